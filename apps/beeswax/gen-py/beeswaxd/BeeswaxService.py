@@ -45,6 +45,32 @@ class Iface:
     """
     pass
 
+  def fetch_rows(self, query_id, start_row, max_rows):
+    """
+    Get up to max_rows rows of the results of a query, starting at row
+    start_row. This is non-blocking. Caller should check Results.ready to
+    determine if the results are in yet. The server reads the next rows
+    ahead while the caller processes these.
+    
+    Parameters:
+     - query_id
+     - start_row
+     - max_rows
+    """
+    pass
+
+  def fetch_columns(self, query_id, start_row, max_rows):
+    """
+    Like fetch_rows(), but returns the results as columns of typed values,
+    rather than as rows of tab-separated strings.
+    
+    Parameters:
+     - query_id
+     - start_row
+     - max_rows
+    """
+    pass
+
   def get_state(self, handle):
     """
     Get the state of the query
@@ -88,6 +114,18 @@ class Iface:
     """
     pass
 
+  def get_log_from(self, context, start_offset):
+    """
+    Get the log messages related to the given context, starting at
+    character start_offset. Lets callers fetch only what was logged since
+    their last call.
+    
+    Parameters:
+     - context
+     - start_offset
+    """
+    pass
+
   def get_default_configuration(self, include_hadoop):
     """
     Parameters:
@@ -210,6 +248,90 @@ class Client(Iface):
       raise result.error2
     raise TApplicationException(TApplicationException.MISSING_RESULT, "fetch failed: unknown result");
 
+  def fetch_rows(self, query_id, start_row, max_rows):
+    """
+    Get up to max_rows rows of the results of a query, starting at row
+    start_row. This is non-blocking. Caller should check Results.ready to
+    determine if the results are in yet. The server reads the next rows
+    ahead while the caller processes these.
+    
+    Parameters:
+     - query_id
+     - start_row
+     - max_rows
+    """
+    self.send_fetch_rows(query_id, start_row, max_rows)
+    return self.recv_fetch_rows()
+
+  def send_fetch_rows(self, query_id, start_row, max_rows):
+    self._oprot.writeMessageBegin('fetch_rows', TMessageType.CALL, self._seqid)
+    args = fetch_rows_args()
+    args.query_id = query_id
+    args.start_row = start_row
+    args.max_rows = max_rows
+    args.write(self._oprot)
+    self._oprot.writeMessageEnd()
+    self._oprot.trans.flush()
+
+  def recv_fetch_rows(self, ):
+    (fname, mtype, rseqid) = self._iprot.readMessageBegin()
+    if mtype == TMessageType.EXCEPTION:
+      x = TApplicationException()
+      x.read(self._iprot)
+      self._iprot.readMessageEnd()
+      raise x
+    result = fetch_rows_result()
+    result.read(self._iprot)
+    self._iprot.readMessageEnd()
+    if result.success != None:
+      return result.success
+    if result.error != None:
+      raise result.error
+    if result.error2 != None:
+      raise result.error2
+    raise TApplicationException(TApplicationException.MISSING_RESULT, "fetch_rows failed: unknown result");
+
+  def fetch_columns(self, query_id, start_row, max_rows):
+    """
+    Like fetch_rows(), but returns the results as columns of typed values,
+    rather than as rows of tab-separated strings.
+    
+    Parameters:
+     - query_id
+     - start_row
+     - max_rows
+    """
+    self.send_fetch_columns(query_id, start_row, max_rows)
+    return self.recv_fetch_columns()
+
+  def send_fetch_columns(self, query_id, start_row, max_rows):
+    self._oprot.writeMessageBegin('fetch_columns', TMessageType.CALL, self._seqid)
+    args = fetch_columns_args()
+    args.query_id = query_id
+    args.start_row = start_row
+    args.max_rows = max_rows
+    args.write(self._oprot)
+    self._oprot.writeMessageEnd()
+    self._oprot.trans.flush()
+
+  def recv_fetch_columns(self, ):
+    (fname, mtype, rseqid) = self._iprot.readMessageBegin()
+    if mtype == TMessageType.EXCEPTION:
+      x = TApplicationException()
+      x.read(self._iprot)
+      self._iprot.readMessageEnd()
+      raise x
+    result = fetch_columns_result()
+    result.read(self._iprot)
+    self._iprot.readMessageEnd()
+    if result.success != None:
+      return result.success
+    if result.error != None:
+      raise result.error
+    if result.error2 != None:
+      raise result.error2
+    raise TApplicationException(TApplicationException.MISSING_RESULT, "fetch_columns failed: unknown result");
+
   def get_state(self, handle):
     """
     Get the state of the query
@@ -373,6 +495,44 @@ class Client(Iface):
       raise result.error
     raise TApplicationException(TApplicationException.MISSING_RESULT, "get_log failed: unknown result");
 
+  def get_log_from(self, context, start_offset):
+    """
+    Get the log messages related to the given context, starting at
+    character start_offset. Lets callers fetch only what was logged since
+    their last call.
+    
+    Parameters:
+     - context
+     - start_offset
+    """
+    self.send_get_log_from(context, start_offset)
+    return self.recv_get_log_from()
+
+  def send_get_log_from(self, context, start_offset):
+    self._oprot.writeMessageBegin('get_log_from', TMessageType.CALL, self._seqid)
+    args = get_log_from_args()
+    args.context = context
+    args.start_offset = start_offset
+    args.write(self._oprot)
+    self._oprot.writeMessageEnd()
+    self._oprot.trans.flush()
+
+  def recv_get_log_from(self, ):
+    (fname, mtype, rseqid) = self._iprot.readMessageBegin()
+    if mtype == TMessageType.EXCEPTION:
+      x = TApplicationException()
+      x.read(self._iprot)
+      self._iprot.readMessageEnd()
+      raise x
+    result = get_log_from_result()
+    result.read(self._iprot)
+    self._iprot.readMessageEnd()
+    if result.success != None:
+      return result.success
+    if result.error != None:
+      raise result.error
+    raise TApplicationException(TApplicationException.MISSING_RESULT, "get_log_from failed: unknown result");
+
   def get_default_configuration(self, include_hadoop):
     """
     Parameters:
@@ -411,11 +571,14 @@ class Processor(Iface, TProcessor):
     self._processMap["query"] = Processor.process_query
     self._processMap["explain"] = Processor.process_explain
     self._processMap["fetch"] = Processor.process_fetch
+    self._processMap["fetch_rows"] = Processor.process_fetch_rows
+    self._processMap["fetch_columns"] = Processor.process_fetch_columns
     self._processMap["get_state"] = Processor.process_get_state
     self._processMap["get_results_metadata"] = Processor.process_get_results_metadata
     self._processMap["echo"] = Processor.process_echo
     self._processMap["dump_config"] = Processor.process_dump_config
     self._processMap["get_log"] = Processor.process_get_log
+    self._processMap["get_log_from"] = Processor.process_get_log_from
     self._processMap["get_default_configuration"] = Processor.process_get_default_configuration
 
   def process(self, iprot, oprot):
@@ -477,6 +640,38 @@ class Processor(Iface, TProcessor):
     oprot.writeMessageEnd()
     oprot.trans.flush()
 
+  def process_fetch_rows(self, seqid, iprot, oprot):
+    args = fetch_rows_args()
+    args.read(iprot)
+    iprot.readMessageEnd()
+    result = fetch_rows_result()
+    try:
+      result.success = self._handler.fetch_rows(args.query_id, args.start_row, args.max_rows)
+    except QueryNotFoundException, error:
+      result.error = error
+    except BeeswaxException, error2:
+      result.error2 = error2
+    oprot.writeMessageBegin("fetch_rows", TMessageType.REPLY, seqid)
+    result.write(oprot)
+    oprot.writeMessageEnd()
+    oprot.trans.flush()
+
+  def process_fetch_columns(self, seqid, iprot, oprot):
+    args = fetch_columns_args()
+    args.read(iprot)
+    iprot.readMessageEnd()
+    result = fetch_columns_result()
+    try:
+      result.success = self._handler.fetch_columns(args.query_id, args.start_row, args.max_rows)
+    except QueryNotFoundException, error:
+      result.error = error
+    except BeeswaxException, error2:
+      result.error2 = error2
+    oprot.writeMessageBegin("fetch_columns", TMessageType.REPLY, seqid)
+    result.write(oprot)
+    oprot.writeMessageEnd()
+    oprot.trans.flush()
+
   def process_get_state(self, seqid, iprot, oprot):
     args = get_state_args()
     args.read(iprot)
@@ -541,6 +736,20 @@ class Processor(Iface, TProcessor):
     oprot.writeMessageEnd()
     oprot.trans.flush()
 
+  def process_get_log_from(self, seqid, iprot, oprot):
+    args = get_log_from_args()
+    args.read(iprot)
+    iprot.readMessageEnd()
+    result = get_log_from_result()
+    try:
+      result.success = self._handler.get_log_from(args.context, args.start_offset)
+    except QueryNotFoundException, error:
+      result.error = error
+    oprot.writeMessageBegin("get_log_from", TMessageType.REPLY, seqid)
+    result.write(oprot)
+    oprot.writeMessageEnd()
+    oprot.trans.flush()
+
   def process_get_default_configuration(self, seqid, iprot, oprot):
     args = get_default_configuration_args()
     args.read(iprot)
@@ -958,19 +1167,25 @@ class fetch_result(object):
   def __ne__(self, other):
     return not (self == other)
 
-class get_state_args(object):
+class fetch_rows_args(object):
   """
   Attributes:
-   - handle
+   - query_id
+   - start_row
+   - max_rows
   """
 
   thrift_spec = (
     None, # 0
-    (1, TType.STRUCT, 'handle', (QueryHandle, QueryHandle.thrift_spec), None, ), # 1
+    (1, TType.STRUCT, 'query_id', (QueryHandle, QueryHandle.thrift_spec), None, ), # 1
+    (2, TType.I64, 'start_row', None, None, ), # 2
+    (3, TType.I32, 'max_rows', None, None, ), # 3
   )
 
-  def __init__(self, handle=None,):
-    self.handle = handle
+  def __init__(self, query_id=None, start_row=None, max_rows=None,):
+    self.query_id = query_id
+    self.start_row = start_row
+    self.max_rows = max_rows
 
   def read(self, iprot):
     if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
@@ -983,8 +1198,18 @@ class get_state_args(object):
         break
       if fid == 1:
         if ftype == TType.STRUCT:
-          self.handle = QueryHandle()
-          self.handle.read(iprot)
+          self.query_id = QueryHandle()
+          self.query_id.read(iprot)
+        else:
+          iprot.skip(ftype)
+      elif fid == 2:
+        if ftype == TType.I64:
+          self.start_row = iprot.readI64();
+        else:
+          iprot.skip(ftype)
+      elif fid == 3:
+        if ftype == TType.I32:
+          self.max_rows = iprot.readI32();
         else:
           iprot.skip(ftype)
       else:
@@ -996,10 +1221,18 @@ class get_state_args(object):
     if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
       oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
       return
-    oprot.writeStructBegin('get_state_args')
-    if self.handle != None:
-      oprot.writeFieldBegin('handle', TType.STRUCT, 1)
-      self.handle.write(oprot)
+    oprot.writeStructBegin('fetch_rows_args')
+    if self.query_id != None:
+      oprot.writeFieldBegin('query_id', TType.STRUCT, 1)
+      self.query_id.write(oprot)
+      oprot.writeFieldEnd()
+    if self.start_row != None:
+      oprot.writeFieldBegin('start_row', TType.I64, 2)
+      oprot.writeI64(self.start_row)
+      oprot.writeFieldEnd()
+    if self.max_rows != None:
+      oprot.writeFieldBegin('max_rows', TType.I32, 3)
+      oprot.writeI32(self.max_rows)
       oprot.writeFieldEnd()
     oprot.writeFieldStop()
     oprot.writeStructEnd()
@@ -1015,21 +1248,24 @@ class get_state_args(object):
   def __ne__(self, other):
     return not (self == other)
 
-class get_state_result(object):
+class fetch_rows_result(object):
   """
   Attributes:
    - success
    - error
+   - error2
   """
 
   thrift_spec = (
-    (0, TType.I32, 'success', None, None, ), # 0
+    (0, TType.STRUCT, 'success', (Results, Results.thrift_spec), None, ), # 0
     (1, TType.STRUCT, 'error', (QueryNotFoundException, QueryNotFoundException.thrift_spec), None, ), # 1
+    (2, TType.STRUCT, 'error2', (BeeswaxException, BeeswaxException.thrift_spec), None, ), # 2
   )
 
-  def __init__(self, success=None, error=None,):
+  def __init__(self, success=None, error=None, error2=None,):
     self.success = success
     self.error = error
+    self.error2 = error2
 
   def read(self, iprot):
     if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
@@ -1041,8 +1277,9 @@ class get_state_result(object):
       if ftype == TType.STOP:
         break
       if fid == 0:
-        if ftype == TType.I32:
-          self.success = iprot.readI32();
+        if ftype == TType.STRUCT:
+          self.success = Results()
+          self.success.read(iprot)
         else:
           iprot.skip(ftype)
       elif fid == 1:
@@ -1051,6 +1288,12 @@ class get_state_result(object):
           self.error.read(iprot)
         else:
           iprot.skip(ftype)
+      elif fid == 2:
+        if ftype == TType.STRUCT:
+          self.error2 = BeeswaxException()
+          self.error2.read(iprot)
+        else:
+          iprot.skip(ftype)
       else:
         iprot.skip(ftype)
       iprot.readFieldEnd()
@@ -1060,15 +1303,19 @@ class get_state_result(object):
     if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
       oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
       return
-    oprot.writeStructBegin('get_state_result')
+    oprot.writeStructBegin('fetch_rows_result')
     if self.success != None:
-      oprot.writeFieldBegin('success', TType.I32, 0)
-      oprot.writeI32(self.success)
+      oprot.writeFieldBegin('success', TType.STRUCT, 0)
+      self.success.write(oprot)
       oprot.writeFieldEnd()
     if self.error != None:
       oprot.writeFieldBegin('error', TType.STRUCT, 1)
       self.error.write(oprot)
       oprot.writeFieldEnd()
+    if self.error2 != None:
+      oprot.writeFieldBegin('error2', TType.STRUCT, 2)
+      self.error2.write(oprot)
+      oprot.writeFieldEnd()
     oprot.writeFieldStop()
     oprot.writeStructEnd()
 
@@ -1083,19 +1330,25 @@ class get_state_result(object):
   def __ne__(self, other):
     return not (self == other)
 
-class get_results_metadata_args(object):
+class fetch_columns_args(object):
   """
   Attributes:
-   - handle
+   - query_id
+   - start_row
+   - max_rows
   """
 
   thrift_spec = (
     None, # 0
-    (1, TType.STRUCT, 'handle', (QueryHandle, QueryHandle.thrift_spec), None, ), # 1
+    (1, TType.STRUCT, 'query_id', (QueryHandle, QueryHandle.thrift_spec), None, ), # 1
+    (2, TType.I64, 'start_row', None, None, ), # 2
+    (3, TType.I32, 'max_rows', None, None, ), # 3
   )
 
-  def __init__(self, handle=None,):
-    self.handle = handle
+  def __init__(self, query_id=None, start_row=None, max_rows=None,):
+    self.query_id = query_id
+    self.start_row = start_row
+    self.max_rows = max_rows
 
   def read(self, iprot):
     if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
@@ -1108,8 +1361,18 @@ class get_results_metadata_args(object):
         break
       if fid == 1:
         if ftype == TType.STRUCT:
-          self.handle = QueryHandle()
-          self.handle.read(iprot)
+          self.query_id = QueryHandle()
+          self.query_id.read(iprot)
+        else:
+          iprot.skip(ftype)
+      elif fid == 2:
+        if ftype == TType.I64:
+          self.start_row = iprot.readI64();
+        else:
+          iprot.skip(ftype)
+      elif fid == 3:
+        if ftype == TType.I32:
+          self.max_rows = iprot.readI32();
         else:
           iprot.skip(ftype)
       else:
@@ -1121,10 +1384,18 @@ class get_results_metadata_args(object):
     if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
       oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
       return
-    oprot.writeStructBegin('get_results_metadata_args')
-    if self.handle != None:
-      oprot.writeFieldBegin('handle', TType.STRUCT, 1)
-      self.handle.write(oprot)
+    oprot.writeStructBegin('fetch_columns_args')
+    if self.query_id != None:
+      oprot.writeFieldBegin('query_id', TType.STRUCT, 1)
+      self.query_id.write(oprot)
+      oprot.writeFieldEnd()
+    if self.start_row != None:
+      oprot.writeFieldBegin('start_row', TType.I64, 2)
+      oprot.writeI64(self.start_row)
+      oprot.writeFieldEnd()
+    if self.max_rows != None:
+      oprot.writeFieldBegin('max_rows', TType.I32, 3)
+      oprot.writeI32(self.max_rows)
       oprot.writeFieldEnd()
     oprot.writeFieldStop()
     oprot.writeStructEnd()
@@ -1140,21 +1411,24 @@ class get_results_metadata_args(object):
   def __ne__(self, other):
     return not (self == other)
 
-class get_results_metadata_result(object):
+class fetch_columns_result(object):
   """
   Attributes:
    - success
    - error
+   - error2
   """
 
   thrift_spec = (
-    (0, TType.STRUCT, 'success', (ResultsMetadata, ResultsMetadata.thrift_spec), None, ), # 0
+    (0, TType.STRUCT, 'success', (ColumnarResults, ColumnarResults.thrift_spec), None, ), # 0
     (1, TType.STRUCT, 'error', (QueryNotFoundException, QueryNotFoundException.thrift_spec), None, ), # 1
+    (2, TType.STRUCT, 'error2', (BeeswaxException, BeeswaxException.thrift_spec), None, ), # 2
   )
 
-  def __init__(self, success=None, error=None,):
+  def __init__(self, success=None, error=None, error2=None,):
     self.success = success
     self.error = error
+    self.error2 = error2
 
   def read(self, iprot):
     if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
@@ -1167,7 +1441,7 @@ class get_results_metadata_result(object):
         break
       if fid == 0:
         if ftype == TType.STRUCT:
-          self.success = ResultsMetadata()
+          self.success = ColumnarResults()
           self.success.read(iprot)
         else:
           iprot.skip(ftype)
@@ -1177,6 +1451,12 @@ class get_results_metadata_result(object):
           self.error.read(iprot)
         else:
           iprot.skip(ftype)
+      elif fid == 2:
+        if ftype == TType.STRUCT:
+          self.error2 = BeeswaxException()
+          self.error2.read(iprot)
+        else:
+          iprot.skip(ftype)
       else:
         iprot.skip(ftype)
       iprot.readFieldEnd()
@@ -1186,7 +1466,7 @@ class get_results_metadata_result(object):
     if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
       oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
       return
-    oprot.writeStructBegin('get_results_metadata_result')
+    oprot.writeStructBegin('fetch_columns_result')
     if self.success != None:
       oprot.writeFieldBegin('success', TType.STRUCT, 0)
       self.success.write(oprot)
@@ -1195,6 +1475,10 @@ class get_results_metadata_result(object):
       oprot.writeFieldBegin('error', TType.STRUCT, 1)
       self.error.write(oprot)
       oprot.writeFieldEnd()
+    if self.error2 != None:
+      oprot.writeFieldBegin('error2', TType.STRUCT, 2)
+      self.error2.write(oprot)
+      oprot.writeFieldEnd()
     oprot.writeFieldStop()
     oprot.writeStructEnd()
 
@@ -1209,19 +1493,19 @@ class get_results_metadata_result(object):
   def __ne__(self, other):
     return not (self == other)
 
-class echo_args(object):
+class get_state_args(object):
   """
   Attributes:
-   - s
+   - handle
   """
 
   thrift_spec = (
     None, # 0
-    (1, TType.STRING, 's', None, None, ), # 1
+    (1, TType.STRUCT, 'handle', (QueryHandle, QueryHandle.thrift_spec), None, ), # 1
   )
 
-  def __init__(self, s=None,):
-    self.s = s
+  def __init__(self, handle=None,):
+    self.handle = handle
 
   def read(self, iprot):
     if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
@@ -1233,8 +1517,9 @@ class echo_args(object):
       if ftype == TType.STOP:
         break
       if fid == 1:
-        if ftype == TType.STRING:
-          self.s = iprot.readString();
+        if ftype == TType.STRUCT:
+          self.handle = QueryHandle()
+          self.handle.read(iprot)
         else:
           iprot.skip(ftype)
       else:
@@ -1246,10 +1531,10 @@ class echo_args(object):
     if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
       oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
       return
-    oprot.writeStructBegin('echo_args')
-    if self.s != None:
-      oprot.writeFieldBegin('s', TType.STRING, 1)
-      oprot.writeString(self.s)
+    oprot.writeStructBegin('get_state_args')
+    if self.handle != None:
+      oprot.writeFieldBegin('handle', TType.STRUCT, 1)
+      self.handle.write(oprot)
       oprot.writeFieldEnd()
     oprot.writeFieldStop()
     oprot.writeStructEnd()
@@ -1265,14 +1550,264 @@ class echo_args(object):
   def __ne__(self, other):
     return not (self == other)
 
-class echo_result(object):
+class get_state_result(object):
   """
   Attributes:
    - success
+   - error
   """
 
   thrift_spec = (
-    (0, TType.STRING, 'success', None, None, ), # 0
+    (0, TType.I32, 'success', None, None, ), # 0
+    (1, TType.STRUCT, 'error', (QueryNotFoundException, QueryNotFoundException.thrift_spec), None, ), # 1
+  )
+
+  def __init__(self, success=None, error=None,):
+    self.success = success
+    self.error = error
+
+  def read(self, iprot):
+    if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
+      fastbinary.decode_binary(self, iprot.trans, (self.__class__, self.thrift_spec))
+      return
+    iprot.readStructBegin()
+    while True:
+      (fname, ftype, fid) = iprot.readFieldBegin()
+      if ftype == TType.STOP:
+        break
+      if fid == 0:
+        if ftype == TType.I32:
+          self.success = iprot.readI32();
+        else:
+          iprot.skip(ftype)
+      elif fid == 1:
+        if ftype == TType.STRUCT:
+          self.error = QueryNotFoundException()
+          self.error.read(iprot)
+        else:
+          iprot.skip(ftype)
+      else:
+        iprot.skip(ftype)
+      iprot.readFieldEnd()
+    iprot.readStructEnd()
+
+  def write(self, oprot):
+    if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
+      return
+    oprot.writeStructBegin('get_state_result')
+    if self.success != None:
+      oprot.writeFieldBegin('success', TType.I32, 0)
+      oprot.writeI32(self.success)
+      oprot.writeFieldEnd()
+    if self.error != None:
+      oprot.writeFieldBegin('error', TType.STRUCT, 1)
+      self.error.write(oprot)
+      oprot.writeFieldEnd()
+    oprot.writeFieldStop()
+    oprot.writeStructEnd()
+
+  def __repr__(self):
+    L = ['%s=%r' % (key, value)
+      for key, value in self.__dict__.iteritems()]
+    return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+  def __eq__(self, other):
+    return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+  def __ne__(self, other):
+    return not (self == other)
+
+class get_results_metadata_args(object):
+  """
+  Attributes:
+   - handle
+  """
+
+  thrift_spec = (
+    None, # 0
+    (1, TType.STRUCT, 'handle', (QueryHandle, QueryHandle.thrift_spec), None, ), # 1
+  )
+
+  def __init__(self, handle=None,):
+    self.handle = handle
+
+  def read(self, iprot):
+    if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
+      fastbinary.decode_binary(self, iprot.trans, (self.__class__, self.thrift_spec))
+      return
+    iprot.readStructBegin()
+    while True:
+      (fname, ftype, fid) = iprot.readFieldBegin()
+      if ftype == TType.STOP:
+        break
+      if fid == 1:
+        if ftype == TType.STRUCT:
+          self.handle = QueryHandle()
+          self.handle.read(iprot)
+        else:
+          iprot.skip(ftype)
+      else:
+        iprot.skip(ftype)
+      iprot.readFieldEnd()
+    iprot.readStructEnd()
+
+  def write(self, oprot):
+    if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
+      return
+    oprot.writeStructBegin('get_results_metadata_args')
+    if self.handle != None:
+      oprot.writeFieldBegin('handle', TType.STRUCT, 1)
+      self.handle.write(oprot)
+      oprot.writeFieldEnd()
+    oprot.writeFieldStop()
+    oprot.writeStructEnd()
+
+  def __repr__(self):
+    L = ['%s=%r' % (key, value)
+      for key, value in self.__dict__.iteritems()]
+    return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+  def __eq__(self, other):
+    return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+  def __ne__(self, other):
+    return not (self == other)
+
+class get_results_metadata_result(object):
+  """
+  Attributes:
+   - success
+   - error
+  """
+
+  thrift_spec = (
+    (0, TType.STRUCT, 'success', (ResultsMetadata, ResultsMetadata.thrift_spec), None, ), # 0
+    (1, TType.STRUCT, 'error', (QueryNotFoundException, QueryNotFoundException.thrift_spec), None, ), # 1
+  )
+
+  def __init__(self, success=None, error=None,):
+    self.success = success
+    self.error = error
+
+  def read(self, iprot):
+    if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
+      fastbinary.decode_binary(self, iprot.trans, (self.__class__, self.thrift_spec))
+      return
+    iprot.readStructBegin()
+    while True:
+      (fname, ftype, fid) = iprot.readFieldBegin()
+      if ftype == TType.STOP:
+        break
+      if fid == 0:
+        if ftype == TType.STRUCT:
+          self.success = ResultsMetadata()
+          self.success.read(iprot)
+        else:
+          iprot.skip(ftype)
+      elif fid == 1:
+        if ftype == TType.STRUCT:
+          self.error = QueryNotFoundException()
+          self.error.read(iprot)
+        else:
+          iprot.skip(ftype)
+      else:
+        iprot.skip(ftype)
+      iprot.readFieldEnd()
+    iprot.readStructEnd()
+
+  def write(self, oprot):
+    if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
+      return
+    oprot.writeStructBegin('get_results_metadata_result')
+    if self.success != None:
+      oprot.writeFieldBegin('success', TType.STRUCT, 0)
+      self.success.write(oprot)
+      oprot.writeFieldEnd()
+    if self.error != None:
+      oprot.writeFieldBegin('error', TType.STRUCT, 1)
+      self.error.write(oprot)
+      oprot.writeFieldEnd()
+    oprot.writeFieldStop()
+    oprot.writeStructEnd()
+
+  def __repr__(self):
+    L = ['%s=%r' % (key, value)
+      for key, value in self.__dict__.iteritems()]
+    return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+  def __eq__(self, other):
+    return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+  def __ne__(self, other):
+    return not (self == other)
+
+class echo_args(object):
+  """
+  Attributes:
+   - s
+  """
+
+  thrift_spec = (
+    None, # 0
+    (1, TType.STRING, 's', None, None, ), # 1
+  )
+
+  def __init__(self, s=None,):
+    self.s = s
+
+  def read(self, iprot):
+    if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
+      fastbinary.decode_binary(self, iprot.trans, (self.__class__, self.thrift_spec))
+      return
+    iprot.readStructBegin()
+    while True:
+      (fname, ftype, fid) = iprot.readFieldBegin()
+      if ftype == TType.STOP:
+        break
+      if fid == 1:
+        if ftype == TType.STRING:
+          self.s = iprot.readString();
+        else:
+          iprot.skip(ftype)
+      else:
+        iprot.skip(ftype)
+      iprot.readFieldEnd()
+    iprot.readStructEnd()
+
+  def write(self, oprot):
+    if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
+      return
+    oprot.writeStructBegin('echo_args')
+    if self.s != None:
+      oprot.writeFieldBegin('s', TType.STRING, 1)
+      oprot.writeString(self.s)
+      oprot.writeFieldEnd()
+    oprot.writeFieldStop()
+    oprot.writeStructEnd()
+
+  def __repr__(self):
+    L = ['%s=%r' % (key, value)
+      for key, value in self.__dict__.iteritems()]
+    return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+  def __eq__(self, other):
+    return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+  def __ne__(self, other):
+    return not (self == other)
+
+class echo_result(object):
+  """
+  Attributes:
+   - success
+  """
+
+  thrift_spec = (
+    (0, TType.STRING, 'success', None, None, ), # 0
   )
 
   def __init__(self, success=None,):
@@ -1537,6 +2072,142 @@ class get_log_result(object):
   def __ne__(self, other):
     return not (self == other)
 
+class get_log_from_args(object):
+  """
+  Attributes:
+   - context
+   - start_offset
+  """
+
+  thrift_spec = (
+    None, # 0
+    (1, TType.STRING, 'context', None, None, ), # 1
+    (2, TType.I64, 'start_offset', None, None, ), # 2
+  )
+
+  def __init__(self, context=None, start_offset=None,):
+    self.context = context
+    self.start_offset = start_offset
+
+  def read(self, iprot):
+    if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
+      fastbinary.decode_binary(self, iprot.trans, (self.__class__, self.thrift_spec))
+      return
+    iprot.readStructBegin()
+    while True:
+      (fname, ftype, fid) = iprot.readFieldBegin()
+      if ftype == TType.STOP:
+        break
+      if fid == 1:
+        if ftype == TType.STRING:
+          self.context = iprot.readString();
+        else:
+          iprot.skip(ftype)
+      elif fid == 2:
+        if ftype == TType.I64:
+          self.start_offset = iprot.readI64();
+        else:
+          iprot.skip(ftype)
+      else:
+        iprot.skip(ftype)
+      iprot.readFieldEnd()
+    iprot.readStructEnd()
+
+  def write(self, oprot):
+    if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
+      return
+    oprot.writeStructBegin('get_log_from_args')
+    if self.context != None:
+      oprot.writeFieldBegin('context', TType.STRING, 1)
+      oprot.writeString(self.context)
+      oprot.writeFieldEnd()
+    if self.start_offset != None:
+      oprot.writeFieldBegin('start_offset', TType.I64, 2)
+      oprot.writeI64(self.start_offset)
+      oprot.writeFieldEnd()
+    oprot.writeFieldStop()
+    oprot.writeStructEnd()
+
+  def __repr__(self):
+    L = ['%s=%r' % (key, value)
+      for key, value in self.__dict__.iteritems()]
+    return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+  def __eq__(self, other):
+    return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+  def __ne__(self, other):
+    return not (self == other)
+
+class get_log_from_result(object):
+  """
+  Attributes:
+   - success
+   - error
+  """
+
+  thrift_spec = (
+    (0, TType.STRING, 'success', None, None, ), # 0
+    (1, TType.STRUCT, 'error', (QueryNotFoundException, QueryNotFoundException.thrift_spec), None, ), # 1
+  )
+
+  def __init__(self, success=None, error=None,):
+    self.success = success
+    self.error = error
+
+  def read(self, iprot):
+    if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
+      fastbinary.decode_binary(self, iprot.trans, (self.__class__, self.thrift_spec))
+      return
+    iprot.readStructBegin()
+    while True:
+      (fname, ftype, fid) = iprot.readFieldBegin()
+      if ftype == TType.STOP:
+        break
+      if fid == 0:
+        if ftype == TType.STRING:
+          self.success = iprot.readString();
+        else:
+          iprot.skip(ftype)
+      elif fid == 1:
+        if ftype == TType.STRUCT:
+          self.error = QueryNotFoundException()
+          self.error.read(iprot)
+        else:
+          iprot.skip(ftype)
+      else:
+        iprot.skip(ftype)
+      iprot.readFieldEnd()
+    iprot.readStructEnd()
+
+  def write(self, oprot):
+    if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
+      return
+    oprot.writeStructBegin('get_log_from_result')
+    if self.success != None:
+      oprot.writeFieldBegin('success', TType.STRING, 0)
+      oprot.writeString(self.success)
+      oprot.writeFieldEnd()
+    if self.error != None:
+      oprot.writeFieldBegin('error', TType.STRUCT, 1)
+      self.error.write(oprot)
+      oprot.writeFieldEnd()
+    oprot.writeFieldStop()
+    oprot.writeStructEnd()
+
+  def __repr__(self):
+    L = ['%s=%r' % (key, value)
+      for key, value in self.__dict__.iteritems()]
+    return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+  def __eq__(self, other):
+    return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+  def __ne__(self, other):
+    return not (self == other)
+
 class get_default_configuration_args(object):
   """
   Attributes:
@@ -1618,11 +2289,11 @@ class get_default_configuration_result(object):
       if fid == 0:
         if ftype == TType.LIST:
           self.success = []
-          (_etype31, _size28) = iprot.readListBegin()
-          for _i32 in xrange(_size28):
-            _elem33 = ConfigVariable()
-            _elem33.read(iprot)
-            self.success.append(_elem33)
+          (_etype73, _size70) = iprot.readListBegin()
+          for _i74 in xrange(_size70):
+            _elem75 = ConfigVariable()
+            _elem75.read(iprot)
+            self.success.append(_elem75)
           iprot.readListEnd()
         else:
           iprot.skip(ftype)
@@ -1639,8 +2310,8 @@ class get_default_configuration_result(object):
     if self.success != None:
       oprot.writeFieldBegin('success', TType.LIST, 0)
       oprot.writeListBegin(TType.STRUCT, len(self.success))
-      for iter34 in self.success:
-        iter34.write(oprot)
+      for iter76 in self.success:
+        iter76.write(oprot)
       oprot.writeListEnd()
       oprot.writeFieldEnd()
     oprot.writeFieldStop()
@@ -42,6 +42,26 @@ class QueryState(object):
     "EXCEPTION": 5,
   }
 
+class ColumnType(object):
+  BOOLEAN = 0
+  LONG = 1
+  DOUBLE = 2
+  STRING = 3
+
+  _VALUES_TO_NAMES = {
+    0: "BOOLEAN",
+    1: "LONG",
+    2: "DOUBLE",
+    3: "STRING",
+  }
+
+  _NAMES_TO_VALUES = {
+    "BOOLEAN": 0,
+    "LONG": 1,
+    "DOUBLE": 2,
+    "STRING": 3,
+  }
+
 class Query(object):
   """
   Attributes:
@@ -49,6 +69,7 @@ class Query(object):
    - configuration
    - hadoop_user
    - hadoop_groups
+   - bypass_cache
   """
 
   thrift_spec = (
@@ -58,13 +79,15 @@ class Query(object):
     (3, TType.LIST, 'configuration', (TType.STRING,None), None, ), # 3
     (4, TType.STRING, 'hadoop_user', None, None, ), # 4
     (5, TType.LIST, 'hadoop_groups', (TType.STRING,None), None, ), # 5
+    (6, TType.BOOL, 'bypass_cache', None, None, ), # 6
   )
 
-  def __init__(self, query=None, configuration=None, hadoop_user=None, hadoop_groups=None,):
+  def __init__(self, query=None, configuration=None, hadoop_user=None, hadoop_groups=None, bypass_cache=None,):
     self.query = query
     self.configuration = configuration
     self.hadoop_user = hadoop_user
     self.hadoop_groups = hadoop_groups
+    self.bypass_cache = bypass_cache
 
   def read(self, iprot):
     if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
@@ -105,6 +128,11 @@ class Query(object):
           iprot.readListEnd()
         else:
           iprot.skip(ftype)
+      elif fid == 6:
+        if ftype == TType.BOOL:
+          self.bypass_cache = iprot.readBool();
+        else:
+          iprot.skip(ftype)
       else:
         iprot.skip(ftype)
       iprot.readFieldEnd()
@@ -137,6 +165,10 @@ class Query(object):
         oprot.writeString(iter13)
       oprot.writeListEnd()
       oprot.writeFieldEnd()
+    if self.bypass_cache != None:
+      oprot.writeFieldBegin('bypass_cache', TType.BOOL, 6)
+      oprot.writeBool(self.bypass_cache)
+      oprot.writeFieldEnd()
     oprot.writeFieldStop()
     oprot.writeStructEnd()
 
@@ -395,6 +427,290 @@ class Results(object):
   def __ne__(self, other):
     return not (self == other)
 
+class ColumnValues(object):
+  """
+  The values of a column of results. Only the list of values of the type
+  of the column is set. Values of complex types are JSON strings.
+  
+  Attributes:
+   - type
+   - nulls
+   - bool_values
+   - long_values
+   - double_values
+   - string_values
+  """
+
+  thrift_spec = (
+    None, # 0
+    (1, TType.I32, 'type', None, None, ), # 1
+    (2, TType.STRING, 'nulls', None, None, ), # 2
+    (3, TType.LIST, 'bool_values', (TType.BOOL,None), None, ), # 3
+    (4, TType.LIST, 'long_values', (TType.I64,None), None, ), # 4
+    (5, TType.LIST, 'double_values', (TType.DOUBLE,None), None, ), # 5
+    (6, TType.LIST, 'string_values', (TType.STRING,None), None, ), # 6
+  )
+
+  def __init__(self, type=None, nulls=None, bool_values=None, long_values=None, double_values=None, string_values=None,):
+    self.type = type
+    self.nulls = nulls
+    self.bool_values = bool_values
+    self.long_values = long_values
+    self.double_values = double_values
+    self.string_values = string_values
+
+  def read(self, iprot):
+    if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
+      fastbinary.decode_binary(self, iprot.trans, (self.__class__, self.thrift_spec))
+      return
+    iprot.readStructBegin()
+    while True:
+      (fname, ftype, fid) = iprot.readFieldBegin()
+      if ftype == TType.STOP:
+        break
+      if fid == 1:
+        if ftype == TType.I32:
+          self.type = iprot.readI32();
+        else:
+          iprot.skip(ftype)
+      elif fid == 2:
+        if ftype == TType.STRING:
+          self.nulls = iprot.readString();
+        else:
+          iprot.skip(ftype)
+      elif fid == 3:
+        if ftype == TType.LIST:
+          self.bool_values = []
+          (_etype31, _size28) = iprot.readListBegin()
+          for _i32 in xrange(_size28):
+            _elem33 = iprot.readBool();
+            self.bool_values.append(_elem33)
+          iprot.readListEnd()
+        else:
+          iprot.skip(ftype)
+      elif fid == 4:
+        if ftype == TType.LIST:
+          self.long_values = []
+          (_etype37, _size34) = iprot.readListBegin()
+          for _i38 in xrange(_size34):
+            _elem39 = iprot.readI64();
+            self.long_values.append(_elem39)
+          iprot.readListEnd()
+        else:
+          iprot.skip(ftype)
+      elif fid == 5:
+        if ftype == TType.LIST:
+          self.double_values = []
+          (_etype43, _size40) = iprot.readListBegin()
+          for _i44 in xrange(_size40):
+            _elem45 = iprot.readDouble();
+            self.double_values.append(_elem45)
+          iprot.readListEnd()
+        else:
+          iprot.skip(ftype)
+      elif fid == 6:
+        if ftype == TType.LIST:
+          self.string_values = []
+          (_etype49, _size46) = iprot.readListBegin()
+          for _i50 in xrange(_size46):
+            _elem51 = iprot.readString();
+            self.string_values.append(_elem51)
+          iprot.readListEnd()
+        else:
+          iprot.skip(ftype)
+      else:
+        iprot.skip(ftype)
+      iprot.readFieldEnd()
+    iprot.readStructEnd()
+
+  def write(self, oprot):
+    if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
+      return
+    oprot.writeStructBegin('ColumnValues')
+    if self.type != None:
+      oprot.writeFieldBegin('type', TType.I32, 1)
+      oprot.writeI32(self.type)
+      oprot.writeFieldEnd()
+    if self.nulls != None:
+      oprot.writeFieldBegin('nulls', TType.STRING, 2)
+      oprot.writeString(self.nulls)
+      oprot.writeFieldEnd()
+    if self.bool_values != None:
+      oprot.writeFieldBegin('bool_values', TType.LIST, 3)
+      oprot.writeListBegin(TType.BOOL, len(self.bool_values))
+      for iter52 in self.bool_values:
+        oprot.writeBool(iter52)
+      oprot.writeListEnd()
+      oprot.writeFieldEnd()
+    if self.long_values != None:
+      oprot.writeFieldBegin('long_values', TType.LIST, 4)
+      oprot.writeListBegin(TType.I64, len(self.long_values))
+      for iter53 in self.long_values:
+        oprot.writeI64(iter53)
+      oprot.writeListEnd()
+      oprot.writeFieldEnd()
+    if self.double_values != None:
+      oprot.writeFieldBegin('double_values', TType.LIST, 5)
+      oprot.writeListBegin(TType.DOUBLE, len(self.double_values))
+      for iter54 in self.double_values:
+        oprot.writeDouble(iter54)
+      oprot.writeListEnd()
+      oprot.writeFieldEnd()
+    if self.string_values != None:
+      oprot.writeFieldBegin('string_values', TType.LIST, 6)
+      oprot.writeListBegin(TType.STRING, len(self.string_values))
+      for iter55 in self.string_values:
+        oprot.writeString(iter55)
+      oprot.writeListEnd()
+      oprot.writeFieldEnd()
+    oprot.writeFieldStop()
+    oprot.writeStructEnd()
+
+  def __repr__(self):
+    L = ['%s=%r' % (key, value)
+      for key, value in self.__dict__.iteritems()]
+    return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+  def __eq__(self, other):
+    return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+  def __ne__(self, other):
+    return not (self == other)
+
+class ColumnarResults(object):
+  """
+  Attributes:
+   - ready
+   - columns
+   - values
+   - start_row
+   - num_rows
+   - has_more
+  """
+
+  thrift_spec = (
+    None, # 0
+    (1, TType.BOOL, 'ready', None, None, ), # 1
+    (2, TType.LIST, 'columns', (TType.STRING,None), None, ), # 2
+    (3, TType.LIST, 'values', (TType.STRUCT,(ColumnValues, ColumnValues.thrift_spec)), None, ), # 3
+    (4, TType.I64, 'start_row', None, None, ), # 4
+    (5, TType.I32, 'num_rows', None, None, ), # 5
+    (6, TType.BOOL, 'has_more', None, None, ), # 6
+  )
+
+  def __init__(self, ready=None, columns=None, values=None, start_row=None, num_rows=None, has_more=None,):
+    self.ready = ready
+    self.columns = columns
+    self.values = values
+    self.start_row = start_row
+    self.num_rows = num_rows
+    self.has_more = has_more
+
+  def read(self, iprot):
+    if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
+      fastbinary.decode_binary(self, iprot.trans, (self.__class__, self.thrift_spec))
+      return
+    iprot.readStructBegin()
+    while True:
+      (fname, ftype, fid) = iprot.readFieldBegin()
+      if ftype == TType.STOP:
+        break
+      if fid == 1:
+        if ftype == TType.BOOL:
+          self.ready = iprot.readBool();
+        else:
+          iprot.skip(ftype)
+      elif fid == 2:
+        if ftype == TType.LIST:
+          self.columns = []
+          (_etype59, _size56) = iprot.readListBegin()
+          for _i60 in xrange(_size56):
+            _elem61 = iprot.readString();
+            self.columns.append(_elem61)
+          iprot.readListEnd()
+        else:
+          iprot.skip(ftype)
+      elif fid == 3:
+        if ftype == TType.LIST:
+          self.values = []
+          (_etype65, _size62) = iprot.readListBegin()
+          for _i66 in xrange(_size62):
+            _elem67 = ColumnValues()
+            _elem67.read(iprot)
+            self.values.append(_elem67)
+          iprot.readListEnd()
+        else:
+          iprot.skip(ftype)
+      elif fid == 4:
+        if ftype == TType.I64:
+          self.start_row = iprot.readI64();
+        else:
+          iprot.skip(ftype)
+      elif fid == 5:
+        if ftype == TType.I32:
+          self.num_rows = iprot.readI32();
+        else:
+          iprot.skip(ftype)
+      elif fid == 6:
+        if ftype == TType.BOOL:
+          self.has_more = iprot.readBool();
+        else:
+          iprot.skip(ftype)
+      else:
+        iprot.skip(ftype)
+      iprot.readFieldEnd()
+    iprot.readStructEnd()
+
+  def write(self, oprot):
+    if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
+      return
+    oprot.writeStructBegin('ColumnarResults')
+    if self.ready != None:
+      oprot.writeFieldBegin('ready', TType.BOOL, 1)
+      oprot.writeBool(self.ready)
+      oprot.writeFieldEnd()
+    if self.columns != None:
+      oprot.writeFieldBegin('columns', TType.LIST, 2)
+      oprot.writeListBegin(TType.STRING, len(self.columns))
+      for iter68 in self.columns:
+        oprot.writeString(iter68)
+      oprot.writeListEnd()
+      oprot.writeFieldEnd()
+    if self.values != None:
+      oprot.writeFieldBegin('values', TType.LIST, 3)
+      oprot.writeListBegin(TType.STRUCT, len(self.values))
+      for iter69 in self.values:
+        iter69.write(oprot)
+      oprot.writeListEnd()
+      oprot.writeFieldEnd()
+    if self.start_row != None:
+      oprot.writeFieldBegin('start_row', TType.I64, 4)
+      oprot.writeI64(self.start_row)
+      oprot.writeFieldEnd()
+    if self.num_rows != None:
+      oprot.writeFieldBegin('num_rows', TType.I32, 5)
+      oprot.writeI32(self.num_rows)
+      oprot.writeFieldEnd()
+    if self.has_more != None:
+      oprot.writeFieldBegin('has_more', TType.BOOL, 6)
+      oprot.writeBool(self.has_more)
+      oprot.writeFieldEnd()
+    oprot.writeFieldStop()
+    oprot.writeStructEnd()
+
+  def __repr__(self):
+    L = ['%s=%r' % (key, value)
+      for key, value in self.__dict__.iteritems()]
+    return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+  def __eq__(self, other):
+    return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+  def __ne__(self, other):
+    return not (self == other)
+
 class ResultsMetadata(object):
   """
   Metadata information about the results.
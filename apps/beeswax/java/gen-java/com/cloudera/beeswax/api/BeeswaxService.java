@@ -46,6 +46,28 @@ public class BeeswaxService {
      */
     public Results fetch(QueryHandle query_id, boolean start_over) throws QueryNotFoundException, BeeswaxException, TException;
 
+    /**
+     * Get up to max_rows rows of the results of a query, starting at row
+     * start_row. This is non-blocking. Caller should check Results.ready to
+     * determine if the results are in yet. The server reads the next rows
+     * ahead while the caller processes these.
+     * 
+     * @param query_id
+     * @param start_row
+     * @param max_rows
+     */
+    public Results fetch_rows(QueryHandle query_id, long start_row, int max_rows) throws QueryNotFoundException, BeeswaxException, TException;
+
+    /**
+     * Like fetch_rows(), but returns the results as columns of typed values,
+     * rather than as rows of tab-separated strings.
+     * 
+     * @param query_id
+     * @param start_row
+     * @param max_rows
+     */
+    public ColumnarResults fetch_columns(QueryHandle query_id, long start_row, int max_rows) throws QueryNotFoundException, BeeswaxException, TException;
+
     /**
      * Get the state of the query
      * 
@@ -80,6 +102,16 @@ public class BeeswaxService {
      */
     public String get_log(String context) throws QueryNotFoundException, TException;
 
+    /**
+     * Get the log messages related to the given context, starting at
+     * character start_offset. Lets callers fetch only what was logged since
+     * their last call.
+     * 
+     * @param context
+     * @param start_offset
+     */
+    public String get_log_from(String context, long start_offset) throws QueryNotFoundException, TException;
+
     public List<ConfigVariable> get_default_configuration(boolean include_hadoop) throws TException;
 
   }
@@ -223,6 +255,88 @@ public class BeeswaxService {
       throw new TApplicationException(TApplicationException.MISSING_RESULT, "fetch failed: unknown result");
     }
 
+    public Results fetch_rows(QueryHandle query_id, long start_row, int max_rows) throws QueryNotFoundException, BeeswaxException, TException
+    {
+      send_fetch_rows(query_id, start_row, max_rows);
+      return recv_fetch_rows();
+    }
+
+    public void send_fetch_rows(QueryHandle query_id, long start_row, int max_rows) throws TException
+    {
+      oprot_.writeMessageBegin(new TMessage("fetch_rows", TMessageType.CALL, seqid_));
+      fetch_rows_args args = new fetch_rows_args();
+      args.query_id = query_id;
+      args.start_row = start_row;
+      args.max_rows = max_rows;
+      args.write(oprot_);
+      oprot_.writeMessageEnd();
+      oprot_.getTransport().flush();
+    }
+
+    public Results recv_fetch_rows() throws QueryNotFoundException, BeeswaxException, TException
+    {
+      TMessage msg = iprot_.readMessageBegin();
+      if (msg.type == TMessageType.EXCEPTION) {
+        TApplicationException x = TApplicationException.read(iprot_);
+        iprot_.readMessageEnd();
+        throw x;
+      }
+      fetch_rows_result result = new fetch_rows_result();
+      result.read(iprot_);
+      iprot_.readMessageEnd();
+      if (result.isSetSuccess()) {
+        return result.success;
+      }
+      if (result.error != null) {
+        throw result.error;
+      }
+      if (result.error2 != null) {
+        throw result.error2;
+      }
+      throw new TApplicationException(TApplicationException.MISSING_RESULT, "fetch_rows failed: unknown result");
+    }
+
+    public ColumnarResults fetch_columns(QueryHandle query_id, long start_row, int max_rows) throws QueryNotFoundException, BeeswaxException, TException
+    {
+      send_fetch_columns(query_id, start_row, max_rows);
+      return recv_fetch_columns();
+    }
+
+    public void send_fetch_columns(QueryHandle query_id, long start_row, int max_rows) throws TException
+    {
+      oprot_.writeMessageBegin(new TMessage("fetch_columns", TMessageType.CALL, seqid_));
+      fetch_columns_args args = new fetch_columns_args();
+      args.query_id = query_id;
+      args.start_row = start_row;
+      args.max_rows = max_rows;
+      args.write(oprot_);
+      oprot_.writeMessageEnd();
+      oprot_.getTransport().flush();
+    }
+
+    public ColumnarResults recv_fetch_columns() throws QueryNotFoundException, BeeswaxException, TException
+    {
+      TMessage msg = iprot_.readMessageBegin();
+      if (msg.type == TMessageType.EXCEPTION) {
+        TApplicationException x = TApplicationException.read(iprot_);
+        iprot_.readMessageEnd();
+        throw x;
+      }
+      fetch_columns_result result = new fetch_columns_result();
+      result.read(iprot_);
+      iprot_.readMessageEnd();
+      if (result.isSetSuccess()) {
+        return result.success;
+      }
+      if (result.error != null) {
+        throw result.error;
+      }
+      if (result.error2 != null) {
+        throw result.error2;
+      }
+      throw new TApplicationException(TApplicationException.MISSING_RESULT, "fetch_columns failed: unknown result");
+    }
+
     public int get_state(QueryHandle handle) throws QueryNotFoundException, TException
     {
       send_get_state(handle);
@@ -396,6 +510,43 @@ public class BeeswaxService {
       throw new TApplicationException(TApplicationException.MISSING_RESULT, "get_log failed: unknown result");
     }
 
+    public String get_log_from(String context, long start_offset) throws QueryNotFoundException, TException
+    {
+      send_get_log_from(context, start_offset);
+      return recv_get_log_from();
+    }
+
+    public void send_get_log_from(String context, long start_offset) throws TException
+    {
+      oprot_.writeMessageBegin(new TMessage("get_log_from", TMessageType.CALL, seqid_));
+      get_log_from_args args = new get_log_from_args();
+      args.context = context;
+      args.start_offset = start_offset;
+      args.write(oprot_);
+      oprot_.writeMessageEnd();
+      oprot_.getTransport().flush();
+    }
+
+    public String recv_get_log_from() throws QueryNotFoundException, TException
+    {
+      TMessage msg = iprot_.readMessageBegin();
+      if (msg.type == TMessageType.EXCEPTION) {
+        TApplicationException x = TApplicationException.read(iprot_);
+        iprot_.readMessageEnd();
+        throw x;
+      }
+      get_log_from_result result = new get_log_from_result();
+      result.read(iprot_);
+      iprot_.readMessageEnd();
+      if (result.isSetSuccess()) {
+        return result.success;
+      }
+      if (result.error != null) {
+        throw result.error;
+      }
+      throw new TApplicationException(TApplicationException.MISSING_RESULT, "get_log_from failed: unknown result");
+    }
+
     public List<ConfigVariable> get_default_configuration(boolean include_hadoop) throws TException
     {
       send_get_default_configuration(include_hadoop);
@@ -438,11 +589,14 @@ public class BeeswaxService {
       processMap_.put("query", new query());
       processMap_.put("explain", new explain());
       processMap_.put("fetch", new fetch());
+      processMap_.put("fetch_rows", new fetch_rows());
+      processMap_.put("fetch_columns", new fetch_columns());
       processMap_.put("get_state", new get_state());
       processMap_.put("get_results_metadata", new get_results_metadata());
       processMap_.put("echo", new echo());
       processMap_.put("dump_config", new dump_config());
       processMap_.put("get_log", new get_log());
+      processMap_.put("get_log_from", new get_log_from());
       processMap_.put("get_default_configuration", new get_default_configuration());
     }
 
@@ -557,6 +711,66 @@ public class BeeswaxService {
 
     }
 
+    private class fetch_rows implements ProcessFunction {
+      public void process(int seqid, TProtocol iprot, TProtocol oprot) throws TException
+      {
+        fetch_rows_args args = new fetch_rows_args();
+        args.read(iprot);
+        iprot.readMessageEnd();
+        fetch_rows_result result = new fetch_rows_result();
+        try {
+          result.success = iface_.fetch_rows(args.query_id, args.start_row, args.max_rows);
+        } catch (QueryNotFoundException error) {
+          result.error = error;
+        } catch (BeeswaxException error2) {
+          result.error2 = error2;
+        } catch (Throwable th) {
+          LOGGER.error("Internal error processing fetch_rows", th);
+          TApplicationException x = new TApplicationException(TApplicationException.INTERNAL_ERROR, "Internal error processing fetch_rows");
+          oprot.writeMessageBegin(new TMessage("fetch_rows", TMessageType.EXCEPTION, seqid));
+          x.write(oprot);
+          oprot.writeMessageEnd();
+          oprot.getTransport().flush();
+          return;
+        }
+        oprot.writeMessageBegin(new TMessage("fetch_rows", TMessageType.REPLY, seqid));
+        result.write(oprot);
+        oprot.writeMessageEnd();
+        oprot.getTransport().flush();
+      }
+
+    }
+
+    private class fetch_columns implements ProcessFunction {
+      public void process(int seqid, TProtocol iprot, TProtocol oprot) throws TException
+      {
+        fetch_columns_args args = new fetch_columns_args();
+        args.read(iprot);
+        iprot.readMessageEnd();
+        fetch_columns_result result = new fetch_columns_result();
+        try {
+          result.success = iface_.fetch_columns(args.query_id, args.start_row, args.max_rows);
+        } catch (QueryNotFoundException error) {
+          result.error = error;
+        } catch (BeeswaxException error2) {
+          result.error2 = error2;
+        } catch (Throwable th) {
+          LOGGER.error("Internal error processing fetch_columns", th);
+          TApplicationException x = new TApplicationException(TApplicationException.INTERNAL_ERROR, "Internal error processing fetch_columns");
+          oprot.writeMessageBegin(new TMessage("fetch_columns", TMessageType.EXCEPTION, seqid));
+          x.write(oprot);
+          oprot.writeMessageEnd();
+          oprot.getTransport().flush();
+          return;
+        }
+        oprot.writeMessageBegin(new TMessage("fetch_columns", TMessageType.REPLY, seqid));
+        result.write(oprot);
+        oprot.writeMessageEnd();
+        oprot.getTransport().flush();
+      }
+
+    }
+
     private class get_state implements ProcessFunction {
       public void process(int seqid, TProtocol iprot, TProtocol oprot) throws TException
       {
@@ -674,6 +888,34 @@ public class BeeswaxService {
 
     }
 
+    private class get_log_from implements ProcessFunction {
+      public void process(int seqid, TProtocol iprot, TProtocol oprot) throws TException
+      {
+        get_log_from_args args = new get_log_from_args();
+        args.read(iprot);
+        iprot.readMessageEnd();
+        get_log_from_result result = new get_log_from_result();
+        try {
+          result.success = iface_.get_log_from(args.context, args.start_offset);
+        } catch (QueryNotFoundException error) {
+          result.error = error;
+        } catch (Throwable th) {
+          LOGGER.error("Internal error processing get_log_from", th);
+          TApplicationException x = new TApplicationException(TApplicationException.INTERNAL_ERROR, "Internal error processing get_log_from");
+          oprot.writeMessageBegin(new TMessage("get_log_from", TMessageType.EXCEPTION, seqid));
+          x.write(oprot);
+          oprot.writeMessageEnd();
+          oprot.getTransport().flush();
+          return;
+        }
+        oprot.writeMessageBegin(new TMessage("get_log_from", TMessageType.REPLY, seqid));
+        result.write(oprot);
+        oprot.writeMessageEnd();
+        oprot.getTransport().flush();
+      }
+
+    }
+
     private class get_default_configuration implements ProcessFunction {
       public void process(int seqid, TProtocol iprot, TProtocol oprot) throws TException
       {
@@ -2326,80 +2568,162 @@ public class BeeswaxService {
 
   }
 
-  public static class get_state_args implements TBase, java.io.Serializable, Cloneable   {
-    private static final TStruct STRUCT_DESC = new TStruct("get_state_args");
-    private static final TField HANDLE_FIELD_DESC = new TField("handle", TType.STRUCT, (short)1);
+  public static class fetch_rows_args implements TBase, java.io.Serializable, Cloneable   {
+    private static final TStruct STRUCT_DESC = new TStruct("fetch_rows_args");
+    private static final TField QUERY_ID_FIELD_DESC = new TField("query_id", TType.STRUCT, (short)1);
+    private static final TField START_ROW_FIELD_DESC = new TField("start_row", TType.I64, (short)2);
+    private static final TField MAX_ROWS_FIELD_DESC = new TField("max_rows", TType.I32, (short)3);
 
-    public QueryHandle handle;
-    public static final int HANDLE = 1;
+    public QueryHandle query_id;
+    public static final int QUERY_ID = 1;
+    public long start_row;
+    public static final int START_ROW = 2;
+    public int max_rows;
+    public static final int MAX_ROWS = 3;
 
     private final Isset __isset = new Isset();
     private static final class Isset implements java.io.Serializable {
+      public boolean start_row = false;
+      public boolean max_rows = false;
     }
 
     public static final Map<Integer, FieldMetaData> metaDataMap = Collections.unmodifiableMap(new HashMap<Integer, FieldMetaData>() {{
-      put(HANDLE, new FieldMetaData("handle", TFieldRequirementType.DEFAULT, 
+      put(QUERY_ID, new FieldMetaData("query_id", TFieldRequirementType.DEFAULT, 
           new StructMetaData(TType.STRUCT, QueryHandle.class)));
+      put(START_ROW, new FieldMetaData("start_row", TFieldRequirementType.DEFAULT, 
+          new FieldValueMetaData(TType.I64)));
+      put(MAX_ROWS, new FieldMetaData("max_rows", TFieldRequirementType.DEFAULT, 
+          new FieldValueMetaData(TType.I32)));
     }});
 
     static {
-      FieldMetaData.addStructMetaDataMap(get_state_args.class, metaDataMap);
+      FieldMetaData.addStructMetaDataMap(fetch_rows_args.class, metaDataMap);
     }
 
-    public get_state_args() {
+    public fetch_rows_args() {
     }
 
-    public get_state_args(
-      QueryHandle handle)
+    public fetch_rows_args(
+      QueryHandle query_id,
+      long start_row,
+      int max_rows)
     {
       this();
-      this.handle = handle;
+      this.query_id = query_id;
+      this.start_row = start_row;
+      this.__isset.start_row = true;
+      this.max_rows = max_rows;
+      this.__isset.max_rows = true;
     }
 
     /**
      * Performs a deep copy on <i>other</i>.
      */
-    public get_state_args(get_state_args other) {
-      if (other.isSetHandle()) {
-        this.handle = new QueryHandle(other.handle);
+    public fetch_rows_args(fetch_rows_args other) {
+      if (other.isSetQuery_id()) {
+        this.query_id = new QueryHandle(other.query_id);
       }
+      __isset.start_row = other.__isset.start_row;
+      this.start_row = other.start_row;
+      __isset.max_rows = other.__isset.max_rows;
+      this.max_rows = other.max_rows;
     }
 
     @Override
-    public get_state_args clone() {
-      return new get_state_args(this);
+    public fetch_rows_args clone() {
+      return new fetch_rows_args(this);
     }
 
-    public QueryHandle getHandle() {
-      return this.handle;
+    public QueryHandle getQuery_id() {
+      return this.query_id;
     }
 
-    public void setHandle(QueryHandle handle) {
-      this.handle = handle;
+    public void setQuery_id(QueryHandle query_id) {
+      this.query_id = query_id;
     }
 
-    public void unsetHandle() {
-      this.handle = null;
+    public void unsetQuery_id() {
+      this.query_id = null;
     }
 
-    // Returns true if field handle is set (has been asigned a value) and false otherwise
-    public boolean isSetHandle() {
-      return this.handle != null;
+    // Returns true if field query_id is set (has been asigned a value) and false otherwise
+    public boolean isSetQuery_id() {
+      return this.query_id != null;
     }
 
-    public void setHandleIsSet(boolean value) {
+    public void setQuery_idIsSet(boolean value) {
       if (!value) {
-        this.handle = null;
+        this.query_id = null;
       }
     }
 
+    public long getStart_row() {
+      return this.start_row;
+    }
+
+    public void setStart_row(long start_row) {
+      this.start_row = start_row;
+      this.__isset.start_row = true;
+    }
+
+    public void unsetStart_row() {
+      this.__isset.start_row = false;
+    }
+
+    // Returns true if field start_row is set (has been asigned a value) and false otherwise
+    public boolean isSetStart_row() {
+      return this.__isset.start_row;
+    }
+
+    public void setStart_rowIsSet(boolean value) {
+      this.__isset.start_row = value;
+    }
+
+    public int getMax_rows() {
+      return this.max_rows;
+    }
+
+    public void setMax_rows(int max_rows) {
+      this.max_rows = max_rows;
+      this.__isset.max_rows = true;
+    }
+
+    public void unsetMax_rows() {
+      this.__isset.max_rows = false;
+    }
+
+    // Returns true if field max_rows is set (has been asigned a value) and false otherwise
+    public boolean isSetMax_rows() {
+      return this.__isset.max_rows;
+    }
+
+    public void setMax_rowsIsSet(boolean value) {
+      this.__isset.max_rows = value;
+    }
+
     public void setFieldValue(int fieldID, Object value) {
       switch (fieldID) {
-      case HANDLE:
+      case QUERY_ID:
         if (value == null) {
-          unsetHandle();
+          unsetQuery_id();
         } else {
-          setHandle((QueryHandle)value);
+          setQuery_id((QueryHandle)value);
+        }
+        break;
+
+      case START_ROW:
+        if (value == null) {
+          unsetStart_row();
+        } else {
+          setStart_row((Long)value);
+        }
+        break;
+
+      case MAX_ROWS:
+        if (value == null) {
+          unsetMax_rows();
+        } else {
+          setMax_rows((Integer)value);
         }
         break;
 
@@ -2410,8 +2734,14 @@ public class BeeswaxService {
 
     public Object getFieldValue(int fieldID) {
       switch (fieldID) {
-      case HANDLE:
-        return getHandle();
+      case QUERY_ID:
+        return getQuery_id();
+
+      case START_ROW:
+        return new Long(getStart_row());
+
+      case MAX_ROWS:
+        return new Integer(getMax_rows());
 
       default:
         throw new IllegalArgumentException("Field " + fieldID + " doesn't exist!");
@@ -2421,7 +2751,1865 @@ public class BeeswaxService {
     // Returns true if field corresponding to fieldID is set (has been asigned a value) and false otherwise
     public boolean isSet(int fieldID) {
       switch (fieldID) {
-      case HANDLE:
+      case QUERY_ID:
+        return isSetQuery_id();
+      case START_ROW:
+        return isSetStart_row();
+      case MAX_ROWS:
+        return isSetMax_rows();
+      default:
+        throw new IllegalArgumentException("Field " + fieldID + " doesn't exist!");
+      }
+    }
+
+    @Override
+    public boolean equals(Object that) {
+      if (that == null)
+        return false;
+      if (that instanceof fetch_rows_args)
+        return this.equals((fetch_rows_args)that);
+      return false;
+    }
+
+    public boolean equals(fetch_rows_args that) {
+      if (that == null)
+        return false;
+
+      boolean this_present_query_id = true && this.isSetQuery_id();
+      boolean that_present_query_id = true && that.isSetQuery_id();
+      if (this_present_query_id || that_present_query_id) {
+        if (!(this_present_query_id && that_present_query_id))
+          return false;
+        if (!this.query_id.equals(that.query_id))
+          return false;
+      }
+
+      boolean this_present_start_row = true;
+      boolean that_present_start_row = true;
+      if (this_present_start_row || that_present_start_row) {
+        if (!(this_present_start_row && that_present_start_row))
+          return false;
+        if (this.start_row != that.start_row)
+          return false;
+      }
+
+      boolean this_present_max_rows = true;
+      boolean that_present_max_rows = true;
+      if (this_present_max_rows || that_present_max_rows) {
+        if (!(this_present_max_rows && that_present_max_rows))
+          return false;
+        if (this.max_rows != that.max_rows)
+          return false;
+      }
+
+      return true;
+    }
+
+    @Override
+    public int hashCode() {
+      HashCodeBuilder builder = new HashCodeBuilder();
+
+      boolean present_query_id = true && (isSetQuery_id());
+      builder.append(present_query_id);
+      if (present_query_id)
+        builder.append(query_id);
+
+      boolean present_start_row = true;
+      builder.append(present_start_row);
+      if (present_start_row)
+        builder.append(start_row);
+
+      boolean present_max_rows = true;
+      builder.append(present_max_rows);
+      if (present_max_rows)
+        builder.append(max_rows);
+
+      return builder.toHashCode();
+    }
+
+    public void read(TProtocol iprot) throws TException {
+      TField field;
+      iprot.readStructBegin();
+      while (true)
+      {
+        field = iprot.readFieldBegin();
+        if (field.type == TType.STOP) { 
+          break;
+        }
+        switch (field.id)
+        {
+          case QUERY_ID:
+            if (field.type == TType.STRUCT) {
+              this.query_id = new QueryHandle();
+              this.query_id.read(iprot);
+            } else { 
+              TProtocolUtil.skip(iprot, field.type);
+            }
+            break;
+          case START_ROW:
+            if (field.type == TType.I64) {
+              this.start_row = iprot.readI64();
+              this.__isset.start_row = true;
+            } else { 
+              TProtocolUtil.skip(iprot, field.type);
+            }
+            break;
+          case MAX_ROWS:
+            if (field.type == TType.I32) {
+              this.max_rows = iprot.readI32();
+              this.__isset.max_rows = true;
+            } else { 
+              TProtocolUtil.skip(iprot, field.type);
+            }
+            break;
+          default:
+            TProtocolUtil.skip(iprot, field.type);
+            break;
+        }
+        iprot.readFieldEnd();
+      }
+      iprot.readStructEnd();
+
+
+      // check for required fields of primitive type, which can't be checked in the validate method
+      validate();
+    }
+
+    public void write(TProtocol oprot) throws TException {
+      validate();
+
+      oprot.writeStructBegin(STRUCT_DESC);
+      if (this.query_id != null) {
+        oprot.writeFieldBegin(QUERY_ID_FIELD_DESC);
+        this.query_id.write(oprot);
+        oprot.writeFieldEnd();
+      }
+      oprot.writeFieldBegin(START_ROW_FIELD_DESC);
+      oprot.writeI64(this.start_row);
+      oprot.writeFieldEnd();
+      oprot.writeFieldBegin(MAX_ROWS_FIELD_DESC);
+      oprot.writeI32(this.max_rows);
+      oprot.writeFieldEnd();
+      oprot.writeFieldStop();
+      oprot.writeStructEnd();
+    }
+
+    @Override
+    public String toString() {
+      StringBuilder sb = new StringBuilder("fetch_rows_args(");
+      boolean first = true;
+
+      sb.append("query_id:");
+      if (this.query_id == null) {
+        sb.append("null");
+      } else {
+        sb.append(this.query_id);
+      }
+      first = false;
+      if (!first) sb.append(", ");
+      sb.append("start_row:");
+      sb.append(this.start_row);
+      first = false;
+      if (!first) sb.append(", ");
+      sb.append("max_rows:");
+      sb.append(this.max_rows);
+      first = false;
+      sb.append(")");
+      return sb.toString();
+    }
+
+    public void validate() throws TException {
+      // check for required fields
+      // check that fields of type enum have valid values
+    }
+
+  }
+
+  public static class fetch_rows_result implements TBase, java.io.Serializable, Cloneable   {
+    private static final TStruct STRUCT_DESC = new TStruct("fetch_rows_result");
+    private static final TField SUCCESS_FIELD_DESC = new TField("success", TType.STRUCT, (short)0);
+    private static final TField ERROR_FIELD_DESC = new TField("error", TType.STRUCT, (short)1);
+    private static final TField ERROR2_FIELD_DESC = new TField("error2", TType.STRUCT, (short)2);
+
+    public Results success;
+    public static final int SUCCESS = 0;
+    public QueryNotFoundException error;
+    public static final int ERROR = 1;
+    public BeeswaxException error2;
+    public static final int ERROR2 = 2;
+
+    private final Isset __isset = new Isset();
+    private static final class Isset implements java.io.Serializable {
+    }
+
+    public static final Map<Integer, FieldMetaData> metaDataMap = Collections.unmodifiableMap(new HashMap<Integer, FieldMetaData>() {{
+      put(SUCCESS, new FieldMetaData("success", TFieldRequirementType.DEFAULT, 
+          new StructMetaData(TType.STRUCT, Results.class)));
+      put(ERROR, new FieldMetaData("error", TFieldRequirementType.DEFAULT, 
+          new FieldValueMetaData(TType.STRUCT)));
+      put(ERROR2, new FieldMetaData("error2", TFieldRequirementType.DEFAULT, 
+          new FieldValueMetaData(TType.STRUCT)));
+    }});
+
+    static {
+      FieldMetaData.addStructMetaDataMap(fetch_rows_result.class, metaDataMap);
+    }
+
+    public fetch_rows_result() {
+    }
+
+    public fetch_rows_result(
+      Results success,
+      QueryNotFoundException error,
+      BeeswaxException error2)
+    {
+      this();
+      this.success = success;
+      this.error = error;
+      this.error2 = error2;
+    }
+
+    /**
+     * Performs a deep copy on <i>other</i>.
+     */
+    public fetch_rows_result(fetch_rows_result other) {
+      if (other.isSetSuccess()) {
+        this.success = new Results(other.success);
+      }
+      if (other.isSetError()) {
+        this.error = new QueryNotFoundException(other.error);
+      }
+      if (other.isSetError2()) {
+        this.error2 = new BeeswaxException(other.error2);
+      }
+    }
+
+    @Override
+    public fetch_rows_result clone() {
+      return new fetch_rows_result(this);
+    }
+
+    public Results getSuccess() {
+      return this.success;
+    }
+
+    public void setSuccess(Results success) {
+      this.success = success;
+    }
+
+    public void unsetSuccess() {
+      this.success = null;
+    }
+
+    // Returns true if field success is set (has been asigned a value) and false otherwise
+    public boolean isSetSuccess() {
+      return this.success != null;
+    }
+
+    public void setSuccessIsSet(boolean value) {
+      if (!value) {
+        this.success = null;
+      }
+    }
+
+    public QueryNotFoundException getError() {
+      return this.error;
+    }
+
+    public void setError(QueryNotFoundException error) {
+      this.error = error;
+    }
+
+    public void unsetError() {
+      this.error = null;
+    }
+
+    // Returns true if field error is set (has been asigned a value) and false otherwise
+    public boolean isSetError() {
+      return this.error != null;
+    }
+
+    public void setErrorIsSet(boolean value) {
+      if (!value) {
+        this.error = null;
+      }
+    }
+
+    public BeeswaxException getError2() {
+      return this.error2;
+    }
+
+    public void setError2(BeeswaxException error2) {
+      this.error2 = error2;
+    }
+
+    public void unsetError2() {
+      this.error2 = null;
+    }
+
+    // Returns true if field error2 is set (has been asigned a value) and false otherwise
+    public boolean isSetError2() {
+      return this.error2 != null;
+    }
+
+    public void setError2IsSet(boolean value) {
+      if (!value) {
+        this.error2 = null;
+      }
+    }
+
+    public void setFieldValue(int fieldID, Object value) {
+      switch (fieldID) {
+      case SUCCESS:
+        if (value == null) {
+          unsetSuccess();
+        } else {
+          setSuccess((Results)value);
+        }
+        break;
+
+      case ERROR:
+        if (value == null) {
+          unsetError();
+        } else {
+          setError((QueryNotFoundException)value);
+        }
+        break;
+
+      case ERROR2:
+        if (value == null) {
+          unsetError2();
+        } else {
+          setError2((BeeswaxException)value);
+        }
+        break;
+
+      default:
+        throw new IllegalArgumentException("Field " + fieldID + " doesn't exist!");
+      }
+    }
+
+    public Object getFieldValue(int fieldID) {
+      switch (fieldID) {
+      case SUCCESS:
+        return getSuccess();
+
+      case ERROR:
+        return getError();
+
+      case ERROR2:
+        return getError2();
+
+      default:
+        throw new IllegalArgumentException("Field " + fieldID + " doesn't exist!");
+      }
+    }
+
+    // Returns true if field corresponding to fieldID is set (has been asigned a value) and false otherwise
+    public boolean isSet(int fieldID) {
+      switch (fieldID) {
+      case SUCCESS:
+        return isSetSuccess();
+      case ERROR:
+        return isSetError();
+      case ERROR2:
+        return isSetError2();
+      default:
+        throw new IllegalArgumentException("Field " + fieldID + " doesn't exist!");
+      }
+    }
+
+    @Override
+    public boolean equals(Object that) {
+      if (that == null)
+        return false;
+      if (that instanceof fetch_rows_result)
+        return this.equals((fetch_rows_result)that);
+      return false;
+    }
+
+    public boolean equals(fetch_rows_result that) {
+      if (that == null)
+        return false;
+
+      boolean this_present_success = true && this.isSetSuccess();
+      boolean that_present_success = true && that.isSetSuccess();
+      if (this_present_success || that_present_success) {
+        if (!(this_present_success && that_present_success))
+          return false;
+        if (!this.success.equals(that.success))
+          return false;
+      }
+
+      boolean this_present_error = true && this.isSetError();
+      boolean that_present_error = true && that.isSetError();
+      if (this_present_error || that_present_error) {
+        if (!(this_present_error && that_present_error))
+          return false;
+        if (!this.error.equals(that.error))
+          return false;
+      }
+
+      boolean this_present_error2 = true && this.isSetError2();
+      boolean that_present_error2 = true && that.isSetError2();
+      if (this_present_error2 || that_present_error2) {
+        if (!(this_present_error2 && that_present_error2))
+          return false;
+        if (!this.error2.equals(that.error2))
+          return false;
+      }
+
+      return true;
+    }
+
+    @Override
+    public int hashCode() {
+      HashCodeBuilder builder = new HashCodeBuilder();
+
+      boolean present_success = true && (isSetSuccess());
+      builder.append(present_success);
+      if (present_success)
+        builder.append(success);
+
+      boolean present_error = true && (isSetError());
+      builder.append(present_error);
+      if (present_error)
+        builder.append(error);
+
+      boolean present_error2 = true && (isSetError2());
+      builder.append(present_error2);
+      if (present_error2)
+        builder.append(error2);
+
+      return builder.toHashCode();
+    }
+
+    public void read(TProtocol iprot) throws TException {
+      TField field;
+      iprot.readStructBegin();
+      while (true)
+      {
+        field = iprot.readFieldBegin();
+        if (field.type == TType.STOP) { 
+          break;
+        }
+        switch (field.id)
+        {
+          case SUCCESS:
+            if (field.type == TType.STRUCT) {
+              this.success = new Results();
+              this.success.read(iprot);
+            } else { 
+              TProtocolUtil.skip(iprot, field.type);
+            }
+            break;
+          case ERROR:
+            if (field.type == TType.STRUCT) {
+              this.error = new QueryNotFoundException();
+              this.error.read(iprot);
+            } else { 
+              TProtocolUtil.skip(iprot, field.type);
+            }
+            break;
+          case ERROR2:
+            if (field.type == TType.STRUCT) {
+              this.error2 = new BeeswaxException();
+              this.error2.read(iprot);
+            } else { 
+              TProtocolUtil.skip(iprot, field.type);
+            }
+            break;
+          default:
+            TProtocolUtil.skip(iprot, field.type);
+            break;
+        }
+        iprot.readFieldEnd();
+      }
+      iprot.readStructEnd();
+
+
+      // check for required fields of primitive type, which can't be checked in the validate method
+      validate();
+    }
+
+    public void write(TProtocol oprot) throws TException {
+      oprot.writeStructBegin(STRUCT_DESC);
+
+      if (this.isSetSuccess()) {
+        oprot.writeFieldBegin(SUCCESS_FIELD_DESC);
+        this.success.write(oprot);
+        oprot.writeFieldEnd();
+      } else if (this.isSetError()) {
+        oprot.writeFieldBegin(ERROR_FIELD_DESC);
+        this.error.write(oprot);
+        oprot.writeFieldEnd();
+      } else if (this.isSetError2()) {
+        oprot.writeFieldBegin(ERROR2_FIELD_DESC);
+        this.error2.write(oprot);
+        oprot.writeFieldEnd();
+      }
+      oprot.writeFieldStop();
+      oprot.writeStructEnd();
+    }
+
+    @Override
+    public String toString() {
+      StringBuilder sb = new StringBuilder("fetch_rows_result(");
+      boolean first = true;
+
+      sb.append("success:");
+      if (this.success == null) {
+        sb.append("null");
+      } else {
+        sb.append(this.success);
+      }
+      first = false;
+      if (!first) sb.append(", ");
+      sb.append("error:");
+      if (this.error == null) {
+        sb.append("null");
+      } else {
+        sb.append(this.error);
+      }
+      first = false;
+      if (!first) sb.append(", ");
+      sb.append("error2:");
+      if (this.error2 == null) {
+        sb.append("null");
+      } else {
+        sb.append(this.error2);
+      }
+      first = false;
+      sb.append(")");
+      return sb.toString();
+    }
+
+    public void validate() throws TException {
+      // check for required fields
+      // check that fields of type enum have valid values
+    }
+
+  }
+
+  public static class fetch_columns_args implements TBase, java.io.Serializable, Cloneable   {
+    private static final TStruct STRUCT_DESC = new TStruct("fetch_columns_args");
+    private static final TField QUERY_ID_FIELD_DESC = new TField("query_id", TType.STRUCT, (short)1);
+    private static final TField START_ROW_FIELD_DESC = new TField("start_row", TType.I64, (short)2);
+    private static final TField MAX_ROWS_FIELD_DESC = new TField("max_rows", TType.I32, (short)3);
+
+    public QueryHandle query_id;
+    public static final int QUERY_ID = 1;
+    public long start_row;
+    public static final int START_ROW = 2;
+    public int max_rows;
+    public static final int MAX_ROWS = 3;
+
+    private final Isset __isset = new Isset();
+    private static final class Isset implements java.io.Serializable {
+      public boolean start_row = false;
+      public boolean max_rows = false;
+    }
+
+    public static final Map<Integer, FieldMetaData> metaDataMap = Collections.unmodifiableMap(new HashMap<Integer, FieldMetaData>() {{
+      put(QUERY_ID, new FieldMetaData("query_id", TFieldRequirementType.DEFAULT, 
+          new StructMetaData(TType.STRUCT, QueryHandle.class)));
+      put(START_ROW, new FieldMetaData("start_row", TFieldRequirementType.DEFAULT, 
+          new FieldValueMetaData(TType.I64)));
+      put(MAX_ROWS, new FieldMetaData("max_rows", TFieldRequirementType.DEFAULT, 
+          new FieldValueMetaData(TType.I32)));
+    }});
+
+    static {
+      FieldMetaData.addStructMetaDataMap(fetch_columns_args.class, metaDataMap);
+    }
+
+    public fetch_columns_args() {
+    }
+
+    public fetch_columns_args(
+      QueryHandle query_id,
+      long start_row,
+      int max_rows)
+    {
+      this();
+      this.query_id = query_id;
+      this.start_row = start_row;
+      this.__isset.start_row = true;
+      this.max_rows = max_rows;
+      this.__isset.max_rows = true;
+    }
+
+    /**
+     * Performs a deep copy on <i>other</i>.
+     */
+    public fetch_columns_args(fetch_columns_args other) {
+      if (other.isSetQuery_id()) {
+        this.query_id = new QueryHandle(other.query_id);
+      }
+      __isset.start_row = other.__isset.start_row;
+      this.start_row = other.start_row;
+      __isset.max_rows = other.__isset.max_rows;
+      this.max_rows = other.max_rows;
+    }
+
+    @Override
+    public fetch_columns_args clone() {
+      return new fetch_columns_args(this);
+    }
+
+    public QueryHandle getQuery_id() {
+      return this.query_id;
+    }
+
+    public void setQuery_id(QueryHandle query_id) {
+      this.query_id = query_id;
+    }
+
+    public void unsetQuery_id() {
+      this.query_id = null;
+    }
+
+    // Returns true if field query_id is set (has been asigned a value) and false otherwise
+    public boolean isSetQuery_id() {
+      return this.query_id != null;
+    }
+
+    public void setQuery_idIsSet(boolean value) {
+      if (!value) {
+        this.query_id = null;
+      }
+    }
+
+    public long getStart_row() {
+      return this.start_row;
+    }
+
+    public void setStart_row(long start_row) {
+      this.start_row = start_row;
+      this.__isset.start_row = true;
+    }
+
+    public void unsetStart_row() {
+      this.__isset.start_row = false;
+    }
+
+    // Returns true if field start_row is set (has been asigned a value) and false otherwise
+    public boolean isSetStart_row() {
+      return this.__isset.start_row;
+    }
+
+    public void setStart_rowIsSet(boolean value) {
+      this.__isset.start_row = value;
+    }
+
+    public int getMax_rows() {
+      return this.max_rows;
+    }
+
+    public void setMax_rows(int max_rows) {
+      this.max_rows = max_rows;
+      this.__isset.max_rows = true;
+    }
+
+    public void unsetMax_rows() {
+      this.__isset.max_rows = false;
+    }
+
+    // Returns true if field max_rows is set (has been asigned a value) and false otherwise
+    public boolean isSetMax_rows() {
+      return this.__isset.max_rows;
+    }
+
+    public void setMax_rowsIsSet(boolean value) {
+      this.__isset.max_rows = value;
+    }
+
+    public void setFieldValue(int fieldID, Object value) {
+      switch (fieldID) {
+      case QUERY_ID:
+        if (value == null) {
+          unsetQuery_id();
+        } else {
+          setQuery_id((QueryHandle)value);
+        }
+        break;
+
+      case START_ROW:
+        if (value == null) {
+          unsetStart_row();
+        } else {
+          setStart_row((Long)value);
+        }
+        break;
+
+      case MAX_ROWS:
+        if (value == null) {
+          unsetMax_rows();
+        } else {
+          setMax_rows((Integer)value);
+        }
+        break;
+
+      default:
+        throw new IllegalArgumentException("Field " + fieldID + " doesn't exist!");
+      }
+    }
+
+    public Object getFieldValue(int fieldID) {
+      switch (fieldID) {
+      case QUERY_ID:
+        return getQuery_id();
+
+      case START_ROW:
+        return new Long(getStart_row());
+
+      case MAX_ROWS:
+        return new Integer(getMax_rows());
+
+      default:
+        throw new IllegalArgumentException("Field " + fieldID + " doesn't exist!");
+      }
+    }
+
+    // Returns true if field corresponding to fieldID is set (has been asigned a value) and false otherwise
+    public boolean isSet(int fieldID) {
+      switch (fieldID) {
+      case QUERY_ID:
+        return isSetQuery_id();
+      case START_ROW:
+        return isSetStart_row();
+      case MAX_ROWS:
+        return isSetMax_rows();
+      default:
+        throw new IllegalArgumentException("Field " + fieldID + " doesn't exist!");
+      }
+    }
+
+    @Override
+    public boolean equals(Object that) {
+      if (that == null)
+        return false;
+      if (that instanceof fetch_columns_args)
+        return this.equals((fetch_columns_args)that);
+      return false;
+    }
+
+    public boolean equals(fetch_columns_args that) {
+      if (that == null)
+        return false;
+
+      boolean this_present_query_id = true && this.isSetQuery_id();
+      boolean that_present_query_id = true && that.isSetQuery_id();
+      if (this_present_query_id || that_present_query_id) {
+        if (!(this_present_query_id && that_present_query_id))
+          return false;
+        if (!this.query_id.equals(that.query_id))
+          return false;
+      }
+
+      boolean this_present_start_row = true;
+      boolean that_present_start_row = true;
+      if (this_present_start_row || that_present_start_row) {
+        if (!(this_present_start_row && that_present_start_row))
+          return false;
+        if (this.start_row != that.start_row)
+          return false;
+      }
+
+      boolean this_present_max_rows = true;
+      boolean that_present_max_rows = true;
+      if (this_present_max_rows || that_present_max_rows) {
+        if (!(this_present_max_rows && that_present_max_rows))
+          return false;
+        if (this.max_rows != that.max_rows)
+          return false;
+      }
+
+      return true;
+    }
+
+    @Override
+    public int hashCode() {
+      HashCodeBuilder builder = new HashCodeBuilder();
+
+      boolean present_query_id = true && (isSetQuery_id());
+      builder.append(present_query_id);
+      if (present_query_id)
+        builder.append(query_id);
+
+      boolean present_start_row = true;
+      builder.append(present_start_row);
+      if (present_start_row)
+        builder.append(start_row);
+
+      boolean present_max_rows = true;
+      builder.append(present_max_rows);
+      if (present_max_rows)
+        builder.append(max_rows);
+
+      return builder.toHashCode();
+    }
+
+    public void read(TProtocol iprot) throws TException {
+      TField field;
+      iprot.readStructBegin();
+      while (true)
+      {
+        field = iprot.readFieldBegin();
+        if (field.type == TType.STOP) { 
+          break;
+        }
+        switch (field.id)
+        {
+          case QUERY_ID:
+            if (field.type == TType.STRUCT) {
+              this.query_id = new QueryHandle();
+              this.query_id.read(iprot);
+            } else { 
+              TProtocolUtil.skip(iprot, field.type);
+            }
+            break;
+          case START_ROW:
+            if (field.type == TType.I64) {
+              this.start_row = iprot.readI64();
+              this.__isset.start_row = true;
+            } else { 
+              TProtocolUtil.skip(iprot, field.type);
+            }
+            break;
+          case MAX_ROWS:
+            if (field.type == TType.I32) {
+              this.max_rows = iprot.readI32();
+              this.__isset.max_rows = true;
+            } else { 
+              TProtocolUtil.skip(iprot, field.type);
+            }
+            break;
+          default:
+            TProtocolUtil.skip(iprot, field.type);
+            break;
+        }
+        iprot.readFieldEnd();
+      }
+      iprot.readStructEnd();
+
+
+      // check for required fields of primitive type, which can't be checked in the validate method
+      validate();
+    }
+
+    public void write(TProtocol oprot) throws TException {
+      validate();
+
+      oprot.writeStructBegin(STRUCT_DESC);
+      if (this.query_id != null) {
+        oprot.writeFieldBegin(QUERY_ID_FIELD_DESC);
+        this.query_id.write(oprot);
+        oprot.writeFieldEnd();
+      }
+      oprot.writeFieldBegin(START_ROW_FIELD_DESC);
+      oprot.writeI64(this.start_row);
+      oprot.writeFieldEnd();
+      oprot.writeFieldBegin(MAX_ROWS_FIELD_DESC);
+      oprot.writeI32(this.max_rows);
+      oprot.writeFieldEnd();
+      oprot.writeFieldStop();
+      oprot.writeStructEnd();
+    }
+
+    @Override
+    public String toString() {
+      StringBuilder sb = new StringBuilder("fetch_columns_args(");
+      boolean first = true;
+
+      sb.append("query_id:");
+      if (this.query_id == null) {
+        sb.append("null");
+      } else {
+        sb.append(this.query_id);
+      }
+      first = false;
+      if (!first) sb.append(", ");
+      sb.append("start_row:");
+      sb.append(this.start_row);
+      first = false;
+      if (!first) sb.append(", ");
+      sb.append("max_rows:");
+      sb.append(this.max_rows);
+      first = false;
+      sb.append(")");
+      return sb.toString();
+    }
+
+    public void validate() throws TException {
+      // check for required fields
+      // check that fields of type enum have valid values
+    }
+
+  }
+
+  public static class fetch_columns_result implements TBase, java.io.Serializable, Cloneable   {
+    private static final TStruct STRUCT_DESC = new TStruct("fetch_columns_result");
+    private static final TField SUCCESS_FIELD_DESC = new TField("success", TType.STRUCT, (short)0);
+    private static final TField ERROR_FIELD_DESC = new TField("error", TType.STRUCT, (short)1);
+    private static final TField ERROR2_FIELD_DESC = new TField("error2", TType.STRUCT, (short)2);
+
+    public ColumnarResults success;
+    public static final int SUCCESS = 0;
+    public QueryNotFoundException error;
+    public static final int ERROR = 1;
+    public BeeswaxException error2;
+    public static final int ERROR2 = 2;
+
+    private final Isset __isset = new Isset();
+    private static final class Isset implements java.io.Serializable {
+    }
+
+    public static final Map<Integer, FieldMetaData> metaDataMap = Collections.unmodifiableMap(new HashMap<Integer, FieldMetaData>() {{
+      put(SUCCESS, new FieldMetaData("success", TFieldRequirementType.DEFAULT, 
+          new StructMetaData(TType.STRUCT, ColumnarResults.class)));
+      put(ERROR, new FieldMetaData("error", TFieldRequirementType.DEFAULT, 
+          new FieldValueMetaData(TType.STRUCT)));
+      put(ERROR2, new FieldMetaData("error2", TFieldRequirementType.DEFAULT, 
+          new FieldValueMetaData(TType.STRUCT)));
+    }});
+
+    static {
+      FieldMetaData.addStructMetaDataMap(fetch_columns_result.class, metaDataMap);
+    }
+
+    public fetch_columns_result() {
+    }
+
+    public fetch_columns_result(
+      ColumnarResults success,
+      QueryNotFoundException error,
+      BeeswaxException error2)
+    {
+      this();
+      this.success = success;
+      this.error = error;
+      this.error2 = error2;
+    }
+
+    /**
+     * Performs a deep copy on <i>other</i>.
+     */
+    public fetch_columns_result(fetch_columns_result other) {
+      if (other.isSetSuccess()) {
+        this.success = new ColumnarResults(other.success);
+      }
+      if (other.isSetError()) {
+        this.error = new QueryNotFoundException(other.error);
+      }
+      if (other.isSetError2()) {
+        this.error2 = new BeeswaxException(other.error2);
+      }
+    }
+
+    @Override
+    public fetch_columns_result clone() {
+      return new fetch_columns_result(this);
+    }
+
+    public ColumnarResults getSuccess() {
+      return this.success;
+    }
+
+    public void setSuccess(ColumnarResults success) {
+      this.success = success;
+    }
+
+    public void unsetSuccess() {
+      this.success = null;
+    }
+
+    // Returns true if field success is set (has been asigned a value) and false otherwise
+    public boolean isSetSuccess() {
+      return this.success != null;
+    }
+
+    public void setSuccessIsSet(boolean value) {
+      if (!value) {
+        this.success = null;
+      }
+    }
+
+    public QueryNotFoundException getError() {
+      return this.error;
+    }
+
+    public void setError(QueryNotFoundException error) {
+      this.error = error;
+    }
+
+    public void unsetError() {
+      this.error = null;
+    }
+
+    // Returns true if field error is set (has been asigned a value) and false otherwise
+    public boolean isSetError() {
+      return this.error != null;
+    }
+
+    public void setErrorIsSet(boolean value) {
+      if (!value) {
+        this.error = null;
+      }
+    }
+
+    public BeeswaxException getError2() {
+      return this.error2;
+    }
+
+    public void setError2(BeeswaxException error2) {
+      this.error2 = error2;
+    }
+
+    public void unsetError2() {
+      this.error2 = null;
+    }
+
+    // Returns true if field error2 is set (has been asigned a value) and false otherwise
+    public boolean isSetError2() {
+      return this.error2 != null;
+    }
+
+    public void setError2IsSet(boolean value) {
+      if (!value) {
+        this.error2 = null;
+      }
+    }
+
+    public void setFieldValue(int fieldID, Object value) {
+      switch (fieldID) {
+      case SUCCESS:
+        if (value == null) {
+          unsetSuccess();
+        } else {
+          setSuccess((ColumnarResults)value);
+        }
+        break;
+
+      case ERROR:
+        if (value == null) {
+          unsetError();
+        } else {
+          setError((QueryNotFoundException)value);
+        }
+        break;
+
+      case ERROR2:
+        if (value == null) {
+          unsetError2();
+        } else {
+          setError2((BeeswaxException)value);
+        }
+        break;
+
+      default:
+        throw new IllegalArgumentException("Field " + fieldID + " doesn't exist!");
+      }
+    }
+
+    public Object getFieldValue(int fieldID) {
+      switch (fieldID) {
+      case SUCCESS:
+        return getSuccess();
+
+      case ERROR:
+        return getError();
+
+      case ERROR2:
+        return getError2();
+
+      default:
+        throw new IllegalArgumentException("Field " + fieldID + " doesn't exist!");
+      }
+    }
+
+    // Returns true if field corresponding to fieldID is set (has been asigned a value) and false otherwise
+    public boolean isSet(int fieldID) {
+      switch (fieldID) {
+      case SUCCESS:
+        return isSetSuccess();
+      case ERROR:
+        return isSetError();
+      case ERROR2:
+        return isSetError2();
+      default:
+        throw new IllegalArgumentException("Field " + fieldID + " doesn't exist!");
+      }
+    }
+
+    @Override
+    public boolean equals(Object that) {
+      if (that == null)
+        return false;
+      if (that instanceof fetch_columns_result)
+        return this.equals((fetch_columns_result)that);
+      return false;
+    }
+
+    public boolean equals(fetch_columns_result that) {
+      if (that == null)
+        return false;
+
+      boolean this_present_success = true && this.isSetSuccess();
+      boolean that_present_success = true && that.isSetSuccess();
+      if (this_present_success || that_present_success) {
+        if (!(this_present_success && that_present_success))
+          return false;
+        if (!this.success.equals(that.success))
+          return false;
+      }
+
+      boolean this_present_error = true && this.isSetError();
+      boolean that_present_error = true && that.isSetError();
+      if (this_present_error || that_present_error) {
+        if (!(this_present_error && that_present_error))
+          return false;
+        if (!this.error.equals(that.error))
+          return false;
+      }
+
+      boolean this_present_error2 = true && this.isSetError2();
+      boolean that_present_error2 = true && that.isSetError2();
+      if (this_present_error2 || that_present_error2) {
+        if (!(this_present_error2 && that_present_error2))
+          return false;
+        if (!this.error2.equals(that.error2))
+          return false;
+      }
+
+      return true;
+    }
+
+    @Override
+    public int hashCode() {
+      HashCodeBuilder builder = new HashCodeBuilder();
+
+      boolean present_success = true && (isSetSuccess());
+      builder.append(present_success);
+      if (present_success)
+        builder.append(success);
+
+      boolean present_error = true && (isSetError());
+      builder.append(present_error);
+      if (present_error)
+        builder.append(error);
+
+      boolean present_error2 = true && (isSetError2());
+      builder.append(present_error2);
+      if (present_error2)
+        builder.append(error2);
+
+      return builder.toHashCode();
+    }
+
+    public void read(TProtocol iprot) throws TException {
+      TField field;
+      iprot.readStructBegin();
+      while (true)
+      {
+        field = iprot.readFieldBegin();
+        if (field.type == TType.STOP) { 
+          break;
+        }
+        switch (field.id)
+        {
+          case SUCCESS:
+            if (field.type == TType.STRUCT) {
+              this.success = new ColumnarResults();
+              this.success.read(iprot);
+            } else { 
+              TProtocolUtil.skip(iprot, field.type);
+            }
+            break;
+          case ERROR:
+            if (field.type == TType.STRUCT) {
+              this.error = new QueryNotFoundException();
+              this.error.read(iprot);
+            } else { 
+              TProtocolUtil.skip(iprot, field.type);
+            }
+            break;
+          case ERROR2:
+            if (field.type == TType.STRUCT) {
+              this.error2 = new BeeswaxException();
+              this.error2.read(iprot);
+            } else { 
+              TProtocolUtil.skip(iprot, field.type);
+            }
+            break;
+          default:
+            TProtocolUtil.skip(iprot, field.type);
+            break;
+        }
+        iprot.readFieldEnd();
+      }
+      iprot.readStructEnd();
+
+
+      // check for required fields of primitive type, which can't be checked in the validate method
+      validate();
+    }
+
+    public void write(TProtocol oprot) throws TException {
+      oprot.writeStructBegin(STRUCT_DESC);
+
+      if (this.isSetSuccess()) {
+        oprot.writeFieldBegin(SUCCESS_FIELD_DESC);
+        this.success.write(oprot);
+        oprot.writeFieldEnd();
+      } else if (this.isSetError()) {
+        oprot.writeFieldBegin(ERROR_FIELD_DESC);
+        this.error.write(oprot);
+        oprot.writeFieldEnd();
+      } else if (this.isSetError2()) {
+        oprot.writeFieldBegin(ERROR2_FIELD_DESC);
+        this.error2.write(oprot);
+        oprot.writeFieldEnd();
+      }
+      oprot.writeFieldStop();
+      oprot.writeStructEnd();
+    }
+
+    @Override
+    public String toString() {
+      StringBuilder sb = new StringBuilder("fetch_columns_result(");
+      boolean first = true;
+
+      sb.append("success:");
+      if (this.success == null) {
+        sb.append("null");
+      } else {
+        sb.append(this.success);
+      }
+      first = false;
+      if (!first) sb.append(", ");
+      sb.append("error:");
+      if (this.error == null) {
+        sb.append("null");
+      } else {
+        sb.append(this.error);
+      }
+      first = false;
+      if (!first) sb.append(", ");
+      sb.append("error2:");
+      if (this.error2 == null) {
+        sb.append("null");
+      } else {
+        sb.append(this.error2);
+      }
+      first = false;
+      sb.append(")");
+      return sb.toString();
+    }
+
+    public void validate() throws TException {
+      // check for required fields
+      // check that fields of type enum have valid values
+    }
+
+  }
+
+  public static class get_state_args implements TBase, java.io.Serializable, Cloneable   {
+    private static final TStruct STRUCT_DESC = new TStruct("get_state_args");
+    private static final TField HANDLE_FIELD_DESC = new TField("handle", TType.STRUCT, (short)1);
+
+    public QueryHandle handle;
+    public static final int HANDLE = 1;
+
+    private final Isset __isset = new Isset();
+    private static final class Isset implements java.io.Serializable {
+    }
+
+    public static final Map<Integer, FieldMetaData> metaDataMap = Collections.unmodifiableMap(new HashMap<Integer, FieldMetaData>() {{
+      put(HANDLE, new FieldMetaData("handle", TFieldRequirementType.DEFAULT, 
+          new StructMetaData(TType.STRUCT, QueryHandle.class)));
+    }});
+
+    static {
+      FieldMetaData.addStructMetaDataMap(get_state_args.class, metaDataMap);
+    }
+
+    public get_state_args() {
+    }
+
+    public get_state_args(
+      QueryHandle handle)
+    {
+      this();
+      this.handle = handle;
+    }
+
+    /**
+     * Performs a deep copy on <i>other</i>.
+     */
+    public get_state_args(get_state_args other) {
+      if (other.isSetHandle()) {
+        this.handle = new QueryHandle(other.handle);
+      }
+    }
+
+    @Override
+    public get_state_args clone() {
+      return new get_state_args(this);
+    }
+
+    public QueryHandle getHandle() {
+      return this.handle;
+    }
+
+    public void setHandle(QueryHandle handle) {
+      this.handle = handle;
+    }
+
+    public void unsetHandle() {
+      this.handle = null;
+    }
+
+    // Returns true if field handle is set (has been asigned a value) and false otherwise
+    public boolean isSetHandle() {
+      return this.handle != null;
+    }
+
+    public void setHandleIsSet(boolean value) {
+      if (!value) {
+        this.handle = null;
+      }
+    }
+
+    public void setFieldValue(int fieldID, Object value) {
+      switch (fieldID) {
+      case HANDLE:
+        if (value == null) {
+          unsetHandle();
+        } else {
+          setHandle((QueryHandle)value);
+        }
+        break;
+
+      default:
+        throw new IllegalArgumentException("Field " + fieldID + " doesn't exist!");
+      }
+    }
+
+    public Object getFieldValue(int fieldID) {
+      switch (fieldID) {
+      case HANDLE:
+        return getHandle();
+
+      default:
+        throw new IllegalArgumentException("Field " + fieldID + " doesn't exist!");
+      }
+    }
+
+    // Returns true if field corresponding to fieldID is set (has been asigned a value) and false otherwise
+    public boolean isSet(int fieldID) {
+      switch (fieldID) {
+      case HANDLE:
+        return isSetHandle();
+      default:
+        throw new IllegalArgumentException("Field " + fieldID + " doesn't exist!");
+      }
+    }
+
+    @Override
+    public boolean equals(Object that) {
+      if (that == null)
+        return false;
+      if (that instanceof get_state_args)
+        return this.equals((get_state_args)that);
+      return false;
+    }
+
+    public boolean equals(get_state_args that) {
+      if (that == null)
+        return false;
+
+      boolean this_present_handle = true && this.isSetHandle();
+      boolean that_present_handle = true && that.isSetHandle();
+      if (this_present_handle || that_present_handle) {
+        if (!(this_present_handle && that_present_handle))
+          return false;
+        if (!this.handle.equals(that.handle))
+          return false;
+      }
+
+      return true;
+    }
+
+    @Override
+    public int hashCode() {
+      HashCodeBuilder builder = new HashCodeBuilder();
+
+      boolean present_handle = true && (isSetHandle());
+      builder.append(present_handle);
+      if (present_handle)
+        builder.append(handle);
+
+      return builder.toHashCode();
+    }
+
+    public void read(TProtocol iprot) throws TException {
+      TField field;
+      iprot.readStructBegin();
+      while (true)
+      {
+        field = iprot.readFieldBegin();
+        if (field.type == TType.STOP) { 
+          break;
+        }
+        switch (field.id)
+        {
+          case HANDLE:
+            if (field.type == TType.STRUCT) {
+              this.handle = new QueryHandle();
+              this.handle.read(iprot);
+            } else { 
+              TProtocolUtil.skip(iprot, field.type);
+            }
+            break;
+          default:
+            TProtocolUtil.skip(iprot, field.type);
+            break;
+        }
+        iprot.readFieldEnd();
+      }
+      iprot.readStructEnd();
+
+
+      // check for required fields of primitive type, which can't be checked in the validate method
+      validate();
+    }
+
+    public void write(TProtocol oprot) throws TException {
+      validate();
+
+      oprot.writeStructBegin(STRUCT_DESC);
+      if (this.handle != null) {
+        oprot.writeFieldBegin(HANDLE_FIELD_DESC);
+        this.handle.write(oprot);
+        oprot.writeFieldEnd();
+      }
+      oprot.writeFieldStop();
+      oprot.writeStructEnd();
+    }
+
+    @Override
+    public String toString() {
+      StringBuilder sb = new StringBuilder("get_state_args(");
+      boolean first = true;
+
+      sb.append("handle:");
+      if (this.handle == null) {
+        sb.append("null");
+      } else {
+        sb.append(this.handle);
+      }
+      first = false;
+      sb.append(")");
+      return sb.toString();
+    }
+
+    public void validate() throws TException {
+      // check for required fields
+      // check that fields of type enum have valid values
+    }
+
+  }
+
+  public static class get_state_result implements TBase, java.io.Serializable, Cloneable   {
+    private static final TStruct STRUCT_DESC = new TStruct("get_state_result");
+    private static final TField SUCCESS_FIELD_DESC = new TField("success", TType.I32, (short)0);
+    private static final TField ERROR_FIELD_DESC = new TField("error", TType.STRUCT, (short)1);
+
+    public int success;
+    public static final int SUCCESS = 0;
+    public QueryNotFoundException error;
+    public static final int ERROR = 1;
+
+    private final Isset __isset = new Isset();
+    private static final class Isset implements java.io.Serializable {
+      public boolean success = false;
+    }
+
+    public static final Map<Integer, FieldMetaData> metaDataMap = Collections.unmodifiableMap(new HashMap<Integer, FieldMetaData>() {{
+      put(SUCCESS, new FieldMetaData("success", TFieldRequirementType.DEFAULT, 
+          new FieldValueMetaData(TType.I32)));
+      put(ERROR, new FieldMetaData("error", TFieldRequirementType.DEFAULT, 
+          new FieldValueMetaData(TType.STRUCT)));
+    }});
+
+    static {
+      FieldMetaData.addStructMetaDataMap(get_state_result.class, metaDataMap);
+    }
+
+    public get_state_result() {
+    }
+
+    public get_state_result(
+      int success,
+      QueryNotFoundException error)
+    {
+      this();
+      this.success = success;
+      this.__isset.success = true;
+      this.error = error;
+    }
+
+    /**
+     * Performs a deep copy on <i>other</i>.
+     */
+    public get_state_result(get_state_result other) {
+      __isset.success = other.__isset.success;
+      this.success = other.success;
+      if (other.isSetError()) {
+        this.error = new QueryNotFoundException(other.error);
+      }
+    }
+
+    @Override
+    public get_state_result clone() {
+      return new get_state_result(this);
+    }
+
+    public int getSuccess() {
+      return this.success;
+    }
+
+    public void setSuccess(int success) {
+      this.success = success;
+      this.__isset.success = true;
+    }
+
+    public void unsetSuccess() {
+      this.__isset.success = false;
+    }
+
+    // Returns true if field success is set (has been asigned a value) and false otherwise
+    public boolean isSetSuccess() {
+      return this.__isset.success;
+    }
+
+    public void setSuccessIsSet(boolean value) {
+      this.__isset.success = value;
+    }
+
+    public QueryNotFoundException getError() {
+      return this.error;
+    }
+
+    public void setError(QueryNotFoundException error) {
+      this.error = error;
+    }
+
+    public void unsetError() {
+      this.error = null;
+    }
+
+    // Returns true if field error is set (has been asigned a value) and false otherwise
+    public boolean isSetError() {
+      return this.error != null;
+    }
+
+    public void setErrorIsSet(boolean value) {
+      if (!value) {
+        this.error = null;
+      }
+    }
+
+    public void setFieldValue(int fieldID, Object value) {
+      switch (fieldID) {
+      case SUCCESS:
+        if (value == null) {
+          unsetSuccess();
+        } else {
+          setSuccess((Integer)value);
+        }
+        break;
+
+      case ERROR:
+        if (value == null) {
+          unsetError();
+        } else {
+          setError((QueryNotFoundException)value);
+        }
+        break;
+
+      default:
+        throw new IllegalArgumentException("Field " + fieldID + " doesn't exist!");
+      }
+    }
+
+    public Object getFieldValue(int fieldID) {
+      switch (fieldID) {
+      case SUCCESS:
+        return getSuccess();
+
+      case ERROR:
+        return getError();
+
+      default:
+        throw new IllegalArgumentException("Field " + fieldID + " doesn't exist!");
+      }
+    }
+
+    // Returns true if field corresponding to fieldID is set (has been asigned a value) and false otherwise
+    public boolean isSet(int fieldID) {
+      switch (fieldID) {
+      case SUCCESS:
+        return isSetSuccess();
+      case ERROR:
+        return isSetError();
+      default:
+        throw new IllegalArgumentException("Field " + fieldID + " doesn't exist!");
+      }
+    }
+
+    @Override
+    public boolean equals(Object that) {
+      if (that == null)
+        return false;
+      if (that instanceof get_state_result)
+        return this.equals((get_state_result)that);
+      return false;
+    }
+
+    public boolean equals(get_state_result that) {
+      if (that == null)
+        return false;
+
+      boolean this_present_success = true;
+      boolean that_present_success = true;
+      if (this_present_success || that_present_success) {
+        if (!(this_present_success && that_present_success))
+          return false;
+        if (this.success != that.success)
+          return false;
+      }
+
+      boolean this_present_error = true && this.isSetError();
+      boolean that_present_error = true && that.isSetError();
+      if (this_present_error || that_present_error) {
+        if (!(this_present_error && that_present_error))
+          return false;
+        if (!this.error.equals(that.error))
+          return false;
+      }
+
+      return true;
+    }
+
+    @Override
+    public int hashCode() {
+      HashCodeBuilder builder = new HashCodeBuilder();
+
+      boolean present_success = true;
+      builder.append(present_success);
+      if (present_success)
+        builder.append(success);
+
+      boolean present_error = true && (isSetError());
+      builder.append(present_error);
+      if (present_error)
+        builder.append(error);
+
+      return builder.toHashCode();
+    }
+
+    public void read(TProtocol iprot) throws TException {
+      TField field;
+      iprot.readStructBegin();
+      while (true)
+      {
+        field = iprot.readFieldBegin();
+        if (field.type == TType.STOP) { 
+          break;
+        }
+        switch (field.id)
+        {
+          case SUCCESS:
+            if (field.type == TType.I32) {
+              this.success = iprot.readI32();
+              this.__isset.success = true;
+            } else { 
+              TProtocolUtil.skip(iprot, field.type);
+            }
+            break;
+          case ERROR:
+            if (field.type == TType.STRUCT) {
+              this.error = new QueryNotFoundException();
+              this.error.read(iprot);
+            } else { 
+              TProtocolUtil.skip(iprot, field.type);
+            }
+            break;
+          default:
+            TProtocolUtil.skip(iprot, field.type);
+            break;
+        }
+        iprot.readFieldEnd();
+      }
+      iprot.readStructEnd();
+
+
+      // check for required fields of primitive type, which can't be checked in the validate method
+      validate();
+    }
+
+    public void write(TProtocol oprot) throws TException {
+      oprot.writeStructBegin(STRUCT_DESC);
+
+      if (this.isSetSuccess()) {
+        oprot.writeFieldBegin(SUCCESS_FIELD_DESC);
+        oprot.writeI32(this.success);
+        oprot.writeFieldEnd();
+      } else if (this.isSetError()) {
+        oprot.writeFieldBegin(ERROR_FIELD_DESC);
+        this.error.write(oprot);
+        oprot.writeFieldEnd();
+      }
+      oprot.writeFieldStop();
+      oprot.writeStructEnd();
+    }
+
+    @Override
+    public String toString() {
+      StringBuilder sb = new StringBuilder("get_state_result(");
+      boolean first = true;
+
+      sb.append("success:");
+      String success_name = QueryState.VALUES_TO_NAMES.get(this.success);
+      if (success_name != null) {
+        sb.append(success_name);
+        sb.append(" (");
+      }
+      sb.append(this.success);
+      if (success_name != null) {
+        sb.append(")");
+      }
+      first = false;
+      if (!first) sb.append(", ");
+      sb.append("error:");
+      if (this.error == null) {
+        sb.append("null");
+      } else {
+        sb.append(this.error);
+      }
+      first = false;
+      sb.append(")");
+      return sb.toString();
+    }
+
+    public void validate() throws TException {
+      // check for required fields
+      // check that fields of type enum have valid values
+      if (isSetSuccess() && !QueryState.VALID_VALUES.contains(success)){
+        throw new TProtocolException("The field 'success' has been assigned the invalid value " + success);
+      }
+    }
+
+  }
+
+  public static class get_results_metadata_args implements TBase, java.io.Serializable, Cloneable   {
+    private static final TStruct STRUCT_DESC = new TStruct("get_results_metadata_args");
+    private static final TField HANDLE_FIELD_DESC = new TField("handle", TType.STRUCT, (short)1);
+
+    public QueryHandle handle;
+    public static final int HANDLE = 1;
+
+    private final Isset __isset = new Isset();
+    private static final class Isset implements java.io.Serializable {
+    }
+
+    public static final Map<Integer, FieldMetaData> metaDataMap = Collections.unmodifiableMap(new HashMap<Integer, FieldMetaData>() {{
+      put(HANDLE, new FieldMetaData("handle", TFieldRequirementType.DEFAULT, 
+          new StructMetaData(TType.STRUCT, QueryHandle.class)));
+    }});
+
+    static {
+      FieldMetaData.addStructMetaDataMap(get_results_metadata_args.class, metaDataMap);
+    }
+
+    public get_results_metadata_args() {
+    }
+
+    public get_results_metadata_args(
+      QueryHandle handle)
+    {
+      this();
+      this.handle = handle;
+    }
+
+    /**
+     * Performs a deep copy on <i>other</i>.
+     */
+    public get_results_metadata_args(get_results_metadata_args other) {
+      if (other.isSetHandle()) {
+        this.handle = new QueryHandle(other.handle);
+      }
+    }
+
+    @Override
+    public get_results_metadata_args clone() {
+      return new get_results_metadata_args(this);
+    }
+
+    public QueryHandle getHandle() {
+      return this.handle;
+    }
+
+    public void setHandle(QueryHandle handle) {
+      this.handle = handle;
+    }
+
+    public void unsetHandle() {
+      this.handle = null;
+    }
+
+    // Returns true if field handle is set (has been asigned a value) and false otherwise
+    public boolean isSetHandle() {
+      return this.handle != null;
+    }
+
+    public void setHandleIsSet(boolean value) {
+      if (!value) {
+        this.handle = null;
+      }
+    }
+
+    public void setFieldValue(int fieldID, Object value) {
+      switch (fieldID) {
+      case HANDLE:
+        if (value == null) {
+          unsetHandle();
+        } else {
+          setHandle((QueryHandle)value);
+        }
+        break;
+
+      default:
+        throw new IllegalArgumentException("Field " + fieldID + " doesn't exist!");
+      }
+    }
+
+    public Object getFieldValue(int fieldID) {
+      switch (fieldID) {
+      case HANDLE:
+        return getHandle();
+
+      default:
+        throw new IllegalArgumentException("Field " + fieldID + " doesn't exist!");
+      }
+    }
+
+    // Returns true if field corresponding to fieldID is set (has been asigned a value) and false otherwise
+    public boolean isSet(int fieldID) {
+      switch (fieldID) {
+      case HANDLE:
         return isSetHandle();
       default:
         throw new IllegalArgumentException("Field " + fieldID + " doesn't exist!");
@@ -2432,12 +4620,12 @@ public class BeeswaxService {
     public boolean equals(Object that) {
       if (that == null)
         return false;
-      if (that instanceof get_state_args)
-        return this.equals((get_state_args)that);
+      if (that instanceof get_results_metadata_args)
+        return this.equals((get_results_metadata_args)that);
       return false;
     }
 
-    public boolean equals(get_state_args that) {
+    public boolean equals(get_results_metadata_args that) {
       if (that == null)
         return false;
 
@@ -2512,7 +4700,7 @@ public class BeeswaxService {
 
     @Override
     public String toString() {
-      StringBuilder sb = new StringBuilder("get_state_args(");
+      StringBuilder sb = new StringBuilder("get_results_metadata_args(");
       boolean first = true;
 
       sb.append("handle:");
@@ -2533,81 +4721,81 @@ public class BeeswaxService {
 
   }
 
-  public static class get_state_result implements TBase, java.io.Serializable, Cloneable   {
-    private static final TStruct STRUCT_DESC = new TStruct("get_state_result");
-    private static final TField SUCCESS_FIELD_DESC = new TField("success", TType.I32, (short)0);
+  public static class get_results_metadata_result implements TBase, java.io.Serializable, Cloneable   {
+    private static final TStruct STRUCT_DESC = new TStruct("get_results_metadata_result");
+    private static final TField SUCCESS_FIELD_DESC = new TField("success", TType.STRUCT, (short)0);
     private static final TField ERROR_FIELD_DESC = new TField("error", TType.STRUCT, (short)1);
 
-    public int success;
+    public ResultsMetadata success;
     public static final int SUCCESS = 0;
     public QueryNotFoundException error;
     public static final int ERROR = 1;
 
     private final Isset __isset = new Isset();
     private static final class Isset implements java.io.Serializable {
-      public boolean success = false;
     }
 
     public static final Map<Integer, FieldMetaData> metaDataMap = Collections.unmodifiableMap(new HashMap<Integer, FieldMetaData>() {{
       put(SUCCESS, new FieldMetaData("success", TFieldRequirementType.DEFAULT, 
-          new FieldValueMetaData(TType.I32)));
+          new StructMetaData(TType.STRUCT, ResultsMetadata.class)));
       put(ERROR, new FieldMetaData("error", TFieldRequirementType.DEFAULT, 
           new FieldValueMetaData(TType.STRUCT)));
     }});
 
     static {
-      FieldMetaData.addStructMetaDataMap(get_state_result.class, metaDataMap);
+      FieldMetaData.addStructMetaDataMap(get_results_metadata_result.class, metaDataMap);
     }
 
-    public get_state_result() {
+    public get_results_metadata_result() {
     }
 
-    public get_state_result(
-      int success,
+    public get_results_metadata_result(
+      ResultsMetadata success,
       QueryNotFoundException error)
     {
       this();
       this.success = success;
-      this.__isset.success = true;
       this.error = error;
     }
 
     /**
      * Performs a deep copy on <i>other</i>.
      */
-    public get_state_result(get_state_result other) {
-      __isset.success = other.__isset.success;
-      this.success = other.success;
+    public get_results_metadata_result(get_results_metadata_result other) {
+      if (other.isSetSuccess()) {
+        this.success = new ResultsMetadata(other.success);
+      }
       if (other.isSetError()) {
         this.error = new QueryNotFoundException(other.error);
       }
     }
 
     @Override
-    public get_state_result clone() {
-      return new get_state_result(this);
+    public get_results_metadata_result clone() {
+      return new get_results_metadata_result(this);
     }
 
-    public int getSuccess() {
+    public ResultsMetadata getSuccess() {
       return this.success;
     }
 
-    public void setSuccess(int success) {
+    public void setSuccess(ResultsMetadata success) {
       this.success = success;
-      this.__isset.success = true;
     }
 
     public void unsetSuccess() {
-      this.__isset.success = false;
+      this.success = null;
     }
 
     // Returns true if field success is set (has been asigned a value) and false otherwise
     public boolean isSetSuccess() {
-      return this.__isset.success;
+      return this.success != null;
     }
 
     public void setSuccessIsSet(boolean value) {
-      this.__isset.success = value;
+      if (!value) {
+        this.success = null;
+      }
     }
 
     public QueryNotFoundException getError() {
@@ -2639,7 +4827,7 @@ public class BeeswaxService {
         if (value == null) {
           unsetSuccess();
         } else {
-          setSuccess((Integer)value);
+          setSuccess((ResultsMetadata)value);
         }
         break;
 
@@ -2685,21 +4873,21 @@ public class BeeswaxService {
     public boolean equals(Object that) {
       if (that == null)
         return false;
-      if (that instanceof get_state_result)
-        return this.equals((get_state_result)that);
+      if (that instanceof get_results_metadata_result)
+        return this.equals((get_results_metadata_result)that);
       return false;
     }
 
-    public boolean equals(get_state_result that) {
+    public boolean equals(get_results_metadata_result that) {
       if (that == null)
         return false;
 
-      boolean this_present_success = true;
-      boolean that_present_success = true;
+      boolean this_present_success = true && this.isSetSuccess();
+      boolean that_present_success = true && that.isSetSuccess();
       if (this_present_success || that_present_success) {
         if (!(this_present_success && that_present_success))
           return false;
-        if (this.success != that.success)
+        if (!this.success.equals(that.success))
           return false;
       }
 
@@ -2719,7 +4907,7 @@ public class BeeswaxService {
     public int hashCode() {
       HashCodeBuilder builder = new HashCodeBuilder();
 
-      boolean present_success = true;
+      boolean present_success = true && (isSetSuccess());
       builder.append(present_success);
       if (present_success)
         builder.append(success);
@@ -2744,9 +4932,9 @@ public class BeeswaxService {
         switch (field.id)
         {
           case SUCCESS:
-            if (field.type == TType.I32) {
-              this.success = iprot.readI32();
-              this.__isset.success = true;
+            if (field.type == TType.STRUCT) {
+              this.success = new ResultsMetadata();
+              this.success.read(iprot);
             } else { 
               TProtocolUtil.skip(iprot, field.type);
             }
@@ -2777,7 +4965,7 @@ public class BeeswaxService {
 
       if (this.isSetSuccess()) {
         oprot.writeFieldBegin(SUCCESS_FIELD_DESC);
-        oprot.writeI32(this.success);
+        this.success.write(oprot);
         oprot.writeFieldEnd();
       } else if (this.isSetError()) {
         oprot.writeFieldBegin(ERROR_FIELD_DESC);
@@ -2790,18 +4978,14 @@ public class BeeswaxService {
 
     @Override
     public String toString() {
-      StringBuilder sb = new StringBuilder("get_state_result(");
+      StringBuilder sb = new StringBuilder("get_results_metadata_result(");
       boolean first = true;
 
       sb.append("success:");
-      String success_name = QueryState.VALUES_TO_NAMES.get(this.success);
-      if (success_name != null) {
-        sb.append(success_name);
-        sb.append(" (");
-      }
-      sb.append(this.success);
-      if (success_name != null) {
-        sb.append(")");
+      if (this.success == null) {
+        sb.append("null");
+      } else {
+        sb.append(this.success);
       }
       first = false;
       if (!first) sb.append(", ");
@@ -2819,87 +5003,84 @@ public class BeeswaxService {
     public void validate() throws TException {
       // check for required fields
       // check that fields of type enum have valid values
-      if (isSetSuccess() && !QueryState.VALID_VALUES.contains(success)){
-        throw new TProtocolException("The field 'success' has been assigned the invalid value " + success);
-      }
     }
 
   }
 
-  public static class get_results_metadata_args implements TBase, java.io.Serializable, Cloneable   {
-    private static final TStruct STRUCT_DESC = new TStruct("get_results_metadata_args");
-    private static final TField HANDLE_FIELD_DESC = new TField("handle", TType.STRUCT, (short)1);
+  public static class echo_args implements TBase, java.io.Serializable, Cloneable   {
+    private static final TStruct STRUCT_DESC = new TStruct("echo_args");
+    private static final TField S_FIELD_DESC = new TField("s", TType.STRING, (short)1);
 
-    public QueryHandle handle;
-    public static final int HANDLE = 1;
+    public String s;
+    public static final int S = 1;
 
     private final Isset __isset = new Isset();
     private static final class Isset implements java.io.Serializable {
     }
 
     public static final Map<Integer, FieldMetaData> metaDataMap = Collections.unmodifiableMap(new HashMap<Integer, FieldMetaData>() {{
-      put(HANDLE, new FieldMetaData("handle", TFieldRequirementType.DEFAULT, 
-          new StructMetaData(TType.STRUCT, QueryHandle.class)));
+      put(S, new FieldMetaData("s", TFieldRequirementType.DEFAULT, 
+          new FieldValueMetaData(TType.STRING)));
     }});
 
     static {
-      FieldMetaData.addStructMetaDataMap(get_results_metadata_args.class, metaDataMap);
+      FieldMetaData.addStructMetaDataMap(echo_args.class, metaDataMap);
     }
 
-    public get_results_metadata_args() {
+    public echo_args() {
     }
 
-    public get_results_metadata_args(
-      QueryHandle handle)
+    public echo_args(
+      String s)
     {
       this();
-      this.handle = handle;
+      this.s = s;
     }
 
     /**
      * Performs a deep copy on <i>other</i>.
      */
-    public get_results_metadata_args(get_results_metadata_args other) {
-      if (other.isSetHandle()) {
-        this.handle = new QueryHandle(other.handle);
+    public echo_args(echo_args other) {
+      if (other.isSetS()) {
+        this.s = other.s;
       }
     }
 
     @Override
-    public get_results_metadata_args clone() {
-      return new get_results_metadata_args(this);
+    public echo_args clone() {
+      return new echo_args(this);
     }
 
-    public QueryHandle getHandle() {
-      return this.handle;
+    public String getS() {
+      return this.s;
     }
 
-    public void setHandle(QueryHandle handle) {
-      this.handle = handle;
+    public void setS(String s) {
+      this.s = s;
     }
 
-    public void unsetHandle() {
-      this.handle = null;
+    public void unsetS() {
+      this.s = null;
     }
 
-    // Returns true if field handle is set (has been asigned a value) and false otherwise
-    public boolean isSetHandle() {
-      return this.handle != null;
+    // Returns true if field s is set (has been asigned a value) and false otherwise
+    public boolean isSetS() {
+      return this.s != null;
     }
 
-    public void setHandleIsSet(boolean value) {
+    public void setSIsSet(boolean value) {
       if (!value) {
-        this.handle = null;
+        this.s = null;
       }
     }
 
     public void setFieldValue(int fieldID, Object value) {
       switch (fieldID) {
-      case HANDLE:
+      case S:
         if (value == null) {
-          unsetHandle();
+          unsetS();
         } else {
-          setHandle((QueryHandle)value);
+          setS((String)value);
         }
         break;
 
@@ -2910,8 +5091,8 @@ public class BeeswaxService {
 
     public Object getFieldValue(int fieldID) {
       switch (fieldID) {
-      case HANDLE:
-        return getHandle();
+      case S:
+        return getS();
 
       default:
         throw new IllegalArgumentException("Field " + fieldID + " doesn't exist!");
@@ -2921,8 +5102,8 @@ public class BeeswaxService {
     // Returns true if field corresponding to fieldID is set (has been asigned a value) and false otherwise
     public boolean isSet(int fieldID) {
       switch (fieldID) {
-      case HANDLE:
-        return isSetHandle();
+      case S:
+        return isSetS();
       default:
         throw new IllegalArgumentException("Field " + fieldID + " doesn't exist!");
       }
@@ -2932,21 +5113,21 @@ public class BeeswaxService {
     public boolean equals(Object that) {
       if (that == null)
         return false;
-      if (that instanceof get_results_metadata_args)
-        return this.equals((get_results_metadata_args)that);
+      if (that instanceof echo_args)
+        return this.equals((echo_args)that);
       return false;
     }
 
-    public boolean equals(get_results_metadata_args that) {
+    public boolean equals(echo_args that) {
       if (that == null)
         return false;
 
-      boolean this_present_handle = true && this.isSetHandle();
-      boolean that_present_handle = true && that.isSetHandle();
-      if (this_present_handle || that_present_handle) {
-        if (!(this_present_handle && that_present_handle))
+      boolean this_present_s = true && this.isSetS();
+      boolean that_present_s = true && that.isSetS();
+      if (this_present_s || that_present_s) {
+        if (!(this_present_s && that_present_s))
           return false;
-        if (!this.handle.equals(that.handle))
+        if (!this.s.equals(that.s))
           return false;
       }
 
@@ -2957,10 +5138,10 @@ public class BeeswaxService {
     public int hashCode() {
       HashCodeBuilder builder = new HashCodeBuilder();
 
-      boolean present_handle = true && (isSetHandle());
-      builder.append(present_handle);
-      if (present_handle)
-        builder.append(handle);
+      boolean present_s = true && (isSetS());
+      builder.append(present_s);
+      if (present_s)
+        builder.append(s);
 
       return builder.toHashCode();
     }
@@ -2976,10 +5157,9 @@ public class BeeswaxService {
         }
         switch (field.id)
         {
-          case HANDLE:
-            if (field.type == TType.STRUCT) {
-              this.handle = new QueryHandle();
-              this.handle.read(iprot);
+          case S:
+            if (field.type == TType.STRING) {
+              this.s = iprot.readString();
             } else { 
               TProtocolUtil.skip(iprot, field.type);
             }
@@ -3001,9 +5181,9 @@ public class BeeswaxService {
       validate();
 
       oprot.writeStructBegin(STRUCT_DESC);
-      if (this.handle != null) {
-        oprot.writeFieldBegin(HANDLE_FIELD_DESC);
-        this.handle.write(oprot);
+      if (this.s != null) {
+        oprot.writeFieldBegin(S_FIELD_DESC);
+        oprot.writeString(this.s);
         oprot.writeFieldEnd();
       }
       oprot.writeFieldStop();
@@ -3012,14 +5192,14 @@ public class BeeswaxService {
 
     @Override
     public String toString() {
-      StringBuilder sb = new StringBuilder("get_results_metadata_args(");
+      StringBuilder sb = new StringBuilder("echo_args(");
       boolean first = true;
 
-      sb.append("handle:");
-      if (this.handle == null) {
+      sb.append("s:");
+      if (this.s == null) {
         sb.append("null");
       } else {
-        sb.append(this.handle);
+        sb.append(this.s);
       }
       first = false;
       sb.append(")");
@@ -3033,15 +5213,12 @@ public class BeeswaxService {
 
   }
 
-  public static class get_results_metadata_result implements TBase, java.io.Serializable, Cloneable   {
-    private static final TStruct STRUCT_DESC = new TStruct("get_results_metadata_result");
-    private static final TField SUCCESS_FIELD_DESC = new TField("success", TType.STRUCT, (short)0);
-    private static final TField ERROR_FIELD_DESC = new TField("error", TType.STRUCT, (short)1);
+  public static class echo_result implements TBase, java.io.Serializable, Cloneable   {
+    private static final TStruct STRUCT_DESC = new TStruct("echo_result");
+    private static final TField SUCCESS_FIELD_DESC = new TField("success", TType.STRING, (short)0);
 
-    public ResultsMetadata success;
+    public String success;
     public static final int SUCCESS = 0;
-    public QueryNotFoundException error;
-    public static final int ERROR = 1;
 
     private final Isset __isset = new Isset();
     private static final class Isset implements java.io.Serializable {
@@ -3049,49 +5226,42 @@ public class BeeswaxService {
 
     public static final Map<Integer, FieldMetaData> metaDataMap = Collections.unmodifiableMap(new HashMap<Integer, FieldMetaData>() {{
       put(SUCCESS, new FieldMetaData("success", TFieldRequirementType.DEFAULT, 
-          new StructMetaData(TType.STRUCT, ResultsMetadata.class)));
-      put(ERROR, new FieldMetaData("error", TFieldRequirementType.DEFAULT, 
-          new FieldValueMetaData(TType.STRUCT)));
+          new FieldValueMetaData(TType.STRING)));
     }});
 
     static {
-      FieldMetaData.addStructMetaDataMap(get_results_metadata_result.class, metaDataMap);
-    }
-
-    public get_results_metadata_result() {
+      FieldMetaData.addStructMetaDataMap(echo_result.class, metaDataMap);
     }
 
-    public get_results_metadata_result(
-      ResultsMetadata success,
-      QueryNotFoundException error)
+    public echo_result() {
+    }
+
+    public echo_result(
+      String success)
     {
       this();
       this.success = success;
-      this.error = error;
     }
 
     /**
      * Performs a deep copy on <i>other</i>.
      */
-    public get_results_metadata_result(get_results_metadata_result other) {
+    public echo_result(echo_result other) {
       if (other.isSetSuccess()) {
-        this.success = new ResultsMetadata(other.success);
-      }
-      if (other.isSetError()) {
-        this.error = new QueryNotFoundException(other.error);
+        this.success = other.success;
       }
     }
 
     @Override
-    public get_results_metadata_result clone() {
-      return new get_results_metadata_result(this);
+    public echo_result clone() {
+      return new echo_result(this);
     }
 
-    public ResultsMetadata getSuccess() {
+    public String getSuccess() {
       return this.success;
     }
 
-    public void setSuccess(ResultsMetadata success) {
+    public void setSuccess(String success) {
       this.success = success;
     }
 
@@ -3110,44 +5280,13 @@ public class BeeswaxService {
       }
     }
 
-    public QueryNotFoundException getError() {
-      return this.error;
-    }
-
-    public void setError(QueryNotFoundException error) {
-      this.error = error;
-    }
-
-    public void unsetError() {
-      this.error = null;
-    }
-
-    // Returns true if field error is set (has been asigned a value) and false otherwise
-    public boolean isSetError() {
-      return this.error != null;
-    }
-
-    public void setErrorIsSet(boolean value) {
-      if (!value) {
-        this.error = null;
-      }
-    }
-
     public void setFieldValue(int fieldID, Object value) {
       switch (fieldID) {
       case SUCCESS:
         if (value == null) {
           unsetSuccess();
         } else {
-          setSuccess((ResultsMetadata)value);
-        }
-        break;
-
-      case ERROR:
-        if (value == null) {
-          unsetError();
-        } else {
-          setError((QueryNotFoundException)value);
+          setSuccess((String)value);
         }
         break;
 
@@ -3161,9 +5300,6 @@ public class BeeswaxService {
       case SUCCESS:
         return getSuccess();
 
-      case ERROR:
-        return getError();
-
       default:
         throw new IllegalArgumentException("Field " + fieldID + " doesn't exist!");
       }
@@ -3174,8 +5310,6 @@ public class BeeswaxService {
       switch (fieldID) {
       case SUCCESS:
         return isSetSuccess();
-      case ERROR:
-        return isSetError();
       default:
         throw new IllegalArgumentException("Field " + fieldID + " doesn't exist!");
       }
@@ -3185,12 +5319,12 @@ public class BeeswaxService {
     public boolean equals(Object that) {
       if (that == null)
         return false;
-      if (that instanceof get_results_metadata_result)
-        return this.equals((get_results_metadata_result)that);
+      if (that instanceof echo_result)
+        return this.equals((echo_result)that);
       return false;
     }
 
-    public boolean equals(get_results_metadata_result that) {
+    public boolean equals(echo_result that) {
       if (that == null)
         return false;
 
@@ -3203,15 +5337,6 @@ public class BeeswaxService {
           return false;
       }
 
-      boolean this_present_error = true && this.isSetError();
-      boolean that_present_error = true && that.isSetError();
-      if (this_present_error || that_present_error) {
-        if (!(this_present_error && that_present_error))
-          return false;
-        if (!this.error.equals(that.error))
-          return false;
-      }
-
       return true;
     }
 
@@ -3224,11 +5349,6 @@ public class BeeswaxService {
       if (present_success)
         builder.append(success);
 
-      boolean present_error = true && (isSetError());
-      builder.append(present_error);
-      if (present_error)
-        builder.append(error);
-
       return builder.toHashCode();
     }
 
@@ -3244,17 +5364,8 @@ public class BeeswaxService {
         switch (field.id)
         {
           case SUCCESS:
-            if (field.type == TType.STRUCT) {
-              this.success = new ResultsMetadata();
-              this.success.read(iprot);
-            } else { 
-              TProtocolUtil.skip(iprot, field.type);
-            }
-            break;
-          case ERROR:
-            if (field.type == TType.STRUCT) {
-              this.error = new QueryNotFoundException();
-              this.error.read(iprot);
+            if (field.type == TType.STRING) {
+              this.success = iprot.readString();
             } else { 
               TProtocolUtil.skip(iprot, field.type);
             }
@@ -3277,11 +5388,7 @@ public class BeeswaxService {
 
       if (this.isSetSuccess()) {
         oprot.writeFieldBegin(SUCCESS_FIELD_DESC);
-        this.success.write(oprot);
-        oprot.writeFieldEnd();
-      } else if (this.isSetError()) {
-        oprot.writeFieldBegin(ERROR_FIELD_DESC);
-        this.error.write(oprot);
+        oprot.writeString(this.success);
         oprot.writeFieldEnd();
       }
       oprot.writeFieldStop();
@@ -3290,7 +5397,7 @@ public class BeeswaxService {
 
     @Override
     public String toString() {
-      StringBuilder sb = new StringBuilder("get_results_metadata_result(");
+      StringBuilder sb = new StringBuilder("echo_result(");
       boolean first = true;
 
       sb.append("success:");
@@ -3300,14 +5407,6 @@ public class BeeswaxService {
         sb.append(this.success);
       }
       first = false;
-      if (!first) sb.append(", ");
-      sb.append("error:");
-      if (this.error == null) {
-        sb.append("null");
-      } else {
-        sb.append(this.error);
-      }
-      first = false;
       sb.append(")");
       return sb.toString();
     }
@@ -3319,83 +5418,32 @@ public class BeeswaxService {
 
   }
 
-  public static class echo_args implements TBase, java.io.Serializable, Cloneable   {
-    private static final TStruct STRUCT_DESC = new TStruct("echo_args");
-    private static final TField S_FIELD_DESC = new TField("s", TType.STRING, (short)1);
-
-    public String s;
-    public static final int S = 1;
-
-    private final Isset __isset = new Isset();
-    private static final class Isset implements java.io.Serializable {
-    }
+  public static class dump_config_args implements TBase, java.io.Serializable, Cloneable   {
+    private static final TStruct STRUCT_DESC = new TStruct("dump_config_args");
 
     public static final Map<Integer, FieldMetaData> metaDataMap = Collections.unmodifiableMap(new HashMap<Integer, FieldMetaData>() {{
-      put(S, new FieldMetaData("s", TFieldRequirementType.DEFAULT, 
-          new FieldValueMetaData(TType.STRING)));
     }});
 
     static {
-      FieldMetaData.addStructMetaDataMap(echo_args.class, metaDataMap);
-    }
-
-    public echo_args() {
+      FieldMetaData.addStructMetaDataMap(dump_config_args.class, metaDataMap);
     }
 
-    public echo_args(
-      String s)
-    {
-      this();
-      this.s = s;
+    public dump_config_args() {
     }
 
     /**
      * Performs a deep copy on <i>other</i>.
      */
-    public echo_args(echo_args other) {
-      if (other.isSetS()) {
-        this.s = other.s;
-      }
+    public dump_config_args(dump_config_args other) {
     }
 
     @Override
-    public echo_args clone() {
-      return new echo_args(this);
-    }
-
-    public String getS() {
-      return this.s;
-    }
-
-    public void setS(String s) {
-      this.s = s;
-    }
-
-    public void unsetS() {
-      this.s = null;
-    }
-
-    // Returns true if field s is set (has been asigned a value) and false otherwise
-    public boolean isSetS() {
-      return this.s != null;
-    }
-
-    public void setSIsSet(boolean value) {
-      if (!value) {
-        this.s = null;
-      }
+    public dump_config_args clone() {
+      return new dump_config_args(this);
     }
 
     public void setFieldValue(int fieldID, Object value) {
       switch (fieldID) {
-      case S:
-        if (value == null) {
-          unsetS();
-        } else {
-          setS((String)value);
-        }
-        break;
-
       default:
         throw new IllegalArgumentException("Field " + fieldID + " doesn't exist!");
       }
@@ -3403,9 +5451,6 @@ public class BeeswaxService {
 
     public Object getFieldValue(int fieldID) {
       switch (fieldID) {
-      case S:
-        return getS();
-
       default:
         throw new IllegalArgumentException("Field " + fieldID + " doesn't exist!");
       }
@@ -3414,8 +5459,6 @@ public class BeeswaxService {
     // Returns true if field corresponding to fieldID is set (has been asigned a value) and false otherwise
     public boolean isSet(int fieldID) {
       switch (fieldID) {
-      case S:
-        return isSetS();
       default:
         throw new IllegalArgumentException("Field " + fieldID + " doesn't exist!");
       }
@@ -3425,24 +5468,15 @@ public class BeeswaxService {
     public boolean equals(Object that) {
       if (that == null)
         return false;
-      if (that instanceof echo_args)
-        return this.equals((echo_args)that);
+      if (that instanceof dump_config_args)
+        return this.equals((dump_config_args)that);
       return false;
     }
 
-    public boolean equals(echo_args that) {
+    public boolean equals(dump_config_args that) {
       if (that == null)
         return false;
 
-      boolean this_present_s = true && this.isSetS();
-      boolean that_present_s = true && that.isSetS();
-      if (this_present_s || that_present_s) {
-        if (!(this_present_s && that_present_s))
-          return false;
-        if (!this.s.equals(that.s))
-          return false;
-      }
-
       return true;
     }
 
@@ -3450,11 +5484,6 @@ public class BeeswaxService {
     public int hashCode() {
       HashCodeBuilder builder = new HashCodeBuilder();
 
-      boolean present_s = true && (isSetS());
-      builder.append(present_s);
-      if (present_s)
-        builder.append(s);
-
       return builder.toHashCode();
     }
 
@@ -3469,13 +5498,6 @@ public class BeeswaxService {
         }
         switch (field.id)
         {
-          case S:
-            if (field.type == TType.STRING) {
-              this.s = iprot.readString();
-            } else { 
-              TProtocolUtil.skip(iprot, field.type);
-            }
-            break;
           default:
             TProtocolUtil.skip(iprot, field.type);
             break;
@@ -3493,27 +5515,15 @@ public class BeeswaxService {
       validate();
 
       oprot.writeStructBegin(STRUCT_DESC);
-      if (this.s != null) {
-        oprot.writeFieldBegin(S_FIELD_DESC);
-        oprot.writeString(this.s);
-        oprot.writeFieldEnd();
-      }
       oprot.writeFieldStop();
       oprot.writeStructEnd();
     }
 
     @Override
     public String toString() {
-      StringBuilder sb = new StringBuilder("echo_args(");
+      StringBuilder sb = new StringBuilder("dump_config_args(");
       boolean first = true;
 
-      sb.append("s:");
-      if (this.s == null) {
-        sb.append("null");
-      } else {
-        sb.append(this.s);
-      }
-      first = false;
       sb.append(")");
       return sb.toString();
     }
@@ -3525,8 +5535,8 @@ public class BeeswaxService {
 
   }
 
-  public static class echo_result implements TBase, java.io.Serializable, Cloneable   {
-    private static final TStruct STRUCT_DESC = new TStruct("echo_result");
+  public static class dump_config_result implements TBase, java.io.Serializable, Cloneable   {
+    private static final TStruct STRUCT_DESC = new TStruct("dump_config_result");
     private static final TField SUCCESS_FIELD_DESC = new TField("success", TType.STRING, (short)0);
 
     public String success;
@@ -3542,13 +5552,13 @@ public class BeeswaxService {
     }});
 
     static {
-      FieldMetaData.addStructMetaDataMap(echo_result.class, metaDataMap);
+      FieldMetaData.addStructMetaDataMap(dump_config_result.class, metaDataMap);
     }
 
-    public echo_result() {
+    public dump_config_result() {
     }
 
-    public echo_result(
+    public dump_config_result(
       String success)
     {
       this();
@@ -3558,15 +5568,15 @@ public class BeeswaxService {
     /**
      * Performs a deep copy on <i>other</i>.
      */
-    public echo_result(echo_result other) {
+    public dump_config_result(dump_config_result other) {
       if (other.isSetSuccess()) {
         this.success = other.success;
       }
     }
 
     @Override
-    public echo_result clone() {
-      return new echo_result(this);
+    public dump_config_result clone() {
+      return new dump_config_result(this);
     }
 
     public String getSuccess() {
@@ -3631,12 +5641,12 @@ public class BeeswaxService {
     public boolean equals(Object that) {
       if (that == null)
         return false;
-      if (that instanceof echo_result)
-        return this.equals((echo_result)that);
+      if (that instanceof dump_config_result)
+        return this.equals((dump_config_result)that);
       return false;
     }
 
-    public boolean equals(echo_result that) {
+    public boolean equals(dump_config_result that) {
       if (that == null)
         return false;
 
@@ -3709,7 +5719,7 @@ public class BeeswaxService {
 
     @Override
     public String toString() {
-      StringBuilder sb = new StringBuilder("echo_result(");
+      StringBuilder sb = new StringBuilder("dump_config_result(");
       boolean first = true;
 
       sb.append("success:");
@@ -3730,32 +5740,83 @@ public class BeeswaxService {
 
   }
 
-  public static class dump_config_args implements TBase, java.io.Serializable, Cloneable   {
-    private static final TStruct STRUCT_DESC = new TStruct("dump_config_args");
+  public static class get_log_args implements TBase, java.io.Serializable, Cloneable   {
+    private static final TStruct STRUCT_DESC = new TStruct("get_log_args");
+    private static final TField CONTEXT_FIELD_DESC = new TField("context", TType.STRING, (short)1);
+
+    public String context;
+    public static final int CONTEXT = 1;
+
+    private final Isset __isset = new Isset();
+    private static final class Isset implements java.io.Serializable {
+    }
 
     public static final Map<Integer, FieldMetaData> metaDataMap = Collections.unmodifiableMap(new HashMap<Integer, FieldMetaData>() {{
+      put(CONTEXT, new FieldMetaData("context", TFieldRequirementType.DEFAULT, 
+          new FieldValueMetaData(TType.STRING)));
     }});
 
     static {
-      FieldMetaData.addStructMetaDataMap(dump_config_args.class, metaDataMap);
+      FieldMetaData.addStructMetaDataMap(get_log_args.class, metaDataMap);
     }
 
-    public dump_config_args() {
+    public get_log_args() {
+    }
+
+    public get_log_args(
+      String context)
+    {
+      this();
+      this.context = context;
     }
 
     /**
      * Performs a deep copy on <i>other</i>.
      */
-    public dump_config_args(dump_config_args other) {
+    public get_log_args(get_log_args other) {
+      if (other.isSetContext()) {
+        this.context = other.context;
+      }
     }
 
     @Override
-    public dump_config_args clone() {
-      return new dump_config_args(this);
+    public get_log_args clone() {
+      return new get_log_args(this);
+    }
+
+    public String getContext() {
+      return this.context;
+    }
+
+    public void setContext(String context) {
+      this.context = context;
+    }
+
+    public void unsetContext() {
+      this.context = null;
+    }
+
+    // Returns true if field context is set (has been asigned a value) and false otherwise
+    public boolean isSetContext() {
+      return this.context != null;
+    }
+
+    public void setContextIsSet(boolean value) {
+      if (!value) {
+        this.context = null;
+      }
     }
 
     public void setFieldValue(int fieldID, Object value) {
       switch (fieldID) {
+      case CONTEXT:
+        if (value == null) {
+          unsetContext();
+        } else {
+          setContext((String)value);
+        }
+        break;
+
       default:
         throw new IllegalArgumentException("Field " + fieldID + " doesn't exist!");
       }
@@ -3763,6 +5824,9 @@ public class BeeswaxService {
 
     public Object getFieldValue(int fieldID) {
       switch (fieldID) {
+      case CONTEXT:
+        return getContext();
+
       default:
         throw new IllegalArgumentException("Field " + fieldID + " doesn't exist!");
       }
@@ -3771,6 +5835,8 @@ public class BeeswaxService {
     // Returns true if field corresponding to fieldID is set (has been asigned a value) and false otherwise
     public boolean isSet(int fieldID) {
       switch (fieldID) {
+      case CONTEXT:
+        return isSetContext();
       default:
         throw new IllegalArgumentException("Field " + fieldID + " doesn't exist!");
       }
@@ -3780,15 +5846,24 @@ public class BeeswaxService {
     public boolean equals(Object that) {
       if (that == null)
         return false;
-      if (that instanceof dump_config_args)
-        return this.equals((dump_config_args)that);
+      if (that instanceof get_log_args)
+        return this.equals((get_log_args)that);
       return false;
     }
 
-    public boolean equals(dump_config_args that) {
+    public boolean equals(get_log_args that) {
       if (that == null)
         return false;
 
+      boolean this_present_context = true && this.isSetContext();
+      boolean that_present_context = true && that.isSetContext();
+      if (this_present_context || that_present_context) {
+        if (!(this_present_context && that_present_context))
+          return false;
+        if (!this.context.equals(that.context))
+          return false;
+      }
+
       return true;
     }
 
@@ -3796,6 +5871,11 @@ public class BeeswaxService {
     public int hashCode() {
       HashCodeBuilder builder = new HashCodeBuilder();
 
+      boolean present_context = true && (isSetContext());
+      builder.append(present_context);
+      if (present_context)
+        builder.append(context);
+
       return builder.toHashCode();
     }
 
@@ -3810,6 +5890,13 @@ public class BeeswaxService {
         }
         switch (field.id)
         {
+          case CONTEXT:
+            if (field.type == TType.STRING) {
+              this.context = iprot.readString();
+            } else { 
+              TProtocolUtil.skip(iprot, field.type);
+            }
+            break;
           default:
             TProtocolUtil.skip(iprot, field.type);
             break;
@@ -3827,15 +5914,27 @@ public class BeeswaxService {
       validate();
 
       oprot.writeStructBegin(STRUCT_DESC);
+      if (this.context != null) {
+        oprot.writeFieldBegin(CONTEXT_FIELD_DESC);
+        oprot.writeString(this.context);
+        oprot.writeFieldEnd();
+      }
       oprot.writeFieldStop();
       oprot.writeStructEnd();
     }
 
     @Override
     public String toString() {
-      StringBuilder sb = new StringBuilder("dump_config_args(");
+      StringBuilder sb = new StringBuilder("get_log_args(");
       boolean first = true;
 
+      sb.append("context:");
+      if (this.context == null) {
+        sb.append("null");
+      } else {
+        sb.append(this.context);
+      }
+      first = false;
       sb.append(")");
       return sb.toString();
     }
@@ -3847,12 +5946,15 @@ public class BeeswaxService {
 
   }
 
-  public static class dump_config_result implements TBase, java.io.Serializable, Cloneable   {
-    private static final TStruct STRUCT_DESC = new TStruct("dump_config_result");
+  public static class get_log_result implements TBase, java.io.Serializable, Cloneable   {
+    private static final TStruct STRUCT_DESC = new TStruct("get_log_result");
     private static final TField SUCCESS_FIELD_DESC = new TField("success", TType.STRING, (short)0);
+    private static final TField ERROR_FIELD_DESC = new TField("error", TType.STRUCT, (short)1);
 
     public String success;
     public static final int SUCCESS = 0;
+    public QueryNotFoundException error;
+    public static final int ERROR = 1;
 
     private final Isset __isset = new Isset();
     private static final class Isset implements java.io.Serializable {
@@ -3861,34 +5963,41 @@ public class BeeswaxService {
     public static final Map<Integer, FieldMetaData> metaDataMap = Collections.unmodifiableMap(new HashMap<Integer, FieldMetaData>() {{
       put(SUCCESS, new FieldMetaData("success", TFieldRequirementType.DEFAULT, 
           new FieldValueMetaData(TType.STRING)));
+      put(ERROR, new FieldMetaData("error", TFieldRequirementType.DEFAULT, 
+          new FieldValueMetaData(TType.STRUCT)));
     }});
 
     static {
-      FieldMetaData.addStructMetaDataMap(dump_config_result.class, metaDataMap);
+      FieldMetaData.addStructMetaDataMap(get_log_result.class, metaDataMap);
     }
 
-    public dump_config_result() {
+    public get_log_result() {
     }
 
-    public dump_config_result(
-      String success)
+    public get_log_result(
+      String success,
+      QueryNotFoundException error)
     {
       this();
       this.success = success;
+      this.error = error;
     }
 
     /**
      * Performs a deep copy on <i>other</i>.
      */
-    public dump_config_result(dump_config_result other) {
+    public get_log_result(get_log_result other) {
       if (other.isSetSuccess()) {
         this.success = other.success;
       }
+      if (other.isSetError()) {
+        this.error = new QueryNotFoundException(other.error);
+      }
     }
 
     @Override
-    public dump_config_result clone() {
-      return new dump_config_result(this);
+    public get_log_result clone() {
+      return new get_log_result(this);
     }
 
     public String getSuccess() {
@@ -3914,6 +6023,29 @@ public class BeeswaxService {
       }
     }
 
+    public QueryNotFoundException getError() {
+      return this.error;
+    }
+
+    public void setError(QueryNotFoundException error) {
+      this.error = error;
+    }
+
+    public void unsetError() {
+      this.error = null;
+    }
+
+    // Returns true if field error is set (has been asigned a value) and false otherwise
+    public boolean isSetError() {
+      return this.error != null;
+    }
+
+    public void setErrorIsSet(boolean value) {
+      if (!value) {
+        this.error = null;
+      }
+    }
+
     public void setFieldValue(int fieldID, Object value) {
       switch (fieldID) {
       case SUCCESS:
@@ -3924,6 +6056,14 @@ public class BeeswaxService {
         }
         break;
 
+      case ERROR:
+        if (value == null) {
+          unsetError();
+        } else {
+          setError((QueryNotFoundException)value);
+        }
+        break;
+
       default:
         throw new IllegalArgumentException("Field " + fieldID + " doesn't exist!");
       }
@@ -3934,6 +6074,9 @@ public class BeeswaxService {
       case SUCCESS:
         return getSuccess();
 
+      case ERROR:
+        return getError();
+
       default:
         throw new IllegalArgumentException("Field " + fieldID + " doesn't exist!");
       }
@@ -3944,6 +6087,8 @@ public class BeeswaxService {
       switch (fieldID) {
       case SUCCESS:
         return isSetSuccess();
+      case ERROR:
+        return isSetError();
       default:
         throw new IllegalArgumentException("Field " + fieldID + " doesn't exist!");
       }
@@ -3953,12 +6098,12 @@ public class BeeswaxService {
     public boolean equals(Object that) {
       if (that == null)
         return false;
-      if (that instanceof dump_config_result)
-        return this.equals((dump_config_result)that);
+      if (that instanceof get_log_result)
+        return this.equals((get_log_result)that);
       return false;
     }
 
-    public boolean equals(dump_config_result that) {
+    public boolean equals(get_log_result that) {
       if (that == null)
         return false;
 
@@ -3971,6 +6116,15 @@ public class BeeswaxService {
           return false;
       }
 
+      boolean this_present_error = true && this.isSetError();
+      boolean that_present_error = true && that.isSetError();
+      if (this_present_error || that_present_error) {
+        if (!(this_present_error && that_present_error))
+          return false;
+        if (!this.error.equals(that.error))
+          return false;
+      }
+
       return true;
     }
 
@@ -3983,6 +6137,11 @@ public class BeeswaxService {
       if (present_success)
         builder.append(success);
 
+      boolean present_error = true && (isSetError());
+      builder.append(present_error);
+      if (present_error)
+        builder.append(error);
+
       return builder.toHashCode();
     }
 
@@ -4004,6 +6163,14 @@ public class BeeswaxService {
               TProtocolUtil.skip(iprot, field.type);
             }
             break;
+          case ERROR:
+            if (field.type == TType.STRUCT) {
+              this.error = new QueryNotFoundException();
+              this.error.read(iprot);
+            } else { 
+              TProtocolUtil.skip(iprot, field.type);
+            }
+            break;
           default:
             TProtocolUtil.skip(iprot, field.type);
             break;
@@ -4024,6 +6191,10 @@ public class BeeswaxService {
         oprot.writeFieldBegin(SUCCESS_FIELD_DESC);
         oprot.writeString(this.success);
         oprot.writeFieldEnd();
+      } else if (this.isSetError()) {
+        oprot.writeFieldBegin(ERROR_FIELD_DESC);
+        this.error.write(oprot);
+        oprot.writeFieldEnd();
       }
       oprot.writeFieldStop();
       oprot.writeStructEnd();
@@ -4031,7 +6202,7 @@ public class BeeswaxService {
 
     @Override
     public String toString() {
-      StringBuilder sb = new StringBuilder("dump_config_result(");
+      StringBuilder sb = new StringBuilder("get_log_result(");
       boolean first = true;
 
       sb.append("success:");
@@ -4041,6 +6212,14 @@ public class BeeswaxService {
         sb.append(this.success);
       }
       first = false;
+      if (!first) sb.append(", ");
+      sb.append("error:");
+      if (this.error == null) {
+        sb.append("null");
+      } else {
+        sb.append(this.error);
+      }
+      first = false;
       sb.append(")");
       return sb.toString();
     }
@@ -4052,48 +6231,59 @@ public class BeeswaxService {
 
   }
 
-  public static class get_log_args implements TBase, java.io.Serializable, Cloneable   {
-    private static final TStruct STRUCT_DESC = new TStruct("get_log_args");
+  public static class get_log_from_args implements TBase, java.io.Serializable, Cloneable   {
+    private static final TStruct STRUCT_DESC = new TStruct("get_log_from_args");
     private static final TField CONTEXT_FIELD_DESC = new TField("context", TType.STRING, (short)1);
+    private static final TField START_OFFSET_FIELD_DESC = new TField("start_offset", TType.I64, (short)2);
 
     public String context;
     public static final int CONTEXT = 1;
+    public long start_offset;
+    public static final int START_OFFSET = 2;
 
     private final Isset __isset = new Isset();
     private static final class Isset implements java.io.Serializable {
+      public boolean start_offset = false;
     }
 
     public static final Map<Integer, FieldMetaData> metaDataMap = Collections.unmodifiableMap(new HashMap<Integer, FieldMetaData>() {{
       put(CONTEXT, new FieldMetaData("context", TFieldRequirementType.DEFAULT, 
           new FieldValueMetaData(TType.STRING)));
+      put(START_OFFSET, new FieldMetaData("start_offset", TFieldRequirementType.DEFAULT, 
+          new FieldValueMetaData(TType.I64)));
     }});
 
     static {
-      FieldMetaData.addStructMetaDataMap(get_log_args.class, metaDataMap);
+      FieldMetaData.addStructMetaDataMap(get_log_from_args.class, metaDataMap);
     }
 
-    public get_log_args() {
+    public get_log_from_args() {
     }
 
-    public get_log_args(
-      String context)
+    public get_log_from_args(
+      String context,
+      long start_offset)
     {
       this();
       this.context = context;
+      this.start_offset = start_offset;
+      this.__isset.start_offset = true;
     }
 
     /**
      * Performs a deep copy on <i>other</i>.
      */
-    public get_log_args(get_log_args other) {
+    public get_log_from_args(get_log_from_args other) {
       if (other.isSetContext()) {
         this.context = other.context;
       }
+      __isset.start_offset = other.__isset.start_offset;
+      this.start_offset = other.start_offset;
     }
 
     @Override
-    public get_log_args clone() {
-      return new get_log_args(this);
+    public get_log_from_args clone() {
+      return new get_log_from_args(this);
     }
 
     public String getContext() {
@@ -4119,6 +6309,28 @@ public class BeeswaxService {
       }
     }
 
+    public long getStart_offset() {
+      return this.start_offset;
+    }
+
+    public void setStart_offset(long start_offset) {
+      this.start_offset = start_offset;
+      this.__isset.start_offset = true;
+    }
+
+    public void unsetStart_offset() {
+      this.__isset.start_offset = false;
+    }
+
+    // Returns true if field start_offset is set (has been asigned a value) and false otherwise
+    public boolean isSetStart_offset() {
+      return this.__isset.start_offset;
+    }
+
+    public void setStart_offsetIsSet(boolean value) {
+      this.__isset.start_offset = value;
+    }
+
     public void setFieldValue(int fieldID, Object value) {
       switch (fieldID) {
       case CONTEXT:
@@ -4129,6 +6341,14 @@ public class BeeswaxService {
         }
         break;
 
+      case START_OFFSET:
+        if (value == null) {
+          unsetStart_offset();
+        } else {
+          setStart_offset((Long)value);
+        }
+        break;
+
       default:
         throw new IllegalArgumentException("Field " + fieldID + " doesn't exist!");
       }
@@ -4139,6 +6359,9 @@ public class BeeswaxService {
       case CONTEXT:
         return getContext();
 
+      case START_OFFSET:
+        return new Long(getStart_offset());
+
       default:
         throw new IllegalArgumentException("Field " + fieldID + " doesn't exist!");
       }
@@ -4149,6 +6372,8 @@ public class BeeswaxService {
       switch (fieldID) {
       case CONTEXT:
         return isSetContext();
+      case START_OFFSET:
+        return isSetStart_offset();
       default:
         throw new IllegalArgumentException("Field " + fieldID + " doesn't exist!");
       }
@@ -4158,12 +6383,12 @@ public class BeeswaxService {
     public boolean equals(Object that) {
       if (that == null)
         return false;
-      if (that instanceof get_log_args)
-        return this.equals((get_log_args)that);
+      if (that instanceof get_log_from_args)
+        return this.equals((get_log_from_args)that);
       return false;
     }
 
-    public boolean equals(get_log_args that) {
+    public boolean equals(get_log_from_args that) {
       if (that == null)
         return false;
 
@@ -4176,6 +6401,15 @@ public class BeeswaxService {
           return false;
       }
 
+      boolean this_present_start_offset = true;
+      boolean that_present_start_offset = true;
+      if (this_present_start_offset || that_present_start_offset) {
+        if (!(this_present_start_offset && that_present_start_offset))
+          return false;
+        if (this.start_offset != that.start_offset)
+          return false;
+      }
+
       return true;
     }
 
@@ -4188,6 +6422,11 @@ public class BeeswaxService {
       if (present_context)
         builder.append(context);
 
+      boolean present_start_offset = true;
+      builder.append(present_start_offset);
+      if (present_start_offset)
+        builder.append(start_offset);
+
       return builder.toHashCode();
     }
 
@@ -4209,6 +6448,14 @@ public class BeeswaxService {
               TProtocolUtil.skip(iprot, field.type);
             }
             break;
+          case START_OFFSET:
+            if (field.type == TType.I64) {
+              this.start_offset = iprot.readI64();
+              this.__isset.start_offset = true;
+            } else { 
+              TProtocolUtil.skip(iprot, field.type);
+            }
+            break;
           default:
             TProtocolUtil.skip(iprot, field.type);
             break;
@@ -4231,13 +6478,16 @@ public class BeeswaxService {
         oprot.writeString(this.context);
         oprot.writeFieldEnd();
       }
+      oprot.writeFieldBegin(START_OFFSET_FIELD_DESC);
+      oprot.writeI64(this.start_offset);
+      oprot.writeFieldEnd();
       oprot.writeFieldStop();
       oprot.writeStructEnd();
     }
 
     @Override
     public String toString() {
-      StringBuilder sb = new StringBuilder("get_log_args(");
+      StringBuilder sb = new StringBuilder("get_log_from_args(");
       boolean first = true;
 
       sb.append("context:");
@@ -4247,6 +6497,10 @@ public class BeeswaxService {
         sb.append(this.context);
       }
       first = false;
+      if (!first) sb.append(", ");
+      sb.append("start_offset:");
+      sb.append(this.start_offset);
+      first = false;
       sb.append(")");
       return sb.toString();
     }
@@ -4258,8 +6512,8 @@ public class BeeswaxService {
 
   }
 
-  public static class get_log_result implements TBase, java.io.Serializable, Cloneable   {
-    private static final TStruct STRUCT_DESC = new TStruct("get_log_result");
+  public static class get_log_from_result implements TBase, java.io.Serializable, Cloneable   {
+    private static final TStruct STRUCT_DESC = new TStruct("get_log_from_result");
     private static final TField SUCCESS_FIELD_DESC = new TField("success", TType.STRING, (short)0);
     private static final TField ERROR_FIELD_DESC = new TField("error", TType.STRUCT, (short)1);
 
@@ -4280,13 +6534,13 @@ public class BeeswaxService {
     }});
 
     static {
-      FieldMetaData.addStructMetaDataMap(get_log_result.class, metaDataMap);
+      FieldMetaData.addStructMetaDataMap(get_log_from_result.class, metaDataMap);
     }
 
-    public get_log_result() {
+    public get_log_from_result() {
     }
 
-    public get_log_result(
+    public get_log_from_result(
       String success,
       QueryNotFoundException error)
     {
@@ -4298,7 +6552,7 @@ public class BeeswaxService {
     /**
      * Performs a deep copy on <i>other</i>.
      */
-    public get_log_result(get_log_result other) {
+    public get_log_from_result(get_log_from_result other) {
       if (other.isSetSuccess()) {
         this.success = other.success;
       }
@@ -4308,8 +6562,8 @@ public class BeeswaxService {
     }
 
     @Override
-    public get_log_result clone() {
-      return new get_log_result(this);
+    public get_log_from_result clone() {
+      return new get_log_from_result(this);
     }
 
     public String getSuccess() {
@@ -4410,12 +6664,12 @@ public class BeeswaxService {
     public boolean equals(Object that) {
       if (that == null)
         return false;
-      if (that instanceof get_log_result)
-        return this.equals((get_log_result)that);
+      if (that instanceof get_log_from_result)
+        return this.equals((get_log_from_result)that);
       return false;
     }
 
-    public boolean equals(get_log_result that) {
+    public boolean equals(get_log_from_result that) {
       if (that == null)
         return false;
 
@@ -4514,7 +6768,7 @@ public class BeeswaxService {
 
     @Override
     public String toString() {
-      StringBuilder sb = new StringBuilder("get_log_result(");
+      StringBuilder sb = new StringBuilder("get_log_from_result(");
       boolean first = true;
 
       sb.append("success:");
@@ -4917,14 +7171,14 @@ public class BeeswaxService {
           case SUCCESS:
             if (field.type == TType.LIST) {
               {
-                TList _list16 = iprot.readListBegin();
-                this.success = new ArrayList<ConfigVariable>(_list16.size);
-                for (int _i17 = 0; _i17 < _list16.size; ++_i17)
+                TList _list40 = iprot.readListBegin();
+                this.success = new ArrayList<ConfigVariable>(_list40.size);
+                for (int _i41 = 0; _i41 < _list40.size; ++_i41)
                 {
-                  ConfigVariable _elem18;
-                  _elem18 = new ConfigVariable();
-                  _elem18.read(iprot);
-                  this.success.add(_elem18);
+                  ConfigVariable _elem42;
+                  _elem42 = new ConfigVariable();
+                  _elem42.read(iprot);
+                  this.success.add(_elem42);
                 }
                 iprot.readListEnd();
               }
@@ -4952,8 +7206,8 @@ public class BeeswaxService {
         oprot.writeFieldBegin(SUCCESS_FIELD_DESC);
         {
           oprot.writeListBegin(new TList(TType.STRUCT, this.success.size()));
-          for (ConfigVariable _iter19 : this.success)          {
-            _iter19.write(oprot);
+          for (ConfigVariable _iter43 : this.success)          {
+            _iter43.write(oprot);
           }
           oprot.writeListEnd();
         }
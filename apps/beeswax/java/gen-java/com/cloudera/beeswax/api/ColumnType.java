@@ -0,0 +1,34 @@
+/**
+ * Autogenerated by Thrift
+ *
+ * DO NOT EDIT UNLESS YOU ARE SURE THAT YOU KNOW WHAT YOU ARE DOING
+ */
+package com.cloudera.beeswax.api;
+
+
+import java.util.Set;
+import java.util.HashSet;
+import java.util.Collections;
+import org.apache.thrift.IntRangeSet;
+import java.util.Map;
+import java.util.HashMap;
+
+public class ColumnType {
+  public static final int BOOLEAN = 0;
+  public static final int LONG = 1;
+  public static final int DOUBLE = 2;
+  public static final int STRING = 3;
+
+  public static final IntRangeSet VALID_VALUES = new IntRangeSet(
+    BOOLEAN, 
+    LONG, 
+    DOUBLE, 
+    STRING );
+
+  public static final Map<Integer, String> VALUES_TO_NAMES = new HashMap<Integer, String>() {{
+    put(BOOLEAN, "BOOLEAN");
+    put(LONG, "LONG");
+    put(DOUBLE, "DOUBLE");
+    put(STRING, "STRING");
+  }};
+}
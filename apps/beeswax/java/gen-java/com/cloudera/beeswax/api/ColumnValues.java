@@ -0,0 +1,787 @@
+/**
+ * Autogenerated by Thrift
+ *
+ * DO NOT EDIT UNLESS YOU ARE SURE THAT YOU KNOW WHAT YOU ARE DOING
+ */
+package com.cloudera.beeswax.api;
+
+import org.apache.commons.lang.builder.HashCodeBuilder;
+import java.util.List;
+import java.util.ArrayList;
+import java.util.Map;
+import java.util.HashMap;
+import java.util.Set;
+import java.util.HashSet;
+import java.util.Collections;
+import org.apache.log4j.Logger;
+
+import org.apache.thrift.*;
+import org.apache.thrift.meta_data.*;
+import org.apache.thrift.protocol.*;
+
+/**
+ * The values of a column of results. Only the list of values of the type
+ * of the column is set. Values of complex types are JSON strings.
+ */
+public class ColumnValues implements TBase, java.io.Serializable, Cloneable {
+  private static final TStruct STRUCT_DESC = new TStruct("ColumnValues");
+  private static final TField TYPE_FIELD_DESC = new TField("type", TType.I32, (short)1);
+  private static final TField NULLS_FIELD_DESC = new TField("nulls", TType.STRING, (short)2);
+  private static final TField BOOL_VALUES_FIELD_DESC = new TField("bool_values", TType.LIST, (short)3);
+  private static final TField LONG_VALUES_FIELD_DESC = new TField("long_values", TType.LIST, (short)4);
+  private static final TField DOUBLE_VALUES_FIELD_DESC = new TField("double_values", TType.LIST, (short)5);
+  private static final TField STRING_VALUES_FIELD_DESC = new TField("string_values", TType.LIST, (short)6);
+
+  public int type;
+  public static final int TYPE = 1;
+  public byte[] nulls;
+  public static final int NULLS = 2;
+  public List<Boolean> bool_values;
+  public static final int BOOL_VALUES = 3;
+  public List<Long> long_values;
+  public static final int LONG_VALUES = 4;
+  public List<Double> double_values;
+  public static final int DOUBLE_VALUES = 5;
+  public List<String> string_values;
+  public static final int STRING_VALUES = 6;
+
+  private final Isset __isset = new Isset();
+  private static final class Isset implements java.io.Serializable {
+    public boolean type = false;
+  }
+
+  public static final Map<Integer, FieldMetaData> metaDataMap = Collections.unmodifiableMap(new HashMap<Integer, FieldMetaData>() {{
+    put(TYPE, new FieldMetaData("type", TFieldRequirementType.DEFAULT, 
+        new FieldValueMetaData(TType.I32)));
+    put(NULLS, new FieldMetaData("nulls", TFieldRequirementType.DEFAULT, 
+        new FieldValueMetaData(TType.STRING)));
+    put(BOOL_VALUES, new FieldMetaData("bool_values", TFieldRequirementType.DEFAULT, 
+        new ListMetaData(TType.LIST, 
+            new FieldValueMetaData(TType.BOOL))));
+    put(LONG_VALUES, new FieldMetaData("long_values", TFieldRequirementType.DEFAULT, 
+        new ListMetaData(TType.LIST, 
+            new FieldValueMetaData(TType.I64))));
+    put(DOUBLE_VALUES, new FieldMetaData("double_values", TFieldRequirementType.DEFAULT, 
+        new ListMetaData(TType.LIST, 
+            new FieldValueMetaData(TType.DOUBLE))));
+    put(STRING_VALUES, new FieldMetaData("string_values", TFieldRequirementType.DEFAULT, 
+        new ListMetaData(TType.LIST, 
+            new FieldValueMetaData(TType.STRING))));
+  }});
+
+  static {
+    FieldMetaData.addStructMetaDataMap(ColumnValues.class, metaDataMap);
+  }
+
+  public ColumnValues() {
+  }
+
+  public ColumnValues(
+    int type,
+    byte[] nulls,
+    List<Boolean> bool_values,
+    List<Long> long_values,
+    List<Double> double_values,
+    List<String> string_values)
+  {
+    this();
+    this.type = type;
+    this.__isset.type = true;
+    this.nulls = nulls;
+    this.bool_values = bool_values;
+    this.long_values = long_values;
+    this.double_values = double_values;
+    this.string_values = string_values;
+  }
+
+  /**
+   * Performs a deep copy on <i>other</i>.
+   */
+  public ColumnValues(ColumnValues other) {
+    __isset.type = other.__isset.type;
+    this.type = other.type;
+    if (other.isSetNulls()) {
+      this.nulls = new byte[other.nulls.length];
+      System.arraycopy(other.nulls, 0, nulls, 0, other.nulls.length);
+    }
+    if (other.isSetBool_values()) {
+      List<Boolean> __this__bool_values = new ArrayList<Boolean>();
+      for (Boolean other_element : other.bool_values) {
+        __this__bool_values.add(other_element);
+      }
+      this.bool_values = __this__bool_values;
+    }
+    if (other.isSetLong_values()) {
+      List<Long> __this__long_values = new ArrayList<Long>();
+      for (Long other_element : other.long_values) {
+        __this__long_values.add(other_element);
+      }
+      this.long_values = __this__long_values;
+    }
+    if (other.isSetDouble_values()) {
+      List<Double> __this__double_values = new ArrayList<Double>();
+      for (Double other_element : other.double_values) {
+        __this__double_values.add(other_element);
+      }
+      this.double_values = __this__double_values;
+    }
+    if (other.isSetString_values()) {
+      List<String> __this__string_values = new ArrayList<String>();
+      for (String other_element : other.string_values) {
+        __this__string_values.add(other_element);
+      }
+      this.string_values = __this__string_values;
+    }
+  }
+
+  @Override
+  public ColumnValues clone() {
+    return new ColumnValues(this);
+  }
+
+  public int getType() {
+    return this.type;
+  }
+
+  public void setType(int type) {
+    this.type = type;
+    this.__isset.type = true;
+  }
+
+  public void unsetType() {
+    this.__isset.type = false;
+  }
+
+  // Returns true if field type is set (has been asigned a value) and false otherwise
+  public boolean isSetType() {
+    return this.__isset.type;
+  }
+
+  public void setTypeIsSet(boolean value) {
+    this.__isset.type = value;
+  }
+
+  public byte[] getNulls() {
+    return this.nulls;
+  }
+
+  public void setNulls(byte[] nulls) {
+    this.nulls = nulls;
+  }
+
+  public void unsetNulls() {
+    this.nulls = null;
+  }
+
+  // Returns true if field nulls is set (has been asigned a value) and false otherwise
+  public boolean isSetNulls() {
+    return this.nulls != null;
+  }
+
+  public void setNullsIsSet(boolean value) {
+    if (!value) {
+      this.nulls = null;
+    }
+  }
+
+  public int getBool_valuesSize() {
+    return (this.bool_values == null) ? 0 : this.bool_values.size();
+  }
+
+  public java.util.Iterator<Boolean> getBool_valuesIterator() {
+    return (this.bool_values == null) ? null : this.bool_values.iterator();
+  }
+
+  public void addToBool_values(boolean elem) {
+    if (this.bool_values == null) {
+      this.bool_values = new ArrayList<Boolean>();
+    }
+    this.bool_values.add(elem);
+  }
+
+  public List<Boolean> getBool_values() {
+    return this.bool_values;
+  }
+
+  public void setBool_values(List<Boolean> bool_values) {
+    this.bool_values = bool_values;
+  }
+
+  public void unsetBool_values() {
+    this.bool_values = null;
+  }
+
+  // Returns true if field bool_values is set (has been asigned a value) and false otherwise
+  public boolean isSetBool_values() {
+    return this.bool_values != null;
+  }
+
+  public void setBool_valuesIsSet(boolean value) {
+    if (!value) {
+      this.bool_values = null;
+    }
+  }
+
+  public int getLong_valuesSize() {
+    return (this.long_values == null) ? 0 : this.long_values.size();
+  }
+
+  public java.util.Iterator<Long> getLong_valuesIterator() {
+    return (this.long_values == null) ? null : this.long_values.iterator();
+  }
+
+  public void addToLong_values(long elem) {
+    if (this.long_values == null) {
+      this.long_values = new ArrayList<Long>();
+    }
+    this.long_values.add(elem);
+  }
+
+  public List<Long> getLong_values() {
+    return this.long_values;
+  }
+
+  public void setLong_values(List<Long> long_values) {
+    this.long_values = long_values;
+  }
+
+  public void unsetLong_values() {
+    this.long_values = null;
+  }
+
+  // Returns true if field long_values is set (has been asigned a value) and false otherwise
+  public boolean isSetLong_values() {
+    return this.long_values != null;
+  }
+
+  public void setLong_valuesIsSet(boolean value) {
+    if (!value) {
+      this.long_values = null;
+    }
+  }
+
+  public int getDouble_valuesSize() {
+    return (this.double_values == null) ? 0 : this.double_values.size();
+  }
+
+  public java.util.Iterator<Double> getDouble_valuesIterator() {
+    return (this.double_values == null) ? null : this.double_values.iterator();
+  }
+
+  public void addToDouble_values(double elem) {
+    if (this.double_values == null) {
+      this.double_values = new ArrayList<Double>();
+    }
+    this.double_values.add(elem);
+  }
+
+  public List<Double> getDouble_values() {
+    return this.double_values;
+  }
+
+  public void setDouble_values(List<Double> double_values) {
+    this.double_values = double_values;
+  }
+
+  public void unsetDouble_values() {
+    this.double_values = null;
+  }
+
+  // Returns true if field double_values is set (has been asigned a value) and false otherwise
+  public boolean isSetDouble_values() {
+    return this.double_values != null;
+  }
+
+  public void setDouble_valuesIsSet(boolean value) {
+    if (!value) {
+      this.double_values = null;
+    }
+  }
+
+  public int getString_valuesSize() {
+    return (this.string_values == null) ? 0 : this.string_values.size();
+  }
+
+  public java.util.Iterator<String> getString_valuesIterator() {
+    return (this.string_values == null) ? null : this.string_values.iterator();
+  }
+
+  public void addToString_values(String elem) {
+    if (this.string_values == null) {
+      this.string_values = new ArrayList<String>();
+    }
+    this.string_values.add(elem);
+  }
+
+  public List<String> getString_values() {
+    return this.string_values;
+  }
+
+  public void setString_values(List<String> string_values) {
+    this.string_values = string_values;
+  }
+
+  public void unsetString_values() {
+    this.string_values = null;
+  }
+
+  // Returns true if field string_values is set (has been asigned a value) and false otherwise
+  public boolean isSetString_values() {
+    return this.string_values != null;
+  }
+
+  public void setString_valuesIsSet(boolean value) {
+    if (!value) {
+      this.string_values = null;
+    }
+  }
+
+  public void setFieldValue(int fieldID, Object value) {
+    switch (fieldID) {
+    case TYPE:
+      if (value == null) {
+        unsetType();
+      } else {
+        setType((Integer)value);
+      }
+      break;
+
+    case NULLS:
+      if (value == null) {
+        unsetNulls();
+      } else {
+        setNulls((byte[])value);
+      }
+      break;
+
+    case BOOL_VALUES:
+      if (value == null) {
+        unsetBool_values();
+      } else {
+        setBool_values((List<Boolean>)value);
+      }
+      break;
+
+    case LONG_VALUES:
+      if (value == null) {
+        unsetLong_values();
+      } else {
+        setLong_values((List<Long>)value);
+      }
+      break;
+
+    case DOUBLE_VALUES:
+      if (value == null) {
+        unsetDouble_values();
+      } else {
+        setDouble_values((List<Double>)value);
+      }
+      break;
+
+    case STRING_VALUES:
+      if (value == null) {
+        unsetString_values();
+      } else {
+        setString_values((List<String>)value);
+      }
+      break;
+
+    default:
+      throw new IllegalArgumentException("Field " + fieldID + " doesn't exist!");
+    }
+  }
+
+  public Object getFieldValue(int fieldID) {
+    switch (fieldID) {
+    case TYPE:
+      return getType();
+
+    case NULLS:
+      return getNulls();
+
+    case BOOL_VALUES:
+      return getBool_values();
+
+    case LONG_VALUES:
+      return getLong_values();
+
+    case DOUBLE_VALUES:
+      return getDouble_values();
+
+    case STRING_VALUES:
+      return getString_values();
+
+    default:
+      throw new IllegalArgumentException("Field " + fieldID + " doesn't exist!");
+    }
+  }
+
+  // Returns true if field corresponding to fieldID is set (has been asigned a value) and false otherwise
+  public boolean isSet(int fieldID) {
+    switch (fieldID) {
+    case TYPE:
+      return isSetType();
+    case NULLS:
+      return isSetNulls();
+    case BOOL_VALUES:
+      return isSetBool_values();
+    case LONG_VALUES:
+      return isSetLong_values();
+    case DOUBLE_VALUES:
+      return isSetDouble_values();
+    case STRING_VALUES:
+      return isSetString_values();
+    default:
+      throw new IllegalArgumentException("Field " + fieldID + " doesn't exist!");
+    }
+  }
+
+  @Override
+  public boolean equals(Object that) {
+    if (that == null)
+      return false;
+    if (that instanceof ColumnValues)
+      return this.equals((ColumnValues)that);
+    return false;
+  }
+
+  public boolean equals(ColumnValues that) {
+    if (that == null)
+      return false;
+
+    boolean this_present_type = true;
+    boolean that_present_type = true;
+    if (this_present_type || that_present_type) {
+      if (!(this_present_type && that_present_type))
+        return false;
+      if (this.type != that.type)
+        return false;
+    }
+
+    boolean this_present_nulls = true && this.isSetNulls();
+    boolean that_present_nulls = true && that.isSetNulls();
+    if (this_present_nulls || that_present_nulls) {
+      if (!(this_present_nulls && that_present_nulls))
+        return false;
+      if (!java.util.Arrays.equals(this.nulls, that.nulls))
+        return false;
+    }
+
+    boolean this_present_bool_values = true && this.isSetBool_values();
+    boolean that_present_bool_values = true && that.isSetBool_values();
+    if (this_present_bool_values || that_present_bool_values) {
+      if (!(this_present_bool_values && that_present_bool_values))
+        return false;
+      if (!this.bool_values.equals(that.bool_values))
+        return false;
+    }
+
+    boolean this_present_long_values = true && this.isSetLong_values();
+    boolean that_present_long_values = true && that.isSetLong_values();
+    if (this_present_long_values || that_present_long_values) {
+      if (!(this_present_long_values && that_present_long_values))
+        return false;
+      if (!this.long_values.equals(that.long_values))
+        return false;
+    }
+
+    boolean this_present_double_values = true && this.isSetDouble_values();
+    boolean that_present_double_values = true && that.isSetDouble_values();
+    if (this_present_double_values || that_present_double_values) {
+      if (!(this_present_double_values && that_present_double_values))
+        return false;
+      if (!this.double_values.equals(that.double_values))
+        return false;
+    }
+
+    boolean this_present_string_values = true && this.isSetString_values();
+    boolean that_present_string_values = true && that.isSetString_values();
+    if (this_present_string_values || that_present_string_values) {
+      if (!(this_present_string_values && that_present_string_values))
+        return false;
+      if (!this.string_values.equals(that.string_values))
+        return false;
+    }
+
+    return true;
+  }
+
+  @Override
+  public int hashCode() {
+    HashCodeBuilder builder = new HashCodeBuilder();
+
+    boolean present_type = true;
+    builder.append(present_type);
+    if (present_type)
+      builder.append(type);
+
+    boolean present_nulls = true && (isSetNulls());
+    builder.append(present_nulls);
+    if (present_nulls)
+      builder.append(nulls);
+
+    boolean present_bool_values = true && (isSetBool_values());
+    builder.append(present_bool_values);
+    if (present_bool_values)
+      builder.append(bool_values);
+
+    boolean present_long_values = true && (isSetLong_values());
+    builder.append(present_long_values);
+    if (present_long_values)
+      builder.append(long_values);
+
+    boolean present_double_values = true && (isSetDouble_values());
+    builder.append(present_double_values);
+    if (present_double_values)
+      builder.append(double_values);
+
+    boolean present_string_values = true && (isSetString_values());
+    builder.append(present_string_values);
+    if (present_string_values)
+      builder.append(string_values);
+
+    return builder.toHashCode();
+  }
+
+  public void read(TProtocol iprot) throws TException {
+    TField field;
+    iprot.readStructBegin();
+    while (true)
+    {
+      field = iprot.readFieldBegin();
+      if (field.type == TType.STOP) { 
+        break;
+      }
+      switch (field.id)
+      {
+        case TYPE:
+          if (field.type == TType.I32) {
+            this.type = iprot.readI32();
+            this.__isset.type = true;
+          } else { 
+            TProtocolUtil.skip(iprot, field.type);
+          }
+          break;
+        case NULLS:
+          if (field.type == TType.STRING) {
+            this.nulls = iprot.readBinary();
+          } else { 
+            TProtocolUtil.skip(iprot, field.type);
+          }
+          break;
+        case BOOL_VALUES:
+          if (field.type == TType.LIST) {
+            {
+              TList _list16 = iprot.readListBegin();
+              this.bool_values = new ArrayList<Boolean>(_list16.size);
+              for (int _i17 = 0; _i17 < _list16.size; ++_i17)
+              {
+                boolean _elem18;
+                _elem18 = iprot.readBool();
+                this.bool_values.add(_elem18);
+              }
+              iprot.readListEnd();
+            }
+          } else { 
+            TProtocolUtil.skip(iprot, field.type);
+          }
+          break;
+        case LONG_VALUES:
+          if (field.type == TType.LIST) {
+            {
+              TList _list19 = iprot.readListBegin();
+              this.long_values = new ArrayList<Long>(_list19.size);
+              for (int _i20 = 0; _i20 < _list19.size; ++_i20)
+              {
+                long _elem21;
+                _elem21 = iprot.readI64();
+                this.long_values.add(_elem21);
+              }
+              iprot.readListEnd();
+            }
+          } else { 
+            TProtocolUtil.skip(iprot, field.type);
+          }
+          break;
+        case DOUBLE_VALUES:
+          if (field.type == TType.LIST) {
+            {
+              TList _list22 = iprot.readListBegin();
+              this.double_values = new ArrayList<Double>(_list22.size);
+              for (int _i23 = 0; _i23 < _list22.size; ++_i23)
+              {
+                double _elem24;
+                _elem24 = iprot.readDouble();
+                this.double_values.add(_elem24);
+              }
+              iprot.readListEnd();
+            }
+          } else { 
+            TProtocolUtil.skip(iprot, field.type);
+          }
+          break;
+        case STRING_VALUES:
+          if (field.type == TType.LIST) {
+            {
+              TList _list25 = iprot.readListBegin();
+              this.string_values = new ArrayList<String>(_list25.size);
+              for (int _i26 = 0; _i26 < _list25.size; ++_i26)
+              {
+                String _elem27;
+                _elem27 = iprot.readString();
+                this.string_values.add(_elem27);
+              }
+              iprot.readListEnd();
+            }
+          } else { 
+            TProtocolUtil.skip(iprot, field.type);
+          }
+          break;
+        default:
+          TProtocolUtil.skip(iprot, field.type);
+          break;
+      }
+      iprot.readFieldEnd();
+    }
+    iprot.readStructEnd();
+
+
+    // check for required fields of primitive type, which can't be checked in the validate method
+    validate();
+  }
+
+  public void write(TProtocol oprot) throws TException {
+    validate();
+
+    oprot.writeStructBegin(STRUCT_DESC);
+    oprot.writeFieldBegin(TYPE_FIELD_DESC);
+    oprot.writeI32(this.type);
+    oprot.writeFieldEnd();
+    if (this.nulls != null) {
+      oprot.writeFieldBegin(NULLS_FIELD_DESC);
+      oprot.writeBinary(this.nulls);
+      oprot.writeFieldEnd();
+    }
+    if (this.bool_values != null) {
+      oprot.writeFieldBegin(BOOL_VALUES_FIELD_DESC);
+      {
+        oprot.writeListBegin(new TList(TType.BOOL, this.bool_values.size()));
+        for (boolean _iter28 : this.bool_values)        {
+          oprot.writeBool(_iter28);
+        }
+        oprot.writeListEnd();
+      }
+      oprot.writeFieldEnd();
+    }
+    if (this.long_values != null) {
+      oprot.writeFieldBegin(LONG_VALUES_FIELD_DESC);
+      {
+        oprot.writeListBegin(new TList(TType.I64, this.long_values.size()));
+        for (long _iter29 : this.long_values)        {
+          oprot.writeI64(_iter29);
+        }
+        oprot.writeListEnd();
+      }
+      oprot.writeFieldEnd();
+    }
+    if (this.double_values != null) {
+      oprot.writeFieldBegin(DOUBLE_VALUES_FIELD_DESC);
+      {
+        oprot.writeListBegin(new TList(TType.DOUBLE, this.double_values.size()));
+        for (double _iter30 : this.double_values)        {
+          oprot.writeDouble(_iter30);
+        }
+        oprot.writeListEnd();
+      }
+      oprot.writeFieldEnd();
+    }
+    if (this.string_values != null) {
+      oprot.writeFieldBegin(STRING_VALUES_FIELD_DESC);
+      {
+        oprot.writeListBegin(new TList(TType.STRING, this.string_values.size()));
+        for (String _iter31 : this.string_values)        {
+          oprot.writeString(_iter31);
+        }
+        oprot.writeListEnd();
+      }
+      oprot.writeFieldEnd();
+    }
+    oprot.writeFieldStop();
+    oprot.writeStructEnd();
+  }
+
+  @Override
+  public String toString() {
+    StringBuilder sb = new StringBuilder("ColumnValues(");
+    boolean first = true;
+
+    sb.append("type:");
+    String type_name = ColumnType.VALUES_TO_NAMES.get(this.type);
+    if (type_name != null) {
+      sb.append(type_name);
+      sb.append(" (");
+    }
+    sb.append(this.type);
+    if (type_name != null) {
+      sb.append(")");
+    }
+    first = false;
+    if (!first) sb.append(", ");
+    sb.append("nulls:");
+    if (this.nulls == null) {
+      sb.append("null");
+    } else {
+        int __nulls_size = Math.min(this.nulls.length, 128);
+        for (int i = 0; i < __nulls_size; i++) {
+          if (i != 0) sb.append(" ");
+          sb.append(Integer.toHexString(this.nulls[i]).length() > 1 ? Integer.toHexString(this.nulls[i]).substring(Integer.toHexString(this.nulls[i]).length() - 2).toUpperCase() : "0" + Integer.toHexString(this.nulls[i]).toUpperCase());
+        }
+        if (this.nulls.length > 128) sb.append(" ...");
+    }
+    first = false;
+    if (!first) sb.append(", ");
+    sb.append("bool_values:");
+    if (this.bool_values == null) {
+      sb.append("null");
+    } else {
+      sb.append(this.bool_values);
+    }
+    first = false;
+    if (!first) sb.append(", ");
+    sb.append("long_values:");
+    if (this.long_values == null) {
+      sb.append("null");
+    } else {
+      sb.append(this.long_values);
+    }
+    first = false;
+    if (!first) sb.append(", ");
+    sb.append("double_values:");
+    if (this.double_values == null) {
+      sb.append("null");
+    } else {
+      sb.append(this.double_values);
+    }
+    first = false;
+    if (!first) sb.append(", ");
+    sb.append("string_values:");
+    if (this.string_values == null) {
+      sb.append("null");
+    } else {
+      sb.append(this.string_values);
+    }
+    first = false;
+    sb.append(")");
+    return sb.toString();
+  }
+
+  public void validate() throws TException {
+    // check for required fields
+    // check that fields of type enum have valid values
+    if (isSetType() && !ColumnType.VALID_VALUES.contains(type)){
+      throw new TProtocolException("The field 'type' has been assigned the invalid value " + type);
+    }
+  }
+
+}
+
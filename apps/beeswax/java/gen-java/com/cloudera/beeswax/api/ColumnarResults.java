@@ -0,0 +1,680 @@
+/**
+ * Autogenerated by Thrift
+ *
+ * DO NOT EDIT UNLESS YOU ARE SURE THAT YOU KNOW WHAT YOU ARE DOING
+ */
+package com.cloudera.beeswax.api;
+
+import org.apache.commons.lang.builder.HashCodeBuilder;
+import java.util.List;
+import java.util.ArrayList;
+import java.util.Map;
+import java.util.HashMap;
+import java.util.Set;
+import java.util.HashSet;
+import java.util.Collections;
+import org.apache.log4j.Logger;
+
+import org.apache.thrift.*;
+import org.apache.thrift.meta_data.*;
+import org.apache.thrift.protocol.*;
+
+public class ColumnarResults implements TBase, java.io.Serializable, Cloneable {
+  private static final TStruct STRUCT_DESC = new TStruct("ColumnarResults");
+  private static final TField READY_FIELD_DESC = new TField("ready", TType.BOOL, (short)1);
+  private static final TField COLUMNS_FIELD_DESC = new TField("columns", TType.LIST, (short)2);
+  private static final TField VALUES_FIELD_DESC = new TField("values", TType.LIST, (short)3);
+  private static final TField START_ROW_FIELD_DESC = new TField("start_row", TType.I64, (short)4);
+  private static final TField NUM_ROWS_FIELD_DESC = new TField("num_rows", TType.I32, (short)5);
+  private static final TField HAS_MORE_FIELD_DESC = new TField("has_more", TType.BOOL, (short)6);
+
+  public boolean ready;
+  public static final int READY = 1;
+  public List<String> columns;
+  public static final int COLUMNS = 2;
+  public List<ColumnValues> values;
+  public static final int VALUES = 3;
+  public long start_row;
+  public static final int START_ROW = 4;
+  public int num_rows;
+  public static final int NUM_ROWS = 5;
+  public boolean has_more;
+  public static final int HAS_MORE = 6;
+
+  private final Isset __isset = new Isset();
+  private static final class Isset implements java.io.Serializable {
+    public boolean ready = false;
+    public boolean start_row = false;
+    public boolean num_rows = false;
+    public boolean has_more = false;
+  }
+
+  public static final Map<Integer, FieldMetaData> metaDataMap = Collections.unmodifiableMap(new HashMap<Integer, FieldMetaData>() {{
+    put(READY, new FieldMetaData("ready", TFieldRequirementType.DEFAULT, 
+        new FieldValueMetaData(TType.BOOL)));
+    put(COLUMNS, new FieldMetaData("columns", TFieldRequirementType.DEFAULT, 
+        new ListMetaData(TType.LIST, 
+            new FieldValueMetaData(TType.STRING))));
+    put(VALUES, new FieldMetaData("values", TFieldRequirementType.DEFAULT, 
+        new ListMetaData(TType.LIST, 
+            new StructMetaData(TType.STRUCT, ColumnValues.class))));
+    put(START_ROW, new FieldMetaData("start_row", TFieldRequirementType.DEFAULT, 
+        new FieldValueMetaData(TType.I64)));
+    put(NUM_ROWS, new FieldMetaData("num_rows", TFieldRequirementType.DEFAULT, 
+        new FieldValueMetaData(TType.I32)));
+    put(HAS_MORE, new FieldMetaData("has_more", TFieldRequirementType.DEFAULT, 
+        new FieldValueMetaData(TType.BOOL)));
+  }});
+
+  static {
+    FieldMetaData.addStructMetaDataMap(ColumnarResults.class, metaDataMap);
+  }
+
+  public ColumnarResults() {
+  }
+
+  public ColumnarResults(
+    boolean ready,
+    List<String> columns,
+    List<ColumnValues> values,
+    long start_row,
+    int num_rows,
+    boolean has_more)
+  {
+    this();
+    this.ready = ready;
+    this.__isset.ready = true;
+    this.columns = columns;
+    this.values = values;
+    this.start_row = start_row;
+    this.__isset.start_row = true;
+    this.num_rows = num_rows;
+    this.__isset.num_rows = true;
+    this.has_more = has_more;
+    this.__isset.has_more = true;
+  }
+
+  /**
+   * Performs a deep copy on <i>other</i>.
+   */
+  public ColumnarResults(ColumnarResults other) {
+    __isset.ready = other.__isset.ready;
+    this.ready = other.ready;
+    if (other.isSetColumns()) {
+      List<String> __this__columns = new ArrayList<String>();
+      for (String other_element : other.columns) {
+        __this__columns.add(other_element);
+      }
+      this.columns = __this__columns;
+    }
+    if (other.isSetValues()) {
+      List<ColumnValues> __this__values = new ArrayList<ColumnValues>();
+      for (ColumnValues other_element : other.values) {
+        __this__values.add(new ColumnValues(other_element));
+      }
+      this.values = __this__values;
+    }
+    __isset.start_row = other.__isset.start_row;
+    this.start_row = other.start_row;
+    __isset.num_rows = other.__isset.num_rows;
+    this.num_rows = other.num_rows;
+    __isset.has_more = other.__isset.has_more;
+    this.has_more = other.has_more;
+  }
+
+  @Override
+  public ColumnarResults clone() {
+    return new ColumnarResults(this);
+  }
+
+  public boolean isReady() {
+    return this.ready;
+  }
+
+  public void setReady(boolean ready) {
+    this.ready = ready;
+    this.__isset.ready = true;
+  }
+
+  public void unsetReady() {
+    this.__isset.ready = false;
+  }
+
+  // Returns true if field ready is set (has been asigned a value) and false otherwise
+  public boolean isSetReady() {
+    return this.__isset.ready;
+  }
+
+  public void setReadyIsSet(boolean value) {
+    this.__isset.ready = value;
+  }
+
+  public int getColumnsSize() {
+    return (this.columns == null) ? 0 : this.columns.size();
+  }
+
+  public java.util.Iterator<String> getColumnsIterator() {
+    return (this.columns == null) ? null : this.columns.iterator();
+  }
+
+  public void addToColumns(String elem) {
+    if (this.columns == null) {
+      this.columns = new ArrayList<String>();
+    }
+    this.columns.add(elem);
+  }
+
+  public List<String> getColumns() {
+    return this.columns;
+  }
+
+  public void setColumns(List<String> columns) {
+    this.columns = columns;
+  }
+
+  public void unsetColumns() {
+    this.columns = null;
+  }
+
+  // Returns true if field columns is set (has been asigned a value) and false otherwise
+  public boolean isSetColumns() {
+    return this.columns != null;
+  }
+
+  public void setColumnsIsSet(boolean value) {
+    if (!value) {
+      this.columns = null;
+    }
+  }
+
+  public int getValuesSize() {
+    return (this.values == null) ? 0 : this.values.size();
+  }
+
+  public java.util.Iterator<ColumnValues> getValuesIterator() {
+    return (this.values == null) ? null : this.values.iterator();
+  }
+
+  public void addToValues(ColumnValues elem) {
+    if (this.values == null) {
+      this.values = new ArrayList<ColumnValues>();
+    }
+    this.values.add(elem);
+  }
+
+  public List<ColumnValues> getValues() {
+    return this.values;
+  }
+
+  public void setValues(List<ColumnValues> values) {
+    this.values = values;
+  }
+
+  public void unsetValues() {
+    this.values = null;
+  }
+
+  // Returns true if field values is set (has been asigned a value) and false otherwise
+  public boolean isSetValues() {
+    return this.values != null;
+  }
+
+  public void setValuesIsSet(boolean value) {
+    if (!value) {
+      this.values = null;
+    }
+  }
+
+  public long getStart_row() {
+    return this.start_row;
+  }
+
+  public void setStart_row(long start_row) {
+    this.start_row = start_row;
+    this.__isset.start_row = true;
+  }
+
+  public void unsetStart_row() {
+    this.__isset.start_row = false;
+  }
+
+  // Returns true if field start_row is set (has been asigned a value) and false otherwise
+  public boolean isSetStart_row() {
+    return this.__isset.start_row;
+  }
+
+  public void setStart_rowIsSet(boolean value) {
+    this.__isset.start_row = value;
+  }
+
+  public int getNum_rows() {
+    return this.num_rows;
+  }
+
+  public void setNum_rows(int num_rows) {
+    this.num_rows = num_rows;
+    this.__isset.num_rows = true;
+  }
+
+  public void unsetNum_rows() {
+    this.__isset.num_rows = false;
+  }
+
+  // Returns true if field num_rows is set (has been asigned a value) and false otherwise
+  public boolean isSetNum_rows() {
+    return this.__isset.num_rows;
+  }
+
+  public void setNum_rowsIsSet(boolean value) {
+    this.__isset.num_rows = value;
+  }
+
+  public boolean isHas_more() {
+    return this.has_more;
+  }
+
+  public void setHas_more(boolean has_more) {
+    this.has_more = has_more;
+    this.__isset.has_more = true;
+  }
+
+  public void unsetHas_more() {
+    this.__isset.has_more = false;
+  }
+
+  // Returns true if field has_more is set (has been asigned a value) and false otherwise
+  public boolean isSetHas_more() {
+    return this.__isset.has_more;
+  }
+
+  public void setHas_moreIsSet(boolean value) {
+    this.__isset.has_more = value;
+  }
+
+  public void setFieldValue(int fieldID, Object value) {
+    switch (fieldID) {
+    case READY:
+      if (value == null) {
+        unsetReady();
+      } else {
+        setReady((Boolean)value);
+      }
+      break;
+
+    case COLUMNS:
+      if (value == null) {
+        unsetColumns();
+      } else {
+        setColumns((List<String>)value);
+      }
+      break;
+
+    case VALUES:
+      if (value == null) {
+        unsetValues();
+      } else {
+        setValues((List<ColumnValues>)value);
+      }
+      break;
+
+    case START_ROW:
+      if (value == null) {
+        unsetStart_row();
+      } else {
+        setStart_row((Long)value);
+      }
+      break;
+
+    case NUM_ROWS:
+      if (value == null) {
+        unsetNum_rows();
+      } else {
+        setNum_rows((Integer)value);
+      }
+      break;
+
+    case HAS_MORE:
+      if (value == null) {
+        unsetHas_more();
+      } else {
+        setHas_more((Boolean)value);
+      }
+      break;
+
+    default:
+      throw new IllegalArgumentException("Field " + fieldID + " doesn't exist!");
+    }
+  }
+
+  public Object getFieldValue(int fieldID) {
+    switch (fieldID) {
+    case READY:
+      return new Boolean(isReady());
+
+    case COLUMNS:
+      return getColumns();
+
+    case VALUES:
+      return getValues();
+
+    case START_ROW:
+      return new Long(getStart_row());
+
+    case NUM_ROWS:
+      return new Integer(getNum_rows());
+
+    case HAS_MORE:
+      return new Boolean(isHas_more());
+
+    default:
+      throw new IllegalArgumentException("Field " + fieldID + " doesn't exist!");
+    }
+  }
+
+  // Returns true if field corresponding to fieldID is set (has been asigned a value) and false otherwise
+  public boolean isSet(int fieldID) {
+    switch (fieldID) {
+    case READY:
+      return isSetReady();
+    case COLUMNS:
+      return isSetColumns();
+    case VALUES:
+      return isSetValues();
+    case START_ROW:
+      return isSetStart_row();
+    case NUM_ROWS:
+      return isSetNum_rows();
+    case HAS_MORE:
+      return isSetHas_more();
+    default:
+      throw new IllegalArgumentException("Field " + fieldID + " doesn't exist!");
+    }
+  }
+
+  @Override
+  public boolean equals(Object that) {
+    if (that == null)
+      return false;
+    if (that instanceof ColumnarResults)
+      return this.equals((ColumnarResults)that);
+    return false;
+  }
+
+  public boolean equals(ColumnarResults that) {
+    if (that == null)
+      return false;
+
+    boolean this_present_ready = true;
+    boolean that_present_ready = true;
+    if (this_present_ready || that_present_ready) {
+      if (!(this_present_ready && that_present_ready))
+        return false;
+      if (this.ready != that.ready)
+        return false;
+    }
+
+    boolean this_present_columns = true && this.isSetColumns();
+    boolean that_present_columns = true && that.isSetColumns();
+    if (this_present_columns || that_present_columns) {
+      if (!(this_present_columns && that_present_columns))
+        return false;
+      if (!this.columns.equals(that.columns))
+        return false;
+    }
+
+    boolean this_present_values = true && this.isSetValues();
+    boolean that_present_values = true && that.isSetValues();
+    if (this_present_values || that_present_values) {
+      if (!(this_present_values && that_present_values))
+        return false;
+      if (!this.values.equals(that.values))
+        return false;
+    }
+
+    boolean this_present_start_row = true;
+    boolean that_present_start_row = true;
+    if (this_present_start_row || that_present_start_row) {
+      if (!(this_present_start_row && that_present_start_row))
+        return false;
+      if (this.start_row != that.start_row)
+        return false;
+    }
+
+    boolean this_present_num_rows = true;
+    boolean that_present_num_rows = true;
+    if (this_present_num_rows || that_present_num_rows) {
+      if (!(this_present_num_rows && that_present_num_rows))
+        return false;
+      if (this.num_rows != that.num_rows)
+        return false;
+    }
+
+    boolean this_present_has_more = true;
+    boolean that_present_has_more = true;
+    if (this_present_has_more || that_present_has_more) {
+      if (!(this_present_has_more && that_present_has_more))
+        return false;
+      if (this.has_more != that.has_more)
+        return false;
+    }
+
+    return true;
+  }
+
+  @Override
+  public int hashCode() {
+    HashCodeBuilder builder = new HashCodeBuilder();
+
+    boolean present_ready = true;
+    builder.append(present_ready);
+    if (present_ready)
+      builder.append(ready);
+
+    boolean present_columns = true && (isSetColumns());
+    builder.append(present_columns);
+    if (present_columns)
+      builder.append(columns);
+
+    boolean present_values = true && (isSetValues());
+    builder.append(present_values);
+    if (present_values)
+      builder.append(values);
+
+    boolean present_start_row = true;
+    builder.append(present_start_row);
+    if (present_start_row)
+      builder.append(start_row);
+
+    boolean present_num_rows = true;
+    builder.append(present_num_rows);
+    if (present_num_rows)
+      builder.append(num_rows);
+
+    boolean present_has_more = true;
+    builder.append(present_has_more);
+    if (present_has_more)
+      builder.append(has_more);
+
+    return builder.toHashCode();
+  }
+
+  public void read(TProtocol iprot) throws TException {
+    TField field;
+    iprot.readStructBegin();
+    while (true)
+    {
+      field = iprot.readFieldBegin();
+      if (field.type == TType.STOP) { 
+        break;
+      }
+      switch (field.id)
+      {
+        case READY:
+          if (field.type == TType.BOOL) {
+            this.ready = iprot.readBool();
+            this.__isset.ready = true;
+          } else { 
+            TProtocolUtil.skip(iprot, field.type);
+          }
+          break;
+        case COLUMNS:
+          if (field.type == TType.LIST) {
+            {
+              TList _list32 = iprot.readListBegin();
+              this.columns = new ArrayList<String>(_list32.size);
+              for (int _i33 = 0; _i33 < _list32.size; ++_i33)
+              {
+                String _elem34;
+                _elem34 = iprot.readString();
+                this.columns.add(_elem34);
+              }
+              iprot.readListEnd();
+            }
+          } else { 
+            TProtocolUtil.skip(iprot, field.type);
+          }
+          break;
+        case VALUES:
+          if (field.type == TType.LIST) {
+            {
+              TList _list35 = iprot.readListBegin();
+              this.values = new ArrayList<ColumnValues>(_list35.size);
+              for (int _i36 = 0; _i36 < _list35.size; ++_i36)
+              {
+                ColumnValues _elem37;
+                _elem37 = new ColumnValues();
+                _elem37.read(iprot);
+                this.values.add(_elem37);
+              }
+              iprot.readListEnd();
+            }
+          } else { 
+            TProtocolUtil.skip(iprot, field.type);
+          }
+          break;
+        case START_ROW:
+          if (field.type == TType.I64) {
+            this.start_row = iprot.readI64();
+            this.__isset.start_row = true;
+          } else { 
+            TProtocolUtil.skip(iprot, field.type);
+          }
+          break;
+        case NUM_ROWS:
+          if (field.type == TType.I32) {
+            this.num_rows = iprot.readI32();
+            this.__isset.num_rows = true;
+          } else { 
+            TProtocolUtil.skip(iprot, field.type);
+          }
+          break;
+        case HAS_MORE:
+          if (field.type == TType.BOOL) {
+            this.has_more = iprot.readBool();
+            this.__isset.has_more = true;
+          } else { 
+            TProtocolUtil.skip(iprot, field.type);
+          }
+          break;
+        default:
+          TProtocolUtil.skip(iprot, field.type);
+          break;
+      }
+      iprot.readFieldEnd();
+    }
+    iprot.readStructEnd();
+
+
+    // check for required fields of primitive type, which can't be checked in the validate method
+    validate();
+  }
+
+  public void write(TProtocol oprot) throws TException {
+    validate();
+
+    oprot.writeStructBegin(STRUCT_DESC);
+    oprot.writeFieldBegin(READY_FIELD_DESC);
+    oprot.writeBool(this.ready);
+    oprot.writeFieldEnd();
+    if (this.columns != null) {
+      oprot.writeFieldBegin(COLUMNS_FIELD_DESC);
+      {
+        oprot.writeListBegin(new TList(TType.STRING, this.columns.size()));
+        for (String _iter38 : this.columns)        {
+          oprot.writeString(_iter38);
+        }
+        oprot.writeListEnd();
+      }
+      oprot.writeFieldEnd();
+    }
+    if (this.values != null) {
+      oprot.writeFieldBegin(VALUES_FIELD_DESC);
+      {
+        oprot.writeListBegin(new TList(TType.STRUCT, this.values.size()));
+        for (ColumnValues _iter39 : this.values)        {
+          _iter39.write(oprot);
+        }
+        oprot.writeListEnd();
+      }
+      oprot.writeFieldEnd();
+    }
+    oprot.writeFieldBegin(START_ROW_FIELD_DESC);
+    oprot.writeI64(this.start_row);
+    oprot.writeFieldEnd();
+    oprot.writeFieldBegin(NUM_ROWS_FIELD_DESC);
+    oprot.writeI32(this.num_rows);
+    oprot.writeFieldEnd();
+    oprot.writeFieldBegin(HAS_MORE_FIELD_DESC);
+    oprot.writeBool(this.has_more);
+    oprot.writeFieldEnd();
+    oprot.writeFieldStop();
+    oprot.writeStructEnd();
+  }
+
+  @Override
+  public String toString() {
+    StringBuilder sb = new StringBuilder("ColumnarResults(");
+    boolean first = true;
+
+    sb.append("ready:");
+    sb.append(this.ready);
+    first = false;
+    if (!first) sb.append(", ");
+    sb.append("columns:");
+    if (this.columns == null) {
+      sb.append("null");
+    } else {
+      sb.append(this.columns);
+    }
+    first = false;
+    if (!first) sb.append(", ");
+    sb.append("values:");
+    if (this.values == null) {
+      sb.append("null");
+    } else {
+      sb.append(this.values);
+    }
+    first = false;
+    if (!first) sb.append(", ");
+    sb.append("start_row:");
+    sb.append(this.start_row);
+    first = false;
+    if (!first) sb.append(", ");
+    sb.append("num_rows:");
+    sb.append(this.num_rows);
+    first = false;
+    if (!first) sb.append(", ");
+    sb.append("has_more:");
+    sb.append(this.has_more);
+    first = false;
+    sb.append(")");
+    return sb.toString();
+  }
+
+  public void validate() throws TException {
+    // check for required fields
+    // check that fields of type enum have valid values
+  }
+
+}
+
@@ -25,6 +25,7 @@ public class Query implements TBase, java.io.Serializable, Cloneable {
   private static final TField CONFIGURATION_FIELD_DESC = new TField("configuration", TType.LIST, (short)3);
   private static final TField HADOOP_USER_FIELD_DESC = new TField("hadoop_user", TType.STRING, (short)4);
   private static final TField HADOOP_GROUPS_FIELD_DESC = new TField("hadoop_groups", TType.LIST, (short)5);
+  private static final TField BYPASS_CACHE_FIELD_DESC = new TField("bypass_cache", TType.BOOL, (short)6);
 
   public String query;
   public static final int QUERY = 1;
@@ -34,9 +35,12 @@ public class Query implements TBase, java.io.Serializable, Cloneable {
   public static final int HADOOP_USER = 4;
   public List<String> hadoop_groups;
   public static final int HADOOP_GROUPS = 5;
+  public boolean bypass_cache;
+  public static final int BYPASS_CACHE = 6;
 
   private final Isset __isset = new Isset();
   private static final class Isset implements java.io.Serializable {
+    public boolean bypass_cache = false;
   }
 
   public static final Map<Integer, FieldMetaData> metaDataMap = Collections.unmodifiableMap(new HashMap<Integer, FieldMetaData>() {{
@@ -50,6 +54,8 @@ public class Query implements TBase, java.io.Serializable, Cloneable {
     put(HADOOP_GROUPS, new FieldMetaData("hadoop_groups", TFieldRequirementType.DEFAULT, 
         new ListMetaData(TType.LIST, 
             new FieldValueMetaData(TType.STRING))));
+    put(BYPASS_CACHE, new FieldMetaData("bypass_cache", TFieldRequirementType.DEFAULT, 
+        new FieldValueMetaData(TType.BOOL)));
   }});
 
   static {
@@ -63,13 +69,16 @@ public class Query implements TBase, java.io.Serializable, Cloneable {
     String query,
     List<String> configuration,
     String hadoop_user,
-    List<String> hadoop_groups)
+    List<String> hadoop_groups,
+    boolean bypass_cache)
   {
     this();
     this.query = query;
     this.configuration = configuration;
     this.hadoop_user = hadoop_user;
     this.hadoop_groups = hadoop_groups;
+    this.bypass_cache = bypass_cache;
+    this.__isset.bypass_cache = true;
   }
 
   /**
@@ -96,6 +105,8 @@ public class Query implements TBase, java.io.Serializable, Cloneable {
       }
       this.hadoop_groups = __this__hadoop_groups;
     }
+    __isset.bypass_cache = other.__isset.bypass_cache;
+    this.bypass_cache = other.bypass_cache;
   }
 
   @Override
@@ -225,6 +236,28 @@ public class Query implements TBase, java.io.Serializable, Cloneable {
     }
   }
 
+  public boolean isBypass_cache() {
+    return this.bypass_cache;
+  }
+
+  public void setBypass_cache(boolean bypass_cache) {
+    this.bypass_cache = bypass_cache;
+    this.__isset.bypass_cache = true;
+  }
+
+  public void unsetBypass_cache() {
+    this.__isset.bypass_cache = false;
+  }
+
+  // Returns true if field bypass_cache is set (has been asigned a value) and false otherwise
+  public boolean isSetBypass_cache() {
+    return this.__isset.bypass_cache;
+  }
+
+  public void setBypass_cacheIsSet(boolean value) {
+    this.__isset.bypass_cache = value;
+  }
+
   public void setFieldValue(int fieldID, Object value) {
     switch (fieldID) {
     case QUERY:
@@ -259,6 +292,14 @@ public class Query implements TBase, java.io.Serializable, Cloneable {
       }
       break;
 
+    case BYPASS_CACHE:
+      if (value == null) {
+        unsetBypass_cache();
+      } else {
+        setBypass_cache((Boolean)value);
+      }
+      break;
+
     default:
       throw new IllegalArgumentException("Field " + fieldID + " doesn't exist!");
     }
@@ -278,6 +319,9 @@ public class Query implements TBase, java.io.Serializable, Cloneable {
     case HADOOP_GROUPS:
       return getHadoop_groups();
 
+    case BYPASS_CACHE:
+      return new Boolean(isBypass_cache());
+
     default:
       throw new IllegalArgumentException("Field " + fieldID + " doesn't exist!");
     }
@@ -294,6 +338,8 @@ public class Query implements TBase, java.io.Serializable, Cloneable {
       return isSetHadoop_user();
     case HADOOP_GROUPS:
       return isSetHadoop_groups();
+    case BYPASS_CACHE:
+      return isSetBypass_cache();
     default:
       throw new IllegalArgumentException("Field " + fieldID + " doesn't exist!");
     }
@@ -348,6 +394,15 @@ public class Query implements TBase, java.io.Serializable, Cloneable {
         return false;
     }
 
+    boolean this_present_bypass_cache = true;
+    boolean that_present_bypass_cache = true;
+    if (this_present_bypass_cache || that_present_bypass_cache) {
+      if (!(this_present_bypass_cache && that_present_bypass_cache))
+        return false;
+      if (this.bypass_cache != that.bypass_cache)
+        return false;
+    }
+
     return true;
   }
 
@@ -375,6 +430,11 @@ public class Query implements TBase, java.io.Serializable, Cloneable {
     if (present_hadoop_groups)
       builder.append(hadoop_groups);
 
+    boolean present_bypass_cache = true;
+    builder.append(present_bypass_cache);
+    if (present_bypass_cache)
+      builder.append(bypass_cache);
+
     return builder.toHashCode();
   }
 
@@ -437,6 +497,14 @@ public class Query implements TBase, java.io.Serializable, Cloneable {
             TProtocolUtil.skip(iprot, field.type);
           }
           break;
+        case BYPASS_CACHE:
+          if (field.type == TType.BOOL) {
+            this.bypass_cache = iprot.readBool();
+            this.__isset.bypass_cache = true;
+          } else { 
+            TProtocolUtil.skip(iprot, field.type);
+          }
+          break;
         default:
           TProtocolUtil.skip(iprot, field.type);
           break;
@@ -486,6 +554,9 @@ public class Query implements TBase, java.io.Serializable, Cloneable {
       }
       oprot.writeFieldEnd();
     }
+    oprot.writeFieldBegin(BYPASS_CACHE_FIELD_DESC);
+    oprot.writeBool(this.bypass_cache);
+    oprot.writeFieldEnd();
     oprot.writeFieldStop();
     oprot.writeStructEnd();
   }
@@ -526,6 +597,10 @@ public class Query implements TBase, java.io.Serializable, Cloneable {
       sb.append(this.hadoop_groups);
     }
     first = false;
+    if (!first) sb.append(", ");
+    sb.append("bypass_cache:");
+    sb.append(this.bypass_cache);
+    first = false;
     sb.append(")");
     return sb.toString();
   }
@@ -27,15 +27,19 @@ import java.text.SimpleDateFormat;
 import java.util.ArrayList;
 import java.util.Collections;
 import java.util.Date;
+import java.util.Iterator;
 import java.util.List;
 import java.util.Map;
 import java.util.Properties;
+import java.util.TreeMap;
 import java.util.UUID;
 import java.util.Vector;
 import java.util.Map.Entry;
 import java.util.concurrent.ConcurrentHashMap;
 import java.util.concurrent.ExecutorService;
 import java.util.concurrent.Executors;
+import java.util.regex.Matcher;
+import java.util.regex.Pattern;
 
 import org.apache.hadoop.fs.Path;
 import org.apache.hadoop.hive.conf.HiveConf;
@@ -43,7 +47,10 @@ import org.apache.hadoop.hive.metastore.api.FieldSchema;
 import org.apache.hadoop.hive.metastore.api.Schema;
 import org.apache.hadoop.hive.ql.Driver;
 import org.apache.hadoop.hive.ql.exec.FetchTask;
+import org.apache.hadoop.hive.ql.exec.FunctionInfo;
+import org.apache.hadoop.hive.ql.exec.FunctionRegistry;
 import org.apache.hadoop.hive.ql.exec.Utilities;
+import org.apache.hadoop.hive.ql.hooks.ReadEntity;
 import org.apache.hadoop.hive.ql.metadata.Hive;
 import org.apache.hadoop.hive.ql.metadata.HiveException;
 import org.apache.hadoop.hive.ql.parse.BaseSemanticAnalyzer;
@@ -55,12 +62,15 @@ import org.apache.hadoop.hive.ql.processors.CommandProcessorFactory;
 import org.apache.hadoop.hive.ql.QueryPlan;
 import org.apache.hadoop.hive.ql.session.SessionState;
 import org.apache.hadoop.hive.serde.Constants;
+import org.apache.hadoop.mapred.JobConf;
 import org.apache.hadoop.security.UnixUserGroupInformation;
 import org.apache.log4j.Logger;
 import org.apache.thrift.TException;
 
 import com.cloudera.beeswax.api.BeeswaxException;
 import com.cloudera.beeswax.api.BeeswaxService;
+import com.cloudera.beeswax.api.ColumnValues;
+import com.cloudera.beeswax.api.ColumnarResults;
 import com.cloudera.beeswax.api.ConfigVariable;
 import com.cloudera.beeswax.api.Query;
 import com.cloudera.beeswax.api.QueryExplanation;
@@ -88,6 +98,35 @@ public class BeeswaxServiceImpl implements BeeswaxService.Iface {
   private static final long RUNNING_QUERY_LIFETIME = 7*24*60*60*1000;  // 1 week
   private static final long EVICTION_INTERVAL = 3*60*60*1000;  // 3 hours
   private static final String NOTIFY_URL_BASE = "/beeswax/query_cb/done/";
+  // Number of rows returned by fetch(), like Hive's default
+  private static final int DEFAULT_FETCH_ROWS = 100;
+  // Upper bound on the number of rows returned by fetch_rows()
+  private static final int MAX_FETCH_ROWS = 10000;
+  // Number of readers of the results of a query, of each kind, kept at a time
+  private static final int MAX_READERS = 4;
+  // Readers of results unused for longer than this are closed, checked
+  // every READER_EXPIRY_INTERVAL.
+  private static final long READER_IDLE_TIME = 5*60*1000;  // 5 minutes
+  private static final long READER_EXPIRY_INTERVAL = 60*1000;  // 1 minute
+  // Number of result sets kept by the result cache. 0 disables the cache.
+  private static final String RESULT_CACHE_SIZE_KEY = "beeswax.result.cache.size";
+  private static final int DEFAULT_RESULT_CACHE_SIZE = 100;
+  // Queries reading more tables and partitions than this are not cached:
+  // versioning the inputs takes three NameNode calls for each of them.
+  private static final String RESULT_CACHE_MAX_INPUTS_KEY = "beeswax.result.cache.max.inputs";
+  private static final int DEFAULT_RESULT_CACHE_MAX_INPUTS = 100;
+  // Calls to functions, whose results may change from a run to the next.
+  private static final Pattern FUNCTION_CALL = Pattern.compile("\\b(\\w+)\\s*\\(");
+  // Scripts (TRANSFORM ... USING 'script'), and the definition of functions
+  // in the configuration of a query. Such queries are not cached.
+  private static final Pattern SCRIPT = Pattern.compile(
+      "\\busing\\s+['\"]", Pattern.CASE_INSENSITIVE);
+  private static final Pattern CREATE_FUNCTION = Pattern.compile(
+      "^\\s*create\\s+temporary\\s+function\\b", Pattern.CASE_INSENSITIVE);
+
+  // The results of finished queries, by query, user, configuration and
+  // version of the inputs.
+  private ResultCache<RunningQueryState> resultCache;
 
   private static Logger LOG = Logger.getLogger(BeeswaxServiceImpl.class.getName());
 
@@ -110,7 +149,24 @@ public class BeeswaxServiceImpl implements BeeswaxService.Iface {
     private Driver driver;
     private ByteArrayOutputStream errStream = new ByteArrayOutputStream();
     private ByteArrayOutputStream outStream = new ByteArrayOutputStream();
-    private long startRow = 0;
+    // Guards the lists of readers of the results, and nextRow,
+    // independently of the query state. Each reader is guarded by itself.
+    private final Object fetchLock = new Object();
+    // Readers of the results, each with a buffer and a position of its own,
+    // so that concurrent clients reading different rows don't rewind each
+    // other. Readers of rows as tab-separated strings, for fetch_rows()...
+    private final List<TextRowBuffer> textReaders = new ArrayList<TextRowBuffer>();
+    // ...and as typed values, for fetch_columns().
+    private final List<ValueRowBuffer> valueReaders = new ArrayList<ValueRowBuffer>();
+    // If set, the results of this query are those of an identical query,
+    // found in the result cache.
+    private RunningQueryState cachedResults = null;
+    // If set, the key of the results of this query in the result cache,
+    // and the version of the results when they were cached.
+    private String cacheKey = null;
+    private String resultsVersion = null;
+    // Row following the last one returned, where fetch() resumes.
+    private long nextRow = 0;
     private HiveConf hiveConf = null;
     private final Query query;
     private long atime = 0;
@@ -287,11 +343,31 @@ public class BeeswaxServiceImpl implements BeeswaxService.Iface {
         assertState(QueryState.COMPILED);
         state = QueryState.RUNNING;
       }
-      int ret = driver.execute();
+      // The result cache is an optimization: if anything goes wrong with
+      // it, the query runs (or its results go uncached) as if it was off.
+      String key = null;
+      RunningQueryState cached = null;
+      try {
+        key = makeCacheKey();
+        cached = findCachedResults(key);
+      } catch (RuntimeException e) {
+        LOG.warn("Not using the result cache for " + this, e);
+        key = null;
+        cached = null;
+      }
+      int ret;
+      if (cached != null) {
+        LOG.info("Using the results of " + cached + " for " + this);
+        sessionState.out.println("Using the cached results of an identical query");
+        ret = 0;
+      } else {
+        ret = driver.execute();
+      }
       try {
         synchronized (this) {
           assertState(QueryState.RUNNING);
           if (ret == 0) {
+            cachedResults = cached;
             state = QueryState.FINISHED;
           } else {
             throwException(new BeeswaxException("Driver returned: " + ret
@@ -299,45 +375,313 @@ public class BeeswaxServiceImpl implements BeeswaxService.Iface {
                 this.handle));
           }
         }
+        if (cached == null && key != null) {
+          try {
+            cacheResults(key);
+          } catch (RuntimeException e) {
+            LOG.warn("Not caching the results of " + this, e);
+          }
+        }
       } finally {
         notifyDone(this);
       }
     }
 
-    public void bringUp() {
-      SessionState.start(this.sessionState);
+    /**
+     * The key of the results of this query in the result cache, or null if
+     * they are not to be cached: the cache is bypassed, or the query doesn't
+     * return results, writes anything, or may return other results when run
+     * again on the same inputs.
+     */
+    private String makeCacheKey() {
+      if (!resultCache.isEnabled() || query.bypass_cache) {
+        return null;
+      }
+      BaseSemanticAnalyzer sem = driver.getPlan().getPlan();
+      if (sem.getFetchTask() == null || sem.getInputs().isEmpty() ||
+          !sem.getOutputs().isEmpty() ||
+          sem.getInputs().size() > hiveConf.getInt(RESULT_CACHE_MAX_INPUTS_KEY,
+                                                   DEFAULT_RESULT_CACHE_MAX_INPUTS)) {
+        return null;
+      }
+      String hql = ResultCache.normalizeQuery(query.query);
+      if (SCRIPT.matcher(hql).find() || !isDeterministic(hql)) {
+        return null;
+      }
+      for (String cmd : query.configuration) {
+        if (CREATE_FUNCTION.matcher(cmd).find()) {
+          return null;
+        }
+      }
+
+      StringBuilder key = new StringBuilder(hql);
+      key.append('\n').append(hiveConf.get(UnixUserGroupInformation.UGI_PROPERTY_NAME));
+      for (String cmd : query.configuration) {
+        key.append('\n').append(cmd.trim());
+      }
+      // The tables and partitions read, with their parameters (which hold
+      // the time of their last DDL), and the version of their files. This
+      // takes three NameNode calls per input, hence the cap on inputs above.
+      List<String> inputs = new ArrayList<String>();
+      try {
+        for (Object o : sem.getInputs()) {
+          ReadEntity input = (ReadEntity) o;
+          Map<String, String> params = new TreeMap<String, String>();
+          if (input.getParameters() != null) {
+            params.putAll(input.getParameters());
+          }
+          inputs.add(input + " " + params + " " +
+              ResultCache.getVersion(new Path(input.getLocation()), hiveConf));
+        }
+      } catch (IOException e) {
+        LOG.warn("Not caching the results of " + this, e);
+        return null;
+      }
+      Collections.sort(inputs);
+      for (String input : inputs) {
+        key.append('\n').append(input);
+      }
+      return key.toString();
     }
 
-    private void materializeResults(Results r, boolean startOver) throws IOException {
-      if (driver.getPlan().getPlan().getFetchTask() == null) {
-        // This query is never going to return anything.
-        r.has_more = false;
-        r.setData(Collections.<String>emptyList());
-        r.setColumns(Collections.<String>emptyList());
+    /**
+     * Whether the functions called by a query are all deterministic,
+     * according to their @UDFType annotation. Names that aren't those of
+     * functions (e.g. IN or AS) are ignored.
+     */
+    private boolean isDeterministic(String hql) {
+      Matcher m = FUNCTION_CALL.matcher(hql);
+      while (m.find()) {
+        FunctionInfo info = FunctionRegistry.getFunctionInfo(m.group(1).toLowerCase());
+        if (info != null && info.getGenericUDF() != null &&
+            !FunctionRegistry.isDeterministic(info.getGenericUDF())) {
+          return false;
+        }
+      }
+      return true;
+    }
+
+    /**
+     * The version of the result files, which changes if they're moved away,
+     * e.g. to save them.
+     */
+    private String getResultsVersion() throws IOException {
+      fetchWork work = getFetchWork();
+      if (work.getTblDir() != null) {
+        return ResultCache.getVersion(work.getTblDirPath(), hiveConf);
+      }
+      StringBuilder sb = new StringBuilder();
+      for (Object dir : work.getPartDirPath()) {
+        sb.append(ResultCache.getVersion((Path) dir, hiveConf)).append('\n');
+      }
+      return sb.toString();
+    }
+
+    private void cacheResults(String key) {
+      try {
+        resultsVersion = getResultsVersion();
+      } catch (IOException e) {
+        LOG.warn("Not caching the results of " + this, e);
         return;
       }
+      cacheKey = key;
+      resultCache.put(key, this);
+    }
 
-      if (startOver) {
-        // This is totally inappropriately reaching into internals.
-        driver.getPlan().getPlan().getFetchTask().initialize(hiveConf,
-            driver.getPlan());
-        startRow = 0;
+    /**
+     * The query whose results are cached under key, if they're still there.
+     */
+    private RunningQueryState findCachedResults(String key) {
+      if (key == null) {
+        return null;
       }
-      Vector<String> v = new Vector<String>();
-      r.setData(v);
-      r.has_more = driver.getResults(v);
-      r.start_row = startRow;
-      startRow += v.size();
+      RunningQueryState cached = resultCache.get(key);
+      if (cached == null) {
+        return null;
+      }
+      boolean valid;
+      try {
+        valid = runningQueries.get(cached.handle.id) == cached &&
+            cached.resultsVersion.equals(cached.getResultsVersion());
+      } catch (IOException e) {
+        LOG.warn("Failed to check the results of " + cached, e);
+        valid = false;
+      }
+      if (!valid) {
+        resultCache.remove(key, cached);
+        return null;
+      }
+      // Keep the cached query from being evicted while its results are used.
+      cached.atime = System.currentTimeMillis();
+      return cached;
+    }
+
+    public String getCacheKey() {
+      return cacheKey;
+    }
 
-      r.setColumns(new ArrayList<String>());
+    public void bringUp() {
+      SessionState.start(this.sessionState);
+    }
+
+    /**
+     * The names of the columns of the results.
+     */
+    private List<String> getColumnNames() {
+      List<String> columns = new ArrayList<String>();
       try {
         for (FieldSchema f : driver.getSchema().getFieldSchemas()) {
-          r.addToColumns(f.getName());
+          columns.add(f.getName());
         }
       } catch (Exception e) {
         // An empty partitioned table may not have table description
         LOG.error("Error getting column names of results.", e);
       }
+      return columns;
+    }
+
+    /**
+     * Pick the reader to read from startRow: one whose buffer holds startRow,
+     * or ends right before it. Returns null if there is none. Call while
+     * holding fetchLock.
+     */
+    private <B extends RowBuffer<?>> B pickReader(List<B> readers, long startRow) {
+      for (B reader : readers) {
+        if (reader.getStart() <= startRow && startRow <= reader.getEnd()) {
+          // So that closeReaders() doesn't expire it before it is used
+          reader.touch();
+          return reader;
+        }
+      }
+      return null;
+    }
+
+    /**
+     * Make room for a new reader: if there are MAX_READERS readers already,
+     * remove the least recently used one and return it, for the caller to
+     * close once it has released fetchLock. Call while holding fetchLock.
+     */
+    private <B extends RowBuffer<?>> B retireReader(List<B> readers) {
+      if (readers.size() < MAX_READERS) {
+        return null;
+      }
+      B lru = null;
+      for (B reader : readers) {
+        if (lru == null || reader.getAtime() < lru.getAtime()) {
+          lru = reader;
+        }
+      }
+      readers.remove(lru);
+      return lru;
+    }
+
+    /**
+     * Release the result files held open by a reader. A fetch still using
+     * the reader reads from the first row again.
+     */
+    private void closeReader(RowBuffer<?> reader) {
+      if (reader == null) {
+        return;
+      }
+      synchronized (reader) {
+        try {
+          reader.close();
+        } catch (IOException e) {
+          LOG.warn("Failed to close a reader of the results of " + this, e);
+        }
+      }
+    }
+
+    /**
+     * Close the readers of the results last used before idleSince, or all
+     * of them (e.g. when the query is evicted) if idleSince is
+     * Long.MAX_VALUE.
+     */
+    public void closeReaders(long idleSince) {
+      List<RowBuffer<?>> readers = new ArrayList<RowBuffer<?>>();
+      synchronized (fetchLock) {
+        removeIdleReaders(textReaders, idleSince, readers);
+        removeIdleReaders(valueReaders, idleSince, readers);
+      }
+      for (RowBuffer<?> reader : readers) {
+        closeReader(reader);
+      }
+    }
+
+    private <B extends RowBuffer<?>> void removeIdleReaders(
+        List<B> readers, long idleSince, List<RowBuffer<?>> removed) {
+      Iterator<B> it = readers.iterator();
+      while (it.hasNext()) {
+        B reader = it.next();
+        if (reader.getAtime() < idleSince) {
+          it.remove();
+          removed.add(reader);
+        }
+      }
+    }
+
+    private TextRowBuffer getTextReader(fetchWork work, long startRow) throws IOException {
+      TextRowBuffer reader;
+      TextRowBuffer retired = null;
+      synchronized (fetchLock) {
+        reader = pickReader(textReaders, startRow);
+        if (reader == null) {
+          reader = new TextRowBuffer(work, new JobConf(hiveConf), MAX_FETCH_ROWS);
+          retired = retireReader(textReaders);
+          textReaders.add(reader);
+        }
+      }
+      closeReader(retired);
+      return reader;
+    }
+
+    private ValueRowBuffer getValueReader(fetchWork work, long startRow) throws IOException {
+      ValueRowBuffer reader;
+      ValueRowBuffer retired = null;
+      synchronized (fetchLock) {
+        reader = pickReader(valueReaders, startRow);
+        if (reader == null) {
+          reader = new ValueRowBuffer(work, new JobConf(hiveConf), MAX_FETCH_ROWS);
+          retired = retireReader(valueReaders);
+          valueReaders.add(reader);
+        }
+      }
+      closeReader(retired);
+      return reader;
+    }
+
+    /**
+     * Read the rows of a reader up to toRow in the background, so that they're
+     * ready for the next fetch. At most one read-ahead of a reader is pending
+     * at a time.
+     */
+    private void readAhead(final RowBuffer<?> reader, final long toRow) {
+      synchronized (reader) {
+        if (reader.isReadAheadPending() || !reader.sourceHasMore()) {
+          return;
+        }
+        reader.setReadAheadPending(true);
+      }
+      final RunningQueryState state = this;
+      executor.submit(new Runnable() {
+        @Override
+        public void run() {
+          try {
+            logContext.registerCurrentThread();
+            state.bringUp();
+            synchronized (reader) {
+              reader.fillTo(toRow);
+            }
+          } catch (Throwable t) {
+            // The next fetch reads the rows itself, and reports the error.
+            LOG.error("Exception while reading ahead the results of " + state, t);
+          } finally {
+            synchronized (reader) {
+              reader.setReadAheadPending(false);
+            }
+          }
+        }
+      });
     }
 
     /**
@@ -372,6 +716,9 @@ public class BeeswaxServiceImpl implements BeeswaxService.Iface {
      * Get the fetchWork. Only SELECTs have them.
      */
     synchronized private fetchWork getFetchWork() {
+      if (cachedResults != null) {
+        return cachedResults.getFetchWork();
+      }
       QueryPlan plan = driver.getPlan();
       FetchTask fetchTask = null;
       if (plan != null) {
@@ -426,30 +773,114 @@ public class BeeswaxServiceImpl implements BeeswaxService.Iface {
     }
 
     public Results fetch(boolean fromBeginning) throws BeeswaxException {
+      long startRow;
+      synchronized (fetchLock) {
+        startRow = fromBeginning ? 0 : nextRow;
+      }
+      return fetchRows(startRow, DEFAULT_FETCH_ROWS);
+    }
+
+    /**
+     * Whether the results are ready to be fetched. Throws the exception of
+     * the query if it failed.
+     */
+    private boolean checkResultsReady() throws BeeswaxException {
       this.atime = System.currentTimeMillis();
-      Results r = new Results();
-      // Only one person can access a running query at a time.
+      // The state lock is only held to check the state, so that get_state()
+      // and friends don't wait for a fetch to read its rows.
       synchronized(this) {
         switch(state) {
-        case QueryState.RUNNING:
-          r.ready = false;
-          break;
         case QueryState.FINISHED:
-          bringUp();
-          r.ready = true;
-          try {
-            materializeResults(r, fromBeginning);
-          } catch (IOException e) {
-            throw new BeeswaxException(e.toString(), logContext.getName(), handle);
-          }
-          break;
+          return true;
         case QueryState.EXCEPTION:
           if (exception instanceof BeeswaxException) {
             throw (BeeswaxException) exception;
           } else {
             throw new BeeswaxException(exception.toString(), logContext.getName(), handle);
           }
+        default:
+          return false;
+        }
+      }
+    }
+
+    /**
+     * Get up to maxRows rows of the results, starting at row startRow.
+     * Concurrent calls for different rows are served by different readers.
+     */
+    public Results fetchRows(long startRow, int maxRows) throws BeeswaxException {
+      Results r = new Results();
+      if (!checkResultsReady()) {
+        r.ready = false;
+        return r;
+      }
+      r.ready = true;
+      r.start_row = startRow;
+      fetchWork work = getFetchWork();
+      if (work == null) {
+        // This query is never going to return anything.
+        r.has_more = false;
+        r.setData(Collections.<String>emptyList());
+        r.setColumns(Collections.<String>emptyList());
+        return r;
+      }
+      TextRowBuffer reader;
+      try {
+        reader = getTextReader(work, startRow);
+        synchronized (reader) {
+          bringUp();
+          List<String> rows = reader.get(startRow, maxRows);
+          r.setData(rows);
+          r.has_more = reader.hasMoreAfter(startRow + rows.size());
+        }
+      } catch (IOException e) {
+        throw new BeeswaxException(e.toString(), logContext.getName(), handle);
+      }
+      synchronized (fetchLock) {
+        nextRow = startRow + r.data.size();
+      }
+      r.setColumns(getColumnNames());
+      if (r.has_more) {
+        readAhead(reader, startRow + r.data.size() + maxRows);
+      }
+      return r;
+    }
+
+    /**
+     * Like fetchRows(), but returns the rows as columns of typed values.
+     */
+    public ColumnarResults fetchColumns(long startRow, int maxRows) throws BeeswaxException {
+      ColumnarResults r = new ColumnarResults();
+      if (!checkResultsReady()) {
+        r.ready = false;
+        return r;
+      }
+      r.ready = true;
+      r.start_row = startRow;
+      fetchWork work = getFetchWork();
+      if (work == null) {
+        // This query is never going to return anything.
+        r.has_more = false;
+        r.setColumns(Collections.<String>emptyList());
+        r.setValues(Collections.<ColumnValues>emptyList());
+        return r;
+      }
+      ValueRowBuffer reader;
+      try {
+        reader = getValueReader(work, startRow);
+        synchronized (reader) {
+          bringUp();
+          List<Object[]> rows = reader.get(startRow, maxRows);
+          r.setValues(reader.toColumns(rows));
+          r.num_rows = rows.size();
+          r.has_more = reader.hasMoreAfter(startRow + rows.size());
         }
+      } catch (IOException e) {
+        throw new BeeswaxException(e.toString(), logContext.getName(), handle);
+      }
+      r.setColumns(getColumnNames());
+      if (r.has_more) {
+        readAhead(reader, startRow + r.num_rows + maxRows);
       }
       return r;
     }
@@ -536,6 +967,8 @@ public class BeeswaxServiceImpl implements BeeswaxService.Iface {
     LogContext.initLogCapture();
     this.executor = Executors.newCachedThreadPool(new NamingThreadFactory("Beeswax-%d"));
     this.runningQueries = new ConcurrentHashMap<String, RunningQueryState>();
+    this.resultCache = new ResultCache<RunningQueryState>(
+        new HiveConf(Driver.class).getInt(RESULT_CACHE_SIZE_KEY, DEFAULT_RESULT_CACHE_SIZE));
 
     String protocol = dtHttps ? "https" : "http";
     this.notifyUrl = protocol + "://" + dtHost + ":" + dtPort + NOTIFY_URL_BASE;
@@ -551,6 +984,10 @@ public class BeeswaxServiceImpl implements BeeswaxService.Iface {
               if (rqState.getAtime() + RUNNING_QUERY_LIFETIME < now) {
                 String id = entry.getKey();
                 runningQueries.remove(id);
+                if (rqState.getCacheKey() != null) {
+                  resultCache.remove(rqState.getCacheKey(), rqState);
+                }
+                rqState.closeReaders(Long.MAX_VALUE);
                 LOG.debug("Removed " + rqState.toString());
                 Thread.yield();                 // be nice
               }
@@ -569,6 +1006,25 @@ public class BeeswaxServiceImpl implements BeeswaxService.Iface {
     }, "Evicter");
     evicter.setDaemon(true);
     evicter.start();
+
+    // A daemon thread that closes the readers of results nobody has
+    // fetched from lately, which hold open files and buffered rows.
+    Thread readerExpirer = new Thread(new Runnable() {
+        @Override
+        public void run() {
+          while (true) {
+            try {
+              Thread.sleep(READER_EXPIRY_INTERVAL);
+            } catch (InterruptedException e) { }
+            long idleSince = System.currentTimeMillis() - READER_IDLE_TIME;
+            for (RunningQueryState rqState : runningQueries.values()) {
+              rqState.closeReaders(idleSince);
+            }
+          }
+        }
+    }, "ReaderExpirer");
+    readerExpirer.setDaemon(true);
+    readerExpirer.start();
   }
 
   /**
@@ -668,6 +1124,57 @@ public class BeeswaxServiceImpl implements BeeswaxService.Iface {
     return res;
   }
 
+  /**
+   * Get up to maxRows rows of the results of a query, starting at row startRow.
+   * This is non-blocking. Caller should check Results.ready to determine if the
+   * results are in yet. The following rows are read ahead in the background.
+   *
+   * @param handle  The handle from query()
+   * @param startRow  The first row to return, counting from 0.
+   * @param maxRows  The number of rows to return, up to MAX_FETCH_ROWS.
+   */
+  @Override
+  public Results fetch_rows(QueryHandle handle, long startRow, int maxRows)
+      throws QueryNotFoundException, BeeswaxException {
+    LogContext.unregisterCurrentThread();
+    validateHandle(handle);
+    LogContext.registerCurrentThread(handle.log_context);
+    RunningQueryState state = runningQueries.get(handle.id);
+    if (state == null) {
+      throw new QueryNotFoundException();
+    }
+    if (startRow < 0 || maxRows <= 0) {
+      throw new BeeswaxException("Invalid rows: " + maxRows + " from row " + startRow,
+                                 handle.log_context, handle);
+    }
+    return state.fetchRows(startRow, Math.min(maxRows, MAX_FETCH_ROWS));
+  }
+
+  /**
+   * Like fetch_rows(), but returns the results as columns of typed values,
+   * rather than as rows of tab-separated strings.
+   *
+   * @param handle  The handle from query()
+   * @param startRow  The first row to return, counting from 0.
+   * @param maxRows  The number of rows to return, up to MAX_FETCH_ROWS.
+   */
+  @Override
+  public ColumnarResults fetch_columns(QueryHandle handle, long startRow, int maxRows)
+      throws QueryNotFoundException, BeeswaxException {
+    LogContext.unregisterCurrentThread();
+    validateHandle(handle);
+    LogContext.registerCurrentThread(handle.log_context);
+    RunningQueryState state = runningQueries.get(handle.id);
+    if (state == null) {
+      throw new QueryNotFoundException();
+    }
+    if (startRow < 0 || maxRows <= 0) {
+      throw new BeeswaxException("Invalid rows: " + maxRows + " from row " + startRow,
+                                 handle.log_context, handle);
+    }
+    return state.fetchColumns(startRow, Math.min(maxRows, MAX_FETCH_ROWS));
+  }
+
   @Override
   public String dump_config() throws TException {
     HiveConf c = new HiveConf();
@@ -733,6 +1240,27 @@ public class BeeswaxServiceImpl implements BeeswaxService.Iface {
     return lc.readLog();
   }
 
+  /**
+   * Get the log messages related to the context, from the given offset on.
+   *
+   * @param contextName The log context name
+   * @param startOffset The offset, in characters, to read the log from
+   * @return The log messages logged since the offset, as a string.
+   */
+  @Override
+  public String get_log_from(String contextName, long startOffset)
+      throws QueryNotFoundException, TException {
+    final boolean DONT_CREATE = false;
+    LogContext.unregisterCurrentThread();
+    if (contextName == null) {
+      throw new QueryNotFoundException();
+    }
+    LogContext lc = LogContext.getByName(contextName, DONT_CREATE);
+    if (lc == null)
+      throw new QueryNotFoundException();
+    return lc.readLog(startOffset);
+  }
+
   /*
    * This is similar in spirit to Hive's own SetProcessor
    */
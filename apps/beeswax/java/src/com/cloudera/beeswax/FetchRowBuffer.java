@@ -0,0 +1,98 @@
+// Licensed to Cloudera, Inc. under one
+// or more contributor license agreements.  See the NOTICE file
+// distributed with this work for additional information
+// regarding copyright ownership.  Cloudera, Inc. licenses this file
+// to you under the Apache License, Version 2.0 (the
+// "License"); you may not use this file except in compliance
+// with the License.  You may obtain a copy of the License at
+//
+//     http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+
+package com.cloudera.beeswax;
+
+import java.io.IOException;
+import java.util.List;
+
+import org.apache.hadoop.hive.ql.exec.FetchOperator;
+import org.apache.hadoop.hive.ql.metadata.HiveException;
+import org.apache.hadoop.hive.ql.plan.fetchWork;
+import org.apache.hadoop.hive.serde2.objectinspector.InspectableObject;
+import org.apache.hadoop.hive.serde2.objectinspector.ObjectInspector;
+import org.apache.hadoop.mapred.JobConf;
+
+/**
+ * The rows of the results of a query, read from the result files with a
+ * FetchOperator of their own. Each instance reads the results
+ * independently of the others, and of the Driver.
+ */
+abstract class FetchRowBuffer<T> extends RowBuffer<T> {
+  private final fetchWork work;
+  private final JobConf job;
+  private FetchOperator fetchOperator = null;
+  // Number of rows read by fetchOperator, to apply the LIMIT of the query
+  private int rowsRead = 0;
+
+  FetchRowBuffer(fetchWork work, JobConf job, int maxBatch) {
+    super(maxBatch);
+    this.work = work;
+    this.job = job;
+  }
+
+  /** Turns a row read by the FetchOperator into a row of the buffer. */
+  protected abstract T convert(InspectableObject row) throws IOException;
+
+  /** Releases the reader of the results; the next read opens a new one. */
+  @Override
+  protected void rewind() throws IOException {
+    if (fetchOperator != null) {
+      try {
+        fetchOperator.clearFetchContext();
+      } catch (HiveException e) {
+        throw new IOException(e.toString());
+      } finally {
+        fetchOperator = null;
+      }
+    }
+  }
+
+  private FetchOperator getFetchOperator() {
+    if (fetchOperator == null) {
+      fetchOperator = new FetchOperator(work, job);
+      rowsRead = 0;
+    }
+    return fetchOperator;
+  }
+
+  /** The ObjectInspector of the rows read by the FetchOperator. */
+  protected ObjectInspector getOutputObjectInspector() throws IOException {
+    try {
+      return getFetchOperator().getOutputObjectInspector();
+    } catch (HiveException e) {
+      throw new IOException(e.toString());
+    }
+  }
+
+  @Override
+  protected boolean read(List<T> rows, int n) throws IOException {
+    FetchOperator op = getFetchOperator();
+    int limit = work.getLimit();
+    for (int i = 0; i < n; i++) {
+      if (limit >= 0 && rowsRead >= limit) {
+        return false;
+      }
+      InspectableObject io = op.getNextRow();
+      if (io == null) {
+        return false;
+      }
+      rows.add(convert(io));
+      rowsRead++;
+    }
+    return true;
+  }
+}
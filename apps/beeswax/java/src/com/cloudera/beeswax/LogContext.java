@@ -54,7 +54,7 @@ public class LogContext {
   private static boolean lcIsInitialized = false;
 
   /** Where we keep the log */
-  private CharArrayWriter logStore;
+  private LogStore logStore;
 
   /** Name of the context */
   private String name;
@@ -62,6 +62,26 @@ public class LogContext {
   /** Creation time */
   private long createTime;
 
+  /**
+   * A CharArrayWriter that can return the chars written after an offset,
+   * without copying the chars before it.
+   */
+  private static class LogStore extends CharArrayWriter {
+    /**
+     * Return the chars written from the given offset on. Offsets past the
+     * end (e.g. after a reset) return an empty string.
+     */
+    public String toString(int start) {
+      if (start < 0) {
+        start = 0;
+      }
+      if (start >= count) {
+        return "";
+      }
+      return new String(buf, start, count - start);
+    }
+  }
+
   /**
    * The LogContextOutputStream helps translate a LogContext to an OutputStream.
    */
@@ -139,7 +159,7 @@ public class LogContext {
    */
   private LogContext(String name) {
     this.name = name;
-    this.logStore = new CharArrayWriter();
+    this.logStore = new LogStore();
     this.createTime = System.currentTimeMillis();
   }
 
@@ -249,6 +269,15 @@ public class LogContext {
     }
   }
 
+  /**
+   * Retrieve the log stored from the given character offset on
+   */
+  public String readLog(long start) {
+    synchronized (this.logStore) {
+      return this.logStore.toString((int) Math.min(start, Integer.MAX_VALUE));
+    }
+  }
+
   /**
    * Reset the log stored
    */
@@ -0,0 +1,133 @@
+// Licensed to Cloudera, Inc. under one
+// or more contributor license agreements.  See the NOTICE file
+// distributed with this work for additional information
+// regarding copyright ownership.  Cloudera, Inc. licenses this file
+// to you under the Apache License, Version 2.0 (the
+// "License"); you may not use this file except in compliance
+// with the License.  You may obtain a copy of the License at
+//
+//     http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+
+package com.cloudera.beeswax;
+
+import java.io.IOException;
+import java.util.Arrays;
+import java.util.LinkedHashMap;
+import java.util.Map;
+
+import org.apache.hadoop.conf.Configuration;
+import org.apache.hadoop.fs.FileStatus;
+import org.apache.hadoop.fs.FileSystem;
+import org.apache.hadoop.fs.Path;
+
+/**
+ * A size-bounded cache of the results of queries, keyed by a string that
+ * identifies the query and the version of its inputs. The least recently
+ * used entry is evicted first.
+ */
+class ResultCache<V> {
+  private final int maxEntries;
+  private final LinkedHashMap<String, V> entries;
+
+  ResultCache(final int maxEntries) {
+    this.maxEntries = maxEntries;
+    // An access-ordered map, so that the eldest entry is the least recently used
+    this.entries = new LinkedHashMap<String, V>(16, 0.75f, true) {
+      @Override
+      protected boolean removeEldestEntry(Map.Entry<String, V> eldest) {
+        return size() > maxEntries;
+      }
+    };
+  }
+
+  /** Whether the cache holds anything at all. A size of 0 disables it. */
+  public boolean isEnabled() {
+    return maxEntries > 0;
+  }
+
+  synchronized public V get(String key) {
+    return entries.get(key);
+  }
+
+  synchronized public void put(String key, V value) {
+    if (isEnabled()) {
+      entries.put(key, value);
+    }
+  }
+
+  /** Removes the entry of key, if its value is still value. */
+  synchronized public void remove(String key, V value) {
+    if (entries.get(key) == value) {
+      entries.remove(key);
+    }
+  }
+
+  /**
+   * Normalizes the text of a query: collapses the whitespace outside of
+   * quotes, and drops the trailing semicolon.
+   */
+  public static String normalizeQuery(String query) {
+    StringBuilder sb = new StringBuilder(query.length());
+    char quote = 0;
+    boolean space = false;
+    for (int i = 0; i < query.length(); i++) {
+      char c = query.charAt(i);
+      if (quote != 0) {
+        sb.append(c);
+        if (c == '\\' && i + 1 < query.length()) {
+          sb.append(query.charAt(++i));
+        } else if (c == quote) {
+          quote = 0;
+        }
+      } else if (Character.isWhitespace(c)) {
+        space = true;
+      } else {
+        if (space && sb.length() > 0) {
+          sb.append(' ');
+        }
+        space = false;
+        sb.append(c);
+        if (c == '\'' || c == '"' || c == '`') {
+          quote = c;
+        }
+      }
+    }
+    int end = sb.length();
+    while (end > 0 && sb.charAt(end - 1) == ';') {
+      end--;
+    }
+    return sb.substring(0, end).trim();
+  }
+
+  /**
+   * The version of the files under a directory, as a string that changes when
+   * files are added, removed or replaced: the modification time of the
+   * directory, and the name, length and modification time of each file.
+   * Takes three NameNode calls: exists(), getFileStatus() and listStatus().
+   */
+  public static String getVersion(Path dir, Configuration conf) throws IOException {
+    FileSystem fs = dir.getFileSystem(conf);
+    if (!fs.exists(dir)) {
+      return "none";
+    }
+    StringBuilder sb = new StringBuilder();
+    sb.append(fs.getFileStatus(dir).getModificationTime());
+    FileStatus[] files = fs.listStatus(dir);
+    if (files != null) {
+      // FileStatus is Comparable, by path.
+      Arrays.sort(files);
+      for (FileStatus file : files) {
+        sb.append(';').append(file.getPath().getName());
+        sb.append(',').append(file.getLen());
+        sb.append(',').append(file.getModificationTime());
+      }
+    }
+    return sb.toString();
+  }
+}
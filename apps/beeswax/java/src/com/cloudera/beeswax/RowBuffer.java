@@ -0,0 +1,163 @@
+// Licensed to Cloudera, Inc. under one
+// or more contributor license agreements.  See the NOTICE file
+// distributed with this work for additional information
+// regarding copyright ownership.  Cloudera, Inc. licenses this file
+// to you under the Apache License, Version 2.0 (the
+// "License"); you may not use this file except in compliance
+// with the License.  You may obtain a copy of the License at
+//
+//     http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+
+package com.cloudera.beeswax;
+
+import java.io.IOException;
+import java.util.ArrayList;
+import java.util.Iterator;
+import java.util.LinkedList;
+import java.util.List;
+
+/**
+ * The rows of the results of a query, read in order from a source and kept
+ * from row bufferStart on, so that rows can be read ahead, and fetched again.
+ * Asking for a row before the buffer rewinds the source.
+ *
+ * Not thread-safe: the callers synchronize on the buffer.
+ */
+abstract class RowBuffer<T> {
+  private final LinkedList<T> buffer = new LinkedList<T>();
+  private volatile long bufferStart = 0;
+  private boolean sourceHasMore = true;
+  private boolean readAheadPending = false;
+  // Whether the buffer was closed, and not fetched from since
+  private boolean closed = false;
+  // When the buffer was last read from, to pick the one to reuse
+  private volatile long atime = 0;
+  // Upper bound on the number of rows read from the source at once
+  private final int maxBatch;
+
+  RowBuffer(int maxBatch) {
+    this.maxBatch = maxBatch;
+    touch();
+  }
+
+  /** Go back to the first row of the source. */
+  protected abstract void rewind() throws IOException;
+
+  /**
+   * Append the next n rows of the source to rows.
+   * Returns false if the source has no more rows after them.
+   */
+  protected abstract boolean read(List<T> rows, int n) throws IOException;
+
+  /** Returns up to maxRows rows, starting at row startRow. */
+  public List<T> get(long startRow, int maxRows) throws IOException {
+    touch();
+    closed = false;
+    if (startRow < bufferStart) {
+      reset();
+    }
+    fill(startRow, startRow + maxRows);
+
+    List<T> rows = new ArrayList<T>(maxRows);
+    Iterator<T> it = buffer.iterator();
+    while (rows.size() < maxRows && it.hasNext()) {
+      rows.add(it.next());
+    }
+    return rows;
+  }
+
+  /**
+   * Release the source and drop the buffered rows. Pending read-aheads
+   * are skipped. If the buffer is fetched from again, it reads from the
+   * first row of the source.
+   */
+  public void close() throws IOException {
+    reset();
+    closed = true;
+  }
+
+  private void reset() throws IOException {
+    rewind();
+    buffer.clear();
+    bufferStart = 0;
+    sourceHasMore = true;
+  }
+
+  /** Whether there are rows after row (exclusive). */
+  public boolean hasMoreAfter(long row) {
+    return sourceHasMore || row < bufferStart + buffer.size();
+  }
+
+  /** The first buffered row. */
+  public long getStart() {
+    return bufferStart;
+  }
+
+  /** The row following the last buffered one. */
+  public long getEnd() {
+    return bufferStart + buffer.size();
+  }
+
+  public long getAtime() {
+    return atime;
+  }
+
+  /** Marks the buffer as used now, e.g. when it is picked for a fetch. */
+  public void touch() {
+    atime = System.currentTimeMillis();
+  }
+
+  /** Whether a read-ahead of the buffer is pending. */
+  public boolean isReadAheadPending() {
+    return readAheadPending;
+  }
+
+  public void setReadAheadPending(boolean readAheadPending) {
+    this.readAheadPending = readAheadPending;
+  }
+
+  /** Whether rows past the buffer are left to read. */
+  public boolean sourceHasMore() {
+    return sourceHasMore;
+  }
+
+  /**
+   * Read from the source until the buffer reaches toRow, keeping the rows
+   * already buffered. Does nothing if the buffer is closed.
+   */
+  public void fillTo(long toRow) throws IOException {
+    if (closed) {
+      return;
+    }
+    fill(bufferStart, toRow);
+  }
+
+  /**
+   * Drop the buffered rows before fromRow, then read from the source
+   * until the buffer reaches toRow or the rows are exhausted.
+   */
+  public void fill(long fromRow, long toRow) throws IOException {
+    while (true) {
+      while (bufferStart < fromRow && !buffer.isEmpty()) {
+        buffer.removeFirst();
+        bufferStart++;
+      }
+      long bufferEnd = bufferStart + buffer.size();
+      if (!sourceHasMore || bufferEnd >= toRow) {
+        return;
+      }
+      // Rows before fromRow are read and dropped in batches of up to
+      // maxBatch.
+      int n = (int) Math.min(toRow - bufferEnd, maxBatch);
+      List<T> rows = new ArrayList<T>(n);
+      sourceHasMore = read(rows, n);
+      buffer.addAll(rows);
+    }
+  }
+}
@@ -0,0 +1,59 @@
+// Licensed to Cloudera, Inc. under one
+// or more contributor license agreements.  See the NOTICE file
+// distributed with this work for additional information
+// regarding copyright ownership.  Cloudera, Inc. licenses this file
+// to you under the Apache License, Version 2.0 (the
+// "License"); you may not use this file except in compliance
+// with the License.  You may obtain a copy of the License at
+//
+//     http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+
+package com.cloudera.beeswax;
+
+import java.io.IOException;
+import java.util.Properties;
+
+import org.apache.hadoop.hive.ql.exec.Utilities;
+import org.apache.hadoop.hive.ql.plan.fetchWork;
+import org.apache.hadoop.hive.serde.Constants;
+import org.apache.hadoop.hive.serde2.SerDeException;
+import org.apache.hadoop.hive.serde2.lazy.LazySimpleSerDe;
+import org.apache.hadoop.hive.serde2.objectinspector.InspectableObject;
+import org.apache.hadoop.mapred.JobConf;
+
+/**
+ * The rows of the results of a query as tab-separated strings, serialized
+ * the same way as the Driver's FetchTask does.
+ */
+class TextRowBuffer extends FetchRowBuffer<String> {
+  private final LazySimpleSerDe serde;
+
+  TextRowBuffer(fetchWork work, JobConf job, int maxBatch) throws IOException {
+    super(work, job, maxBatch);
+    serde = new LazySimpleSerDe();
+    Properties props = new Properties();
+    props.put(Constants.SERIALIZATION_FORMAT, "" + Utilities.tabCode);
+    props.put(Constants.SERIALIZATION_NULL_FORMAT, work.getSerializationNullFormat());
+    try {
+      serde.initialize(job, props);
+    } catch (SerDeException e) {
+      throw new IOException(e.toString());
+    }
+    serde.setUseJSONSerialize(true);
+  }
+
+  @Override
+  protected String convert(InspectableObject row) throws IOException {
+    try {
+      return serde.serialize(row.o, row.oi).toString();
+    } catch (SerDeException e) {
+      throw new IOException(e.toString());
+    }
+  }
+}
@@ -0,0 +1,170 @@
+// Licensed to Cloudera, Inc. under one
+// or more contributor license agreements.  See the NOTICE file
+// distributed with this work for additional information
+// regarding copyright ownership.  Cloudera, Inc. licenses this file
+// to you under the Apache License, Version 2.0 (the
+// "License"); you may not use this file except in compliance
+// with the License.  You may obtain a copy of the License at
+//
+//     http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+
+package com.cloudera.beeswax;
+
+import java.io.IOException;
+import java.util.ArrayList;
+import java.util.List;
+
+import org.apache.hadoop.hive.ql.plan.fetchWork;
+import org.apache.hadoop.hive.serde2.SerDeUtils;
+import org.apache.hadoop.hive.serde2.objectinspector.InspectableObject;
+import org.apache.hadoop.hive.serde2.objectinspector.ObjectInspector;
+import org.apache.hadoop.hive.serde2.objectinspector.PrimitiveObjectInspector;
+import org.apache.hadoop.hive.serde2.objectinspector.StructField;
+import org.apache.hadoop.hive.serde2.objectinspector.StructObjectInspector;
+import org.apache.hadoop.mapred.JobConf;
+
+import com.cloudera.beeswax.api.ColumnType;
+import com.cloudera.beeswax.api.ColumnValues;
+
+/**
+ * The rows of the results of a query as typed values, one Object per column:
+ * a Boolean, Long, Double or String (JSON for complex types), or null.
+ *
+ * Unlike the tab-separated strings of TextRowBuffer, these tell the tabs
+ * and the NULLs in the values apart.
+ */
+class ValueRowBuffer extends FetchRowBuffer<Object[]> {
+  private int[] types = null;
+
+  ValueRowBuffer(fetchWork work, JobConf job, int maxBatch) {
+    super(work, job, maxBatch);
+  }
+
+  @Override
+  protected Object[] convert(InspectableObject row) {
+    return toValues(row.o, (StructObjectInspector) row.oi);
+  }
+
+  /** The ColumnType of each column. */
+  public int[] getTypes() throws IOException {
+    if (types == null) {
+      StructObjectInspector soi = (StructObjectInspector) getOutputObjectInspector();
+      List<? extends StructField> fields = soi.getAllStructFieldRefs();
+      int[] t = new int[fields.size()];
+      for (int i = 0; i < t.length; i++) {
+        t[i] = columnType(fields.get(i).getFieldObjectInspector());
+      }
+      types = t;
+    }
+    return types;
+  }
+
+  private static int columnType(ObjectInspector oi) {
+    if (oi.getCategory() == ObjectInspector.Category.PRIMITIVE) {
+      switch (((PrimitiveObjectInspector) oi).getPrimitiveCategory()) {
+      case BOOLEAN:
+        return ColumnType.BOOLEAN;
+      case BYTE:
+      case SHORT:
+      case INT:
+      case LONG:
+        return ColumnType.LONG;
+      case FLOAT:
+      case DOUBLE:
+        return ColumnType.DOUBLE;
+      }
+    }
+    return ColumnType.STRING;
+  }
+
+  private static Object[] toValues(Object row, StructObjectInspector soi) {
+    List<? extends StructField> fields = soi.getAllStructFieldRefs();
+    Object[] values = new Object[fields.size()];
+    for (int i = 0; i < values.length; i++) {
+      StructField field = fields.get(i);
+      values[i] = toValue(soi.getStructFieldData(row, field), field.getFieldObjectInspector());
+    }
+    return values;
+  }
+
+  private static Object toValue(Object data, ObjectInspector oi) {
+    if (data == null) {
+      return null;
+    }
+    if (oi.getCategory() != ObjectInspector.Category.PRIMITIVE) {
+      return SerDeUtils.getJSONString(data, oi);
+    }
+    Object o = ((PrimitiveObjectInspector) oi).getPrimitiveJavaObject(data);
+    if (o == null) {
+      return null;
+    }
+    switch (columnType(oi)) {
+    case ColumnType.BOOLEAN:
+      return o;
+    case ColumnType.LONG:
+      return ((Number) o).longValue();
+    case ColumnType.DOUBLE:
+      // Go through the string of a float, so that 0.1f stays 0.1.
+      return (o instanceof Float) ? Double.valueOf(o.toString()) : (Double) o;
+    default:
+      return o.toString();
+    }
+  }
+
+  /**
+   * Turns rows into columns of values, of the types given by getTypes().
+   * A NULL value is flagged in the nulls bitmap of its column, and holds
+   * a placeholder in the list of values.
+   */
+  public List<ColumnValues> toColumns(List<Object[]> rows) throws IOException {
+    int[] t = getTypes();
+    int n = rows.size();
+    List<ColumnValues> columns = new ArrayList<ColumnValues>(t.length);
+    for (int c = 0; c < t.length; c++) {
+      ColumnValues column = new ColumnValues();
+      column.setType(t[c]);
+      byte[] nulls = new byte[(n + 7) / 8];
+      switch (t[c]) {
+      case ColumnType.BOOLEAN:
+        column.setBool_values(new ArrayList<Boolean>(n));
+        break;
+      case ColumnType.LONG:
+        column.setLong_values(new ArrayList<Long>(n));
+        break;
+      case ColumnType.DOUBLE:
+        column.setDouble_values(new ArrayList<Double>(n));
+        break;
+      default:
+        column.setString_values(new ArrayList<String>(n));
+      }
+      for (int i = 0; i < n; i++) {
+        Object v = rows.get(i)[c];
+        if (v == null) {
+          nulls[i / 8] |= 1 << (i % 8);
+        }
+        switch (t[c]) {
+        case ColumnType.BOOLEAN:
+          column.addToBool_values(v == null ? false : (Boolean) v);
+          break;
+        case ColumnType.LONG:
+          column.addToLong_values(v == null ? 0L : ((Number) v).longValue());
+          break;
+        case ColumnType.DOUBLE:
+          column.addToDouble_values(v == null ? 0.0 : ((Number) v).doubleValue());
+          break;
+        default:
+          column.addToString_values(v == null ? "" : v.toString());
+        }
+      }
+      column.setNulls(nulls);
+      columns.add(column);
+    }
+    return columns;
+  }
+}
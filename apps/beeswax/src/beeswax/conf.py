@@ -59,3 +59,10 @@ LOCAL_EXAMPLES_DATA_DIR = Config(
   key='local_examples_data_dir',
   default=os.path.join(os.path.dirname(__file__), "..", "..", "data"),
   help='The local filesystem path containing the beeswax examples')
+
+DOWNLOAD_FETCH_ROWS = Config(
+  key='download_fetch_rows',
+  help='Number of rows fetched from the beeswax server at a time when downloading '
+       'query results',
+  default=1000,
+  type=int)
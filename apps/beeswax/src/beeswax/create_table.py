@@ -364,9 +364,7 @@ def _peek_file(fs, file_form):
   """_peek_file(fs, file_form) -> (path, initial data)"""
   try:
     path = file_form.cleaned_data['path']
-    file_obj = fs.open(path)
-    file_head = file_obj.read(IMPORT_PEEK_SIZE)
-    file_obj.close()
+    file_head = fs.read(path, 0, IMPORT_PEEK_SIZE)
     return (path, file_head)
   except IOError, ex:
     msg = "Failed to open file '%s': %s" % (path, ex)
@@ -23,6 +23,7 @@ import time
 from django.http import HttpResponse
 
 from beeswax import common
+from beeswax import conf
 from beeswax import db_utils
 from beeswaxd.ttypes import QueryHandle
 
@@ -57,16 +58,21 @@ def download(query_model, format):
   return resp
 
 
-def data_generator(query_model, formatter):
+def data_generator(query_model, formatter, fetch_rows=None):
   """
-  data_generator(query_model, formatter) -> generator object
+  data_generator(query_model, formatter [,fetch_rows]) -> generator object
 
   Return a generator object for a csv. The first line is the column names.
 
-  This is similar to export_csvxls.generator, but has
-  one or two extra complexities.
+  The results are fetched ``fetch_rows`` rows at a time (``download_fetch_rows``
+  by default), each batch from an explicit row offset, so that other readers
+  of the same results don't interfere. The server reads the next batch ahead
+  while this one is formatted. The results come as columns of typed values,
+  which are formatted the way Hive prints them.
   """
   global _DATA_WAIT_SLEEP
+  if fetch_rows is None:
+    fetch_rows = conf.DOWNLOAD_FETCH_ROWS.get()
   is_first_row = True
   next_row = 0
   results = None
@@ -77,40 +83,26 @@ def data_generator(query_model, formatter):
   while True:
     # Make sure that we have the next batch of ready results
     while results is None or not results.ready:
-      results = db_utils.db_client().fetch(handle, start_over=is_first_row)
+      results = db_utils.db_client().fetch_columns(handle, next_row, fetch_rows)
       if not results.ready:
         time.sleep(_DATA_WAIT_SLEEP)
 
-    # Someone is reading the results concurrently. Abort.
-    # But unfortunately, this current generator will produce incomplete data.
-    if next_row != results.start_row:
-      msg = 'Error: Potentially incomplete results as an error occur during data retrieval.'
-      yield formatter.format_row([msg])
-      err = ('Detected another client retrieving results for %s. '
-             'Expect next row being %s and got %s. Aborting' %
-             (query_model.server_id, next_row, results.start_row))
-      LOG.error(err)
-      raise RuntimeError(err)
-
     if is_first_row:
       is_first_row = False
       yield formatter.format_header(results.columns)
-    else:
-      for i, row in enumerate(results.data):
-        # TODO(bc): Hive seems to always return tab delimited row data.
-        # What if a cell has a tab?
-        row = row.split('\t')
-        try:
-          yield formatter.format_row(row)
-        except TooBigToDownloadException, ex:
-          LOG.error(ex)
-          # Exceeded limit. Stop.
-          results.has_more = False
-          break
-
-      if results.has_more:
-        next_row += len(results.data)
-        results = None
-      else:
-        yield formatter.fini_doc()
+
+    for row in db_utils.decode_rows(results):
+      try:
+        yield formatter.format_row([ db_utils.format_value(value) for value in row ])
+      except TooBigToDownloadException, ex:
+        LOG.error(ex)
+        # Exceeded limit. Stop.
+        results.has_more = False
         break
+
+    if results.has_more:
+      next_row += results.num_rows
+      results = None
+    else:
+      yield formatter.fini_doc()
+      break
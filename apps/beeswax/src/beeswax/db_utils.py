@@ -30,7 +30,7 @@ from beeswaxd import BeeswaxService
 
 from desktop.lib import thrift_util
 from hive_metastore import ThriftHiveMetastore
-from beeswaxd.ttypes import BeeswaxException, QueryHandle, QueryNotFoundException
+from beeswaxd.ttypes import BeeswaxException, ColumnType, QueryHandle, QueryNotFoundException
 
 LOG = logging.getLogger(__name__)
 
@@ -40,6 +40,9 @@ LOG = logging.getLogger(__name__)
 BEESWAX_SERVER_THRIFT_TIMEOUT = 10
 METASTORE_THRIFT_TIMEOUT = 10
 
+# Number of rows of results shown at a time, like the Beeswax server's fetch()
+DEFAULT_FETCH_ROWS = 100
+
 def execute_directly(user, query_msg, design=None, notify=False):
   """
   execute_directly(user, query_msg [,design]) -> QueryHistory object
@@ -96,14 +99,13 @@ def wait_for_results(query_history, timeout_sec=30.0):
   May raise BeeswaxException.
   """
   SLEEP_INTERVAL = 0.5
-  START_OVER = True
 
   handle = QueryHandle(id=query_history.server_id, log_context=query_history.log_context)
 
   curr = time.time()
   end = curr + timeout_sec
   while curr <= end:
-    results = db_client().fetch(handle, START_OVER)
+    results = db_client().fetch_rows(handle, 0, DEFAULT_FETCH_ROWS)
     if results.ready:
       return results
     time.sleep(SLEEP_INTERVAL)
@@ -111,6 +113,101 @@ def wait_for_results(query_history, timeout_sec=30.0):
   return None
 
 
+# The null flags of the 8 rows of each byte of a nulls bitmap, lowest bit first
+_NULL_FLAGS = [ tuple([ bool(byte & (1 << bit)) for bit in range(8) ]) for byte in range(256) ]
+
+
+def decode_column(column):
+  """
+  decode_column(column) -> list of values
+
+  Return the values of a ColumnValues, with None for the NULLs.
+  """
+  if column.type == ColumnType.BOOLEAN:
+    values = column.bool_values
+  elif column.type == ColumnType.LONG:
+    values = column.long_values
+  elif column.type == ColumnType.DOUBLE:
+    values = column.double_values
+  else:
+    values = column.string_values
+  values = values or [ ]
+  if not column.nulls or not column.nulls.strip('\x00'):
+    return values
+  # Expand the bitmap a byte at a time. zip() drops the padding bits.
+  flags = [ ]
+  for byte in column.nulls:
+    flags.extend(_NULL_FLAGS[ord(byte)])
+  return [ (value, None)[is_null] for value, is_null in zip(values, flags) ]
+
+
+def decode_rows(results):
+  """
+  decode_rows(results) -> list of rows
+
+  Turn the columns of a ColumnarResults into rows, each a list of values.
+  """
+  columns = [ decode_column(column) for column in results.values or [ ] ]
+  return [ list(row) for row in zip(*columns) ]
+
+
+def format_value(value):
+  """
+  format_value(value) -> string
+
+  Format a value of the results the way Hive prints it.
+  """
+  if value is None:
+    return 'NULL'
+  if isinstance(value, bool):
+    return value and 'true' or 'false'
+  if isinstance(value, basestring):
+    return value
+  if isinstance(value, float):
+    return _format_double(value)
+  return str(value)
+
+
+_INFINITY = float('inf')
+
+def _format_double(value):
+  """
+  Format a double like Java's Double.toString(): the shortest digits that
+  read back as the same value, in decimal notation from 10^-3 up to 10^7
+  and in computerized scientific notation (e.g. 1.0E10) otherwise.
+  """
+  if value != value:
+    return 'NaN'
+  if value == _INFINITY:
+    return 'Infinity'
+  if value == -_INFINITY:
+    return '-Infinity'
+  if value == 0:
+    return repr(value)                  # '0.0' or '-0.0'
+
+  sign = ''
+  if value < 0:
+    sign = '-'
+    value = -value
+  # Like Java, use at least two significant digits (e.g. 4.9E-324).
+  for precision in xrange(2, 18):
+    shortest = '%.*e' % (precision - 1, value)
+    if float(shortest) == value:
+      break
+  mantissa, exponent = shortest.split('e')
+  digits = mantissa.replace('.', '').rstrip('0') or '0'
+  exponent = int(exponent)
+
+  if 1e-3 <= value < 1e7:
+    if exponent < 0:
+      return '%s0.%s%s' % (sign, '0' * (-exponent - 1), digits)
+    point = exponent + 1
+    if point >= len(digits):
+      return '%s%s%s.0' % (sign, digits, '0' * (point - len(digits)))
+    return '%s%s.%s' % (sign, digits[:point], digits[point:])
+  return '%s%s.%sE%d' % (sign, digits[0], digits[1:] or '0', exponent)
+
+
 def execute_and_wait(user, query_msg, timeout_sec=30.0):
   """
   execute_and_wait(user, query_msg) -> results or None
@@ -113,6 +113,7 @@ class HQLForm(forms.Form):
                           widget=forms.Textarea(attrs={'class':'beeswax_query'}))
   is_parameterized = forms.BooleanField(required=False, initial=True)
   email_notify = forms.BooleanField(required=False, initial=False)
+  bypass_cache = forms.BooleanField(required=False, initial=False)
 
 
 class FunctionForm(forms.Form):
@@ -0,0 +1,74 @@
+#!/usr/bin/env python
+# Licensed to Cloudera, Inc. under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  Cloudera, Inc. licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# Query completion events
+
+"""
+Lets requests wait for the Beeswax server to report a query as done.
+
+The server reports completion to the query_done_cb view, which calls
+notify_done(). Requests blocked in wait_done() for that query then wake up.
+Only the waiters in the process that got the notification wake up, so waiters
+should still poll for the query state once in a while.
+"""
+
+import threading
+
+_lock = threading.Lock()
+# server_id -> [ threading.Event, number of waiters ]
+_waiters = { }
+
+def wait_done(server_id, timeout):
+  """
+  wait_done(server_id, timeout) -> True/False
+
+  Block for up to ``timeout`` seconds until notify_done(server_id) is called.
+  Returns whether it was.
+  """
+  _lock.acquire()
+  try:
+    entry = _waiters.get(server_id)
+    if entry is None:
+      entry = [ threading.Event(), 0 ]
+      _waiters[server_id] = entry
+    entry[1] += 1
+  finally:
+    _lock.release()
+
+  event = entry[0]
+  try:
+    event.wait(timeout)
+    return event.isSet()
+  finally:
+    _lock.acquire()
+    try:
+      entry[1] -= 1
+      if entry[1] == 0 and _waiters.get(server_id) is entry:
+        del _waiters[server_id]
+    finally:
+      _lock.release()
+
+
+def notify_done(server_id):
+  """Wake up the requests waiting for query ``server_id`` to be done."""
+  _lock.acquire()
+  try:
+    entry = _waiters.pop(server_id, None)
+  finally:
+    _lock.release()
+  if entry is not None:
+    entry[0].set()
@@ -0,0 +1,171 @@
+#!/usr/bin/env python
+# Licensed to Cloudera, Inc. under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  Cloudera, Inc. licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# Sampling of tables, straight from their files
+
+"""
+Read the first rows of a table from its files, without running a query.
+
+Only delimited text tables (LazySimpleSerDe over TextInputFormat) are read.
+Their files may be compressed with gzip, deflate or bzip2, as told by their
+extension.
+"""
+
+import bz2
+import logging
+import stat
+import zlib
+
+LOG = logging.getLogger(__name__)
+
+TEXT_SERDES = (
+  'org.apache.hadoop.hive.serde2.lazy.LazySimpleSerDe',
+  'org.apache.hadoop.hive.serde2.MetadataTypedColumnsetSerDe',
+)
+TEXT_INPUT_FORMAT = 'org.apache.hadoop.mapred.TextInputFormat'
+
+# Hive's defaults
+DEFAULT_FIELD_DELIM = '\001'
+DEFAULT_LINE_DELIM = '\n'
+DEFAULT_NULL_FORMAT = '\\N'
+
+# Bytes read from a file at a time, and at most, to find the rows
+READ_SIZE = 64 * 1024
+MAX_READ_SIZE = 1024 * 1024
+
+# Decompressors by file extension, as Hadoop's codecs name their files
+DECOMPRESSORS = {
+  '.gz': lambda: zlib.decompressobj(16 + zlib.MAX_WBITS),
+  '.deflate': zlib.decompressobj,
+  '.bz2': bz2.BZ2Decompressor,
+}
+
+
+def sample_table(fs, table, partition=None, n_rows=100):
+  """
+  sample_table(fs, table [,partition [,n_rows]]) -> list of rows, or None
+
+  Read up to ``n_rows`` rows of a metastore ``table``, or of one of its
+  ``partition``, from its files. Each row is a list of strings, one per data
+  column, with u'NULL' for the NULLs. Return None if the files can't be read
+  without Hive.
+  """
+  sd = (partition or table).sd
+  if sd.inputFormat != TEXT_INPUT_FORMAT or sd.serdeInfo.serializationLib not in TEXT_SERDES:
+    return None
+  params = sd.serdeInfo.parameters or { }
+  field_delim = get_delim(params.get('field.delim', params.get('serialization.format')),
+                          DEFAULT_FIELD_DELIM)
+  line_delim = get_delim(params.get('line.delim'), DEFAULT_LINE_DELIM)
+  null_format = params.get('serialization.null.format', DEFAULT_NULL_FORMAT)
+  n_cols = len(table.sd.cols)
+
+  rows = [ ]
+  for path in list_data_files(fs, fs.urlsplit(sd.location)[2]):
+    for line in read_lines(fs, path, line_delim, n_rows - len(rows)):
+      rows.append(split_row(line, field_delim, null_format, n_cols))
+    if len(rows) >= n_rows:
+      break
+  return rows
+
+
+def get_delim(value, default):
+  """
+  Return the delimiter character of a SerDe parameter. Like Hive, take a
+  number as the code of the character.
+  """
+  if not value:
+    return default
+  try:
+    return chr(int(value))
+  except ValueError:
+    return value[0]
+
+
+def list_data_files(fs, dir):
+  """Return the paths of the data files of a table directory, sorted by name."""
+  if not fs.isdir(dir):
+    return [ ]
+  paths = [ ]
+  for stats in fs.listdir_stats(dir):
+    name = fs.basename(stats['path'])
+    # Skip the directories, and the files that Hadoop hides (_logs, .crc...)
+    if stat.S_ISDIR(stats['mode']) or name.startswith('_') or name.startswith('.'):
+      continue
+    paths.append(fs.join(dir, name))
+  paths.sort()
+  return paths
+
+
+def read_lines(fs, path, line_delim, n_lines):
+  """
+  read_lines(fs, path, line_delim, n_lines) -> list of lines
+
+  Read up to ``n_lines`` lines from the beginning of a file, decompressing it
+  if need be.
+  """
+  decompressor = None
+  for ext, factory in DECOMPRESSORS.iteritems():
+    if path.endswith(ext):
+      decompressor = factory()
+  chunks = [ ]
+  n_found = 0
+  n_read = 0
+  eof = False
+  file_obj = fs.open(path)
+  try:
+    while n_found < n_lines and n_read < MAX_READ_SIZE:
+      data = file_obj.read(READ_SIZE)
+      if not data:
+        eof = True
+        break
+      n_read += len(data)
+      if decompressor is not None:
+        try:
+          data = decompressor.decompress(data)
+        except (IOError, EOFError, zlib.error), ex:
+          # Stop at the end of the first stream, or at corrupt data.
+          LOG.warn("Failed to decompress '%s': %s" % (path, ex))
+          eof = True
+          break
+      chunks.append(data)
+      n_found += data.count(line_delim)
+  finally:
+    file_obj.close()
+
+  lines = ''.join(chunks).split(line_delim)
+  # The last piece is a partial line, unless the file ended.
+  last = lines.pop()
+  if eof and last:
+    lines.append(last)
+  return lines[:n_lines]
+
+
+def split_row(line, field_delim, null_format, n_cols):
+  """
+  Split a line into ``n_cols`` fields. Like Hive, ignore the extra fields,
+  and take the missing ones as NULL.
+  """
+  fields = line.split(field_delim)[:n_cols]
+  fields.extend([ null_format ] * (n_cols - len(fields)))
+  row = [ ]
+  for field in fields:
+    if field == null_format:
+      row.append(u'NULL')
+    else:
+      row.append(unicode(field, 'utf-8', 'replace'))
+  return row
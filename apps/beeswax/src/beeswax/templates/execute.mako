@@ -223,6 +223,20 @@ ${wrappers.head('Hive Query', section='query')}
                        )}
             </dl>
           </dd>
+          <dt class="ccs-dt_cap">Cached Results</dt>
+          <dd class="ccs-dd_bottom">
+            <dl class="ccs-bw_parameters">
+          ${comps.field(form.query["bypass_cache"],
+                        notitle = True,
+                        tag = "checkbox",
+                        button_text = "Run again, even if cached",
+                        help = "If checked, the query runs even if the results of an identical query on unchanged tables are cached.",
+                        help_attrs= dict(
+                          data_help_direction='11'
+                        )
+                       )}
+            </dl>
+          </dd>
         </dl>
       </div>
       <div class="right_col">
@@ -155,6 +155,8 @@ def wait_for_query_to_finish(client, response, max=30.0):
       url = match.group(1)
     else:
       url = response.request['PATH_INFO']
+      if response.request.get('QUERY_STRING'):
+        url += '?' + response.request['QUERY_STRING']
     response = client.get(url, follow=True)
   return response
 
@@ -162,7 +164,7 @@ def wait_for_query_to_finish(client, response, max=30.0):
 def make_query(client, query, submission_type="Execute",
                follow=True, udfs=None, settings=None, resources=[],
                wait=False, name=None, desc=None, local=True,
-               is_parameterized=True):
+               is_parameterized=True, bypass_cache=False):
   """
   Prepares arguments for the execute view.
 
@@ -191,6 +193,8 @@ def make_query(client, query, submission_type="Execute",
     parameters['saveform-name'] = name
   if desc:
     parameters['saveform-desc'] = desc
+  if bypass_cache:
+    parameters['query-bypass_cache'] = 'on'
 
   parameters["functions-next_form_id"] = str(len(udfs or []))
   for i, udf_pair in enumerate(udfs or []):
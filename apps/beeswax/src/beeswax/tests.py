@@ -25,11 +25,15 @@ import re
 import shutil
 import tempfile
 import threading
+import time
+import zlib
+import simplejson
 from nose.tools import assert_true, assert_equal, assert_false
 from nose.plugins.skip import SkipTest
 
 from desktop.lib.django_test_util import make_logged_in_client, assert_equal_mod_whitespace
 from desktop.lib.django_test_util import assert_similar_pages
+from desktop.lib.export_csvxls import CSVformatter
 from desktop.lib.test_export_csvxls import xls2csv
 
 import beeswax.create_table
@@ -37,23 +41,26 @@ import beeswax.db_utils
 import beeswax.forms
 import beeswax.hive_site
 import beeswax.models
+import beeswax.query_events
 import beeswax.report
+import beeswax.table_sample
 import beeswax.views
 from beeswax.views import parse_results, collapse_whitespace
 from beeswax.test_base import make_query, wait_for_query_to_finish, verify_history
 from beeswax.test_base import BeeswaxSampleProvider
 from beeswaxd import BeeswaxService
+from beeswaxd.ttypes import ColumnarResults, ColumnType, ColumnValues
 
 LOG = logging.getLogger(__name__)
 
 def _make_query(client, query, submission_type="Execute",
                 follow=True, udfs=None, settings=None, resources=[],
                 wait=False, name=None, desc=None, local=True,
-                is_parameterized=True):
+                is_parameterized=True, bypass_cache=False):
   """Wrapper around the real make_query"""
   res = make_query(client, query, submission_type,
                    follow, udfs, settings, resources,
-                   wait, name, desc, local, is_parameterized)
+                   wait, name, desc, local, is_parameterized, bypass_cache)
   # Should be in the history if it's submitted.
   if submission_type == 'Execute':
     verify_history(client, fragment=collapse_whitespace(query[:20]))
@@ -101,6 +108,33 @@ class TestBeeswaxWithHadoop(BeeswaxSampleProvider):
     response = self.client.get("/beeswax/table/test/partitions")
     assert_true("is not partitioned." in response.content)
 
+  def test_describe_table_sample(self):
+    # The sample is read from the files of the table, without a query
+    history_cnt = len(beeswax.models.QueryHistory.objects.all())
+    response = self.client.get("/beeswax/table/test")
+    rows = response.context["top_rows"]
+    assert_equal(100, len(rows))
+    assert_equal([ [ '0', '0x0' ], [ '1', '0x1' ] ], rows[:2])
+    assert_equal(history_cnt, len(beeswax.models.QueryHistory.objects.all()))
+
+    # Including compressed files
+    self.cluster.fs.setuser(self.cluster.superuser)
+    data = ''.join([ "%d\t0x%x\n" % (x, x) for x in range(1000) ])
+    sio = cStringIO.StringIO()
+    gz = gzip.GzipFile(fileobj=sio, mode='wb')
+    gz.write(data)
+    gz.close()
+    for path, contents in [ ('/tmp/sample.gz', sio.getvalue()),
+                            ('/tmp/sample.deflate', zlib.compress(data)),
+                            ('/tmp/sample.txt', data) ]:
+      f = self.cluster.fs.open(path, "w")
+      f.write(contents)
+      f.close()
+      lines = beeswax.table_sample.read_lines(self.cluster.fs, path, '\n', 500)
+      assert_equal(data.split('\n')[:500], lines)
+      lines = beeswax.table_sample.read_lines(self.cluster.fs, path, '\n', 5000)
+      assert_equal(data.split('\n')[:1000], lines)
+
   def test_query_with_resource(self):
     script = self.cluster.fs.open("/square.py", "w")
     script.write(
@@ -214,6 +248,59 @@ for x in sys.stdin:
     # Test job extraction while we're at it
     assert_equal(1, len(response.context["hadoop_jobs"]), "Should have started 1 job and extracted it.")
 
+  def test_result_cache(self):
+    QUERY = "SELECT bar, COUNT(*) FROM test WHERE foo < 3 GROUP BY bar"
+    response = _make_query(self.client, QUERY)
+    response = wait_for_query_to_finish(self.client, response, max=60.0)
+    results = response.context["results"]
+    assert_equal(3, len(results))
+    assert_false('Using the cached results' in response.context['log'])
+
+    # The same query (modulo whitespace) reuses the results
+    response = _make_query(self.client, QUERY.replace(' ', '  ') + ';')
+    response = wait_for_query_to_finish(self.client, response, max=60.0)
+    assert_equal(results, response.context["results"])
+    assert_true('Using the cached results' in response.context['log'])
+
+    # Unless asked not to
+    response = _make_query(self.client, QUERY, bypass_cache=True)
+    response = wait_for_query_to_finish(self.client, response, max=60.0)
+    assert_equal(results, response.context["results"])
+    assert_false('Using the cached results' in response.context['log'])
+
+  def test_watch_query_wait(self):
+    QUERY = "SELECT foo, COUNT(*) FROM test GROUP BY foo"
+    response = _make_query(self.client, QUERY, local=False, bypass_cache=True)
+    id = response.context["query"].id
+    wait_url = "/beeswax/watch/%d/wait" % (id,)
+
+    # Follow the query from the start of its log until it is done
+    log = ''
+    hadoop_jobs = [ ]
+    start = time.time()
+    while True:
+      data = simplejson.loads(self.client.get(wait_url, { 'log_offset': len(log) }).content)
+      # Only the new part of the log comes back. (The log is ASCII.)
+      assert_equal(len(log) + len(data['log']), data['log_offset'])
+      log += data['log']
+      hadoop_jobs += [ job['id'] for job in data['hadoop_jobs'] ]
+      if data['done']:
+        break
+      assert_true(time.time() - start < 120, "Query took too long.")
+    assert_equal('available', data['state'])
+
+    response = self.client.get("/beeswax/watch/%d" % (id,), follow=True)
+    assert_equal(256, len(response.context["results"]))
+    assert_true(response.context['log'].startswith(log))
+    assert_equal(1, len(hadoop_jobs))
+    assert_equal(response.context["hadoop_jobs"], hadoop_jobs)
+
+    # A done query doesn't wait
+    start = time.time()
+    data = simplejson.loads(self.client.get(wait_url, { 'log_offset': len(log) }).content)
+    assert_true(data['done'])
+    assert_true(time.time() - start < beeswax.views.WATCH_WAIT_INTERVAL)
+
   def test_query_with_remote_udf(self):
     """
     UDF is on HDFS.  This was implemented as part of HIVE-1157.
@@ -355,6 +442,89 @@ for x in sys.stdin:
     # Get the result in csv.
     csv_resp = beeswax.data_export.download(query_data, 'csv')
     assert_equal(csv_resp.content, translated_csv)
+    # Fetching in small batches gives the same result
+    csv_gen = beeswax.data_export.data_generator(query_data, CSVformatter(), fetch_rows=7)
+    assert_equal(''.join(csv_gen), translated_csv)
+
+  def test_fetch_rows(self):
+    query_msg = BeeswaxService.Query()
+    query_msg.query = 'SELECT * FROM test'
+    query_msg.configuration = []
+    query_msg.hadoop_user = "test"
+    query_msg.hadoop_groups = ["test"]
+    handle = beeswax.db_utils.db_client().query(query_msg)
+    client = beeswax.db_utils.db_client()
+    results = client.fetch_rows(handle, 0, 1000)
+    while not results.ready:
+      time.sleep(0.1)
+      results = client.fetch_rows(handle, 0, 1000)
+    all_rows = results.data
+    assert_equal(256, len(all_rows))
+    assert_false(results.has_more)
+
+    # Rows are fetched from any offset, forwards and backwards
+    for start_row, max_rows in [ (0, 10), (10, 10), (200, 100), (5, 3), (256, 10) ]:
+      results = client.fetch_rows(handle, start_row, max_rows)
+      assert_equal(start_row, results.start_row)
+      assert_equal(all_rows[start_row:start_row + max_rows], results.data)
+      assert_equal(start_row + max_rows < 256, results.has_more)
+
+  def test_fetch_columns(self):
+    query_msg = BeeswaxService.Query()
+    query_msg.query = 'SELECT * FROM test'
+    query_msg.configuration = []
+    query_msg.hadoop_user = "test"
+    query_msg.hadoop_groups = ["test"]
+    handle = beeswax.db_utils.db_client().query(query_msg)
+    client = beeswax.db_utils.db_client()
+    results = client.fetch_rows(handle, 0, 1000)
+    while not results.ready:
+      time.sleep(0.1)
+      results = client.fetch_rows(handle, 0, 1000)
+    all_rows = list(parse_results(results.data))
+
+    columns = client.fetch_columns(handle, 0, 1000)
+    assert_true(columns.ready)
+    assert_equal(results.columns, columns.columns)
+    assert_equal([ ColumnType.LONG, ColumnType.STRING ], [ c.type for c in columns.values ])
+    assert_equal(256, columns.num_rows)
+    assert_false(columns.has_more)
+    rows = beeswax.db_utils.decode_rows(columns)
+    assert_equal(all_rows,
+                 [ [ beeswax.db_utils.format_value(v) for v in row ] for row in rows ])
+
+    # Columns are fetched from any offset too
+    for start_row, max_rows in [ (10, 10), (5, 3), (250, 10) ]:
+      columns = client.fetch_columns(handle, start_row, max_rows)
+      assert_equal(start_row, columns.start_row)
+      assert_equal(rows[start_row:start_row + max_rows], beeswax.db_utils.decode_rows(columns))
+      assert_equal(start_row + max_rows < 256, columns.has_more)
+
+  def test_concurrent_readers(self):
+    query_msg = BeeswaxService.Query()
+    query_msg.query = 'SELECT * FROM test'
+    query_msg.configuration = []
+    query_msg.hadoop_user = "test"
+    query_msg.hadoop_groups = ["test"]
+    handle = beeswax.db_utils.db_client().query(query_msg)
+    query_data = beeswax.models.QueryHistory(server_id=handle.id, log_context=handle.log_context)
+    client = beeswax.db_utils.db_client()
+    results = client.fetch_rows(handle, 0, 1000)
+    while not results.ready:
+      time.sleep(0.1)
+      results = client.fetch_rows(handle, 0, 1000)
+    all_rows = results.data
+
+    # Readers at different rows don't disturb each other
+    gen1 = beeswax.data_export.data_generator(query_data, CSVformatter(), fetch_rows=10)
+    gen2 = beeswax.data_export.data_generator(query_data, CSVformatter(), fetch_rows=10)
+    csv1 = [ gen1.next() for i in range(100) ]
+    csv2 = [ gen2.next() for i in range(20) ]
+    assert_equal(all_rows[:10], client.fetch_rows(handle, 0, 10).data)
+    csv1.extend(gen1)
+    csv2.extend(gen2)
+    assert_equal(''.join(csv1), ''.join(csv2))
+    assert_equal(all_rows[250:], client.fetch_rows(handle, 250, 10).data)
 
   def test_designs(self):
     """Test design view and interaction"""
@@ -828,6 +998,45 @@ def test_parse_results():
     [ x for x in parse_results(data) ])
 
 
+def test_decode_rows():
+  # Row 1 of the first column and rows 0 and 9 of the second are NULL
+  results = ColumnarResults(ready=True, columns=[ 'a', 'b' ], num_rows=10, values=[
+      ColumnValues(type=ColumnType.LONG, nulls='\x02\x00', long_values=range(10)),
+      ColumnValues(type=ColumnType.STRING, nulls='\x01\x02',
+                   string_values=[ '', 'x\ty' ] + [ 'z' ] * 7 + [ '' ]) ])
+  rows = beeswax.db_utils.decode_rows(results)
+  assert_equal([ [ 0, None ], [ None, 'x\ty' ] ] + [ [ i, 'z' ] for i in range(2, 9) ] + [ [ 9, None ] ],
+               rows)
+  assert_equal([ 'NULL', 'x\ty' ], [ beeswax.db_utils.format_value(v) for v in rows[1] ])
+
+  # Without NULLs, the values are left as they are
+  column = ColumnValues(type=ColumnType.BOOLEAN, nulls='\x00', bool_values=[ True, False ])
+  assert_equal([ True, False ], beeswax.db_utils.decode_column(column))
+  assert_equal([ 'true', 'false', '1.5' ],
+               [ beeswax.db_utils.format_value(v) for v in (True, False, 1.5) ])
+
+  # Doubles are formatted like Java's Double.toString()
+  doubles = [ (0.1, '0.1'), (-0.0, '-0.0'), (0.001, '0.001'), (1234567.0, '1234567.0'),
+              (1e7, '1.0E7'), (10000000000.0, '1.0E10'), (-1.25e-5, '-1.25E-5'),
+              (0.00099, '9.9E-4'), (1.7976931348623157e308, '1.7976931348623157E308'),
+              (float('inf'), 'Infinity'), (float('nan'), 'NaN') ]
+  assert_equal([ s for v, s in doubles ],
+               [ beeswax.db_utils.format_value(v) for v, s in doubles ])
+
+
+def test_table_sample_split_row():
+  split_row = beeswax.table_sample.split_row
+  assert_equal([ u'a', u'NULL', u'c' ], split_row('a\001\\N\001c', '\001', '\\N', 3))
+  # Extra fields are ignored, and missing ones are NULL
+  assert_equal([ u'a', u'b' ], split_row('a,b,c', ',', '\\N', 2))
+  assert_equal([ u'a', u'NULL', u'NULL' ], split_row('a', ',', '\\N', 3))
+
+  get_delim = beeswax.table_sample.get_delim
+  assert_equal('\t', get_delim('9', '\001'))
+  assert_equal(',', get_delim(',', '\001'))
+  assert_equal('\001', get_delim(None, '\001'))
+
+
 def test_index_page():
   """Minimal test that index page renders."""
   c = make_logged_in_client()
@@ -875,6 +1084,26 @@ def test_strip_trailing_semicolon():
   # No semicolons
   assert_equal("foo", beeswax.views._strip_trailing_semicolon("foo"))
 
+def test_query_events():
+  # Nobody notifies: time out
+  assert_false(beeswax.query_events.wait_done('query_a', 0.1))
+
+  # Notifying wakes up all the waiters of that query only
+  results = [ ]
+  def waiter(server_id):
+    results.append((server_id, beeswax.query_events.wait_done(server_id, 1.0)))
+  threads = [ threading.Thread(target=waiter, args=(server_id,))
+              for server_id in ('query_a', 'query_a', 'query_b') ]
+  for thread in threads:
+    thread.start()
+  time.sleep(0.2)
+  beeswax.query_events.notify_done('query_a')
+  beeswax.query_events.notify_done('query_c')
+  for thread in threads:
+    thread.join()
+  assert_equal([ ('query_a', True), ('query_a', True), ('query_b', False) ], sorted(results))
+  assert_equal({ }, beeswax.query_events._waiters)
+
 def test_hadoop_extraction():
   sample_log = """
 Starting Job = job_201003191517_0002, Tracking URL = http://localhost:50030/jobdetails.jsp?jobid=job_201003191517_0002
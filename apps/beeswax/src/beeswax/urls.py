@@ -41,6 +41,7 @@ urlpatterns = patterns('beeswax',
   url(r'^report_gen$', 'views.edit_report'),
   url(r'^report_gen/(?P<design_id>\d+)$', 'views.edit_report'),
   url(r'^watch/(?P<id>\d+)$', 'views.watch_query'),
+  url(r'^watch/(?P<id>\d+)/wait$', 'views.watch_query_wait'),
   url(r'^results/(?P<id>\d+)/(?P<first_row>\d+)$', 'views.view_results'),
   url(r'^download/(?P<id>\d+)/(?P<format>\w+)$', 'views.download'),
   url(r'^configuration$', 'views.configuration'),
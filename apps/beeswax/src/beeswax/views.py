@@ -20,6 +20,8 @@ Beeswax is a UI for Hive.
 
 import logging
 import re
+import threading
+import time
 
 from django import forms
 from django.core import urlresolvers
@@ -30,7 +32,7 @@ from desktop.lib import django_mako
 from desktop.lib.paginator import Paginator
 from desktop.lib.django_util import copy_query_dict, format_preserving_redirect, render
 from desktop.lib.django_util import login_notrequired, get_desktop_uri_prefix
-from desktop.lib.django_util import render_injected, PopupWithJframe, PopupException
+from desktop.lib.django_util import render_injected, render_json, PopupWithJframe, PopupException
 
 import beeswax.forms
 import beeswax.design
@@ -42,6 +44,8 @@ from beeswax import common
 from beeswax import data_export
 from beeswax import db_utils
 from beeswax import models
+from beeswax import query_events
+from beeswax import table_sample
 
 from jobsub.parameterization import find_variables, substitute_variables
 
@@ -64,25 +68,49 @@ def show_tables(request):
 
 def describe_table(request, table):
   table_obj = db_utils.meta_client().get_table("default", table)
-  # Show the first few rows
-  hql = "SELECT * FROM `%s`" % (table,)
-  query_msg = make_beeswax_query(request, hql)
-  try:
-    results = db_utils.execute_and_wait(request.user, query_msg, timeout_sec=5.0)
-  except:
-    # Gracefully degrade if we're unable to load the results.
-    logging.exception("Failed to read table '%s'" % table)
-    results = None
+  top_rows = _sample_table(request, table, table_obj)
   hdfs_link = location_to_url(request, table_obj.sd.location)
   load_form = beeswax.forms.LoadDataForm(table_obj)
   return render("describe_table.mako", request, dict(
       table=table_obj,
       table_name=table,
-      top_rows=results and list(parse_results(results.data)) or None,
+      top_rows=top_rows,
       hdfs_link=hdfs_link,
       load_form=load_form
   ))
 
+def _sample_table(request, table, table_obj):
+  """
+  _sample_table(request, table, table_obj) -> list of rows, or None
+
+  Return the first few rows of a table. Read them straight from the files of
+  the table (or of its first partition) if possible. Otherwise, query them.
+  """
+  try:
+    partition = None
+    if table_obj.partitionKeys:
+      partitions = db_utils.meta_client().get_partitions("default", table, 1)
+      if not partitions:
+        return [ ]
+      partition = partitions[0]
+    rows = table_sample.sample_table(request.fs, table_obj, partition,
+                                     n_rows=db_utils.DEFAULT_FETCH_ROWS)
+    if rows is not None:
+      return rows
+  except Exception:
+    logging.exception("Failed to sample the files of table '%s'" % table)
+
+  hql = "SELECT * FROM `%s`" % (table,)
+  query_msg = make_beeswax_query(request, hql)
+  try:
+    results = db_utils.execute_and_wait(request.user, query_msg, timeout_sec=5.0)
+  except:
+    # Gracefully degrade if we're unable to load the results.
+    logging.exception("Failed to read table '%s'" % table)
+    results = None
+  return results and list(parse_results(results.data)) or None
+
+
 def drop_table(request, table):
   if request.method == 'GET':
     # It may be possible to determine whether the table is
@@ -179,6 +207,7 @@ def make_beeswax_query(request, hql, query_form=None):
   query_msg.hadoop_groups = request.user.get_groups()
 
   if query_form is not None:
+    query_msg.bypass_cache = query_form.query.cleaned_data.get('bypass_cache', False)
     for f in query_form.settings.forms:
       query_msg.configuration.append(django_mako.render_to_string(
                                           "hql_set.mako", f.cleaned_data))
@@ -634,6 +663,7 @@ def query_done_cb(request, server_id):
 
   # Update the query status
   history.save_state(models.QueryHistory.STATE.available)
+  query_events.notify_done(server_id)
 
   # Find out details about the query
   if not history.notify:
@@ -714,11 +744,105 @@ def watch_query(request, id):
                       'fwd_params': request.GET.urlencode(),
                       'download_urls': download_urls,
                       'log': log,
+                      'log_offset': _log_length(log),
                       'hadoop_jobs': _parse_out_hadoop_jobs(log),
                       'query_context': context,
                     })
 
 
+# The longest a watch_query_wait request waits, in seconds
+WATCH_WAIT_TIMEOUT = 6
+# How often a watch_query_wait request looks for more log, in seconds
+WATCH_WAIT_INTERVAL = 3
+# The most watch_query_wait requests waiting at a time, each holding one of
+# the (10 by default) server threads. Others return at once.
+WATCH_WAIT_MAX_WAITERS = 3
+_watch_wait_slots = threading.Semaphore(WATCH_WAIT_MAX_WAITERS)
+
+def watch_query_wait(request, id):
+  """
+  Waits for the query id to make progress, and returns it as JSON.
+  Returns as soon as the query is done or has logged more, or after a timeout.
+  If WATCH_WAIT_MAX_WAITERS requests are waiting already, returns at once.
+  It understands the optional GET params:
+
+    log_offset
+      The length of the log the client has already seen. Defaults to 0.
+
+    timeout
+      The most seconds to wait. Defaults to (and is capped at) WATCH_WAIT_TIMEOUT.
+
+  The response has the query ``state``, whether it is ``done``, the ``log``
+  written since log_offset, the new ``log_offset``, and the ``hadoop_jobs``
+  (id and url) found in that part of the log. Once the query is done, the
+  client should reload watch_query for the results.
+  """
+  id = int(id)
+  log_offset = int(request.GET.get('log_offset', 0))
+  timeout = min(float(request.GET.get('timeout', WATCH_WAIT_TIMEOUT)), WATCH_WAIT_TIMEOUT)
+
+  query_history = models.QueryHistory.objects.get(id=id)
+  server_id, state = _get_server_id_and_state(query_history)
+  query_history.save_state(state)
+  last_state = query_history.last_state
+
+  waiting = _watch_wait_slots.acquire(False)
+  if not waiting:
+    timeout = 0
+  deadline = time.time() + timeout
+  try:
+    while True:
+      done = state not in (models.QueryHistory.STATE.submitted,
+                           models.QueryHistory.STATE.running)
+      if state == models.QueryHistory.STATE.expired:
+        log = ''
+      else:
+        log = db_utils.db_client().get_log_from(server_id, log_offset)
+        if not done:
+          # Only hand out whole lines, so that no job URL is split across responses
+          log = log[:log.rfind('\n') + 1]
+
+      remaining = deadline - time.time()
+      if done or log or remaining <= 0:
+        break
+
+      # We either get notified of the completion (in this process), see it in
+      # the database (notified in another process), or time out. The log and
+      # the database are only polled every WATCH_WAIT_INTERVAL seconds.
+      notified = query_events.wait_done(server_id, min(remaining, WATCH_WAIT_INTERVAL))
+      query_history = models.QueryHistory.objects.get(id=id)
+      if notified or query_history.last_state != last_state or time.time() >= deadline:
+        state = db_utils.get_query_state(query_history)
+        if state is None:
+          raise PopupException("Failed to contact Beeswax Server to check query status")
+        query_history.save_state(state)
+        last_state = query_history.last_state
+  finally:
+    if waiting:
+      _watch_wait_slots.release()
+
+  hadoop_jobs = [ ]
+  for job_id in _parse_out_hadoop_jobs(log):
+    job_url = urlresolvers.reverse('jobbrowser.views.single_job', kwargs={'jobid': job_id})
+    hadoop_jobs.append({ 'id': job_id, 'url': job_url })
+
+  return render_json({
+    'state': str(state),
+    'done': done,
+    'log': log,
+    'log_offset': log_offset + _log_length(log),
+    'hadoop_jobs': hadoop_jobs,
+  })
+
+
+def _log_length(log):
+  """
+  The length of the log as the Beeswax server counts it, i.e. in UTF-16
+  code units. Thrift hands us the log as UTF-8.
+  """
+  return len(log.decode('utf-8', 'replace').encode('utf-16-le')) / 2
+
+
 def make_query_context(type, info):
   """
   ``type`` is one of "table" and "design", and ``info`` is the table name or design id.
@@ -794,16 +918,15 @@ def view_results(request, id, first_row=0):
   The query results MUST be ready.
   To display query results, one should always go through the watch_query view.
 
-  If ``first_row`` is 0, restarts (if necessary) the query read.  Otherwise, just
-  spits out a warning if first_row doesn't match the servers conception.
-  Multiple readers will produce a confusing interaction here, and that's known.
+  The rows are fetched from ``first_row`` on. The server keeps a reader of the
+  results per client position, so several pages or downloads of the same
+  results can be read at once.
 
   It understands the ``context`` GET parameter. (See watch_query().)
   """
   # Coerce types; manage arguments
   id = int(id)
   first_row = long(first_row)
-  start_over = (first_row == 0)
 
   # Retrieve models from database
   query_history = models.QueryHistory.objects.get(id=id)
@@ -812,7 +935,7 @@ def view_results(request, id, first_row=0):
 
   # Retrieve query results
   try:
-    results = db_utils.db_client().fetch(handle, start_over)
+    results = db_utils.db_client().fetch_rows(handle, first_row, db_utils.DEFAULT_FETCH_ROWS)
     assert results.ready, 'Trying to display result that is not yet ready. Query id %s' % (id,)
     # We display the "Download" button only when we know
     # that there are results:
@@ -252,9 +252,68 @@ ART.Sheet.define('splitview.bw-editor', {
 				case 'define-columns':
 					this.setupDefineColumns();
 					break;
+				case 'watch_wait':
+					this.setupWatchWait();
+					break;
 			}
 		},
 
+		//long-polls the server for the progress of a running query; appends the log written since
+		//the last response and any jobs it started, and reloads the view once the query is done
+		setupWatchWait: function(){
+			var watch = $(this).getElement('div.view[data-wait-url]');
+			if (!watch) return;
+			var log = $(this).getElement('pre.bw-query_log');
+			var jobs = $(this).getElement('ul.bw-hadoop_jobs');
+			var offset = watch.get('data-log-offset').toInt();
+			var stopped, retry;
+			var poll = function(){
+				request.send({ data: { log_offset: offset } });
+			};
+			var request = new Request.JSON({
+				url: watch.get('data-wait-url'),
+				method: 'get',
+				noCache: true,
+				onSuccess: function(data){
+					if (stopped) return;
+					if (data.done) {
+						this.jframe.refresh();
+						return;
+					}
+					if (data.log) log.appendText(data.log);
+					if (data.hadoop_jobs.length) {
+						var list = jobs.getElement('ul.beeswax_hadoop_job_links');
+						if (!list) list = new Element('ul', {'class': 'beeswax_hadoop_job_links'}).inject(jobs.empty());
+						data.hadoop_jobs.each(function(job){
+							new Element('li').adopt(new Element('a', {
+								href: job.url,
+								target: 'JobBrowser',
+								'class': 'bw-hadoop_job',
+								text: job.id.replace('job_', '')
+							})).inject(list);
+						});
+					}
+					offset = data.log_offset;
+					//no news means the request timed out, or that the server had too many waiting
+					//already and returned at once; either way, wait a bit before asking again
+					if (data.log) poll();
+					else retry = poll.delay(3000);
+				}.bind(this),
+				//if the server can't tell us, reload the whole view in a bit
+				onFailure: function(){
+					if (stopped) return;
+					retry = this.jframe.refresh.delay(3000, this.jframe);
+				}.bind(this)
+			});
+			poll();
+			//stop waiting when the view is unloaded
+			this.jframe.markForCleanup(function(){
+				stopped = true;
+				$clear(retry);
+				request.cancel();
+			});
+		},
+
 		setupChooseFile: function(){
 			var importData = $(this).getElement('.bw-import_data');
 			var impLabel = importData.getElement('label');
@@ -32,6 +32,10 @@ struct Query {
   // User and groups to "act as" for purposes of Hadoop.
   4: string hadoop_user;
   5: list<string> hadoop_groups;
+
+  // If set, the query runs even if the results of an identical query on
+  // unchanged inputs are cached.
+  6: bool bypass_cache;
 }
 
 typedef string LogContextId
@@ -67,6 +71,44 @@ struct Results {
   5: bool has_more
 }
 
+// The type of the values of a column of results
+enum ColumnType {
+  BOOLEAN,
+  LONG,
+  DOUBLE,
+  STRING
+}
+
+/**
+ * The values of a column of results. Only the list of values of the type
+ * of the column is set. Values of complex types are JSON strings.
+ */
+struct ColumnValues {
+  1: ColumnType type,
+  // Bit (i % 8) of byte (i / 8) is set if the value of row i is NULL.
+  // A NULL value holds a placeholder in the list of values.
+  2: binary nulls,
+  3: list<bool> bool_values,
+  4: list<i64> long_values,
+  5: list<double> double_values,
+  6: list<string> string_values
+}
+
+struct ColumnarResults {
+  // If set, values are valid.  Otherwise, results aren't ready yet.
+  1: bool ready,
+  // Columns for the results
+  2: list<string> columns,
+  // The values of each column
+  3: list<ColumnValues> values,
+  // The starting row of the results
+  4: i64 start_row,
+  // The number of rows
+  5: i32 num_rows,
+  // Whether there are more results to fetch
+  6: bool has_more
+}
+
 /**
  * Metadata information about the results.
  * Applicable only for SELECT.
@@ -118,6 +160,20 @@ service BeeswaxService {
    */
   Results fetch(1:QueryHandle query_id, 2:bool start_over) throws(1:QueryNotFoundException error, 2:BeeswaxException error2),
 
+  /**
+   * Get up to max_rows rows of the results of a query, starting at row
+   * start_row. This is non-blocking. Caller should check Results.ready to
+   * determine if the results are in yet. The server reads the next rows
+   * ahead while the caller processes these.
+   */
+  Results fetch_rows(1:QueryHandle query_id, 2:i64 start_row, 3:i32 max_rows) throws(1:QueryNotFoundException error, 2:BeeswaxException error2),
+
+  /**
+   * Like fetch_rows(), but returns the results as columns of typed values,
+   * rather than as rows of tab-separated strings.
+   */
+  ColumnarResults fetch_columns(1:QueryHandle query_id, 2:i64 start_row, 3:i32 max_rows) throws(1:QueryNotFoundException error, 2:BeeswaxException error2),
+
   /**
    * Get the state of the query
    */
@@ -145,6 +201,13 @@ service BeeswaxService {
    */
   string get_log(1:LogContextId context) throws(1:QueryNotFoundException error)
 
+  /**
+   * Get the log messages related to the given context, starting at
+   * character start_offset. Lets callers fetch only what was logged since
+   * their last call.
+   */
+  string get_log_from(1:LogContextId context, 2:i64 start_offset) throws(1:QueryNotFoundException error)
+
   /*
    * Returns "default" configuration.
    */
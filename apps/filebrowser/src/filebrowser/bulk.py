@@ -0,0 +1,196 @@
+# Licensed to Cloudera, Inc. under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  Cloudera, Inc. licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Bulk file operations (see BulkOperation), carried out by filebrowserd.
+
+The paths to act upon are expanded by one thread, walking directories
+when the operation is recursive, and acted upon by a small pool of
+worker threads, so that the NameNode sees a bounded number of concurrent
+calls however many files are involved.  Progress is written back to the
+BulkOperation every few seconds.
+"""
+
+import datetime
+import logging
+import posixpath
+import Queue
+import simplejson
+import stat as stat_module
+import threading
+import time
+
+from desktop.auth.backend import rewrite_user
+from filebrowser import conf
+from filebrowser.models import BulkOperation
+from hadoop.fs import normpath
+
+LOG = logging.getLogger(__name__)
+
+# Seconds between progress updates in the database.
+PROGRESS_INTERVAL = 2
+
+# Sentinels in the results queue.
+_WALK_DONE = "walk_done"
+_WORKER_DONE = "worker_done"
+
+def submit(user, op, paths, params, recursive=False):
+  """Records an operation for filebrowserd to carry out.  Returns the BulkOperation."""
+  assert op in BulkOperation.OPS
+  operation = BulkOperation(owner=user,
+                            op=op,
+                            paths=simplejson.dumps(paths),
+                            params=simplejson.dumps(params),
+                            recursive=recursive)
+  operation.save()
+  return operation
+
+def fail_interrupted():
+  """Marks operations left running by a previous filebrowserd as failed."""
+  now = datetime.datetime.now()
+  for operation in BulkOperation.objects.filter(state=BulkOperation.STATE.running.index):
+    _add_error(operation, None, "Interrupted by a restart of filebrowserd")
+    operation.state = BulkOperation.STATE.failed.index
+    operation.finished = now
+    operation.save()
+
+def run_pending(fs):
+  """
+  Carries out the oldest submitted operation, as its owner.  Returns
+  whether there was one.
+  """
+  pending = BulkOperation.objects.filter(state=BulkOperation.STATE.submitted.index).order_by('submitted')[:1]
+  if not pending:
+    return False
+  operation = pending[0]
+  owner = rewrite_user(operation.owner)
+  fs.setuser(owner.username, owner.get_groups())
+  run(fs, operation)
+  return True
+
+def _walk(fs, path, recursive):
+  """
+  Generator of path and, if recursive, of everything under it; parents
+  before their children.  A directory is listed before it's yielded,
+  so that acting upon it (e.g., chmod 000) doesn't keep us from
+  listing it.
+  """
+  stack = [ (path, recursive and fs.isdir(path)) ]
+  while stack:
+    current, is_dir = stack.pop()
+    children = is_dir and fs.listdir_stats(current) or []
+    yield current
+    for child in children:
+      stack.append((normpath(child['path']), stat_module.S_ISDIR(child['mode'])))
+
+def _get_action(fs, operation):
+  """Returns a function acting upon a single path."""
+  params = operation.get_params()
+  if operation.op == 'chmod':
+    return lambda path: fs.chmod(path, params['mode'])
+  elif operation.op == 'chown':
+    return lambda path: fs.chown(path, params['user'], params['group'])
+  elif operation.op == 'move':
+    return lambda path: fs.rename(path, posixpath.join(params['dest'], posixpath.basename(path)))
+  elif operation.op == 'delete':
+    def delete(path):
+      if not fs.isdir(path):
+        fs.remove(path)
+      elif operation.recursive:
+        fs.rmtree(path)
+      else:
+        fs.rmdir(path)
+    return delete
+  raise ValueError("Unknown operation: %s" % (operation.op,))
+
+def _add_error(operation, path, message):
+  errors = operation.get_errors()
+  if len(errors) < BulkOperation.MAX_ERRORS:
+    errors.append((path, message))
+    operation.errors = simplejson.dumps(errors)
+
+def run(fs, operation, concurrency=None):
+  """Carries out operation, recording its progress."""
+  if concurrency is None:
+    concurrency = conf.BULK_OP_CONCURRENCY.get()
+  operation.state = BulkOperation.STATE.running.index
+  operation.started = datetime.datetime.now()
+  operation.save()
+
+  action = _get_action(fs, operation)
+  # Bounded, so that the walk doesn't race ahead of the workers.
+  targets = Queue.Queue(concurrency * 16)
+  results = Queue.Queue()
+
+  # Only chmod and chown need walking: rmtree takes a tree out in one
+  # call, and moving a directory moves what's under it.
+  walk_children = operation.recursive and operation.op in ('chmod', 'chown')
+
+  def walk():
+    for path in operation.get_paths():
+      try:
+        for target in _walk(fs, path, walk_children):
+          targets.put(target)
+      except Exception, e:
+        LOG.warn("Failed to list %s: %s" % (path, e))
+        results.put((path, str(e)))
+    results.put(_WALK_DONE)
+    for i in range(concurrency):
+      targets.put(None)
+
+  def work():
+    while True:
+      path = targets.get()
+      if path is None:
+        break
+      try:
+        action(path)
+        results.put((path, None))
+      except Exception, e:
+        results.put((path, str(e)))
+    results.put(_WORKER_DONE)
+
+  threads = [ threading.Thread(target=walk) ]
+  threads.extend(threading.Thread(target=work) for i in range(concurrency))
+  for t in threads:
+    t.setDaemon(True)
+    t.start()
+
+  running = concurrency
+  last_save = time.time()
+  while running:
+    result = results.get()
+    if result == _WORKER_DONE:
+      running -= 1
+    elif result == _WALK_DONE:
+      operation.walk_complete = True
+    else:
+      path, error = result
+      operation.done += 1
+      if error is not None:
+        operation.failed += 1
+        _add_error(operation, path, error)
+    if time.time() - last_save > PROGRESS_INTERVAL:
+      operation.save()
+      last_save = time.time()
+
+  if operation.failed:
+    operation.state = BulkOperation.STATE.failed.index
+  else:
+    operation.state = BulkOperation.STATE.finished.index
+  operation.finished = datetime.datetime.now()
+  operation.save()
+  LOG.info("Bulk %s of %s by %s: %d paths, %d failed" % (operation.op, operation.get_paths(),
+           operation.owner.username, operation.done, operation.failed))
@@ -0,0 +1,51 @@
+# Licensed to Cloudera, Inc. under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  Cloudera, Inc. licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Configuration for the file browser"""
+
+from desktop.lib.conf import Config
+
+DU_REFRESH_INTERVAL = Config(
+  key="du_refresh_interval",
+  help="Seconds after which filebrowserd recomputes a cached directory content summary.",
+  default=10*60,
+  type=int)
+
+DU_ACTIVE_WINDOW = Config(
+  key="du_active_window",
+  help="Cached directory content summaries are only refreshed if someone looked at " +
+       "them within this many seconds.",
+  default=24*60*60,
+  type=int)
+
+DU_BATCH_SIZE = Config(
+  key="du_batch_size",
+  help="Maximum number of directory content summaries filebrowserd asks the NameNode " +
+       "for in one call.",
+  default=20,
+  type=int)
+
+DAEMON_POLL_INTERVAL = Config(
+  key="daemon_poll_interval",
+  help="Seconds filebrowserd sleeps when it has no work to do.",
+  default=5,
+  type=int)
+
+BULK_OP_CONCURRENCY = Config(
+  key="bulk_op_concurrency",
+  help="Number of concurrent NameNode calls filebrowserd makes when carrying out " +
+       "a bulk file operation.",
+  default=4,
+  type=int)
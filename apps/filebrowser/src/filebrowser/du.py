@@ -0,0 +1,133 @@
+# Licensed to Cloudera, Inc. under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  Cloudera, Inc. licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Disk usage ("du") of HDFS directories, served from a cache.
+
+getContentSummary walks the whole subtree in the NameNode, so views never
+call it.  They read the cached DirectorySummary entries instead (which
+marks them as wanted), and filebrowserd refreshes wanted entries in the
+background, a batch per NameNode call, never-computed and oldest first.
+"""
+
+import datetime
+import logging
+
+from django.db import IntegrityError
+
+from filebrowser import conf
+from filebrowser.models import DirectorySummary
+from hadoop.api.common.ttypes import IOException
+from hadoop.api.hdfs.ttypes import ContentSummary
+from hadoop.fs import normpath
+from hadoop.fs.hadoopfs import HadoopFileSystem
+
+LOG = logging.getLogger(__name__)
+
+FILE_NOT_FOUND = 'java.io.FileNotFoundException'
+
+def get_summaries(paths):
+  """
+  Returns a dictionary of path -> DirectorySummary.
+
+  Paths that aren't cached yet get an entry that filebrowserd will
+  compute shortly.  All the entries are marked as requested now.
+  """
+  now = datetime.datetime.now()
+  hashes = dict((DirectorySummary.hash_path(normpath(path)), normpath(path)) for path in paths)
+  found = dict((entry.path_hash, entry) for entry in
+               DirectorySummary.objects.filter(path_hash__in=hashes.keys()))
+  if found:
+    DirectorySummary.objects.filter(path_hash__in=found.keys()).update(requested=now)
+
+  for path_hash, path in hashes.iteritems():
+    if path_hash in found:
+      continue
+    entry = DirectorySummary(path=path, path_hash=path_hash, summary=ContentSummary(),
+                             requested=now)
+    try:
+      entry.save()
+    except IntegrityError:
+      # Another request added it in the meantime.
+      entry = DirectorySummary.objects.get(path_hash=path_hash)
+    found[path_hash] = entry
+  return dict((entry.path, entry) for entry in found.itervalues())
+
+def get_usage(entry):
+  """
+  Returns the usage of a DirectorySummary as a dictionary like the
+  one of HadoopFileSystem.get_usage_and_quota(), or None if it hasn't
+  been computed yet.
+  """
+  if entry.computed is None:
+    return None
+  return HadoopFileSystem.unpack_content_summary(entry.summary)
+
+def get_stale(limit):
+  """
+  Returns up to limit entries that need refreshing: first those never
+  computed, then those older than the refresh interval that someone
+  looked at recently.
+  """
+  now = datetime.datetime.now()
+  stale = list(DirectorySummary.objects.filter(computed__isnull=True).order_by('requested')[:limit])
+  if len(stale) < limit:
+    refresh_before = now - datetime.timedelta(seconds=conf.DU_REFRESH_INTERVAL.get())
+    active_after = now - datetime.timedelta(seconds=conf.DU_ACTIVE_WINDOW.get())
+    stale.extend(DirectorySummary.objects.filter(computed__lt=refresh_before,
+                                                 requested__gte=active_after)
+                                         .order_by('computed')[:limit - len(stale)])
+  return stale
+
+def refresh(fs, limit=None):
+  """
+  Recomputes a batch of stale entries.  Returns the number of entries
+  refreshed, so that callers can tell when there's nothing left to do.
+  """
+  if limit is None:
+    limit = conf.DU_BATCH_SIZE.get()
+  entries = get_stale(limit)
+  if not entries:
+    return 0
+
+  try:
+    summaries = fs.get_content_summaries([entry.path for entry in entries])
+    results = [ (entry, summary, None) for entry, summary in zip(entries, summaries) ]
+  except IOException, e:
+    # A single bad path (typically one removed since) fails the whole
+    # call.  Fall back to asking for the entries one by one.
+    LOG.info("Batched content summary failed (%s); retrying one path at a time" % (e.msg,))
+    results = []
+    for entry in entries:
+      try:
+        results.append((entry, fs.get_content_summaries([entry.path])[0], None))
+      except IOException, e:
+        results.append((entry, None, e))
+
+  now = datetime.datetime.now()
+  for entry, summary, error in results:
+    if error is not None and error.clazz == FILE_NOT_FOUND:
+      entry.delete()
+      continue
+    if error is not None:
+      entry.error = error.msg[:1024]
+    else:
+      entry.summary = summary
+      entry.error = None
+    # Failures count as computed too, so that they're retried only
+    # after the refresh interval.
+    entry.computed = now
+    entry.save()
+  return len(results)
@@ -16,9 +16,11 @@
 # limitations under the License.
 
 from django import forms
-from django.forms import FileField, CharField, BooleanField, Textarea
+from django.forms import FileField, CharField, BooleanField, ChoiceField, Textarea, \
+    MultipleHiddenInput, ValidationError
 
 from filebrowser.lib import rwx
+from filebrowser.models import BulkOperation
 from hadoop.fs import normpath
 
 import logging
@@ -33,6 +35,15 @@ class PathField(CharField):
   def clean(self, value):
     return normpath(CharField.clean(self, value))
 
+class PathListField(forms.Field):
+  """A list of paths, e.g., those selected in a directory listing."""
+  widget = MultipleHiddenInput
+
+  def clean(self, value):
+    if not value:
+      raise ValidationError("Select at least one path.")
+    return [ normpath(path) for path in value ]
+
 class EditorForm(forms.Form):
   path = PathField(label="File to edit")
   contents = CharField(widget=Textarea, label="Contents", required=False)
@@ -64,6 +75,43 @@ class MkDirForm(forms.Form):
   path = PathField(label="Path in which to create the directory")
   name = PathField(label="The name of the directory to create")
 
+class SearchForm(forms.Form):
+  op = "search"
+  pattern = CharField(label="Search for", min_length=1)
+  regex = BooleanField(label="Regular expression", required=False)
+  ignore_case = BooleanField(label="Ignore case", required=False)
+
+class BulkOpForm(forms.Form):
+  """
+  A rename (into another directory), chmod, chown or delete of several
+  paths, carried out in the background.  See filebrowser.bulk.
+  """
+  op = ChoiceField(label="Operation", choices=[ (op, op) for op in sorted(BulkOperation.OPS) ])
+  path = PathListField(label="Paths")
+  recursive = BooleanField(label="Recursive", required=False)
+  dest = CharField(label="Destination directory", required=False)
+  mode = CharField(label="Mode (octal)", required=False)
+  user = CharField(label="User", required=False)
+  group = CharField(label="Group", required=False)
+
+  def clean(self):
+    op = self.cleaned_data.get('op')
+    for param in BulkOperation.OPS.get(op, ()):
+      if not self.cleaned_data.get(param):
+        raise ValidationError("%s requires a %s." % (op, param))
+    if op == 'move':
+      self.cleaned_data['dest'] = normpath(self.cleaned_data['dest'])
+    elif op == 'chmod':
+      try:
+        self.cleaned_data['mode'] = int(self.cleaned_data['mode'], 8)
+      except ValueError:
+        raise ValidationError("Mode must be an octal number, e.g., 755.")
+    return self.cleaned_data
+
+  def get_params(self):
+    """The parameters of the operation, from the cleaned data."""
+    return dict((param, self.cleaned_data[param]) for param in BulkOperation.OPS[self.cleaned_data['op']])
+
 class ChownForm(forms.Form):
   op = "chown"
   path = PathField(label="Path to change user/group ownership")
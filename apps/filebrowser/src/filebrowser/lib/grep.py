@@ -0,0 +1,318 @@
+#!/usr/bin/env python
+# Licensed to Cloudera, Inc. under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  Cloudera, Inc. licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Implements grep-like functionality over a filesystem.
+
+Files are streamed through the filesystem's read path (and gunzipped on the
+fly, if need be) rather than loaded whole, and the files under a directory
+are searched by a small pool of worker threads. Results are handed back
+as they are found, so callers can render them incrementally.
+"""
+import logging
+import posixpath
+import Queue
+import re
+import stat as stat_module
+import threading
+import zlib
+
+LOG = logging.getLogger(__name__)
+
+# Number of files searched concurrently by one search.
+DEFAULT_WORKERS = 4
+# Caps on the work done by one search.  Bytes are counted after
+# decompression.
+DEFAULT_MAX_BYTES = 512*1024*1024 # 512MB
+DEFAULT_MAX_FILES = 1000
+DEFAULT_MAX_MATCHES = 1000
+# Size of each read issued against the filesystem.
+READ_CHUNK_SIZE = 1024*1024 # 1MB
+# Matching lines longer than this are truncated in the results.
+MAX_LINE_LENGTH = 1024
+
+GZIP_MAGIC = '\x1f\x8b'
+
+# Result types
+MATCH = "match"
+ERROR = "error"
+DONE = "done"
+
+
+def compile_pattern(pattern, regex=False, ignore_case=False):
+  """
+  Compiles the search pattern.  Unless regex is set, the pattern
+  is treated as a literal string.  Raises re.error on a bad regex.
+  """
+  if not regex:
+    pattern = re.escape(pattern)
+  flags = 0
+  if ignore_case:
+    flags |= re.IGNORECASE
+  return re.compile(pattern, flags)
+
+
+class Budget(object):
+  """
+  Thread-safe accounting of the work done by a search.
+
+  Once any limit is reached (or the search is cancelled), the budget
+  is exhausted and workers stop at their next check.
+  """
+  def __init__(self, max_bytes=DEFAULT_MAX_BYTES, max_files=DEFAULT_MAX_FILES,
+               max_matches=DEFAULT_MAX_MATCHES):
+    self.max_bytes = max_bytes
+    self.max_files = max_files
+    self.max_matches = max_matches
+    self.bytes = 0
+    self.files = 0
+    self.matches = 0
+    self.reason = None
+    self._lock = threading.Lock()
+
+  def _charge(self, attr, limit, amount, reason):
+    self._lock.acquire()
+    try:
+      if self.reason:
+        return False
+      if getattr(self, attr) + amount > limit:
+        self.reason = reason
+        return False
+      setattr(self, attr, getattr(self, attr) + amount)
+      return True
+    finally:
+      self._lock.release()
+
+  def add_bytes(self, count):
+    return self._charge("bytes", self.max_bytes, count, "Byte limit reached")
+
+  def add_file(self):
+    return self._charge("files", self.max_files, 1, "File limit reached")
+
+  def add_match(self):
+    return self._charge("matches", self.max_matches, 1, "Match limit reached")
+
+  def cancel(self, reason="Cancelled"):
+    self._lock.acquire()
+    try:
+      if not self.reason:
+        self.reason = reason
+    finally:
+      self._lock.release()
+
+  @property
+  def exhausted(self):
+    return self.reason is not None
+
+
+def _read_chunks(fh, chunk_size=READ_CHUNK_SIZE):
+  """
+  Generator of (compressed, chunk) read from fh.  Gzipped contents,
+  detected by their magic number, are decompressed as they are read.
+  """
+  first = fh.read(chunk_size)
+  if not first.startswith(GZIP_MAGIC):
+    data = first
+    while data:
+      yield False, data
+      data = fh.read(chunk_size)
+    return
+
+  # 16 + MAX_WBITS makes zlib expect (and skip) the gzip header.
+  decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+  data = first
+  while data:
+    out = decompressor.decompress(data)
+    # Concatenated gzip members (as written by "cat a.gz b.gz") show up
+    # as unused data after the end of the first stream.
+    while decompressor.unused_data:
+      rest = decompressor.unused_data
+      out += decompressor.flush()
+      decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+      out += decompressor.decompress(rest)
+    if out:
+      yield True, out
+    data = fh.read(chunk_size)
+  out = decompressor.flush()
+  if out:
+    yield True, out
+
+
+def grep_file(fs, path, regex, budget=None):
+  """
+  Generator of matches of regex within path.
+
+  Each match is a dictionary with the path, the 1-based line number,
+  the byte offset of the start of the line (within the decompressed
+  contents, for compressed files) and the line itself, decoded as UTF-8.
+
+  Lines longer than MAX_LINE_LENGTH are searched as they are read, rather
+  than buffered whole; only matches spanning less than MAX_LINE_LENGTH
+  bytes across two reads are found in them.
+  """
+  if budget is None:
+    budget = Budget()
+  fh = fs.open(path)
+  try:
+    line_number = 0
+    offset = 0
+    remainder = ''
+    # For a line longer than MAX_LINE_LENGTH: its start, the number of
+    # bytes of it searched and dropped, and whether it matched.
+    head = None
+    dropped = 0
+    matched = False
+    for compressed, chunk in _read_chunks(fh):
+      if not budget.add_bytes(len(chunk)):
+        return
+      lines = (remainder + chunk).split('\n')
+      remainder = lines.pop()
+      for line in lines:
+        line_number += 1
+        if head is None:
+          if regex.search(line):
+            if not budget.add_match():
+              return
+            yield _make_match(path, line_number, offset, line, compressed)
+        elif not matched and regex.search(line):
+          if not budget.add_match():
+            return
+          yield _make_match(path, line_number, offset, head, compressed)
+        offset += dropped + len(line) + 1
+        head, dropped, matched = None, 0, False
+      if len(remainder) > MAX_LINE_LENGTH:
+        # Search the start of an overlong line now, and only carry over
+        # enough of it for matches spanning into the next chunk.
+        if head is None:
+          head = remainder[:MAX_LINE_LENGTH + 1]
+        if not matched and regex.search(remainder):
+          if not budget.add_match():
+            return
+          yield _make_match(path, line_number + 1, offset, head, compressed)
+          matched = True
+        dropped += len(remainder) - MAX_LINE_LENGTH
+        remainder = remainder[-MAX_LINE_LENGTH:]
+    if head is None:
+      head = remainder
+    if remainder and not matched and regex.search(remainder) and budget.add_match():
+      yield _make_match(path, line_number + 1, offset, head, compressed)
+  finally:
+    fh.close()
+
+
+def _make_match(path, line_number, offset, line, compressed):
+  return {
+    'type': MATCH,
+    'path': path,
+    'line_number': line_number,
+    'offset': offset,
+    'line': line[:MAX_LINE_LENGTH].decode('utf-8', 'replace'),
+    'truncated': len(line) > MAX_LINE_LENGTH,
+    'compressed': compressed,
+  }
+
+
+class Search(object):
+  """
+  A search of one file, or of all the files under a directory.
+
+  Iterating over a Search runs it and yields results as they are found.
+  Results are dictionaries whose 'type' is MATCH (see grep_file), ERROR
+  (a file that could not be read) or, last, DONE (a summary of the work
+  done and, if the search was cut short, why).
+  """
+  def __init__(self, fs, path, regex, workers=DEFAULT_WORKERS, budget=None):
+    self.fs = fs
+    self.path = path
+    self.regex = regex
+    self.workers = workers
+    self.budget = budget or Budget()
+
+  def _walk(self, paths):
+    """Feeds the files under self.path to the workers, breadth first."""
+    try:
+      dirs = []
+      if stat_module.S_ISDIR(self.fs.stats(self.path)['mode']):
+        dirs.append(self.path)
+      else:
+        self._enqueue(paths, self.path)
+      while dirs and not self.budget.exhausted:
+        current = dirs.pop(0)
+        children = self.fs.listdir_stats(current)
+        children.sort(key=lambda s: s['path'])
+        for child in children:
+          if self.budget.exhausted:
+            break
+          child_path = posixpath.join(current, posixpath.basename(child['path']))
+          if stat_module.S_ISDIR(child['mode']):
+            dirs.append(child_path)
+          else:
+            self._enqueue(paths, child_path)
+    except Exception, e:
+      LOG.exception("Failed to list %s" % self.path)
+      self.results.put(dict(type=ERROR, path=self.path, message=str(e)))
+    for i in range(self.workers):
+      paths.put(None)
+
+  def _enqueue(self, paths, path):
+    if self.budget.add_file():
+      paths.put(path)
+
+  def _work(self, paths):
+    while True:
+      path = paths.get()
+      if path is None:
+        break
+      if self.budget.exhausted:
+        continue
+      try:
+        for match in grep_file(self.fs, path, self.regex, self.budget):
+          self.results.put(match)
+      except Exception, e:
+        LOG.warn("Failed to search %s: %s" % (path, e))
+        self.results.put(dict(type=ERROR, path=path, message=str(e)))
+    self.results.put(None)
+
+  def __iter__(self):
+    self.results = Queue.Queue()
+    # Bounded, so that the walker doesn't race ahead of the workers.
+    paths = Queue.Queue(self.workers * 4)
+    threads = [ threading.Thread(target=self._walk, args=(paths,)) ]
+    threads.extend(threading.Thread(target=self._work, args=(paths,))
+                   for i in range(self.workers))
+    for t in threads:
+      t.setDaemon(True)
+      t.start()
+
+    running = self.workers
+    try:
+      while running:
+        result = self.results.get()
+        if result is None:
+          running -= 1
+        else:
+          yield result
+    finally:
+      # The consumer stopped iterating early (e.g., the client went away
+      # mid-response); stop the threads.
+      if running:
+        self.budget.cancel()
+
+    yield dict(type=DONE,
+               files=self.budget.files,
+               bytes=self.budget.bytes,
+               matches=self.budget.matches,
+               reason=self.budget.reason)
@@ -0,0 +1,106 @@
+#!/usr/bin/env python
+# Licensed to Cloudera, Inc. under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  Cloudera, Inc. licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import gzip
+import shutil
+import StringIO
+import tempfile
+import unittest
+
+import grep
+
+from hadoop.fs import LocalSubFileSystem
+
+class GrepTest(unittest.TestCase):
+  def setUp(self):
+    self.root = tempfile.mkdtemp()
+    self.fs = LocalSubFileSystem(self.root)
+    self.fs.mkdir("/logs")
+    self.fs.mkdir("/logs/nested")
+    self._write("/logs/a.txt", "alpha\nbeta\nERROR one\ngamma\nERROR two")
+    self._write("/logs/nested/b.txt", "error three\n")
+    buf = StringIO.StringIO()
+    gz = gzip.GzipFile(mode="w", fileobj=buf)
+    gz.write("delta\nERROR four\n")
+    gz.close()
+    self._write("/logs/c.gz", buf.getvalue())
+
+  def tearDown(self):
+    shutil.rmtree(self.root)
+
+  def _write(self, path, data):
+    f = self.fs.open(path, "w")
+    try:
+      f.write(data)
+    finally:
+      f.close()
+
+  def _matches(self, results):
+    return sorted((r['path'], r['line_number'], r['offset'], r['line'])
+                  for r in results if r['type'] == grep.MATCH)
+
+  def test_grep_file(self):
+    regex = grep.compile_pattern("ERROR")
+    matches = self._matches(grep.grep_file(self.fs, "/logs/a.txt", regex))
+    self.assertEquals([("/logs/a.txt", 3, 11, "ERROR one"),
+                       ("/logs/a.txt", 5, 27, "ERROR two")], matches)
+
+  def test_gzip(self):
+    regex = grep.compile_pattern("ERROR")
+    matches = list(grep.grep_file(self.fs, "/logs/c.gz", regex))
+    self.assertEquals(1, len(matches))
+    self.assertEquals((2, 6, "ERROR four"),
+                      (matches[0]['line_number'], matches[0]['offset'], matches[0]['line']))
+    self.assertTrue(matches[0]['compressed'])
+
+  def test_long_lines(self):
+    # 3MB without newlines, with a match across the first two reads, and
+    # an ordinary line after it.
+    size = 3 * grep.READ_CHUNK_SIZE
+    data = "x" * (grep.READ_CHUNK_SIZE - 2) + "ERROR" + "x" * size + "\nERROR five"
+    self._write("/logs/long.txt", data)
+    regex = grep.compile_pattern("ERROR")
+    matches = list(grep.grep_file(self.fs, "/logs/long.txt", regex))
+    self.assertEquals([(1, 0, "x" * grep.MAX_LINE_LENGTH, True),
+                       (2, len(data) - len("ERROR five"), "ERROR five", False)],
+                      [ (m['line_number'], m['offset'], m['line'], m['truncated'])
+                        for m in matches ])
+    self.assertEquals([], list(grep.grep_file(self.fs, "/logs/long.txt",
+                                              grep.compile_pattern("missing"))))
+
+  def test_search_directory(self):
+    regex = grep.compile_pattern("error", ignore_case=True)
+    results = list(grep.Search(self.fs, "/logs", regex, workers=2))
+    self.assertEquals(4, len(self._matches(results)))
+    self.assertEquals(grep.DONE, results[-1]['type'])
+    self.assertEquals(3, results[-1]['files'])
+    self.assertEquals(None, results[-1]['reason'])
+
+  def test_limits(self):
+    regex = grep.compile_pattern("ERROR \\w+", regex=True)
+    budget = grep.Budget(max_matches=1)
+    results = list(grep.Search(self.fs, "/logs", regex, budget=budget))
+    self.assertEquals(1, len(self._matches(results)))
+    self.assertEquals("Match limit reached", results[-1]['reason'])
+
+    budget = grep.Budget(max_files=1)
+    results = list(grep.Search(self.fs, "/logs", regex, budget=budget))
+    self.assertEquals(1, results[-1]['files'])
+    self.assertEquals("File limit reached", results[-1]['reason'])
+
+if __name__ == "__main__":
+  unittest.main()
@@ -0,0 +1,57 @@
+# Licensed to Cloudera, Inc. under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  Cloudera, Inc. licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Starts filebrowserd, which does the file browser's background work:
+carrying out bulk file operations (see filebrowser.bulk) and keeping
+the cached directory content summaries (see filebrowser.du) up to date.
+"""
+
+import logging
+import sys
+import time
+
+from django.core.management.base import NoArgsCommand
+
+from filebrowser import bulk, conf, du
+from hadoop import cluster
+
+LOG = logging.getLogger(__name__)
+
+class Command(NoArgsCommand):
+  """Starts filebrowserd daemon."""
+  def handle_noargs(self, **options):
+    try:
+      fs = cluster.get_hdfs()
+      superuser = fs.superuser
+      bulk.fail_interrupted()
+      while True:
+        busy = False
+        try:
+          # Bulk operations run as the user who submitted them.
+          busy = bulk.run_pending(fs)
+        except Exception, ex:
+          LOG.exception("Failed to run bulk file operation")
+        try:
+          # Summaries are shared by all users; who may see them is
+          # checked when they're served.
+          fs.setuser(superuser)
+          busy = du.refresh(fs) or busy
+        except Exception, ex:
+          LOG.exception("Failed to refresh directory content summaries")
+        if not busy:
+          time.sleep(conf.DAEMON_POLL_INTERVAL.get())
+    except KeyboardInterrupt, kbe:
+      sys.exit(2)
@@ -0,0 +1,60 @@
+# encoding: utf-8
+# Licensed to Cloudera, Inc. under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  Cloudera, Inc. licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import datetime
+from south.db import db
+from south.v2 import SchemaMigration
+from django.db import models
+
+from hadoop.api.hdfs.ttypes import ContentSummary
+
+class Migration(SchemaMigration):
+    
+    def forwards(self, orm):
+        
+        # Adding model 'DirectorySummary'
+        db.create_table('filebrowser_directorysummary', (
+            ('id', self.gf('django.db.models.fields.AutoField')(primary_key=True)),
+            ('path', self.gf('django.db.models.fields.CharField')(max_length=1024)),
+            ('path_hash', self.gf('django.db.models.fields.CharField')(unique=True, max_length=40)),
+            ('summary', self.gf('desktop.lib.djangothrift.ThriftField')(thrift_class=ContentSummary(spaceConsumed=None, fileCount=None, directoryCount=None, spaceQuota=None, path=None, quota=None))),
+            ('computed', self.gf('django.db.models.fields.DateTimeField')(null=True, db_index=True)),
+            ('requested', self.gf('django.db.models.fields.DateTimeField')(db_index=True)),
+            ('error', self.gf('django.db.models.fields.CharField')(max_length=1024, null=True)),
+        ))
+        db.send_create_signal('filebrowser', ['DirectorySummary'])
+    
+    
+    def backwards(self, orm):
+        
+        # Deleting model 'DirectorySummary'
+        db.delete_table('filebrowser_directorysummary')
+    
+    
+    models = {
+        'filebrowser.directorysummary': {
+            'Meta': {'object_name': 'DirectorySummary'},
+            'computed': ('django.db.models.fields.DateTimeField', [], {'null': 'True', 'db_index': 'True'}),
+            'error': ('django.db.models.fields.CharField', [], {'max_length': '1024', 'null': 'True'}),
+            'id': ('django.db.models.fields.AutoField', [], {'primary_key': 'True'}),
+            'path': ('django.db.models.fields.CharField', [], {'max_length': '1024'}),
+            'path_hash': ('django.db.models.fields.CharField', [], {'unique': 'True', 'max_length': '40'}),
+            'requested': ('django.db.models.fields.DateTimeField', [], {'db_index': 'True'}),
+            'summary': ('desktop.lib.djangothrift.ThriftField', [], {'thrift_class': 'ContentSummary(spaceConsumed=None, fileCount=None, directoryCount=None, spaceQuota=None, path=None, quota=None)'})
+        }
+    }
+    
+    complete_apps = ['filebrowser']
@@ -1,4 +1,3 @@
-#!/usr/bin/env python
 # Licensed to Cloudera, Inc. under one
 # or more contributor license agreements.  See the NOTICE file
 # distributed with this work for additional information
@@ -14,5 +13,124 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-#
-# Filebrowser has no models.
+
+import datetime
+import hashlib
+import simplejson
+import time
+
+from django.contrib.auth.models import User
+from django.db import models
+from enum import Enum
+
+from desktop.lib.djangothrift import ThriftField
+from hadoop.api.hdfs.ttypes import ContentSummary
+
+class DirectorySummary(models.Model):
+  """
+  The content summary (file count, space consumed, quotas) of an HDFS path,
+  as last computed by filebrowserd.  Entries are created when a user looks
+  at the disk usage of a directory, and refreshed in the background while
+  they keep being looked at.  See filebrowser.du.
+  """
+  path = models.CharField(max_length=1024)
+  # Paths are too long to index, so entries are looked up by hash.
+  path_hash = models.CharField(max_length=40, unique=True)
+  summary = ThriftField(ContentSummary)
+  # None until the summary has been computed for the first time.
+  computed = models.DateTimeField(null=True, db_index=True)
+  # Last time a user asked for this summary.
+  requested = models.DateTimeField(db_index=True)
+  # Why the last refresh failed, if it did.
+  error = models.CharField(max_length=1024, null=True)
+
+  @staticmethod
+  def hash_path(path):
+    if isinstance(path, unicode):
+      path = path.encode('utf-8')
+    return hashlib.sha1(path).hexdigest()
+
+  @property
+  def age(self):
+    """How stale the summary is, as a timedelta, or None if never computed."""
+    if self.computed is None:
+      return None
+    return datetime.datetime.now() - self.computed
+
+
+def _epoch(dt):
+  if dt is None:
+    return None
+  return int(time.mktime(dt.timetuple()))
+
+class BulkOperation(models.Model):
+  """
+  A file operation over several paths, and optionally everything under
+  them, carried out in the background by filebrowserd (see
+  filebrowser.bulk).  Progress is recorded here as the operation runs.
+  """
+  STATE = Enum('submitted', 'running', 'finished', 'failed')
+  # Operations, and the parameters they take.
+  OPS = {
+    'move': ('dest',),
+    'chmod': ('mode',),
+    'chown': ('user', 'group'),
+    'delete': (),
+  }
+  # Only the first few errors are kept.
+  MAX_ERRORS = 100
+
+  owner = models.ForeignKey(User, db_index=True)
+  op = models.CharField(max_length=16)
+  # JSON-encoded list of paths, and dictionary of parameters.
+  paths = models.TextField()
+  params = models.TextField()
+  recursive = models.BooleanField(default=False)
+  state = models.IntegerField(db_index=True, default=STATE.submitted.index)
+  # Number of paths acted upon so far, and how many of those failed.
+  # The total number of paths isn't known until a recursive walk is over.
+  done = models.IntegerField(default=0)
+  failed = models.IntegerField(default=0)
+  walk_complete = models.BooleanField(default=False)
+  # JSON-encoded list of (path, message).
+  errors = models.TextField(default="[]")
+  submitted = models.DateTimeField(auto_now_add=True)
+  started = models.DateTimeField(null=True)
+  finished = models.DateTimeField(null=True)
+
+  class Meta:
+    ordering = ['-submitted']
+
+  def get_paths(self):
+    return simplejson.loads(self.paths)
+
+  def get_params(self):
+    return simplejson.loads(self.params)
+
+  def get_errors(self):
+    return simplejson.loads(self.errors)
+
+  def get_state(self):
+    return BulkOperation.STATE[self.state]
+
+  def is_complete(self):
+    return self.state in (BulkOperation.STATE.finished.index, BulkOperation.STATE.failed.index)
+
+  def to_jsonable(self):
+    """Status of the operation, as served to pollers.  Times are in seconds since the epoch."""
+    return {
+      'id': self.id,
+      'op': self.op,
+      'paths': self.get_paths(),
+      'params': self.get_params(),
+      'recursive': self.recursive,
+      'state': str(self.get_state()),
+      'complete': self.is_complete(),
+      'done': self.done,
+      'failed': self.failed,
+      'walk_complete': self.walk_complete,
+      'errors': self.get_errors(),
+      'submitted': _epoch(self.submitted),
+      'started': _epoch(self.started),
+      'finished': _epoch(self.finished),
+    }
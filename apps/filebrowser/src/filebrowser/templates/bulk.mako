@@ -0,0 +1,39 @@
+## Licensed to Cloudera, Inc. under one
+## or more contributor license agreements.  See the NOTICE file
+## distributed with this work for additional information
+## regarding copyright ownership.  Cloudera, Inc. licenses this file
+## to you under the Apache License, Version 2.0 (the
+## "License"); you may not use this file except in compliance
+## with the License.  You may obtain a copy of the License at
+##
+##     http://www.apache.org/licenses/LICENSE-2.0
+##
+## Unless required by applicable law or agreed to in writing, software
+## distributed under the License is distributed on an "AS IS" BASIS,
+## WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+## See the License for the specific language governing permissions and
+## limitations under the License.
+<%namespace name="edit" file="editor_components.mako" />
+<%namespace name="comps" file="fb_components.mako" />
+${comps.header('Bulk Operation')}
+
+<div class="prompt_popup">
+<form action="/filebrowser/bulk" method="POST" enctype="multipart/form-data">
+  <h4 class="ccs-hidden">Bulk Operation</h4>
+  <dl>
+    ${edit.render_field(form["path"], hidden=True)}
+    ${edit.render_field(form["op"])}
+    ${edit.render_field(form["recursive"])}
+    ${edit.render_field(form["dest"])}
+    ${edit.render_field(form["mode"])}
+    ${edit.render_field(form["user"])}
+    ${edit.render_field(form["group"])}
+  </dl>
+  % if form.non_field_errors():
+    <div class="beeswax_error">${str(form.non_field_errors()) | n}</div>
+  % endif
+  <input class="ccs-hidden" type="submit" value="Submit" />
+</form>
+</div>
+
+${comps.footer()}
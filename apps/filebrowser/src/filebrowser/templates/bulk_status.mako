@@ -0,0 +1,72 @@
+## Licensed to Cloudera, Inc. under one
+## or more contributor license agreements.  See the NOTICE file
+## distributed with this work for additional information
+## regarding copyright ownership.  Cloudera, Inc. licenses this file
+## to you under the Apache License, Version 2.0 (the
+## "License"); you may not use this file except in compliance
+## with the License.  You may obtain a copy of the License at
+##
+##     http://www.apache.org/licenses/LICENSE-2.0
+##
+## Unless required by applicable law or agreed to in writing, software
+## distributed under the License is distributed on an "AS IS" BASIS,
+## WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+## See the License for the specific language governing permissions and
+## limitations under the License.
+<%!
+  from django.template.defaultfilters import urlencode
+%>
+<%namespace name="comps" file="fb_components.mako" />
+${comps.header('Bulk Operation %s' % operation.id)}
+
+% if not operation.is_complete():
+  <meta http-equiv="refresh" content="3;url=${url('filebrowser.views.bulk_status', op_id=operation.id)}" />
+% endif
+
+<div class="fb-bulk-status jframe_padded">
+  <h4>${operation.op} of ${len(operation.get_paths())} path(s)
+    % if operation.recursive:
+      (recursive)
+    % endif
+  </h4>
+  <dl>
+    <dt>State</dt>
+    <dd>${operation.get_state()}</dd>
+    <dt>Done</dt>
+    <dd>${operation.done}
+      % if not operation.walk_complete:
+        (still finding files)
+      % endif
+    </dd>
+    <dt>Failed</dt>
+    <dd>${operation.failed}</dd>
+  </dl>
+  <ul class="fb-bulk-paths">
+  % for path in operation.get_paths():
+    <li><a href="${url('filebrowser.views.view', path=urlencode(path))}">${path}</a></li>
+  % endfor
+  </ul>
+  % if operation.get_errors():
+    <table class="fb-bulk-errors" data-filters="HtmlTable">
+      <thead>
+        <tr>
+          <th>Path</th>
+          <th>Error</th>
+        </tr>
+      </thead>
+      <tbody>
+      % for path, message in operation.get_errors():
+        <tr>
+          <td>${path or ''}</td>
+          <td>${message}</td>
+        </tr>
+      % endfor
+      </tbody>
+    </table>
+    % if operation.failed > len(operation.get_errors()):
+      <div>Only the first ${len(operation.get_errors())} errors are shown.</div>
+    % endif
+  % endif
+</div>
+
+${comps.footer()}
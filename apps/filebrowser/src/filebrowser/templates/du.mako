@@ -0,0 +1,73 @@
+## Licensed to Cloudera, Inc. under one
+## or more contributor license agreements.  See the NOTICE file
+## distributed with this work for additional information
+## regarding copyright ownership.  Cloudera, Inc. licenses this file
+## to you under the Apache License, Version 2.0 (the
+## "License"); you may not use this file except in compliance
+## with the License.  You may obtain a copy of the License at
+##
+##     http://www.apache.org/licenses/LICENSE-2.0
+##
+## Unless required by applicable law or agreed to in writing, software
+## distributed under the License is distributed on an "AS IS" BASIS,
+## WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+## See the License for the specific language governing permissions and
+## limitations under the License.
+<%!
+  from django.template.defaultfilters import urlencode, filesizeformat, timesince
+  from filebrowser.views import truncate
+%>
+<%namespace name="comps" file="fb_components.mako" />
+${comps.header('Disk Usage of ' + truncate(path, 100))}
+
+<%def name="usage_cells(item)">
+  % if item['usage']:
+    <td>${item['usage']['file_count']}</td>
+    <td>${filesizeformat(item['usage']['space_used'])}</td>
+    <td>
+      % if item['usage']['file_quota'] is not None:
+        ${item['usage']['file_quota']} files
+      % endif
+      % if item['usage']['space_quota'] is not None:
+        ${filesizeformat(item['usage']['space_quota'])}
+      % endif
+    </td>
+    <td>${timesince(item['computed'])} ago</td>
+  % elif item['error']:
+    <td colspan="4" class="fb-du-error">${item['error']}</td>
+  % else:
+    <td colspan="4" class="fb-du-pending">Pending</td>
+  % endif
+</%def>
+
+<div class="fb-du jframe_padded">
+  <h4>Disk Usage of ${truncate(path, 100)}</h4>
+  <table class="fb-du-results" data-filters="HtmlTable">
+    <thead>
+      <tr>
+        <th>Name</th>
+        <th>Files</th>
+        <th>Space Consumed</th>
+        <th>Quota</th>
+        <th>As Of</th>
+      </tr>
+    </thead>
+    <tbody>
+      <tr class="fb-du-total">
+        <td><a href="${url('filebrowser.views.view', path=urlencode(path))}">${path}</a> (total)</td>
+        ${usage_cells(total)}
+      </tr>
+    % for item in dirs:
+      <tr>
+        <td><a href="${url('filebrowser.views.disk_usage', path=urlencode(item['path']))}">${item['name']}</a></td>
+        ${usage_cells(item)}
+      </tr>
+    % endfor
+    </tbody>
+  </table>
+  <div class="fb-du-files">
+    ${file_count} files directly in this directory, of ${filesizeformat(file_length)}.
+  </div>
+</div>
+
+${comps.footer()}
@@ -36,6 +36,8 @@ from django.template.defaultfilters import urlencode, escape
             % if cwd_set:
               <a class="fb-upload ccs-art_button" data-icon-styles="{'width' : 16, 'height': 16}" href="${url('filebrowser.views.upload')}?dest=${path|urlencode}&next=${current_request_path|urlencode}">Upload a File</a>
               <a class="fb-mkdir ccs-art_button" data-icon-styles="{'width' : 16, 'height': 16}" href="${url('filebrowser.views.mkdir')}?path=${path|urlencode}&next=${current_request_path|urlencode}">New Directory</a>
+              <a class="fb-search ccs-art_button" data-icon-styles="{'width' : 16, 'height': 16}" href="${url('filebrowser.views.search', path=urlencode(path))}">Search</a>
+              <a class="fb-du ccs-art_button" data-icon-styles="{'width' : 16, 'height': 16}" href="${url('filebrowser.views.disk_usage', path=urlencode(path))}">Disk Usage</a>
             % endif
           </div>
         % endif
@@ -0,0 +1,88 @@
+## Licensed to Cloudera, Inc. under one
+## or more contributor license agreements.  See the NOTICE file
+## distributed with this work for additional information
+## regarding copyright ownership.  Cloudera, Inc. licenses this file
+## to you under the Apache License, Version 2.0 (the
+## "License"); you may not use this file except in compliance
+## with the License.  You may obtain a copy of the License at
+##
+##     http://www.apache.org/licenses/LICENSE-2.0
+##
+## Unless required by applicable law or agreed to in writing, software
+## distributed under the License is distributed on an "AS IS" BASIS,
+## WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+## See the License for the specific language governing permissions and
+## limitations under the License.
+<%!
+  from django.template.defaultfilters import urlencode, filesizeformat
+  from filebrowser.views import truncate
+%>
+<%namespace name="edit" file="editor_components.mako" />
+<%namespace name="comps" file="fb_components.mako" />
+${comps.header('Search ' + truncate(path, 100))}
+
+<div class="fb-search jframe_padded">
+<form action="${url('filebrowser.views.search', path=urlencode(path))}" method="GET">
+  <h4>Search ${truncate(path, 100)}</h4>
+  <dl>
+    ${edit.render_field(form["pattern"])}
+    ${edit.render_field(form["regex"])}
+    ${edit.render_field(form["ignore_case"])}
+  </dl>
+  <input type="submit" value="Search" />
+</form>
+
+% if summary:
+  <div class="fb-search-summary">
+    ${summary['matches']} matching lines in ${summary['files']} files
+    (${filesizeformat(summary['bytes'])} searched).
+    % if summary['reason']:
+      <span class="fb-search-truncated">${summary['reason']}; the search stopped early.</span>
+    % endif
+  </div>
+% endif
+
+% if matches:
+  <table class="fb-search-results" data-filters="HtmlTable">
+    <thead>
+      <tr>
+        <th>File</th>
+        <th>Line</th>
+        <th>Offset</th>
+        <th>Text</th>
+      </tr>
+    </thead>
+    <tbody>
+    % for match in matches:
+      <tr>
+        <td><a href="${url('filebrowser.views.view', path=urlencode(match['path']))}" target="FileViewer">${truncate(match['path'], 100)}</a></td>
+        <td>${match['line_number']}</td>
+        <td>
+        ## Offsets into compressed files can't be displayed.
+        % if match['compressed']:
+          ${match['offset']}
+        % else:
+          <a href="${url('filebrowser.views.view', path=urlencode(match['path']))}?offset=${match['offset']}" target="FileViewer">${match['offset']}</a>
+        % endif
+        </td>
+        <td><code>${match['line']}</code>
+        % if match['truncated']:
+          ...
+        % endif
+        </td>
+      </tr>
+    % endfor
+    </tbody>
+  </table>
+% endif
+
+% if errors:
+  <ul class="fb-search-errors">
+  % for error in errors:
+    <li>Could not search ${error['path']}: ${error['message']}</li>
+  % endfor
+  </ul>
+% endif
+</div>
+
+${comps.footer()}
@@ -25,6 +25,14 @@ urlpatterns = patterns('',
   # Base view
   url(r'^$', 'django.views.generic.simple.redirect_to', { "url": "/filebrowser/view/" }),
 
+  # Anchored patterns go before the unanchored ones below, which would
+  # otherwise also match paths like "/search/tmp/status".
+  url(r'^du(?P<path>/.*)', 'filebrowser.views.disk_usage', name='du'),
+  url(r'^search_stream(?P<path>/.*)', 'filebrowser.views.search_stream', name='search_stream'),
+  url(r'^search(?P<path>/.*)', 'filebrowser.views.search', name='search'),
+  url(r'^bulk$', 'filebrowser.views.bulk_op', name='bulk_op'),
+  url(r'^bulk_status/(?P<op_id>\d+)$', 'filebrowser.views.bulk_status', name='bulk_status'),
+
   url(r'listdir(?P<path>/.*)', 'filebrowser.views.listdir', name='listdir'),
   url(r'display(?P<path>/.*)', 'filebrowser.views.display', name='display'),
   url(r'stat(?P<path>/.*)', 'filebrowser.views.stat', name='stat'),
@@ -23,6 +23,7 @@
 import logging
 import mimetypes
 import posixpath
+import re
 import stat as stat_module
 import urllib
 import os
@@ -36,12 +37,14 @@ from cStringIO import StringIO
 from gzip import GzipFile
 
 
-from desktop.lib.django_util import make_absolute, render_json
+from desktop.lib.django_util import make_absolute, render_json, encode_json
 from desktop.lib.django_util import PopupException, format_preserving_redirect
 from filebrowser.lib.rwx import filetype, rwx
-from filebrowser.lib import xxd
+from filebrowser.lib import grep, xxd
+from filebrowser import bulk, du
+from filebrowser.models import BulkOperation
 from filebrowser.forms import RenameForm, UploadForm, MkDirForm, RmDirForm, RmTreeForm, \
-    RemoveForm, ChmodForm, ChownForm, EditorForm
+    RemoveForm, ChmodForm, ChownForm, EditorForm, SearchForm, BulkOpForm
 from hadoop.fs import normpath
 from filebrowser.plugin.views import render_with_toolbars
 
@@ -303,6 +306,42 @@ def listdir(request, path):
   data['files'] = [_massage_stats(request, stat) for stat in stats]
   return render_with_toolbars('listdir.mako', request, data)
 
+def disk_usage(request, path):
+  """
+  Implements disk usage of a directory and of its subdirectories.
+
+  The usage comes from content summaries cached by filebrowserd (see
+  filebrowser.du), so this never waits on the NameNode walking a
+  subtree.  Summaries not computed yet are shown as pending.
+  """
+  path = _unquote_path(path)
+  if not request.fs.isdir(path):
+    raise PopupException("Not a directory: %s" % (path,))
+
+  # Listing the directory as the user checks that they may see it.
+  stats = request.fs.listdir_stats(path)
+  dir_stats = [ s for s in stats if stat_module.S_ISDIR(s['mode']) ]
+  entries = du.get_summaries([path] + [ s['path'] for s in dir_stats ])
+
+  def _usage(massaged):
+    entry = entries[massaged['path']]
+    massaged['usage'] = du.get_usage(entry)
+    massaged['computed'] = entry.computed
+    massaged['error'] = entry.error
+    return massaged
+
+  dirs = [ _usage(_massage_stats(request, s)) for s in dir_stats ]
+  dirs.sort(key=lambda d: d['usage'] and d['usage']['space_used'], reverse=True)
+  data = {
+    'path': path,
+    'total': _usage(_massage_stats(request, request.fs.stats(path))),
+    'dirs': dirs,
+    # Files directly in the directory, whose length is in their stats.
+    'file_count': len(stats) - len(dir_stats),
+    'file_length': sum(s['size'] for s in stats if not stat_module.S_ISDIR(s['mode'])),
+  }
+  return render_with_toolbars('du.mako', request, data)
+
 def chooser(request, path):
   """
   Returns the html to JFrame that will display a file prompt.
@@ -394,17 +433,16 @@ def display(request, path):
 
 
   if not compression:
-    if path.endswith('.gz') and detect_gzip(request.fs.open(path).read(2)):
+    if path.endswith('.gz') and detect_gzip(request.fs.read(path, 0, 2)):
       compression = 'gzip'
       offset = 0
     else:
       compression = 'none'
 
-  f = request.fs.open(path)
-
   if compression == 'gzip':
     if offset and offset != 0:
       raise PopupException("We don't support offset and gzip Compression")
+    f = request.fs.open(path)
     try:
       try:
         contents = GzipFile('', 'r', 0, StringIO(f.read())).read(length)
@@ -415,11 +453,7 @@ def display(request, path):
       f.close()
 
   else:
-    try:
-      f.seek(offset)
-      contents = f.read(length)
-    finally:
-      f.close()
+    contents = request.fs.read(path, offset, length)
 
   masked = None
 
@@ -469,6 +503,67 @@ def display(request, path):
 
   return render_with_toolbars("display.mako", request, data)
 
+def _make_search(request, path):
+  """
+  Validates the search parameters in the request, and returns a
+  (form, grep.Search) pair.  The search is None if the form is invalid.
+  """
+  path = _unquote_path(path)
+  if not request.fs.exists(path):
+    raise Http404("File not found: %s" % escape(path))
+
+  form = SearchForm(request.GET)
+  if not form.is_valid():
+    return form, None
+  try:
+    regex = grep.compile_pattern(form.cleaned_data['pattern'],
+                                 regex=form.cleaned_data['regex'],
+                                 ignore_case=form.cleaned_data['ignore_case'])
+  except re.error, e:
+    raise PopupException("Invalid regular expression: %s" % (e,))
+  return form, grep.Search(request.fs, path, regex)
+
+def search(request, path):
+  """
+  Searches a file, or all the files under a directory, for lines
+  matching a pattern.
+
+  GET arguments are pattern, regex and ignore_case.  The work done
+  is capped (see filebrowser.lib.grep); the view says so if the cap
+  cut the search short.  See search_stream() for incremental results.
+  """
+  form, searcher = _make_search(request, path)
+  data = {
+    'path': _unquote_path(path),
+    'form': form,
+    'matches': [],
+    'errors': [],
+    'summary': None,
+  }
+  if searcher is not None:
+    for result in searcher:
+      if result['type'] == grep.MATCH:
+        data['matches'].append(result)
+      elif result['type'] == grep.ERROR:
+        data['errors'].append(result)
+      else:
+        data['summary'] = result
+  return render_with_toolbars("search.mako", request, data)
+
+def search_stream(request, path):
+  """
+  Same as search(), but streams the results back as they are found,
+  one JSON object per line.  The last line is the summary of the search.
+  """
+  form, searcher = _make_search(request, path)
+  if searcher is None:
+    return render_json(dict(success=False, errors=form.errors))
+
+  def _result_reader():
+    for result in searcher:
+      yield encode_json(result) + "\n"
+  return HttpResponse(_result_reader(), mimetype="text/plain")
+
 def detect_gzip(contents):
   ''' This is a silly small function which checks to see if the file is Gzip'''
   if contents[:2] == '\x1f\x8b':
@@ -593,6 +688,41 @@ def chmod(request):
 def chown(request):
   return generic_op(ChownForm, request, request.fs.chown, ["path", "user", "group"], "path", template="chown.mako")
 
+def bulk_op(request):
+  """
+  Submits an operation over several paths (the "path" parameter, repeated)
+  for filebrowserd to carry out in the background, and redirects to its
+  status.  Unlike the single-path operations above, chmod and chown may
+  be recursive.
+  """
+  if request.method == 'POST':
+    form = BulkOpForm(request.POST)
+    if form.is_valid():
+      operation = bulk.submit(request.user,
+                              form.cleaned_data['op'],
+                              form.cleaned_data['path'],
+                              form.get_params(),
+                              form.cleaned_data['recursive'])
+      return format_preserving_redirect(request,
+          urlresolvers.reverse(bulk_status, kwargs=dict(op_id=operation.id)))
+  else:
+    form = BulkOpForm(initial=dict(op=request.GET.get('op'), path=request.GET.getlist('path')))
+  return render_with_toolbars('bulk.mako', request, dict(form=form))
+
+def bulk_status(request, op_id):
+  """
+  Shows the progress of a bulk operation.  Intended to be polled
+  (the page refreshes itself) until the operation is complete.
+  """
+  try:
+    operation = BulkOperation.objects.get(id=op_id)
+  except BulkOperation.DoesNotExist:
+    raise Http404("Operation not found: %s" % (op_id,))
+  if operation.owner != request.user and not request.user.is_superuser:
+    raise PopupException("Operation %s belongs to another user." % (op_id,))
+  return render_with_toolbars('bulk_status.mako', request, dict(operation=operation),
+                              json=operation.to_jsonable())
+
 def upload_flash(request):
   """
   Our flash uploader is bad at handling errors, so, instead
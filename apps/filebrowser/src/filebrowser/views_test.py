@@ -19,9 +19,18 @@ Tests for filebrowser views
 """
 from nose.plugins.attrib import attr
 from hadoop import mini_cluster
+import desktop.conf
+import desktop.lib.fsmanager
 from desktop.lib.django_test_util import make_logged_in_client
+from filebrowser import bulk, du
+from filebrowser.models import BulkOperation, DirectorySummary
 from nose.tools import assert_true, assert_false, assert_equal
+import gzip
 import logging
+import os
+import shutil
+import simplejson
+import tempfile
 
 LOG = logging.getLogger(__name__)
 
@@ -125,6 +134,36 @@ def test_view():
     cluster.shutdown()
 
 
+def test_view_local():
+  """The file viewer reads through LocalSubFileSystem.read() too."""
+  root = tempfile.mkdtemp()
+  finish = desktop.conf.LOCAL_FILESYSTEMS.set_for_testing({ 'test_local': { 'path': root } })
+  desktop.lib.fsmanager.reset()
+  try:
+    c = make_logged_in_client()
+
+    f = file(os.path.join(root, 'test-view'), 'w')
+    f.write("hello")
+    f.close()
+
+    response = c.get('/filebrowser/view/test-view?fs=test_local')
+    assert_equal(response.context['view']['contents'], "hello")
+
+    response = c.get('/filebrowser/view/test-view?fs=test_local&end=2&begin=1')
+    assert_equal(response.context['view']['contents'], "he")
+
+    f = gzip.GzipFile(os.path.join(root, 'test-view.gz'), 'w')
+    f.write("hello")
+    f.close()
+
+    response = c.get('/filebrowser/view/test-view.gz?fs=test_local')
+    assert_equal(response.context['view']['compression'], "gzip")
+    assert_equal(response.context['view']['contents'], "hello")
+  finally:
+    finish()
+    desktop.lib.fsmanager.reset()
+    shutil.rmtree(root)
+
 @attr('requires_hadoop')
 def test_edit():
   cluster = mini_cluster.shared_cluster(conf=True)
@@ -179,3 +218,128 @@ def test_edit():
     # TODO(todd) add test for maintaining ownership/permissions
   finally:
     cluster.shutdown()
+
+
+@attr('requires_hadoop')
+def test_search():
+  cluster = mini_cluster.shared_cluster(conf=True)
+  try:
+    c = make_logged_in_client()
+    cluster.fs.setuser(cluster.superuser)
+
+    if cluster.fs.isdir("/test-search-filebrowser"):
+      cluster.fs.rmtree('/test-search-filebrowser/')
+    cluster.fs.mkdir('/test-search-filebrowser/nested')
+
+    f = cluster.fs.open('/test-search-filebrowser/a', "w")
+    f.write("hello\nworld\nhello again\n")
+    f.close()
+    f = cluster.fs.open('/test-search-filebrowser/nested/b', "w")
+    f.write("goodbye\nhello")
+    f.close()
+
+    response = c.get('/filebrowser/search/test-search-filebrowser?pattern=hello')
+    matches = [(m['path'], m['line_number'], m['offset']) for m in response.context['matches']]
+    assert_equal(sorted(matches), [('/test-search-filebrowser/a', 1, 0),
+                                   ('/test-search-filebrowser/a', 3, 12),
+                                   ('/test-search-filebrowser/nested/b', 2, 8)])
+    assert_equal(response.context['summary']['files'], 2)
+
+    # Streamed results: one json object per line, the summary last.
+    response = c.get('/filebrowser/search_stream/test-search-filebrowser/a?pattern=WORLD&ignore_case=on')
+    lines = [ simplejson.loads(line) for line in response.content.splitlines() ]
+    assert_equal(lines[0]['line'], "world")
+    assert_equal(lines[-1]['type'], "done")
+    assert_equal(lines[-1]['matches'], 1)
+  finally:
+    cluster.shutdown()
+
+
+@attr('requires_hadoop')
+def test_disk_usage():
+  cluster = mini_cluster.shared_cluster(conf=True)
+  try:
+    c = make_logged_in_client()
+    cluster.fs.setuser(cluster.superuser)
+
+    if cluster.fs.isdir("/test-du-filebrowser"):
+      cluster.fs.rmtree('/test-du-filebrowser/')
+    cluster.fs.mkdir('/test-du-filebrowser/big')
+    cluster.fs.mkdir('/test-du-filebrowser/small')
+    for name, data in (('big/a', 'x' * 1000), ('big/b', 'x' * 1000), ('small/c', 'x')):
+      f = cluster.fs.open('/test-du-filebrowser/' + name, "w")
+      f.write(data)
+      f.close()
+
+    # Nothing cached yet: the view doesn't compute anything itself.
+    response = c.get('/filebrowser/du/test-du-filebrowser')
+    assert_equal(response.context['total']['usage'], None)
+    assert_equal([ d['usage'] for d in response.context['dirs'] ], [None, None])
+
+    # What filebrowserd does in the background.
+    while du.refresh(cluster.fs):
+      pass
+
+    response = c.get('/filebrowser/du/test-du-filebrowser')
+    assert_equal(response.context['total']['usage']['file_count'], 3)
+    assert_equal([ (d['name'], d['usage']['file_count']) for d in response.context['dirs'] ],
+                 [('big', 2), ('small', 1)])
+
+    # Entries of removed directories go away on refresh.
+    cluster.fs.rmtree('/test-du-filebrowser/small')
+    DirectorySummary.objects.all().update(computed=None)
+    while du.refresh(cluster.fs):
+      pass
+    assert_equal(DirectorySummary.objects.filter(path='/test-du-filebrowser/small').count(), 0)
+  finally:
+    cluster.shutdown()
+
+def test_hash_path():
+  # Request paths are unicode
+  assert_equal(DirectorySummary.hash_path('/user/test'),
+               DirectorySummary.hash_path(u'/user/test'))
+  assert_equal(DirectorySummary.hash_path('/user/t\xc3\xa9st'),
+               DirectorySummary.hash_path(u'/user/t\xe9st'))
+
+@attr('requires_hadoop')
+def test_bulk_op():
+  cluster = mini_cluster.shared_cluster(conf=True)
+  try:
+    c = make_logged_in_client()
+    cluster.fs.setuser(cluster.superuser)
+
+    if cluster.fs.isdir("/test-bulk-filebrowser"):
+      cluster.fs.rmtree('/test-bulk-filebrowser/')
+    paths = [ '/test-bulk-filebrowser', '/test-bulk-filebrowser/a', '/test-bulk-filebrowser/a/b' ]
+    cluster.fs.mkdir(paths[2])
+    cluster.fs.open('/test-bulk-filebrowser/a/b/f', "w").close()
+    paths.append('/test-bulk-filebrowser/a/b/f')
+    for path in paths:
+      cluster.fs.chown(path, 'test', 'test')
+
+    # Bad parameters are rejected up front.
+    response = c.post('/filebrowser/bulk', dict(op='chmod', path=paths[1], mode='9'))
+    assert_true(response.context['form'].errors)
+    assert_equal(BulkOperation.objects.count(), 0)
+
+    response = c.post('/filebrowser/bulk', dict(op='chmod', path=paths[1], mode='0700',
+                                                 recursive='on'), follow=True)
+    operation = response.context['operation']
+    assert_equal('submitted', str(operation.get_state()))
+
+    # What filebrowserd does in the background.
+    assert_true(bulk.run_pending(cluster.fs))
+    assert_false(bulk.run_pending(cluster.fs))
+
+    response = c.get('/filebrowser/bulk_status/%d' % operation.id, dict(format='json'))
+    status = simplejson.loads(response.content)
+    assert_equal('finished', status['state'])
+    assert_equal(3, status['done'])
+    assert_equal(0, status['failed'])
+
+    cluster.fs.setuser(cluster.superuser)
+    assert_equal(0755, cluster.fs.stats(paths[0])['mode'] & 0777)
+    for path in paths[1:]:
+      assert_equal(0700, cluster.fs.stats(path)['mode'] & 0777)
+  finally:
+    cluster.shutdown()
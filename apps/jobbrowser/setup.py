@@ -24,5 +24,6 @@ setup(
       packages = find_packages('src'),
       package_dir = {'': 'src'},
       install_requires = ['setuptools', 'desktop'],
-      entry_points = { 'desktop.sdk.application': 'jobbrowser=jobbrowser' },
+      entry_points = { 'desktop.supervisor.specs': [ 'jobbrowserd = jobbrowser:SUPERVISOR_SPEC' ],
+                       'desktop.sdk.application': 'jobbrowser=jobbrowser' },
 )
@@ -20,4 +20,4 @@ import os
 from desktop.supervisor import DjangoCommandSupervisee
 
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', 'gen-py'))
-SUPERVISOR_SPEC = DjangoCommandSupervisee("filesearch_server")
+SUPERVISOR_SPEC = DjangoCommandSupervisee("jobbrowserd")
@@ -0,0 +1,58 @@
+#!/usr/bin/env python
+# Licensed to Cloudera, Inc. under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  Cloudera, Inc. licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+A small thread-safe LRU cache.
+"""
+import threading
+
+
+class LruCache(object):
+  """
+  Thread-safe mapping that keeps the size most recently used entries.
+  """
+  def __init__(self, size):
+    self.size = size
+    self._data = {}     # key -> [last use, value]
+    self._clock = 0
+    self._lock = threading.Lock()
+
+  def __len__(self):
+    return len(self._data)
+
+  def get(self, key, default=None):
+    self._lock.acquire()
+    try:
+      entry = self._data.get(key)
+      if entry is None:
+        return default
+      self._clock += 1
+      entry[0] = self._clock
+      return entry[1]
+    finally:
+      self._lock.release()
+
+  def put(self, key, value):
+    self._lock.acquire()
+    try:
+      self._clock += 1
+      self._data[key] = [self._clock, value]
+      if len(self._data) > self.size:
+        # Evictions only happen when the cache is full, and it's small
+        oldest = min(self._data.iteritems(), key=lambda item: item[1][0])[0]
+        del self._data[oldest]
+    finally:
+      self._lock.release()
@@ -0,0 +1,239 @@
+#!/usr/bin/env python
+# Licensed to Cloudera, Inc. under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  Cloudera, Inc. licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Fetches task attempt logs from the TaskTrackers' /tasklog servlet.
+
+Each section of a log (stdout, stderr or syslog) is fetched on its own,
+as plain text and only up to its last max_bytes, over HTTP connections
+that are kept open per TaskTracker.  The logs of completed attempts don't
+change any more, so they are kept in an LRU cache.  The logs of several
+attempts can be fetched in parallel.
+"""
+import httplib
+import logging
+import socket
+import threading
+import urllib
+
+from jobbrowser.lib.lru import LruCache
+
+LOG = logging.getLogger(__name__)
+
+LOG_SECTIONS = ('stdout', 'stderr', 'syslog')
+
+# Socket timeout of the requests to the TaskTrackers
+DEFAULT_TIMEOUT = 10 # seconds
+# Only the end of a log section longer than this is fetched
+DEFAULT_MAX_BYTES = 1024*1024 # 1MB
+# Number of log sections kept in the cache
+DEFAULT_CACHE_SIZE = 200
+# Number of idle connections kept open to each TaskTracker
+DEFAULT_POOL_SIZE = 4
+# Number of log sections fetched concurrently by fetch_many()
+DEFAULT_WORKERS = 8
+
+
+class LogFetchError(Exception):
+  pass
+
+
+class _TimeoutHTTPConnection(httplib.HTTPConnection):
+  """An HTTPConnection whose socket (including connecting) times out."""
+  def __init__(self, host, port, timeout):
+    httplib.HTTPConnection.__init__(self, host, port)
+    self._timeout = timeout
+
+  def connect(self):
+    self.sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    self.sock.settimeout(self._timeout)
+    try:
+      self.sock.connect((self.host, self.port))
+    except socket.error:
+      self.sock.close()
+      self.sock = None
+      raise
+
+
+class ConnectionPool(object):
+  """
+  Thread-safe pool of idle HTTP connections, per (host, port).
+  Connections are created on demand, so getting one never blocks.
+  """
+  def __init__(self, timeout=DEFAULT_TIMEOUT, size=DEFAULT_POOL_SIZE):
+    self.timeout = timeout
+    self.size = size
+    self._idle = {}
+    self._lock = threading.Lock()
+
+  def get(self, host, port):
+    """Returns (connection, reused)."""
+    self._lock.acquire()
+    try:
+      idle = self._idle.get((host, port))
+      if idle:
+        return idle.pop(), True
+    finally:
+      self._lock.release()
+    return _TimeoutHTTPConnection(host, port, self.timeout), False
+
+  def put(self, host, port, conn):
+    self._lock.acquire()
+    try:
+      idle = self._idle.setdefault((host, port), [])
+      if len(idle) < self.size:
+        idle.append(conn)
+        return
+    finally:
+      self._lock.release()
+    conn.close()
+
+  def close(self):
+    """Closes the idle connections."""
+    self._lock.acquire()
+    try:
+      idle, self._idle = self._idle, {}
+    finally:
+      self._lock.release()
+    for conns in idle.itervalues():
+      for conn in conns:
+        conn.close()
+
+
+class TaskLogFetcher(object):
+  """
+  Fetches sections of task attempt logs.  Safe to share between threads.
+  """
+  def __init__(self, timeout=DEFAULT_TIMEOUT, max_bytes=DEFAULT_MAX_BYTES,
+               cache_size=DEFAULT_CACHE_SIZE, workers=DEFAULT_WORKERS):
+    self.max_bytes = max_bytes
+    self.workers = workers
+    self._pool = ConnectionPool(timeout)
+    self._cache = LruCache(cache_size)
+
+  def close(self):
+    """Closes the connections kept open to the TaskTrackers."""
+    self._pool.close()
+
+  def _path(self, attempt_id, section, max_bytes):
+    # The servlet counts negative offsets back from the end of the log,
+    # -1 being the end itself.
+    params = [('taskid', attempt_id), ('filter', section), ('plaintext', 'true'),
+              ('start', -(max_bytes + 1)), ('end', -1)]
+    return '/tasklog?' + urllib.urlencode(params)
+
+  def _get(self, host, port, path):
+    while True:
+      conn, reused = self._pool.get(host, port)
+      try:
+        conn.request('GET', path)
+        response = conn.getresponse()
+        data = response.read()
+      except (socket.error, httplib.HTTPException), e:
+        conn.close()
+        if reused:
+          # The TaskTracker may have closed an idle connection; try again
+          # on a new one.
+          continue
+        raise LogFetchError("Cannot retrieve logs from %s:%s: %s" % (host, port, e))
+      if response.will_close:
+        conn.close()
+      else:
+        self._pool.put(host, port, conn)
+      if response.status != httplib.OK:
+        raise LogFetchError("Cannot retrieve logs from %s:%s: %d %s" %
+                            (host, port, response.status, response.reason))
+      return data
+
+  def fetch(self, host, port, attempt_id, section, complete=False, max_bytes=None):
+    """
+    Returns the end (up to max_bytes) of the section of the log of the
+    attempt, from the TaskTracker at host:port.  Logs of complete attempts
+    are cached.  Raises LogFetchError.
+    """
+    assert section in LOG_SECTIONS
+    if max_bytes is None:
+      max_bytes = self.max_bytes
+    key = (attempt_id, section, max_bytes)
+    if complete:
+      data = self._cache.get(key)
+      if data is not None:
+        return data
+
+    path = self._path(attempt_id, section, max_bytes)
+    LOG.info('Retrieving http://%s:%s%s' % (host, port, path))
+    data = self._get(host, port, path)
+    if complete:
+      self._cache.put(key, data)
+    return data
+
+  def fetch_many(self, requests, max_bytes=None):
+    """
+    Fetches several log sections in parallel.  requests is a list of
+    (host, port, attempt_id, section, complete) tuples, as per fetch().
+    Returns their results in order; a failure is returned as its
+    LogFetchError rather than raised.
+    """
+    results = [ None ] * len(requests)
+    pending = list(enumerate(requests))
+    lock = threading.Lock()
+
+    def work():
+      while True:
+        lock.acquire()
+        try:
+          if not pending:
+            return
+          i, request = pending.pop()
+        finally:
+          lock.release()
+        host, port, attempt_id, section, complete = request
+        try:
+          results[i] = self.fetch(host, port, attempt_id, section, complete, max_bytes)
+        except LogFetchError, e:
+          LOG.warn(str(e))
+          results[i] = e
+        except Exception, e:
+          LOG.exception("Failed to fetch log of %s" % (attempt_id,))
+          results[i] = LogFetchError(str(e))
+
+    if len(requests) <= 1:
+      work()
+      return results
+    threads = [ threading.Thread(target=work)
+                for i in range(min(self.workers, len(requests))) ]
+    for t in threads:
+      t.setDaemon(True)
+      t.start()
+    for t in threads:
+      t.join()
+    return results
+
+
+_fetcher = None
+_fetcher_lock = threading.Lock()
+
+def get_fetcher():
+  """Returns the TaskLogFetcher shared by the process."""
+  global _fetcher
+  if _fetcher is None:
+    _fetcher_lock.acquire()
+    try:
+      if _fetcher is None:
+        _fetcher = TaskLogFetcher()
+    finally:
+      _fetcher_lock.release()
+  return _fetcher
@@ -0,0 +1,113 @@
+#!/usr/bin/env python
+# Licensed to Cloudera, Inc. under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  Cloudera, Inc. licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import BaseHTTPServer
+import cgi
+import SocketServer
+import threading
+import unittest
+
+import tasklog
+
+LOGS = {
+  ("attempt_1_m_000000_0", "stdout"): "out\n",
+  ("attempt_1_m_000000_0", "syslog"): "INFO starting\nWARN something broke\n",
+  ("attempt_1_m_000001_0", "stderr"): "Exception in thread main\n",
+}
+
+class FakeTaskLogHandler(BaseHTTPServer.BaseHTTPRequestHandler):
+  """Serves LOGS like the TaskTracker's /tasklog?plaintext=true"""
+  protocol_version = "HTTP/1.1"
+  requests = []
+
+  def do_GET(self):
+    path, query = self.path.split("?", 1)
+    params = dict(cgi.parse_qsl(query))
+    FakeTaskLogHandler.requests.append(params)
+    log = LOGS.get((params["taskid"], params["filter"]))
+    if path != "/tasklog" or log is None:
+      self.send_error(404)
+      return
+    size = len(log)
+    start, end = int(params["start"]), int(params["end"])
+    if start < 0:
+      start += size + 1
+    if end < 0:
+      end += size + 1
+    data = log[max(0, start):end]
+    self.send_response(200)
+    self.send_header("Content-Type", "text/plain")
+    self.send_header("Content-Length", str(len(data)))
+    self.end_headers()
+    self.wfile.write(data)
+
+  def log_message(self, *args):
+    pass
+
+
+class ThreadingHTTPServer(SocketServer.ThreadingMixIn, BaseHTTPServer.HTTPServer):
+  # Idle keep-alive connections would otherwise block other clients
+  daemon_threads = True
+
+
+class TaskLogFetcherTest(unittest.TestCase):
+  def setUp(self):
+    self.server = ThreadingHTTPServer(("127.0.0.1", 0), FakeTaskLogHandler)
+    self.port = self.server.server_address[1]
+    self.thread = threading.Thread(target=self.server.serve_forever)
+    self.thread.setDaemon(True)
+    self.thread.start()
+    FakeTaskLogHandler.requests = []
+    self.fetcher = tasklog.TaskLogFetcher(timeout=5)
+
+  def tearDown(self):
+    self.fetcher.close()
+    self.server.shutdown()
+    self.server.server_close()
+
+  def test_fetch_section(self):
+    self.assertEquals("INFO starting\nWARN something broke\n",
+      self.fetcher.fetch("127.0.0.1", self.port, "attempt_1_m_000000_0", "syslog"))
+    params = FakeTaskLogHandler.requests[-1]
+    self.assertEquals("syslog", params["filter"])
+    self.assertEquals("true", params["plaintext"])
+
+  def test_max_bytes(self):
+    self.assertEquals("broke\n", self.fetcher.fetch(
+      "127.0.0.1", self.port, "attempt_1_m_000000_0", "syslog", max_bytes=6))
+
+  def test_cache(self):
+    # Running attempts are always fetched, complete ones only once
+    for i in range(2):
+      self.fetcher.fetch("127.0.0.1", self.port, "attempt_1_m_000000_0", "stdout")
+    self.assertEquals(2, len(FakeTaskLogHandler.requests))
+    for i in range(2):
+      self.assertEquals("out\n", self.fetcher.fetch(
+        "127.0.0.1", self.port, "attempt_1_m_000000_0", "stdout", complete=True))
+    self.assertEquals(3, len(FakeTaskLogHandler.requests))
+
+  def test_errors(self):
+    self.assertRaises(tasklog.LogFetchError, self.fetcher.fetch,
+                      "127.0.0.1", self.port, "attempt_1_m_000009_0", "stdout")
+
+  def test_fetch_many(self):
+    requests = [ ("127.0.0.1", self.port, "attempt_1_m_000000_0", "stdout", True),
+                 ("127.0.0.1", self.port, "attempt_1_m_000001_0", "stderr", True),
+                 ("127.0.0.1", self.port, "attempt_1_m_000009_0", "syslog", False) ] * 3
+    results = self.fetcher.fetch_many(requests)
+    self.assertEquals(["out\n", "Exception in thread main\n"], results[:2])
+    self.assertTrue(isinstance(results[2], tasklog.LogFetchError))
+    self.assertEquals(results[:2], results[3:5])
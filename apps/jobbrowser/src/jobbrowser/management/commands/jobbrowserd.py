@@ -0,0 +1,54 @@
+# Licensed to Cloudera, Inc. under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  Cloudera, Inc. licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Starts jobbrowserd, which archives finished jobs (see
+jobbrowser.models.JobArchiver) as they show up in its own JobTracker
+snapshot.  Running in its own process, it sees every job from the first
+refresh on, whatever pages the users look at.
+"""
+
+import logging
+import sys
+
+from django.core.management.base import NoArgsCommand
+
+from hadoop import cluster
+from jobbrowser.models import JobArchiver
+
+LOG = logging.getLogger(__name__)
+
+# Seconds to wait for the snapshot to queue jobs when there's nothing to do
+POLL_INTERVAL = 30
+
+class Command(NoArgsCommand):
+  """Starts jobbrowserd daemon."""
+  def handle_noargs(self, **options):
+    try:
+      snapshot = cluster.get_mrcluster().snapshot()
+      archiver = JobArchiver()
+      # Listen before the first refresh, which lists every job.
+      snapshot.add_listener(archiver)
+      snapshot.start()
+      while True:
+        busy = False
+        try:
+          busy = archiver.run_pending(snapshot)
+        except Exception, ex:
+          LOG.exception("Failed to archive finished jobs")
+        if not busy:
+          archiver.wait(POLL_INTERVAL)
+    except KeyboardInterrupt, kbe:
+      sys.exit(2)
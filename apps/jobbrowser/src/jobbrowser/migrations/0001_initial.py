@@ -0,0 +1,60 @@
+# encoding: utf-8
+# Licensed to Cloudera, Inc. under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  Cloudera, Inc. licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import datetime
+from south.db import db
+from south.v2 import SchemaMigration
+from django.db import models
+
+class Migration(SchemaMigration):
+    
+    def forwards(self, orm):
+        
+        # Adding model 'JobCounters'
+        db.create_table('jobbrowser_jobcounters', (
+            ('id', self.gf('django.db.models.fields.AutoField')(primary_key=True)),
+            ('job_id', self.gf('django.db.models.fields.CharField')(unique=True, max_length=64)),
+            ('job_name', self.gf('django.db.models.fields.CharField')(max_length=255, db_index=True)),
+            ('user', self.gf('django.db.models.fields.CharField')(max_length=64, db_index=True)),
+            ('state', self.gf('django.db.models.fields.CharField')(max_length=16)),
+            ('start_time', self.gf('django.db.models.fields.DateTimeField')(null=True)),
+            ('finish_time', self.gf('django.db.models.fields.DateTimeField')(null=True, db_index=True)),
+            ('counters', self.gf('django.db.models.fields.TextField')()),
+        ))
+        db.send_create_signal('jobbrowser', ['JobCounters'])
+    
+    
+    def backwards(self, orm):
+        
+        # Deleting model 'JobCounters'
+        db.delete_table('jobbrowser_jobcounters')
+    
+    
+    models = {
+        'jobbrowser.jobcounters': {
+            'Meta': {'ordering': "['-finish_time']", 'object_name': 'JobCounters'},
+            'counters': ('django.db.models.fields.TextField', [], {}),
+            'finish_time': ('django.db.models.fields.DateTimeField', [], {'null': 'True', 'db_index': 'True'}),
+            'id': ('django.db.models.fields.AutoField', [], {'primary_key': 'True'}),
+            'job_id': ('django.db.models.fields.CharField', [], {'unique': 'True', 'max_length': '64'}),
+            'job_name': ('django.db.models.fields.CharField', [], {'max_length': '255', 'db_index': 'True'}),
+            'start_time': ('django.db.models.fields.DateTimeField', [], {'null': 'True'}),
+            'state': ('django.db.models.fields.CharField', [], {'max_length': '16'}),
+            'user': ('django.db.models.fields.CharField', [], {'max_length': '64', 'db_index': 'True'})
+        }
+    }
+    
+    complete_apps = ['jobbrowser']
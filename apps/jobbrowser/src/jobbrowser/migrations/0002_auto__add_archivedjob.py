@@ -0,0 +1,89 @@
+# encoding: utf-8
+# Licensed to Cloudera, Inc. under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  Cloudera, Inc. licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import datetime
+from south.db import db
+from south.v2 import SchemaMigration
+from django.db import models
+
+class Migration(SchemaMigration):
+    
+    def forwards(self, orm):
+        
+        # Adding model 'ArchivedJob'
+        db.create_table('jobbrowser_archivedjob', (
+            ('id', self.gf('django.db.models.fields.AutoField')(primary_key=True)),
+            ('job_id', self.gf('django.db.models.fields.CharField')(unique=True, max_length=64)),
+            ('jobtracker_id', self.gf('django.db.models.fields.CharField')(max_length=64)),
+            ('job_number', self.gf('django.db.models.fields.IntegerField')()),
+            ('name', self.gf('django.db.models.fields.CharField')(max_length=255, db_index=True)),
+            ('user', self.gf('django.db.models.fields.CharField')(max_length=64, db_index=True)),
+            ('queue', self.gf('django.db.models.fields.CharField')(max_length=128)),
+            ('run_state', self.gf('django.db.models.fields.IntegerField')(db_index=True)),
+            ('priority', self.gf('django.db.models.fields.IntegerField')()),
+            ('desired_maps', self.gf('django.db.models.fields.IntegerField')()),
+            ('desired_reduces', self.gf('django.db.models.fields.IntegerField')()),
+            ('finished_maps', self.gf('django.db.models.fields.IntegerField')()),
+            ('finished_reduces', self.gf('django.db.models.fields.IntegerField')()),
+            ('start_time', self.gf('django.db.models.fields.DateTimeField')(null=True, db_index=True)),
+            ('finish_time', self.gf('django.db.models.fields.DateTimeField')(null=True, db_index=True)),
+            ('retired', self.gf('django.db.models.fields.BooleanField')(default=False, db_index=True)),
+            ('details', self.gf('django.db.models.fields.TextField')()),
+        ))
+        db.send_create_signal('jobbrowser', ['ArchivedJob'])
+    
+    
+    def backwards(self, orm):
+        
+        # Deleting model 'ArchivedJob'
+        db.delete_table('jobbrowser_archivedjob')
+    
+    
+    models = {
+        'jobbrowser.archivedjob': {
+            'Meta': {'ordering': "['-finish_time']", 'object_name': 'ArchivedJob'},
+            'desired_maps': ('django.db.models.fields.IntegerField', [], {}),
+            'desired_reduces': ('django.db.models.fields.IntegerField', [], {}),
+            'details': ('django.db.models.fields.TextField', [], {}),
+            'finish_time': ('django.db.models.fields.DateTimeField', [], {'null': 'True', 'db_index': 'True'}),
+            'finished_maps': ('django.db.models.fields.IntegerField', [], {}),
+            'finished_reduces': ('django.db.models.fields.IntegerField', [], {}),
+            'id': ('django.db.models.fields.AutoField', [], {'primary_key': 'True'}),
+            'job_id': ('django.db.models.fields.CharField', [], {'unique': 'True', 'max_length': '64'}),
+            'job_number': ('django.db.models.fields.IntegerField', [], {}),
+            'jobtracker_id': ('django.db.models.fields.CharField', [], {'max_length': '64'}),
+            'name': ('django.db.models.fields.CharField', [], {'max_length': '255', 'db_index': 'True'}),
+            'priority': ('django.db.models.fields.IntegerField', [], {}),
+            'queue': ('django.db.models.fields.CharField', [], {'max_length': '128'}),
+            'retired': ('django.db.models.fields.BooleanField', [], {'default': 'False', 'db_index': 'True'}),
+            'run_state': ('django.db.models.fields.IntegerField', [], {'db_index': 'True'}),
+            'start_time': ('django.db.models.fields.DateTimeField', [], {'null': 'True', 'db_index': 'True'}),
+            'user': ('django.db.models.fields.CharField', [], {'max_length': '64', 'db_index': 'True'})
+        },
+        'jobbrowser.jobcounters': {
+            'Meta': {'ordering': "['-finish_time']", 'object_name': 'JobCounters'},
+            'counters': ('django.db.models.fields.TextField', [], {}),
+            'finish_time': ('django.db.models.fields.DateTimeField', [], {'null': 'True', 'db_index': 'True'}),
+            'id': ('django.db.models.fields.AutoField', [], {'primary_key': 'True'}),
+            'job_id': ('django.db.models.fields.CharField', [], {'unique': 'True', 'max_length': '64'}),
+            'job_name': ('django.db.models.fields.CharField', [], {'max_length': '255', 'db_index': 'True'}),
+            'start_time': ('django.db.models.fields.DateTimeField', [], {'null': 'True'}),
+            'state': ('django.db.models.fields.CharField', [], {'max_length': '16'}),
+            'user': ('django.db.models.fields.CharField', [], {'max_length': '64', 'db_index': 'True'})
+        }
+    }
+    
+    complete_apps = ['jobbrowser']
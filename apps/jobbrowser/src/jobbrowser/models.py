@@ -15,18 +15,28 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from desktop.lib.thrift_util import fixup_enums
 from desktop.lib.view_util import format_time_diff
 from hadoop import job_tracker
 from hadoop import confparse
-from urlparse import urlparse, urlunparse
+from jobbrowser.lib import tasklog
+from jobbrowser.lib.lru import LruCache
+from urlparse import urlparse
 
 import datetime
 import logging
-import lxml.html
 import re
-import urllib2
+import simplejson
+import threading
+
+from django.db import IntegrityError
+from django.db import connection
+from django.db import models
+from django.db.models import Q
 
 import hadoop.api.jobtracker.ttypes as ttypes
+from hadoop.api.common.ttypes import IOException
+from thrift.transport.TTransport import TTransportException
 
 LOGGER = logging.getLogger(__name__)
 
@@ -71,7 +81,7 @@ class Job(JobLinkage):
       Returns a Job instance given a job tracker interface and an id. The job tracker interface is typically
       located in request.jt.
     """
-    thriftjob = jt.get_job(jt.thriftjobid_from_string(jobid))
+    thriftjob = jt.get_job(jt.thriftjobid_from_string(jobid), include_tasks=False)
     if not thriftjob:
       raise Exception("could not find job with id %s" % jobid)
     return Job(jt, thriftjob)
@@ -84,52 +94,102 @@ class Job(JobLinkage):
     """
     return Job(jt, thriftjob)
 
-  def __init__(self, jt, thriftJob):
+  @staticmethod
+  def from_summary(jt, summary):
+    """
+      Returns a Job instance given a job tracker interface and a ThriftJobSummary. Only the fields
+      shown in job lists are set; the rest of the job is fetched the first time it is needed.
+    """
+    return Job(jt, None, summary)
+
+  @staticmethod
+  def from_archive(jt, archived):
+    """
+      Returns a Job instance given an ArchivedJob, for jobs the JobTracker has retired. Its
+      counters and configuration come from the archive as well.
+    """
+    job = Job(jt, archived.to_thriftjob())
+    job._set_conf(archived.get_conf())
+    job.archived = True
+    return job
+
+  def __init__(self, jt, thriftJob, summary=None):
     """
     Returns a Job instance given a job tracker interface and a thriftjob object returned from that
-    job tracker interface.  The job tracker interface is typically located in request.jt
+    job tracker interface (or, failing that, a ThriftJobSummary).  The job tracker interface is
+    typically located in request.jt
     """
-    JobLinkage.__init__(self, jt, thriftJob.jobID.asString)
+    if thriftJob is not None:
+      summary = thriftJob
+    JobLinkage.__init__(self, jt, summary.jobID.asString)
     self.jt = jt
-    self.job = thriftJob
-    self.tasks = []
-    if self.job.tasks is not None:
-      self.tasks = TaskList.from_thriftTaskList(self.job.tasks, jt)
-
-    self.task_map = dict( (task.taskId, task) for task in self.tasks )
+    self._job = thriftJob
+    self._tasks = None
+    self._task_map = None
     self._counters = None
     self._conf_keys = None
     self._full_job_conf = None
-    self._init_attributes()
+    # Whether this job comes from the archive rather than from the JobTracker
+    self.archived = False
+    self._init_attributes(summary)
+
+  @property
+  def job(self):
+    """
+    The ThriftJobInProgress (without its tasks), fetched on first use for
+    Jobs made from summaries
+    """
+    if self._job is None:
+      self._job = self.jt.get_job(self.jt.thriftjobid_from_string(self.jobId),
+                                  include_tasks=False)
+    return self._job
+
+  @property
+  def tasks(self):
+    """
+    Every task of the job, fetched on first use.  This is expensive for
+    big jobs; use top_tasks() or TaskList.select() where possible.
+    """
+    if self._tasks is None:
+      # Setup and cleanup tasks come on top of the maps and reduces
+      count = self.desiredMaps + self.desiredReduces + 2
+      self._tasks = TaskList.select(self.jt, self.jobId, None, None, None, count, 0)
+    return self._tasks
+
+  def top_tasks(self, task_states, n, newest_first=True):
+    """
+    Returns the n tasks in any of task_states that started executing last
+    (or first, unless newest_first).  Only those tasks are fetched.
+    """
+    assert job_tracker.VALID_TASK_STATES.issuperset(task_states)
+    tip_list = self.jt.get_top_tasks(self.jt.thriftjobid_from_string(self.jobId),
+                                     task_states, n, newest_first)
+    return TaskList.from_thriftTaskList(tip_list, self.jt).tasks
+
+  @property
+  def task_map(self):
+    if self._task_map is None:
+      self._task_map = dict( (task.taskId, task) for task in self.tasks )
+    return self._task_map
 
   @property
   def counters(self):
+    """
+    The counters of the job, by group and counter name.  Those of
+    finished jobs don't change, so they are stored (see JobCounters).
+    """
     if self._counters is None:
-      rollups = self.jt.get_job_counter_rollups(self.job.jobID)
-      # We get back a structure with counter lists for maps, reduces, and total
-      # and we need to invert this
-
-      def aggregate_counters(ctrs_from_jt, key, target):
-        for group in ctrs_from_jt.groups:
-          if group.name not in target:
-            target[group.name] = {
-              'name': group.name,
-              'displayName': group.displayName,
-              'counters': {}
-              }
-          agg_counters = target[group.name]['counters']
-          for counter in group.counters.itervalues():
-            if counter.name not in agg_counters:
-              agg_counters[counter.name] = {
-                'name': counter.name,
-                'displayName': counter.displayName,
-                }
-            agg_counters[counter.name][key] = counter.value
-
-      self._counters = {}
-      aggregate_counters(rollups.mapCounters, "map", self._counters)
-      aggregate_counters(rollups.reduceCounters, "reduce", self._counters)
-      aggregate_counters(rollups.jobCounters, "total", self._counters)
+      stored = None
+      if self.status in FINISHED_JOB_STATES:
+        stored = JobCounters.lookup(self.jobId)
+      if stored is not None:
+        self._counters = stored.get_counters()
+      else:
+        rollups = self.jt.get_job_counter_rollups(self.jt.thriftjobid_from_string(self.jobId))
+        self._counters = counters_from_rollups(rollups)
+        if self.status in FINISHED_JOB_STATES:
+          JobCounters.record(self.jobId, self.jobName, self.user, self.status,
+                             self.startTimeMs, self.finishTimeMs, rollups)
     return self._counters
 
   @property
@@ -144,59 +204,100 @@ class Job(JobLinkage):
       self._initialize_conf_keys()
     return self._full_job_conf
 
-  def _init_attributes(self):
-    self.queueName = self.job.profile.queueName
-    self.jobName = self.job.profile.name
-    self.user = self.job.profile.user
-    self.mapProgress = self.job.status.mapProgress
-    self.reduceProgress = self.job.status.reduceProgress
-    self.setupProgress = self.job.status.setupProgress
-    self.cleanupProgress = self.job.status.cleanupProgress
-
-    if self.job.desiredMaps == 0:
+  def _init_attributes(self, job):
+    """
+    Sets the fields shown in job lists, from either a ThriftJobInProgress
+    or a ThriftJobSummary.  The other fields are properties, computed (or
+    fetched) when they are used.
+    """
+    if self._job is not None:
+      self.queueName = job.profile.queueName
+      self.jobName = job.profile.name
+      self.user = job.profile.user
+      self.mapProgress = job.status.mapProgress
+      self.reduceProgress = job.status.reduceProgress
+      self.status = job.status.runStateAsString
+    else:
+      self.queueName = job.queueName
+      self.jobName = job.name
+      self.user = job.user
+      self.mapProgress = job.mapProgress
+      self.reduceProgress = job.reduceProgress
+      self.status = job.runStateAsString
+
+    if job.desiredMaps == 0:
       maps_percent_complete = 0
     else:
-      maps_percent_complete = int(round(float(self.job.finishedMaps)/self.job.desiredMaps*100))
+      maps_percent_complete = int(round(float(job.finishedMaps)/job.desiredMaps*100))
 
-    self.desiredMaps = self.job.desiredMaps
+    self.desiredMaps = job.desiredMaps
 
-    if self.job.desiredReduces == 0:
+    if job.desiredReduces == 0:
       reduces_percent_complete = 0
     else:
-      reduces_percent_complete = int(round(float(self.job.finishedReduces)/self.job.desiredReduces*100))
+      reduces_percent_complete = int(round(float(job.finishedReduces)/job.desiredReduces*100))
 
-    self.desiredReduces = self.job.desiredReduces
+    self.desiredReduces = job.desiredReduces
     self.maps_percent_complete = maps_percent_complete
-    self.finishedMaps = self.job.finishedMaps
-    self.finishedReduces = self.job.finishedReduces
+    self.finishedMaps = job.finishedMaps
+    self.finishedReduces = job.finishedReduces
     self.reduces_percent_complete = reduces_percent_complete
-    self.startTimeMs = self.job.startTime
-    self.startTimeFormatted = format_unixtime_ms(self.job.startTime)
-    self.launchTimeMs = self.job.launchTime
-    self.launchTimeFormatted = format_unixtime_ms(self.job.launchTime)
-
-    self.finishTimeMs = self.job.finishTime
-    self.finishTimeFormatted = format_unixtime_ms(self.job.finishTime)
-    self.status = self.job.status.runStateAsString
-    self.priority = self.job.priorityAsString
-    self.jobFile = self.job.profile.jobFile
-
-    finishTime = self.job.finishTime
-    if finishTime == 0:
+    self.startTimeMs = job.startTime
+    self.finishTimeMs = job.finishTime
+    self.priority = job.priorityAsString
+
+  @property
+  def setupProgress(self):
+    return self.job.status.setupProgress
+
+  @property
+  def cleanupProgress(self):
+    return self.job.status.cleanupProgress
+
+  @property
+  def launchTimeMs(self):
+    return self.job.launchTime
+
+  @property
+  def launchTimeFormatted(self):
+    return format_unixtime_ms(self.launchTimeMs)
+
+  @property
+  def jobFile(self):
+    return self.job.profile.jobFile
+
+  @property
+  def startTimeFormatted(self):
+    return format_unixtime_ms(self.startTimeMs)
+
+  @property
+  def finishTimeFormatted(self):
+    return format_unixtime_ms(self.finishTimeMs)
+
+  def _start_finish_datetimes(self):
+    if self.finishTimeMs == 0:
       finishTime = datetime.datetime.now()
     else:
-      finishTime = datetime.datetime.fromtimestamp(finishTime/1000)
-    self.duration = finishTime - datetime.datetime.fromtimestamp(self.job.startTime/1000)
-    self.durationFormatted = format_time_diff(datetime.datetime.fromtimestamp(self.job.startTime/1000), finishTime)
+      finishTime = datetime.datetime.fromtimestamp(self.finishTimeMs/1000)
+    return datetime.datetime.fromtimestamp(self.startTimeMs/1000), finishTime
+
+  @property
+  def duration(self):
+    startTime, finishTime = self._start_finish_datetimes()
+    return finishTime - startTime
+
+  @property
+  def durationFormatted(self):
+    return format_time_diff(*self._start_finish_datetimes())
 
   def kill(self):
-    self.jt.kill_job(self.job.jobID)
+    self.jt.kill_job(self.jt.thriftjobid_from_string(self.jobId))
 
   def get_task(self, id):
-    try:
+    # Only look in the tasks if they were fetched already
+    if self._tasks is not None and id in self.task_map:
       return self.task_map[id]
-    except:
-      return JobLinkage.get_task(self, id)
+    return JobLinkage.get_task(self, id)
 
   def filter_tasks(self, task_types=None, task_states=None, task_text=None):
     """
@@ -226,21 +327,54 @@ class Job(JobLinkage):
     return [ t for t in self.tasks if is_good_match(t) ]
 
   def _initialize_conf_keys(self):
-    conf_keys = [
-      'mapred.mapper.class',
-      'mapred.reducer.class',
-      'mapred.input.format.class',
-      'mapred.output.format.class',
-      'mapred.input.dir',
-      'mapred.output.dir',
-      ]
-    jobconf = get_jobconf(self.jt, self.jobId)
+    self._set_conf(get_jobconf(self.jt, self.jobId))
+
+  def _set_conf(self, jobconf):
     self._full_job_conf = jobconf
     self._conf_keys = {}
     for k, v in jobconf.iteritems():
-      if k in conf_keys:
+      if k in JOB_CONF_KEYS:
         self._conf_keys[dots_to_camel_case(k)] = v
 
+# The configuration keys shown with the job's metadata (as conf_keys), and
+# kept in the archive
+JOB_CONF_KEYS = (
+  'mapred.mapper.class',
+  'mapred.reducer.class',
+  'mapred.input.format.class',
+  'mapred.output.format.class',
+  'mapred.input.dir',
+  'mapred.output.dir',
+)
+
+
+class JobList(object):
+  """
+  A page of Jobs, from a ThriftJobSummaryList as returned by
+  LiveJobTracker.get_job_summaries(), along with the total number of
+  jobs matching the query.
+  """
+  def __init__(self, jobtracker, joblist):
+    self.__jobsSoFar = [ Job.from_summary(jobtracker, j) for j in joblist.jobs ]
+    self.__nTotalJobs = joblist.numTotalJobs
+
+  def __iter__(self):
+    return self.__jobsSoFar.__iter__()
+
+  def __len__(self):
+    return len(self.__jobsSoFar)
+
+  def __getitem__(self, key):
+    return self.__jobsSoFar[key]
+
+  @property
+  def jobs(self):
+    return self.__jobsSoFar
+
+  @property
+  def numTotalJobs(self):
+    return self.__nTotalJobs
+
 
 class TaskList(object):
   @staticmethod
@@ -252,6 +386,27 @@ class TaskList(object):
     task_types is a set of job_tracker.VALID_TASK_TYPES. A value to None means everything.
     task_states is a set of job_tracker.VALID_TASK_STATES. A value to None means everything.
     """
+    task_types, task_states = TaskList._filter_sets(task_types, task_states)
+    tjobid = jt.thriftjobid_from_string(jobid)
+    thrift_list = jt.get_task_list(tjobid, task_types, task_states, text, count, offset)
+    return TaskList.from_thriftTaskList(thrift_list, jt)
+
+  @staticmethod
+  def select_from(jt, jobid, task_types, task_states, text, cursor, count):
+    """
+    select_from(jt, jobid, task_types, task_states, text, cursor, count) -> TaskList
+
+    Like select(), but for paging through the tasks with cursors: returns
+    count tasks from cursor (None for the first page) on.  The TaskList's
+    nextCursor is where the next page starts ("" after the last page).
+    """
+    task_types, task_states = TaskList._filter_sets(task_types, task_states)
+    tjobid = jt.thriftjobid_from_string(jobid)
+    thrift_page = jt.get_task_page(tjobid, task_types, task_states, text, cursor, count)
+    return TaskList.from_thriftTaskList(thrift_page, jt)
+
+  @staticmethod
+  def _filter_sets(task_types, task_states):
     assert task_types is None or job_tracker.VALID_TASK_TYPES.issuperset(task_types)
     assert task_states is None or job_tracker.VALID_TASK_STATES.issuperset(task_states)
 
@@ -259,14 +414,13 @@ class TaskList(object):
       task_types = job_tracker.VALID_TASK_TYPES
     if task_states is None:
       task_states = job_tracker.VALID_TASK_STATES
-
-    tjobid = jt.thriftjobid_from_string(jobid)
-    thrift_list = jt.get_task_list(tjobid, task_types, task_states, text, count, offset)
-    return TaskList.from_thriftTaskList(thrift_list, jt)
+    return task_types, task_states
 
   @staticmethod
   def from_thriftTaskList(thrift_task_list, jobtracker):
     """TaskList.from_thriftTaskList(thrift_task_list, jobtracker) -> TaskList
+
+    thrift_task_list is a ThriftTaskInProgressList or a ThriftTaskPage.
     """
     if thrift_task_list is None:
       return None
@@ -280,6 +434,7 @@ class TaskList(object):
   def __init_attributes(self):
     self.__tasksSoFar = [ Task(t, self.__jt) for t in self.__tasklist.tasks ]
     self.__nTotalTasks = self.__tasklist.numTotalTasks
+    self.__nextCursor = getattr(self.__tasklist, 'nextCursor', None)
 
   def __iter__(self):
     return self.__tasksSoFar.__iter__()
@@ -298,6 +453,136 @@ class TaskList(object):
   def numTotalTasks(self):
     return self.__nTotalTasks
 
+  @property
+  def nextCursor(self):
+    """The cursor of the next page, for TaskLists from select_from()"""
+    return self.__nextCursor
+
+
+# Order of the task types in the timeline
+_TIMELINE_TASK_TYPES = ("job_setup", "map", "reduce", "job_cleanup")
+# Short form of the task types in task ids
+_TASK_ID_TYPES = {"map": "m", "reduce": "r"}
+
+class TaskTimeline(object):
+  """
+  The start and finish times of every task of a job, from a single
+  ThriftTaskTimeline, i.e., as parallel lists rather than as Tasks.  Also
+  works out what the timeline page shows: the tasks as a Gantt chart, and
+  histograms of their durations per task type.
+  """
+  # Tasks beyond this many are merged into fewer rows of the Gantt chart
+  MAX_GANTT_ROWS = 500
+  HISTOGRAM_BINS = 20
+
+  @staticmethod
+  def from_jobtracker(jt, jobid):
+    thrift_timeline = jt.get_task_timeline(jt.thriftjobid_from_string(jobid))
+    return TaskTimeline(jobid, thrift_timeline)
+
+  def __init__(self, jobid, thrift_timeline):
+    self.jobId = jobid
+    self.currentTimeMs = thrift_timeline.currentTime
+    type_names = ttypes.ThriftTaskType._VALUES_TO_NAMES
+    state_names = ttypes.ThriftTaskQueryState._VALUES_TO_NAMES
+    self.taskNumbers = thrift_timeline.taskNumbers
+    self.taskTypes = [ type_names[t].lower() for t in thrift_timeline.taskTypes ]
+    self.states = [ state_names[s].lower() for s in thrift_timeline.states ]
+    self.startTimes = thrift_timeline.startTimes
+    # Running tasks end now, as far as the chart goes
+    now = self.currentTimeMs
+    self.finishTimes = [ (state == 'running' and now) or max(start, finish)
+                         for state, start, finish in zip(self.states, self.startTimes,
+                                                         thrift_timeline.finishTimes) ]
+    started = [ start for start in self.startTimes if start ]
+    self.startTimeMs = started and min(started) or 0
+    self.finishTimeMs = started and max(self.finishTimes) or 0
+
+  def __len__(self):
+    return len(self.taskNumbers)
+
+  def task_id(self, i):
+    """The id of the i-th task, or None for setup and cleanup tasks."""
+    short_type = _TASK_ID_TYPES.get(self.taskTypes[i])
+    if short_type is None:
+      return None
+    return "task_%s_%s_%06d" % (self.jobId[len("job_"):], short_type, self.taskNumbers[i])
+
+  def _started_by_type(self):
+    """Returns the indexes of the tasks that started, by type, in order of start."""
+    by_type = {}
+    for i, start in enumerate(self.startTimes):
+      if start:
+        by_type.setdefault(self.taskTypes[i], []).append(i)
+    for indexes in by_type.itervalues():
+      indexes.sort(key=self.startTimes.__getitem__)
+    return by_type
+
+  def gantt_rows(self, max_rows=MAX_GANTT_ROWS):
+    """
+    Returns the rows of the Gantt chart of the tasks that started, grouped
+    by type and in order of start.  Each row is a dict of its type, the
+    task id of its first task, how many tasks it has, how many of them
+    failed, and its start and finish times (ms) and offsets (% of the
+    job's duration).  If there are more than max_rows tasks, consecutive
+    tasks of a type share a row, which spans all of them.
+    """
+    by_type = self._started_by_type()
+    n = sum([ len(indexes) for indexes in by_type.itervalues() ])
+    per_row = max(1, (n + max_rows - 1) // max_rows)
+    span = float(max(1, self.finishTimeMs - self.startTimeMs))
+    rows = []
+    for task_type in _TIMELINE_TASK_TYPES:
+      indexes = by_type.get(task_type, [])
+      for first in range(0, len(indexes), per_row):
+        group = indexes[first:first + per_row]
+        start = self.startTimes[group[0]]
+        finish = max([ self.finishTimes[i] for i in group ])
+        rows.append({
+          'type': task_type,
+          'taskId': self.task_id(group[0]),
+          'count': len(group),
+          'failed': len([ i for i in group if self.states[i] == 'failed' ]),
+          'start': start,
+          'finish': finish,
+          'left': 100 * (start - self.startTimeMs) / span,
+          'width': 100 * (finish - start) / span,
+        })
+    return rows
+
+  def duration_histograms(self, bins=HISTOGRAM_BINS):
+    """
+    Returns a histogram of the durations (ms) of the finished tasks of each
+    type, as a list of dicts of the type, the number of tasks, the min,
+    median and max durations, the width of the bins, and the number of
+    tasks in each bin.
+    """
+    durations = {}
+    for task_type, state, start, finish in zip(self.taskTypes, self.states,
+                                               self.startTimes, self.finishTimes):
+      if start and state != 'running':
+        durations.setdefault(task_type, []).append(finish - start)
+    histograms = []
+    for task_type in _TIMELINE_TASK_TYPES:
+      values = durations.get(task_type)
+      if not values:
+        continue
+      values.sort()
+      width = max(1, (values[-1] + bins - 1) // bins)
+      counts = [ 0 ] * bins
+      for value in values:
+        counts[min(value // width, bins - 1)] += 1
+      histograms.append({
+        'type': task_type,
+        'count': len(values),
+        'min': values[0],
+        'median': values[len(values) // 2],
+        'max': values[-1],
+        'binWidth': width,
+        'bins': counts,
+      })
+    return histograms
+
 
 class Task(object):
 
@@ -387,49 +672,74 @@ class TaskAttempt(object):
 
   def get_tracker(self):
     try:
-      tracker = Tracker.from_name(self.task.jt, self.taskTrackerId)
-      return tracker
+      return Tracker.from_name(self.task.jt, self.taskTrackerId)
     except ttypes.TaskTrackerNotFoundException, e:
       LOGGER.warn("Tracker %s not found: %s" % (self.taskTrackerId, e))
-      all_trackers = self.task.jt.all_task_trackers()
-      for t in all_trackers.trackers:
-        LOGGER.debug("Available tracker: %s" % t.trackerName)
       raise ttypes.TaskTrackerNotFoundException(
                           "Cannot lookup TaskTracker '%s'" % (self.taskTrackerId,))
 
-  def get_task_log(self):
-    """
-    get_task_log(task_id) -> (stdout_text, stderr_text, syslog_text)
-
-    Retrieve the task log from the TaskTracker, at this url:
-      http://<tracker_host>:<port>/tasklog?taskid=<attempt_id>
-    Optional query string:
-      &filter=<source>  : where <source> is 'syslog', 'stdout', or 'stderr'.
-      &start=<offset>   : specify the start offset of the log section, when using a filter.
-      &end=<offset>     : specify the end offset of the log section, when using a filter.
-    """
-    tracker = self.get_tracker()
-    url = urlunparse(('http',
-                      '%s:%s' % (tracker.host, tracker.httpPort),
-                      'tasklog',
-                      None,
-                      'taskid=%s' % (self.attemptId,),
-                      None))
-    LOGGER.info('Retrieving %s' % (url,))
-    try:
-      data = urllib2.urlopen(url)
-    except urllib2.URLError:
-      raise urllib2.URLError("Cannot retrieve logs from TaskTracker '%s'" % (self.taskTrackerId,))
+  @property
+  def complete(self):
+    """Whether the attempt is over, so that its logs won't change any more"""
+    return self.state in ('succeeded', 'failed', 'killed')
+
+  def get_task_log(self, sections=tasklog.LOG_SECTIONS, max_bytes=None):
+    """
+    get_task_log() -> [stdout_text, stderr_text, syslog_text]
+
+    Retrieve the end (up to max_bytes) of the given sections of the task log
+    from the TaskTracker, in parallel (see jobbrowser.lib.tasklog).  A
+    section that can't be retrieved is replaced by an error message.
+    """
+    return fetch_task_logs([ (self, section) for section in sections ], max_bytes)
+
+
+def fetch_task_logs(attempt_sections, max_bytes=None, trackers=None):
+  """
+  fetch_task_logs([(attempt, section), ...]) -> [text, ...]
+
+  Retrieves sections of the logs of several TaskAttempts in parallel.
+  trackers maps tracker names to Trackers, e.g. from the JobTracker
+  snapshot; other trackers are looked up.  A section that can't be
+  retrieved is replaced by an error message.
+  """
+  if trackers is None:
+    trackers = {}
+  requests = []
+  errors = {}
+  for i, (attempt, section) in enumerate(attempt_sections):
+    tracker = trackers.get(attempt.taskTrackerId)
+    if tracker is None:
+      try:
+        tracker = attempt.get_tracker()
+      except ttypes.TaskTrackerNotFoundException, e:
+        errors[i] = e
+        requests.append(None)
+        continue
+      trackers[attempt.taskTrackerId] = tracker
+    requests.append((tracker.host, tracker.httpPort, attempt.attemptId, section,
+                     attempt.complete))
+
+  results = tasklog.get_fetcher().fetch_many([ r for r in requests if r is not None ],
+                                             max_bytes)
+  results.reverse()
+  logs = []
+  for i, request in enumerate(requests):
+    if request is None:
+      result = errors[i]
+    else:
+      result = results.pop()
+    if isinstance(result, Exception):
+      attempt = attempt_sections[i][0]
+      result = "Hue encountered an error while retrieving logs of %s from '%s': %s" % \
+          (attempt.attemptId, attempt.taskTrackerId, result)
+    logs.append(result)
+  return logs
 
-    et = lxml.html.parse(data)
-    log_sections = et.findall('body/pre')
-    if len(log_sections) != 3:
-      LOGGER.warn('Error parsing task attempt log for %s at "%s". Found %d (not 3) log sections' %
-                  (self.attemptId, url, len(log_sections)))
-      err = "Hue encountered an error while retrieving logs from '%s'" % (url,)
-      return (err, err, err)
-    return [ section.text for section in log_sections ]
 
+# Number of Trackers kept by Tracker.from_status()
+TRACKER_CACHE_SIZE = 5000
+_tracker_cache = LruCache(TRACKER_CACHE_SIZE)
 
 class Tracker(object):
 
@@ -441,7 +751,30 @@ class Tracker(object):
 
   @staticmethod
   def from_name(jt, trackername):
-    return Tracker(jt.task_tracker(trackername))
+    """
+    Returns the Tracker named trackername, from the JobTracker snapshot;
+    trackers that joined since its last refresh are asked for.  Raises
+    TaskTrackerNotFoundException.
+    """
+    status = jt.snapshot().tracker(trackername)
+    if status is not None:
+      return Tracker.from_status(status)
+    status = jt.task_tracker(trackername)
+    if status is None:
+      raise ttypes.TaskTrackerNotFoundException()
+    return Tracker(status)
+
+  @staticmethod
+  def from_status(status):
+    """
+    Returns the Tracker of a ThriftTaskTrackerStatus of the snapshot.  It is
+    only built once per status, i.e., once per refresh of the snapshot.
+    """
+    tracker = _tracker_cache.get(status.trackerName)
+    if tracker is None or tracker.tracker is not status:
+      tracker = Tracker(status)
+      _tracker_cache.put(status.trackerName, tracker)
+    return tracker
 
   def __init__(self, thrifttracker):
     self.tracker = thrifttracker
@@ -498,15 +831,552 @@ class Cluster(object):
     # self.currentTimeMs = curtime
     # self.currentTimeFormatted = format_unixtime_ms(curtime)
 
+# Jobs in these states (as in Job.status) won't change any more
+FINISHED_JOB_STATES = ("SUCCEEDED", "FAILED", "KILLED")
+
+# The kinds of rollups, as keys of the counters dicts
+_ROLLUP_KINDS = ("map", "reduce", "total")
+
+def counters_from_rollups(rollups):
+  """
+  Turns a ThriftJobCounterRollups, which has counter lists for maps,
+  reduces, and total, into a dict of group name to
+    {'name':..., 'displayName':..., 'counters': {counter name: counter}}
+  where each counter is
+    {'name':..., 'displayName':..., 'map':..., 'reduce':..., 'total':...}
+  """
+  result = {}
+  for key, ctrs_from_jt in zip(_ROLLUP_KINDS, (rollups.mapCounters,
+                                               rollups.reduceCounters,
+                                               rollups.jobCounters)):
+    for group in ctrs_from_jt.groups:
+      if group.name not in result:
+        result[group.name] = {
+          'name': group.name,
+          'displayName': group.displayName,
+          'counters': {}
+          }
+      agg_counters = result[group.name]['counters']
+      for counter in group.counters.itervalues():
+        if counter.name not in agg_counters:
+          agg_counters[counter.name] = {
+            'name': counter.name,
+            'displayName': counter.displayName,
+            }
+        agg_counters[counter.name][key] = counter.value
+  return result
+
+
+def _datetime_from_ms(unixtime_ms):
+  if not unixtime_ms:
+    return None
+  return datetime.datetime.fromtimestamp(unixtime_ms / 1000.0)
+
+
+class JobCounters(models.Model):
+  """
+  The counters of a finished job, which won't change any more.  They are
+  stored so that they needn't be fetched from the JobTracker again, and
+  so that runs of the same job can be compared (see compare_counters).
+  """
+  # Longer names are truncated
+  MAX_NAME_LENGTH = 255
+
+  job_id = models.CharField(max_length=64, unique=True)
+  job_name = models.CharField(max_length=MAX_NAME_LENGTH, db_index=True)
+  user = models.CharField(max_length=64, db_index=True)
+  state = models.CharField(max_length=16)
+  start_time = models.DateTimeField(null=True)
+  finish_time = models.DateTimeField(null=True, db_index=True)
+  # JSON-encoded list of [group name, group display name, counters], where
+  # counters is a list of [name, display name, map, reduce, total].
+  counters = models.TextField()
+
+  class Meta:
+    ordering = ['-finish_time']
+
+  @staticmethod
+  def lookup(job_id):
+    try:
+      return JobCounters.objects.get(job_id=job_id)
+    except JobCounters.DoesNotExist:
+      return None
+
+  @staticmethod
+  def record(job_id, job_name, user, state, start_time_ms, finish_time_ms, rollups):
+    """Stores the ThriftJobCounterRollups of a finished job."""
+    compact = []
+    for group in counters_from_rollups(rollups).itervalues():
+      compact.append([group['name'], group['displayName'],
+                      [ [ c['name'], c['displayName'] ] + [ c.get(kind) for kind in _ROLLUP_KINDS ]
+                        for c in group['counters'].itervalues() ]])
+    record = JobCounters(job_id=job_id,
+                         job_name=(job_name or '')[:JobCounters.MAX_NAME_LENGTH],
+                         user=user,
+                         state=state,
+                         start_time=_datetime_from_ms(start_time_ms),
+                         finish_time=_datetime_from_ms(finish_time_ms),
+                         counters=simplejson.dumps(compact, separators=(',', ':')))
+    try:
+      record.save()
+    except IntegrityError:
+      # Recorded concurrently
+      LOGGER.debug("Counters of %s are already stored" % (job_id,))
+    return record
+
+  def get_counters(self):
+    """Returns the counters, as per counters_from_rollups()."""
+    result = {}
+    for group_name, group_display_name, counters in simplejson.loads(self.counters):
+      group_counters = {}
+      for counter in counters:
+        name, display_name, values = counter[0], counter[1], counter[2:]
+        c = dict(name=name, displayName=display_name)
+        for kind, value in zip(_ROLLUP_KINDS, values):
+          if value is not None:
+            c[kind] = value
+        group_counters[name] = c
+      result[group_name] = dict(name=group_name, displayName=group_display_name,
+                                counters=group_counters)
+    return result
+
+
+def compare_counters(records):
+  """
+  compare_counters([JobCounters, ...]) -> [row, ...]
+
+  Lines up the counters of several jobs.  Each row is a dict with the
+  group and counter display names, the 'values' (one per job, None where
+  a job lacks the counter) and their 'min', 'max' and 'mean'.  A value is
+  the sum of the map, reduce and job-scoped values of the counter.  Rows
+  are sorted by group and counter name.
+  """
+  rows = {}
+  for i, record in enumerate(records):
+    for group in record.get_counters().itervalues():
+      for counter in group['counters'].itervalues():
+        key = (group['name'], counter['name'])
+        if key not in rows:
+          rows[key] = dict(groupDisplayName=group['displayName'],
+                           displayName=counter['displayName'],
+                           values=[ None ] * len(records))
+        # Job-scoped counters (e.g., launched tasks) only have a 'total'
+        rows[key]['values'][i] = sum(counter.get(kind, 0) for kind in _ROLLUP_KINDS)
+
+  result = []
+  for key in sorted(rows):
+    row = rows[key]
+    present = [ v for v in row['values'] if v is not None ]
+    row['min'] = min(present)
+    row['max'] = max(present)
+    row['mean'] = float(sum(present)) / len(present)
+    result.append(row)
+  return result
+
+
+class ArchivedTask(object):
+  """
+  The few fields kept of a task of an ArchivedJob; enough to list it.
+  """
+  def __init__(self, task_id, task_type, state):
+    self.taskId = task_id
+    self.taskId_short = "_".join(task_id.split("_")[-2:])
+    self.taskType = task_type
+    self.state = state
+
+
+# Columns the archive is sorted by, by hadoop.job_tracker.VALID_JOB_SORT_KEYS,
+# in the order of hadoop.job_index.JOB_SORT_KEYS.  "lower_" columns are the
+# lowercased field.  Ties are ordered by job id.
+_ARCHIVE_SORT_COLUMNS = {
+  None: (),
+  "job_id": (),
+  "name": ("lower_name",),
+  "user": ("lower_user",),
+  "queue": ("lower_queue",),
+  "state": ("run_state",),
+  "priority": ("priority",),
+  "start_time": ("start_time",),
+  "finish_time": ("finish_time",),
+}
+_JOB_ID_COLUMNS = ("jobtracker_id", "job_number")
+
+# Job ids looked up per query, so as not to hit the database's limit on
+# query parameters
+_ID_CHUNK_SIZE = 500
+
+def _chunks(items, size=_ID_CHUNK_SIZE):
+  for i in xrange(0, len(items), size):
+    yield items[i:i + size]
+
+
+class ArchivedJob(models.Model):
+  """
+  A copy of a finished job, so that it can still be shown once the
+  JobTracker has retired it.  Its counters are in JobCounters.
+
+  Jobs are archived as they finish (see JobArchiver), but are only listed
+  from here once retired; until then they are listed from the JobTracker
+  snapshot.  The summary fields are columns, indexed for queries; the rest
+  is in details.
+  """
+  # Longer names are truncated
+  MAX_NAME_LENGTH = 255
+  # Failed and recent tasks kept of each job, as many as job.mako shows
+  MAX_TASKS = 5
+
+  job_id = models.CharField(max_length=64, unique=True)
+  # The parts of the ThriftJobID, which job ids sort by
+  jobtracker_id = models.CharField(max_length=64)
+  job_number = models.IntegerField()
+  name = models.CharField(max_length=MAX_NAME_LENGTH, db_index=True)
+  user = models.CharField(max_length=64, db_index=True)
+  queue = models.CharField(max_length=128)
+  run_state = models.IntegerField(db_index=True)   # ThriftJobState
+  priority = models.IntegerField()                 # ThriftJobPriority
+  desired_maps = models.IntegerField()
+  desired_reduces = models.IntegerField()
+  finished_maps = models.IntegerField()
+  finished_reduces = models.IntegerField()
+  start_time = models.DateTimeField(null=True, db_index=True)
+  finish_time = models.DateTimeField(null=True, db_index=True)
+  retired = models.BooleanField(default=False, db_index=True)
+  # JSON-encoded dict of the other fields of the job (times in ms, as in
+  # the JobTracker), its configuration (JOB_CONF_KEYS only), and its
+  # failed and recent tasks, as lists of [task id, task type, state].
+  details = models.TextField()
+
+  class Meta:
+    ordering = ['-finish_time']
+
+  @staticmethod
+  def lookup(job_id):
+    try:
+      return ArchivedJob.objects.get(job_id=job_id)
+    except ArchivedJob.DoesNotExist:
+      return None
+
+  @staticmethod
+  def record(job, jobconf, failed_tasks, recent_tasks):
+    """
+    Archives a finished job, given its ThriftJobInProgress, its
+    configuration, and its failed and most recent ThriftTaskInProgress
+    (enums fixed up).
+    """
+    def task_list(tasks):
+      return [ [ t.taskID.asString, t.taskID.taskTypeAsString, t.state ]
+               for t in tasks[:ArchivedJob.MAX_TASKS] ]
+
+    details = {
+      'jobFile': job.profile.jobFile,
+      'launchTime': job.launchTime,
+      'startTime': job.startTime,
+      'finishTime': job.finishTime,
+      'mapProgress': job.status.mapProgress,
+      'reduceProgress': job.status.reduceProgress,
+      'setupProgress': job.status.setupProgress,
+      'cleanupProgress': job.status.cleanupProgress,
+      'schedulingInfo': job.status.schedulingInfo,
+      'conf': dict((k, jobconf[k]) for k in JOB_CONF_KEYS if k in jobconf),
+      'failedTasks': task_list(failed_tasks),
+      'recentTasks': task_list(recent_tasks),
+    }
+    record = ArchivedJob(job_id=job.jobID.asString,
+                         jobtracker_id=job.jobID.jobTrackerID,
+                         job_number=job.jobID.jobID,
+                         name=(job.profile.name or '')[:ArchivedJob.MAX_NAME_LENGTH],
+                         user=job.profile.user,
+                         queue=job.profile.queueName,
+                         run_state=job.status.runState,
+                         priority=job.priority,
+                         desired_maps=job.desiredMaps,
+                         desired_reduces=job.desiredReduces,
+                         finished_maps=job.finishedMaps,
+                         finished_reduces=job.finishedReduces,
+                         start_time=_datetime_from_ms(job.startTime),
+                         finish_time=_datetime_from_ms(job.finishTime),
+                         details=simplejson.dumps(details, separators=(',', ':')))
+    try:
+      record.save()
+    except IntegrityError:
+      # Archived concurrently
+      LOGGER.debug("Job %s is already archived" % (job.jobID.asString,))
+    return record
+
+  @staticmethod
+  def retire(job_ids):
+    """Notes that the JobTracker no longer has the jobs of job_ids."""
+    for chunk in _chunks(list(job_ids)):
+      ArchivedJob.objects.filter(job_id__in=chunk).update(retired=True)
+
+  @staticmethod
+  def query(job_states=None, user=None, queue=None, text=None,
+            sort_key=None, descending=False, count=-1, offset=0):
+    """
+    Returns (page, total) like hadoop.job_index.JobIndex.query(), of the
+    retired jobs, as ThriftJobSummary.  Only the database is queried.
+    """
+    jobs = ArchivedJob.objects.filter(retired=True)
+    if job_states:
+      jobs = jobs.filter(run_state__in=[ ttypes.ThriftJobState._NAMES_TO_VALUES[s.upper()]
+                                         for s in job_states ])
+    if user:
+      jobs = jobs.filter(user__icontains=user)
+    if queue:
+      jobs = jobs.filter(queue__icontains=queue)
+    if text:
+      matches = Q(user__icontains=text) | Q(name__icontains=text) | \
+          Q(job_id__icontains=text) | Q(queue__icontains=text)
+      priorities = [ value for name, value in ttypes.ThriftJobPriority._NAMES_TO_VALUES.iteritems()
+                     if text.lower() in name.lower() ]
+      if priorities:
+        matches |= Q(priority__in=priorities)
+      jobs = jobs.filter(matches)
+
+    columns = _ARCHIVE_SORT_COLUMNS[sort_key] + _JOB_ID_COLUMNS
+    lowered = [ c for c in columns if c.startswith("lower_") ]
+    if lowered:
+      jobs = jobs.extra(select=dict(
+        (c, "LOWER(%s)" % connection.ops.quote_name(c[len("lower_"):])) for c in lowered))
+    if descending:
+      columns = [ "-" + c for c in columns ]
+    jobs = jobs.order_by(*columns)
+
+    total = jobs.count()
+    if count < 0:
+      page = jobs[offset:]
+    else:
+      page = jobs[offset:offset + count]
+    return [ archived.to_summary() for archived in page ], total
+
+  def get_details(self):
+    if not hasattr(self, '_details'):
+      self._details = simplejson.loads(self.details)
+    return self._details
+
+  def get_conf(self):
+    """Returns the archived configuration (JOB_CONF_KEYS only)."""
+    return self.get_details()['conf']
+
+  @property
+  def failed_tasks(self):
+    return [ ArchivedTask(*task) for task in self.get_details()['failedTasks'] ]
+
+  @property
+  def recent_tasks(self):
+    return [ ArchivedTask(*task) for task in self.get_details()['recentTasks'] ]
+
+  def _thrift_job_id(self):
+    return ttypes.ThriftJobID(jobTrackerID=self.jobtracker_id, jobID=self.job_number,
+                              asString=self.job_id)
+
+  def to_summary(self):
+    """Returns the job as a ThriftJobSummary, with its enums fixed up."""
+    details = self.get_details()
+    summary = ttypes.ThriftJobSummary(jobID=self._thrift_job_id(),
+                                      name=self.name,
+                                      user=self.user,
+                                      queueName=self.queue,
+                                      runState=self.run_state,
+                                      priority=self.priority,
+                                      mapProgress=details['mapProgress'],
+                                      reduceProgress=details['reduceProgress'],
+                                      desiredMaps=self.desired_maps,
+                                      desiredReduces=self.desired_reduces,
+                                      finishedMaps=self.finished_maps,
+                                      finishedReduces=self.finished_reduces,
+                                      startTime=details['startTime'],
+                                      finishTime=details['finishTime'])
+    fixup_enums(summary, {"runState":ttypes.ThriftJobState, "priority":ttypes.ThriftJobPriority})
+    return summary
+
+  def to_thriftjob(self):
+    """Returns the job as a ThriftJobInProgress without tasks, with its enums fixed up."""
+    details = self.get_details()
+    jobid = self._thrift_job_id()
+    profile = ttypes.ThriftJobProfile(user=self.user,
+                                      jobID=jobid,
+                                      jobFile=details['jobFile'],
+                                      name=self.name,
+                                      queueName=self.queue)
+    status = ttypes.ThriftJobStatus(jobID=jobid,
+                                    mapProgress=details['mapProgress'],
+                                    reduceProgress=details['reduceProgress'],
+                                    cleanupProgress=details['cleanupProgress'],
+                                    setupProgress=details['setupProgress'],
+                                    runState=self.run_state,
+                                    startTime=details['startTime'],
+                                    user=self.user,
+                                    priority=self.priority,
+                                    schedulingInfo=details['schedulingInfo'])
+    job = ttypes.ThriftJobInProgress(profile=profile,
+                                     status=status,
+                                     jobID=jobid,
+                                     desiredMaps=self.desired_maps,
+                                     desiredReduces=self.desired_reduces,
+                                     finishedMaps=self.finished_maps,
+                                     finishedReduces=self.finished_reduces,
+                                     priority=self.priority,
+                                     startTime=details['startTime'],
+                                     finishTime=details['finishTime'],
+                                     launchTime=details['launchTime'])
+    fixup_enums(status, {"runState":ttypes.ThriftJobState, "priority":ttypes.ThriftJobPriority})
+    fixup_enums(job, {"priority":ttypes.ThriftJobPriority})
+    return job
+
+
+# Number of times JobArchiver tries to archive a job before giving up on it
+MAX_ARCHIVE_ATTEMPTS = 3
+
+class JobArchiver(object):
+  """
+  Archives jobs (see ArchivedJob), and stores their counters (see
+  JobCounters), as they finish; and notes when the JobTracker retires them.
+
+  It listens to a JobTrackerSnapshot (see add_listener), which only queues
+  the ids of the jobs, since listeners run in the refreshing thread.  The
+  archiving itself is done by run_pending(), in the jobbrowserd daemon.
+  Jobs already finished when the snapshot is first loaded are archived too.
+  """
+  def __init__(self):
+    self._lock = threading.Lock()
+    self._queued = threading.Event()
+    self._finished = set()      # ids of finished jobs to archive
+    self._removed = []          # ids of jobs the JobTracker retired
+    self._live = None           # ids of every job, after a full refresh
+    self._attempts = { }        # job id -> failed attempts to archive it
+
+  def __call__(self, snapshot, changes):
+    self._lock.acquire()
+    try:
+      self._removed.extend(jobid.asString for jobid in changes.removed)
+      if changes.full:
+        self._live = set(summary.jobID.asString for summary in changes.changed)
+      for summary in changes.changed:
+        if summary.runStateAsString in FINISHED_JOB_STATES:
+          self._finished.add(summary.jobID.asString)
+    finally:
+      self._lock.release()
+    self._queued.set()
+
+  def wait(self, timeout):
+    """Waits up to timeout seconds for the snapshot to queue more jobs."""
+    self._queued.wait(timeout)
+    self._queued.clear()
+
+  def run_pending(self, snapshot):
+    """
+    Notes the retired jobs, and archives the finished jobs queued so far.
+    Returns whether there was anything to do.
+    """
+    self._lock.acquire()
+    try:
+      finished, self._finished = self._finished, set()
+      retired, self._removed = self._removed, []
+      live, self._live = self._live, None
+    finally:
+      self._lock.release()
+    if not (finished or retired or live is not None):
+      return False
+
+    if live is not None:
+      # The jobs retired while nobody was watching
+      retired.extend(job_id for job_id in
+                     ArchivedJob.objects.filter(retired=False).values_list('job_id', flat=True)
+                     if job_id not in live)
+    ArchivedJob.retire(retired)
+    finished.difference_update(retired)
+    for chunk in _chunks(list(finished)):
+      finished.difference_update(
+        ArchivedJob.objects.filter(job_id__in=chunk).values_list('job_id', flat=True))
+
+    pending = list(finished)
+    try:
+      while pending:
+        try:
+          self._archive(snapshot, pending[-1])
+        except ttypes.JobNotFoundException:
+          pass
+        except TTransportException:
+          # The JobTracker is unreachable, rather than the job at fault
+          raise
+        except Exception:
+          self._archive_failed(pending[-1])
+        else:
+          self._attempts.pop(pending[-1], None)
+        pending.pop()
+    finally:
+      if pending:
+        # Try the others again next time
+        self._requeue(pending)
+    return True
+
+  def _archive_failed(self, job_id):
+    """Retries job_id next time, up to MAX_ARCHIVE_ATTEMPTS attempts."""
+    attempts = self._attempts.pop(job_id, 0) + 1
+    if attempts < MAX_ARCHIVE_ATTEMPTS:
+      LOGGER.warn("Failed to archive %s, will retry" % (job_id,), exc_info=True)
+      self._attempts[job_id] = attempts
+      self._requeue([ job_id ])
+    else:
+      LOGGER.exception("Failed to archive %s %d times, giving up" % (job_id, attempts))
+
+  def _requeue(self, job_ids):
+    self._lock.acquire()
+    try:
+      self._finished.update(job_ids)
+    finally:
+      self._lock.release()
+
+  def _archive(self, snapshot, job_id):
+    jt, context = snapshot.jt, snapshot.request_context
+    jobid = jt.thriftjobid_from_string(job_id)
+    job = jt.client.getJobNoTasks(context, jobid)
+    jt._fixup_job(job)
+    if JobCounters.lookup(job_id) is None:
+      rollups = jt.client.getJobCounterRollups(context, jobid)
+      JobCounters.record(job_id, job.profile.name, job.profile.user,
+                         job.status.runStateAsString, job.startTime, job.finishTime, rollups)
+    try:
+      jobconf = confparse.ConfParse(jt.client.getJobConfXML(context, jobid))
+    except IOException:
+      # E.g. the JobTracker cleaned up <log dir>/<job id>_conf.xml
+      LOGGER.warn("No conf to archive with %s" % (job_id,), exc_info=True)
+      jobconf = { }
+
+    def top_tasks(states, newest_first):
+      tip_list = jt.client.getTopTasks(context, jobid,
+        [ ttypes.ThriftTaskQueryState._NAMES_TO_VALUES[s] for s in states ],
+        ArchivedJob.MAX_TASKS, newest_first)
+      for tip in tip_list.tasks:
+        jt._fixup_task_in_progress(tip)
+      return tip_list.tasks
+
+    ArchivedJob.record(job, jobconf,
+                       top_tasks(["FAILED"], False),
+                       top_tasks(["RUNNING", "SUCCEEDED"], True))
+
+
+# Number of parsed job confs kept by get_jobconf()
+JOBCONF_CACHE_SIZE = 100
+_jobconf_cache = LruCache(JOBCONF_CACHE_SIZE)
+
 def get_jobconf(jt, jobid):
   """
   Returns a dict representation of the jobconf for the job corresponding
-  to jobid. filter_keys is an optional list of configuration keys to filter on.
+  to jobid.
+
+  A job's conf doesn't change once it is submitted, so the parsed confs of
+  the most recently used jobs are cached.  Don't modify the dict returned.
   """
-  jid = jt.thriftjobid_from_string(jobid)
-  # This will throw if the the jobconf can't be found
-  xml_data = jt.get_job_xml(jid)
-  return confparse.ConfParse(xml_data)
+  jobconf = _jobconf_cache.get(jobid)
+  if jobconf is None:
+    jid = jt.thriftjobid_from_string(jobid)
+    # This will throw if the the jobconf can't be found
+    xml_data = jt.get_job_xml(jid)
+    jobconf = confparse.ConfParse(xml_data)
+    _jobconf_cache.put(jobid, jobconf)
+  return jobconf
 
 def format_unixtime_ms(unixtime):
   """
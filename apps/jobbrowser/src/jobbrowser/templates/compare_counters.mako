@@ -0,0 +1,70 @@
+## Licensed to Cloudera, Inc. under one
+## or more contributor license agreements.  See the NOTICE file
+## distributed with this work for additional information
+## regarding copyright ownership.  Cloudera, Inc. licenses this file
+## to you under the Apache License, Version 2.0 (the
+## "License"); you may not use this file except in compliance
+## with the License.  You may obtain a copy of the License at
+##
+##     http://www.apache.org/licenses/LICENSE-2.0
+##
+## Unless required by applicable law or agreed to in writing, software
+## distributed under the License is distributed on an "AS IS" BASIS,
+## WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+## See the License for the specific language governing permissions and
+## limitations under the License.
+<%
+  from jobbrowser.views import format_counter_name
+%>
+
+<%namespace name="comps" file="jobbrowser_components.mako" />
+
+  ${comps.header("Counters of " + name + " :: Job Browser")}
+
+  <div id="job_browser_compare_counters" class="view jframe_padded">
+    <h1>Counters of the last ${len(records)} finished runs of ${name}
+    % if user_filter:
+      by ${user_filter}
+    % endif
+    </h1>
+    % if not records:
+      <p>No finished runs of ${name} have been recorded.</p>
+    % else:
+    <table class="ccs-data_table jt_counter_table" cellpadding="0" cellspacing="0">
+      <thead>
+        <tr>
+          <th class="jt_counter_display_name">Name</th>
+          % for record in records:
+          <th><a href="${url('jobbrowser.views.single_job', jobid=record.job_id)}" class="jt_slide_right"
+                 title="${record.state.lower()}, finished ${record.finish_time}">${"_".join(record.job_id.split("_")[-2:])}</a></th>
+          % endfor
+          <th>Min</th>
+          <th>Mean</th>
+          <th>Max</th>
+        </tr>
+      </thead>
+      <tbody>
+      <% group = None %>
+      % for row in rows:
+        % if row['groupDisplayName'] != group:
+        <% group = row['groupDisplayName'] %>
+        <tr>
+          <td colspan="${len(records) + 4}" class="jt_counter_group_name">${format_counter_name(group)}</td>
+        </tr>
+        % endif
+        <tr>
+          <td class="jt_counter_display_name">${format_counter_name(row['displayName'])}</td>
+          % for value in row['values']:
+          <td>${value is None and "-" or value}</td>
+          % endfor
+          <td>${row['min']}</td>
+          <td>${"%.1f" % row['mean']}</td>
+          <td>${row['max']}</td>
+        </tr>
+      % endfor
+      </tbody>
+    </table>
+    % endif
+  </div>
+
+  ${comps.footer()}
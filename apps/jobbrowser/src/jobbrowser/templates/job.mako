@@ -34,8 +34,12 @@
         <tr>
           <td class="task_table_id">${task.taskId_short}</td>
           <td class="task_table_type">${task.taskType}</td>
+          % if job.archived:
+          <td class="jtask_view_col"></td>
+          % else:
           <td class="jtask_view_col"><a class="frame_tip jtask_view jt_slide_right" title="View this task"
                  href="${ url('jobbrowser.views.single_task', jobid=job.jobId, taskid=task.taskId) }"></a></td>
+          % endif
         </tr>
       % endfor
     </tbody>
@@ -86,7 +90,7 @@
         </dl>
         <dl>
           <dt>Status</dt>
-          <dd>${job.status.lower()}</dd>
+          <dd>${job.status.lower()}${job.archived and " (retired)" or ""}</dd>
           <dt>Output</dt>
           <dd>
           <%
@@ -106,7 +110,11 @@
         <dl>
           <dt>Kill Job:</dt>
           <dd>
-          <a href="${url('jobbrowser.views.kill_job', jobid=job.jobId)}" class="frame_tip jt_kill confirm_and_post" title="Kill this job">kill</a>
+          % if kill_status == 'pending':
+            <span class="jt_kill_pending">kill pending</span>
+          % else:
+            <a href="${url('jobbrowser.views.kill_job', jobid=job.jobId)}" class="frame_tip jt_kill confirm_and_post" title="${kill_status == 'timed_out' and 'The last kill timed out. Kill this job again' or 'Kill this job'}">kill</a>
+          % endif
           </dd>
         </dl>
         % endif
@@ -138,7 +146,9 @@
             %if failed_tasks:
             <div class="jt_task_list jt_failed_tasks ccs-inline" style="width: ${task_table_size};">
               <h3>
+                % if not job.archived:
                 <a class="ccs-right" href="${url('jobbrowser.views.tasks', jobid=job.jobId)}?taskstate=failed">view failed tasks &raquo;</a>
+                % endif
                 Failed Tasks
               </h3>
               <div class="jt_task_list_container">
@@ -148,7 +158,10 @@
             %endif
             <div class="jt_task_list jt_recent_tasks ccs-inline" style="width: ${task_table_size}">
               <h3>
+                % if not job.archived:
                 <a class="ccs-right" href="${url('jobbrowser.views.tasks', jobid=job.jobId)}">view all tasks &raquo;</a>
+                <a class="ccs-right" href="${url('jobbrowser.views.job_timeline', jobid=job.jobId)}">view timeline &raquo;&nbsp;</a>
+                % endif
                 Recent Tasks
               </h3>
               <div class="jt_task_list_container">
@@ -210,6 +223,7 @@
             </table>
           </li>
           <li>
+            <a class="ccs-right" href="${url('jobbrowser.views.compare_job_counters')}?name=${job.jobName | u}">compare with other runs &raquo;</a>
             ${comps.job_counters(job.counters)}
           </li>
         </ul>
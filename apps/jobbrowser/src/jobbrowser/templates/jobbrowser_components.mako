@@ -83,7 +83,7 @@
       <%
         map_count = counter.get('map', 0)
         reduce_count = counter.get('reduce', 0)
-        job_count = counter.get('job', 0)
+        job_count = counter.get('total', 0)
       %>
        <tr>
           <td class="jt_counter_display_name">${format_counter_name(counter.get('displayName', 'n/a'))}</td>
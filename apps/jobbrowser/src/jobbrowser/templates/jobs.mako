@@ -22,14 +22,41 @@
 %   if option == state:
       selected="true"
 %   endif
+</%def>
+<%def name="pageref(num)">
+  href="?page=${num}&${filter_params}"
+</%def>
+<%def name="prevpage()">
+  ${pageref(page.previous_page_number())}
+</%def>
+<%def name="nextpage()">
+  ${pageref(page.next_page_number())}
+</%def>
+<%def name="toppage()">
+  ${pageref(1)}
+</%def>
+<%def name="bottompage()">
+  ${pageref(page.num_pages())}
 </%def>
 
-    % if len(jobs) > 0 or filtered:
+    % if page.total_count() > 0 or filtered:
       ${comps.header("Job Browser", toolbar=False)}
       <div id="job_browser_list" class="view">
         <h1 class="ccs-hidden">Jobs</h1>
         <div class="toolbar">
           <a href="/jobbrowser/jobs/"><img src="/jobbrowser/static/art/icon_large.png" class="jt_icon"/></a>
+          <div class="jtv_nav">
+            <div class="ccs-inline">
+              Showing ${page.start_index()} to ${page.end_index()} of ${page.total_count()} jobs
+            </div>
+            <div class="jtv_offset_controls ccs-inline">
+              <a title="First Page" class="jtv_offset_begin" ${toppage()}>First Page</a>
+              <a title="Previous Page" class="jtv_offset_previous" ${prevpage()}>Previous Page</a>
+              <div class="jtv_nav_pages">page <span class="jtv_page">${page.number} of ${page.num_pages()}</span></div>
+              <a title="Next Page" class="jtv_offset_next" ${nextpage()}>Next Page</a>
+              <a title="Last Page" class="jtv_offset_end" ${bottompage()}>Last Page</a>
+            </div>
+          </div>
           <ul class="jt_filters">
             <form class="jt_filter_form submit_on_change" method="get" action="/jobbrowser/jobs/">
               <li class="ccs-inline"><b>Filter Jobs:</b></li>
@@ -95,7 +122,11 @@
               <td>${job.startTimeFormatted}</td>
               <td>
                 % if job.status.lower() == 'running' or job.status.lower() == 'pending':
-                  <a href="${url('jobbrowser.views.kill_job', jobid=job.jobId)}" class="frame_tip jt_kill confirm_and_post" title="Kill this job">kill</a>
+                  % if kill_status(job.jobId) == 'pending':
+                    <span class="jt_kill_pending">kill pending</span>
+                  % else:
+                    <a href="${url('jobbrowser.views.kill_job', jobid=job.jobId)}" class="frame_tip jt_kill confirm_and_post" title="Kill this job">kill</a>
+                  % endif
                 % endif
               </td>
               <td><a href="${url('jobbrowser.views.single_job', jobid=job.jobId)}" class="frame_tip jt_view jt_slide_right" title="View this job">view</a></td>
@@ -117,6 +117,11 @@
             <td>${t.execFinishTimeFormatted}</td>
             <td><a href="/jobbrowser/jobs/${jobid}/tasks/${t.taskId}" class="jt_slide_right">Attempts</a></td>
          </tr>
+         % if log_tails.get(t.taskId):
+         <tr class="jt_log_tail">
+            <td colspan="8"><pre>${log_tails[t.taskId] | h}</pre></td>
+         </tr>
+         % endif
         %endfor
       </tbody>
     </table>
@@ -0,0 +1,72 @@
+## Licensed to Cloudera, Inc. under one
+## or more contributor license agreements.  See the NOTICE file
+## distributed with this work for additional information
+## regarding copyright ownership.  Cloudera, Inc. licenses this file
+## to you under the Apache License, Version 2.0 (the
+## "License"); you may not use this file except in compliance
+## with the License.  You may obtain a copy of the License at
+##
+##     http://www.apache.org/licenses/LICENSE-2.0
+##
+## Unless required by applicable law or agreed to in writing, software
+## distributed under the License is distributed on an "AS IS" BASIS,
+## WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+## See the License for the specific language governing permissions and
+## limitations under the License.
+<%namespace name="comps" file="jobbrowser_components.mako" />
+
+<%def name="duration(ms)">${"%.1fs" % (ms / 1000.0)}</%def>
+
+  ${comps.header("Timeline of " + jobid + " :: Job Browser")}
+
+  <div id="job_browser_timeline" class="view jframe_padded">
+    <h1>Timeline of <a href="${url('jobbrowser.views.single_job', jobid=jobid)}" class="jt_slide_right">${job_name}</a></h1>
+    % if not rows:
+      <p>No task of ${jobid} has started yet.</p>
+    % else:
+    <p>
+      ${len(timeline)} tasks, ${duration(timeline.finishTimeMs - timeline.startTimeMs)} from the start of the first one.
+      <% per_row = max([ row['count'] for row in rows ]) %>
+      % if per_row > 1:
+        Each row spans up to ${per_row} consecutive tasks of a type.
+      % endif
+    </p>
+    <div class="jt_gantt">
+      % for row in rows:
+      <div class="jt_gantt_row">
+        <span class="jt_gantt_label">
+          % if row['taskId']:
+          <a href="${url('jobbrowser.views.single_task', jobid=jobid, taskid=row['taskId'])}" class="jt_slide_right">${"_".join(row['taskId'].split("_")[-2:])}</a>
+          % else:
+          ${row['type']}
+          % endif
+        </span>
+        <span class="jt_gantt_track">
+          <span class="jt_gantt_bar jt_gantt_${row['type']}${row['failed'] and ' jt_gantt_failed' or ''}"
+                style="left: ${"%.3f" % row['left']}%; width: ${"%.3f" % max(row['width'], 0.1)}%;"
+                title="${row['type']}: ${row['count']} task(s), ${row['failed']} failed, ${duration(row['finish'] - row['start'])}"></span>
+        </span>
+      </div>
+      % endfor
+    </div>
+
+    % for histogram in histograms:
+    <h2>Durations of the ${histogram['count']} finished ${histogram['type']} tasks</h2>
+    <p>min ${duration(histogram['min'])}, median ${duration(histogram['median'])}, max ${duration(histogram['max'])}</p>
+    <% highest = max(histogram['bins']) %>
+    <table class="ccs-data_table jt_histogram" cellpadding="0" cellspacing="0">
+      <tbody>
+      % for i, count in enumerate(histogram['bins']):
+        <tr>
+          <td class="jt_histogram_range">${duration(i * histogram['binWidth'])} - ${duration((i + 1) * histogram['binWidth'])}</td>
+          <td class="jt_histogram_count">${count}</td>
+          <td><span class="jt_histogram_bar jt_gantt_${histogram['type']}" style="width: ${100 * count // highest}%;"></span></td>
+        </tr>
+      % endfor
+      </tbody>
+    </table>
+    % endfor
+    % endif
+  </div>
+
+  ${comps.footer()}
@@ -15,16 +15,29 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import simplejson
 import time
 
 from nose.tools import assert_true, assert_false, assert_equal
 
 from desktop.lib.django_test_util import make_logged_in_client
+from desktop.lib.thrift_util import fixup_enums
 from hadoop import mini_cluster
+import hadoop.cluster
 from jobsub.models import JobDesign
 from jobsub.tests import parse_out_id, watch_till_complete
 from jobsub.views import in_process_jobsubd
 from jobsubd.ttypes import SubmissionHandle
+from hadoop.api.jobtracker.ttypes import ThriftJobCounterRollups, ThriftGroupList, \
+    ThriftCounterGroup, ThriftCounter, ThriftJobInProgress, ThriftJobProfile, ThriftJobStatus, \
+    ThriftJobID, ThriftJobState, ThriftJobPriority, ThriftJobChanges, ThriftTaskInProgress, \
+    ThriftTaskInProgressList, ThriftTaskID, ThriftTaskType, ThriftJobSummary, \
+    ThriftTaskTrackerStatus, ThriftTaskTimeline, ThriftTaskQueryState, JobNotFoundException, \
+    TaskTrackerNotFoundException
+from hadoop.api.common.ttypes import IOException
+from hadoop.job_index import JOB_SORT_KEYS
+from hadoop.job_tracker import LiveJobTracker
+from hadoop.tracker_registry import TrackerRegistry
 from jobbrowser import models, views
 
 def test_dots_to_camel_case():
@@ -43,6 +56,313 @@ def test_format_counter_name():
   assert_equal("Foo.", views.format_counter_name("foo."))
   assert_equal("A Bbb Ccc", views.format_counter_name("A_BBB_CCC"))
 
+def test_make_substitutions():
+  conf = {
+    "dir": "${base}/${user}",
+    "base": "${root}/tmp",
+    "root": "/hadoop",
+    "user": "alice",
+    "loop": "a${loop}",
+    "unknown": "${nobody.knows}",
+  }
+  assert_equal({
+    "dir": "/hadoop/tmp/alice",
+    "base": "/hadoop/tmp",
+    "root": "/hadoop",
+    "user": "alice",
+    "loop": "a${loop}",
+    "unknown": "${nobody.knows}",
+  }, views.make_substitutions(conf))
+
+def test_get_jobconf_cache():
+  class FakeJobTracker(object):
+    calls = 0
+    def thriftjobid_from_string(self, jobid):
+      return jobid
+    def get_job_xml(self, jobid):
+      FakeJobTracker.calls += 1
+      return "<configuration><property><name>id</name><value>%s</value></property></configuration>" % jobid
+  jt = FakeJobTracker()
+  for i in range(2):
+    assert_equal("job_1_0001", models.get_jobconf(jt, "job_1_0001")["id"])
+  assert_equal(1, FakeJobTracker.calls)
+
+def test_tracker_lookup():
+  registry = TrackerRegistry()
+  registry.update([ ThriftTaskTrackerStatus(trackerName="tracker_%d" % i, host="host%d" % i,
+                                            httpPort=50060, taskReports=[])
+                    for i in range(3) ])
+  class FakeSnapshot(object):
+    def tracker(self, name):
+      return registry.get(name)
+  class FakeJobTracker(object):
+    calls = 0
+    def snapshot(self):
+      return FakeSnapshot()
+    def task_tracker(self, name):
+      FakeJobTracker.calls += 1
+      if name == "tracker_new":
+        return ThriftTaskTrackerStatus(trackerName=name, host="newhost", httpPort=50060)
+      return None
+  jt = FakeJobTracker()
+
+  # Trackers of the snapshot are looked up in it, and built once
+  tracker = models.Tracker.from_name(jt, "tracker_1")
+  assert_equal("host1", tracker.host)
+  assert_true(tracker is models.Tracker.from_name(jt, "tracker_1"))
+  assert_equal(0, FakeJobTracker.calls)
+  # Others are asked for
+  assert_equal("newhost", models.Tracker.from_name(jt, "tracker_new").host)
+  assert_equal(1, FakeJobTracker.calls)
+  try:
+    models.Tracker.from_name(jt, "tracker_gone")
+    assert_true(False, "Expected TaskTrackerNotFoundException")
+  except TaskTrackerNotFoundException:
+    pass
+
+def test_task_timeline():
+  MAP, REDUCE, SETUP = ThriftTaskType.MAP, ThriftTaskType.REDUCE, ThriftTaskType.JOB_SETUP
+  SUCCEEDED, FAILED, RUNNING, PENDING = ThriftTaskQueryState.SUCCEEDED, \
+      ThriftTaskQueryState.FAILED, ThriftTaskQueryState.RUNNING, ThriftTaskQueryState.PENDING
+  thrift_timeline = ThriftTaskTimeline(
+    taskNumbers=[2, 0, 1, 2, 0, 1],
+    taskTypes=[SETUP, MAP, MAP, MAP, REDUCE, REDUCE],
+    states=[SUCCEEDED, SUCCEEDED, FAILED, SUCCEEDED, RUNNING, PENDING],
+    startTimes=[1000, 2000, 3000, 2500, 5000, 0],
+    finishTimes=[2000, 4000, 3500, 9000, 0, 0],
+    currentTime=11000)
+  timeline = models.TaskTimeline("job_201003121527_0001", thrift_timeline)
+  assert_equal(6, len(timeline))
+  assert_equal((1000, 11000), (timeline.startTimeMs, timeline.finishTimeMs))
+  assert_equal(None, timeline.task_id(0))
+  assert_equal("task_201003121527_0001_r_000000", timeline.task_id(4))
+
+  # Started tasks, by type and start
+  rows = timeline.gantt_rows()
+  assert_equal([ "job_setup", "map", "map", "map", "reduce" ], [ r['type'] for r in rows ])
+  assert_equal("task_201003121527_0001_m_000002", rows[2]['taskId'])
+  assert_equal((2500, 9000), (rows[2]['start'], rows[2]['finish']))
+  assert_equal((15.0, 65.0), (rows[2]['left'], rows[2]['width']))
+  # The running reduce ends now
+  assert_equal(11000, rows[4]['finish'])
+  rows = timeline.gantt_rows(max_rows=3)
+  assert_equal([ (1, 0), (2, 0), (1, 1), (1, 0) ], [ (r['count'], r['failed']) for r in rows ])
+  assert_equal((2000, 9000), (rows[1]['start'], rows[1]['finish']))
+
+  histograms = timeline.duration_histograms(bins=4)
+  assert_equal([ "job_setup", "map" ], [ h['type'] for h in histograms ])
+  maps = histograms[1]
+  assert_equal((3, 500, 2000, 6500), (maps['count'], maps['min'], maps['median'], maps['max']))
+  assert_equal(1625, maps['binWidth'])
+  assert_equal([1, 1, 0, 1], maps['bins'])
+
+def make_rollups(map_records, reduce_records, launched_maps):
+  def group_list(name, counters):
+    return ThriftGroupList(groups=[ThriftCounterGroup(
+      name=name, displayName=name,
+      counters=dict((n, ThriftCounter(name=n, displayName=n, value=v)) for n, v in counters))])
+  return ThriftJobCounterRollups(
+    mapCounters=group_list("Task", [("MAP_OUTPUT_RECORDS", map_records)]),
+    reduceCounters=group_list("Task", [("REDUCE_OUTPUT_RECORDS", reduce_records)]),
+    jobCounters=group_list("Job", [("TOTAL_LAUNCHED_MAPS", launched_maps)]))
+
+def test_job_counters_store():
+  models.JobCounters.objects.all().delete()
+  rollups = make_rollups(100, 10, 4)
+  models.JobCounters.record("job_201003121527_0001", "word count", "alice", "SUCCEEDED",
+                            1268400000000, 1268400060000, rollups)
+  # Recording twice is harmless
+  models.JobCounters.record("job_201003121527_0001", "word count", "alice", "SUCCEEDED",
+                            1268400000000, 1268400060000, rollups)
+  stored = models.JobCounters.lookup("job_201003121527_0001")
+  assert_equal(models.counters_from_rollups(rollups), stored.get_counters())
+  assert_equal(None, models.JobCounters.lookup("job_201003121527_0002"))
+
+  models.JobCounters.record("job_201003121527_0002", "word count", "bob", "FAILED",
+                            1268400100000, 1268400200000, make_rollups(50, 0, 2))
+  records = list(models.JobCounters.objects.filter(job_name="word count"))
+  # Newest first
+  assert_equal(["job_201003121527_0002", "job_201003121527_0001"],
+               [ r.job_id for r in records ])
+  rows = models.compare_counters(records)
+  assert_equal(["TOTAL_LAUNCHED_MAPS", "MAP_OUTPUT_RECORDS", "REDUCE_OUTPUT_RECORDS"],
+               [ row['displayName'] for row in rows ])
+  assert_equal([2, 4], rows[0]['values'])
+  assert_equal((50, 100, 75.0), (rows[1]['min'], rows[1]['max'], rows[1]['mean']))
+
+  c = make_logged_in_client()
+  response = c.get("/jobbrowser/jobs/counters/compare?name=word+count")
+  assert_equal(rows, response.context['rows'])
+  response = c.get("/jobbrowser/jobs/counters/compare?name=word+count&user=bob")
+  assert_equal(1, len(response.context['records']))
+
+
+def make_job(i, state, user="alice", name="word count", queue="default"):
+  jobid = ThriftJobID("201003121527", i, "job_201003121527_%04d" % i)
+  start = 1268400000000 + i * 1000
+  return ThriftJobInProgress(
+    profile=ThriftJobProfile(user=user, jobID=jobid, jobFile="hdfs://nn/%d.xml" % i,
+                             name=name, queueName=queue),
+    status=ThriftJobStatus(jobID=jobid, mapProgress=1.0, reduceProgress=1.0,
+                           cleanupProgress=1.0, setupProgress=1.0, runState=state,
+                           startTime=start, user=user, priority=ThriftJobPriority.NORMAL,
+                           schedulingInfo="NA"),
+    jobID=jobid, desiredMaps=4, desiredReduces=1, finishedMaps=4, finishedReduces=1,
+    priority=ThriftJobPriority.NORMAL, startTime=start, finishTime=start + 60000,
+    launchTime=start + 10, tasks=None)
+
+def summarize(job):
+  summary = ThriftJobSummary(jobID=job.jobID, name=job.profile.name, user=job.profile.user,
+    queueName=job.profile.queueName, runState=job.status.runState, priority=job.priority,
+    mapProgress=1.0, reduceProgress=1.0, desiredMaps=4, desiredReduces=1,
+    finishedMaps=4, finishedReduces=1, startTime=job.startTime, finishTime=job.finishTime)
+  return fixup_enums(summary, {"runState":ThriftJobState, "priority":ThriftJobPriority})
+
+class FakeJobTrackerClient(object):
+  """Answers the calls JobArchiver makes, for the jobs given."""
+  def __init__(self, jobs):
+    self.jobs = dict((job.jobID.asString, job) for job in jobs)
+
+  def getJobNoTasks(self, ctx, jobid):
+    if jobid.asString not in self.jobs:
+      raise JobNotFoundException()
+    return self.jobs[jobid.asString]
+
+  def getJobCounterRollups(self, ctx, jobid):
+    return make_rollups(jobid.jobID, 1, 4)
+
+  def getJobConfXML(self, ctx, jobid):
+    return ("<configuration><property><name>mapred.output.dir</name><value>/out/%d</value>"
+            "</property><property><name>io.sort.mb</name><value>100</value></property>"
+            "</configuration>" % jobid.jobID)
+
+  def getTopTasks(self, ctx, jobid, states, count, newest_first):
+    task = ThriftTaskInProgress(
+      taskID=ThriftTaskID(jobID=jobid, taskType=ThriftTaskType.MAP, taskID=0,
+                          asString="task_%s_m_000000" % jobid.asString[4:]),
+      complete=True, failed=False, execStartTime=1, taskStatuses={})
+    return ThriftTaskInProgressList(tasks=[task], numTotalTasks=1)
+
+def test_job_archive():
+  models.ArchivedJob.objects.all().delete()
+  models.JobCounters.objects.all().delete()
+  users = ["alice", "bob", "carol_admin"]
+  states = [ThriftJobState.SUCCEEDED, ThriftJobState.FAILED, ThriftJobState.KILLED]
+  jobs = [ make_job(i, states[i % 3], user=users[i % 3], name="job %d" % (i % 4),
+                    queue=i % 2 and "etl" or "default") for i in range(30) ]
+  running = make_job(30, ThriftJobState.RUNNING)
+
+  jt = LiveJobTracker("localhost", 0)
+  jt.client = FakeJobTrackerClient(jobs + [running])
+  snapshot = jt.snapshot()
+  # Finished jobs are archived as they show up in the snapshot, retired
+  # ones only listed from the archive.
+  archiver = models.JobArchiver()
+  archiver(snapshot, ThriftJobChanges(
+    changed=[ summarize(job) for job in jobs + [running] ],
+    removed=[], token=1, full=True))
+  # The snapshot only queues them
+  assert_equal(0, models.ArchivedJob.objects.count())
+  assert_true(archiver.run_pending(snapshot))
+  assert_false(archiver.run_pending(snapshot))
+  assert_equal(30, models.ArchivedJob.objects.count())
+  assert_equal(30, models.JobCounters.objects.count())
+  assert_equal(0, models.ArchivedJob.query()[1])
+  archiver(snapshot, ThriftJobChanges(changed=[], removed=[ job.jobID for job in jobs[:20] ],
+                                      token=2, full=False))
+  archiver.run_pending(snapshot)
+  # Jobs missing from a full refresh were retired too
+  archiver(snapshot, ThriftJobChanges(
+    changed=[ summarize(job) for job in jobs[25:] ],
+    removed=[], token=3, full=True))
+  archiver.run_pending(snapshot)
+  retired = [ summarize(job) for job in jobs[:25] ]
+
+  def ids(summaries):
+    return [ s.jobID.asString for s in summaries ]
+
+  queries = [
+    dict(),
+    dict(sort_key="start_time", descending=True, count=10, offset=5),
+    dict(job_states=set(["failed"]), sort_key="finish_time"),
+    dict(job_states=set(["running"])),
+    dict(user="ADMIN", sort_key="name", descending=True),
+    dict(queue="etl", sort_key="user"),
+    dict(text="job 3", sort_key="queue"),
+    dict(text="norm", sort_key="priority", count=3),
+    dict(text="_0002"),
+    dict(sort_key="state", descending=True, count=7, offset=20),
+  ]
+  for query in queries:
+    expected = [ s for s in retired if
+                 (not query.get("job_states") or
+                  s.runStateAsString.lower() in query["job_states"]) and
+                 query.get("user", "").lower() in s.user.lower() and
+                 query.get("queue", "").lower() in s.queueName.lower() and
+                 [ f for f in (s.user, s.name, s.jobID.asString, s.queueName, s.priorityAsString)
+                   if query.get("text", "").lower() in f.lower() ] ]
+    expected.sort(key=JOB_SORT_KEYS[query.get("sort_key")], reverse=query.get("descending", False))
+    offset, count = query.get("offset", 0), query.get("count", -1)
+    page, total = models.ArchivedJob.query(**query)
+    assert_equal(len(expected), total)
+    if count >= 0:
+      expected = expected[offset:offset + count]
+    else:
+      expected = expected[offset:]
+    assert_equal(ids(expected), ids(page))
+
+  archived = models.ArchivedJob.lookup("job_201003121527_0004")
+  job = models.Job.from_archive(None, archived)
+  assert_true(job.archived)
+  assert_equal(("bob", "job 0", "FAILED", 1268400004000, 1268400064000),
+               (job.user, job.jobName, job.status, job.startTimeMs, job.finishTimeMs))
+  assert_equal("hdfs://nn/4.xml", job.jobFile)
+  assert_equal({"mapredOutputDir": "/out/4"}, job.conf_keys)
+  assert_equal(4, job.counters["Task"]["counters"]["MAP_OUTPUT_RECORDS"]["map"])
+  assert_equal(["task_201003121527_0004_m_000000"], [ t.taskId for t in archived.recent_tasks ])
+
+
+class FailingJobTrackerClient(FakeJobTrackerClient):
+  """Has lost the conf of one job, and fails to list the tasks of another."""
+  def __init__(self, jobs, no_conf, broken):
+    FakeJobTrackerClient.__init__(self, jobs)
+    self.no_conf = no_conf
+    self.broken = broken
+
+  def getJobConfXML(self, ctx, jobid):
+    if jobid.asString == self.no_conf:
+      raise IOException(msg="File %s_conf.xml does not exist." % jobid.asString)
+    return FakeJobTrackerClient.getJobConfXML(self, ctx, jobid)
+
+  def getTopTasks(self, ctx, jobid, states, count, newest_first):
+    if jobid.asString == self.broken:
+      raise ValueError("broken")
+    return FakeJobTrackerClient.getTopTasks(self, ctx, jobid, states, count, newest_first)
+
+def test_job_archive_errors():
+  """A job that can't be archived doesn't hold back the others."""
+  models.ArchivedJob.objects.all().delete()
+  models.JobCounters.objects.all().delete()
+  jobs = [ make_job(i, ThriftJobState.SUCCEEDED) for i in range(4) ]
+  no_conf, broken = jobs[1].jobID.asString, jobs[2].jobID.asString
+
+  jt = LiveJobTracker("localhost", 0)
+  jt.client = FailingJobTrackerClient(jobs, no_conf, broken)
+  snapshot = jt.snapshot()
+  archiver = models.JobArchiver()
+  archiver(snapshot, ThriftJobChanges(changed=[ summarize(job) for job in jobs ],
+                                      removed=[], token=1, full=True))
+  assert_true(archiver.run_pending(snapshot))
+  assert_equal(3, models.ArchivedJob.objects.count())
+  # A job whose conf is gone is archived without it
+  assert_equal({}, models.ArchivedJob.lookup(no_conf).get_conf())
+  # The broken one is retried a few times, then dropped
+  for i in range(models.MAX_ARCHIVE_ATTEMPTS - 1):
+    assert_true(archiver.run_pending(snapshot))
+  assert_false(archiver.run_pending(snapshot))
+  assert_equal(None, models.ArchivedJob.lookup(broken))
+  assert_equal(3, models.ArchivedJob.objects.count())
+
 
 def get_hadoop_job_id(jobsubd, jobsub_id):
   handle = SubmissionHandle(id=jobsub_id)
@@ -50,6 +370,24 @@ def get_hadoop_job_id(jobsubd, jobsub_id):
   return job_data.hadoop_job_ids[0]
 
 
+def wait_for_snapshot(hadoop_job_id, timeout_sec=20):
+  """
+  Refreshes the shared JobTracker snapshot until it has the current state
+  of the job.
+  """
+  jt = hadoop.cluster.get_mrcluster()
+  state = jt.get_job(jt.thriftjobid_from_string(hadoop_job_id)).status.runStateAsString
+  start = time.time()
+  while time.time() - start < timeout_sec:
+    snapshot = jt.snapshot()
+    snapshot.refresh()
+    for summary in snapshot.jobs.jobs():
+      if summary.jobID.asString == hadoop_job_id and summary.runStateAsString == state:
+        return
+    time.sleep(0.5)
+  raise Exception("Job %s did not reach the snapshot in %d seconds" % (hadoop_job_id, timeout_sec))
+
+
 class TestJobBrowserWithHadoop(object):
   """
   Tests for JobBrowser that requires Hadoop. Use the same mini_cluster and jobsubd.
@@ -88,6 +426,13 @@ class TestJobBrowserWithHadoop(object):
     self.client.get("/jobbrowser/queues")
     self.client.get("/jobbrowser/jobbrowser")
 
+    changes = simplejson.loads(self.client.get("/jobbrowser/trackers/changes").content)
+    assert_true(changes['full'])
+    assert_true(changes['changed'])
+    changes = simplejson.loads(
+        self.client.get("/jobbrowser/trackers/changes?token=%d" % changes['token']).content)
+    assert_false(changes['full'])
+
     # This is not tested.
     # assert_equal("{}", self.client.get("/jobbrowser/jobs/%s/setpriority?priority=HIGH" % hadoop_job_id).content)
 
@@ -117,6 +462,7 @@ class TestJobBrowserWithHadoop(object):
     job_id = parse_out_id(response)
     response = watch_till_complete(self.client, job_id, timeout_sec=120)
     hadoop_job_id = get_hadoop_job_id(self.jobsubd, job_id)
+    wait_for_snapshot(hadoop_job_id)
 
     # The single job view should have the failed task table
     response = self.client.get('/jobbrowser/jobs/%s' % (hadoop_job_id,))
@@ -168,10 +514,28 @@ class TestJobBrowserWithHadoop(object):
     job_id = parse_out_id(response)
     response = watch_till_complete(self.client, job_id)
     hadoop_job_id = get_hadoop_job_id(self.jobsubd, job_id)
+    wait_for_snapshot(hadoop_job_id)
 
     # All jobs page
     response = self.client.get('/jobbrowser/jobs/')
     assert_true(hadoop_job_id.lstrip('job_') in response.content)
+    # Filtered and sorted by the JobTracker
+    response = self.client.get('/jobbrowser/jobs/?state=completed&user=test&sortkey=jobId&sortrev')
+    assert_true(hadoop_job_id.lstrip('job_') in response.content)
+    assert_true('Showing 1 to' in response.content)
+    response = self.client.get('/jobbrowser/jobs/?text=%s' % hadoop_job_id)
+    assert_true('Showing 1 to 1 of 1 jobs' in response.content)
+    response = self.client.get('/jobbrowser/jobs/?state=running&text=%s' % hadoop_job_id)
+    assert_false(hadoop_job_id.lstrip('job_') in response.content)
+
+    # The change feed has every job the first time, then only what changed
+    changes = simplejson.loads(self.client.get('/jobbrowser/jobs/changes').content)
+    assert_true(changes['full'])
+    assert_true(hadoop_job_id in [ job['jobId'] for job in changes['changed'] ])
+    changes = simplejson.loads(
+        self.client.get('/jobbrowser/jobs/changes?token=%d' % changes['token']).content)
+    assert_false(changes['full'])
+    assert_false(hadoop_job_id in [ job['jobId'] for job in changes['changed'] ])
 
     # Single job page
     response = self.client.get('/jobbrowser/jobs/%s' % hadoop_job_id)
@@ -230,7 +594,18 @@ class TestJobBrowserWithHadoop(object):
     time.sleep(15)                      # 15 seconds should be enough to start the job
     hadoop_job_id = get_hadoop_job_id(self.jobsubd, job_id)
 
-    self.client.post('/jobbrowser/jobs/%s/kill' % (hadoop_job_id,))
+    response = self.client.post('/jobbrowser/jobs/%s/kill' % (hadoop_job_id,))
+    # The kill returns before the job is killed
+    assert_true(simplejson.loads(response.content)['kill'] in ('pending', 'confirmed'))
+    start = time.time()
+    while time.time() - start < 30:
+      status = simplejson.loads(
+          self.client.get('/jobbrowser/jobs/%s/status' % (hadoop_job_id,)).content)
+      if status['kill'] != 'pending':
+        break
+      time.sleep(1)
+    assert_equal('confirmed', status['kill'])
+    assert_equal('KILLED', status['status'])
 
     # It should say killed
     response = self.client.get('/jobbrowser/jobs/%s' % (hadoop_job_id,))
@@ -21,14 +21,20 @@ urlpatterns = patterns('jobbrowser.views',
   # "Default"
   url(r'^$','jobbrowser'),
   url(r'^trackers$','trackers',name='trackers'),
+  url(r'^trackers/changes$','tracker_changes',name='tracker_changes'),
   url(r'^trackers/(?P<trackerid>.+)$','single_tracker',name='single_tracker'),
   url(r'^jobs/$','jobs',name='jobs'),
   url(r'^dock_jobs/$','dock_jobs',name='dock_jobs'),
+  url(r'^jobs/changes$','job_changes',name='job_changes'),
+  url(r'^jobs/counters/compare$','compare_job_counters',name='compare_job_counters'),
   url(r'^jobs/(?P<jobid>\w+)$','single_job',name='single_job'),
   url(r'^jobs/(?P<jobid>\w+)/counters$','job_counters',name='job_counters'),
   url(r'^jobs/(?P<jobid>\w+)/kill$','kill_job',name='kill_job'),
+  url(r'^jobs/(?P<jobid>\w+)/status$','job_status',name='job_status'),
   url(r'^jobs/(?P<jobid>\w+)/setpriority$','set_job_priority',name='set_job_priority'),
   url(r'^jobs/(?P<jobid>\w+)/tasks$','tasks',name='tasks'),
+  url(r'^jobs/(?P<jobid>\w+)/tasks/page$','task_page',name='task_page'),
+  url(r'^jobs/(?P<jobid>\w+)/timeline$','job_timeline',name='job_timeline'),
   url(r'^jobs/(?P<jobid>\w+)/tasks/(?P<taskid>\w+)$','single_task',name='single_task'),
   url(r'^jobs/(?P<jobid>\w+)/tasks/(?P<taskid>\w+)/attempts/(?P<attemptid>\w+)$',
       'single_task_attempt',name='single_task_attempt'),
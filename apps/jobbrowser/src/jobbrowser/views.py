@@ -18,7 +18,6 @@
 # Implements simple jobbrowser api
 #
 import re
-import time
 import logging
 import string
 from urllib import quote_plus
@@ -28,60 +27,191 @@ from desktop.lib.django_util import render_json, MessageException, render
 from desktop.lib.django_util import copy_query_dict
 from desktop.log.access import access_warn, access_log_level
 from desktop.views import register_status_bar_view
-from hadoop.api.jobtracker.ttypes import ThriftJobPriority
+from hadoop.api.jobtracker.ttypes import ThriftJobPriority, ThriftJobSummaryList, \
+    JobNotFoundException
+from hadoop.job_index import JOB_SORT_KEYS
 
-from jobbrowser.models import Job, JobLinkage, TaskList, Tracker, Cluster
+from jobbrowser.models import Job, JobLinkage, JobList, TaskList, TaskTimeline, Tracker, \
+    Cluster, ArchivedJob, JobCounters, compare_counters, fetch_task_logs, FINISHED_JOB_STATES
 
 ##################################
 ## View end-points
 
 __DEFAULT_OBJ_PER_PAGINATION = 10
+__DEFAULT_JOBS_PER_PAGINATION = 50
+# Number of tasks returned by task_page by default, and at most
+__DEFAULT_TASK_PAGE_SIZE = 100
+__MAX_TASK_PAGE_SIZE = 1000
+# How much of the log of each failed attempt the tasks page shows
+__FAILED_LOG_TAIL_BYTES = 4096
+# Number of runs compared by default, and at most, by compare_job_counters
+__DEFAULT_COMPARED_RUNS = 10
+__MAX_COMPARED_RUNS = 100
+
+# Maps the state filter of the jobs page to hadoop.job_tracker.VALID_JOB_STATES.
+# "all" is no filter at all.
+_JOB_STATE_FILTERS = {
+  "completed": set(["succeeded"]),
+  # Succeeded and completed are synonyms here.
+  "succeeded": set(["succeeded"]),
+  "running": set(["running"]),
+  "failed": set(["failed"]),
+  "killed": set(["killed"]),
+  "all": None,
+}
+
+# Maps the sortkey of the jobs page (a Job attribute) to
+# hadoop.job_tracker.VALID_JOB_SORT_KEYS.
+_JOB_SORT_KEYS = {
+  "jobId": "job_id",
+  "jobName": "name",
+  "user": "user",
+  "queueName": "queue",
+  "status": "state",
+  "priority": "priority",
+  "startTimeMs": "start_time",
+  "finishTimeMs": "finish_time",
+}
 
 def single_job(request, jobid):
   """
-  We get here from /jobs/jobid
+  We get here from /jobs/jobid. Jobs the JobTracker has retired are shown
+  from the archive (see models.ArchivedJob).
   """
-  job = Job.from_id(jt=request.jt, jobid=jobid)
-
-  def cmp_exec_time(foo, bar):
-    return cmp(foo.execStartTimeMs, bar.execStartTimeMs)
-
-  failed_tasks = job.filter_tasks(task_states=set(['failed']))
-  failed_tasks.sort(cmp_exec_time)
-  recent_tasks = job.filter_tasks(task_states=set(['running', 'succeeded']))
-  recent_tasks.sort(cmp_exec_time, reverse=True)
+  job, archived = _get_job(request, jobid)
+  if archived is not None:
+    failed_tasks = archived.failed_tasks
+    recent_tasks = archived.recent_tasks
+  else:
+    failed_tasks = job.top_tasks(['failed'], 5, newest_first=False)
+    recent_tasks = job.top_tasks(['running', 'succeeded'], 5)
 
   return render("job.mako", request, {
     'request': request,
     'job': job,
-    'failed_tasks': failed_tasks[:5],
-    'recent_tasks': recent_tasks[:5]
+    'failed_tasks': failed_tasks,
+    'recent_tasks': recent_tasks,
+    'kill_status': request.jt.snapshot().kill_status(jobid),
   })
 
+def _get_job(request, jobid):
+  """
+  Returns (job, archived): the Job of jobid, and its ArchivedJob if the
+  JobTracker no longer has it (else None).
+  """
+  try:
+    return Job.from_id(jt=request.jt, jobid=jobid), None
+  except JobNotFoundException:
+    archived = ArchivedJob.lookup(jobid)
+    if archived is None:
+      raise
+    return Job.from_archive(request.jt, archived), archived
+
 def job_counters(request, jobid):
   """
   We get here from /jobs/jobid/counters
   """
-  job = Job.from_id(jt=request.jt, jobid=jobid)
+  job = get_single_job(request, jobid)
   return render("counters.html", request, {"counters":job.counters})
 
+def compare_job_counters(request):
+  """
+  We get here from /jobs/counters/compare?name=<name>, with the options:
+    user=<user>         - Only compare the runs of this user
+    count=<n>           - How many of the latest runs to compare. Defaults
+                          to __DEFAULT_COMPARED_RUNS.
+  Compares the counters of the finished runs of the jobs named name. This
+  only looks at the stored counters (see models.JobCounters), so it doesn't
+  reach the JobTracker.
+  """
+  name = request.GET.get('name', '')
+  user = request.GET.get('user')
+  try:
+    count = int(request.GET.get('count', __DEFAULT_COMPARED_RUNS))
+  except ValueError:
+    count = __DEFAULT_COMPARED_RUNS
+  count = max(1, min(count, __MAX_COMPARED_RUNS))
+
+  records = JobCounters.objects.filter(job_name=name[:JobCounters.MAX_NAME_LENGTH])
+  if user:
+    records = records.filter(user=user)
+  records = list(records[:count])
+  return render("compare_counters.mako", request, {
+    'name': name,
+    'user_filter': user,
+    'records': records,
+    'rows': compare_counters(records)
+  })
+
 def jobs(request):
   """
-  We get here from /jobs?filterargs
+  We get here from /jobs?filterargs, with the options being:
+    page=<n>            - Controls pagination. Defaults to 1.
+    state=<state>       - One of "all", "running", "completed" (or "succeeded"),
+                          "failed" and "killed". Defaults to "all".
+    user=<user>         - Substring of the job's user
+    text=<text>         - Substring of the job's name, id, user, queue or priority
+    sortkey=<attr>      - Job attribute to sort by (see _JOB_SORT_KEYS). Jobs are
+                          listed newest first by default.
+    sortrev             - If present, reverses the sort.
   """
-  matching_jobs = sort_if_necessary(request, get_matching_jobs(request))
   state = request.GET.get('state', 'all')
   user = request.GET.get('user', '')
   text = request.GET.get('text', '')
+
+  pagenum = _get_pagenum(request)
+
+  joblist = get_matching_jobs(request,
+                              count=__DEFAULT_JOBS_PER_PAGINATION,
+                              offset=__DEFAULT_JOBS_PER_PAGINATION * (pagenum - 1))
+  paginator = Paginator(joblist, __DEFAULT_JOBS_PER_PAGINATION, total=joblist.numTotalJobs)
+  page = paginator.page(pagenum)
+
+  # We need to pass the parameters back to the template to generate links
+  filter_params = copy_query_dict(
+        request.GET, ('state', 'user', 'text', 'sortkey', 'sortrev')).urlencode()
+
   return render("jobs.mako", request, {
-    'jobs':matching_jobs,
+    'jobs': page.object_list,
+    'page': page,
+    'filter_params': filter_params,
     'request': request,
     'state_filter': state,
     'user_filter': user,
     'text_filter': text,
-    'filtered': not (state == 'all' and user == '' and text == '')
+    'filtered': not (state == 'all' and user == '' and text == ''),
+    'kill_status': request.jt.snapshot().kill_status,
+  })
+
+def job_changes(request):
+  """
+  We get here from /jobs/changes?token=<token>. Returns, as JSON, the jobs
+  whose state or progress changed since token (every job if token is 0 or
+  missing), the ids of the jobs removed since, and the token to pass next.
+
+  This is answered from the shared JobTracker snapshot, so polling doesn't
+  reach the JobTracker at all.
+  """
+  try:
+    token = long(request.GET.get('token', 0))
+  except ValueError:
+    token = 0
+  token, full, changed, removed = request.jt.snapshot().jobs.changed_since(token)
+  return render_json({
+    'token': token,
+    'full': full,
+    'changed': [ _job_summary_dict(Job.from_summary(request.jt, summary))
+                 for summary in changed ],
+    'removed': removed
   })
 
+def _job_summary_dict(job):
+  return dict((attr, getattr(job, attr)) for attr in (
+    'jobId', 'jobId_short', 'jobName', 'user', 'queueName', 'status', 'priority',
+    'mapProgress', 'reduceProgress', 'desiredMaps', 'desiredReduces',
+    'finishedMaps', 'finishedReduces', 'maps_percent_complete',
+    'reduces_percent_complete', 'startTimeMs', 'finishTimeMs'))
+
 def dock_jobs(request):
   username = request.user.username
   matching_jobs = get_job_count_by_state(request, username)
@@ -94,7 +224,8 @@ register_status_bar_view(dock_jobs)
 @access_log_level(logging.WARN)
 def kill_job(request, jobid):
   """
-  We get here from /jobs/jobid/kill
+  We get here from /jobs/jobid/kill. The kill is only requested here, so
+  this returns at once with the kill pending (see job_status).
   """
   if request.method != "POST":
     raise Exception("kill_job may only be invoked with a POST (got a %s)" % request.method)
@@ -105,16 +236,48 @@ def kill_job(request, jobid):
                            (request.user.username, job.profile.user))
 
   job.kill()
-  cur_time = time.time()
-  while time.time() - cur_time < 15:
-    job = Job.from_id(jt=request.jt, jobid=jobid)
+  request.jt.snapshot().request_kill(jobid)
+  return render_json(_job_status_dict(request, jobid))
+
+def job_status(request, jobid):
+  """
+  We get here from /jobs/jobid/status. Returns, as JSON, the state of the
+  job and of any kill requested through kill_job ("pending", "confirmed",
+  "timed_out" or null).
 
-    if job.status not in ["RUNNING", "QUEUED"]:
-      return render_json({})
-    time.sleep(1)
-    job = Job.from_id(jt=request.jt, jobid=jobid)
+  This is answered from the shared JobTracker snapshot, so it's cheap to
+  poll while waiting for a kill to be confirmed.
+  """
+  return render_json(_job_status_dict(request, jobid))
 
-  raise Exception("Job did not appear as killed within 15 seconds")
+def _job_status_dict(request, jobid):
+  snapshot = request.jt.snapshot()
+  summary = snapshot.jobs.get(jobid)
+  return {
+    'jobId': jobid,
+    # Jobs submitted since the last refresh aren't in the snapshot yet
+    'status': summary and summary.runStateAsString,
+    'kill': snapshot.kill_status(jobid),
+  }
+
+def _get_pagenum(request):
+  """The page=<n> GET argument, or 1 if it is missing or invalid."""
+  try:
+    return max(int(request.GET.get('page', 1)), 1)
+  except ValueError:
+    return 1
+
+def _task_filters(request):
+  """Returns the task_types, task_states and task_text of the tasks views' filters."""
+  ttypes = request.GET.get('tasktype')
+  tstates = request.GET.get('taskstate')
+  task_types = None
+  if ttypes:
+    task_types = set(ttypes.split(','))
+  task_states = None
+  if tstates:
+    task_states = set(tstates.split(','))
+  return task_types, task_states, request.GET.get('tasktext')
 
 def tasks(request, jobid):
   """
@@ -129,17 +292,9 @@ def tasks(request, jobid):
   # Get the filter parameters
   ttypes = request.GET.get('tasktype')
   tstates = request.GET.get('taskstate')
-  ttext = request.GET.get('tasktext')
-  task_types = None
-  if ttypes:
-    task_types = set(ttypes.split(','))
-  task_states = None
-  if tstates:
-    task_states = set(tstates.split(','))
+  task_types, task_states, ttext = _task_filters(request)
 
-  pagenum = int(request.GET.get('page', 1))
-  if pagenum < 0:
-    pagenum = 1
+  pagenum = _get_pagenum(request)
 
   # Fetch the list of tasks
   task_list = TaskList.select(request.jt,
@@ -153,6 +308,12 @@ def tasks(request, jobid):
   paginator = Paginator(task_list, __DEFAULT_OBJ_PER_PAGINATION, total=task_list.numTotalTasks)
   page = paginator.page(pagenum)
 
+  # When looking at failures, show the end of the log of the latest
+  # failed attempt of each task
+  log_tails = {}
+  if task_states == set(['failed']):
+    log_tails = _failed_attempt_log_tails(request, page.object_list)
+
   # We need to pass the parameters back to the template to generate links
   filter_params = copy_query_dict(
         request.GET, ('tasktype', 'taskstate', 'tasktext')).urlencode()
@@ -164,9 +325,75 @@ def tasks(request, jobid):
     'page': page,
     'tasktype': ttypes,
     'taskstate': tstates,
-    'tasktext': ttext
+    'tasktext': ttext,
+    'log_tails': log_tails
+  })
+
+def task_page(request, jobid):
+  """
+  We get here from /jobs/jobid/tasks/page?filterargs, with the filters of
+  the tasks view (tasktype, taskstate and tasktext) and:
+    cursor=<cursor>     - Where the page starts; missing for the first page
+    count=<n>           - How many tasks to return. Defaults to
+                          __DEFAULT_TASK_PAGE_SIZE, and is capped at
+                          __MAX_TASK_PAGE_SIZE.
+  Returns, as JSON, the tasks, the number of matching tasks, and the
+  cursor of the next page (empty after the last page).
+
+  The JobTracker keeps the matching tasks for a while, so that loading the
+  next pages (e.g., while scrolling) doesn't filter every task again.
+  """
+  task_types, task_states, ttext = _task_filters(request)
+  try:
+    count = int(request.GET.get('count', __DEFAULT_TASK_PAGE_SIZE))
+  except ValueError:
+    count = __DEFAULT_TASK_PAGE_SIZE
+  count = max(1, min(count, __MAX_TASK_PAGE_SIZE))
+
+  task_list = TaskList.select_from(request.jt, jobid, task_types, task_states, ttext,
+                                   request.GET.get('cursor'), count)
+  return render_json({
+    'tasks': [ _task_summary_dict(task) for task in task_list ],
+    'total': task_list.numTotalTasks,
+    'next': task_list.nextCursor
+  })
+
+def job_timeline(request, jobid):
+  """
+  We get here from /jobs/jobid/timeline
+  Shows when each task of the job ran, as a Gantt chart, and histograms of
+  the task durations per type.  These come from a single call for the
+  start and finish times of the tasks (see models.TaskTimeline).
+  """
+  timeline = TaskTimeline.from_jobtracker(request.jt, jobid)
+  summary = request.jt.snapshot().jobs.get(jobid)
+  return render("timeline.mako", request, {
+    'jobid': jobid,
+    'job_name': summary and summary.name or jobid,
+    'timeline': timeline,
+    'rows': timeline.gantt_rows(),
+    'histograms': timeline.duration_histograms()
   })
 
+def _task_summary_dict(task):
+  return dict((attr, getattr(task, attr)) for attr in (
+    'taskId', 'taskId_short', 'taskType', 'state', 'progress', 'mostRecentState',
+    'execStartTimeMs', 'execFinishTimeMs'))
+
+def _failed_attempt_log_tails(request, tasks):
+  """
+  Returns a dict of task id to the end of the syslog of the latest failed
+  attempt of the task.  The logs are fetched in parallel.
+  """
+  attempts = []
+  for task in tasks:
+    failed = [ a for a in task.attempts if a.state == 'failed' ]
+    if failed:
+      attempts.append(max(failed, key=lambda a: a.finishTimeMs))
+  logs = fetch_task_logs([ (attempt, 'syslog') for attempt in attempts ],
+                         max_bytes=__FAILED_LOG_TAIL_BYTES)
+  return dict((attempt.task.taskId, log.strip()) for attempt, log in zip(attempts, logs))
+
 
 def single_task(request, jobid, taskid):
   """
@@ -230,6 +457,30 @@ def trackers(request):
 
   return render("tasktrackers.mako", request, {'trackers':trackers})
 
+def tracker_changes(request):
+  """
+  We get here from /trackers/changes?token=<token>. Returns, as JSON, the
+  trackers whose status changed since token (every tracker if token is 0
+  or missing), the names of the trackers gone since, and the token to
+  pass next.  Like job_changes, this never reaches the JobTracker.
+  """
+  try:
+    token = long(request.GET.get('token', 0))
+  except ValueError:
+    token = 0
+  token, full, changed, removed = request.jt.snapshot().trackers_changed_since(token)
+  return render_json({
+    'token': token,
+    'full': full,
+    'changed': [ _tracker_dict(Tracker.from_status(status)) for status in changed ],
+    'removed': removed
+  })
+
+def _tracker_dict(tracker):
+  return dict((attr, getattr(tracker, attr)) for attr in (
+    'trackerId', 'host', 'httpPort', 'lastSeenMs', 'failureCount',
+    'mapCount', 'reduceCount', 'maxMapTasks', 'maxReduceTasks'))
+
 def single_tracker(request, trackerid):
   """
   We get here from /trackers/trackerid
@@ -258,31 +509,47 @@ def set_job_priority(request, jobid):
   request.jt.set_job_priority(jid, ThriftJobPriority._NAMES_TO_VALUES[priority])
   return render_json({})
 
-CONF_VARIABLE_REGEX = r"\$\{(.+)\}"
+# As in Hadoop's Configuration
+CONF_VARIABLE_REGEX = r"\$\{([^\}\$ ]+)\}"
 
 def make_substitutions(conf):
   """
   Substitute occurences of ${foo} with conf[foo], recursively, in all the values
   of the conf dict.
 
+  Each value is expanded once, and its expansion reused by the values that
+  refer to it.  References that loop back to themselves are left as is.
+
   Note that the Java code may also substitute Java properties in, which 
   this code does not have.
   """
   r = re.compile(CONF_VARIABLE_REGEX)
-  def sub(s, depth=0):
-    # Malformed / malicious confs could make this loop infinitely
-    if depth > 100:
-      logging.warn("Max recursion depth exceeded when substituting jobconf value: %s" % s)
-      return s
-    m = r.search(s)
-    if m:
-      for g in [g for g in m.groups() if g in conf]:
-        substr = "${%s}" % g
-        s = s.replace(substr, sub(conf[g], depth+1))
-    return s
-
-  for k, v in conf.items():
-    conf[k] = sub(v)
+  expanded = {}
+  expanding = set()
+
+  def replace(match):
+    # Unknown and looping references stay
+    return expanded.get(match.group(1), match.group(0))
+
+  for key in conf:
+    # Expand the values key refers to before key itself, depth first
+    stack = [key]
+    while stack:
+      k = stack[-1]
+      if k in expanded:
+        stack.pop()
+        continue
+      expanding.add(k)
+      refs = [ ref for ref in r.findall(conf[k])
+               if ref in conf and ref not in expanded and ref not in expanding ]
+      if refs:
+        stack.extend(refs)
+        continue
+      expanded[k] = r.sub(replace, conf[k])
+      expanding.discard(k)
+      stack.pop()
+
+  conf.update(expanded)
   return conf
 
 ##################################
@@ -330,65 +597,6 @@ def get_state_link(request, option=None, val='',
   return "&".join([ "%s=%s" % (key, quote_plus(value)) for key, value in states.iteritems() ])
 
 
-def _filter_jobs_by_req(joblist, request, **kwargs):
-  """
-  Unpacks filter arguments from the request object and optional
-  keyword arguments, and supplies the resulting filter to _filter_jobs.
-  """
-  args = {}
-  for x in ["jobid_exact", "jobid_substr", "pools", "user", "tasks", "text"]:
-    if x in kwargs:
-      args[x] = kwargs[x]
-    else:
-      args[x] = request.GET.get(x)
-  return _filter_jobs(joblist, **args)
-
-
-def _filter_jobs(jobs, jobid_exact=None, jobid_substr=None, pools=None, user=None, tasks=None, text=None):
-  # TODO(henry): this naive version can be replaced with something
-  # more flexible. (i.e. use getattr with a dict of values, check
-  # the type and do the right kind of test)
-  """
-  Return the set in jobs that match the supplied parameters (any of which may be
-  None). If jobid is supplied will only return exact id matches if exactid = True.
-
-  All other parameters are substring matched.
-  """
-  def predicate(job):
-    """
-    Return True if a ThriftJobInProgress structure matches the supplied filters.
-
-    If a filter argument is None, everything matches it.
-    """
-    if jobid_exact and jobid_exact != job.jobID.asString:
-      return False
-    if jobid_substr and jobid_substr not in job.jobID.asString:
-      return False
-    if pools and pools not in job.profile.queueName:
-      return False
-    if user and user not in job.profile.user:
-      return False
-    if tasks and not True: # TODO: figure out what Nutron wants to happen here
-      return False
-    if text:
-      search = text.lower()
-      # These fields are chosen to match those displayed by the JT UI
-      saw_text = False
-      for t in [job.profile.user,
-                job.profile.name,
-                job.jobID.asString,
-                job.profile.queueName,
-                job.priorityAsString
-                ]:
-        if search in t.lower():
-          saw_text = True
-          break
-      if not saw_text:
-        return False
-    return True
-
-  return filter(predicate, jobs)
-
 ##################################
 ## Task trackers
 
@@ -396,7 +604,7 @@ def get_tasktrackers(request):
   """
   Return a ThriftTaskTrackerStatusList object containing all task trackers
   """
-  return [ Tracker(tracker) for tracker in request.jt.all_task_trackers().trackers]
+  return [ Tracker.from_status(tracker) for tracker in request.jt.snapshot().trackers ]
 
 
 ##################################
@@ -404,42 +612,75 @@ def get_tasktrackers(request):
 
 def get_single_job(request, jobid):
   """
-  Returns the job which matches jobid.
+  Returns the job which matches jobid, from the archive if the JobTracker
+  no longer has it.
   """
-  return Job.from_id(jt=request.jt, jobid=jobid)
+  return _get_job(request, jobid)[0]
 
 
-def get_matching_jobs(request, **kwargs):
+def get_matching_jobs(request, count=-1, offset=0, **kwargs):
   """
-  Returns an array of jobs where the returned
-  jobs are matched by the provided filter arguments.
+  Returns a JobList of the jobs matched by the provided filter arguments,
+  count of them (all of them if count is negative) from offset on.
+  The jobs come from the JobTracker snapshot shared by all users, which
+  only has job summaries; the Jobs fetch the rest when needed.  The jobs
+  the JobTracker has retired come from the archive (see models.ArchivedJob).
 
   If a filter argument is in kwargs it will supersede the same argument
   in the request object.
 
-  Filter arguments may be jobid, pools, user, tasks, text and state.
-  """
-  jobfunc = {"completed" : request.jt.completed_jobs,
-             # Succeeded and completed are synonyms here.
-             "succeeded" : request.jt.completed_jobs,
-             "running" : request.jt.running_jobs,
-             "failed" : request.jt.failed_jobs,
-             "killed" : request.jt.killed_jobs,
-             "all" : request.jt.all_jobs}
-  if 'state' in kwargs:
-    selection = kwargs['state']
-  else:
-    selection = request.GET.get("state", "all")
-
-  joblist = jobfunc[selection]().jobs
+  Filter arguments may be state, user, queue and text; the jobs are
+  sorted by sortkey (reversed if sortrev is present), or newest first.
+  """
+  args = {}
+  for x in ["state", "user", "queue", "text", "sortkey"]:
+    if x in kwargs:
+      args[x] = kwargs[x]
+    else:
+      args[x] = request.GET.get(x)
 
-  return [Job.from_thriftjob(request.jt, j)
-          for j in _filter_jobs_by_req(joblist, request, **kwargs) ]
+  # Unknown states and sort keys fall back to the defaults
+  job_states = _JOB_STATE_FILTERS.get(args["state"], _JOB_STATE_FILTERS["all"])
+  if args["sortkey"] in _JOB_SORT_KEYS:
+    sort_key = _JOB_SORT_KEYS[args["sortkey"]]
+    descending = kwargs.get("sortrev", request.GET.has_key("sortrev"))
+  else:
+    sort_key, descending = "start_time", True
+
+  query = dict(job_states=job_states,
+               user=args["user"] or None,
+               queue=args["queue"] or None,
+               text=args["text"] or None,
+               sort_key=sort_key,
+               descending=descending)
+  if job_states is not None and \
+      not [ state for state in job_states if state.upper() in FINISHED_JOB_STATES ]:
+    # Only finished jobs are archived
+    joblist = request.jt.snapshot().get_job_summaries(count=count, offset=offset, **query)
+    return JobList(request.jt, joblist)
+
+  # The page is among the first offset + count jobs of either source
+  if count < 0:
+    end = -1
+  else:
+    end = offset + count
+  live = request.jt.snapshot().get_job_summaries(count=end, **query)
+  archived, num_archived = ArchivedJob.query(count=end, **query)
+  jobs = live.jobs + archived
+  jobs.sort(key=JOB_SORT_KEYS[sort_key], reverse=descending)
+  if count < 0:
+    jobs = jobs[offset:]
+  else:
+    jobs = jobs[offset:end]
+  joblist = ThriftJobSummaryList(jobs=jobs, numTotalJobs=live.numTotalJobs + num_archived)
+  return JobList(request.jt, joblist)
 
 
 def get_job_count_by_state(request, username):
   """
   Returns the number of comlpeted, running, and failed jobs for a user.
+
+  The counts come from the JobTracker snapshot shared by all users.
   """
   res = {
     'completed': 0,
@@ -449,11 +690,15 @@ def get_job_count_by_state(request, username):
     'all': 0
   }
 
-  jobcounts = request.jt.get_job_count_by_user(username)
-  res['completed'] = jobcounts.nSucceeded
-  res['running'] = jobcounts.nPrep + jobcounts.nRunning
-  res['failed'] = jobcounts.nFailed
-  res['killed'] = jobcounts.nKilled
+  states = {
+    'SUCCEEDED': 'completed',
+    'PREP': 'running',
+    'RUNNING': 'running',
+    'FAILED': 'failed',
+    'KILLED': 'killed'
+  }
+  for summary in request.jt.snapshot().jobs_by_user(username):
+    res[states[summary.runStateAsString]] += 1
   res['all'] = res['completed'] + res['running'] + res['failed'] + res['killed']
   return res
 
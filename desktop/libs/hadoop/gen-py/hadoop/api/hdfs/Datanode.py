@@ -20,7 +20,7 @@ class Iface(object):
   Provides an interface to data nodes, so that clients may read and write
   data blocks.
   """
-  def readBlock(self, ctx, block, offset, length):
+  def readBlock(self, ctx, block, offset, length, skipCrc):
     """
     Read bytes from a block.
     
@@ -31,6 +31,28 @@ class Iface(object):
      - block: Block to be read from.
      - offset: Offset within the block where read must start from.
      - length: Number of bytes to read.
+     - skipCrc: Don't compute the CRC32 of the data, for clients
+    that don't check it.
+    """
+    pass
+
+  def readRange(self, ctx, path, offset, length, skipCrc):
+    """
+    Read bytes from a file, across block boundaries if need be.
+    
+    The datanode reads the blocks itself, from its own replicas where
+    it has them, so the client needs no block locations.  Fewer bytes
+    than asked for are returned only at the end of the file.
+    
+    Only 2^31 - 1 bytes may be read on a single call to this method.
+    
+    Parameters:
+     - ctx
+     - path: Path of the file to be read from.
+     - offset: Offset within the file where read must start from.
+     - length: Number of bytes to read.
+     - skipCrc: Don't compute the CRC32 of the data, for clients
+    that don't check it.
     """
     pass
 
@@ -46,7 +68,7 @@ class Client(Iface):
       self._oprot = oprot
     self._seqid = 0
 
-  def readBlock(self, ctx, block, offset, length):
+  def readBlock(self, ctx, block, offset, length, skipCrc):
     """
     Read bytes from a block.
     
@@ -57,17 +79,20 @@ class Client(Iface):
      - block: Block to be read from.
      - offset: Offset within the block where read must start from.
      - length: Number of bytes to read.
+     - skipCrc: Don't compute the CRC32 of the data, for clients
+    that don't check it.
     """
-    self.send_readBlock(ctx, block, offset, length)
+    self.send_readBlock(ctx, block, offset, length, skipCrc)
     return self.recv_readBlock()
 
-  def send_readBlock(self, ctx, block, offset, length):
+  def send_readBlock(self, ctx, block, offset, length, skipCrc):
     self._oprot.writeMessageBegin('readBlock', TMessageType.CALL, self._seqid)
     args = readBlock_args()
     args.ctx = ctx
     args.block = block
     args.offset = offset
     args.length = length
+    args.skipCrc = skipCrc
     args.write(self._oprot)
     self._oprot.writeMessageEnd()
     self._oprot.trans.flush()
@@ -88,12 +113,62 @@ class Client(Iface):
       raise result.err
     raise TApplicationException(TApplicationException.MISSING_RESULT, "readBlock failed: unknown result");
 
+  def readRange(self, ctx, path, offset, length, skipCrc):
+    """
+    Read bytes from a file, across block boundaries if need be.
+    
+    The datanode reads the blocks itself, from its own replicas where
+    it has them, so the client needs no block locations.  Fewer bytes
+    than asked for are returned only at the end of the file.
+    
+    Only 2^31 - 1 bytes may be read on a single call to this method.
+    
+    Parameters:
+     - ctx
+     - path: Path of the file to be read from.
+     - offset: Offset within the file where read must start from.
+     - length: Number of bytes to read.
+     - skipCrc: Don't compute the CRC32 of the data, for clients
+    that don't check it.
+    """
+    self.send_readRange(ctx, path, offset, length, skipCrc)
+    return self.recv_readRange()
+
+  def send_readRange(self, ctx, path, offset, length, skipCrc):
+    self._oprot.writeMessageBegin('readRange', TMessageType.CALL, self._seqid)
+    args = readRange_args()
+    args.ctx = ctx
+    args.path = path
+    args.offset = offset
+    args.length = length
+    args.skipCrc = skipCrc
+    args.write(self._oprot)
+    self._oprot.writeMessageEnd()
+    self._oprot.trans.flush()
+
+  def recv_readRange(self, ):
+    (fname, mtype, rseqid) = self._iprot.readMessageBegin()
+    if mtype == TMessageType.EXCEPTION:
+      x = TApplicationException()
+      x.read(self._iprot)
+      self._iprot.readMessageEnd()
+      raise x
+    result = readRange_result()
+    result.read(self._iprot)
+    self._iprot.readMessageEnd()
+    if result.success != None:
+      return result.success
+    if result.err != None:
+      raise result.err
+    raise TApplicationException(TApplicationException.MISSING_RESULT, "readRange failed: unknown result");
+
 
 class Processor(Iface, TProcessor):
   def __init__(self, handler):
     self._handler = handler
     self._processMap = {}
     self._processMap["readBlock"] = Processor.process_readBlock
+    self._processMap["readRange"] = Processor.process_readRange
 
   def process(self, iprot, oprot):
     (name, type, seqid) = iprot.readMessageBegin()
@@ -116,7 +191,7 @@ class Processor(Iface, TProcessor):
     iprot.readMessageEnd()
     result = readBlock_result()
     try:
-      result.success = self._handler.readBlock(args.ctx, args.block, args.offset, args.length)
+      result.success = self._handler.readBlock(args.ctx, args.block, args.offset, args.length, args.skipCrc)
     except hadoop.api.common.ttypes.IOException, err:
       result.err = err
     oprot.writeMessageBegin("readBlock", TMessageType.REPLY, seqid)
@@ -124,6 +199,20 @@ class Processor(Iface, TProcessor):
     oprot.writeMessageEnd()
     oprot.trans.flush()
 
+  def process_readRange(self, seqid, iprot, oprot):
+    args = readRange_args()
+    args.read(iprot)
+    iprot.readMessageEnd()
+    result = readRange_result()
+    try:
+      result.success = self._handler.readRange(args.ctx, args.path, args.offset, args.length, args.skipCrc)
+    except hadoop.api.common.ttypes.IOException, err:
+      result.err = err
+    oprot.writeMessageBegin("readRange", TMessageType.REPLY, seqid)
+    result.write(oprot)
+    oprot.writeMessageEnd()
+    oprot.trans.flush()
+
 
 # HELPER FUNCTIONS AND STRUCTURES
 
@@ -134,6 +223,8 @@ class readBlock_args(object):
    - block: Block to be read from.
    - offset: Offset within the block where read must start from.
    - length: Number of bytes to read.
+   - skipCrc: Don't compute the CRC32 of the data, for clients
+  that don't check it.
   """
 
   thrift_spec = (
@@ -141,7 +232,7 @@ class readBlock_args(object):
     (1, TType.STRUCT, 'block', (Block, Block.thrift_spec), None, ), # 1
     (2, TType.I64, 'offset', None, None, ), # 2
     (3, TType.I32, 'length', None, None, ), # 3
-    None, # 4
+    (4, TType.BOOL, 'skipCrc', None, None, ), # 4
     None, # 5
     None, # 6
     None, # 7
@@ -150,11 +241,12 @@ class readBlock_args(object):
     (10, TType.STRUCT, 'ctx', (hadoop.api.common.ttypes.RequestContext, hadoop.api.common.ttypes.RequestContext.thrift_spec), None, ), # 10
   )
 
-  def __init__(self, ctx=None, block=None, offset=None, length=None,):
+  def __init__(self, ctx=None, block=None, offset=None, length=None, skipCrc=None,):
     self.ctx = ctx
     self.block = block
     self.offset = offset
     self.length = length
+    self.skipCrc = skipCrc
 
   def read(self, iprot):
     if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
@@ -187,6 +279,11 @@ class readBlock_args(object):
           self.length = iprot.readI32();
         else:
           iprot.skip(ftype)
+      elif fid == 4:
+        if ftype == TType.BOOL:
+          self.skipCrc = iprot.readBool();
+        else:
+          iprot.skip(ftype)
       else:
         iprot.skip(ftype)
       iprot.readFieldEnd()
@@ -209,6 +306,10 @@ class readBlock_args(object):
       oprot.writeFieldBegin('length', TType.I32, 3)
       oprot.writeI32(self.length)
       oprot.writeFieldEnd()
+    if self.skipCrc != None:
+      oprot.writeFieldBegin('skipCrc', TType.BOOL, 4)
+      oprot.writeBool(self.skipCrc)
+      oprot.writeFieldEnd()
     if self.ctx != None:
       oprot.writeFieldBegin('ctx', TType.STRUCT, 10)
       self.ctx.write(oprot)
@@ -296,4 +397,184 @@ class readBlock_result(object):
   def __ne__(self, other):
     return not (self == other)
 
+class readRange_args(object):
+  """
+  Attributes:
+   - ctx
+   - path: Path of the file to be read from.
+   - offset: Offset within the file where read must start from.
+   - length: Number of bytes to read.
+   - skipCrc: Don't compute the CRC32 of the data, for clients
+  that don't check it.
+  """
+
+  thrift_spec = (
+    None, # 0
+    (1, TType.STRING, 'path', None, None, ), # 1
+    (2, TType.I64, 'offset', None, None, ), # 2
+    (3, TType.I32, 'length', None, None, ), # 3
+    (4, TType.BOOL, 'skipCrc', None, None, ), # 4
+    None, # 5
+    None, # 6
+    None, # 7
+    None, # 8
+    None, # 9
+    (10, TType.STRUCT, 'ctx', (hadoop.api.common.ttypes.RequestContext, hadoop.api.common.ttypes.RequestContext.thrift_spec), None, ), # 10
+  )
+
+  def __init__(self, ctx=None, path=None, offset=None, length=None, skipCrc=None,):
+    self.ctx = ctx
+    self.path = path
+    self.offset = offset
+    self.length = length
+    self.skipCrc = skipCrc
+
+  def read(self, iprot):
+    if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
+      fastbinary.decode_binary(self, iprot.trans, (self.__class__, self.thrift_spec))
+      return
+    iprot.readStructBegin()
+    while True:
+      (fname, ftype, fid) = iprot.readFieldBegin()
+      if ftype == TType.STOP:
+        break
+      if fid == 10:
+        if ftype == TType.STRUCT:
+          self.ctx = hadoop.api.common.ttypes.RequestContext()
+          self.ctx.read(iprot)
+        else:
+          iprot.skip(ftype)
+      elif fid == 1:
+        if ftype == TType.STRING:
+          self.path = iprot.readString();
+        else:
+          iprot.skip(ftype)
+      elif fid == 2:
+        if ftype == TType.I64:
+          self.offset = iprot.readI64();
+        else:
+          iprot.skip(ftype)
+      elif fid == 3:
+        if ftype == TType.I32:
+          self.length = iprot.readI32();
+        else:
+          iprot.skip(ftype)
+      elif fid == 4:
+        if ftype == TType.BOOL:
+          self.skipCrc = iprot.readBool();
+        else:
+          iprot.skip(ftype)
+      else:
+        iprot.skip(ftype)
+      iprot.readFieldEnd()
+    iprot.readStructEnd()
+
+  def write(self, oprot):
+    if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
+      return
+    oprot.writeStructBegin('readRange_args')
+    if self.path != None:
+      oprot.writeFieldBegin('path', TType.STRING, 1)
+      oprot.writeString(self.path)
+      oprot.writeFieldEnd()
+    if self.offset != None:
+      oprot.writeFieldBegin('offset', TType.I64, 2)
+      oprot.writeI64(self.offset)
+      oprot.writeFieldEnd()
+    if self.length != None:
+      oprot.writeFieldBegin('length', TType.I32, 3)
+      oprot.writeI32(self.length)
+      oprot.writeFieldEnd()
+    if self.skipCrc != None:
+      oprot.writeFieldBegin('skipCrc', TType.BOOL, 4)
+      oprot.writeBool(self.skipCrc)
+      oprot.writeFieldEnd()
+    if self.ctx != None:
+      oprot.writeFieldBegin('ctx', TType.STRUCT, 10)
+      self.ctx.write(oprot)
+      oprot.writeFieldEnd()
+    oprot.writeFieldStop()
+    oprot.writeStructEnd()
+
+  def __repr__(self):
+    L = ['%s=%r' % (key, value)
+      for key, value in self.__dict__.iteritems()]
+    return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+  def __eq__(self, other):
+    return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+  def __ne__(self, other):
+    return not (self == other)
+
+class readRange_result(object):
+  """
+  Attributes:
+   - success
+   - err
+  """
+
+  thrift_spec = (
+    (0, TType.STRUCT, 'success', (BlockData, BlockData.thrift_spec), None, ), # 0
+    (1, TType.STRUCT, 'err', (hadoop.api.common.ttypes.IOException, hadoop.api.common.ttypes.IOException.thrift_spec), None, ), # 1
+  )
+
+  def __init__(self, success=None, err=None,):
+    self.success = success
+    self.err = err
+
+  def read(self, iprot):
+    if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
+      fastbinary.decode_binary(self, iprot.trans, (self.__class__, self.thrift_spec))
+      return
+    iprot.readStructBegin()
+    while True:
+      (fname, ftype, fid) = iprot.readFieldBegin()
+      if ftype == TType.STOP:
+        break
+      if fid == 0:
+        if ftype == TType.STRUCT:
+          self.success = BlockData()
+          self.success.read(iprot)
+        else:
+          iprot.skip(ftype)
+      elif fid == 1:
+        if ftype == TType.STRUCT:
+          self.err = hadoop.api.common.ttypes.IOException()
+          self.err.read(iprot)
+        else:
+          iprot.skip(ftype)
+      else:
+        iprot.skip(ftype)
+      iprot.readFieldEnd()
+    iprot.readStructEnd()
+
+  def write(self, oprot):
+    if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
+      return
+    oprot.writeStructBegin('readRange_result')
+    if self.success != None:
+      oprot.writeFieldBegin('success', TType.STRUCT, 0)
+      self.success.write(oprot)
+      oprot.writeFieldEnd()
+    if self.err != None:
+      oprot.writeFieldBegin('err', TType.STRUCT, 1)
+      self.err.write(oprot)
+      oprot.writeFieldEnd()
+    oprot.writeFieldStop()
+    oprot.writeStructEnd()
+
+  def __repr__(self):
+    L = ['%s=%r' % (key, value)
+      for key, value in self.__dict__.iteritems()]
+    return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+  def __eq__(self, other):
+    return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+  def __ne__(self, other):
+    return not (self == other)
+
 
@@ -969,7 +969,7 @@ class BlockData(object):
   Encapsulates a block data transfer with its CRC
   
   Attributes:
-   - crc: CRC32 of the data being transfered
+   - crc: CRC32 of the data being transfered (0 if the client skipped it)
    - length: Length of the data being transfered
    - data: The data itsef
   """
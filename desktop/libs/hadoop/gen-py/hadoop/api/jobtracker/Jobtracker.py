@@ -57,6 +57,16 @@ class Iface(hadoop.api.common.HadoopServiceBase.Iface):
     """
     pass
 
+  def getJobNoTasks(self, ctx, jobID):
+    """
+    Get a job by ID, without its task list (see getTopTasks)
+    
+    Parameters:
+     - ctx
+     - jobID
+    """
+    pass
+
   def getRunningJobs(self, ctx):
     """
     Get a list of currently running jobs
@@ -102,6 +112,33 @@ class Iface(hadoop.api.common.HadoopServiceBase.Iface):
     """
     pass
 
+  def getJobSummaries(self, ctx, filter, sort, offset, limit):
+    """
+    Get the summaries of one page of the jobs matching a filter, in
+    the given order. numTotalJobs of the result is the number of
+    matching jobs. A negative limit means no limit.
+    
+    Parameters:
+     - ctx
+     - filter
+     - sort
+     - offset
+     - limit
+    """
+    pass
+
+  def getJobsChangedSince(self, ctx, token):
+    """
+    Get the jobs whose state or progress changed since token, which
+    is 0 or the token returned by an earlier call. When nothing has
+    changed, the result is empty.
+    
+    Parameters:
+     - ctx
+     - token
+    """
+    pass
+
   def getUserJobCounts(self, ctx, user):
     """
     Get the count of jobs by status for a given user
@@ -127,6 +164,49 @@ class Iface(hadoop.api.common.HadoopServiceBase.Iface):
     """
     pass
 
+  def getTopTasks(self, ctx, jobID, states, count, newestFirst):
+    """
+    Get the count tasks in any of states that started executing last
+    (or first, unless newestFirst), in that order. numTotalTasks is the
+    number of tasks in those states.
+    
+    Parameters:
+     - ctx
+     - jobID
+     - states
+     - count
+     - newestFirst
+    """
+    pass
+
+  def getTaskPage(self, ctx, jobID, types, states, text, cursor, count):
+    """
+    Get count tasks from cursor (empty for the first page) on, of
+    the tasks that match a filter, as per getTaskList. The matching
+    tasks are kept for a while, so that getting the next pages
+    doesn't filter every task of the job again.
+    
+    Parameters:
+     - ctx
+     - jobID
+     - types
+     - states
+     - text
+     - cursor
+     - count
+    """
+    pass
+
+  def getTaskTimeline(self, ctx, jobID):
+    """
+    Get the start and finish times of every task of a job
+    
+    Parameters:
+     - ctx
+     - jobID
+    """
+    pass
+
   def getTask(self, ctx, taskID):
     """
     Get details of a task
@@ -388,6 +468,42 @@ class Client(hadoop.api.common.HadoopServiceBase.Client, Iface):
       raise result.err
     raise TApplicationException(TApplicationException.MISSING_RESULT, "getJob failed: unknown result");
 
+  def getJobNoTasks(self, ctx, jobID):
+    """
+    Get a job by ID, without its task list (see getTopTasks)
+    
+    Parameters:
+     - ctx
+     - jobID
+    """
+    self.send_getJobNoTasks(ctx, jobID)
+    return self.recv_getJobNoTasks()
+
+  def send_getJobNoTasks(self, ctx, jobID):
+    self._oprot.writeMessageBegin('getJobNoTasks', TMessageType.CALL, self._seqid)
+    args = getJobNoTasks_args()
+    args.ctx = ctx
+    args.jobID = jobID
+    args.write(self._oprot)
+    self._oprot.writeMessageEnd()
+    self._oprot.trans.flush()
+
+  def recv_getJobNoTasks(self, ):
+    (fname, mtype, rseqid) = self._iprot.readMessageBegin()
+    if mtype == TMessageType.EXCEPTION:
+      x = TApplicationException()
+      x.read(self._iprot)
+      self._iprot.readMessageEnd()
+      raise x
+    result = getJobNoTasks_result()
+    result.read(self._iprot)
+    self._iprot.readMessageEnd()
+    if result.success != None:
+      return result.success
+    if result.err != None:
+      raise result.err
+    raise TApplicationException(TApplicationException.MISSING_RESULT, "getJobNoTasks failed: unknown result");
+
   def getRunningJobs(self, ctx):
     """
     Get a list of currently running jobs
@@ -548,6 +664,84 @@ class Client(hadoop.api.common.HadoopServiceBase.Client, Iface):
       return result.success
     raise TApplicationException(TApplicationException.MISSING_RESULT, "getAllJobs failed: unknown result");
 
+  def getJobSummaries(self, ctx, filter, sort, offset, limit):
+    """
+    Get the summaries of one page of the jobs matching a filter, in
+    the given order. numTotalJobs of the result is the number of
+    matching jobs. A negative limit means no limit.
+    
+    Parameters:
+     - ctx
+     - filter
+     - sort
+     - offset
+     - limit
+    """
+    self.send_getJobSummaries(ctx, filter, sort, offset, limit)
+    return self.recv_getJobSummaries()
+
+  def send_getJobSummaries(self, ctx, filter, sort, offset, limit):
+    self._oprot.writeMessageBegin('getJobSummaries', TMessageType.CALL, self._seqid)
+    args = getJobSummaries_args()
+    args.ctx = ctx
+    args.filter = filter
+    args.sort = sort
+    args.offset = offset
+    args.limit = limit
+    args.write(self._oprot)
+    self._oprot.writeMessageEnd()
+    self._oprot.trans.flush()
+
+  def recv_getJobSummaries(self, ):
+    (fname, mtype, rseqid) = self._iprot.readMessageBegin()
+    if mtype == TMessageType.EXCEPTION:
+      x = TApplicationException()
+      x.read(self._iprot)
+      self._iprot.readMessageEnd()
+      raise x
+    result = getJobSummaries_result()
+    result.read(self._iprot)
+    self._iprot.readMessageEnd()
+    if result.success != None:
+      return result.success
+    raise TApplicationException(TApplicationException.MISSING_RESULT, "getJobSummaries failed: unknown result");
+
+  def getJobsChangedSince(self, ctx, token):
+    """
+    Get the jobs whose state or progress changed since token, which
+    is 0 or the token returned by an earlier call. When nothing has
+    changed, the result is empty.
+    
+    Parameters:
+     - ctx
+     - token
+    """
+    self.send_getJobsChangedSince(ctx, token)
+    return self.recv_getJobsChangedSince()
+
+  def send_getJobsChangedSince(self, ctx, token):
+    self._oprot.writeMessageBegin('getJobsChangedSince', TMessageType.CALL, self._seqid)
+    args = getJobsChangedSince_args()
+    args.ctx = ctx
+    args.token = token
+    args.write(self._oprot)
+    self._oprot.writeMessageEnd()
+    self._oprot.trans.flush()
+
+  def recv_getJobsChangedSince(self, ):
+    (fname, mtype, rseqid) = self._iprot.readMessageBegin()
+    if mtype == TMessageType.EXCEPTION:
+      x = TApplicationException()
+      x.read(self._iprot)
+      self._iprot.readMessageEnd()
+      raise x
+    result = getJobsChangedSince_result()
+    result.read(self._iprot)
+    self._iprot.readMessageEnd()
+    if result.success != None:
+      return result.success
+    raise TApplicationException(TApplicationException.MISSING_RESULT, "getJobsChangedSince failed: unknown result");
+
   def getUserJobCounts(self, ctx, user):
     """
     Get the count of jobs by status for a given user
@@ -628,6 +822,135 @@ class Client(hadoop.api.common.HadoopServiceBase.Client, Iface):
       raise result.err
     raise TApplicationException(TApplicationException.MISSING_RESULT, "getTaskList failed: unknown result");
 
+  def getTopTasks(self, ctx, jobID, states, count, newestFirst):
+    """
+    Get the count tasks in any of states that started executing last
+    (or first, unless newestFirst), in that order. numTotalTasks is the
+    number of tasks in those states.
+    
+    Parameters:
+     - ctx
+     - jobID
+     - states
+     - count
+     - newestFirst
+    """
+    self.send_getTopTasks(ctx, jobID, states, count, newestFirst)
+    return self.recv_getTopTasks()
+
+  def send_getTopTasks(self, ctx, jobID, states, count, newestFirst):
+    self._oprot.writeMessageBegin('getTopTasks', TMessageType.CALL, self._seqid)
+    args = getTopTasks_args()
+    args.ctx = ctx
+    args.jobID = jobID
+    args.states = states
+    args.count = count
+    args.newestFirst = newestFirst
+    args.write(self._oprot)
+    self._oprot.writeMessageEnd()
+    self._oprot.trans.flush()
+
+  def recv_getTopTasks(self, ):
+    (fname, mtype, rseqid) = self._iprot.readMessageBegin()
+    if mtype == TMessageType.EXCEPTION:
+      x = TApplicationException()
+      x.read(self._iprot)
+      self._iprot.readMessageEnd()
+      raise x
+    result = getTopTasks_result()
+    result.read(self._iprot)
+    self._iprot.readMessageEnd()
+    if result.success != None:
+      return result.success
+    if result.err != None:
+      raise result.err
+    raise TApplicationException(TApplicationException.MISSING_RESULT, "getTopTasks failed: unknown result");
+
+  def getTaskPage(self, ctx, jobID, types, states, text, cursor, count):
+    """
+    Get count tasks from cursor (empty for the first page) on, of
+    the tasks that match a filter, as per getTaskList. The matching
+    tasks are kept for a while, so that getting the next pages
+    doesn't filter every task of the job again.
+    
+    Parameters:
+     - ctx
+     - jobID
+     - types
+     - states
+     - text
+     - cursor
+     - count
+    """
+    self.send_getTaskPage(ctx, jobID, types, states, text, cursor, count)
+    return self.recv_getTaskPage()
+
+  def send_getTaskPage(self, ctx, jobID, types, states, text, cursor, count):
+    self._oprot.writeMessageBegin('getTaskPage', TMessageType.CALL, self._seqid)
+    args = getTaskPage_args()
+    args.ctx = ctx
+    args.jobID = jobID
+    args.types = types
+    args.states = states
+    args.text = text
+    args.cursor = cursor
+    args.count = count
+    args.write(self._oprot)
+    self._oprot.writeMessageEnd()
+    self._oprot.trans.flush()
+
+  def recv_getTaskPage(self, ):
+    (fname, mtype, rseqid) = self._iprot.readMessageBegin()
+    if mtype == TMessageType.EXCEPTION:
+      x = TApplicationException()
+      x.read(self._iprot)
+      self._iprot.readMessageEnd()
+      raise x
+    result = getTaskPage_result()
+    result.read(self._iprot)
+    self._iprot.readMessageEnd()
+    if result.success != None:
+      return result.success
+    if result.err != None:
+      raise result.err
+    raise TApplicationException(TApplicationException.MISSING_RESULT, "getTaskPage failed: unknown result");
+
+  def getTaskTimeline(self, ctx, jobID):
+    """
+    Get the start and finish times of every task of a job
+    
+    Parameters:
+     - ctx
+     - jobID
+    """
+    self.send_getTaskTimeline(ctx, jobID)
+    return self.recv_getTaskTimeline()
+
+  def send_getTaskTimeline(self, ctx, jobID):
+    self._oprot.writeMessageBegin('getTaskTimeline', TMessageType.CALL, self._seqid)
+    args = getTaskTimeline_args()
+    args.ctx = ctx
+    args.jobID = jobID
+    args.write(self._oprot)
+    self._oprot.writeMessageEnd()
+    self._oprot.trans.flush()
+
+  def recv_getTaskTimeline(self, ):
+    (fname, mtype, rseqid) = self._iprot.readMessageBegin()
+    if mtype == TMessageType.EXCEPTION:
+      x = TApplicationException()
+      x.read(self._iprot)
+      self._iprot.readMessageEnd()
+      raise x
+    result = getTaskTimeline_result()
+    result.read(self._iprot)
+    self._iprot.readMessageEnd()
+    if result.success != None:
+      return result.success
+    if result.err != None:
+      raise result.err
+    raise TApplicationException(TApplicationException.MISSING_RESULT, "getTaskTimeline failed: unknown result");
+
   def getTask(self, ctx, taskID):
     """
     Get details of a task
@@ -1060,13 +1383,19 @@ class Processor(hadoop.api.common.HadoopServiceBase.Processor, Iface, TProcessor
     self._processMap["getClusterStatus"] = Processor.process_getClusterStatus
     self._processMap["getQueues"] = Processor.process_getQueues
     self._processMap["getJob"] = Processor.process_getJob
+    self._processMap["getJobNoTasks"] = Processor.process_getJobNoTasks
     self._processMap["getRunningJobs"] = Processor.process_getRunningJobs
     self._processMap["getCompletedJobs"] = Processor.process_getCompletedJobs
     self._processMap["getFailedJobs"] = Processor.process_getFailedJobs
     self._processMap["getKilledJobs"] = Processor.process_getKilledJobs
     self._processMap["getAllJobs"] = Processor.process_getAllJobs
+    self._processMap["getJobSummaries"] = Processor.process_getJobSummaries
+    self._processMap["getJobsChangedSince"] = Processor.process_getJobsChangedSince
     self._processMap["getUserJobCounts"] = Processor.process_getUserJobCounts
     self._processMap["getTaskList"] = Processor.process_getTaskList
+    self._processMap["getTopTasks"] = Processor.process_getTopTasks
+    self._processMap["getTaskPage"] = Processor.process_getTaskPage
+    self._processMap["getTaskTimeline"] = Processor.process_getTaskTimeline
     self._processMap["getTask"] = Processor.process_getTask
     self._processMap["getJobCounters"] = Processor.process_getJobCounters
     self._processMap["getJobCounterRollups"] = Processor.process_getJobCounterRollups
@@ -1145,6 +1474,20 @@ class Processor(hadoop.api.common.HadoopServiceBase.Processor, Iface, TProcessor
     oprot.writeMessageEnd()
     oprot.trans.flush()
 
+  def process_getJobNoTasks(self, seqid, iprot, oprot):
+    args = getJobNoTasks_args()
+    args.read(iprot)
+    iprot.readMessageEnd()
+    result = getJobNoTasks_result()
+    try:
+      result.success = self._handler.getJobNoTasks(args.ctx, args.jobID)
+    except JobNotFoundException, err:
+      result.err = err
+    oprot.writeMessageBegin("getJobNoTasks", TMessageType.REPLY, seqid)
+    result.write(oprot)
+    oprot.writeMessageEnd()
+    oprot.trans.flush()
+
   def process_getRunningJobs(self, seqid, iprot, oprot):
     args = getRunningJobs_args()
     args.read(iprot)
@@ -1200,6 +1543,28 @@ class Processor(hadoop.api.common.HadoopServiceBase.Processor, Iface, TProcessor
     oprot.writeMessageEnd()
     oprot.trans.flush()
 
+  def process_getJobSummaries(self, seqid, iprot, oprot):
+    args = getJobSummaries_args()
+    args.read(iprot)
+    iprot.readMessageEnd()
+    result = getJobSummaries_result()
+    result.success = self._handler.getJobSummaries(args.ctx, args.filter, args.sort, args.offset, args.limit)
+    oprot.writeMessageBegin("getJobSummaries", TMessageType.REPLY, seqid)
+    result.write(oprot)
+    oprot.writeMessageEnd()
+    oprot.trans.flush()
+
+  def process_getJobsChangedSince(self, seqid, iprot, oprot):
+    args = getJobsChangedSince_args()
+    args.read(iprot)
+    iprot.readMessageEnd()
+    result = getJobsChangedSince_result()
+    result.success = self._handler.getJobsChangedSince(args.ctx, args.token)
+    oprot.writeMessageBegin("getJobsChangedSince", TMessageType.REPLY, seqid)
+    result.write(oprot)
+    oprot.writeMessageEnd()
+    oprot.trans.flush()
+
   def process_getUserJobCounts(self, seqid, iprot, oprot):
     args = getUserJobCounts_args()
     args.read(iprot)
@@ -1225,43 +1590,85 @@ class Processor(hadoop.api.common.HadoopServiceBase.Processor, Iface, TProcessor
     oprot.writeMessageEnd()
     oprot.trans.flush()
 
-  def process_getTask(self, seqid, iprot, oprot):
-    args = getTask_args()
+  def process_getTopTasks(self, seqid, iprot, oprot):
+    args = getTopTasks_args()
     args.read(iprot)
     iprot.readMessageEnd()
-    result = getTask_result()
+    result = getTopTasks_result()
     try:
-      result.success = self._handler.getTask(args.ctx, args.taskID)
-    except JobNotFoundException, jnf:
-      result.jnf = jnf
-    except TaskNotFoundException, tnf:
-      result.tnf = tnf
-    oprot.writeMessageBegin("getTask", TMessageType.REPLY, seqid)
+      result.success = self._handler.getTopTasks(args.ctx, args.jobID, args.states, args.count, args.newestFirst)
+    except JobNotFoundException, err:
+      result.err = err
+    oprot.writeMessageBegin("getTopTasks", TMessageType.REPLY, seqid)
     result.write(oprot)
     oprot.writeMessageEnd()
     oprot.trans.flush()
 
-  def process_getJobCounters(self, seqid, iprot, oprot):
-    args = getJobCounters_args()
+  def process_getTaskPage(self, seqid, iprot, oprot):
+    args = getTaskPage_args()
     args.read(iprot)
     iprot.readMessageEnd()
-    result = getJobCounters_result()
+    result = getTaskPage_result()
     try:
-      result.success = self._handler.getJobCounters(args.ctx, args.jobID)
+      result.success = self._handler.getTaskPage(args.ctx, args.jobID, args.types, args.states, args.text, args.cursor, args.count)
     except JobNotFoundException, err:
       result.err = err
-    oprot.writeMessageBegin("getJobCounters", TMessageType.REPLY, seqid)
+    oprot.writeMessageBegin("getTaskPage", TMessageType.REPLY, seqid)
     result.write(oprot)
     oprot.writeMessageEnd()
     oprot.trans.flush()
 
-  def process_getJobCounterRollups(self, seqid, iprot, oprot):
-    args = getJobCounterRollups_args()
+  def process_getTaskTimeline(self, seqid, iprot, oprot):
+    args = getTaskTimeline_args()
     args.read(iprot)
     iprot.readMessageEnd()
-    result = getJobCounterRollups_result()
+    result = getTaskTimeline_result()
     try:
-      result.success = self._handler.getJobCounterRollups(args.ctx, args.jobID)
+      result.success = self._handler.getTaskTimeline(args.ctx, args.jobID)
+    except JobNotFoundException, err:
+      result.err = err
+    oprot.writeMessageBegin("getTaskTimeline", TMessageType.REPLY, seqid)
+    result.write(oprot)
+    oprot.writeMessageEnd()
+    oprot.trans.flush()
+
+  def process_getTask(self, seqid, iprot, oprot):
+    args = getTask_args()
+    args.read(iprot)
+    iprot.readMessageEnd()
+    result = getTask_result()
+    try:
+      result.success = self._handler.getTask(args.ctx, args.taskID)
+    except JobNotFoundException, jnf:
+      result.jnf = jnf
+    except TaskNotFoundException, tnf:
+      result.tnf = tnf
+    oprot.writeMessageBegin("getTask", TMessageType.REPLY, seqid)
+    result.write(oprot)
+    oprot.writeMessageEnd()
+    oprot.trans.flush()
+
+  def process_getJobCounters(self, seqid, iprot, oprot):
+    args = getJobCounters_args()
+    args.read(iprot)
+    iprot.readMessageEnd()
+    result = getJobCounters_result()
+    try:
+      result.success = self._handler.getJobCounters(args.ctx, args.jobID)
+    except JobNotFoundException, err:
+      result.err = err
+    oprot.writeMessageBegin("getJobCounters", TMessageType.REPLY, seqid)
+    result.write(oprot)
+    oprot.writeMessageEnd()
+    oprot.trans.flush()
+
+  def process_getJobCounterRollups(self, seqid, iprot, oprot):
+    args = getJobCounterRollups_args()
+    args.read(iprot)
+    iprot.readMessageEnd()
+    result = getJobCounterRollups_result()
+    try:
+      result.success = self._handler.getJobCounterRollups(args.ctx, args.jobID)
     except JobNotFoundException, err:
       result.err = err
     oprot.writeMessageBegin("getJobCounterRollups", TMessageType.REPLY, seqid)
@@ -1919,15 +2326,16 @@ class getJob_result(object):
   def __ne__(self, other):
     return not (self == other)
 
-class getRunningJobs_args(object):
+class getJobNoTasks_args(object):
   """
   Attributes:
    - ctx
+   - jobID
   """
 
   thrift_spec = (
     None, # 0
-    None, # 1
+    (1, TType.STRUCT, 'jobID', (ThriftJobID, ThriftJobID.thrift_spec), None, ), # 1
     None, # 2
     None, # 3
     None, # 4
@@ -1939,8 +2347,9 @@ class getRunningJobs_args(object):
     (10, TType.STRUCT, 'ctx', (hadoop.api.common.ttypes.RequestContext, hadoop.api.common.ttypes.RequestContext.thrift_spec), None, ), # 10
   )
 
-  def __init__(self, ctx=None,):
+  def __init__(self, ctx=None, jobID=None,):
     self.ctx = ctx
+    self.jobID = jobID
 
   def read(self, iprot):
     if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
@@ -1957,6 +2366,12 @@ class getRunningJobs_args(object):
           self.ctx.read(iprot)
         else:
           iprot.skip(ftype)
+      elif fid == 1:
+        if ftype == TType.STRUCT:
+          self.jobID = ThriftJobID()
+          self.jobID.read(iprot)
+        else:
+          iprot.skip(ftype)
       else:
         iprot.skip(ftype)
       iprot.readFieldEnd()
@@ -1966,7 +2381,11 @@ class getRunningJobs_args(object):
     if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
       oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
       return
-    oprot.writeStructBegin('getRunningJobs_args')
+    oprot.writeStructBegin('getJobNoTasks_args')
+    if self.jobID != None:
+      oprot.writeFieldBegin('jobID', TType.STRUCT, 1)
+      self.jobID.write(oprot)
+      oprot.writeFieldEnd()
     if self.ctx != None:
       oprot.writeFieldBegin('ctx', TType.STRUCT, 10)
       self.ctx.write(oprot)
@@ -1985,18 +2404,21 @@ class getRunningJobs_args(object):
   def __ne__(self, other):
     return not (self == other)
 
-class getRunningJobs_result(object):
+class getJobNoTasks_result(object):
   """
   Attributes:
    - success
+   - err
   """
 
   thrift_spec = (
-    (0, TType.STRUCT, 'success', (ThriftJobList, ThriftJobList.thrift_spec), None, ), # 0
+    (0, TType.STRUCT, 'success', (ThriftJobInProgress, ThriftJobInProgress.thrift_spec), None, ), # 0
+    (1, TType.STRUCT, 'err', (JobNotFoundException, JobNotFoundException.thrift_spec), None, ), # 1
   )
 
-  def __init__(self, success=None,):
+  def __init__(self, success=None, err=None,):
     self.success = success
+    self.err = err
 
   def read(self, iprot):
     if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
@@ -2009,10 +2431,16 @@ class getRunningJobs_result(object):
         break
       if fid == 0:
         if ftype == TType.STRUCT:
-          self.success = ThriftJobList()
+          self.success = ThriftJobInProgress()
           self.success.read(iprot)
         else:
           iprot.skip(ftype)
+      elif fid == 1:
+        if ftype == TType.STRUCT:
+          self.err = JobNotFoundException()
+          self.err.read(iprot)
+        else:
+          iprot.skip(ftype)
       else:
         iprot.skip(ftype)
       iprot.readFieldEnd()
@@ -2022,11 +2450,15 @@ class getRunningJobs_result(object):
     if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
       oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
       return
-    oprot.writeStructBegin('getRunningJobs_result')
+    oprot.writeStructBegin('getJobNoTasks_result')
     if self.success != None:
       oprot.writeFieldBegin('success', TType.STRUCT, 0)
       self.success.write(oprot)
       oprot.writeFieldEnd()
+    if self.err != None:
+      oprot.writeFieldBegin('err', TType.STRUCT, 1)
+      self.err.write(oprot)
+      oprot.writeFieldEnd()
     oprot.writeFieldStop()
     oprot.writeStructEnd()
 
@@ -2041,7 +2473,7 @@ class getRunningJobs_result(object):
   def __ne__(self, other):
     return not (self == other)
 
-class getCompletedJobs_args(object):
+class getRunningJobs_args(object):
   """
   Attributes:
    - ctx
@@ -2088,7 +2520,7 @@ class getCompletedJobs_args(object):
     if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
       oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
       return
-    oprot.writeStructBegin('getCompletedJobs_args')
+    oprot.writeStructBegin('getRunningJobs_args')
     if self.ctx != None:
       oprot.writeFieldBegin('ctx', TType.STRUCT, 10)
       self.ctx.write(oprot)
@@ -2107,7 +2539,7 @@ class getCompletedJobs_args(object):
   def __ne__(self, other):
     return not (self == other)
 
-class getCompletedJobs_result(object):
+class getRunningJobs_result(object):
   """
   Attributes:
    - success
@@ -2144,7 +2576,7 @@ class getCompletedJobs_result(object):
     if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
       oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
       return
-    oprot.writeStructBegin('getCompletedJobs_result')
+    oprot.writeStructBegin('getRunningJobs_result')
     if self.success != None:
       oprot.writeFieldBegin('success', TType.STRUCT, 0)
       self.success.write(oprot)
@@ -2163,7 +2595,7 @@ class getCompletedJobs_result(object):
   def __ne__(self, other):
     return not (self == other)
 
-class getFailedJobs_args(object):
+class getCompletedJobs_args(object):
   """
   Attributes:
    - ctx
@@ -2210,7 +2642,7 @@ class getFailedJobs_args(object):
     if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
       oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
       return
-    oprot.writeStructBegin('getFailedJobs_args')
+    oprot.writeStructBegin('getCompletedJobs_args')
     if self.ctx != None:
       oprot.writeFieldBegin('ctx', TType.STRUCT, 10)
       self.ctx.write(oprot)
@@ -2229,7 +2661,7 @@ class getFailedJobs_args(object):
   def __ne__(self, other):
     return not (self == other)
 
-class getFailedJobs_result(object):
+class getCompletedJobs_result(object):
   """
   Attributes:
    - success
@@ -2266,7 +2698,7 @@ class getFailedJobs_result(object):
     if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
       oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
       return
-    oprot.writeStructBegin('getFailedJobs_result')
+    oprot.writeStructBegin('getCompletedJobs_result')
     if self.success != None:
       oprot.writeFieldBegin('success', TType.STRUCT, 0)
       self.success.write(oprot)
@@ -2285,7 +2717,7 @@ class getFailedJobs_result(object):
   def __ne__(self, other):
     return not (self == other)
 
-class getKilledJobs_args(object):
+class getFailedJobs_args(object):
   """
   Attributes:
    - ctx
@@ -2332,7 +2764,7 @@ class getKilledJobs_args(object):
     if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
       oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
       return
-    oprot.writeStructBegin('getKilledJobs_args')
+    oprot.writeStructBegin('getFailedJobs_args')
     if self.ctx != None:
       oprot.writeFieldBegin('ctx', TType.STRUCT, 10)
       self.ctx.write(oprot)
@@ -2351,7 +2783,7 @@ class getKilledJobs_args(object):
   def __ne__(self, other):
     return not (self == other)
 
-class getKilledJobs_result(object):
+class getFailedJobs_result(object):
   """
   Attributes:
    - success
@@ -2388,7 +2820,7 @@ class getKilledJobs_result(object):
     if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
       oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
       return
-    oprot.writeStructBegin('getKilledJobs_result')
+    oprot.writeStructBegin('getFailedJobs_result')
     if self.success != None:
       oprot.writeFieldBegin('success', TType.STRUCT, 0)
       self.success.write(oprot)
@@ -2407,7 +2839,7 @@ class getKilledJobs_result(object):
   def __ne__(self, other):
     return not (self == other)
 
-class getAllJobs_args(object):
+class getKilledJobs_args(object):
   """
   Attributes:
    - ctx
@@ -2454,7 +2886,7 @@ class getAllJobs_args(object):
     if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
       oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
       return
-    oprot.writeStructBegin('getAllJobs_args')
+    oprot.writeStructBegin('getKilledJobs_args')
     if self.ctx != None:
       oprot.writeFieldBegin('ctx', TType.STRUCT, 10)
       self.ctx.write(oprot)
@@ -2473,7 +2905,7 @@ class getAllJobs_args(object):
   def __ne__(self, other):
     return not (self == other)
 
-class getAllJobs_result(object):
+class getKilledJobs_result(object):
   """
   Attributes:
    - success
@@ -2510,7 +2942,7 @@ class getAllJobs_result(object):
     if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
       oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
       return
-    oprot.writeStructBegin('getAllJobs_result')
+    oprot.writeStructBegin('getKilledJobs_result')
     if self.success != None:
       oprot.writeFieldBegin('success', TType.STRUCT, 0)
       self.success.write(oprot)
@@ -2529,22 +2961,28 @@ class getAllJobs_result(object):
   def __ne__(self, other):
     return not (self == other)
 
-class getUserJobCounts_args(object):
+class getAllJobs_args(object):
   """
   Attributes:
    - ctx
-   - user
   """
 
   thrift_spec = (
     None, # 0
-    (1, TType.STRUCT, 'ctx', (hadoop.api.common.ttypes.RequestContext, hadoop.api.common.ttypes.RequestContext.thrift_spec), None, ), # 1
-    (2, TType.STRING, 'user', None, None, ), # 2
+    None, # 1
+    None, # 2
+    None, # 3
+    None, # 4
+    None, # 5
+    None, # 6
+    None, # 7
+    None, # 8
+    None, # 9
+    (10, TType.STRUCT, 'ctx', (hadoop.api.common.ttypes.RequestContext, hadoop.api.common.ttypes.RequestContext.thrift_spec), None, ), # 10
   )
 
-  def __init__(self, ctx=None, user=None,):
+  def __init__(self, ctx=None,):
     self.ctx = ctx
-    self.user = user
 
   def read(self, iprot):
     if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
@@ -2555,17 +2993,12 @@ class getUserJobCounts_args(object):
       (fname, ftype, fid) = iprot.readFieldBegin()
       if ftype == TType.STOP:
         break
-      if fid == 1:
+      if fid == 10:
         if ftype == TType.STRUCT:
           self.ctx = hadoop.api.common.ttypes.RequestContext()
           self.ctx.read(iprot)
         else:
           iprot.skip(ftype)
-      elif fid == 2:
-        if ftype == TType.STRING:
-          self.user = iprot.readString();
-        else:
-          iprot.skip(ftype)
       else:
         iprot.skip(ftype)
       iprot.readFieldEnd()
@@ -2575,15 +3008,11 @@ class getUserJobCounts_args(object):
     if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
       oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
       return
-    oprot.writeStructBegin('getUserJobCounts_args')
+    oprot.writeStructBegin('getAllJobs_args')
     if self.ctx != None:
-      oprot.writeFieldBegin('ctx', TType.STRUCT, 1)
+      oprot.writeFieldBegin('ctx', TType.STRUCT, 10)
       self.ctx.write(oprot)
       oprot.writeFieldEnd()
-    if self.user != None:
-      oprot.writeFieldBegin('user', TType.STRING, 2)
-      oprot.writeString(self.user)
-      oprot.writeFieldEnd()
     oprot.writeFieldStop()
     oprot.writeStructEnd()
 
@@ -2598,14 +3027,14 @@ class getUserJobCounts_args(object):
   def __ne__(self, other):
     return not (self == other)
 
-class getUserJobCounts_result(object):
+class getAllJobs_result(object):
   """
   Attributes:
    - success
   """
 
   thrift_spec = (
-    (0, TType.STRUCT, 'success', (ThriftUserJobCounts, ThriftUserJobCounts.thrift_spec), None, ), # 0
+    (0, TType.STRUCT, 'success', (ThriftJobList, ThriftJobList.thrift_spec), None, ), # 0
   )
 
   def __init__(self, success=None,):
@@ -2622,7 +3051,7 @@ class getUserJobCounts_result(object):
         break
       if fid == 0:
         if ftype == TType.STRUCT:
-          self.success = ThriftUserJobCounts()
+          self.success = ThriftJobList()
           self.success.read(iprot)
         else:
           iprot.skip(ftype)
@@ -2635,7 +3064,7 @@ class getUserJobCounts_result(object):
     if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
       oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
       return
-    oprot.writeStructBegin('getUserJobCounts_result')
+    oprot.writeStructBegin('getAllJobs_result')
     if self.success != None:
       oprot.writeFieldBegin('success', TType.STRUCT, 0)
       self.success.write(oprot)
@@ -2654,37 +3083,36 @@ class getUserJobCounts_result(object):
   def __ne__(self, other):
     return not (self == other)
 
-class getTaskList_args(object):
+class getJobSummaries_args(object):
   """
   Attributes:
    - ctx
-   - jobID
-   - types
-   - states
-   - text
-   - count
+   - filter
+   - sort
    - offset
+   - limit
   """
 
   thrift_spec = (
     None, # 0
-    (1, TType.STRUCT, 'ctx', (hadoop.api.common.ttypes.RequestContext, hadoop.api.common.ttypes.RequestContext.thrift_spec), None, ), # 1
-    (2, TType.STRUCT, 'jobID', (ThriftJobID, ThriftJobID.thrift_spec), None, ), # 2
-    (3, TType.SET, 'types', (TType.I32,None), None, ), # 3
-    (4, TType.SET, 'states', (TType.I32,None), None, ), # 4
-    (5, TType.STRING, 'text', None, None, ), # 5
-    (6, TType.I32, 'count', None, None, ), # 6
-    (7, TType.I32, 'offset', None, None, ), # 7
+    (1, TType.STRUCT, 'filter', (ThriftJobFilter, ThriftJobFilter.thrift_spec), None, ), # 1
+    (2, TType.STRUCT, 'sort', (ThriftJobSort, ThriftJobSort.thrift_spec), None, ), # 2
+    (3, TType.I32, 'offset', None, None, ), # 3
+    (4, TType.I32, 'limit', None, None, ), # 4
+    None, # 5
+    None, # 6
+    None, # 7
+    None, # 8
+    None, # 9
+    (10, TType.STRUCT, 'ctx', (hadoop.api.common.ttypes.RequestContext, hadoop.api.common.ttypes.RequestContext.thrift_spec), None, ), # 10
   )
 
-  def __init__(self, ctx=None, jobID=None, types=None, states=None, text=None, count=None, offset=None,):
+  def __init__(self, ctx=None, filter=None, sort=None, offset=None, limit=None,):
     self.ctx = ctx
-    self.jobID = jobID
-    self.types = types
-    self.states = states
-    self.text = text
-    self.count = count
+    self.filter = filter
+    self.sort = sort
     self.offset = offset
+    self.limit = limit
 
   def read(self, iprot):
     if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
@@ -2695,51 +3123,32 @@ class getTaskList_args(object):
       (fname, ftype, fid) = iprot.readFieldBegin()
       if ftype == TType.STOP:
         break
-      if fid == 1:
+      if fid == 10:
         if ftype == TType.STRUCT:
           self.ctx = hadoop.api.common.ttypes.RequestContext()
           self.ctx.read(iprot)
         else:
           iprot.skip(ftype)
-      elif fid == 2:
+      elif fid == 1:
         if ftype == TType.STRUCT:
-          self.jobID = ThriftJobID()
-          self.jobID.read(iprot)
-        else:
-          iprot.skip(ftype)
-      elif fid == 3:
-        if ftype == TType.SET:
-          self.types = set()
-          (_etype107, _size104) = iprot.readSetBegin()
-          for _i108 in xrange(_size104):
-            _elem109 = iprot.readI32();
-            self.types.add(_elem109)
-          iprot.readSetEnd()
+          self.filter = ThriftJobFilter()
+          self.filter.read(iprot)
         else:
           iprot.skip(ftype)
-      elif fid == 4:
-        if ftype == TType.SET:
-          self.states = set()
-          (_etype113, _size110) = iprot.readSetBegin()
-          for _i114 in xrange(_size110):
-            _elem115 = iprot.readI32();
-            self.states.add(_elem115)
-          iprot.readSetEnd()
-        else:
-          iprot.skip(ftype)
-      elif fid == 5:
-        if ftype == TType.STRING:
-          self.text = iprot.readString();
+      elif fid == 2:
+        if ftype == TType.STRUCT:
+          self.sort = ThriftJobSort()
+          self.sort.read(iprot)
         else:
           iprot.skip(ftype)
-      elif fid == 6:
+      elif fid == 3:
         if ftype == TType.I32:
-          self.count = iprot.readI32();
+          self.offset = iprot.readI32();
         else:
           iprot.skip(ftype)
-      elif fid == 7:
+      elif fid == 4:
         if ftype == TType.I32:
-          self.offset = iprot.readI32();
+          self.limit = iprot.readI32();
         else:
           iprot.skip(ftype)
       else:
@@ -2751,41 +3160,27 @@ class getTaskList_args(object):
     if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
       oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
       return
-    oprot.writeStructBegin('getTaskList_args')
-    if self.ctx != None:
-      oprot.writeFieldBegin('ctx', TType.STRUCT, 1)
-      self.ctx.write(oprot)
-      oprot.writeFieldEnd()
-    if self.jobID != None:
-      oprot.writeFieldBegin('jobID', TType.STRUCT, 2)
-      self.jobID.write(oprot)
-      oprot.writeFieldEnd()
-    if self.types != None:
-      oprot.writeFieldBegin('types', TType.SET, 3)
-      oprot.writeSetBegin(TType.I32, len(self.types))
-      for iter116 in self.types:
-        oprot.writeI32(iter116)
-      oprot.writeSetEnd()
-      oprot.writeFieldEnd()
-    if self.states != None:
-      oprot.writeFieldBegin('states', TType.SET, 4)
-      oprot.writeSetBegin(TType.I32, len(self.states))
-      for iter117 in self.states:
-        oprot.writeI32(iter117)
-      oprot.writeSetEnd()
-      oprot.writeFieldEnd()
-    if self.text != None:
-      oprot.writeFieldBegin('text', TType.STRING, 5)
-      oprot.writeString(self.text)
+    oprot.writeStructBegin('getJobSummaries_args')
+    if self.filter != None:
+      oprot.writeFieldBegin('filter', TType.STRUCT, 1)
+      self.filter.write(oprot)
       oprot.writeFieldEnd()
-    if self.count != None:
-      oprot.writeFieldBegin('count', TType.I32, 6)
-      oprot.writeI32(self.count)
+    if self.sort != None:
+      oprot.writeFieldBegin('sort', TType.STRUCT, 2)
+      self.sort.write(oprot)
       oprot.writeFieldEnd()
     if self.offset != None:
-      oprot.writeFieldBegin('offset', TType.I32, 7)
+      oprot.writeFieldBegin('offset', TType.I32, 3)
       oprot.writeI32(self.offset)
       oprot.writeFieldEnd()
+    if self.limit != None:
+      oprot.writeFieldBegin('limit', TType.I32, 4)
+      oprot.writeI32(self.limit)
+      oprot.writeFieldEnd()
+    if self.ctx != None:
+      oprot.writeFieldBegin('ctx', TType.STRUCT, 10)
+      self.ctx.write(oprot)
+      oprot.writeFieldEnd()
     oprot.writeFieldStop()
     oprot.writeStructEnd()
 
@@ -2800,21 +3195,18 @@ class getTaskList_args(object):
   def __ne__(self, other):
     return not (self == other)
 
-class getTaskList_result(object):
+class getJobSummaries_result(object):
   """
   Attributes:
    - success
-   - err
   """
 
   thrift_spec = (
-    (0, TType.STRUCT, 'success', (ThriftTaskInProgressList, ThriftTaskInProgressList.thrift_spec), None, ), # 0
-    (1, TType.STRUCT, 'err', (JobNotFoundException, JobNotFoundException.thrift_spec), None, ), # 1
+    (0, TType.STRUCT, 'success', (ThriftJobSummaryList, ThriftJobSummaryList.thrift_spec), None, ), # 0
   )
 
-  def __init__(self, success=None, err=None,):
+  def __init__(self, success=None,):
     self.success = success
-    self.err = err
 
   def read(self, iprot):
     if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
@@ -2827,16 +3219,10 @@ class getTaskList_result(object):
         break
       if fid == 0:
         if ftype == TType.STRUCT:
-          self.success = ThriftTaskInProgressList()
+          self.success = ThriftJobSummaryList()
           self.success.read(iprot)
         else:
           iprot.skip(ftype)
-      elif fid == 1:
-        if ftype == TType.STRUCT:
-          self.err = JobNotFoundException()
-          self.err.read(iprot)
-        else:
-          iprot.skip(ftype)
       else:
         iprot.skip(ftype)
       iprot.readFieldEnd()
@@ -2846,7 +3232,1029 @@ class getTaskList_result(object):
     if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
       oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
       return
-    oprot.writeStructBegin('getTaskList_result')
+    oprot.writeStructBegin('getJobSummaries_result')
+    if self.success != None:
+      oprot.writeFieldBegin('success', TType.STRUCT, 0)
+      self.success.write(oprot)
+      oprot.writeFieldEnd()
+    oprot.writeFieldStop()
+    oprot.writeStructEnd()
+
+  def __repr__(self):
+    L = ['%s=%r' % (key, value)
+      for key, value in self.__dict__.iteritems()]
+    return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+  def __eq__(self, other):
+    return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+  def __ne__(self, other):
+    return not (self == other)
+
+class getJobsChangedSince_args(object):
+  """
+  Attributes:
+   - ctx
+   - token
+  """
+
+  thrift_spec = (
+    None, # 0
+    (1, TType.I64, 'token', None, None, ), # 1
+    None, # 2
+    None, # 3
+    None, # 4
+    None, # 5
+    None, # 6
+    None, # 7
+    None, # 8
+    None, # 9
+    (10, TType.STRUCT, 'ctx', (hadoop.api.common.ttypes.RequestContext, hadoop.api.common.ttypes.RequestContext.thrift_spec), None, ), # 10
+  )
+
+  def __init__(self, ctx=None, token=None,):
+    self.ctx = ctx
+    self.token = token
+
+  def read(self, iprot):
+    if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
+      fastbinary.decode_binary(self, iprot.trans, (self.__class__, self.thrift_spec))
+      return
+    iprot.readStructBegin()
+    while True:
+      (fname, ftype, fid) = iprot.readFieldBegin()
+      if ftype == TType.STOP:
+        break
+      if fid == 10:
+        if ftype == TType.STRUCT:
+          self.ctx = hadoop.api.common.ttypes.RequestContext()
+          self.ctx.read(iprot)
+        else:
+          iprot.skip(ftype)
+      elif fid == 1:
+        if ftype == TType.I64:
+          self.token = iprot.readI64();
+        else:
+          iprot.skip(ftype)
+      else:
+        iprot.skip(ftype)
+      iprot.readFieldEnd()
+    iprot.readStructEnd()
+
+  def write(self, oprot):
+    if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
+      return
+    oprot.writeStructBegin('getJobsChangedSince_args')
+    if self.token != None:
+      oprot.writeFieldBegin('token', TType.I64, 1)
+      oprot.writeI64(self.token)
+      oprot.writeFieldEnd()
+    if self.ctx != None:
+      oprot.writeFieldBegin('ctx', TType.STRUCT, 10)
+      self.ctx.write(oprot)
+      oprot.writeFieldEnd()
+    oprot.writeFieldStop()
+    oprot.writeStructEnd()
+
+  def __repr__(self):
+    L = ['%s=%r' % (key, value)
+      for key, value in self.__dict__.iteritems()]
+    return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+  def __eq__(self, other):
+    return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+  def __ne__(self, other):
+    return not (self == other)
+
+class getJobsChangedSince_result(object):
+  """
+  Attributes:
+   - success
+  """
+
+  thrift_spec = (
+    (0, TType.STRUCT, 'success', (ThriftJobChanges, ThriftJobChanges.thrift_spec), None, ), # 0
+  )
+
+  def __init__(self, success=None,):
+    self.success = success
+
+  def read(self, iprot):
+    if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
+      fastbinary.decode_binary(self, iprot.trans, (self.__class__, self.thrift_spec))
+      return
+    iprot.readStructBegin()
+    while True:
+      (fname, ftype, fid) = iprot.readFieldBegin()
+      if ftype == TType.STOP:
+        break
+      if fid == 0:
+        if ftype == TType.STRUCT:
+          self.success = ThriftJobChanges()
+          self.success.read(iprot)
+        else:
+          iprot.skip(ftype)
+      else:
+        iprot.skip(ftype)
+      iprot.readFieldEnd()
+    iprot.readStructEnd()
+
+  def write(self, oprot):
+    if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
+      return
+    oprot.writeStructBegin('getJobsChangedSince_result')
+    if self.success != None:
+      oprot.writeFieldBegin('success', TType.STRUCT, 0)
+      self.success.write(oprot)
+      oprot.writeFieldEnd()
+    oprot.writeFieldStop()
+    oprot.writeStructEnd()
+
+  def __repr__(self):
+    L = ['%s=%r' % (key, value)
+      for key, value in self.__dict__.iteritems()]
+    return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+  def __eq__(self, other):
+    return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+  def __ne__(self, other):
+    return not (self == other)
+
+class getUserJobCounts_args(object):
+  """
+  Attributes:
+   - ctx
+   - user
+  """
+
+  thrift_spec = (
+    None, # 0
+    (1, TType.STRUCT, 'ctx', (hadoop.api.common.ttypes.RequestContext, hadoop.api.common.ttypes.RequestContext.thrift_spec), None, ), # 1
+    (2, TType.STRING, 'user', None, None, ), # 2
+  )
+
+  def __init__(self, ctx=None, user=None,):
+    self.ctx = ctx
+    self.user = user
+
+  def read(self, iprot):
+    if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
+      fastbinary.decode_binary(self, iprot.trans, (self.__class__, self.thrift_spec))
+      return
+    iprot.readStructBegin()
+    while True:
+      (fname, ftype, fid) = iprot.readFieldBegin()
+      if ftype == TType.STOP:
+        break
+      if fid == 1:
+        if ftype == TType.STRUCT:
+          self.ctx = hadoop.api.common.ttypes.RequestContext()
+          self.ctx.read(iprot)
+        else:
+          iprot.skip(ftype)
+      elif fid == 2:
+        if ftype == TType.STRING:
+          self.user = iprot.readString();
+        else:
+          iprot.skip(ftype)
+      else:
+        iprot.skip(ftype)
+      iprot.readFieldEnd()
+    iprot.readStructEnd()
+
+  def write(self, oprot):
+    if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
+      return
+    oprot.writeStructBegin('getUserJobCounts_args')
+    if self.ctx != None:
+      oprot.writeFieldBegin('ctx', TType.STRUCT, 1)
+      self.ctx.write(oprot)
+      oprot.writeFieldEnd()
+    if self.user != None:
+      oprot.writeFieldBegin('user', TType.STRING, 2)
+      oprot.writeString(self.user)
+      oprot.writeFieldEnd()
+    oprot.writeFieldStop()
+    oprot.writeStructEnd()
+
+  def __repr__(self):
+    L = ['%s=%r' % (key, value)
+      for key, value in self.__dict__.iteritems()]
+    return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+  def __eq__(self, other):
+    return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+  def __ne__(self, other):
+    return not (self == other)
+
+class getUserJobCounts_result(object):
+  """
+  Attributes:
+   - success
+  """
+
+  thrift_spec = (
+    (0, TType.STRUCT, 'success', (ThriftUserJobCounts, ThriftUserJobCounts.thrift_spec), None, ), # 0
+  )
+
+  def __init__(self, success=None,):
+    self.success = success
+
+  def read(self, iprot):
+    if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
+      fastbinary.decode_binary(self, iprot.trans, (self.__class__, self.thrift_spec))
+      return
+    iprot.readStructBegin()
+    while True:
+      (fname, ftype, fid) = iprot.readFieldBegin()
+      if ftype == TType.STOP:
+        break
+      if fid == 0:
+        if ftype == TType.STRUCT:
+          self.success = ThriftUserJobCounts()
+          self.success.read(iprot)
+        else:
+          iprot.skip(ftype)
+      else:
+        iprot.skip(ftype)
+      iprot.readFieldEnd()
+    iprot.readStructEnd()
+
+  def write(self, oprot):
+    if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
+      return
+    oprot.writeStructBegin('getUserJobCounts_result')
+    if self.success != None:
+      oprot.writeFieldBegin('success', TType.STRUCT, 0)
+      self.success.write(oprot)
+      oprot.writeFieldEnd()
+    oprot.writeFieldStop()
+    oprot.writeStructEnd()
+
+  def __repr__(self):
+    L = ['%s=%r' % (key, value)
+      for key, value in self.__dict__.iteritems()]
+    return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+  def __eq__(self, other):
+    return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+  def __ne__(self, other):
+    return not (self == other)
+
+class getTaskList_args(object):
+  """
+  Attributes:
+   - ctx
+   - jobID
+   - types
+   - states
+   - text
+   - count
+   - offset
+  """
+
+  thrift_spec = (
+    None, # 0
+    (1, TType.STRUCT, 'ctx', (hadoop.api.common.ttypes.RequestContext, hadoop.api.common.ttypes.RequestContext.thrift_spec), None, ), # 1
+    (2, TType.STRUCT, 'jobID', (ThriftJobID, ThriftJobID.thrift_spec), None, ), # 2
+    (3, TType.SET, 'types', (TType.I32,None), None, ), # 3
+    (4, TType.SET, 'states', (TType.I32,None), None, ), # 4
+    (5, TType.STRING, 'text', None, None, ), # 5
+    (6, TType.I32, 'count', None, None, ), # 6
+    (7, TType.I32, 'offset', None, None, ), # 7
+  )
+
+  def __init__(self, ctx=None, jobID=None, types=None, states=None, text=None, count=None, offset=None,):
+    self.ctx = ctx
+    self.jobID = jobID
+    self.types = types
+    self.states = states
+    self.text = text
+    self.count = count
+    self.offset = offset
+
+  def read(self, iprot):
+    if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
+      fastbinary.decode_binary(self, iprot.trans, (self.__class__, self.thrift_spec))
+      return
+    iprot.readStructBegin()
+    while True:
+      (fname, ftype, fid) = iprot.readFieldBegin()
+      if ftype == TType.STOP:
+        break
+      if fid == 1:
+        if ftype == TType.STRUCT:
+          self.ctx = hadoop.api.common.ttypes.RequestContext()
+          self.ctx.read(iprot)
+        else:
+          iprot.skip(ftype)
+      elif fid == 2:
+        if ftype == TType.STRUCT:
+          self.jobID = ThriftJobID()
+          self.jobID.read(iprot)
+        else:
+          iprot.skip(ftype)
+      elif fid == 3:
+        if ftype == TType.SET:
+          self.types = set()
+          (_etype177, _size174) = iprot.readSetBegin()
+          for _i178 in xrange(_size174):
+            _elem179 = iprot.readI32();
+            self.types.add(_elem179)
+          iprot.readSetEnd()
+        else:
+          iprot.skip(ftype)
+      elif fid == 4:
+        if ftype == TType.SET:
+          self.states = set()
+          (_etype183, _size180) = iprot.readSetBegin()
+          for _i184 in xrange(_size180):
+            _elem185 = iprot.readI32();
+            self.states.add(_elem185)
+          iprot.readSetEnd()
+        else:
+          iprot.skip(ftype)
+      elif fid == 5:
+        if ftype == TType.STRING:
+          self.text = iprot.readString();
+        else:
+          iprot.skip(ftype)
+      elif fid == 6:
+        if ftype == TType.I32:
+          self.count = iprot.readI32();
+        else:
+          iprot.skip(ftype)
+      elif fid == 7:
+        if ftype == TType.I32:
+          self.offset = iprot.readI32();
+        else:
+          iprot.skip(ftype)
+      else:
+        iprot.skip(ftype)
+      iprot.readFieldEnd()
+    iprot.readStructEnd()
+
+  def write(self, oprot):
+    if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
+      return
+    oprot.writeStructBegin('getTaskList_args')
+    if self.ctx != None:
+      oprot.writeFieldBegin('ctx', TType.STRUCT, 1)
+      self.ctx.write(oprot)
+      oprot.writeFieldEnd()
+    if self.jobID != None:
+      oprot.writeFieldBegin('jobID', TType.STRUCT, 2)
+      self.jobID.write(oprot)
+      oprot.writeFieldEnd()
+    if self.types != None:
+      oprot.writeFieldBegin('types', TType.SET, 3)
+      oprot.writeSetBegin(TType.I32, len(self.types))
+      for iter186 in self.types:
+        oprot.writeI32(iter186)
+      oprot.writeSetEnd()
+      oprot.writeFieldEnd()
+    if self.states != None:
+      oprot.writeFieldBegin('states', TType.SET, 4)
+      oprot.writeSetBegin(TType.I32, len(self.states))
+      for iter187 in self.states:
+        oprot.writeI32(iter187)
+      oprot.writeSetEnd()
+      oprot.writeFieldEnd()
+    if self.text != None:
+      oprot.writeFieldBegin('text', TType.STRING, 5)
+      oprot.writeString(self.text)
+      oprot.writeFieldEnd()
+    if self.count != None:
+      oprot.writeFieldBegin('count', TType.I32, 6)
+      oprot.writeI32(self.count)
+      oprot.writeFieldEnd()
+    if self.offset != None:
+      oprot.writeFieldBegin('offset', TType.I32, 7)
+      oprot.writeI32(self.offset)
+      oprot.writeFieldEnd()
+    oprot.writeFieldStop()
+    oprot.writeStructEnd()
+
+  def __repr__(self):
+    L = ['%s=%r' % (key, value)
+      for key, value in self.__dict__.iteritems()]
+    return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+  def __eq__(self, other):
+    return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+  def __ne__(self, other):
+    return not (self == other)
+
+class getTaskList_result(object):
+  """
+  Attributes:
+   - success
+   - err
+  """
+
+  thrift_spec = (
+    (0, TType.STRUCT, 'success', (ThriftTaskInProgressList, ThriftTaskInProgressList.thrift_spec), None, ), # 0
+    (1, TType.STRUCT, 'err', (JobNotFoundException, JobNotFoundException.thrift_spec), None, ), # 1
+  )
+
+  def __init__(self, success=None, err=None,):
+    self.success = success
+    self.err = err
+
+  def read(self, iprot):
+    if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
+      fastbinary.decode_binary(self, iprot.trans, (self.__class__, self.thrift_spec))
+      return
+    iprot.readStructBegin()
+    while True:
+      (fname, ftype, fid) = iprot.readFieldBegin()
+      if ftype == TType.STOP:
+        break
+      if fid == 0:
+        if ftype == TType.STRUCT:
+          self.success = ThriftTaskInProgressList()
+          self.success.read(iprot)
+        else:
+          iprot.skip(ftype)
+      elif fid == 1:
+        if ftype == TType.STRUCT:
+          self.err = JobNotFoundException()
+          self.err.read(iprot)
+        else:
+          iprot.skip(ftype)
+      else:
+        iprot.skip(ftype)
+      iprot.readFieldEnd()
+    iprot.readStructEnd()
+
+  def write(self, oprot):
+    if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
+      return
+    oprot.writeStructBegin('getTaskList_result')
+    if self.success != None:
+      oprot.writeFieldBegin('success', TType.STRUCT, 0)
+      self.success.write(oprot)
+      oprot.writeFieldEnd()
+    if self.err != None:
+      oprot.writeFieldBegin('err', TType.STRUCT, 1)
+      self.err.write(oprot)
+      oprot.writeFieldEnd()
+    oprot.writeFieldStop()
+    oprot.writeStructEnd()
+
+  def __repr__(self):
+    L = ['%s=%r' % (key, value)
+      for key, value in self.__dict__.iteritems()]
+    return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+  def __eq__(self, other):
+    return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+  def __ne__(self, other):
+    return not (self == other)
+
+class getTopTasks_args(object):
+  """
+  Attributes:
+   - ctx
+   - jobID
+   - states
+   - count
+   - newestFirst
+  """
+
+  thrift_spec = (
+    None, # 0
+    (1, TType.STRUCT, 'jobID', (ThriftJobID, ThriftJobID.thrift_spec), None, ), # 1
+    (2, TType.SET, 'states', (TType.I32,None), None, ), # 2
+    (3, TType.I32, 'count', None, None, ), # 3
+    (4, TType.BOOL, 'newestFirst', None, None, ), # 4
+    None, # 5
+    None, # 6
+    None, # 7
+    None, # 8
+    None, # 9
+    (10, TType.STRUCT, 'ctx', (hadoop.api.common.ttypes.RequestContext, hadoop.api.common.ttypes.RequestContext.thrift_spec), None, ), # 10
+  )
+
+  def __init__(self, ctx=None, jobID=None, states=None, count=None, newestFirst=None,):
+    self.ctx = ctx
+    self.jobID = jobID
+    self.states = states
+    self.count = count
+    self.newestFirst = newestFirst
+
+  def read(self, iprot):
+    if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
+      fastbinary.decode_binary(self, iprot.trans, (self.__class__, self.thrift_spec))
+      return
+    iprot.readStructBegin()
+    while True:
+      (fname, ftype, fid) = iprot.readFieldBegin()
+      if ftype == TType.STOP:
+        break
+      if fid == 10:
+        if ftype == TType.STRUCT:
+          self.ctx = hadoop.api.common.ttypes.RequestContext()
+          self.ctx.read(iprot)
+        else:
+          iprot.skip(ftype)
+      elif fid == 1:
+        if ftype == TType.STRUCT:
+          self.jobID = ThriftJobID()
+          self.jobID.read(iprot)
+        else:
+          iprot.skip(ftype)
+      elif fid == 2:
+        if ftype == TType.SET:
+          self.states = set()
+          (_etype191, _size188) = iprot.readSetBegin()
+          for _i192 in xrange(_size188):
+            _elem193 = iprot.readI32();
+            self.states.add(_elem193)
+          iprot.readSetEnd()
+        else:
+          iprot.skip(ftype)
+      elif fid == 3:
+        if ftype == TType.I32:
+          self.count = iprot.readI32();
+        else:
+          iprot.skip(ftype)
+      elif fid == 4:
+        if ftype == TType.BOOL:
+          self.newestFirst = iprot.readBool();
+        else:
+          iprot.skip(ftype)
+      else:
+        iprot.skip(ftype)
+      iprot.readFieldEnd()
+    iprot.readStructEnd()
+
+  def write(self, oprot):
+    if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
+      return
+    oprot.writeStructBegin('getTopTasks_args')
+    if self.jobID != None:
+      oprot.writeFieldBegin('jobID', TType.STRUCT, 1)
+      self.jobID.write(oprot)
+      oprot.writeFieldEnd()
+    if self.states != None:
+      oprot.writeFieldBegin('states', TType.SET, 2)
+      oprot.writeSetBegin(TType.I32, len(self.states))
+      for iter194 in self.states:
+        oprot.writeI32(iter194)
+      oprot.writeSetEnd()
+      oprot.writeFieldEnd()
+    if self.count != None:
+      oprot.writeFieldBegin('count', TType.I32, 3)
+      oprot.writeI32(self.count)
+      oprot.writeFieldEnd()
+    if self.newestFirst != None:
+      oprot.writeFieldBegin('newestFirst', TType.BOOL, 4)
+      oprot.writeBool(self.newestFirst)
+      oprot.writeFieldEnd()
+    if self.ctx != None:
+      oprot.writeFieldBegin('ctx', TType.STRUCT, 10)
+      self.ctx.write(oprot)
+      oprot.writeFieldEnd()
+    oprot.writeFieldStop()
+    oprot.writeStructEnd()
+
+  def __repr__(self):
+    L = ['%s=%r' % (key, value)
+      for key, value in self.__dict__.iteritems()]
+    return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+  def __eq__(self, other):
+    return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+  def __ne__(self, other):
+    return not (self == other)
+
+class getTopTasks_result(object):
+  """
+  Attributes:
+   - success
+   - err
+  """
+
+  thrift_spec = (
+    (0, TType.STRUCT, 'success', (ThriftTaskInProgressList, ThriftTaskInProgressList.thrift_spec), None, ), # 0
+    (1, TType.STRUCT, 'err', (JobNotFoundException, JobNotFoundException.thrift_spec), None, ), # 1
+  )
+
+  def __init__(self, success=None, err=None,):
+    self.success = success
+    self.err = err
+
+  def read(self, iprot):
+    if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
+      fastbinary.decode_binary(self, iprot.trans, (self.__class__, self.thrift_spec))
+      return
+    iprot.readStructBegin()
+    while True:
+      (fname, ftype, fid) = iprot.readFieldBegin()
+      if ftype == TType.STOP:
+        break
+      if fid == 0:
+        if ftype == TType.STRUCT:
+          self.success = ThriftTaskInProgressList()
+          self.success.read(iprot)
+        else:
+          iprot.skip(ftype)
+      elif fid == 1:
+        if ftype == TType.STRUCT:
+          self.err = JobNotFoundException()
+          self.err.read(iprot)
+        else:
+          iprot.skip(ftype)
+      else:
+        iprot.skip(ftype)
+      iprot.readFieldEnd()
+    iprot.readStructEnd()
+
+  def write(self, oprot):
+    if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
+      return
+    oprot.writeStructBegin('getTopTasks_result')
+    if self.success != None:
+      oprot.writeFieldBegin('success', TType.STRUCT, 0)
+      self.success.write(oprot)
+      oprot.writeFieldEnd()
+    if self.err != None:
+      oprot.writeFieldBegin('err', TType.STRUCT, 1)
+      self.err.write(oprot)
+      oprot.writeFieldEnd()
+    oprot.writeFieldStop()
+    oprot.writeStructEnd()
+
+  def __repr__(self):
+    L = ['%s=%r' % (key, value)
+      for key, value in self.__dict__.iteritems()]
+    return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+  def __eq__(self, other):
+    return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+  def __ne__(self, other):
+    return not (self == other)
+
+class getTaskPage_args(object):
+  """
+  Attributes:
+   - ctx
+   - jobID
+   - types
+   - states
+   - text
+   - cursor
+   - count
+  """
+
+  thrift_spec = (
+    None, # 0
+    (1, TType.STRUCT, 'jobID', (ThriftJobID, ThriftJobID.thrift_spec), None, ), # 1
+    (2, TType.SET, 'types', (TType.I32,None), None, ), # 2
+    (3, TType.SET, 'states', (TType.I32,None), None, ), # 3
+    (4, TType.STRING, 'text', None, None, ), # 4
+    (5, TType.STRING, 'cursor', None, None, ), # 5
+    (6, TType.I32, 'count', None, None, ), # 6
+    None, # 7
+    None, # 8
+    None, # 9
+    (10, TType.STRUCT, 'ctx', (hadoop.api.common.ttypes.RequestContext, hadoop.api.common.ttypes.RequestContext.thrift_spec), None, ), # 10
+  )
+
+  def __init__(self, ctx=None, jobID=None, types=None, states=None, text=None, cursor=None, count=None,):
+    self.ctx = ctx
+    self.jobID = jobID
+    self.types = types
+    self.states = states
+    self.text = text
+    self.cursor = cursor
+    self.count = count
+
+  def read(self, iprot):
+    if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
+      fastbinary.decode_binary(self, iprot.trans, (self.__class__, self.thrift_spec))
+      return
+    iprot.readStructBegin()
+    while True:
+      (fname, ftype, fid) = iprot.readFieldBegin()
+      if ftype == TType.STOP:
+        break
+      if fid == 10:
+        if ftype == TType.STRUCT:
+          self.ctx = hadoop.api.common.ttypes.RequestContext()
+          self.ctx.read(iprot)
+        else:
+          iprot.skip(ftype)
+      elif fid == 1:
+        if ftype == TType.STRUCT:
+          self.jobID = ThriftJobID()
+          self.jobID.read(iprot)
+        else:
+          iprot.skip(ftype)
+      elif fid == 2:
+        if ftype == TType.SET:
+          self.types = set()
+          (_etype198, _size195) = iprot.readSetBegin()
+          for _i199 in xrange(_size195):
+            _elem200 = iprot.readI32();
+            self.types.add(_elem200)
+          iprot.readSetEnd()
+        else:
+          iprot.skip(ftype)
+      elif fid == 3:
+        if ftype == TType.SET:
+          self.states = set()
+          (_etype204, _size201) = iprot.readSetBegin()
+          for _i205 in xrange(_size201):
+            _elem206 = iprot.readI32();
+            self.states.add(_elem206)
+          iprot.readSetEnd()
+        else:
+          iprot.skip(ftype)
+      elif fid == 4:
+        if ftype == TType.STRING:
+          self.text = iprot.readString();
+        else:
+          iprot.skip(ftype)
+      elif fid == 5:
+        if ftype == TType.STRING:
+          self.cursor = iprot.readString();
+        else:
+          iprot.skip(ftype)
+      elif fid == 6:
+        if ftype == TType.I32:
+          self.count = iprot.readI32();
+        else:
+          iprot.skip(ftype)
+      else:
+        iprot.skip(ftype)
+      iprot.readFieldEnd()
+    iprot.readStructEnd()
+
+  def write(self, oprot):
+    if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
+      return
+    oprot.writeStructBegin('getTaskPage_args')
+    if self.jobID != None:
+      oprot.writeFieldBegin('jobID', TType.STRUCT, 1)
+      self.jobID.write(oprot)
+      oprot.writeFieldEnd()
+    if self.types != None:
+      oprot.writeFieldBegin('types', TType.SET, 2)
+      oprot.writeSetBegin(TType.I32, len(self.types))
+      for iter207 in self.types:
+        oprot.writeI32(iter207)
+      oprot.writeSetEnd()
+      oprot.writeFieldEnd()
+    if self.states != None:
+      oprot.writeFieldBegin('states', TType.SET, 3)
+      oprot.writeSetBegin(TType.I32, len(self.states))
+      for iter208 in self.states:
+        oprot.writeI32(iter208)
+      oprot.writeSetEnd()
+      oprot.writeFieldEnd()
+    if self.text != None:
+      oprot.writeFieldBegin('text', TType.STRING, 4)
+      oprot.writeString(self.text)
+      oprot.writeFieldEnd()
+    if self.cursor != None:
+      oprot.writeFieldBegin('cursor', TType.STRING, 5)
+      oprot.writeString(self.cursor)
+      oprot.writeFieldEnd()
+    if self.count != None:
+      oprot.writeFieldBegin('count', TType.I32, 6)
+      oprot.writeI32(self.count)
+      oprot.writeFieldEnd()
+    if self.ctx != None:
+      oprot.writeFieldBegin('ctx', TType.STRUCT, 10)
+      self.ctx.write(oprot)
+      oprot.writeFieldEnd()
+    oprot.writeFieldStop()
+    oprot.writeStructEnd()
+
+  def __repr__(self):
+    L = ['%s=%r' % (key, value)
+      for key, value in self.__dict__.iteritems()]
+    return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+  def __eq__(self, other):
+    return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+  def __ne__(self, other):
+    return not (self == other)
+
+class getTaskPage_result(object):
+  """
+  Attributes:
+   - success
+   - err
+  """
+
+  thrift_spec = (
+    (0, TType.STRUCT, 'success', (ThriftTaskPage, ThriftTaskPage.thrift_spec), None, ), # 0
+    (1, TType.STRUCT, 'err', (JobNotFoundException, JobNotFoundException.thrift_spec), None, ), # 1
+  )
+
+  def __init__(self, success=None, err=None,):
+    self.success = success
+    self.err = err
+
+  def read(self, iprot):
+    if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
+      fastbinary.decode_binary(self, iprot.trans, (self.__class__, self.thrift_spec))
+      return
+    iprot.readStructBegin()
+    while True:
+      (fname, ftype, fid) = iprot.readFieldBegin()
+      if ftype == TType.STOP:
+        break
+      if fid == 0:
+        if ftype == TType.STRUCT:
+          self.success = ThriftTaskPage()
+          self.success.read(iprot)
+        else:
+          iprot.skip(ftype)
+      elif fid == 1:
+        if ftype == TType.STRUCT:
+          self.err = JobNotFoundException()
+          self.err.read(iprot)
+        else:
+          iprot.skip(ftype)
+      else:
+        iprot.skip(ftype)
+      iprot.readFieldEnd()
+    iprot.readStructEnd()
+
+  def write(self, oprot):
+    if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
+      return
+    oprot.writeStructBegin('getTaskPage_result')
+    if self.success != None:
+      oprot.writeFieldBegin('success', TType.STRUCT, 0)
+      self.success.write(oprot)
+      oprot.writeFieldEnd()
+    if self.err != None:
+      oprot.writeFieldBegin('err', TType.STRUCT, 1)
+      self.err.write(oprot)
+      oprot.writeFieldEnd()
+    oprot.writeFieldStop()
+    oprot.writeStructEnd()
+
+  def __repr__(self):
+    L = ['%s=%r' % (key, value)
+      for key, value in self.__dict__.iteritems()]
+    return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+  def __eq__(self, other):
+    return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+  def __ne__(self, other):
+    return not (self == other)
+
+class getTaskTimeline_args(object):
+  """
+  Attributes:
+   - ctx
+   - jobID
+  """
+
+  thrift_spec = (
+    None, # 0
+    (1, TType.STRUCT, 'jobID', (ThriftJobID, ThriftJobID.thrift_spec), None, ), # 1
+    None, # 2
+    None, # 3
+    None, # 4
+    None, # 5
+    None, # 6
+    None, # 7
+    None, # 8
+    None, # 9
+    (10, TType.STRUCT, 'ctx', (hadoop.api.common.ttypes.RequestContext, hadoop.api.common.ttypes.RequestContext.thrift_spec), None, ), # 10
+  )
+
+  def __init__(self, ctx=None, jobID=None,):
+    self.ctx = ctx
+    self.jobID = jobID
+
+  def read(self, iprot):
+    if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
+      fastbinary.decode_binary(self, iprot.trans, (self.__class__, self.thrift_spec))
+      return
+    iprot.readStructBegin()
+    while True:
+      (fname, ftype, fid) = iprot.readFieldBegin()
+      if ftype == TType.STOP:
+        break
+      if fid == 10:
+        if ftype == TType.STRUCT:
+          self.ctx = hadoop.api.common.ttypes.RequestContext()
+          self.ctx.read(iprot)
+        else:
+          iprot.skip(ftype)
+      elif fid == 1:
+        if ftype == TType.STRUCT:
+          self.jobID = ThriftJobID()
+          self.jobID.read(iprot)
+        else:
+          iprot.skip(ftype)
+      else:
+        iprot.skip(ftype)
+      iprot.readFieldEnd()
+    iprot.readStructEnd()
+
+  def write(self, oprot):
+    if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
+      return
+    oprot.writeStructBegin('getTaskTimeline_args')
+    if self.jobID != None:
+      oprot.writeFieldBegin('jobID', TType.STRUCT, 1)
+      self.jobID.write(oprot)
+      oprot.writeFieldEnd()
+    if self.ctx != None:
+      oprot.writeFieldBegin('ctx', TType.STRUCT, 10)
+      self.ctx.write(oprot)
+      oprot.writeFieldEnd()
+    oprot.writeFieldStop()
+    oprot.writeStructEnd()
+
+  def __repr__(self):
+    L = ['%s=%r' % (key, value)
+      for key, value in self.__dict__.iteritems()]
+    return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+  def __eq__(self, other):
+    return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+  def __ne__(self, other):
+    return not (self == other)
+
+class getTaskTimeline_result(object):
+  """
+  Attributes:
+   - success
+   - err
+  """
+
+  thrift_spec = (
+    (0, TType.STRUCT, 'success', (ThriftTaskTimeline, ThriftTaskTimeline.thrift_spec), None, ), # 0
+    (1, TType.STRUCT, 'err', (JobNotFoundException, JobNotFoundException.thrift_spec), None, ), # 1
+  )
+
+  def __init__(self, success=None, err=None,):
+    self.success = success
+    self.err = err
+
+  def read(self, iprot):
+    if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
+      fastbinary.decode_binary(self, iprot.trans, (self.__class__, self.thrift_spec))
+      return
+    iprot.readStructBegin()
+    while True:
+      (fname, ftype, fid) = iprot.readFieldBegin()
+      if ftype == TType.STOP:
+        break
+      if fid == 0:
+        if ftype == TType.STRUCT:
+          self.success = ThriftTaskTimeline()
+          self.success.read(iprot)
+        else:
+          iprot.skip(ftype)
+      elif fid == 1:
+        if ftype == TType.STRUCT:
+          self.err = JobNotFoundException()
+          self.err.read(iprot)
+        else:
+          iprot.skip(ftype)
+      else:
+        iprot.skip(ftype)
+      iprot.readFieldEnd()
+    iprot.readStructEnd()
+
+  def write(self, oprot):
+    if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
+      return
+    oprot.writeStructBegin('getTaskTimeline_result')
     if self.success != None:
       oprot.writeFieldBegin('success', TType.STRUCT, 0)
       self.success.write(oprot)
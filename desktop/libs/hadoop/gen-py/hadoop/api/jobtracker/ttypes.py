@@ -193,6 +193,41 @@ class ThriftJobState(object):
     "KILLED": 5,
   }
 
+class ThriftJobSortKey(object):
+  """
+  Job fields that getJobSummaries() can order by
+  """
+  JOB_ID = 0
+  NAME = 1
+  USER = 2
+  QUEUE = 3
+  STATE = 4
+  PRIORITY = 5
+  START_TIME = 6
+  FINISH_TIME = 7
+
+  _VALUES_TO_NAMES = {
+    0: "JOB_ID",
+    1: "NAME",
+    2: "USER",
+    3: "QUEUE",
+    4: "STATE",
+    5: "PRIORITY",
+    6: "START_TIME",
+    7: "FINISH_TIME",
+  }
+
+  _NAMES_TO_VALUES = {
+    "JOB_ID": 0,
+    "NAME": 1,
+    "USER": 2,
+    "QUEUE": 3,
+    "STATE": 4,
+    "PRIORITY": 5,
+    "START_TIME": 6,
+    "FINISH_TIME": 7,
+  }
+
 class ThriftJobID(object):
   """
   Unique identifier for each job
@@ -2036,6 +2071,258 @@ class ThriftTaskInProgressList(object):
   def __ne__(self, other):
     return not (self == other)
 
+class ThriftTaskPage(object):
+  """
+  A page of the tasks of a job that match a filter (see getTaskPage). The
+  tasks are listed in the same order as by getTaskList.
+  
+  Attributes:
+   - tasks
+   - numTotalTasks: The number of tasks that matched the filter when the listing started
+   - nextCursor: The cursor of the next page, or empty after the last page
+  """
+
+  thrift_spec = (
+    None, # 0
+    (1, TType.LIST, 'tasks', (TType.STRUCT,(ThriftTaskInProgress, ThriftTaskInProgress.thrift_spec)), None, ), # 1
+    (2, TType.I32, 'numTotalTasks', None, None, ), # 2
+    (3, TType.STRING, 'nextCursor', None, None, ), # 3
+  )
+
+  def __init__(self, tasks=None, numTotalTasks=None, nextCursor=None,):
+    self.tasks = tasks
+    self.numTotalTasks = numTotalTasks
+    self.nextCursor = nextCursor
+
+  def read(self, iprot):
+    if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
+      fastbinary.decode_binary(self, iprot.trans, (self.__class__, self.thrift_spec))
+      return
+    iprot.readStructBegin()
+    while True:
+      (fname, ftype, fid) = iprot.readFieldBegin()
+      if ftype == TType.STOP:
+        break
+      if fid == 1:
+        if ftype == TType.LIST:
+          self.tasks = []
+          (_etype86, _size83) = iprot.readListBegin()
+          for _i87 in xrange(_size83):
+            _elem88 = ThriftTaskInProgress()
+            _elem88.read(iprot)
+            self.tasks.append(_elem88)
+          iprot.readListEnd()
+        else:
+          iprot.skip(ftype)
+      elif fid == 2:
+        if ftype == TType.I32:
+          self.numTotalTasks = iprot.readI32();
+        else:
+          iprot.skip(ftype)
+      elif fid == 3:
+        if ftype == TType.STRING:
+          self.nextCursor = iprot.readString();
+        else:
+          iprot.skip(ftype)
+      else:
+        iprot.skip(ftype)
+      iprot.readFieldEnd()
+    iprot.readStructEnd()
+
+  def write(self, oprot):
+    if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
+      return
+    oprot.writeStructBegin('ThriftTaskPage')
+    if self.tasks != None:
+      oprot.writeFieldBegin('tasks', TType.LIST, 1)
+      oprot.writeListBegin(TType.STRUCT, len(self.tasks))
+      for iter89 in self.tasks:
+        iter89.write(oprot)
+      oprot.writeListEnd()
+      oprot.writeFieldEnd()
+    if self.numTotalTasks != None:
+      oprot.writeFieldBegin('numTotalTasks', TType.I32, 2)
+      oprot.writeI32(self.numTotalTasks)
+      oprot.writeFieldEnd()
+    if self.nextCursor != None:
+      oprot.writeFieldBegin('nextCursor', TType.STRING, 3)
+      oprot.writeString(self.nextCursor)
+      oprot.writeFieldEnd()
+    oprot.writeFieldStop()
+    oprot.writeStructEnd()
+
+  def __repr__(self):
+    L = ['%s=%r' % (key, value)
+      for key, value in self.__dict__.iteritems()]
+    return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+  def __eq__(self, other):
+    return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+  def __ne__(self, other):
+    return not (self == other)
+
+class ThriftTaskTimeline(object):
+  """
+  The start and finish times of every task of a job, as parallel lists
+  (one element per task) rather than as ThriftTaskInProgress, so that jobs
+  with many tasks stay cheap to send (see getTaskTimeline).
+  
+  Attributes:
+   - taskNumbers: The number of each task within its type, as in its ThriftTaskID
+   - taskTypes
+   - states
+   - startTimes: When each task started running, or 0
+   - finishTimes: When each task finished, or 0
+   - currentTime: The time on the JobTracker, for the tasks that are still running
+  """
+
+  thrift_spec = (
+    None, # 0
+    (1, TType.LIST, 'taskNumbers', (TType.I32,None), None, ), # 1
+    (2, TType.LIST, 'taskTypes', (TType.I32,None), None, ), # 2
+    (3, TType.LIST, 'states', (TType.I32,None), None, ), # 3
+    (4, TType.LIST, 'startTimes', (TType.I64,None), None, ), # 4
+    (5, TType.LIST, 'finishTimes', (TType.I64,None), None, ), # 5
+    (6, TType.I64, 'currentTime', None, None, ), # 6
+  )
+
+  def __init__(self, taskNumbers=None, taskTypes=None, states=None, startTimes=None, finishTimes=None, currentTime=None,):
+    self.taskNumbers = taskNumbers
+    self.taskTypes = taskTypes
+    self.states = states
+    self.startTimes = startTimes
+    self.finishTimes = finishTimes
+    self.currentTime = currentTime
+
+  def read(self, iprot):
+    if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
+      fastbinary.decode_binary(self, iprot.trans, (self.__class__, self.thrift_spec))
+      return
+    iprot.readStructBegin()
+    while True:
+      (fname, ftype, fid) = iprot.readFieldBegin()
+      if ftype == TType.STOP:
+        break
+      if fid == 1:
+        if ftype == TType.LIST:
+          self.taskNumbers = []
+          (_etype93, _size90) = iprot.readListBegin()
+          for _i94 in xrange(_size90):
+            _elem95 = iprot.readI32();
+            self.taskNumbers.append(_elem95)
+          iprot.readListEnd()
+        else:
+          iprot.skip(ftype)
+      elif fid == 2:
+        if ftype == TType.LIST:
+          self.taskTypes = []
+          (_etype99, _size96) = iprot.readListBegin()
+          for _i100 in xrange(_size96):
+            _elem101 = iprot.readI32();
+            self.taskTypes.append(_elem101)
+          iprot.readListEnd()
+        else:
+          iprot.skip(ftype)
+      elif fid == 3:
+        if ftype == TType.LIST:
+          self.states = []
+          (_etype105, _size102) = iprot.readListBegin()
+          for _i106 in xrange(_size102):
+            _elem107 = iprot.readI32();
+            self.states.append(_elem107)
+          iprot.readListEnd()
+        else:
+          iprot.skip(ftype)
+      elif fid == 4:
+        if ftype == TType.LIST:
+          self.startTimes = []
+          (_etype111, _size108) = iprot.readListBegin()
+          for _i112 in xrange(_size108):
+            _elem113 = iprot.readI64();
+            self.startTimes.append(_elem113)
+          iprot.readListEnd()
+        else:
+          iprot.skip(ftype)
+      elif fid == 5:
+        if ftype == TType.LIST:
+          self.finishTimes = []
+          (_etype117, _size114) = iprot.readListBegin()
+          for _i118 in xrange(_size114):
+            _elem119 = iprot.readI64();
+            self.finishTimes.append(_elem119)
+          iprot.readListEnd()
+        else:
+          iprot.skip(ftype)
+      elif fid == 6:
+        if ftype == TType.I64:
+          self.currentTime = iprot.readI64();
+        else:
+          iprot.skip(ftype)
+      else:
+        iprot.skip(ftype)
+      iprot.readFieldEnd()
+    iprot.readStructEnd()
+
+  def write(self, oprot):
+    if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
+      return
+    oprot.writeStructBegin('ThriftTaskTimeline')
+    if self.taskNumbers != None:
+      oprot.writeFieldBegin('taskNumbers', TType.LIST, 1)
+      oprot.writeListBegin(TType.I32, len(self.taskNumbers))
+      for iter120 in self.taskNumbers:
+        oprot.writeI32(iter120)
+      oprot.writeListEnd()
+      oprot.writeFieldEnd()
+    if self.taskTypes != None:
+      oprot.writeFieldBegin('taskTypes', TType.LIST, 2)
+      oprot.writeListBegin(TType.I32, len(self.taskTypes))
+      for iter121 in self.taskTypes:
+        oprot.writeI32(iter121)
+      oprot.writeListEnd()
+      oprot.writeFieldEnd()
+    if self.states != None:
+      oprot.writeFieldBegin('states', TType.LIST, 3)
+      oprot.writeListBegin(TType.I32, len(self.states))
+      for iter122 in self.states:
+        oprot.writeI32(iter122)
+      oprot.writeListEnd()
+      oprot.writeFieldEnd()
+    if self.startTimes != None:
+      oprot.writeFieldBegin('startTimes', TType.LIST, 4)
+      oprot.writeListBegin(TType.I64, len(self.startTimes))
+      for iter123 in self.startTimes:
+        oprot.writeI64(iter123)
+      oprot.writeListEnd()
+      oprot.writeFieldEnd()
+    if self.finishTimes != None:
+      oprot.writeFieldBegin('finishTimes', TType.LIST, 5)
+      oprot.writeListBegin(TType.I64, len(self.finishTimes))
+      for iter124 in self.finishTimes:
+        oprot.writeI64(iter124)
+      oprot.writeListEnd()
+      oprot.writeFieldEnd()
+    if self.currentTime != None:
+      oprot.writeFieldBegin('currentTime', TType.I64, 6)
+      oprot.writeI64(self.currentTime)
+      oprot.writeFieldEnd()
+    oprot.writeFieldStop()
+    oprot.writeStructEnd()
+
+  def __repr__(self):
+    L = ['%s=%r' % (key, value)
+      for key, value in self.__dict__.iteritems()]
+    return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+  def __eq__(self, other):
+    return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+  def __ne__(self, other):
+    return not (self == other)
+
 class ThriftJobInProgress(object):
   """
   Status of *all* jobs, not just currently running ones
@@ -2269,11 +2556,11 @@ class ThriftJobList(object):
       if fid == 1:
         if ftype == TType.LIST:
           self.jobs = []
-          (_etype86, _size83) = iprot.readListBegin()
-          for _i87 in xrange(_size83):
-            _elem88 = ThriftJobInProgress()
-            _elem88.read(iprot)
-            self.jobs.append(_elem88)
+          (_etype128, _size125) = iprot.readListBegin()
+          for _i129 in xrange(_size125):
+            _elem130 = ThriftJobInProgress()
+            _elem130.read(iprot)
+            self.jobs.append(_elem130)
           iprot.readListEnd()
         else:
           iprot.skip(ftype)
@@ -2290,8 +2577,8 @@ class ThriftJobList(object):
     if self.jobs != None:
       oprot.writeFieldBegin('jobs', TType.LIST, 1)
       oprot.writeListBegin(TType.STRUCT, len(self.jobs))
-      for iter89 in self.jobs:
-        iter89.write(oprot)
+      for iter131 in self.jobs:
+        iter131.write(oprot)
       oprot.writeListEnd()
       oprot.writeFieldEnd()
     oprot.writeFieldStop()
@@ -2308,33 +2595,31 @@ class ThriftJobList(object):
   def __ne__(self, other):
     return not (self == other)
 
-class ThriftUserJobCounts(object):
+class ThriftJobFilter(object):
   """
-  Container structure for job counts for a given user
+  Selection criteria for getJobSummaries(). Unset or empty fields match every job.
+  Strings match as case-insensitive substrings.
   
   Attributes:
-   - nPrep
-   - nRunning
-   - nSucceeded
-   - nFailed
-   - nKilled
+   - states: Match jobs in any of these states
+   - user
+   - queue
+   - text: Matched against the job's user, name, id, queue and priority
   """
 
   thrift_spec = (
     None, # 0
-    (1, TType.I32, 'nPrep', None, None, ), # 1
-    (2, TType.I32, 'nRunning', None, None, ), # 2
-    (3, TType.I32, 'nSucceeded', None, None, ), # 3
-    (4, TType.I32, 'nFailed', None, None, ), # 4
-    (5, TType.I32, 'nKilled', None, None, ), # 5
+    (1, TType.SET, 'states', (TType.I32,None), None, ), # 1
+    (2, TType.STRING, 'user', None, None, ), # 2
+    (3, TType.STRING, 'queue', None, None, ), # 3
+    (4, TType.STRING, 'text', None, None, ), # 4
   )
 
-  def __init__(self, nPrep=None, nRunning=None, nSucceeded=None, nFailed=None, nKilled=None,):
-    self.nPrep = nPrep
-    self.nRunning = nRunning
-    self.nSucceeded = nSucceeded
-    self.nFailed = nFailed
-    self.nKilled = nKilled
+  def __init__(self, states=None, user=None, queue=None, text=None,):
+    self.states = states
+    self.user = user
+    self.queue = queue
+    self.text = text
 
   def read(self, iprot):
     if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
@@ -2346,28 +2631,28 @@ class ThriftUserJobCounts(object):
       if ftype == TType.STOP:
         break
       if fid == 1:
-        if ftype == TType.I32:
-          self.nPrep = iprot.readI32();
+        if ftype == TType.SET:
+          self.states = set()
+          (_etype135, _size132) = iprot.readSetBegin()
+          for _i136 in xrange(_size132):
+            _elem137 = iprot.readI32();
+            self.states.add(_elem137)
+          iprot.readSetEnd()
         else:
           iprot.skip(ftype)
       elif fid == 2:
-        if ftype == TType.I32:
-          self.nRunning = iprot.readI32();
+        if ftype == TType.STRING:
+          self.user = iprot.readString();
         else:
           iprot.skip(ftype)
       elif fid == 3:
-        if ftype == TType.I32:
-          self.nSucceeded = iprot.readI32();
+        if ftype == TType.STRING:
+          self.queue = iprot.readString();
         else:
           iprot.skip(ftype)
       elif fid == 4:
-        if ftype == TType.I32:
-          self.nFailed = iprot.readI32();
-        else:
-          iprot.skip(ftype)
-      elif fid == 5:
-        if ftype == TType.I32:
-          self.nKilled = iprot.readI32();
+        if ftype == TType.STRING:
+          self.text = iprot.readString();
         else:
           iprot.skip(ftype)
       else:
@@ -2379,26 +2664,25 @@ class ThriftUserJobCounts(object):
     if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
       oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
       return
-    oprot.writeStructBegin('ThriftUserJobCounts')
-    if self.nPrep != None:
-      oprot.writeFieldBegin('nPrep', TType.I32, 1)
-      oprot.writeI32(self.nPrep)
+    oprot.writeStructBegin('ThriftJobFilter')
+    if self.states != None:
+      oprot.writeFieldBegin('states', TType.SET, 1)
+      oprot.writeSetBegin(TType.I32, len(self.states))
+      for iter138 in self.states:
+        oprot.writeI32(iter138)
+      oprot.writeSetEnd()
       oprot.writeFieldEnd()
-    if self.nRunning != None:
-      oprot.writeFieldBegin('nRunning', TType.I32, 2)
-      oprot.writeI32(self.nRunning)
-      oprot.writeFieldEnd()
-    if self.nSucceeded != None:
-      oprot.writeFieldBegin('nSucceeded', TType.I32, 3)
-      oprot.writeI32(self.nSucceeded)
+    if self.user != None:
+      oprot.writeFieldBegin('user', TType.STRING, 2)
+      oprot.writeString(self.user)
       oprot.writeFieldEnd()
-    if self.nFailed != None:
-      oprot.writeFieldBegin('nFailed', TType.I32, 4)
-      oprot.writeI32(self.nFailed)
+    if self.queue != None:
+      oprot.writeFieldBegin('queue', TType.STRING, 3)
+      oprot.writeString(self.queue)
       oprot.writeFieldEnd()
-    if self.nKilled != None:
-      oprot.writeFieldBegin('nKilled', TType.I32, 5)
-      oprot.writeI32(self.nKilled)
+    if self.text != None:
+      oprot.writeFieldBegin('text', TType.STRING, 4)
+      oprot.writeString(self.text)
       oprot.writeFieldEnd()
     oprot.writeFieldStop()
     oprot.writeStructEnd()
@@ -2414,38 +2698,624 @@ class ThriftUserJobCounts(object):
   def __ne__(self, other):
     return not (self == other)
 
-class ThriftClusterStatus(object):
+class ThriftJobSort(object):
   """
-  Status of the cluster as viewed by the jobtracker
+  Order of the jobs returned by getJobSummaries()
   
   Attributes:
-   - numActiveTrackers
-   - activeTrackerNames
-   - blacklistedTrackerNames
-   - numBlacklistedTrackers
-   - numExcludedNodes
-   - taskTrackerExpiryInterval
-   - mapTasks
-   - reduceTasks
-   - maxMapTasks
-   - maxReduceTasks
-   - state
-   - usedMemory: Used and max memory for the cluster, in bytes
-   - maxMemory
-   - totalSubmissions
-   - hasRestarted
-   - hasRecovered
-   - startTime
-   - hostname
-   - identifier
-   - httpPort
+   - key
+   - descending
   """
 
   thrift_spec = (
     None, # 0
-    (1, TType.I32, 'numActiveTrackers', None, None, ), # 1
-    (2, TType.LIST, 'activeTrackerNames', (TType.STRING,None), None, ), # 2
-    (3, TType.LIST, 'blacklistedTrackerNames', (TType.STRING,None), None, ), # 3
+    (1, TType.I32, 'key', None, None, ), # 1
+    (2, TType.BOOL, 'descending', None, None, ), # 2
+  )
+
+  def __init__(self, key=None, descending=None,):
+    self.key = key
+    self.descending = descending
+
+  def read(self, iprot):
+    if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
+      fastbinary.decode_binary(self, iprot.trans, (self.__class__, self.thrift_spec))
+      return
+    iprot.readStructBegin()
+    while True:
+      (fname, ftype, fid) = iprot.readFieldBegin()
+      if ftype == TType.STOP:
+        break
+      if fid == 1:
+        if ftype == TType.I32:
+          self.key = iprot.readI32();
+        else:
+          iprot.skip(ftype)
+      elif fid == 2:
+        if ftype == TType.BOOL:
+          self.descending = iprot.readBool();
+        else:
+          iprot.skip(ftype)
+      else:
+        iprot.skip(ftype)
+      iprot.readFieldEnd()
+    iprot.readStructEnd()
+
+  def write(self, oprot):
+    if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
+      return
+    oprot.writeStructBegin('ThriftJobSort')
+    if self.key != None:
+      oprot.writeFieldBegin('key', TType.I32, 1)
+      oprot.writeI32(self.key)
+      oprot.writeFieldEnd()
+    if self.descending != None:
+      oprot.writeFieldBegin('descending', TType.BOOL, 2)
+      oprot.writeBool(self.descending)
+      oprot.writeFieldEnd()
+    oprot.writeFieldStop()
+    oprot.writeStructEnd()
+
+  def __repr__(self):
+    L = ['%s=%r' % (key, value)
+      for key, value in self.__dict__.iteritems()]
+    return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+  def __eq__(self, other):
+    return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+  def __ne__(self, other):
+    return not (self == other)
+
+class ThriftJobSummary(object):
+  """
+  The fields of a job shown in job lists; much smaller than a
+  ThriftJobInProgress. Use getJob() for the rest.
+  
+  Attributes:
+   - jobID
+   - name
+   - user
+   - queueName
+   - runState
+   - priority
+   - mapProgress
+   - reduceProgress
+   - desiredMaps
+   - desiredReduces
+   - finishedMaps
+   - finishedReduces
+   - startTime
+   - finishTime
+  """
+
+  thrift_spec = (
+    None, # 0
+    (1, TType.STRUCT, 'jobID', (ThriftJobID, ThriftJobID.thrift_spec), None, ), # 1
+    (2, TType.STRING, 'name', None, None, ), # 2
+    (3, TType.STRING, 'user', None, None, ), # 3
+    (4, TType.STRING, 'queueName', None, None, ), # 4
+    (5, TType.I32, 'runState', None, None, ), # 5
+    (6, TType.I32, 'priority', None, None, ), # 6
+    (7, TType.DOUBLE, 'mapProgress', None, None, ), # 7
+    (8, TType.DOUBLE, 'reduceProgress', None, None, ), # 8
+    (9, TType.I32, 'desiredMaps', None, None, ), # 9
+    (10, TType.I32, 'desiredReduces', None, None, ), # 10
+    (11, TType.I32, 'finishedMaps', None, None, ), # 11
+    (12, TType.I32, 'finishedReduces', None, None, ), # 12
+    (13, TType.I64, 'startTime', None, None, ), # 13
+    (14, TType.I64, 'finishTime', None, None, ), # 14
+  )
+
+  def __init__(self, jobID=None, name=None, user=None, queueName=None, runState=None, priority=None, mapProgress=None, reduceProgress=None, desiredMaps=None, desiredReduces=None, finishedMaps=None, finishedReduces=None, startTime=None, finishTime=None,):
+    self.jobID = jobID
+    self.name = name
+    self.user = user
+    self.queueName = queueName
+    self.runState = runState
+    self.priority = priority
+    self.mapProgress = mapProgress
+    self.reduceProgress = reduceProgress
+    self.desiredMaps = desiredMaps
+    self.desiredReduces = desiredReduces
+    self.finishedMaps = finishedMaps
+    self.finishedReduces = finishedReduces
+    self.startTime = startTime
+    self.finishTime = finishTime
+
+  def read(self, iprot):
+    if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
+      fastbinary.decode_binary(self, iprot.trans, (self.__class__, self.thrift_spec))
+      return
+    iprot.readStructBegin()
+    while True:
+      (fname, ftype, fid) = iprot.readFieldBegin()
+      if ftype == TType.STOP:
+        break
+      if fid == 1:
+        if ftype == TType.STRUCT:
+          self.jobID = ThriftJobID()
+          self.jobID.read(iprot)
+        else:
+          iprot.skip(ftype)
+      elif fid == 2:
+        if ftype == TType.STRING:
+          self.name = iprot.readString();
+        else:
+          iprot.skip(ftype)
+      elif fid == 3:
+        if ftype == TType.STRING:
+          self.user = iprot.readString();
+        else:
+          iprot.skip(ftype)
+      elif fid == 4:
+        if ftype == TType.STRING:
+          self.queueName = iprot.readString();
+        else:
+          iprot.skip(ftype)
+      elif fid == 5:
+        if ftype == TType.I32:
+          self.runState = iprot.readI32();
+        else:
+          iprot.skip(ftype)
+      elif fid == 6:
+        if ftype == TType.I32:
+          self.priority = iprot.readI32();
+        else:
+          iprot.skip(ftype)
+      elif fid == 7:
+        if ftype == TType.DOUBLE:
+          self.mapProgress = iprot.readDouble();
+        else:
+          iprot.skip(ftype)
+      elif fid == 8:
+        if ftype == TType.DOUBLE:
+          self.reduceProgress = iprot.readDouble();
+        else:
+          iprot.skip(ftype)
+      elif fid == 9:
+        if ftype == TType.I32:
+          self.desiredMaps = iprot.readI32();
+        else:
+          iprot.skip(ftype)
+      elif fid == 10:
+        if ftype == TType.I32:
+          self.desiredReduces = iprot.readI32();
+        else:
+          iprot.skip(ftype)
+      elif fid == 11:
+        if ftype == TType.I32:
+          self.finishedMaps = iprot.readI32();
+        else:
+          iprot.skip(ftype)
+      elif fid == 12:
+        if ftype == TType.I32:
+          self.finishedReduces = iprot.readI32();
+        else:
+          iprot.skip(ftype)
+      elif fid == 13:
+        if ftype == TType.I64:
+          self.startTime = iprot.readI64();
+        else:
+          iprot.skip(ftype)
+      elif fid == 14:
+        if ftype == TType.I64:
+          self.finishTime = iprot.readI64();
+        else:
+          iprot.skip(ftype)
+      else:
+        iprot.skip(ftype)
+      iprot.readFieldEnd()
+    iprot.readStructEnd()
+
+  def write(self, oprot):
+    if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
+      return
+    oprot.writeStructBegin('ThriftJobSummary')
+    if self.jobID != None:
+      oprot.writeFieldBegin('jobID', TType.STRUCT, 1)
+      self.jobID.write(oprot)
+      oprot.writeFieldEnd()
+    if self.name != None:
+      oprot.writeFieldBegin('name', TType.STRING, 2)
+      oprot.writeString(self.name)
+      oprot.writeFieldEnd()
+    if self.user != None:
+      oprot.writeFieldBegin('user', TType.STRING, 3)
+      oprot.writeString(self.user)
+      oprot.writeFieldEnd()
+    if self.queueName != None:
+      oprot.writeFieldBegin('queueName', TType.STRING, 4)
+      oprot.writeString(self.queueName)
+      oprot.writeFieldEnd()
+    if self.runState != None:
+      oprot.writeFieldBegin('runState', TType.I32, 5)
+      oprot.writeI32(self.runState)
+      oprot.writeFieldEnd()
+    if self.priority != None:
+      oprot.writeFieldBegin('priority', TType.I32, 6)
+      oprot.writeI32(self.priority)
+      oprot.writeFieldEnd()
+    if self.mapProgress != None:
+      oprot.writeFieldBegin('mapProgress', TType.DOUBLE, 7)
+      oprot.writeDouble(self.mapProgress)
+      oprot.writeFieldEnd()
+    if self.reduceProgress != None:
+      oprot.writeFieldBegin('reduceProgress', TType.DOUBLE, 8)
+      oprot.writeDouble(self.reduceProgress)
+      oprot.writeFieldEnd()
+    if self.desiredMaps != None:
+      oprot.writeFieldBegin('desiredMaps', TType.I32, 9)
+      oprot.writeI32(self.desiredMaps)
+      oprot.writeFieldEnd()
+    if self.desiredReduces != None:
+      oprot.writeFieldBegin('desiredReduces', TType.I32, 10)
+      oprot.writeI32(self.desiredReduces)
+      oprot.writeFieldEnd()
+    if self.finishedMaps != None:
+      oprot.writeFieldBegin('finishedMaps', TType.I32, 11)
+      oprot.writeI32(self.finishedMaps)
+      oprot.writeFieldEnd()
+    if self.finishedReduces != None:
+      oprot.writeFieldBegin('finishedReduces', TType.I32, 12)
+      oprot.writeI32(self.finishedReduces)
+      oprot.writeFieldEnd()
+    if self.startTime != None:
+      oprot.writeFieldBegin('startTime', TType.I64, 13)
+      oprot.writeI64(self.startTime)
+      oprot.writeFieldEnd()
+    if self.finishTime != None:
+      oprot.writeFieldBegin('finishTime', TType.I64, 14)
+      oprot.writeI64(self.finishTime)
+      oprot.writeFieldEnd()
+    oprot.writeFieldStop()
+    oprot.writeStructEnd()
+
+  def __repr__(self):
+    L = ['%s=%r' % (key, value)
+      for key, value in self.__dict__.iteritems()]
+    return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+  def __eq__(self, other):
+    return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+  def __ne__(self, other):
+    return not (self == other)
+
+class ThriftJobSummaryList(object):
+  """
+  A page of job summaries (see getJobSummaries)
+  
+  Attributes:
+   - jobs
+   - numTotalJobs: The total number of jobs matching
+  """
+
+  thrift_spec = (
+    None, # 0
+    (1, TType.LIST, 'jobs', (TType.STRUCT,(ThriftJobSummary, ThriftJobSummary.thrift_spec)), None, ), # 1
+    (2, TType.I32, 'numTotalJobs', None, None, ), # 2
+  )
+
+  def __init__(self, jobs=None, numTotalJobs=None,):
+    self.jobs = jobs
+    self.numTotalJobs = numTotalJobs
+
+  def read(self, iprot):
+    if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
+      fastbinary.decode_binary(self, iprot.trans, (self.__class__, self.thrift_spec))
+      return
+    iprot.readStructBegin()
+    while True:
+      (fname, ftype, fid) = iprot.readFieldBegin()
+      if ftype == TType.STOP:
+        break
+      if fid == 1:
+        if ftype == TType.LIST:
+          self.jobs = []
+          (_etype142, _size139) = iprot.readListBegin()
+          for _i143 in xrange(_size139):
+            _elem144 = ThriftJobSummary()
+            _elem144.read(iprot)
+            self.jobs.append(_elem144)
+          iprot.readListEnd()
+        else:
+          iprot.skip(ftype)
+      elif fid == 2:
+        if ftype == TType.I32:
+          self.numTotalJobs = iprot.readI32();
+        else:
+          iprot.skip(ftype)
+      else:
+        iprot.skip(ftype)
+      iprot.readFieldEnd()
+    iprot.readStructEnd()
+
+  def write(self, oprot):
+    if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
+      return
+    oprot.writeStructBegin('ThriftJobSummaryList')
+    if self.jobs != None:
+      oprot.writeFieldBegin('jobs', TType.LIST, 1)
+      oprot.writeListBegin(TType.STRUCT, len(self.jobs))
+      for iter145 in self.jobs:
+        iter145.write(oprot)
+      oprot.writeListEnd()
+      oprot.writeFieldEnd()
+    if self.numTotalJobs != None:
+      oprot.writeFieldBegin('numTotalJobs', TType.I32, 2)
+      oprot.writeI32(self.numTotalJobs)
+      oprot.writeFieldEnd()
+    oprot.writeFieldStop()
+    oprot.writeStructEnd()
+
+  def __repr__(self):
+    L = ['%s=%r' % (key, value)
+      for key, value in self.__dict__.iteritems()]
+    return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+  def __eq__(self, other):
+    return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+  def __ne__(self, other):
+    return not (self == other)
+
+class ThriftJobChanges(object):
+  """
+  The jobs that changed since a getJobsChangedSince() token. Tokens are
+  only meaningful to the JobTracker that issued them.
+  
+  Attributes:
+   - changed: Summaries of the jobs that were added, or whose state or progress changed
+   - removed: The jobs that the JobTracker no longer retains
+   - token: The token to pass to the next call
+   - full: True if the token given could not be used (it was 0, too old, or from
+  another JobTracker). changed then has every job, and the caller should
+  drop the jobs it knew about.
+  """
+
+  thrift_spec = (
+    None, # 0
+    (1, TType.LIST, 'changed', (TType.STRUCT,(ThriftJobSummary, ThriftJobSummary.thrift_spec)), None, ), # 1
+    (2, TType.LIST, 'removed', (TType.STRUCT,(ThriftJobID, ThriftJobID.thrift_spec)), None, ), # 2
+    (3, TType.I64, 'token', None, None, ), # 3
+    (4, TType.BOOL, 'full', None, None, ), # 4
+  )
+
+  def __init__(self, changed=None, removed=None, token=None, full=None,):
+    self.changed = changed
+    self.removed = removed
+    self.token = token
+    self.full = full
+
+  def read(self, iprot):
+    if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
+      fastbinary.decode_binary(self, iprot.trans, (self.__class__, self.thrift_spec))
+      return
+    iprot.readStructBegin()
+    while True:
+      (fname, ftype, fid) = iprot.readFieldBegin()
+      if ftype == TType.STOP:
+        break
+      if fid == 1:
+        if ftype == TType.LIST:
+          self.changed = []
+          (_etype149, _size146) = iprot.readListBegin()
+          for _i150 in xrange(_size146):
+            _elem151 = ThriftJobSummary()
+            _elem151.read(iprot)
+            self.changed.append(_elem151)
+          iprot.readListEnd()
+        else:
+          iprot.skip(ftype)
+      elif fid == 2:
+        if ftype == TType.LIST:
+          self.removed = []
+          (_etype155, _size152) = iprot.readListBegin()
+          for _i156 in xrange(_size152):
+            _elem157 = ThriftJobID()
+            _elem157.read(iprot)
+            self.removed.append(_elem157)
+          iprot.readListEnd()
+        else:
+          iprot.skip(ftype)
+      elif fid == 3:
+        if ftype == TType.I64:
+          self.token = iprot.readI64();
+        else:
+          iprot.skip(ftype)
+      elif fid == 4:
+        if ftype == TType.BOOL:
+          self.full = iprot.readBool();
+        else:
+          iprot.skip(ftype)
+      else:
+        iprot.skip(ftype)
+      iprot.readFieldEnd()
+    iprot.readStructEnd()
+
+  def write(self, oprot):
+    if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
+      return
+    oprot.writeStructBegin('ThriftJobChanges')
+    if self.changed != None:
+      oprot.writeFieldBegin('changed', TType.LIST, 1)
+      oprot.writeListBegin(TType.STRUCT, len(self.changed))
+      for iter158 in self.changed:
+        iter158.write(oprot)
+      oprot.writeListEnd()
+      oprot.writeFieldEnd()
+    if self.removed != None:
+      oprot.writeFieldBegin('removed', TType.LIST, 2)
+      oprot.writeListBegin(TType.STRUCT, len(self.removed))
+      for iter159 in self.removed:
+        iter159.write(oprot)
+      oprot.writeListEnd()
+      oprot.writeFieldEnd()
+    if self.token != None:
+      oprot.writeFieldBegin('token', TType.I64, 3)
+      oprot.writeI64(self.token)
+      oprot.writeFieldEnd()
+    if self.full != None:
+      oprot.writeFieldBegin('full', TType.BOOL, 4)
+      oprot.writeBool(self.full)
+      oprot.writeFieldEnd()
+    oprot.writeFieldStop()
+    oprot.writeStructEnd()
+
+  def __repr__(self):
+    L = ['%s=%r' % (key, value)
+      for key, value in self.__dict__.iteritems()]
+    return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+  def __eq__(self, other):
+    return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+  def __ne__(self, other):
+    return not (self == other)
+
+class ThriftUserJobCounts(object):
+  """
+  Container structure for job counts for a given user
+  
+  Attributes:
+   - nPrep
+   - nRunning
+   - nSucceeded
+   - nFailed
+   - nKilled
+  """
+
+  thrift_spec = (
+    None, # 0
+    (1, TType.I32, 'nPrep', None, None, ), # 1
+    (2, TType.I32, 'nRunning', None, None, ), # 2
+    (3, TType.I32, 'nSucceeded', None, None, ), # 3
+    (4, TType.I32, 'nFailed', None, None, ), # 4
+    (5, TType.I32, 'nKilled', None, None, ), # 5
+  )
+
+  def __init__(self, nPrep=None, nRunning=None, nSucceeded=None, nFailed=None, nKilled=None,):
+    self.nPrep = nPrep
+    self.nRunning = nRunning
+    self.nSucceeded = nSucceeded
+    self.nFailed = nFailed
+    self.nKilled = nKilled
+
+  def read(self, iprot):
+    if iprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None and fastbinary is not None:
+      fastbinary.decode_binary(self, iprot.trans, (self.__class__, self.thrift_spec))
+      return
+    iprot.readStructBegin()
+    while True:
+      (fname, ftype, fid) = iprot.readFieldBegin()
+      if ftype == TType.STOP:
+        break
+      if fid == 1:
+        if ftype == TType.I32:
+          self.nPrep = iprot.readI32();
+        else:
+          iprot.skip(ftype)
+      elif fid == 2:
+        if ftype == TType.I32:
+          self.nRunning = iprot.readI32();
+        else:
+          iprot.skip(ftype)
+      elif fid == 3:
+        if ftype == TType.I32:
+          self.nSucceeded = iprot.readI32();
+        else:
+          iprot.skip(ftype)
+      elif fid == 4:
+        if ftype == TType.I32:
+          self.nFailed = iprot.readI32();
+        else:
+          iprot.skip(ftype)
+      elif fid == 5:
+        if ftype == TType.I32:
+          self.nKilled = iprot.readI32();
+        else:
+          iprot.skip(ftype)
+      else:
+        iprot.skip(ftype)
+      iprot.readFieldEnd()
+    iprot.readStructEnd()
+
+  def write(self, oprot):
+    if oprot.__class__ == TBinaryProtocol.TBinaryProtocolAccelerated and self.thrift_spec is not None and fastbinary is not None:
+      oprot.trans.write(fastbinary.encode_binary(self, (self.__class__, self.thrift_spec)))
+      return
+    oprot.writeStructBegin('ThriftUserJobCounts')
+    if self.nPrep != None:
+      oprot.writeFieldBegin('nPrep', TType.I32, 1)
+      oprot.writeI32(self.nPrep)
+      oprot.writeFieldEnd()
+    if self.nRunning != None:
+      oprot.writeFieldBegin('nRunning', TType.I32, 2)
+      oprot.writeI32(self.nRunning)
+      oprot.writeFieldEnd()
+    if self.nSucceeded != None:
+      oprot.writeFieldBegin('nSucceeded', TType.I32, 3)
+      oprot.writeI32(self.nSucceeded)
+      oprot.writeFieldEnd()
+    if self.nFailed != None:
+      oprot.writeFieldBegin('nFailed', TType.I32, 4)
+      oprot.writeI32(self.nFailed)
+      oprot.writeFieldEnd()
+    if self.nKilled != None:
+      oprot.writeFieldBegin('nKilled', TType.I32, 5)
+      oprot.writeI32(self.nKilled)
+      oprot.writeFieldEnd()
+    oprot.writeFieldStop()
+    oprot.writeStructEnd()
+
+  def __repr__(self):
+    L = ['%s=%r' % (key, value)
+      for key, value in self.__dict__.iteritems()]
+    return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+  def __eq__(self, other):
+    return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+  def __ne__(self, other):
+    return not (self == other)
+
+class ThriftClusterStatus(object):
+  """
+  Status of the cluster as viewed by the jobtracker
+  
+  Attributes:
+   - numActiveTrackers
+   - activeTrackerNames
+   - blacklistedTrackerNames
+   - numBlacklistedTrackers
+   - numExcludedNodes
+   - taskTrackerExpiryInterval
+   - mapTasks
+   - reduceTasks
+   - maxMapTasks
+   - maxReduceTasks
+   - state
+   - usedMemory: Used and max memory for the cluster, in bytes
+   - maxMemory
+   - totalSubmissions
+   - hasRestarted
+   - hasRecovered
+   - startTime
+   - hostname
+   - identifier
+   - httpPort
+  """
+
+  thrift_spec = (
+    None, # 0
+    (1, TType.I32, 'numActiveTrackers', None, None, ), # 1
+    (2, TType.LIST, 'activeTrackerNames', (TType.STRING,None), None, ), # 2
+    (3, TType.LIST, 'blacklistedTrackerNames', (TType.STRING,None), None, ), # 3
     (4, TType.I32, 'numBlacklistedTrackers', None, None, ), # 4
     (5, TType.I32, 'numExcludedNodes', None, None, ), # 5
     (6, TType.I64, 'taskTrackerExpiryInterval', None, None, ), # 6
@@ -2504,20 +3374,20 @@ class ThriftClusterStatus(object):
       elif fid == 2:
         if ftype == TType.LIST:
           self.activeTrackerNames = []
-          (_etype93, _size90) = iprot.readListBegin()
-          for _i94 in xrange(_size90):
-            _elem95 = iprot.readString();
-            self.activeTrackerNames.append(_elem95)
+          (_etype163, _size160) = iprot.readListBegin()
+          for _i164 in xrange(_size160):
+            _elem165 = iprot.readString();
+            self.activeTrackerNames.append(_elem165)
           iprot.readListEnd()
         else:
           iprot.skip(ftype)
       elif fid == 3:
         if ftype == TType.LIST:
           self.blacklistedTrackerNames = []
-          (_etype99, _size96) = iprot.readListBegin()
-          for _i100 in xrange(_size96):
-            _elem101 = iprot.readString();
-            self.blacklistedTrackerNames.append(_elem101)
+          (_etype169, _size166) = iprot.readListBegin()
+          for _i170 in xrange(_size166):
+            _elem171 = iprot.readString();
+            self.blacklistedTrackerNames.append(_elem171)
           iprot.readListEnd()
         else:
           iprot.skip(ftype)
@@ -2623,15 +3493,15 @@ class ThriftClusterStatus(object):
     if self.activeTrackerNames != None:
       oprot.writeFieldBegin('activeTrackerNames', TType.LIST, 2)
       oprot.writeListBegin(TType.STRING, len(self.activeTrackerNames))
-      for iter102 in self.activeTrackerNames:
-        oprot.writeString(iter102)
+      for iter172 in self.activeTrackerNames:
+        oprot.writeString(iter172)
       oprot.writeListEnd()
       oprot.writeFieldEnd()
     if self.blacklistedTrackerNames != None:
       oprot.writeFieldBegin('blacklistedTrackerNames', TType.LIST, 3)
       oprot.writeListBegin(TType.STRING, len(self.blacklistedTrackerNames))
-      for iter103 in self.blacklistedTrackerNames:
-        oprot.writeString(iter103)
+      for iter173 in self.blacklistedTrackerNames:
+        oprot.writeString(iter173)
       oprot.writeListEnd()
       oprot.writeFieldEnd()
     if self.numBlacklistedTrackers != None:
@@ -34,7 +34,7 @@ public class BlockData implements TBase<BlockData._Fields>, java.io.Serializable
   private static final TField DATA_FIELD_DESC = new TField("data", TType.STRING, (short)3);
 
   /**
-   * CRC32 of the data being transfered
+   * CRC32 of the data being transfered (0 if the client skipped it)
    */
   public int crc;
   /**
@@ -49,7 +49,7 @@ public class BlockData implements TBase<BlockData._Fields>, java.io.Serializable
   /** The set of fields this struct contains, along with convenience methods for finding and manipulating them. */
   public enum _Fields implements TFieldIdEnum {
     /**
-     * CRC32 of the data being transfered
+     * CRC32 of the data being transfered (0 if the client skipped it)
      */
     CRC((short)1, "crc"),
     /**
@@ -170,14 +170,14 @@ public class BlockData implements TBase<BlockData._Fields>, java.io.Serializable
   }
 
   /**
-   * CRC32 of the data being transfered
+   * CRC32 of the data being transfered (0 if the client skipped it)
    */
   public int getCrc() {
     return this.crc;
   }
 
   /**
-   * CRC32 of the data being transfered
+   * CRC32 of the data being transfered (0 if the client skipped it)
    */
   public BlockData setCrc(int crc) {
     this.crc = crc;
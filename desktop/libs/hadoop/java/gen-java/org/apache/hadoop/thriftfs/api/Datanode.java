@@ -42,8 +42,32 @@ public class Datanode {
      * @param offset Offset within the block where read must start from.
      * 
      * @param length Number of bytes to read.
+     * 
+     * @param skipCrc Don't compute the CRC32 of the data, for clients
+     * that don't check it.
+     */
+    public BlockData readBlock(org.apache.hadoop.thriftfs.api.RequestContext ctx, Block block, long offset, int length, boolean skipCrc) throws org.apache.hadoop.thriftfs.api.IOException, TException;
+
+    /**
+     * Read bytes from a file, across block boundaries if need be.
+     * 
+     * The datanode reads the blocks itself, from its own replicas where
+     * it has them, so the client needs no block locations.  Fewer bytes
+     * than asked for are returned only at the end of the file.
+     * 
+     * Only 2^31 - 1 bytes may be read on a single call to this method.
+     * 
+     * @param ctx
+     * @param path Path of the file to be read from.
+     * 
+     * @param offset Offset within the file where read must start from.
+     * 
+     * @param length Number of bytes to read.
+     * 
+     * @param skipCrc Don't compute the CRC32 of the data, for clients
+     * that don't check it.
      */
-    public BlockData readBlock(org.apache.hadoop.thriftfs.api.RequestContext ctx, Block block, long offset, int length) throws org.apache.hadoop.thriftfs.api.IOException, TException;
+    public BlockData readRange(org.apache.hadoop.thriftfs.api.RequestContext ctx, String path, long offset, int length, boolean skipCrc) throws org.apache.hadoop.thriftfs.api.IOException, TException;
 
   }
 
@@ -74,13 +98,13 @@ public class Datanode {
       return this.oprot_;
     }
 
-    public BlockData readBlock(org.apache.hadoop.thriftfs.api.RequestContext ctx, Block block, long offset, int length) throws org.apache.hadoop.thriftfs.api.IOException, TException
+    public BlockData readBlock(org.apache.hadoop.thriftfs.api.RequestContext ctx, Block block, long offset, int length, boolean skipCrc) throws org.apache.hadoop.thriftfs.api.IOException, TException
     {
-      send_readBlock(ctx, block, offset, length);
+      send_readBlock(ctx, block, offset, length, skipCrc);
       return recv_readBlock();
     }
 
-    public void send_readBlock(org.apache.hadoop.thriftfs.api.RequestContext ctx, Block block, long offset, int length) throws TException
+    public void send_readBlock(org.apache.hadoop.thriftfs.api.RequestContext ctx, Block block, long offset, int length, boolean skipCrc) throws TException
     {
       oprot_.writeMessageBegin(new TMessage("readBlock", TMessageType.CALL, seqid_));
       readBlock_args args = new readBlock_args();
@@ -88,6 +112,7 @@ public class Datanode {
       args.block = block;
       args.offset = offset;
       args.length = length;
+      args.skipCrc = skipCrc;
       args.write(oprot_);
       oprot_.writeMessageEnd();
       oprot_.getTransport().flush();
@@ -113,6 +138,46 @@ public class Datanode {
       throw new TApplicationException(TApplicationException.MISSING_RESULT, "readBlock failed: unknown result");
     }
 
+    public BlockData readRange(org.apache.hadoop.thriftfs.api.RequestContext ctx, String path, long offset, int length, boolean skipCrc) throws org.apache.hadoop.thriftfs.api.IOException, TException
+    {
+      send_readRange(ctx, path, offset, length, skipCrc);
+      return recv_readRange();
+    }
+
+    public void send_readRange(org.apache.hadoop.thriftfs.api.RequestContext ctx, String path, long offset, int length, boolean skipCrc) throws TException
+    {
+      oprot_.writeMessageBegin(new TMessage("readRange", TMessageType.CALL, seqid_));
+      readRange_args args = new readRange_args();
+      args.ctx = ctx;
+      args.path = path;
+      args.offset = offset;
+      args.length = length;
+      args.skipCrc = skipCrc;
+      args.write(oprot_);
+      oprot_.writeMessageEnd();
+      oprot_.getTransport().flush();
+    }
+
+    public BlockData recv_readRange() throws org.apache.hadoop.thriftfs.api.IOException, TException
+    {
+      TMessage msg = iprot_.readMessageBegin();
+      if (msg.type == TMessageType.EXCEPTION) {
+        TApplicationException x = TApplicationException.read(iprot_);
+        iprot_.readMessageEnd();
+        throw x;
+      }
+      readRange_result result = new readRange_result();
+      result.read(iprot_);
+      iprot_.readMessageEnd();
+      if (result.isSetSuccess()) {
+        return result.success;
+      }
+      if (result.err != null) {
+        throw result.err;
+      }
+      throw new TApplicationException(TApplicationException.MISSING_RESULT, "readRange failed: unknown result");
+    }
+
   }
   public static class Processor implements TProcessor {
     private static final Logger LOGGER = LoggerFactory.getLogger(Processor.class.getName());
@@ -120,6 +185,7 @@ public class Datanode {
     {
       iface_ = iface;
       processMap_.put("readBlock", new readBlock());
+      processMap_.put("readRange", new readRange());
     }
 
     protected static interface ProcessFunction {
@@ -155,7 +221,7 @@ public class Datanode {
         iprot.readMessageEnd();
         readBlock_result result = new readBlock_result();
         try {
-          result.success = iface_.readBlock(args.ctx, args.block, args.offset, args.length);
+          result.success = iface_.readBlock(args.ctx, args.block, args.offset, args.length, args.skipCrc);
         } catch (org.apache.hadoop.thriftfs.api.IOException err) {
           result.err = err;
         } catch (Throwable th) {
@@ -175,6 +241,34 @@ public class Datanode {
 
     }
 
+    private class readRange implements ProcessFunction {
+      public void process(int seqid, TProtocol iprot, TProtocol oprot) throws TException
+      {
+        readRange_args args = new readRange_args();
+        args.read(iprot);
+        iprot.readMessageEnd();
+        readRange_result result = new readRange_result();
+        try {
+          result.success = iface_.readRange(args.ctx, args.path, args.offset, args.length, args.skipCrc);
+        } catch (org.apache.hadoop.thriftfs.api.IOException err) {
+          result.err = err;
+        } catch (Throwable th) {
+          LOGGER.error("Internal error processing readRange", th);
+          TApplicationException x = new TApplicationException(TApplicationException.INTERNAL_ERROR, "Internal error processing readRange");
+          oprot.writeMessageBegin(new TMessage("readRange", TMessageType.EXCEPTION, seqid));
+          x.write(oprot);
+          oprot.writeMessageEnd();
+          oprot.getTransport().flush();
+          return;
+        }
+        oprot.writeMessageBegin(new TMessage("readRange", TMessageType.REPLY, seqid));
+        result.write(oprot);
+        oprot.writeMessageEnd();
+        oprot.getTransport().flush();
+      }
+
+    }
+
   }
 
   public static class readBlock_args implements TBase<readBlock_args._Fields>, java.io.Serializable, Cloneable   {
@@ -184,6 +278,7 @@ public class Datanode {
     private static final TField BLOCK_FIELD_DESC = new TField("block", TType.STRUCT, (short)1);
     private static final TField OFFSET_FIELD_DESC = new TField("offset", TType.I64, (short)2);
     private static final TField LENGTH_FIELD_DESC = new TField("length", TType.I32, (short)3);
+    private static final TField SKIP_CRC_FIELD_DESC = new TField("skipCrc", TType.BOOL, (short)4);
 
     public org.apache.hadoop.thriftfs.api.RequestContext ctx;
     /**
@@ -198,6 +293,11 @@ public class Datanode {
      * Number of bytes to read.
      */
     public int length;
+    /**
+     * Don't compute the CRC32 of the data, for clients
+     * that don't check it.
+     */
+    public boolean skipCrc;
 
     /** The set of fields this struct contains, along with convenience methods for finding and manipulating them. */
     public enum _Fields implements TFieldIdEnum {
@@ -213,7 +313,12 @@ public class Datanode {
       /**
        * Number of bytes to read.
        */
-      LENGTH((short)3, "length");
+      LENGTH((short)3, "length"),
+      /**
+       * Don't compute the CRC32 of the data, for clients
+       * that don't check it.
+       */
+      SKIP_CRC((short)4, "skipCrc");
 
       private static final Map<Integer, _Fields> byId = new HashMap<Integer, _Fields>();
       private static final Map<String, _Fields> byName = new HashMap<String, _Fields>();
@@ -269,7 +374,8 @@ public class Datanode {
     // isset id assignments
     private static final int __OFFSET_ISSET_ID = 0;
     private static final int __LENGTH_ISSET_ID = 1;
-    private BitSet __isset_bit_vector = new BitSet(2);
+    private static final int __SKIPCRC_ISSET_ID = 2;
+    private BitSet __isset_bit_vector = new BitSet(3);
 
     public static final Map<_Fields, FieldMetaData> metaDataMap = Collections.unmodifiableMap(new EnumMap<_Fields, FieldMetaData>(_Fields.class) {{
       put(_Fields.CTX, new FieldMetaData("ctx", TFieldRequirementType.DEFAULT, 
@@ -280,6 +386,8 @@ public class Datanode {
           new FieldValueMetaData(TType.I64)));
       put(_Fields.LENGTH, new FieldMetaData("length", TFieldRequirementType.DEFAULT, 
           new FieldValueMetaData(TType.I32)));
+      put(_Fields.SKIP_CRC, new FieldMetaData("skipCrc", TFieldRequirementType.DEFAULT, 
+          new FieldValueMetaData(TType.BOOL)));
     }});
 
     static {
@@ -293,7 +401,8 @@ public class Datanode {
       org.apache.hadoop.thriftfs.api.RequestContext ctx,
       Block block,
       long offset,
-      int length)
+      int length,
+      boolean skipCrc)
     {
       this();
       this.ctx = ctx;
@@ -302,6 +411,8 @@ public class Datanode {
       setOffsetIsSet(true);
       this.length = length;
       setLengthIsSet(true);
+      this.skipCrc = skipCrc;
+      setSkipCrcIsSet(true);
     }
 
     /**
@@ -318,6 +429,7 @@ public class Datanode {
       }
       this.offset = other.offset;
       this.length = other.length;
+      this.skipCrc = other.skipCrc;
     }
 
     public readBlock_args deepCopy() {
@@ -441,6 +553,37 @@ public class Datanode {
       __isset_bit_vector.set(__LENGTH_ISSET_ID, value);
     }
 
+    /**
+     * Don't compute the CRC32 of the data, for clients
+     * that don't check it.
+     */
+    public boolean isSkipCrc() {
+      return this.skipCrc;
+    }
+
+    /**
+     * Don't compute the CRC32 of the data, for clients
+     * that don't check it.
+     */
+    public readBlock_args setSkipCrc(boolean skipCrc) {
+      this.skipCrc = skipCrc;
+      setSkipCrcIsSet(true);
+      return this;
+    }
+
+    public void unsetSkipCrc() {
+      __isset_bit_vector.clear(__SKIPCRC_ISSET_ID);
+    }
+
+    /** Returns true if field skipCrc is set (has been asigned a value) and false otherwise */
+    public boolean isSetSkipCrc() {
+      return __isset_bit_vector.get(__SKIPCRC_ISSET_ID);
+    }
+
+    public void setSkipCrcIsSet(boolean value) {
+      __isset_bit_vector.set(__SKIPCRC_ISSET_ID, value);
+    }
+
     public void setFieldValue(_Fields field, Object value) {
       switch (field) {
       case CTX:
@@ -475,6 +618,14 @@ public class Datanode {
         }
         break;
 
+      case SKIP_CRC:
+        if (value == null) {
+          unsetSkipCrc();
+        } else {
+          setSkipCrc((Boolean)value);
+        }
+        break;
+
       }
     }
 
@@ -496,6 +647,9 @@ public class Datanode {
       case LENGTH:
         return new Integer(getLength());
 
+      case SKIP_CRC:
+        return new Boolean(isSkipCrc());
+
       }
       throw new IllegalStateException();
     }
@@ -515,6 +669,8 @@ public class Datanode {
         return isSetOffset();
       case LENGTH:
         return isSetLength();
+      case SKIP_CRC:
+        return isSetSkipCrc();
       }
       throw new IllegalStateException();
     }
@@ -572,6 +728,15 @@ public class Datanode {
           return false;
       }
 
+      boolean this_present_skipCrc = true;
+      boolean that_present_skipCrc = true;
+      if (this_present_skipCrc || that_present_skipCrc) {
+        if (!(this_present_skipCrc && that_present_skipCrc))
+          return false;
+        if (this.skipCrc != that.skipCrc)
+          return false;
+      }
+
       return true;
     }
 
@@ -626,6 +791,14 @@ public class Datanode {
                 TProtocolUtil.skip(iprot, field.type);
               }
               break;
+            case SKIP_CRC:
+              if (field.type == TType.BOOL) {
+                this.skipCrc = iprot.readBool();
+                setSkipCrcIsSet(true);
+              } else { 
+                TProtocolUtil.skip(iprot, field.type);
+              }
+              break;
           }
           iprot.readFieldEnd();
         }
@@ -651,6 +824,9 @@ public class Datanode {
       oprot.writeFieldBegin(LENGTH_FIELD_DESC);
       oprot.writeI32(this.length);
       oprot.writeFieldEnd();
+      oprot.writeFieldBegin(SKIP_CRC_FIELD_DESC);
+      oprot.writeBool(this.skipCrc);
+      oprot.writeFieldEnd();
       if (this.ctx != null) {
         oprot.writeFieldBegin(CTX_FIELD_DESC);
         this.ctx.write(oprot);
@@ -688,6 +864,10 @@ public class Datanode {
       sb.append("length:");
       sb.append(this.length);
       first = false;
+      if (!first) sb.append(", ");
+      sb.append("skipCrc:");
+      sb.append(this.skipCrc);
+      first = false;
       sb.append(")");
       return sb.toString();
     }
@@ -1065,4 +1245,977 @@ public class Datanode {
 
   }
 
+  public static class readRange_args implements TBase<readRange_args._Fields>, java.io.Serializable, Cloneable   {
+    private static final TStruct STRUCT_DESC = new TStruct("readRange_args");
+
+    private static final TField CTX_FIELD_DESC = new TField("ctx", TType.STRUCT, (short)10);
+    private static final TField PATH_FIELD_DESC = new TField("path", TType.STRING, (short)1);
+    private static final TField OFFSET_FIELD_DESC = new TField("offset", TType.I64, (short)2);
+    private static final TField LENGTH_FIELD_DESC = new TField("length", TType.I32, (short)3);
+    private static final TField SKIP_CRC_FIELD_DESC = new TField("skipCrc", TType.BOOL, (short)4);
+
+    public org.apache.hadoop.thriftfs.api.RequestContext ctx;
+    /**
+     * Path of the file to be read from.
+     */
+    public String path;
+    /**
+     * Offset within the file where read must start from.
+     */
+    public long offset;
+    /**
+     * Number of bytes to read.
+     */
+    public int length;
+    /**
+     * Don't compute the CRC32 of the data, for clients
+     * that don't check it.
+     */
+    public boolean skipCrc;
+
+    /** The set of fields this struct contains, along with convenience methods for finding and manipulating them. */
+    public enum _Fields implements TFieldIdEnum {
+      CTX((short)10, "ctx"),
+      /**
+       * Path of the file to be read from.
+       */
+      PATH((short)1, "path"),
+      /**
+       * Offset within the file where read must start from.
+       */
+      OFFSET((short)2, "offset"),
+      /**
+       * Number of bytes to read.
+       */
+      LENGTH((short)3, "length"),
+      /**
+       * Don't compute the CRC32 of the data, for clients
+       * that don't check it.
+       */
+      SKIP_CRC((short)4, "skipCrc");
+
+      private static final Map<Integer, _Fields> byId = new HashMap<Integer, _Fields>();
+      private static final Map<String, _Fields> byName = new HashMap<String, _Fields>();
+
+      static {
+        for (_Fields field : EnumSet.allOf(_Fields.class)) {
+          byId.put((int)field._thriftId, field);
+          byName.put(field.getFieldName(), field);
+        }
+      }
+
+      /**
+       * Find the _Fields constant that matches fieldId, or null if its not found.
+       */
+      public static _Fields findByThriftId(int fieldId) {
+        return byId.get(fieldId);
+      }
+
+      /**
+       * Find the _Fields constant that matches fieldId, throwing an exception
+       * if it is not found.
+       */
+      public static _Fields findByThriftIdOrThrow(int fieldId) {
+        _Fields fields = findByThriftId(fieldId);
+        if (fields == null) throw new IllegalArgumentException("Field " + fieldId + " doesn't exist!");
+        return fields;
+      }
+
+      /**
+       * Find the _Fields constant that matches name, or null if its not found.
+       */
+      public static _Fields findByName(String name) {
+        return byName.get(name);
+      }
+
+      private final short _thriftId;
+      private final String _fieldName;
+
+      _Fields(short thriftId, String fieldName) {
+        _thriftId = thriftId;
+        _fieldName = fieldName;
+      }
+
+      public short getThriftFieldId() {
+        return _thriftId;
+      }
+
+      public String getFieldName() {
+        return _fieldName;
+      }
+    }
+
+    // isset id assignments
+    private static final int __OFFSET_ISSET_ID = 0;
+    private static final int __LENGTH_ISSET_ID = 1;
+    private static final int __SKIPCRC_ISSET_ID = 2;
+    private BitSet __isset_bit_vector = new BitSet(3);
+
+    public static final Map<_Fields, FieldMetaData> metaDataMap = Collections.unmodifiableMap(new EnumMap<_Fields, FieldMetaData>(_Fields.class) {{
+      put(_Fields.CTX, new FieldMetaData("ctx", TFieldRequirementType.DEFAULT, 
+          new StructMetaData(TType.STRUCT, org.apache.hadoop.thriftfs.api.RequestContext.class)));
+      put(_Fields.PATH, new FieldMetaData("path", TFieldRequirementType.DEFAULT, 
+          new FieldValueMetaData(TType.STRING)));
+      put(_Fields.OFFSET, new FieldMetaData("offset", TFieldRequirementType.DEFAULT, 
+          new FieldValueMetaData(TType.I64)));
+      put(_Fields.LENGTH, new FieldMetaData("length", TFieldRequirementType.DEFAULT, 
+          new FieldValueMetaData(TType.I32)));
+      put(_Fields.SKIP_CRC, new FieldMetaData("skipCrc", TFieldRequirementType.DEFAULT, 
+          new FieldValueMetaData(TType.BOOL)));
+    }});
+
+    static {
+      FieldMetaData.addStructMetaDataMap(readRange_args.class, metaDataMap);
+    }
+
+    public readRange_args() {
+    }
+
+    public readRange_args(
+      org.apache.hadoop.thriftfs.api.RequestContext ctx,
+      String path,
+      long offset,
+      int length,
+      boolean skipCrc)
+    {
+      this();
+      this.ctx = ctx;
+      this.path = path;
+      this.offset = offset;
+      setOffsetIsSet(true);
+      this.length = length;
+      setLengthIsSet(true);
+      this.skipCrc = skipCrc;
+      setSkipCrcIsSet(true);
+    }
+
+    /**
+     * Performs a deep copy on <i>other</i>.
+     */
+    public readRange_args(readRange_args other) {
+      __isset_bit_vector.clear();
+      __isset_bit_vector.or(other.__isset_bit_vector);
+      if (other.isSetCtx()) {
+        this.ctx = new org.apache.hadoop.thriftfs.api.RequestContext(other.ctx);
+      }
+      if (other.isSetPath()) {
+        this.path = other.path;
+      }
+      this.offset = other.offset;
+      this.length = other.length;
+      this.skipCrc = other.skipCrc;
+    }
+
+    public readRange_args deepCopy() {
+      return new readRange_args(this);
+    }
+
+    @Deprecated
+    public readRange_args clone() {
+      return new readRange_args(this);
+    }
+
+    public org.apache.hadoop.thriftfs.api.RequestContext getCtx() {
+      return this.ctx;
+    }
+
+    public readRange_args setCtx(org.apache.hadoop.thriftfs.api.RequestContext ctx) {
+      this.ctx = ctx;
+      return this;
+    }
+
+    public void unsetCtx() {
+      this.ctx = null;
+    }
+
+    /** Returns true if field ctx is set (has been asigned a value) and false otherwise */
+    public boolean isSetCtx() {
+      return this.ctx != null;
+    }
+
+    public void setCtxIsSet(boolean value) {
+      if (!value) {
+        this.ctx = null;
+      }
+    }
+
+    /**
+     * Path of the file to be read from.
+     */
+    public String getPath() {
+      return this.path;
+    }
+
+    /**
+     * Path of the file to be read from.
+     */
+    public readRange_args setPath(String path) {
+      this.path = path;
+      return this;
+    }
+
+    public void unsetPath() {
+      this.path = null;
+    }
+
+    /** Returns true if field path is set (has been asigned a value) and false otherwise */
+    public boolean isSetPath() {
+      return this.path != null;
+    }
+
+    public void setPathIsSet(boolean value) {
+      if (!value) {
+        this.path = null;
+      }
+    }
+
+    /**
+     * Offset within the file where read must start from.
+     */
+    public long getOffset() {
+      return this.offset;
+    }
+
+    /**
+     * Offset within the file where read must start from.
+     */
+    public readRange_args setOffset(long offset) {
+      this.offset = offset;
+      setOffsetIsSet(true);
+      return this;
+    }
+
+    public void unsetOffset() {
+      __isset_bit_vector.clear(__OFFSET_ISSET_ID);
+    }
+
+    /** Returns true if field offset is set (has been asigned a value) and false otherwise */
+    public boolean isSetOffset() {
+      return __isset_bit_vector.get(__OFFSET_ISSET_ID);
+    }
+
+    public void setOffsetIsSet(boolean value) {
+      __isset_bit_vector.set(__OFFSET_ISSET_ID, value);
+    }
+
+    /**
+     * Number of bytes to read.
+     */
+    public int getLength() {
+      return this.length;
+    }
+
+    /**
+     * Number of bytes to read.
+     */
+    public readRange_args setLength(int length) {
+      this.length = length;
+      setLengthIsSet(true);
+      return this;
+    }
+
+    public void unsetLength() {
+      __isset_bit_vector.clear(__LENGTH_ISSET_ID);
+    }
+
+    /** Returns true if field length is set (has been asigned a value) and false otherwise */
+    public boolean isSetLength() {
+      return __isset_bit_vector.get(__LENGTH_ISSET_ID);
+    }
+
+    public void setLengthIsSet(boolean value) {
+      __isset_bit_vector.set(__LENGTH_ISSET_ID, value);
+    }
+
+    /**
+     * Don't compute the CRC32 of the data, for clients
+     * that don't check it.
+     */
+    public boolean isSkipCrc() {
+      return this.skipCrc;
+    }
+
+    /**
+     * Don't compute the CRC32 of the data, for clients
+     * that don't check it.
+     */
+    public readRange_args setSkipCrc(boolean skipCrc) {
+      this.skipCrc = skipCrc;
+      setSkipCrcIsSet(true);
+      return this;
+    }
+
+    public void unsetSkipCrc() {
+      __isset_bit_vector.clear(__SKIPCRC_ISSET_ID);
+    }
+
+    /** Returns true if field skipCrc is set (has been asigned a value) and false otherwise */
+    public boolean isSetSkipCrc() {
+      return __isset_bit_vector.get(__SKIPCRC_ISSET_ID);
+    }
+
+    public void setSkipCrcIsSet(boolean value) {
+      __isset_bit_vector.set(__SKIPCRC_ISSET_ID, value);
+    }
+
+    public void setFieldValue(_Fields field, Object value) {
+      switch (field) {
+      case CTX:
+        if (value == null) {
+          unsetCtx();
+        } else {
+          setCtx((org.apache.hadoop.thriftfs.api.RequestContext)value);
+        }
+        break;
+
+      case PATH:
+        if (value == null) {
+          unsetPath();
+        } else {
+          setPath((String)value);
+        }
+        break;
+
+      case OFFSET:
+        if (value == null) {
+          unsetOffset();
+        } else {
+          setOffset((Long)value);
+        }
+        break;
+
+      case LENGTH:
+        if (value == null) {
+          unsetLength();
+        } else {
+          setLength((Integer)value);
+        }
+        break;
+
+      case SKIP_CRC:
+        if (value == null) {
+          unsetSkipCrc();
+        } else {
+          setSkipCrc((Boolean)value);
+        }
+        break;
+
+      }
+    }
+
+    public void setFieldValue(int fieldID, Object value) {
+      setFieldValue(_Fields.findByThriftIdOrThrow(fieldID), value);
+    }
+
+    public Object getFieldValue(_Fields field) {
+      switch (field) {
+      case CTX:
+        return getCtx();
+
+      case PATH:
+        return getPath();
+
+      case OFFSET:
+        return new Long(getOffset());
+
+      case LENGTH:
+        return new Integer(getLength());
+
+      case SKIP_CRC:
+        return new Boolean(isSkipCrc());
+
+      }
+      throw new IllegalStateException();
+    }
+
+    public Object getFieldValue(int fieldId) {
+      return getFieldValue(_Fields.findByThriftIdOrThrow(fieldId));
+    }
+
+    /** Returns true if field corresponding to fieldID is set (has been asigned a value) and false otherwise */
+    public boolean isSet(_Fields field) {
+      switch (field) {
+      case CTX:
+        return isSetCtx();
+      case PATH:
+        return isSetPath();
+      case OFFSET:
+        return isSetOffset();
+      case LENGTH:
+        return isSetLength();
+      case SKIP_CRC:
+        return isSetSkipCrc();
+      }
+      throw new IllegalStateException();
+    }
+
+    public boolean isSet(int fieldID) {
+      return isSet(_Fields.findByThriftIdOrThrow(fieldID));
+    }
+
+    @Override
+    public boolean equals(Object that) {
+      if (that == null)
+        return false;
+      if (that instanceof readRange_args)
+        return this.equals((readRange_args)that);
+      return false;
+    }
+
+    public boolean equals(readRange_args that) {
+      if (that == null)
+        return false;
+
+      boolean this_present_ctx = true && this.isSetCtx();
+      boolean that_present_ctx = true && that.isSetCtx();
+      if (this_present_ctx || that_present_ctx) {
+        if (!(this_present_ctx && that_present_ctx))
+          return false;
+        if (!this.ctx.equals(that.ctx))
+          return false;
+      }
+
+      boolean this_present_path = true && this.isSetPath();
+      boolean that_present_path = true && that.isSetPath();
+      if (this_present_path || that_present_path) {
+        if (!(this_present_path && that_present_path))
+          return false;
+        if (!this.path.equals(that.path))
+          return false;
+      }
+
+      boolean this_present_offset = true;
+      boolean that_present_offset = true;
+      if (this_present_offset || that_present_offset) {
+        if (!(this_present_offset && that_present_offset))
+          return false;
+        if (this.offset != that.offset)
+          return false;
+      }
+
+      boolean this_present_length = true;
+      boolean that_present_length = true;
+      if (this_present_length || that_present_length) {
+        if (!(this_present_length && that_present_length))
+          return false;
+        if (this.length != that.length)
+          return false;
+      }
+
+      boolean this_present_skipCrc = true;
+      boolean that_present_skipCrc = true;
+      if (this_present_skipCrc || that_present_skipCrc) {
+        if (!(this_present_skipCrc && that_present_skipCrc))
+          return false;
+        if (this.skipCrc != that.skipCrc)
+          return false;
+      }
+
+      return true;
+    }
+
+    @Override
+    public int hashCode() {
+      return 0;
+    }
+
+    public void read(TProtocol iprot) throws TException {
+      TField field;
+      iprot.readStructBegin();
+      while (true)
+      {
+        field = iprot.readFieldBegin();
+        if (field.type == TType.STOP) { 
+          break;
+        }
+        _Fields fieldId = _Fields.findByThriftId(field.id);
+        if (fieldId == null) {
+          TProtocolUtil.skip(iprot, field.type);
+        } else {
+          switch (fieldId) {
+            case CTX:
+              if (field.type == TType.STRUCT) {
+                this.ctx = new org.apache.hadoop.thriftfs.api.RequestContext();
+                this.ctx.read(iprot);
+              } else { 
+                TProtocolUtil.skip(iprot, field.type);
+              }
+              break;
+            case PATH:
+              if (field.type == TType.STRING) {
+                this.path = iprot.readString();
+              } else { 
+                TProtocolUtil.skip(iprot, field.type);
+              }
+              break;
+            case OFFSET:
+              if (field.type == TType.I64) {
+                this.offset = iprot.readI64();
+                setOffsetIsSet(true);
+              } else { 
+                TProtocolUtil.skip(iprot, field.type);
+              }
+              break;
+            case LENGTH:
+              if (field.type == TType.I32) {
+                this.length = iprot.readI32();
+                setLengthIsSet(true);
+              } else { 
+                TProtocolUtil.skip(iprot, field.type);
+              }
+              break;
+            case SKIP_CRC:
+              if (field.type == TType.BOOL) {
+                this.skipCrc = iprot.readBool();
+                setSkipCrcIsSet(true);
+              } else { 
+                TProtocolUtil.skip(iprot, field.type);
+              }
+              break;
+          }
+          iprot.readFieldEnd();
+        }
+      }
+      iprot.readStructEnd();
+
+      // check for required fields of primitive type, which can't be checked in the validate method
+      validate();
+    }
+
+    public void write(TProtocol oprot) throws TException {
+      validate();
+
+      oprot.writeStructBegin(STRUCT_DESC);
+      if (this.path != null) {
+        oprot.writeFieldBegin(PATH_FIELD_DESC);
+        oprot.writeString(this.path);
+        oprot.writeFieldEnd();
+      }
+      oprot.writeFieldBegin(OFFSET_FIELD_DESC);
+      oprot.writeI64(this.offset);
+      oprot.writeFieldEnd();
+      oprot.writeFieldBegin(LENGTH_FIELD_DESC);
+      oprot.writeI32(this.length);
+      oprot.writeFieldEnd();
+      oprot.writeFieldBegin(SKIP_CRC_FIELD_DESC);
+      oprot.writeBool(this.skipCrc);
+      oprot.writeFieldEnd();
+      if (this.ctx != null) {
+        oprot.writeFieldBegin(CTX_FIELD_DESC);
+        this.ctx.write(oprot);
+        oprot.writeFieldEnd();
+      }
+      oprot.writeFieldStop();
+      oprot.writeStructEnd();
+    }
+
+    @Override
+    public String toString() {
+      StringBuilder sb = new StringBuilder("readRange_args(");
+      boolean first = true;
+
+      sb.append("ctx:");
+      if (this.ctx == null) {
+        sb.append("null");
+      } else {
+        sb.append(this.ctx);
+      }
+      first = false;
+      if (!first) sb.append(", ");
+      sb.append("path:");
+      if (this.path == null) {
+        sb.append("null");
+      } else {
+        sb.append(this.path);
+      }
+      first = false;
+      if (!first) sb.append(", ");
+      sb.append("offset:");
+      sb.append(this.offset);
+      first = false;
+      if (!first) sb.append(", ");
+      sb.append("length:");
+      sb.append(this.length);
+      first = false;
+      if (!first) sb.append(", ");
+      sb.append("skipCrc:");
+      sb.append(this.skipCrc);
+      first = false;
+      sb.append(")");
+      return sb.toString();
+    }
+
+    public void validate() throws TException {
+      // check for required fields
+    }
+
+  }
+
+  public static class readRange_result implements TBase<readRange_result._Fields>, java.io.Serializable, Cloneable, Comparable<readRange_result>   {
+    private static final TStruct STRUCT_DESC = new TStruct("readRange_result");
+
+    private static final TField SUCCESS_FIELD_DESC = new TField("success", TType.STRUCT, (short)0);
+    private static final TField ERR_FIELD_DESC = new TField("err", TType.STRUCT, (short)1);
+
+    public BlockData success;
+    public org.apache.hadoop.thriftfs.api.IOException err;
+
+    /** The set of fields this struct contains, along with convenience methods for finding and manipulating them. */
+    public enum _Fields implements TFieldIdEnum {
+      SUCCESS((short)0, "success"),
+      ERR((short)1, "err");
+
+      private static final Map<Integer, _Fields> byId = new HashMap<Integer, _Fields>();
+      private static final Map<String, _Fields> byName = new HashMap<String, _Fields>();
+
+      static {
+        for (_Fields field : EnumSet.allOf(_Fields.class)) {
+          byId.put((int)field._thriftId, field);
+          byName.put(field.getFieldName(), field);
+        }
+      }
+
+      /**
+       * Find the _Fields constant that matches fieldId, or null if its not found.
+       */
+      public static _Fields findByThriftId(int fieldId) {
+        return byId.get(fieldId);
+      }
+
+      /**
+       * Find the _Fields constant that matches fieldId, throwing an exception
+       * if it is not found.
+       */
+      public static _Fields findByThriftIdOrThrow(int fieldId) {
+        _Fields fields = findByThriftId(fieldId);
+        if (fields == null) throw new IllegalArgumentException("Field " + fieldId + " doesn't exist!");
+        return fields;
+      }
+
+      /**
+       * Find the _Fields constant that matches name, or null if its not found.
+       */
+      public static _Fields findByName(String name) {
+        return byName.get(name);
+      }
+
+      private final short _thriftId;
+      private final String _fieldName;
+
+      _Fields(short thriftId, String fieldName) {
+        _thriftId = thriftId;
+        _fieldName = fieldName;
+      }
+
+      public short getThriftFieldId() {
+        return _thriftId;
+      }
+
+      public String getFieldName() {
+        return _fieldName;
+      }
+    }
+
+    // isset id assignments
+
+    public static final Map<_Fields, FieldMetaData> metaDataMap = Collections.unmodifiableMap(new EnumMap<_Fields, FieldMetaData>(_Fields.class) {{
+      put(_Fields.SUCCESS, new FieldMetaData("success", TFieldRequirementType.DEFAULT, 
+          new StructMetaData(TType.STRUCT, BlockData.class)));
+      put(_Fields.ERR, new FieldMetaData("err", TFieldRequirementType.DEFAULT, 
+          new FieldValueMetaData(TType.STRUCT)));
+    }});
+
+    static {
+      FieldMetaData.addStructMetaDataMap(readRange_result.class, metaDataMap);
+    }
+
+    public readRange_result() {
+    }
+
+    public readRange_result(
+      BlockData success,
+      org.apache.hadoop.thriftfs.api.IOException err)
+    {
+      this();
+      this.success = success;
+      this.err = err;
+    }
+
+    /**
+     * Performs a deep copy on <i>other</i>.
+     */
+    public readRange_result(readRange_result other) {
+      if (other.isSetSuccess()) {
+        this.success = new BlockData(other.success);
+      }
+      if (other.isSetErr()) {
+        this.err = new org.apache.hadoop.thriftfs.api.IOException(other.err);
+      }
+    }
+
+    public readRange_result deepCopy() {
+      return new readRange_result(this);
+    }
+
+    @Deprecated
+    public readRange_result clone() {
+      return new readRange_result(this);
+    }
+
+    public BlockData getSuccess() {
+      return this.success;
+    }
+
+    public readRange_result setSuccess(BlockData success) {
+      this.success = success;
+      return this;
+    }
+
+    public void unsetSuccess() {
+      this.success = null;
+    }
+
+    /** Returns true if field success is set (has been asigned a value) and false otherwise */
+    public boolean isSetSuccess() {
+      return this.success != null;
+    }
+
+    public void setSuccessIsSet(boolean value) {
+      if (!value) {
+        this.success = null;
+      }
+    }
+
+    public org.apache.hadoop.thriftfs.api.IOException getErr() {
+      return this.err;
+    }
+
+    public readRange_result setErr(org.apache.hadoop.thriftfs.api.IOException err) {
+      this.err = err;
+      return this;
+    }
+
+    public void unsetErr() {
+      this.err = null;
+    }
+
+    /** Returns true if field err is set (has been asigned a value) and false otherwise */
+    public boolean isSetErr() {
+      return this.err != null;
+    }
+
+    public void setErrIsSet(boolean value) {
+      if (!value) {
+        this.err = null;
+      }
+    }
+
+    public void setFieldValue(_Fields field, Object value) {
+      switch (field) {
+      case SUCCESS:
+        if (value == null) {
+          unsetSuccess();
+        } else {
+          setSuccess((BlockData)value);
+        }
+        break;
+
+      case ERR:
+        if (value == null) {
+          unsetErr();
+        } else {
+          setErr((org.apache.hadoop.thriftfs.api.IOException)value);
+        }
+        break;
+
+      }
+    }
+
+    public void setFieldValue(int fieldID, Object value) {
+      setFieldValue(_Fields.findByThriftIdOrThrow(fieldID), value);
+    }
+
+    public Object getFieldValue(_Fields field) {
+      switch (field) {
+      case SUCCESS:
+        return getSuccess();
+
+      case ERR:
+        return getErr();
+
+      }
+      throw new IllegalStateException();
+    }
+
+    public Object getFieldValue(int fieldId) {
+      return getFieldValue(_Fields.findByThriftIdOrThrow(fieldId));
+    }
+
+    /** Returns true if field corresponding to fieldID is set (has been asigned a value) and false otherwise */
+    public boolean isSet(_Fields field) {
+      switch (field) {
+      case SUCCESS:
+        return isSetSuccess();
+      case ERR:
+        return isSetErr();
+      }
+      throw new IllegalStateException();
+    }
+
+    public boolean isSet(int fieldID) {
+      return isSet(_Fields.findByThriftIdOrThrow(fieldID));
+    }
+
+    @Override
+    public boolean equals(Object that) {
+      if (that == null)
+        return false;
+      if (that instanceof readRange_result)
+        return this.equals((readRange_result)that);
+      return false;
+    }
+
+    public boolean equals(readRange_result that) {
+      if (that == null)
+        return false;
+
+      boolean this_present_success = true && this.isSetSuccess();
+      boolean that_present_success = true && that.isSetSuccess();
+      if (this_present_success || that_present_success) {
+        if (!(this_present_success && that_present_success))
+          return false;
+        if (!this.success.equals(that.success))
+          return false;
+      }
+
+      boolean this_present_err = true && this.isSetErr();
+      boolean that_present_err = true && that.isSetErr();
+      if (this_present_err || that_present_err) {
+        if (!(this_present_err && that_present_err))
+          return false;
+        if (!this.err.equals(that.err))
+          return false;
+      }
+
+      return true;
+    }
+
+    @Override
+    public int hashCode() {
+      return 0;
+    }
+
+    public int compareTo(readRange_result other) {
+      if (!getClass().equals(other.getClass())) {
+        return getClass().getName().compareTo(other.getClass().getName());
+      }
+
+      int lastComparison = 0;
+      readRange_result typedOther = (readRange_result)other;
+
+      lastComparison = Boolean.valueOf(isSetSuccess()).compareTo(isSetSuccess());
+      if (lastComparison != 0) {
+        return lastComparison;
+      }
+      lastComparison = TBaseHelper.compareTo(success, typedOther.success);
+      if (lastComparison != 0) {
+        return lastComparison;
+      }
+      lastComparison = Boolean.valueOf(isSetErr()).compareTo(isSetErr());
+      if (lastComparison != 0) {
+        return lastComparison;
+      }
+      lastComparison = TBaseHelper.compareTo(err, typedOther.err);
+      if (lastComparison != 0) {
+        return lastComparison;
+      }
+      return 0;
+    }
+
+    public void read(TProtocol iprot) throws TException {
+      TField field;
+      iprot.readStructBegin();
+      while (true)
+      {
+        field = iprot.readFieldBegin();
+        if (field.type == TType.STOP) { 
+          break;
+        }
+        _Fields fieldId = _Fields.findByThriftId(field.id);
+        if (fieldId == null) {
+          TProtocolUtil.skip(iprot, field.type);
+        } else {
+          switch (fieldId) {
+            case SUCCESS:
+              if (field.type == TType.STRUCT) {
+                this.success = new BlockData();
+                this.success.read(iprot);
+              } else { 
+                TProtocolUtil.skip(iprot, field.type);
+              }
+              break;
+            case ERR:
+              if (field.type == TType.STRUCT) {
+                this.err = new org.apache.hadoop.thriftfs.api.IOException();
+                this.err.read(iprot);
+              } else { 
+                TProtocolUtil.skip(iprot, field.type);
+              }
+              break;
+          }
+          iprot.readFieldEnd();
+        }
+      }
+      iprot.readStructEnd();
+
+      // check for required fields of primitive type, which can't be checked in the validate method
+      validate();
+    }
+
+    public void write(TProtocol oprot) throws TException {
+      oprot.writeStructBegin(STRUCT_DESC);
+
+      if (this.isSetSuccess()) {
+        oprot.writeFieldBegin(SUCCESS_FIELD_DESC);
+        this.success.write(oprot);
+        oprot.writeFieldEnd();
+      } else if (this.isSetErr()) {
+        oprot.writeFieldBegin(ERR_FIELD_DESC);
+        this.err.write(oprot);
+        oprot.writeFieldEnd();
+      }
+      oprot.writeFieldStop();
+      oprot.writeStructEnd();
+    }
+
+    @Override
+    public String toString() {
+      StringBuilder sb = new StringBuilder("readRange_result(");
+      boolean first = true;
+
+      sb.append("success:");
+      if (this.success == null) {
+        sb.append("null");
+      } else {
+        sb.append(this.success);
+      }
+      first = false;
+      if (!first) sb.append(", ");
+      sb.append("err:");
+      if (this.err == null) {
+        sb.append("null");
+      } else {
+        sb.append(this.err);
+      }
+      first = false;
+      sb.append(")");
+      return sb.toString();
+    }
+
+    public void validate() throws TException {
+      // check for required fields
+    }
+
+  }
+
 }
@@ -59,6 +59,14 @@ public class Jobtracker {
      */
     public ThriftJobInProgress getJob(org.apache.hadoop.thriftfs.api.RequestContext ctx, ThriftJobID jobID) throws JobNotFoundException, TException;
 
+    /**
+     * Get a job by ID, without its task list (see getTopTasks)
+     * 
+     * @param ctx
+     * @param jobID
+     */
+    public ThriftJobInProgress getJobNoTasks(org.apache.hadoop.thriftfs.api.RequestContext ctx, ThriftJobID jobID) throws JobNotFoundException, TException;
+
     /**
      * Get a list of currently running jobs
      * 
@@ -94,6 +102,29 @@ public class Jobtracker {
      */
     public ThriftJobList getAllJobs(org.apache.hadoop.thriftfs.api.RequestContext ctx) throws TException;
 
+    /**
+     * Get the summaries of one page of the jobs matching a filter, in
+     * the given order. numTotalJobs of the result is the number of
+     * matching jobs. A negative limit means no limit.
+     * 
+     * @param ctx
+     * @param filter
+     * @param sort
+     * @param offset
+     * @param limit
+     */
+    public ThriftJobSummaryList getJobSummaries(org.apache.hadoop.thriftfs.api.RequestContext ctx, ThriftJobFilter filter, ThriftJobSort sort, int offset, int limit) throws TException;
+
+    /**
+     * Get the jobs whose state or progress changed since token, which
+     * is 0 or the token returned by an earlier call. When nothing has
+     * changed, the result is empty.
+     * 
+     * @param ctx
+     * @param token
+     */
+    public ThriftJobChanges getJobsChangedSince(org.apache.hadoop.thriftfs.api.RequestContext ctx, long token) throws TException;
+
     /**
      * Get the count of jobs by status for a given user
      * 
@@ -115,6 +146,43 @@ public class Jobtracker {
      */
     public ThriftTaskInProgressList getTaskList(org.apache.hadoop.thriftfs.api.RequestContext ctx, ThriftJobID jobID, Set<ThriftTaskType> types, Set<ThriftTaskQueryState> states, String text, int count, int offset) throws JobNotFoundException, TException;
 
+    /**
+     * Get the count tasks in any of states that started executing last
+     * (or first, unless newestFirst), in that order. numTotalTasks is the
+     * number of tasks in those states.
+     * 
+     * @param ctx
+     * @param jobID
+     * @param states
+     * @param count
+     * @param newestFirst
+     */
+    public ThriftTaskInProgressList getTopTasks(org.apache.hadoop.thriftfs.api.RequestContext ctx, ThriftJobID jobID, Set<ThriftTaskQueryState> states, int count, boolean newestFirst) throws JobNotFoundException, TException;
+
+    /**
+     * Get count tasks from cursor (empty for the first page) on, of
+     * the tasks that match a filter, as per getTaskList. The matching
+     * tasks are kept for a while, so that getting the next pages
+     * doesn't filter every task of the job again.
+     * 
+     * @param ctx
+     * @param jobID
+     * @param types
+     * @param states
+     * @param text
+     * @param cursor
+     * @param count
+     */
+    public ThriftTaskPage getTaskPage(org.apache.hadoop.thriftfs.api.RequestContext ctx, ThriftJobID jobID, Set<ThriftTaskType> types, Set<ThriftTaskQueryState> states, String text, String cursor, int count) throws JobNotFoundException, TException;
+
+    /**
+     * Get the start and finish times of every task of a job
+     * 
+     * @param ctx
+     * @param jobID
+     */
+    public ThriftTaskTimeline getTaskTimeline(org.apache.hadoop.thriftfs.api.RequestContext ctx, ThriftJobID jobID) throws JobNotFoundException, TException;
+
     /**
      * Get details of a task
      * 
@@ -362,6 +430,43 @@ public class Jobtracker {
       throw new TApplicationException(TApplicationException.MISSING_RESULT, "getJob failed: unknown result");
     }
 
+    public ThriftJobInProgress getJobNoTasks(org.apache.hadoop.thriftfs.api.RequestContext ctx, ThriftJobID jobID) throws JobNotFoundException, TException
+    {
+      send_getJobNoTasks(ctx, jobID);
+      return recv_getJobNoTasks();
+    }
+
+    public void send_getJobNoTasks(org.apache.hadoop.thriftfs.api.RequestContext ctx, ThriftJobID jobID) throws TException
+    {
+      oprot_.writeMessageBegin(new TMessage("getJobNoTasks", TMessageType.CALL, seqid_));
+      getJobNoTasks_args args = new getJobNoTasks_args();
+      args.ctx = ctx;
+      args.jobID = jobID;
+      args.write(oprot_);
+      oprot_.writeMessageEnd();
+      oprot_.getTransport().flush();
+    }
+
+    public ThriftJobInProgress recv_getJobNoTasks() throws JobNotFoundException, TException
+    {
+      TMessage msg = iprot_.readMessageBegin();
+      if (msg.type == TMessageType.EXCEPTION) {
+        TApplicationException x = TApplicationException.read(iprot_);
+        iprot_.readMessageEnd();
+        throw x;
+      }
+      getJobNoTasks_result result = new getJobNoTasks_result();
+      result.read(iprot_);
+      iprot_.readMessageEnd();
+      if (result.isSetSuccess()) {
+        return result.success;
+      }
+      if (result.err != null) {
+        throw result.err;
+      }
+      throw new TApplicationException(TApplicationException.MISSING_RESULT, "getJobNoTasks failed: unknown result");
+    }
+
     public ThriftJobList getRunningJobs(org.apache.hadoop.thriftfs.api.RequestContext ctx) throws TException
     {
       send_getRunningJobs(ctx);
@@ -527,6 +632,77 @@ public class Jobtracker {
       throw new TApplicationException(TApplicationException.MISSING_RESULT, "getAllJobs failed: unknown result");
     }
 
+    public ThriftJobSummaryList getJobSummaries(org.apache.hadoop.thriftfs.api.RequestContext ctx, ThriftJobFilter filter, ThriftJobSort sort, int offset, int limit) throws TException
+    {
+      send_getJobSummaries(ctx, filter, sort, offset, limit);
+      return recv_getJobSummaries();
+    }
+
+    public void send_getJobSummaries(org.apache.hadoop.thriftfs.api.RequestContext ctx, ThriftJobFilter filter, ThriftJobSort sort, int offset, int limit) throws TException
+    {
+      oprot_.writeMessageBegin(new TMessage("getJobSummaries", TMessageType.CALL, seqid_));
+      getJobSummaries_args args = new getJobSummaries_args();
+      args.ctx = ctx;
+      args.filter = filter;
+      args.sort = sort;
+      args.offset = offset;
+      args.limit = limit;
+      args.write(oprot_);
+      oprot_.writeMessageEnd();
+      oprot_.getTransport().flush();
+    }
+
+    public ThriftJobSummaryList recv_getJobSummaries() throws TException
+    {
+      TMessage msg = iprot_.readMessageBegin();
+      if (msg.type == TMessageType.EXCEPTION) {
+        TApplicationException x = TApplicationException.read(iprot_);
+        iprot_.readMessageEnd();
+        throw x;
+      }
+      getJobSummaries_result result = new getJobSummaries_result();
+      result.read(iprot_);
+      iprot_.readMessageEnd();
+      if (result.isSetSuccess()) {
+        return result.success;
+      }
+      throw new TApplicationException(TApplicationException.MISSING_RESULT, "getJobSummaries failed: unknown result");
+    }
+
+    public ThriftJobChanges getJobsChangedSince(org.apache.hadoop.thriftfs.api.RequestContext ctx, long token) throws TException
+    {
+      send_getJobsChangedSince(ctx, token);
+      return recv_getJobsChangedSince();
+    }
+
+    public void send_getJobsChangedSince(org.apache.hadoop.thriftfs.api.RequestContext ctx, long token) throws TException
+    {
+      oprot_.writeMessageBegin(new TMessage("getJobsChangedSince", TMessageType.CALL, seqid_));
+      getJobsChangedSince_args args = new getJobsChangedSince_args();
+      args.ctx = ctx;
+      args.token = token;
+      args.write(oprot_);
+      oprot_.writeMessageEnd();
+      oprot_.getTransport().flush();
+    }
+
+    public ThriftJobChanges recv_getJobsChangedSince() throws TException
+    {
+      TMessage msg = iprot_.readMessageBegin();
+      if (msg.type == TMessageType.EXCEPTION) {
+        TApplicationException x = TApplicationException.read(iprot_);
+        iprot_.readMessageEnd();
+        throw x;
+      }
+      getJobsChangedSince_result result = new getJobsChangedSince_result();
+      result.read(iprot_);
+      iprot_.readMessageEnd();
+      if (result.isSetSuccess()) {
+        return result.success;
+      }
+      throw new TApplicationException(TApplicationException.MISSING_RESULT, "getJobsChangedSince failed: unknown result");
+    }
+
     public ThriftUserJobCounts getUserJobCounts(org.apache.hadoop.thriftfs.api.RequestContext ctx, String user) throws TException
     {
       send_getUserJobCounts(ctx, user);
@@ -603,6 +779,125 @@ public class Jobtracker {
       throw new TApplicationException(TApplicationException.MISSING_RESULT, "getTaskList failed: unknown result");
     }
 
+    public ThriftTaskInProgressList getTopTasks(org.apache.hadoop.thriftfs.api.RequestContext ctx, ThriftJobID jobID, Set<ThriftTaskQueryState> states, int count, boolean newestFirst) throws JobNotFoundException, TException
+    {
+      send_getTopTasks(ctx, jobID, states, count, newestFirst);
+      return recv_getTopTasks();
+    }
+
+    public void send_getTopTasks(org.apache.hadoop.thriftfs.api.RequestContext ctx, ThriftJobID jobID, Set<ThriftTaskQueryState> states, int count, boolean newestFirst) throws TException
+    {
+      oprot_.writeMessageBegin(new TMessage("getTopTasks", TMessageType.CALL, seqid_));
+      getTopTasks_args args = new getTopTasks_args();
+      args.ctx = ctx;
+      args.jobID = jobID;
+      args.states = states;
+      args.count = count;
+      args.newestFirst = newestFirst;
+      args.write(oprot_);
+      oprot_.writeMessageEnd();
+      oprot_.getTransport().flush();
+    }
+
+    public ThriftTaskInProgressList recv_getTopTasks() throws JobNotFoundException, TException
+    {
+      TMessage msg = iprot_.readMessageBegin();
+      if (msg.type == TMessageType.EXCEPTION) {
+        TApplicationException x = TApplicationException.read(iprot_);
+        iprot_.readMessageEnd();
+        throw x;
+      }
+      getTopTasks_result result = new getTopTasks_result();
+      result.read(iprot_);
+      iprot_.readMessageEnd();
+      if (result.isSetSuccess()) {
+        return result.success;
+      }
+      if (result.err != null) {
+        throw result.err;
+      }
+      throw new TApplicationException(TApplicationException.MISSING_RESULT, "getTopTasks failed: unknown result");
+    }
+
+    public ThriftTaskPage getTaskPage(org.apache.hadoop.thriftfs.api.RequestContext ctx, ThriftJobID jobID, Set<ThriftTaskType> types, Set<ThriftTaskQueryState> states, String text, String cursor, int count) throws JobNotFoundException, TException
+    {
+      send_getTaskPage(ctx, jobID, types, states, text, cursor, count);
+      return recv_getTaskPage();
+    }
+
+    public void send_getTaskPage(org.apache.hadoop.thriftfs.api.RequestContext ctx, ThriftJobID jobID, Set<ThriftTaskType> types, Set<ThriftTaskQueryState> states, String text, String cursor, int count) throws TException
+    {
+      oprot_.writeMessageBegin(new TMessage("getTaskPage", TMessageType.CALL, seqid_));
+      getTaskPage_args args = new getTaskPage_args();
+      args.ctx = ctx;
+      args.jobID = jobID;
+      args.types = types;
+      args.states = states;
+      args.text = text;
+      args.cursor = cursor;
+      args.count = count;
+      args.write(oprot_);
+      oprot_.writeMessageEnd();
+      oprot_.getTransport().flush();
+    }
+
+    public ThriftTaskPage recv_getTaskPage() throws JobNotFoundException, TException
+    {
+      TMessage msg = iprot_.readMessageBegin();
+      if (msg.type == TMessageType.EXCEPTION) {
+        TApplicationException x = TApplicationException.read(iprot_);
+        iprot_.readMessageEnd();
+        throw x;
+      }
+      getTaskPage_result result = new getTaskPage_result();
+      result.read(iprot_);
+      iprot_.readMessageEnd();
+      if (result.isSetSuccess()) {
+        return result.success;
+      }
+      if (result.err != null) {
+        throw result.err;
+      }
+      throw new TApplicationException(TApplicationException.MISSING_RESULT, "getTaskPage failed: unknown result");
+    }
+
+    public ThriftTaskTimeline getTaskTimeline(org.apache.hadoop.thriftfs.api.RequestContext ctx, ThriftJobID jobID) throws JobNotFoundException, TException
+    {
+      send_getTaskTimeline(ctx, jobID);
+      return recv_getTaskTimeline();
+    }
+
+    public void send_getTaskTimeline(org.apache.hadoop.thriftfs.api.RequestContext ctx, ThriftJobID jobID) throws TException
+    {
+      oprot_.writeMessageBegin(new TMessage("getTaskTimeline", TMessageType.CALL, seqid_));
+      getTaskTimeline_args args = new getTaskTimeline_args();
+      args.ctx = ctx;
+      args.jobID = jobID;
+      args.write(oprot_);
+      oprot_.writeMessageEnd();
+      oprot_.getTransport().flush();
+    }
+
+    public ThriftTaskTimeline recv_getTaskTimeline() throws JobNotFoundException, TException
+    {
+      TMessage msg = iprot_.readMessageBegin();
+      if (msg.type == TMessageType.EXCEPTION) {
+        TApplicationException x = TApplicationException.read(iprot_);
+        iprot_.readMessageEnd();
+        throw x;
+      }
+      getTaskTimeline_result result = new getTaskTimeline_result();
+      result.read(iprot_);
+      iprot_.readMessageEnd();
+      if (result.isSetSuccess()) {
+        return result.success;
+      }
+      if (result.err != null) {
+        throw result.err;
+      }
+      throw new TApplicationException(TApplicationException.MISSING_RESULT, "getTaskTimeline failed: unknown result");
+    }
+
     public ThriftTaskInProgress getTask(org.apache.hadoop.thriftfs.api.RequestContext ctx, ThriftTaskID taskID) throws JobNotFoundException, TaskNotFoundException, TException
     {
       send_getTask(ctx, taskID);
@@ -1049,13 +1344,19 @@ public class Jobtracker {
       processMap_.put("getClusterStatus", new getClusterStatus());
       processMap_.put("getQueues", new getQueues());
       processMap_.put("getJob", new getJob());
+      processMap_.put("getJobNoTasks", new getJobNoTasks());
       processMap_.put("getRunningJobs", new getRunningJobs());
       processMap_.put("getCompletedJobs", new getCompletedJobs());
       processMap_.put("getFailedJobs", new getFailedJobs());
       processMap_.put("getKilledJobs", new getKilledJobs());
       processMap_.put("getAllJobs", new getAllJobs());
+      processMap_.put("getJobSummaries", new getJobSummaries());
+      processMap_.put("getJobsChangedSince", new getJobsChangedSince());
       processMap_.put("getUserJobCounts", new getUserJobCounts());
       processMap_.put("getTaskList", new getTaskList());
+      processMap_.put("getTopTasks", new getTopTasks());
+      processMap_.put("getTaskPage", new getTaskPage());
+      processMap_.put("getTaskTimeline", new getTaskTimeline());
       processMap_.put("getTask", new getTask());
       processMap_.put("getJobCounters", new getJobCounters());
       processMap_.put("getJobCounterRollups", new getJobCounterRollups());
@@ -1178,6 +1479,34 @@ public class Jobtracker {
 
     }
 
+    private class getJobNoTasks implements ProcessFunction {
+      public void process(int seqid, TProtocol iprot, TProtocol oprot) throws TException
+      {
+        getJobNoTasks_args args = new getJobNoTasks_args();
+        args.read(iprot);
+        iprot.readMessageEnd();
+        getJobNoTasks_result result = new getJobNoTasks_result();
+        try {
+          result.success = iface_.getJobNoTasks(args.ctx, args.jobID);
+        } catch (JobNotFoundException err) {
+          result.err = err;
+        } catch (Throwable th) {
+          LOGGER.error("Internal error processing getJobNoTasks", th);
+          TApplicationException x = new TApplicationException(TApplicationException.INTERNAL_ERROR, "Internal error processing getJobNoTasks");
+          oprot.writeMessageBegin(new TMessage("getJobNoTasks", TMessageType.EXCEPTION, seqid));
+          x.write(oprot);
+          oprot.writeMessageEnd();
+          oprot.getTransport().flush();
+          return;
+        }
+        oprot.writeMessageBegin(new TMessage("getJobNoTasks", TMessageType.REPLY, seqid));
+        result.write(oprot);
+        oprot.writeMessageEnd();
+        oprot.getTransport().flush();
+      }
+
+    }
+
     private class getRunningJobs implements ProcessFunction {
       public void process(int seqid, TProtocol iprot, TProtocol oprot) throws TException
       {
@@ -1258,6 +1587,38 @@ public class Jobtracker {
 
     }
 
+    private class getJobSummaries implements ProcessFunction {
+      public void process(int seqid, TProtocol iprot, TProtocol oprot) throws TException
+      {
+        getJobSummaries_args args = new getJobSummaries_args();
+        args.read(iprot);
+        iprot.readMessageEnd();
+        getJobSummaries_result result = new getJobSummaries_result();
+        result.success = iface_.getJobSummaries(args.ctx, args.filter, args.sort, args.offset, args.limit);
+        oprot.writeMessageBegin(new TMessage("getJobSummaries", TMessageType.REPLY, seqid));
+        result.write(oprot);
+        oprot.writeMessageEnd();
+        oprot.getTransport().flush();
+      }
+
+    }
+
+    private class getJobsChangedSince implements ProcessFunction {
+      public void process(int seqid, TProtocol iprot, TProtocol oprot) throws TException
+      {
+        getJobsChangedSince_args args = new getJobsChangedSince_args();
+        args.read(iprot);
+        iprot.readMessageEnd();
+        getJobsChangedSince_result result = new getJobsChangedSince_result();
+        result.success = iface_.getJobsChangedSince(args.ctx, args.token);
+        oprot.writeMessageBegin(new TMessage("getJobsChangedSince", TMessageType.REPLY, seqid));
+        result.write(oprot);
+        oprot.writeMessageEnd();
+        oprot.getTransport().flush();
+      }
+
+    }
+
     private class getUserJobCounts implements ProcessFunction {
       public void process(int seqid, TProtocol iprot, TProtocol oprot) throws TException
       {
@@ -1302,17 +1663,101 @@ public class Jobtracker {
 
     }
 
-    private class getTask implements ProcessFunction {
+    private class getTopTasks implements ProcessFunction {
       public void process(int seqid, TProtocol iprot, TProtocol oprot) throws TException
       {
-        getTask_args args = new getTask_args();
+        getTopTasks_args args = new getTopTasks_args();
         args.read(iprot);
         iprot.readMessageEnd();
-        getTask_result result = new getTask_result();
+        getTopTasks_result result = new getTopTasks_result();
         try {
-          result.success = iface_.getTask(args.ctx, args.taskID);
-        } catch (JobNotFoundException jnf) {
-          result.jnf = jnf;
+          result.success = iface_.getTopTasks(args.ctx, args.jobID, args.states, args.count, args.newestFirst);
+        } catch (JobNotFoundException err) {
+          result.err = err;
+        } catch (Throwable th) {
+          LOGGER.error("Internal error processing getTopTasks", th);
+          TApplicationException x = new TApplicationException(TApplicationException.INTERNAL_ERROR, "Internal error processing getTopTasks");
+          oprot.writeMessageBegin(new TMessage("getTopTasks", TMessageType.EXCEPTION, seqid));
+          x.write(oprot);
+          oprot.writeMessageEnd();
+          oprot.getTransport().flush();
+          return;
+        }
+        oprot.writeMessageBegin(new TMessage("getTopTasks", TMessageType.REPLY, seqid));
+        result.write(oprot);
+        oprot.writeMessageEnd();
+        oprot.getTransport().flush();
+      }
+
+    }
+
+    private class getTaskPage implements ProcessFunction {
+      public void process(int seqid, TProtocol iprot, TProtocol oprot) throws TException
+      {
+        getTaskPage_args args = new getTaskPage_args();
+        args.read(iprot);
+        iprot.readMessageEnd();
+        getTaskPage_result result = new getTaskPage_result();
+        try {
+          result.success = iface_.getTaskPage(args.ctx, args.jobID, args.types, args.states, args.text, args.cursor, args.count);
+        } catch (JobNotFoundException err) {
+          result.err = err;
+        } catch (Throwable th) {
+          LOGGER.error("Internal error processing getTaskPage", th);
+          TApplicationException x = new TApplicationException(TApplicationException.INTERNAL_ERROR, "Internal error processing getTaskPage");
+          oprot.writeMessageBegin(new TMessage("getTaskPage", TMessageType.EXCEPTION, seqid));
+          x.write(oprot);
+          oprot.writeMessageEnd();
+          oprot.getTransport().flush();
+          return;
+        }
+        oprot.writeMessageBegin(new TMessage("getTaskPage", TMessageType.REPLY, seqid));
+        result.write(oprot);
+        oprot.writeMessageEnd();
+        oprot.getTransport().flush();
+      }
+
+    }
+
+    private class getTaskTimeline implements ProcessFunction {
+      public void process(int seqid, TProtocol iprot, TProtocol oprot) throws TException
+      {
+        getTaskTimeline_args args = new getTaskTimeline_args();
+        args.read(iprot);
+        iprot.readMessageEnd();
+        getTaskTimeline_result result = new getTaskTimeline_result();
+        try {
+          result.success = iface_.getTaskTimeline(args.ctx, args.jobID);
+        } catch (JobNotFoundException err) {
+          result.err = err;
+        } catch (Throwable th) {
+          LOGGER.error("Internal error processing getTaskTimeline", th);
+          TApplicationException x = new TApplicationException(TApplicationException.INTERNAL_ERROR, "Internal error processing getTaskTimeline");
+          oprot.writeMessageBegin(new TMessage("getTaskTimeline", TMessageType.EXCEPTION, seqid));
+          x.write(oprot);
+          oprot.writeMessageEnd();
+          oprot.getTransport().flush();
+          return;
+        }
+        oprot.writeMessageBegin(new TMessage("getTaskTimeline", TMessageType.REPLY, seqid));
+        result.write(oprot);
+        oprot.writeMessageEnd();
+        oprot.getTransport().flush();
+      }
+
+    }
+
+    private class getTask implements ProcessFunction {
+      public void process(int seqid, TProtocol iprot, TProtocol oprot) throws TException
+      {
+        getTask_args args = new getTask_args();
+        args.read(iprot);
+        iprot.readMessageEnd();
+        getTask_result result = new getTask_result();
+        try {
+          result.success = iface_.getTask(args.ctx, args.taskID);
+        } catch (JobNotFoundException jnf) {
+          result.jnf = jnf;
         } catch (TaskNotFoundException tnf) {
           result.tnf = tnf;
         } catch (Throwable th) {
@@ -4012,16 +4457,19 @@ public class Jobtracker {
 
   }
 
-  public static class getRunningJobs_args implements TBase<getRunningJobs_args._Fields>, java.io.Serializable, Cloneable   {
-    private static final TStruct STRUCT_DESC = new TStruct("getRunningJobs_args");
+  public static class getJobNoTasks_args implements TBase<getJobNoTasks_args._Fields>, java.io.Serializable, Cloneable   {
+    private static final TStruct STRUCT_DESC = new TStruct("getJobNoTasks_args");
 
     private static final TField CTX_FIELD_DESC = new TField("ctx", TType.STRUCT, (short)10);
+    private static final TField JOB_ID_FIELD_DESC = new TField("jobID", TType.STRUCT, (short)1);
 
     public org.apache.hadoop.thriftfs.api.RequestContext ctx;
+    public ThriftJobID jobID;
 
     /** The set of fields this struct contains, along with convenience methods for finding and manipulating them. */
     public enum _Fields implements TFieldIdEnum {
-      CTX((short)10, "ctx");
+      CTX((short)10, "ctx"),
+      JOB_ID((short)1, "jobID");
 
       private static final Map<Integer, _Fields> byId = new HashMap<Integer, _Fields>();
       private static final Map<String, _Fields> byName = new HashMap<String, _Fields>();
@@ -4079,45 +4527,52 @@ public class Jobtracker {
     public static final Map<_Fields, FieldMetaData> metaDataMap = Collections.unmodifiableMap(new EnumMap<_Fields, FieldMetaData>(_Fields.class) {{
       put(_Fields.CTX, new FieldMetaData("ctx", TFieldRequirementType.DEFAULT, 
           new StructMetaData(TType.STRUCT, org.apache.hadoop.thriftfs.api.RequestContext.class)));
+      put(_Fields.JOB_ID, new FieldMetaData("jobID", TFieldRequirementType.DEFAULT, 
+          new StructMetaData(TType.STRUCT, ThriftJobID.class)));
     }});
 
     static {
-      FieldMetaData.addStructMetaDataMap(getRunningJobs_args.class, metaDataMap);
+      FieldMetaData.addStructMetaDataMap(getJobNoTasks_args.class, metaDataMap);
     }
 
-    public getRunningJobs_args() {
+    public getJobNoTasks_args() {
     }
 
-    public getRunningJobs_args(
-      org.apache.hadoop.thriftfs.api.RequestContext ctx)
+    public getJobNoTasks_args(
+      org.apache.hadoop.thriftfs.api.RequestContext ctx,
+      ThriftJobID jobID)
     {
       this();
       this.ctx = ctx;
+      this.jobID = jobID;
     }
 
     /**
      * Performs a deep copy on <i>other</i>.
      */
-    public getRunningJobs_args(getRunningJobs_args other) {
+    public getJobNoTasks_args(getJobNoTasks_args other) {
       if (other.isSetCtx()) {
         this.ctx = new org.apache.hadoop.thriftfs.api.RequestContext(other.ctx);
       }
+      if (other.isSetJobID()) {
+        this.jobID = new ThriftJobID(other.jobID);
+      }
     }
 
-    public getRunningJobs_args deepCopy() {
-      return new getRunningJobs_args(this);
+    public getJobNoTasks_args deepCopy() {
+      return new getJobNoTasks_args(this);
     }
 
     @Deprecated
-    public getRunningJobs_args clone() {
-      return new getRunningJobs_args(this);
+    public getJobNoTasks_args clone() {
+      return new getJobNoTasks_args(this);
     }
 
     public org.apache.hadoop.thriftfs.api.RequestContext getCtx() {
       return this.ctx;
     }
 
-    public getRunningJobs_args setCtx(org.apache.hadoop.thriftfs.api.RequestContext ctx) {
+    public getJobNoTasks_args setCtx(org.apache.hadoop.thriftfs.api.RequestContext ctx) {
       this.ctx = ctx;
       return this;
     }
@@ -4137,6 +4592,30 @@ public class Jobtracker {
       }
     }
 
+    public ThriftJobID getJobID() {
+      return this.jobID;
+    }
+
+    public getJobNoTasks_args setJobID(ThriftJobID jobID) {
+      this.jobID = jobID;
+      return this;
+    }
+
+    public void unsetJobID() {
+      this.jobID = null;
+    }
+
+    /** Returns true if field jobID is set (has been asigned a value) and false otherwise */
+    public boolean isSetJobID() {
+      return this.jobID != null;
+    }
+
+    public void setJobIDIsSet(boolean value) {
+      if (!value) {
+        this.jobID = null;
+      }
+    }
+
     public void setFieldValue(_Fields field, Object value) {
       switch (field) {
       case CTX:
@@ -4147,6 +4626,14 @@ public class Jobtracker {
         }
         break;
 
+      case JOB_ID:
+        if (value == null) {
+          unsetJobID();
+        } else {
+          setJobID((ThriftJobID)value);
+        }
+        break;
+
       }
     }
 
@@ -4159,6 +4646,9 @@ public class Jobtracker {
       case CTX:
         return getCtx();
 
+      case JOB_ID:
+        return getJobID();
+
       }
       throw new IllegalStateException();
     }
@@ -4172,6 +4662,8 @@ public class Jobtracker {
       switch (field) {
       case CTX:
         return isSetCtx();
+      case JOB_ID:
+        return isSetJobID();
       }
       throw new IllegalStateException();
     }
@@ -4184,12 +4676,12 @@ public class Jobtracker {
     public boolean equals(Object that) {
       if (that == null)
         return false;
-      if (that instanceof getRunningJobs_args)
-        return this.equals((getRunningJobs_args)that);
+      if (that instanceof getJobNoTasks_args)
+        return this.equals((getJobNoTasks_args)that);
       return false;
     }
 
-    public boolean equals(getRunningJobs_args that) {
+    public boolean equals(getJobNoTasks_args that) {
       if (that == null)
         return false;
 
@@ -4202,6 +4694,15 @@ public class Jobtracker {
           return false;
       }
 
+      boolean this_present_jobID = true && this.isSetJobID();
+      boolean that_present_jobID = true && that.isSetJobID();
+      if (this_present_jobID || that_present_jobID) {
+        if (!(this_present_jobID && that_present_jobID))
+          return false;
+        if (!this.jobID.equals(that.jobID))
+          return false;
+      }
+
       return true;
     }
 
@@ -4232,6 +4733,14 @@ public class Jobtracker {
                 TProtocolUtil.skip(iprot, field.type);
               }
               break;
+            case JOB_ID:
+              if (field.type == TType.STRUCT) {
+                this.jobID = new ThriftJobID();
+                this.jobID.read(iprot);
+              } else { 
+                TProtocolUtil.skip(iprot, field.type);
+              }
+              break;
           }
           iprot.readFieldEnd();
         }
@@ -4246,6 +4755,11 @@ public class Jobtracker {
       validate();
 
       oprot.writeStructBegin(STRUCT_DESC);
+      if (this.jobID != null) {
+        oprot.writeFieldBegin(JOB_ID_FIELD_DESC);
+        this.jobID.write(oprot);
+        oprot.writeFieldEnd();
+      }
       if (this.ctx != null) {
         oprot.writeFieldBegin(CTX_FIELD_DESC);
         this.ctx.write(oprot);
@@ -4257,7 +4771,7 @@ public class Jobtracker {
 
     @Override
     public String toString() {
-      StringBuilder sb = new StringBuilder("getRunningJobs_args(");
+      StringBuilder sb = new StringBuilder("getJobNoTasks_args(");
       boolean first = true;
 
       sb.append("ctx:");
@@ -4267,6 +4781,14 @@ public class Jobtracker {
         sb.append(this.ctx);
       }
       first = false;
+      if (!first) sb.append(", ");
+      sb.append("jobID:");
+      if (this.jobID == null) {
+        sb.append("null");
+      } else {
+        sb.append(this.jobID);
+      }
+      first = false;
       sb.append(")");
       return sb.toString();
     }
@@ -4277,16 +4799,19 @@ public class Jobtracker {
 
   }
 
-  public static class getRunningJobs_result implements TBase<getRunningJobs_result._Fields>, java.io.Serializable, Cloneable   {
-    private static final TStruct STRUCT_DESC = new TStruct("getRunningJobs_result");
+  public static class getJobNoTasks_result implements TBase<getJobNoTasks_result._Fields>, java.io.Serializable, Cloneable   {
+    private static final TStruct STRUCT_DESC = new TStruct("getJobNoTasks_result");
 
     private static final TField SUCCESS_FIELD_DESC = new TField("success", TType.STRUCT, (short)0);
+    private static final TField ERR_FIELD_DESC = new TField("err", TType.STRUCT, (short)1);
 
-    public ThriftJobList success;
+    public ThriftJobInProgress success;
+    public JobNotFoundException err;
 
     /** The set of fields this struct contains, along with convenience methods for finding and manipulating them. */
     public enum _Fields implements TFieldIdEnum {
-      SUCCESS((short)0, "success");
+      SUCCESS((short)0, "success"),
+      ERR((short)1, "err");
 
       private static final Map<Integer, _Fields> byId = new HashMap<Integer, _Fields>();
       private static final Map<String, _Fields> byName = new HashMap<String, _Fields>();
@@ -4343,46 +4868,53 @@ public class Jobtracker {
 
     public static final Map<_Fields, FieldMetaData> metaDataMap = Collections.unmodifiableMap(new EnumMap<_Fields, FieldMetaData>(_Fields.class) {{
       put(_Fields.SUCCESS, new FieldMetaData("success", TFieldRequirementType.DEFAULT, 
-          new StructMetaData(TType.STRUCT, ThriftJobList.class)));
+          new StructMetaData(TType.STRUCT, ThriftJobInProgress.class)));
+      put(_Fields.ERR, new FieldMetaData("err", TFieldRequirementType.DEFAULT, 
+          new FieldValueMetaData(TType.STRUCT)));
     }});
 
     static {
-      FieldMetaData.addStructMetaDataMap(getRunningJobs_result.class, metaDataMap);
+      FieldMetaData.addStructMetaDataMap(getJobNoTasks_result.class, metaDataMap);
     }
 
-    public getRunningJobs_result() {
+    public getJobNoTasks_result() {
     }
 
-    public getRunningJobs_result(
-      ThriftJobList success)
+    public getJobNoTasks_result(
+      ThriftJobInProgress success,
+      JobNotFoundException err)
     {
       this();
       this.success = success;
+      this.err = err;
     }
 
     /**
      * Performs a deep copy on <i>other</i>.
      */
-    public getRunningJobs_result(getRunningJobs_result other) {
+    public getJobNoTasks_result(getJobNoTasks_result other) {
       if (other.isSetSuccess()) {
-        this.success = new ThriftJobList(other.success);
+        this.success = new ThriftJobInProgress(other.success);
+      }
+      if (other.isSetErr()) {
+        this.err = new JobNotFoundException(other.err);
       }
     }
 
-    public getRunningJobs_result deepCopy() {
-      return new getRunningJobs_result(this);
+    public getJobNoTasks_result deepCopy() {
+      return new getJobNoTasks_result(this);
     }
 
     @Deprecated
-    public getRunningJobs_result clone() {
-      return new getRunningJobs_result(this);
+    public getJobNoTasks_result clone() {
+      return new getJobNoTasks_result(this);
     }
 
-    public ThriftJobList getSuccess() {
+    public ThriftJobInProgress getSuccess() {
       return this.success;
     }
 
-    public getRunningJobs_result setSuccess(ThriftJobList success) {
+    public getJobNoTasks_result setSuccess(ThriftJobInProgress success) {
       this.success = success;
       return this;
     }
@@ -4402,13 +4934,45 @@ public class Jobtracker {
       }
     }
 
+    public JobNotFoundException getErr() {
+      return this.err;
+    }
+
+    public getJobNoTasks_result setErr(JobNotFoundException err) {
+      this.err = err;
+      return this;
+    }
+
+    public void unsetErr() {
+      this.err = null;
+    }
+
+    /** Returns true if field err is set (has been asigned a value) and false otherwise */
+    public boolean isSetErr() {
+      return this.err != null;
+    }
+
+    public void setErrIsSet(boolean value) {
+      if (!value) {
+        this.err = null;
+      }
+    }
+
     public void setFieldValue(_Fields field, Object value) {
       switch (field) {
       case SUCCESS:
         if (value == null) {
           unsetSuccess();
         } else {
-          setSuccess((ThriftJobList)value);
+          setSuccess((ThriftJobInProgress)value);
+        }
+        break;
+
+      case ERR:
+        if (value == null) {
+          unsetErr();
+        } else {
+          setErr((JobNotFoundException)value);
         }
         break;
 
@@ -4424,6 +4988,9 @@ public class Jobtracker {
       case SUCCESS:
         return getSuccess();
 
+      case ERR:
+        return getErr();
+
       }
       throw new IllegalStateException();
     }
@@ -4437,6 +5004,8 @@ public class Jobtracker {
       switch (field) {
       case SUCCESS:
         return isSetSuccess();
+      case ERR:
+        return isSetErr();
       }
       throw new IllegalStateException();
     }
@@ -4449,12 +5018,12 @@ public class Jobtracker {
     public boolean equals(Object that) {
       if (that == null)
         return false;
-      if (that instanceof getRunningJobs_result)
-        return this.equals((getRunningJobs_result)that);
+      if (that instanceof getJobNoTasks_result)
+        return this.equals((getJobNoTasks_result)that);
       return false;
     }
 
-    public boolean equals(getRunningJobs_result that) {
+    public boolean equals(getJobNoTasks_result that) {
       if (that == null)
         return false;
 
@@ -4467,6 +5036,15 @@ public class Jobtracker {
           return false;
       }
 
+      boolean this_present_err = true && this.isSetErr();
+      boolean that_present_err = true && that.isSetErr();
+      if (this_present_err || that_present_err) {
+        if (!(this_present_err && that_present_err))
+          return false;
+        if (!this.err.equals(that.err))
+          return false;
+      }
+
       return true;
     }
 
@@ -4491,12 +5069,20 @@ public class Jobtracker {
           switch (fieldId) {
             case SUCCESS:
               if (field.type == TType.STRUCT) {
-                this.success = new ThriftJobList();
+                this.success = new ThriftJobInProgress();
                 this.success.read(iprot);
               } else { 
                 TProtocolUtil.skip(iprot, field.type);
               }
               break;
+            case ERR:
+              if (field.type == TType.STRUCT) {
+                this.err = new JobNotFoundException();
+                this.err.read(iprot);
+              } else { 
+                TProtocolUtil.skip(iprot, field.type);
+              }
+              break;
           }
           iprot.readFieldEnd();
         }
@@ -4514,14 +5100,18 @@ public class Jobtracker {
         oprot.writeFieldBegin(SUCCESS_FIELD_DESC);
         this.success.write(oprot);
         oprot.writeFieldEnd();
-      }
-      oprot.writeFieldStop();
+      } else if (this.isSetErr()) {
+        oprot.writeFieldBegin(ERR_FIELD_DESC);
+        this.err.write(oprot);
+        oprot.writeFieldEnd();
+      }
+      oprot.writeFieldStop();
       oprot.writeStructEnd();
     }
 
     @Override
     public String toString() {
-      StringBuilder sb = new StringBuilder("getRunningJobs_result(");
+      StringBuilder sb = new StringBuilder("getJobNoTasks_result(");
       boolean first = true;
 
       sb.append("success:");
@@ -4531,6 +5121,14 @@ public class Jobtracker {
         sb.append(this.success);
       }
       first = false;
+      if (!first) sb.append(", ");
+      sb.append("err:");
+      if (this.err == null) {
+        sb.append("null");
+      } else {
+        sb.append(this.err);
+      }
+      first = false;
       sb.append(")");
       return sb.toString();
     }
@@ -4541,8 +5139,8 @@ public class Jobtracker {
 
   }
 
-  public static class getCompletedJobs_args implements TBase<getCompletedJobs_args._Fields>, java.io.Serializable, Cloneable   {
-    private static final TStruct STRUCT_DESC = new TStruct("getCompletedJobs_args");
+  public static class getRunningJobs_args implements TBase<getRunningJobs_args._Fields>, java.io.Serializable, Cloneable   {
+    private static final TStruct STRUCT_DESC = new TStruct("getRunningJobs_args");
 
     private static final TField CTX_FIELD_DESC = new TField("ctx", TType.STRUCT, (short)10);
 
@@ -4611,13 +5209,13 @@ public class Jobtracker {
     }});
 
     static {
-      FieldMetaData.addStructMetaDataMap(getCompletedJobs_args.class, metaDataMap);
+      FieldMetaData.addStructMetaDataMap(getRunningJobs_args.class, metaDataMap);
     }
 
-    public getCompletedJobs_args() {
+    public getRunningJobs_args() {
     }
 
-    public getCompletedJobs_args(
+    public getRunningJobs_args(
       org.apache.hadoop.thriftfs.api.RequestContext ctx)
     {
       this();
@@ -4627,26 +5225,26 @@ public class Jobtracker {
     /**
      * Performs a deep copy on <i>other</i>.
      */
-    public getCompletedJobs_args(getCompletedJobs_args other) {
+    public getRunningJobs_args(getRunningJobs_args other) {
       if (other.isSetCtx()) {
         this.ctx = new org.apache.hadoop.thriftfs.api.RequestContext(other.ctx);
       }
     }
 
-    public getCompletedJobs_args deepCopy() {
-      return new getCompletedJobs_args(this);
+    public getRunningJobs_args deepCopy() {
+      return new getRunningJobs_args(this);
     }
 
     @Deprecated
-    public getCompletedJobs_args clone() {
-      return new getCompletedJobs_args(this);
+    public getRunningJobs_args clone() {
+      return new getRunningJobs_args(this);
     }
 
     public org.apache.hadoop.thriftfs.api.RequestContext getCtx() {
       return this.ctx;
     }
 
-    public getCompletedJobs_args setCtx(org.apache.hadoop.thriftfs.api.RequestContext ctx) {
+    public getRunningJobs_args setCtx(org.apache.hadoop.thriftfs.api.RequestContext ctx) {
       this.ctx = ctx;
       return this;
     }
@@ -4713,12 +5311,12 @@ public class Jobtracker {
     public boolean equals(Object that) {
       if (that == null)
         return false;
-      if (that instanceof getCompletedJobs_args)
-        return this.equals((getCompletedJobs_args)that);
+      if (that instanceof getRunningJobs_args)
+        return this.equals((getRunningJobs_args)that);
       return false;
     }
 
-    public boolean equals(getCompletedJobs_args that) {
+    public boolean equals(getRunningJobs_args that) {
       if (that == null)
         return false;
 
@@ -4786,7 +5384,7 @@ public class Jobtracker {
 
     @Override
     public String toString() {
-      StringBuilder sb = new StringBuilder("getCompletedJobs_args(");
+      StringBuilder sb = new StringBuilder("getRunningJobs_args(");
       boolean first = true;
 
       sb.append("ctx:");
@@ -4806,8 +5404,8 @@ public class Jobtracker {
 
   }
 
-  public static class getCompletedJobs_result implements TBase<getCompletedJobs_result._Fields>, java.io.Serializable, Cloneable   {
-    private static final TStruct STRUCT_DESC = new TStruct("getCompletedJobs_result");
+  public static class getRunningJobs_result implements TBase<getRunningJobs_result._Fields>, java.io.Serializable, Cloneable   {
+    private static final TStruct STRUCT_DESC = new TStruct("getRunningJobs_result");
 
     private static final TField SUCCESS_FIELD_DESC = new TField("success", TType.STRUCT, (short)0);
 
@@ -4876,13 +5474,13 @@ public class Jobtracker {
     }});
 
     static {
-      FieldMetaData.addStructMetaDataMap(getCompletedJobs_result.class, metaDataMap);
+      FieldMetaData.addStructMetaDataMap(getRunningJobs_result.class, metaDataMap);
     }
 
-    public getCompletedJobs_result() {
+    public getRunningJobs_result() {
     }
 
-    public getCompletedJobs_result(
+    public getRunningJobs_result(
       ThriftJobList success)
     {
       this();
@@ -4892,26 +5490,26 @@ public class Jobtracker {
     /**
      * Performs a deep copy on <i>other</i>.
      */
-    public getCompletedJobs_result(getCompletedJobs_result other) {
+    public getRunningJobs_result(getRunningJobs_result other) {
       if (other.isSetSuccess()) {
         this.success = new ThriftJobList(other.success);
       }
     }
 
-    public getCompletedJobs_result deepCopy() {
-      return new getCompletedJobs_result(this);
+    public getRunningJobs_result deepCopy() {
+      return new getRunningJobs_result(this);
     }
 
     @Deprecated
-    public getCompletedJobs_result clone() {
-      return new getCompletedJobs_result(this);
+    public getRunningJobs_result clone() {
+      return new getRunningJobs_result(this);
     }
 
     public ThriftJobList getSuccess() {
       return this.success;
     }
 
-    public getCompletedJobs_result setSuccess(ThriftJobList success) {
+    public getRunningJobs_result setSuccess(ThriftJobList success) {
       this.success = success;
       return this;
     }
@@ -4978,12 +5576,12 @@ public class Jobtracker {
     public boolean equals(Object that) {
       if (that == null)
         return false;
-      if (that instanceof getCompletedJobs_result)
-        return this.equals((getCompletedJobs_result)that);
+      if (that instanceof getRunningJobs_result)
+        return this.equals((getRunningJobs_result)that);
       return false;
     }
 
-    public boolean equals(getCompletedJobs_result that) {
+    public boolean equals(getRunningJobs_result that) {
       if (that == null)
         return false;
 
@@ -5050,7 +5648,7 @@ public class Jobtracker {
 
     @Override
     public String toString() {
-      StringBuilder sb = new StringBuilder("getCompletedJobs_result(");
+      StringBuilder sb = new StringBuilder("getRunningJobs_result(");
       boolean first = true;
 
       sb.append("success:");
@@ -5070,8 +5668,8 @@ public class Jobtracker {
 
   }
 
-  public static class getFailedJobs_args implements TBase<getFailedJobs_args._Fields>, java.io.Serializable, Cloneable   {
-    private static final TStruct STRUCT_DESC = new TStruct("getFailedJobs_args");
+  public static class getCompletedJobs_args implements TBase<getCompletedJobs_args._Fields>, java.io.Serializable, Cloneable   {
+    private static final TStruct STRUCT_DESC = new TStruct("getCompletedJobs_args");
 
     private static final TField CTX_FIELD_DESC = new TField("ctx", TType.STRUCT, (short)10);
 
@@ -5140,13 +5738,13 @@ public class Jobtracker {
     }});
 
     static {
-      FieldMetaData.addStructMetaDataMap(getFailedJobs_args.class, metaDataMap);
+      FieldMetaData.addStructMetaDataMap(getCompletedJobs_args.class, metaDataMap);
     }
 
-    public getFailedJobs_args() {
+    public getCompletedJobs_args() {
     }
 
-    public getFailedJobs_args(
+    public getCompletedJobs_args(
       org.apache.hadoop.thriftfs.api.RequestContext ctx)
     {
       this();
@@ -5156,26 +5754,26 @@ public class Jobtracker {
     /**
      * Performs a deep copy on <i>other</i>.
      */
-    public getFailedJobs_args(getFailedJobs_args other) {
+    public getCompletedJobs_args(getCompletedJobs_args other) {
       if (other.isSetCtx()) {
         this.ctx = new org.apache.hadoop.thriftfs.api.RequestContext(other.ctx);
       }
     }
 
-    public getFailedJobs_args deepCopy() {
-      return new getFailedJobs_args(this);
+    public getCompletedJobs_args deepCopy() {
+      return new getCompletedJobs_args(this);
     }
 
     @Deprecated
-    public getFailedJobs_args clone() {
-      return new getFailedJobs_args(this);
+    public getCompletedJobs_args clone() {
+      return new getCompletedJobs_args(this);
     }
 
     public org.apache.hadoop.thriftfs.api.RequestContext getCtx() {
       return this.ctx;
     }
 
-    public getFailedJobs_args setCtx(org.apache.hadoop.thriftfs.api.RequestContext ctx) {
+    public getCompletedJobs_args setCtx(org.apache.hadoop.thriftfs.api.RequestContext ctx) {
       this.ctx = ctx;
       return this;
     }
@@ -5242,12 +5840,12 @@ public class Jobtracker {
     public boolean equals(Object that) {
       if (that == null)
         return false;
-      if (that instanceof getFailedJobs_args)
-        return this.equals((getFailedJobs_args)that);
+      if (that instanceof getCompletedJobs_args)
+        return this.equals((getCompletedJobs_args)that);
       return false;
     }
 
-    public boolean equals(getFailedJobs_args that) {
+    public boolean equals(getCompletedJobs_args that) {
       if (that == null)
         return false;
 
@@ -5315,7 +5913,7 @@ public class Jobtracker {
 
     @Override
     public String toString() {
-      StringBuilder sb = new StringBuilder("getFailedJobs_args(");
+      StringBuilder sb = new StringBuilder("getCompletedJobs_args(");
       boolean first = true;
 
       sb.append("ctx:");
@@ -5335,8 +5933,8 @@ public class Jobtracker {
 
   }
 
-  public static class getFailedJobs_result implements TBase<getFailedJobs_result._Fields>, java.io.Serializable, Cloneable   {
-    private static final TStruct STRUCT_DESC = new TStruct("getFailedJobs_result");
+  public static class getCompletedJobs_result implements TBase<getCompletedJobs_result._Fields>, java.io.Serializable, Cloneable   {
+    private static final TStruct STRUCT_DESC = new TStruct("getCompletedJobs_result");
 
     private static final TField SUCCESS_FIELD_DESC = new TField("success", TType.STRUCT, (short)0);
 
@@ -5405,13 +6003,13 @@ public class Jobtracker {
     }});
 
     static {
-      FieldMetaData.addStructMetaDataMap(getFailedJobs_result.class, metaDataMap);
+      FieldMetaData.addStructMetaDataMap(getCompletedJobs_result.class, metaDataMap);
     }
 
-    public getFailedJobs_result() {
+    public getCompletedJobs_result() {
     }
 
-    public getFailedJobs_result(
+    public getCompletedJobs_result(
       ThriftJobList success)
     {
       this();
@@ -5421,26 +6019,26 @@ public class Jobtracker {
     /**
      * Performs a deep copy on <i>other</i>.
      */
-    public getFailedJobs_result(getFailedJobs_result other) {
+    public getCompletedJobs_result(getCompletedJobs_result other) {
       if (other.isSetSuccess()) {
         this.success = new ThriftJobList(other.success);
       }
     }
 
-    public getFailedJobs_result deepCopy() {
-      return new getFailedJobs_result(this);
+    public getCompletedJobs_result deepCopy() {
+      return new getCompletedJobs_result(this);
     }
 
     @Deprecated
-    public getFailedJobs_result clone() {
-      return new getFailedJobs_result(this);
+    public getCompletedJobs_result clone() {
+      return new getCompletedJobs_result(this);
     }
 
     public ThriftJobList getSuccess() {
       return this.success;
     }
 
-    public getFailedJobs_result setSuccess(ThriftJobList success) {
+    public getCompletedJobs_result setSuccess(ThriftJobList success) {
       this.success = success;
       return this;
     }
@@ -5507,12 +6105,12 @@ public class Jobtracker {
     public boolean equals(Object that) {
       if (that == null)
         return false;
-      if (that instanceof getFailedJobs_result)
-        return this.equals((getFailedJobs_result)that);
+      if (that instanceof getCompletedJobs_result)
+        return this.equals((getCompletedJobs_result)that);
       return false;
     }
 
-    public boolean equals(getFailedJobs_result that) {
+    public boolean equals(getCompletedJobs_result that) {
       if (that == null)
         return false;
 
@@ -5579,7 +6177,7 @@ public class Jobtracker {
 
     @Override
     public String toString() {
-      StringBuilder sb = new StringBuilder("getFailedJobs_result(");
+      StringBuilder sb = new StringBuilder("getCompletedJobs_result(");
       boolean first = true;
 
       sb.append("success:");
@@ -5599,8 +6197,8 @@ public class Jobtracker {
 
   }
 
-  public static class getKilledJobs_args implements TBase<getKilledJobs_args._Fields>, java.io.Serializable, Cloneable   {
-    private static final TStruct STRUCT_DESC = new TStruct("getKilledJobs_args");
+  public static class getFailedJobs_args implements TBase<getFailedJobs_args._Fields>, java.io.Serializable, Cloneable   {
+    private static final TStruct STRUCT_DESC = new TStruct("getFailedJobs_args");
 
     private static final TField CTX_FIELD_DESC = new TField("ctx", TType.STRUCT, (short)10);
 
@@ -5669,13 +6267,13 @@ public class Jobtracker {
     }});
 
     static {
-      FieldMetaData.addStructMetaDataMap(getKilledJobs_args.class, metaDataMap);
+      FieldMetaData.addStructMetaDataMap(getFailedJobs_args.class, metaDataMap);
     }
 
-    public getKilledJobs_args() {
+    public getFailedJobs_args() {
     }
 
-    public getKilledJobs_args(
+    public getFailedJobs_args(
       org.apache.hadoop.thriftfs.api.RequestContext ctx)
     {
       this();
@@ -5685,26 +6283,26 @@ public class Jobtracker {
     /**
      * Performs a deep copy on <i>other</i>.
      */
-    public getKilledJobs_args(getKilledJobs_args other) {
+    public getFailedJobs_args(getFailedJobs_args other) {
       if (other.isSetCtx()) {
         this.ctx = new org.apache.hadoop.thriftfs.api.RequestContext(other.ctx);
       }
     }
 
-    public getKilledJobs_args deepCopy() {
-      return new getKilledJobs_args(this);
+    public getFailedJobs_args deepCopy() {
+      return new getFailedJobs_args(this);
     }
 
     @Deprecated
-    public getKilledJobs_args clone() {
-      return new getKilledJobs_args(this);
+    public getFailedJobs_args clone() {
+      return new getFailedJobs_args(this);
     }
 
     public org.apache.hadoop.thriftfs.api.RequestContext getCtx() {
       return this.ctx;
     }
 
-    public getKilledJobs_args setCtx(org.apache.hadoop.thriftfs.api.RequestContext ctx) {
+    public getFailedJobs_args setCtx(org.apache.hadoop.thriftfs.api.RequestContext ctx) {
       this.ctx = ctx;
       return this;
     }
@@ -5771,12 +6369,12 @@ public class Jobtracker {
     public boolean equals(Object that) {
       if (that == null)
         return false;
-      if (that instanceof getKilledJobs_args)
-        return this.equals((getKilledJobs_args)that);
+      if (that instanceof getFailedJobs_args)
+        return this.equals((getFailedJobs_args)that);
       return false;
     }
 
-    public boolean equals(getKilledJobs_args that) {
+    public boolean equals(getFailedJobs_args that) {
       if (that == null)
         return false;
 
@@ -5844,7 +6442,7 @@ public class Jobtracker {
 
     @Override
     public String toString() {
-      StringBuilder sb = new StringBuilder("getKilledJobs_args(");
+      StringBuilder sb = new StringBuilder("getFailedJobs_args(");
       boolean first = true;
 
       sb.append("ctx:");
@@ -5864,8 +6462,8 @@ public class Jobtracker {
 
   }
 
-  public static class getKilledJobs_result implements TBase<getKilledJobs_result._Fields>, java.io.Serializable, Cloneable   {
-    private static final TStruct STRUCT_DESC = new TStruct("getKilledJobs_result");
+  public static class getFailedJobs_result implements TBase<getFailedJobs_result._Fields>, java.io.Serializable, Cloneable   {
+    private static final TStruct STRUCT_DESC = new TStruct("getFailedJobs_result");
 
     private static final TField SUCCESS_FIELD_DESC = new TField("success", TType.STRUCT, (short)0);
 
@@ -5934,13 +6532,13 @@ public class Jobtracker {
     }});
 
     static {
-      FieldMetaData.addStructMetaDataMap(getKilledJobs_result.class, metaDataMap);
+      FieldMetaData.addStructMetaDataMap(getFailedJobs_result.class, metaDataMap);
     }
 
-    public getKilledJobs_result() {
+    public getFailedJobs_result() {
     }
 
-    public getKilledJobs_result(
+    public getFailedJobs_result(
       ThriftJobList success)
     {
       this();
@@ -5950,26 +6548,26 @@ public class Jobtracker {
     /**
      * Performs a deep copy on <i>other</i>.
      */
-    public getKilledJobs_result(getKilledJobs_result other) {
+    public getFailedJobs_result(getFailedJobs_result other) {
       if (other.isSetSuccess()) {
         this.success = new ThriftJobList(other.success);
       }
     }
 
-    public getKilledJobs_result deepCopy() {
-      return new getKilledJobs_result(this);
+    public getFailedJobs_result deepCopy() {
+      return new getFailedJobs_result(this);
     }
 
     @Deprecated
-    public getKilledJobs_result clone() {
-      return new getKilledJobs_result(this);
+    public getFailedJobs_result clone() {
+      return new getFailedJobs_result(this);
     }
 
     public ThriftJobList getSuccess() {
       return this.success;
     }
 
-    public getKilledJobs_result setSuccess(ThriftJobList success) {
+    public getFailedJobs_result setSuccess(ThriftJobList success) {
       this.success = success;
       return this;
     }
@@ -6036,12 +6634,12 @@ public class Jobtracker {
     public boolean equals(Object that) {
       if (that == null)
         return false;
-      if (that instanceof getKilledJobs_result)
-        return this.equals((getKilledJobs_result)that);
+      if (that instanceof getFailedJobs_result)
+        return this.equals((getFailedJobs_result)that);
       return false;
     }
 
-    public boolean equals(getKilledJobs_result that) {
+    public boolean equals(getFailedJobs_result that) {
       if (that == null)
         return false;
 
@@ -6108,7 +6706,7 @@ public class Jobtracker {
 
     @Override
     public String toString() {
-      StringBuilder sb = new StringBuilder("getKilledJobs_result(");
+      StringBuilder sb = new StringBuilder("getFailedJobs_result(");
       boolean first = true;
 
       sb.append("success:");
@@ -6128,8 +6726,8 @@ public class Jobtracker {
 
   }
 
-  public static class getAllJobs_args implements TBase<getAllJobs_args._Fields>, java.io.Serializable, Cloneable   {
-    private static final TStruct STRUCT_DESC = new TStruct("getAllJobs_args");
+  public static class getKilledJobs_args implements TBase<getKilledJobs_args._Fields>, java.io.Serializable, Cloneable   {
+    private static final TStruct STRUCT_DESC = new TStruct("getKilledJobs_args");
 
     private static final TField CTX_FIELD_DESC = new TField("ctx", TType.STRUCT, (short)10);
 
@@ -6198,13 +6796,13 @@ public class Jobtracker {
     }});
 
     static {
-      FieldMetaData.addStructMetaDataMap(getAllJobs_args.class, metaDataMap);
+      FieldMetaData.addStructMetaDataMap(getKilledJobs_args.class, metaDataMap);
     }
 
-    public getAllJobs_args() {
+    public getKilledJobs_args() {
     }
 
-    public getAllJobs_args(
+    public getKilledJobs_args(
       org.apache.hadoop.thriftfs.api.RequestContext ctx)
     {
       this();
@@ -6214,26 +6812,26 @@ public class Jobtracker {
     /**
      * Performs a deep copy on <i>other</i>.
      */
-    public getAllJobs_args(getAllJobs_args other) {
+    public getKilledJobs_args(getKilledJobs_args other) {
       if (other.isSetCtx()) {
         this.ctx = new org.apache.hadoop.thriftfs.api.RequestContext(other.ctx);
       }
     }
 
-    public getAllJobs_args deepCopy() {
-      return new getAllJobs_args(this);
+    public getKilledJobs_args deepCopy() {
+      return new getKilledJobs_args(this);
     }
 
     @Deprecated
-    public getAllJobs_args clone() {
-      return new getAllJobs_args(this);
+    public getKilledJobs_args clone() {
+      return new getKilledJobs_args(this);
     }
 
     public org.apache.hadoop.thriftfs.api.RequestContext getCtx() {
       return this.ctx;
     }
 
-    public getAllJobs_args setCtx(org.apache.hadoop.thriftfs.api.RequestContext ctx) {
+    public getKilledJobs_args setCtx(org.apache.hadoop.thriftfs.api.RequestContext ctx) {
       this.ctx = ctx;
       return this;
     }
@@ -6300,12 +6898,12 @@ public class Jobtracker {
     public boolean equals(Object that) {
       if (that == null)
         return false;
-      if (that instanceof getAllJobs_args)
-        return this.equals((getAllJobs_args)that);
+      if (that instanceof getKilledJobs_args)
+        return this.equals((getKilledJobs_args)that);
       return false;
     }
 
-    public boolean equals(getAllJobs_args that) {
+    public boolean equals(getKilledJobs_args that) {
       if (that == null)
         return false;
 
@@ -6373,7 +6971,7 @@ public class Jobtracker {
 
     @Override
     public String toString() {
-      StringBuilder sb = new StringBuilder("getAllJobs_args(");
+      StringBuilder sb = new StringBuilder("getKilledJobs_args(");
       boolean first = true;
 
       sb.append("ctx:");
@@ -6393,8 +6991,8 @@ public class Jobtracker {
 
   }
 
-  public static class getAllJobs_result implements TBase<getAllJobs_result._Fields>, java.io.Serializable, Cloneable   {
-    private static final TStruct STRUCT_DESC = new TStruct("getAllJobs_result");
+  public static class getKilledJobs_result implements TBase<getKilledJobs_result._Fields>, java.io.Serializable, Cloneable   {
+    private static final TStruct STRUCT_DESC = new TStruct("getKilledJobs_result");
 
     private static final TField SUCCESS_FIELD_DESC = new TField("success", TType.STRUCT, (short)0);
 
@@ -6463,13 +7061,13 @@ public class Jobtracker {
     }});
 
     static {
-      FieldMetaData.addStructMetaDataMap(getAllJobs_result.class, metaDataMap);
+      FieldMetaData.addStructMetaDataMap(getKilledJobs_result.class, metaDataMap);
     }
 
-    public getAllJobs_result() {
+    public getKilledJobs_result() {
     }
 
-    public getAllJobs_result(
+    public getKilledJobs_result(
       ThriftJobList success)
     {
       this();
@@ -6479,26 +7077,26 @@ public class Jobtracker {
     /**
      * Performs a deep copy on <i>other</i>.
      */
-    public getAllJobs_result(getAllJobs_result other) {
+    public getKilledJobs_result(getKilledJobs_result other) {
       if (other.isSetSuccess()) {
         this.success = new ThriftJobList(other.success);
       }
     }
 
-    public getAllJobs_result deepCopy() {
-      return new getAllJobs_result(this);
+    public getKilledJobs_result deepCopy() {
+      return new getKilledJobs_result(this);
     }
 
     @Deprecated
-    public getAllJobs_result clone() {
-      return new getAllJobs_result(this);
+    public getKilledJobs_result clone() {
+      return new getKilledJobs_result(this);
     }
 
     public ThriftJobList getSuccess() {
       return this.success;
     }
 
-    public getAllJobs_result setSuccess(ThriftJobList success) {
+    public getKilledJobs_result setSuccess(ThriftJobList success) {
       this.success = success;
       return this;
     }
@@ -6565,12 +7163,12 @@ public class Jobtracker {
     public boolean equals(Object that) {
       if (that == null)
         return false;
-      if (that instanceof getAllJobs_result)
-        return this.equals((getAllJobs_result)that);
+      if (that instanceof getKilledJobs_result)
+        return this.equals((getKilledJobs_result)that);
       return false;
     }
 
-    public boolean equals(getAllJobs_result that) {
+    public boolean equals(getKilledJobs_result that) {
       if (that == null)
         return false;
 
@@ -6637,7 +7235,7 @@ public class Jobtracker {
 
     @Override
     public String toString() {
-      StringBuilder sb = new StringBuilder("getAllJobs_result(");
+      StringBuilder sb = new StringBuilder("getKilledJobs_result(");
       boolean first = true;
 
       sb.append("success:");
@@ -6657,19 +7255,16 @@ public class Jobtracker {
 
   }
 
-  public static class getUserJobCounts_args implements TBase<getUserJobCounts_args._Fields>, java.io.Serializable, Cloneable   {
-    private static final TStruct STRUCT_DESC = new TStruct("getUserJobCounts_args");
+  public static class getAllJobs_args implements TBase<getAllJobs_args._Fields>, java.io.Serializable, Cloneable   {
+    private static final TStruct STRUCT_DESC = new TStruct("getAllJobs_args");
 
-    private static final TField CTX_FIELD_DESC = new TField("ctx", TType.STRUCT, (short)1);
-    private static final TField USER_FIELD_DESC = new TField("user", TType.STRING, (short)2);
+    private static final TField CTX_FIELD_DESC = new TField("ctx", TType.STRUCT, (short)10);
 
     public org.apache.hadoop.thriftfs.api.RequestContext ctx;
-    public String user;
 
     /** The set of fields this struct contains, along with convenience methods for finding and manipulating them. */
     public enum _Fields implements TFieldIdEnum {
-      CTX((short)1, "ctx"),
-      USER((short)2, "user");
+      CTX((short)10, "ctx");
 
       private static final Map<Integer, _Fields> byId = new HashMap<Integer, _Fields>();
       private static final Map<String, _Fields> byName = new HashMap<String, _Fields>();
@@ -6727,52 +7322,45 @@ public class Jobtracker {
     public static final Map<_Fields, FieldMetaData> metaDataMap = Collections.unmodifiableMap(new EnumMap<_Fields, FieldMetaData>(_Fields.class) {{
       put(_Fields.CTX, new FieldMetaData("ctx", TFieldRequirementType.DEFAULT, 
           new StructMetaData(TType.STRUCT, org.apache.hadoop.thriftfs.api.RequestContext.class)));
-      put(_Fields.USER, new FieldMetaData("user", TFieldRequirementType.DEFAULT, 
-          new FieldValueMetaData(TType.STRING)));
     }});
 
     static {
-      FieldMetaData.addStructMetaDataMap(getUserJobCounts_args.class, metaDataMap);
+      FieldMetaData.addStructMetaDataMap(getAllJobs_args.class, metaDataMap);
     }
 
-    public getUserJobCounts_args() {
+    public getAllJobs_args() {
     }
 
-    public getUserJobCounts_args(
-      org.apache.hadoop.thriftfs.api.RequestContext ctx,
-      String user)
+    public getAllJobs_args(
+      org.apache.hadoop.thriftfs.api.RequestContext ctx)
     {
       this();
       this.ctx = ctx;
-      this.user = user;
     }
 
     /**
      * Performs a deep copy on <i>other</i>.
      */
-    public getUserJobCounts_args(getUserJobCounts_args other) {
+    public getAllJobs_args(getAllJobs_args other) {
       if (other.isSetCtx()) {
         this.ctx = new org.apache.hadoop.thriftfs.api.RequestContext(other.ctx);
       }
-      if (other.isSetUser()) {
-        this.user = other.user;
-      }
     }
 
-    public getUserJobCounts_args deepCopy() {
-      return new getUserJobCounts_args(this);
+    public getAllJobs_args deepCopy() {
+      return new getAllJobs_args(this);
     }
 
     @Deprecated
-    public getUserJobCounts_args clone() {
-      return new getUserJobCounts_args(this);
+    public getAllJobs_args clone() {
+      return new getAllJobs_args(this);
     }
 
     public org.apache.hadoop.thriftfs.api.RequestContext getCtx() {
       return this.ctx;
     }
 
-    public getUserJobCounts_args setCtx(org.apache.hadoop.thriftfs.api.RequestContext ctx) {
+    public getAllJobs_args setCtx(org.apache.hadoop.thriftfs.api.RequestContext ctx) {
       this.ctx = ctx;
       return this;
     }
@@ -6792,30 +7380,6 @@ public class Jobtracker {
       }
     }
 
-    public String getUser() {
-      return this.user;
-    }
-
-    public getUserJobCounts_args setUser(String user) {
-      this.user = user;
-      return this;
-    }
-
-    public void unsetUser() {
-      this.user = null;
-    }
-
-    /** Returns true if field user is set (has been asigned a value) and false otherwise */
-    public boolean isSetUser() {
-      return this.user != null;
-    }
-
-    public void setUserIsSet(boolean value) {
-      if (!value) {
-        this.user = null;
-      }
-    }
-
     public void setFieldValue(_Fields field, Object value) {
       switch (field) {
       case CTX:
@@ -6826,14 +7390,6 @@ public class Jobtracker {
         }
         break;
 
-      case USER:
-        if (value == null) {
-          unsetUser();
-        } else {
-          setUser((String)value);
-        }
-        break;
-
       }
     }
 
@@ -6846,9 +7402,6 @@ public class Jobtracker {
       case CTX:
         return getCtx();
 
-      case USER:
-        return getUser();
-
       }
       throw new IllegalStateException();
     }
@@ -6862,8 +7415,6 @@ public class Jobtracker {
       switch (field) {
       case CTX:
         return isSetCtx();
-      case USER:
-        return isSetUser();
       }
       throw new IllegalStateException();
     }
@@ -6876,12 +7427,12 @@ public class Jobtracker {
     public boolean equals(Object that) {
       if (that == null)
         return false;
-      if (that instanceof getUserJobCounts_args)
-        return this.equals((getUserJobCounts_args)that);
+      if (that instanceof getAllJobs_args)
+        return this.equals((getAllJobs_args)that);
       return false;
     }
 
-    public boolean equals(getUserJobCounts_args that) {
+    public boolean equals(getAllJobs_args that) {
       if (that == null)
         return false;
 
@@ -6894,15 +7445,6 @@ public class Jobtracker {
           return false;
       }
 
-      boolean this_present_user = true && this.isSetUser();
-      boolean that_present_user = true && that.isSetUser();
-      if (this_present_user || that_present_user) {
-        if (!(this_present_user && that_present_user))
-          return false;
-        if (!this.user.equals(that.user))
-          return false;
-      }
-
       return true;
     }
 
@@ -6933,13 +7475,6 @@ public class Jobtracker {
                 TProtocolUtil.skip(iprot, field.type);
               }
               break;
-            case USER:
-              if (field.type == TType.STRING) {
-                this.user = iprot.readString();
-              } else { 
-                TProtocolUtil.skip(iprot, field.type);
-              }
-              break;
           }
           iprot.readFieldEnd();
         }
@@ -6959,18 +7494,13 @@ public class Jobtracker {
         this.ctx.write(oprot);
         oprot.writeFieldEnd();
       }
-      if (this.user != null) {
-        oprot.writeFieldBegin(USER_FIELD_DESC);
-        oprot.writeString(this.user);
-        oprot.writeFieldEnd();
-      }
       oprot.writeFieldStop();
       oprot.writeStructEnd();
     }
 
     @Override
     public String toString() {
-      StringBuilder sb = new StringBuilder("getUserJobCounts_args(");
+      StringBuilder sb = new StringBuilder("getAllJobs_args(");
       boolean first = true;
 
       sb.append("ctx:");
@@ -6980,14 +7510,6 @@ public class Jobtracker {
         sb.append(this.ctx);
       }
       first = false;
-      if (!first) sb.append(", ");
-      sb.append("user:");
-      if (this.user == null) {
-        sb.append("null");
-      } else {
-        sb.append(this.user);
-      }
-      first = false;
       sb.append(")");
       return sb.toString();
     }
@@ -6998,12 +7520,12 @@ public class Jobtracker {
 
   }
 
-  public static class getUserJobCounts_result implements TBase<getUserJobCounts_result._Fields>, java.io.Serializable, Cloneable, Comparable<getUserJobCounts_result>   {
-    private static final TStruct STRUCT_DESC = new TStruct("getUserJobCounts_result");
+  public static class getAllJobs_result implements TBase<getAllJobs_result._Fields>, java.io.Serializable, Cloneable   {
+    private static final TStruct STRUCT_DESC = new TStruct("getAllJobs_result");
 
     private static final TField SUCCESS_FIELD_DESC = new TField("success", TType.STRUCT, (short)0);
 
-    public ThriftUserJobCounts success;
+    public ThriftJobList success;
 
     /** The set of fields this struct contains, along with convenience methods for finding and manipulating them. */
     public enum _Fields implements TFieldIdEnum {
@@ -7064,18 +7586,18 @@ public class Jobtracker {
 
     public static final Map<_Fields, FieldMetaData> metaDataMap = Collections.unmodifiableMap(new EnumMap<_Fields, FieldMetaData>(_Fields.class) {{
       put(_Fields.SUCCESS, new FieldMetaData("success", TFieldRequirementType.DEFAULT, 
-          new StructMetaData(TType.STRUCT, ThriftUserJobCounts.class)));
+          new StructMetaData(TType.STRUCT, ThriftJobList.class)));
     }});
 
     static {
-      FieldMetaData.addStructMetaDataMap(getUserJobCounts_result.class, metaDataMap);
+      FieldMetaData.addStructMetaDataMap(getAllJobs_result.class, metaDataMap);
     }
 
-    public getUserJobCounts_result() {
+    public getAllJobs_result() {
     }
 
-    public getUserJobCounts_result(
-      ThriftUserJobCounts success)
+    public getAllJobs_result(
+      ThriftJobList success)
     {
       this();
       this.success = success;
@@ -7084,26 +7606,26 @@ public class Jobtracker {
     /**
      * Performs a deep copy on <i>other</i>.
      */
-    public getUserJobCounts_result(getUserJobCounts_result other) {
+    public getAllJobs_result(getAllJobs_result other) {
       if (other.isSetSuccess()) {
-        this.success = new ThriftUserJobCounts(other.success);
+        this.success = new ThriftJobList(other.success);
       }
     }
 
-    public getUserJobCounts_result deepCopy() {
-      return new getUserJobCounts_result(this);
+    public getAllJobs_result deepCopy() {
+      return new getAllJobs_result(this);
     }
 
     @Deprecated
-    public getUserJobCounts_result clone() {
-      return new getUserJobCounts_result(this);
+    public getAllJobs_result clone() {
+      return new getAllJobs_result(this);
     }
 
-    public ThriftUserJobCounts getSuccess() {
+    public ThriftJobList getSuccess() {
       return this.success;
     }
 
-    public getUserJobCounts_result setSuccess(ThriftUserJobCounts success) {
+    public getAllJobs_result setSuccess(ThriftJobList success) {
       this.success = success;
       return this;
     }
@@ -7129,7 +7651,7 @@ public class Jobtracker {
         if (value == null) {
           unsetSuccess();
         } else {
-          setSuccess((ThriftUserJobCounts)value);
+          setSuccess((ThriftJobList)value);
         }
         break;
 
@@ -7170,12 +7692,12 @@ public class Jobtracker {
     public boolean equals(Object that) {
       if (that == null)
         return false;
-      if (that instanceof getUserJobCounts_result)
-        return this.equals((getUserJobCounts_result)that);
+      if (that instanceof getAllJobs_result)
+        return this.equals((getAllJobs_result)that);
       return false;
     }
 
-    public boolean equals(getUserJobCounts_result that) {
+    public boolean equals(getAllJobs_result that) {
       if (that == null)
         return false;
 
@@ -7196,25 +7718,6 @@ public class Jobtracker {
       return 0;
     }
 
-    public int compareTo(getUserJobCounts_result other) {
-      if (!getClass().equals(other.getClass())) {
-        return getClass().getName().compareTo(other.getClass().getName());
-      }
-
-      int lastComparison = 0;
-      getUserJobCounts_result typedOther = (getUserJobCounts_result)other;
-
-      lastComparison = Boolean.valueOf(isSetSuccess()).compareTo(isSetSuccess());
-      if (lastComparison != 0) {
-        return lastComparison;
-      }
-      lastComparison = TBaseHelper.compareTo(success, typedOther.success);
-      if (lastComparison != 0) {
-        return lastComparison;
-      }
-      return 0;
-    }
-
     public void read(TProtocol iprot) throws TException {
       TField field;
       iprot.readStructBegin();
@@ -7231,7 +7734,7 @@ public class Jobtracker {
           switch (fieldId) {
             case SUCCESS:
               if (field.type == TType.STRUCT) {
-                this.success = new ThriftUserJobCounts();
+                this.success = new ThriftJobList();
                 this.success.read(iprot);
               } else { 
                 TProtocolUtil.skip(iprot, field.type);
@@ -7261,7 +7764,7 @@ public class Jobtracker {
 
     @Override
     public String toString() {
-      StringBuilder sb = new StringBuilder("getUserJobCounts_result(");
+      StringBuilder sb = new StringBuilder("getAllJobs_result(");
       boolean first = true;
 
       sb.append("success:");
@@ -7281,34 +7784,28 @@ public class Jobtracker {
 
   }
 
-  public static class getTaskList_args implements TBase<getTaskList_args._Fields>, java.io.Serializable, Cloneable   {
-    private static final TStruct STRUCT_DESC = new TStruct("getTaskList_args");
+  public static class getJobSummaries_args implements TBase<getJobSummaries_args._Fields>, java.io.Serializable, Cloneable   {
+    private static final TStruct STRUCT_DESC = new TStruct("getJobSummaries_args");
 
-    private static final TField CTX_FIELD_DESC = new TField("ctx", TType.STRUCT, (short)1);
-    private static final TField JOB_ID_FIELD_DESC = new TField("jobID", TType.STRUCT, (short)2);
-    private static final TField TYPES_FIELD_DESC = new TField("types", TType.SET, (short)3);
-    private static final TField STATES_FIELD_DESC = new TField("states", TType.SET, (short)4);
-    private static final TField TEXT_FIELD_DESC = new TField("text", TType.STRING, (short)5);
-    private static final TField COUNT_FIELD_DESC = new TField("count", TType.I32, (short)6);
-    private static final TField OFFSET_FIELD_DESC = new TField("offset", TType.I32, (short)7);
+    private static final TField CTX_FIELD_DESC = new TField("ctx", TType.STRUCT, (short)10);
+    private static final TField FILTER_FIELD_DESC = new TField("filter", TType.STRUCT, (short)1);
+    private static final TField SORT_FIELD_DESC = new TField("sort", TType.STRUCT, (short)2);
+    private static final TField OFFSET_FIELD_DESC = new TField("offset", TType.I32, (short)3);
+    private static final TField LIMIT_FIELD_DESC = new TField("limit", TType.I32, (short)4);
 
     public org.apache.hadoop.thriftfs.api.RequestContext ctx;
-    public ThriftJobID jobID;
-    public Set<ThriftTaskType> types;
-    public Set<ThriftTaskQueryState> states;
-    public String text;
-    public int count;
+    public ThriftJobFilter filter;
+    public ThriftJobSort sort;
     public int offset;
+    public int limit;
 
     /** The set of fields this struct contains, along with convenience methods for finding and manipulating them. */
     public enum _Fields implements TFieldIdEnum {
-      CTX((short)1, "ctx"),
-      JOB_ID((short)2, "jobID"),
-      TYPES((short)3, "types"),
-      STATES((short)4, "states"),
-      TEXT((short)5, "text"),
-      COUNT((short)6, "count"),
-      OFFSET((short)7, "offset");
+      CTX((short)10, "ctx"),
+      FILTER((short)1, "filter"),
+      SORT((short)2, "sort"),
+      OFFSET((short)3, "offset"),
+      LIMIT((short)4, "limit");
 
       private static final Map<Integer, _Fields> byId = new HashMap<Integer, _Fields>();
       private static final Map<String, _Fields> byName = new HashMap<String, _Fields>();
@@ -7362,104 +7859,80 @@ public class Jobtracker {
     }
 
     // isset id assignments
-    private static final int __COUNT_ISSET_ID = 0;
-    private static final int __OFFSET_ISSET_ID = 1;
+    private static final int __OFFSET_ISSET_ID = 0;
+    private static final int __LIMIT_ISSET_ID = 1;
     private BitSet __isset_bit_vector = new BitSet(2);
 
     public static final Map<_Fields, FieldMetaData> metaDataMap = Collections.unmodifiableMap(new EnumMap<_Fields, FieldMetaData>(_Fields.class) {{
       put(_Fields.CTX, new FieldMetaData("ctx", TFieldRequirementType.DEFAULT, 
           new StructMetaData(TType.STRUCT, org.apache.hadoop.thriftfs.api.RequestContext.class)));
-      put(_Fields.JOB_ID, new FieldMetaData("jobID", TFieldRequirementType.DEFAULT, 
-          new StructMetaData(TType.STRUCT, ThriftJobID.class)));
-      put(_Fields.TYPES, new FieldMetaData("types", TFieldRequirementType.DEFAULT, 
-          new SetMetaData(TType.SET, 
-              new EnumMetaData(TType.ENUM, ThriftTaskType.class))));
-      put(_Fields.STATES, new FieldMetaData("states", TFieldRequirementType.DEFAULT, 
-          new SetMetaData(TType.SET, 
-              new EnumMetaData(TType.ENUM, ThriftTaskQueryState.class))));
-      put(_Fields.TEXT, new FieldMetaData("text", TFieldRequirementType.DEFAULT, 
-          new FieldValueMetaData(TType.STRING)));
-      put(_Fields.COUNT, new FieldMetaData("count", TFieldRequirementType.DEFAULT, 
-          new FieldValueMetaData(TType.I32)));
+      put(_Fields.FILTER, new FieldMetaData("filter", TFieldRequirementType.DEFAULT, 
+          new StructMetaData(TType.STRUCT, ThriftJobFilter.class)));
+      put(_Fields.SORT, new FieldMetaData("sort", TFieldRequirementType.DEFAULT, 
+          new StructMetaData(TType.STRUCT, ThriftJobSort.class)));
       put(_Fields.OFFSET, new FieldMetaData("offset", TFieldRequirementType.DEFAULT, 
           new FieldValueMetaData(TType.I32)));
+      put(_Fields.LIMIT, new FieldMetaData("limit", TFieldRequirementType.DEFAULT, 
+          new FieldValueMetaData(TType.I32)));
     }});
 
     static {
-      FieldMetaData.addStructMetaDataMap(getTaskList_args.class, metaDataMap);
+      FieldMetaData.addStructMetaDataMap(getJobSummaries_args.class, metaDataMap);
     }
 
-    public getTaskList_args() {
+    public getJobSummaries_args() {
     }
 
-    public getTaskList_args(
+    public getJobSummaries_args(
       org.apache.hadoop.thriftfs.api.RequestContext ctx,
-      ThriftJobID jobID,
-      Set<ThriftTaskType> types,
-      Set<ThriftTaskQueryState> states,
-      String text,
-      int count,
-      int offset)
+      ThriftJobFilter filter,
+      ThriftJobSort sort,
+      int offset,
+      int limit)
     {
       this();
       this.ctx = ctx;
-      this.jobID = jobID;
-      this.types = types;
-      this.states = states;
-      this.text = text;
-      this.count = count;
-      setCountIsSet(true);
+      this.filter = filter;
+      this.sort = sort;
       this.offset = offset;
       setOffsetIsSet(true);
+      this.limit = limit;
+      setLimitIsSet(true);
     }
 
     /**
      * Performs a deep copy on <i>other</i>.
      */
-    public getTaskList_args(getTaskList_args other) {
+    public getJobSummaries_args(getJobSummaries_args other) {
       __isset_bit_vector.clear();
       __isset_bit_vector.or(other.__isset_bit_vector);
       if (other.isSetCtx()) {
         this.ctx = new org.apache.hadoop.thriftfs.api.RequestContext(other.ctx);
       }
-      if (other.isSetJobID()) {
-        this.jobID = new ThriftJobID(other.jobID);
-      }
-      if (other.isSetTypes()) {
-        Set<ThriftTaskType> __this__types = new HashSet<ThriftTaskType>();
-        for (ThriftTaskType other_element : other.types) {
-          __this__types.add(other_element);
-        }
-        this.types = __this__types;
-      }
-      if (other.isSetStates()) {
-        Set<ThriftTaskQueryState> __this__states = new HashSet<ThriftTaskQueryState>();
-        for (ThriftTaskQueryState other_element : other.states) {
-          __this__states.add(other_element);
-        }
-        this.states = __this__states;
+      if (other.isSetFilter()) {
+        this.filter = new ThriftJobFilter(other.filter);
       }
-      if (other.isSetText()) {
-        this.text = other.text;
+      if (other.isSetSort()) {
+        this.sort = new ThriftJobSort(other.sort);
       }
-      this.count = other.count;
       this.offset = other.offset;
+      this.limit = other.limit;
     }
 
-    public getTaskList_args deepCopy() {
-      return new getTaskList_args(this);
+    public getJobSummaries_args deepCopy() {
+      return new getJobSummaries_args(this);
     }
 
     @Deprecated
-    public getTaskList_args clone() {
-      return new getTaskList_args(this);
+    public getJobSummaries_args clone() {
+      return new getJobSummaries_args(this);
     }
 
     public org.apache.hadoop.thriftfs.api.RequestContext getCtx() {
       return this.ctx;
     }
 
-    public getTaskList_args setCtx(org.apache.hadoop.thriftfs.api.RequestContext ctx) {
+    public getJobSummaries_args setCtx(org.apache.hadoop.thriftfs.api.RequestContext ctx) {
       this.ctx = ctx;
       return this;
     }
@@ -7479,160 +7952,59 @@ public class Jobtracker {
       }
     }
 
-    public ThriftJobID getJobID() {
-      return this.jobID;
+    public ThriftJobFilter getFilter() {
+      return this.filter;
     }
 
-    public getTaskList_args setJobID(ThriftJobID jobID) {
-      this.jobID = jobID;
+    public getJobSummaries_args setFilter(ThriftJobFilter filter) {
+      this.filter = filter;
       return this;
     }
 
-    public void unsetJobID() {
-      this.jobID = null;
-    }
-
-    /** Returns true if field jobID is set (has been asigned a value) and false otherwise */
-    public boolean isSetJobID() {
-      return this.jobID != null;
-    }
-
-    public void setJobIDIsSet(boolean value) {
-      if (!value) {
-        this.jobID = null;
-      }
-    }
-
-    public int getTypesSize() {
-      return (this.types == null) ? 0 : this.types.size();
-    }
-
-    public java.util.Iterator<ThriftTaskType> getTypesIterator() {
-      return (this.types == null) ? null : this.types.iterator();
-    }
-
-    public void addToTypes(ThriftTaskType elem) {
-      if (this.types == null) {
-        this.types = new HashSet<ThriftTaskType>();
-      }
-      this.types.add(elem);
-    }
-
-    public Set<ThriftTaskType> getTypes() {
-      return this.types;
-    }
-
-    public getTaskList_args setTypes(Set<ThriftTaskType> types) {
-      this.types = types;
-      return this;
-    }
-
-    public void unsetTypes() {
-      this.types = null;
-    }
-
-    /** Returns true if field types is set (has been asigned a value) and false otherwise */
-    public boolean isSetTypes() {
-      return this.types != null;
-    }
-
-    public void setTypesIsSet(boolean value) {
-      if (!value) {
-        this.types = null;
-      }
-    }
-
-    public int getStatesSize() {
-      return (this.states == null) ? 0 : this.states.size();
-    }
-
-    public java.util.Iterator<ThriftTaskQueryState> getStatesIterator() {
-      return (this.states == null) ? null : this.states.iterator();
-    }
-
-    public void addToStates(ThriftTaskQueryState elem) {
-      if (this.states == null) {
-        this.states = new HashSet<ThriftTaskQueryState>();
-      }
-      this.states.add(elem);
-    }
-
-    public Set<ThriftTaskQueryState> getStates() {
-      return this.states;
-    }
-
-    public getTaskList_args setStates(Set<ThriftTaskQueryState> states) {
-      this.states = states;
-      return this;
-    }
-
-    public void unsetStates() {
-      this.states = null;
+    public void unsetFilter() {
+      this.filter = null;
     }
 
-    /** Returns true if field states is set (has been asigned a value) and false otherwise */
-    public boolean isSetStates() {
-      return this.states != null;
+    /** Returns true if field filter is set (has been asigned a value) and false otherwise */
+    public boolean isSetFilter() {
+      return this.filter != null;
     }
 
-    public void setStatesIsSet(boolean value) {
+    public void setFilterIsSet(boolean value) {
       if (!value) {
-        this.states = null;
+        this.filter = null;
       }
     }
 
-    public String getText() {
-      return this.text;
+    public ThriftJobSort getSort() {
+      return this.sort;
     }
 
-    public getTaskList_args setText(String text) {
-      this.text = text;
+    public getJobSummaries_args setSort(ThriftJobSort sort) {
+      this.sort = sort;
       return this;
     }
 
-    public void unsetText() {
-      this.text = null;
+    public void unsetSort() {
+      this.sort = null;
     }
 
-    /** Returns true if field text is set (has been asigned a value) and false otherwise */
-    public boolean isSetText() {
-      return this.text != null;
+    /** Returns true if field sort is set (has been asigned a value) and false otherwise */
+    public boolean isSetSort() {
+      return this.sort != null;
     }
 
-    public void setTextIsSet(boolean value) {
+    public void setSortIsSet(boolean value) {
       if (!value) {
-        this.text = null;
+        this.sort = null;
       }
     }
 
-    public int getCount() {
-      return this.count;
-    }
-
-    public getTaskList_args setCount(int count) {
-      this.count = count;
-      setCountIsSet(true);
-      return this;
-    }
-
-    public void unsetCount() {
-      __isset_bit_vector.clear(__COUNT_ISSET_ID);
-    }
-
-    /** Returns true if field count is set (has been asigned a value) and false otherwise */
-    public boolean isSetCount() {
-      return __isset_bit_vector.get(__COUNT_ISSET_ID);
-    }
-
-    public void setCountIsSet(boolean value) {
-      __isset_bit_vector.set(__COUNT_ISSET_ID, value);
-    }
-
     public int getOffset() {
       return this.offset;
     }
 
-    public getTaskList_args setOffset(int offset) {
+    public getJobSummaries_args setOffset(int offset) {
       this.offset = offset;
       setOffsetIsSet(true);
       return this;
@@ -7651,6 +8023,29 @@ public class Jobtracker {
       __isset_bit_vector.set(__OFFSET_ISSET_ID, value);
     }
 
+    public int getLimit() {
+      return this.limit;
+    }
+
+    public getJobSummaries_args setLimit(int limit) {
+      this.limit = limit;
+      setLimitIsSet(true);
+      return this;
+    }
+
+    public void unsetLimit() {
+      __isset_bit_vector.clear(__LIMIT_ISSET_ID);
+    }
+
+    /** Returns true if field limit is set (has been asigned a value) and false otherwise */
+    public boolean isSetLimit() {
+      return __isset_bit_vector.get(__LIMIT_ISSET_ID);
+    }
+
+    public void setLimitIsSet(boolean value) {
+      __isset_bit_vector.set(__LIMIT_ISSET_ID, value);
+    }
+
     public void setFieldValue(_Fields field, Object value) {
       switch (field) {
       case CTX:
@@ -7661,51 +8056,5196 @@ public class Jobtracker {
         }
         break;
 
-      case JOB_ID:
+      case FILTER:
         if (value == null) {
-          unsetJobID();
+          unsetFilter();
         } else {
-          setJobID((ThriftJobID)value);
+          setFilter((ThriftJobFilter)value);
         }
         break;
 
-      case TYPES:
+      case SORT:
         if (value == null) {
-          unsetTypes();
+          unsetSort();
         } else {
-          setTypes((Set<ThriftTaskType>)value);
+          setSort((ThriftJobSort)value);
         }
         break;
 
-      case STATES:
+      case OFFSET:
         if (value == null) {
-          unsetStates();
+          unsetOffset();
         } else {
-          setStates((Set<ThriftTaskQueryState>)value);
+          setOffset((Integer)value);
         }
         break;
 
-      case TEXT:
+      case LIMIT:
         if (value == null) {
-          unsetText();
+          unsetLimit();
         } else {
-          setText((String)value);
+          setLimit((Integer)value);
         }
         break;
 
-      case COUNT:
+      }
+    }
+
+    public void setFieldValue(int fieldID, Object value) {
+      setFieldValue(_Fields.findByThriftIdOrThrow(fieldID), value);
+    }
+
+    public Object getFieldValue(_Fields field) {
+      switch (field) {
+      case CTX:
+        return getCtx();
+
+      case FILTER:
+        return getFilter();
+
+      case SORT:
+        return getSort();
+
+      case OFFSET:
+        return new Integer(getOffset());
+
+      case LIMIT:
+        return new Integer(getLimit());
+
+      }
+      throw new IllegalStateException();
+    }
+
+    public Object getFieldValue(int fieldId) {
+      return getFieldValue(_Fields.findByThriftIdOrThrow(fieldId));
+    }
+
+    /** Returns true if field corresponding to fieldID is set (has been asigned a value) and false otherwise */
+    public boolean isSet(_Fields field) {
+      switch (field) {
+      case CTX:
+        return isSetCtx();
+      case FILTER:
+        return isSetFilter();
+      case SORT:
+        return isSetSort();
+      case OFFSET:
+        return isSetOffset();
+      case LIMIT:
+        return isSetLimit();
+      }
+      throw new IllegalStateException();
+    }
+
+    public boolean isSet(int fieldID) {
+      return isSet(_Fields.findByThriftIdOrThrow(fieldID));
+    }
+
+    @Override
+    public boolean equals(Object that) {
+      if (that == null)
+        return false;
+      if (that instanceof getJobSummaries_args)
+        return this.equals((getJobSummaries_args)that);
+      return false;
+    }
+
+    public boolean equals(getJobSummaries_args that) {
+      if (that == null)
+        return false;
+
+      boolean this_present_ctx = true && this.isSetCtx();
+      boolean that_present_ctx = true && that.isSetCtx();
+      if (this_present_ctx || that_present_ctx) {
+        if (!(this_present_ctx && that_present_ctx))
+          return false;
+        if (!this.ctx.equals(that.ctx))
+          return false;
+      }
+
+      boolean this_present_filter = true && this.isSetFilter();
+      boolean that_present_filter = true && that.isSetFilter();
+      if (this_present_filter || that_present_filter) {
+        if (!(this_present_filter && that_present_filter))
+          return false;
+        if (!this.filter.equals(that.filter))
+          return false;
+      }
+
+      boolean this_present_sort = true && this.isSetSort();
+      boolean that_present_sort = true && that.isSetSort();
+      if (this_present_sort || that_present_sort) {
+        if (!(this_present_sort && that_present_sort))
+          return false;
+        if (!this.sort.equals(that.sort))
+          return false;
+      }
+
+      boolean this_present_offset = true;
+      boolean that_present_offset = true;
+      if (this_present_offset || that_present_offset) {
+        if (!(this_present_offset && that_present_offset))
+          return false;
+        if (this.offset != that.offset)
+          return false;
+      }
+
+      boolean this_present_limit = true;
+      boolean that_present_limit = true;
+      if (this_present_limit || that_present_limit) {
+        if (!(this_present_limit && that_present_limit))
+          return false;
+        if (this.limit != that.limit)
+          return false;
+      }
+
+      return true;
+    }
+
+    @Override
+    public int hashCode() {
+      return 0;
+    }
+
+    public void read(TProtocol iprot) throws TException {
+      TField field;
+      iprot.readStructBegin();
+      while (true)
+      {
+        field = iprot.readFieldBegin();
+        if (field.type == TType.STOP) { 
+          break;
+        }
+        _Fields fieldId = _Fields.findByThriftId(field.id);
+        if (fieldId == null) {
+          TProtocolUtil.skip(iprot, field.type);
+        } else {
+          switch (fieldId) {
+            case CTX:
+              if (field.type == TType.STRUCT) {
+                this.ctx = new org.apache.hadoop.thriftfs.api.RequestContext();
+                this.ctx.read(iprot);
+              } else { 
+                TProtocolUtil.skip(iprot, field.type);
+              }
+              break;
+            case FILTER:
+              if (field.type == TType.STRUCT) {
+                this.filter = new ThriftJobFilter();
+                this.filter.read(iprot);
+              } else { 
+                TProtocolUtil.skip(iprot, field.type);
+              }
+              break;
+            case SORT:
+              if (field.type == TType.STRUCT) {
+                this.sort = new ThriftJobSort();
+                this.sort.read(iprot);
+              } else { 
+                TProtocolUtil.skip(iprot, field.type);
+              }
+              break;
+            case OFFSET:
+              if (field.type == TType.I32) {
+                this.offset = iprot.readI32();
+                setOffsetIsSet(true);
+              } else { 
+                TProtocolUtil.skip(iprot, field.type);
+              }
+              break;
+            case LIMIT:
+              if (field.type == TType.I32) {
+                this.limit = iprot.readI32();
+                setLimitIsSet(true);
+              } else { 
+                TProtocolUtil.skip(iprot, field.type);
+              }
+              break;
+          }
+          iprot.readFieldEnd();
+        }
+      }
+      iprot.readStructEnd();
+
+      // check for required fields of primitive type, which can't be checked in the validate method
+      validate();
+    }
+
+    public void write(TProtocol oprot) throws TException {
+      validate();
+
+      oprot.writeStructBegin(STRUCT_DESC);
+      if (this.filter != null) {
+        oprot.writeFieldBegin(FILTER_FIELD_DESC);
+        this.filter.write(oprot);
+        oprot.writeFieldEnd();
+      }
+      if (this.sort != null) {
+        oprot.writeFieldBegin(SORT_FIELD_DESC);
+        this.sort.write(oprot);
+        oprot.writeFieldEnd();
+      }
+      oprot.writeFieldBegin(OFFSET_FIELD_DESC);
+      oprot.writeI32(this.offset);
+      oprot.writeFieldEnd();
+      oprot.writeFieldBegin(LIMIT_FIELD_DESC);
+      oprot.writeI32(this.limit);
+      oprot.writeFieldEnd();
+      if (this.ctx != null) {
+        oprot.writeFieldBegin(CTX_FIELD_DESC);
+        this.ctx.write(oprot);
+        oprot.writeFieldEnd();
+      }
+      oprot.writeFieldStop();
+      oprot.writeStructEnd();
+    }
+
+    @Override
+    public String toString() {
+      StringBuilder sb = new StringBuilder("getJobSummaries_args(");
+      boolean first = true;
+
+      sb.append("ctx:");
+      if (this.ctx == null) {
+        sb.append("null");
+      } else {
+        sb.append(this.ctx);
+      }
+      first = false;
+      if (!first) sb.append(", ");
+      sb.append("filter:");
+      if (this.filter == null) {
+        sb.append("null");
+      } else {
+        sb.append(this.filter);
+      }
+      first = false;
+      if (!first) sb.append(", ");
+      sb.append("sort:");
+      if (this.sort == null) {
+        sb.append("null");
+      } else {
+        sb.append(this.sort);
+      }
+      first = false;
+      if (!first) sb.append(", ");
+      sb.append("offset:");
+      sb.append(this.offset);
+      first = false;
+      if (!first) sb.append(", ");
+      sb.append("limit:");
+      sb.append(this.limit);
+      first = false;
+      sb.append(")");
+      return sb.toString();
+    }
+
+    public void validate() throws TException {
+      // check for required fields
+    }
+
+  }
+
+  public static class getJobSummaries_result implements TBase<getJobSummaries_result._Fields>, java.io.Serializable, Cloneable, Comparable<getJobSummaries_result>   {
+    private static final TStruct STRUCT_DESC = new TStruct("getJobSummaries_result");
+
+    private static final TField SUCCESS_FIELD_DESC = new TField("success", TType.STRUCT, (short)0);
+
+    public ThriftJobSummaryList success;
+
+    /** The set of fields this struct contains, along with convenience methods for finding and manipulating them. */
+    public enum _Fields implements TFieldIdEnum {
+      SUCCESS((short)0, "success");
+
+      private static final Map<Integer, _Fields> byId = new HashMap<Integer, _Fields>();
+      private static final Map<String, _Fields> byName = new HashMap<String, _Fields>();
+
+      static {
+        for (_Fields field : EnumSet.allOf(_Fields.class)) {
+          byId.put((int)field._thriftId, field);
+          byName.put(field.getFieldName(), field);
+        }
+      }
+
+      /**
+       * Find the _Fields constant that matches fieldId, or null if its not found.
+       */
+      public static _Fields findByThriftId(int fieldId) {
+        return byId.get(fieldId);
+      }
+
+      /**
+       * Find the _Fields constant that matches fieldId, throwing an exception
+       * if it is not found.
+       */
+      public static _Fields findByThriftIdOrThrow(int fieldId) {
+        _Fields fields = findByThriftId(fieldId);
+        if (fields == null) throw new IllegalArgumentException("Field " + fieldId + " doesn't exist!");
+        return fields;
+      }
+
+      /**
+       * Find the _Fields constant that matches name, or null if its not found.
+       */
+      public static _Fields findByName(String name) {
+        return byName.get(name);
+      }
+
+      private final short _thriftId;
+      private final String _fieldName;
+
+      _Fields(short thriftId, String fieldName) {
+        _thriftId = thriftId;
+        _fieldName = fieldName;
+      }
+
+      public short getThriftFieldId() {
+        return _thriftId;
+      }
+
+      public String getFieldName() {
+        return _fieldName;
+      }
+    }
+
+    // isset id assignments
+
+    public static final Map<_Fields, FieldMetaData> metaDataMap = Collections.unmodifiableMap(new EnumMap<_Fields, FieldMetaData>(_Fields.class) {{
+      put(_Fields.SUCCESS, new FieldMetaData("success", TFieldRequirementType.DEFAULT, 
+          new StructMetaData(TType.STRUCT, ThriftJobSummaryList.class)));
+    }});
+
+    static {
+      FieldMetaData.addStructMetaDataMap(getJobSummaries_result.class, metaDataMap);
+    }
+
+    public getJobSummaries_result() {
+    }
+
+    public getJobSummaries_result(
+      ThriftJobSummaryList success)
+    {
+      this();
+      this.success = success;
+    }
+
+    /**
+     * Performs a deep copy on <i>other</i>.
+     */
+    public getJobSummaries_result(getJobSummaries_result other) {
+      if (other.isSetSuccess()) {
+        this.success = new ThriftJobSummaryList(other.success);
+      }
+    }
+
+    public getJobSummaries_result deepCopy() {
+      return new getJobSummaries_result(this);
+    }
+
+    @Deprecated
+    public getJobSummaries_result clone() {
+      return new getJobSummaries_result(this);
+    }
+
+    public ThriftJobSummaryList getSuccess() {
+      return this.success;
+    }
+
+    public getJobSummaries_result setSuccess(ThriftJobSummaryList success) {
+      this.success = success;
+      return this;
+    }
+
+    public void unsetSuccess() {
+      this.success = null;
+    }
+
+    /** Returns true if field success is set (has been asigned a value) and false otherwise */
+    public boolean isSetSuccess() {
+      return this.success != null;
+    }
+
+    public void setSuccessIsSet(boolean value) {
+      if (!value) {
+        this.success = null;
+      }
+    }
+
+    public void setFieldValue(_Fields field, Object value) {
+      switch (field) {
+      case SUCCESS:
+        if (value == null) {
+          unsetSuccess();
+        } else {
+          setSuccess((ThriftJobSummaryList)value);
+        }
+        break;
+
+      }
+    }
+
+    public void setFieldValue(int fieldID, Object value) {
+      setFieldValue(_Fields.findByThriftIdOrThrow(fieldID), value);
+    }
+
+    public Object getFieldValue(_Fields field) {
+      switch (field) {
+      case SUCCESS:
+        return getSuccess();
+
+      }
+      throw new IllegalStateException();
+    }
+
+    public Object getFieldValue(int fieldId) {
+      return getFieldValue(_Fields.findByThriftIdOrThrow(fieldId));
+    }
+
+    /** Returns true if field corresponding to fieldID is set (has been asigned a value) and false otherwise */
+    public boolean isSet(_Fields field) {
+      switch (field) {
+      case SUCCESS:
+        return isSetSuccess();
+      }
+      throw new IllegalStateException();
+    }
+
+    public boolean isSet(int fieldID) {
+      return isSet(_Fields.findByThriftIdOrThrow(fieldID));
+    }
+
+    @Override
+    public boolean equals(Object that) {
+      if (that == null)
+        return false;
+      if (that instanceof getJobSummaries_result)
+        return this.equals((getJobSummaries_result)that);
+      return false;
+    }
+
+    public boolean equals(getJobSummaries_result that) {
+      if (that == null)
+        return false;
+
+      boolean this_present_success = true && this.isSetSuccess();
+      boolean that_present_success = true && that.isSetSuccess();
+      if (this_present_success || that_present_success) {
+        if (!(this_present_success && that_present_success))
+          return false;
+        if (!this.success.equals(that.success))
+          return false;
+      }
+
+      return true;
+    }
+
+    @Override
+    public int hashCode() {
+      return 0;
+    }
+
+    public int compareTo(getJobSummaries_result other) {
+      if (!getClass().equals(other.getClass())) {
+        return getClass().getName().compareTo(other.getClass().getName());
+      }
+
+      int lastComparison = 0;
+      getJobSummaries_result typedOther = (getJobSummaries_result)other;
+
+      lastComparison = Boolean.valueOf(isSetSuccess()).compareTo(isSetSuccess());
+      if (lastComparison != 0) {
+        return lastComparison;
+      }
+      lastComparison = TBaseHelper.compareTo(success, typedOther.success);
+      if (lastComparison != 0) {
+        return lastComparison;
+      }
+      return 0;
+    }
+
+    public void read(TProtocol iprot) throws TException {
+      TField field;
+      iprot.readStructBegin();
+      while (true)
+      {
+        field = iprot.readFieldBegin();
+        if (field.type == TType.STOP) { 
+          break;
+        }
+        _Fields fieldId = _Fields.findByThriftId(field.id);
+        if (fieldId == null) {
+          TProtocolUtil.skip(iprot, field.type);
+        } else {
+          switch (fieldId) {
+            case SUCCESS:
+              if (field.type == TType.STRUCT) {
+                this.success = new ThriftJobSummaryList();
+                this.success.read(iprot);
+              } else { 
+                TProtocolUtil.skip(iprot, field.type);
+              }
+              break;
+          }
+          iprot.readFieldEnd();
+        }
+      }
+      iprot.readStructEnd();
+
+      // check for required fields of primitive type, which can't be checked in the validate method
+      validate();
+    }
+
+    public void write(TProtocol oprot) throws TException {
+      oprot.writeStructBegin(STRUCT_DESC);
+
+      if (this.isSetSuccess()) {
+        oprot.writeFieldBegin(SUCCESS_FIELD_DESC);
+        this.success.write(oprot);
+        oprot.writeFieldEnd();
+      }
+      oprot.writeFieldStop();
+      oprot.writeStructEnd();
+    }
+
+    @Override
+    public String toString() {
+      StringBuilder sb = new StringBuilder("getJobSummaries_result(");
+      boolean first = true;
+
+      sb.append("success:");
+      if (this.success == null) {
+        sb.append("null");
+      } else {
+        sb.append(this.success);
+      }
+      first = false;
+      sb.append(")");
+      return sb.toString();
+    }
+
+    public void validate() throws TException {
+      // check for required fields
+    }
+
+  }
+
+  public static class getJobsChangedSince_args implements TBase<getJobsChangedSince_args._Fields>, java.io.Serializable, Cloneable   {
+    private static final TStruct STRUCT_DESC = new TStruct("getJobsChangedSince_args");
+
+    private static final TField CTX_FIELD_DESC = new TField("ctx", TType.STRUCT, (short)10);
+    private static final TField TOKEN_FIELD_DESC = new TField("token", TType.I64, (short)1);
+
+    public org.apache.hadoop.thriftfs.api.RequestContext ctx;
+    public long token;
+
+    /** The set of fields this struct contains, along with convenience methods for finding and manipulating them. */
+    public enum _Fields implements TFieldIdEnum {
+      CTX((short)10, "ctx"),
+      TOKEN((short)1, "token");
+
+      private static final Map<Integer, _Fields> byId = new HashMap<Integer, _Fields>();
+      private static final Map<String, _Fields> byName = new HashMap<String, _Fields>();
+
+      static {
+        for (_Fields field : EnumSet.allOf(_Fields.class)) {
+          byId.put((int)field._thriftId, field);
+          byName.put(field.getFieldName(), field);
+        }
+      }
+
+      /**
+       * Find the _Fields constant that matches fieldId, or null if its not found.
+       */
+      public static _Fields findByThriftId(int fieldId) {
+        return byId.get(fieldId);
+      }
+
+      /**
+       * Find the _Fields constant that matches fieldId, throwing an exception
+       * if it is not found.
+       */
+      public static _Fields findByThriftIdOrThrow(int fieldId) {
+        _Fields fields = findByThriftId(fieldId);
+        if (fields == null) throw new IllegalArgumentException("Field " + fieldId + " doesn't exist!");
+        return fields;
+      }
+
+      /**
+       * Find the _Fields constant that matches name, or null if its not found.
+       */
+      public static _Fields findByName(String name) {
+        return byName.get(name);
+      }
+
+      private final short _thriftId;
+      private final String _fieldName;
+
+      _Fields(short thriftId, String fieldName) {
+        _thriftId = thriftId;
+        _fieldName = fieldName;
+      }
+
+      public short getThriftFieldId() {
+        return _thriftId;
+      }
+
+      public String getFieldName() {
+        return _fieldName;
+      }
+    }
+
+    // isset id assignments
+    private static final int __TOKEN_ISSET_ID = 0;
+    private BitSet __isset_bit_vector = new BitSet(1);
+
+    public static final Map<_Fields, FieldMetaData> metaDataMap = Collections.unmodifiableMap(new EnumMap<_Fields, FieldMetaData>(_Fields.class) {{
+      put(_Fields.CTX, new FieldMetaData("ctx", TFieldRequirementType.DEFAULT, 
+          new StructMetaData(TType.STRUCT, org.apache.hadoop.thriftfs.api.RequestContext.class)));
+      put(_Fields.TOKEN, new FieldMetaData("token", TFieldRequirementType.DEFAULT, 
+          new FieldValueMetaData(TType.I64)));
+    }});
+
+    static {
+      FieldMetaData.addStructMetaDataMap(getJobsChangedSince_args.class, metaDataMap);
+    }
+
+    public getJobsChangedSince_args() {
+    }
+
+    public getJobsChangedSince_args(
+      org.apache.hadoop.thriftfs.api.RequestContext ctx,
+      long token)
+    {
+      this();
+      this.ctx = ctx;
+      this.token = token;
+      setTokenIsSet(true);
+    }
+
+    /**
+     * Performs a deep copy on <i>other</i>.
+     */
+    public getJobsChangedSince_args(getJobsChangedSince_args other) {
+      __isset_bit_vector.clear();
+      __isset_bit_vector.or(other.__isset_bit_vector);
+      if (other.isSetCtx()) {
+        this.ctx = new org.apache.hadoop.thriftfs.api.RequestContext(other.ctx);
+      }
+      this.token = other.token;
+    }
+
+    public getJobsChangedSince_args deepCopy() {
+      return new getJobsChangedSince_args(this);
+    }
+
+    @Deprecated
+    public getJobsChangedSince_args clone() {
+      return new getJobsChangedSince_args(this);
+    }
+
+    public org.apache.hadoop.thriftfs.api.RequestContext getCtx() {
+      return this.ctx;
+    }
+
+    public getJobsChangedSince_args setCtx(org.apache.hadoop.thriftfs.api.RequestContext ctx) {
+      this.ctx = ctx;
+      return this;
+    }
+
+    public void unsetCtx() {
+      this.ctx = null;
+    }
+
+    /** Returns true if field ctx is set (has been asigned a value) and false otherwise */
+    public boolean isSetCtx() {
+      return this.ctx != null;
+    }
+
+    public void setCtxIsSet(boolean value) {
+      if (!value) {
+        this.ctx = null;
+      }
+    }
+
+    public long getToken() {
+      return this.token;
+    }
+
+    public getJobsChangedSince_args setToken(long token) {
+      this.token = token;
+      setTokenIsSet(true);
+      return this;
+    }
+
+    public void unsetToken() {
+      __isset_bit_vector.clear(__TOKEN_ISSET_ID);
+    }
+
+    /** Returns true if field token is set (has been asigned a value) and false otherwise */
+    public boolean isSetToken() {
+      return __isset_bit_vector.get(__TOKEN_ISSET_ID);
+    }
+
+    public void setTokenIsSet(boolean value) {
+      __isset_bit_vector.set(__TOKEN_ISSET_ID, value);
+    }
+
+    public void setFieldValue(_Fields field, Object value) {
+      switch (field) {
+      case CTX:
+        if (value == null) {
+          unsetCtx();
+        } else {
+          setCtx((org.apache.hadoop.thriftfs.api.RequestContext)value);
+        }
+        break;
+
+      case TOKEN:
+        if (value == null) {
+          unsetToken();
+        } else {
+          setToken((Long)value);
+        }
+        break;
+
+      }
+    }
+
+    public void setFieldValue(int fieldID, Object value) {
+      setFieldValue(_Fields.findByThriftIdOrThrow(fieldID), value);
+    }
+
+    public Object getFieldValue(_Fields field) {
+      switch (field) {
+      case CTX:
+        return getCtx();
+
+      case TOKEN:
+        return new Long(getToken());
+
+      }
+      throw new IllegalStateException();
+    }
+
+    public Object getFieldValue(int fieldId) {
+      return getFieldValue(_Fields.findByThriftIdOrThrow(fieldId));
+    }
+
+    /** Returns true if field corresponding to fieldID is set (has been asigned a value) and false otherwise */
+    public boolean isSet(_Fields field) {
+      switch (field) {
+      case CTX:
+        return isSetCtx();
+      case TOKEN:
+        return isSetToken();
+      }
+      throw new IllegalStateException();
+    }
+
+    public boolean isSet(int fieldID) {
+      return isSet(_Fields.findByThriftIdOrThrow(fieldID));
+    }
+
+    @Override
+    public boolean equals(Object that) {
+      if (that == null)
+        return false;
+      if (that instanceof getJobsChangedSince_args)
+        return this.equals((getJobsChangedSince_args)that);
+      return false;
+    }
+
+    public boolean equals(getJobsChangedSince_args that) {
+      if (that == null)
+        return false;
+
+      boolean this_present_ctx = true && this.isSetCtx();
+      boolean that_present_ctx = true && that.isSetCtx();
+      if (this_present_ctx || that_present_ctx) {
+        if (!(this_present_ctx && that_present_ctx))
+          return false;
+        if (!this.ctx.equals(that.ctx))
+          return false;
+      }
+
+      boolean this_present_token = true;
+      boolean that_present_token = true;
+      if (this_present_token || that_present_token) {
+        if (!(this_present_token && that_present_token))
+          return false;
+        if (this.token != that.token)
+          return false;
+      }
+
+      return true;
+    }
+
+    @Override
+    public int hashCode() {
+      return 0;
+    }
+
+    public void read(TProtocol iprot) throws TException {
+      TField field;
+      iprot.readStructBegin();
+      while (true)
+      {
+        field = iprot.readFieldBegin();
+        if (field.type == TType.STOP) { 
+          break;
+        }
+        _Fields fieldId = _Fields.findByThriftId(field.id);
+        if (fieldId == null) {
+          TProtocolUtil.skip(iprot, field.type);
+        } else {
+          switch (fieldId) {
+            case CTX:
+              if (field.type == TType.STRUCT) {
+                this.ctx = new org.apache.hadoop.thriftfs.api.RequestContext();
+                this.ctx.read(iprot);
+              } else { 
+                TProtocolUtil.skip(iprot, field.type);
+              }
+              break;
+            case TOKEN:
+              if (field.type == TType.I64) {
+                this.token = iprot.readI64();
+                setTokenIsSet(true);
+              } else { 
+                TProtocolUtil.skip(iprot, field.type);
+              }
+              break;
+          }
+          iprot.readFieldEnd();
+        }
+      }
+      iprot.readStructEnd();
+
+      // check for required fields of primitive type, which can't be checked in the validate method
+      validate();
+    }
+
+    public void write(TProtocol oprot) throws TException {
+      validate();
+
+      oprot.writeStructBegin(STRUCT_DESC);
+      oprot.writeFieldBegin(TOKEN_FIELD_DESC);
+      oprot.writeI64(this.token);
+      oprot.writeFieldEnd();
+      if (this.ctx != null) {
+        oprot.writeFieldBegin(CTX_FIELD_DESC);
+        this.ctx.write(oprot);
+        oprot.writeFieldEnd();
+      }
+      oprot.writeFieldStop();
+      oprot.writeStructEnd();
+    }
+
+    @Override
+    public String toString() {
+      StringBuilder sb = new StringBuilder("getJobsChangedSince_args(");
+      boolean first = true;
+
+      sb.append("ctx:");
+      if (this.ctx == null) {
+        sb.append("null");
+      } else {
+        sb.append(this.ctx);
+      }
+      first = false;
+      if (!first) sb.append(", ");
+      sb.append("token:");
+      sb.append(this.token);
+      first = false;
+      sb.append(")");
+      return sb.toString();
+    }
+
+    public void validate() throws TException {
+      // check for required fields
+    }
+
+  }
+
+  public static class getJobsChangedSince_result implements TBase<getJobsChangedSince_result._Fields>, java.io.Serializable, Cloneable, Comparable<getJobsChangedSince_result>   {
+    private static final TStruct STRUCT_DESC = new TStruct("getJobsChangedSince_result");
+
+    private static final TField SUCCESS_FIELD_DESC = new TField("success", TType.STRUCT, (short)0);
+
+    public ThriftJobChanges success;
+
+    /** The set of fields this struct contains, along with convenience methods for finding and manipulating them. */
+    public enum _Fields implements TFieldIdEnum {
+      SUCCESS((short)0, "success");
+
+      private static final Map<Integer, _Fields> byId = new HashMap<Integer, _Fields>();
+      private static final Map<String, _Fields> byName = new HashMap<String, _Fields>();
+
+      static {
+        for (_Fields field : EnumSet.allOf(_Fields.class)) {
+          byId.put((int)field._thriftId, field);
+          byName.put(field.getFieldName(), field);
+        }
+      }
+
+      /**
+       * Find the _Fields constant that matches fieldId, or null if its not found.
+       */
+      public static _Fields findByThriftId(int fieldId) {
+        return byId.get(fieldId);
+      }
+
+      /**
+       * Find the _Fields constant that matches fieldId, throwing an exception
+       * if it is not found.
+       */
+      public static _Fields findByThriftIdOrThrow(int fieldId) {
+        _Fields fields = findByThriftId(fieldId);
+        if (fields == null) throw new IllegalArgumentException("Field " + fieldId + " doesn't exist!");
+        return fields;
+      }
+
+      /**
+       * Find the _Fields constant that matches name, or null if its not found.
+       */
+      public static _Fields findByName(String name) {
+        return byName.get(name);
+      }
+
+      private final short _thriftId;
+      private final String _fieldName;
+
+      _Fields(short thriftId, String fieldName) {
+        _thriftId = thriftId;
+        _fieldName = fieldName;
+      }
+
+      public short getThriftFieldId() {
+        return _thriftId;
+      }
+
+      public String getFieldName() {
+        return _fieldName;
+      }
+    }
+
+    // isset id assignments
+
+    public static final Map<_Fields, FieldMetaData> metaDataMap = Collections.unmodifiableMap(new EnumMap<_Fields, FieldMetaData>(_Fields.class) {{
+      put(_Fields.SUCCESS, new FieldMetaData("success", TFieldRequirementType.DEFAULT, 
+          new StructMetaData(TType.STRUCT, ThriftJobChanges.class)));
+    }});
+
+    static {
+      FieldMetaData.addStructMetaDataMap(getJobsChangedSince_result.class, metaDataMap);
+    }
+
+    public getJobsChangedSince_result() {
+    }
+
+    public getJobsChangedSince_result(
+      ThriftJobChanges success)
+    {
+      this();
+      this.success = success;
+    }
+
+    /**
+     * Performs a deep copy on <i>other</i>.
+     */
+    public getJobsChangedSince_result(getJobsChangedSince_result other) {
+      if (other.isSetSuccess()) {
+        this.success = new ThriftJobChanges(other.success);
+      }
+    }
+
+    public getJobsChangedSince_result deepCopy() {
+      return new getJobsChangedSince_result(this);
+    }
+
+    @Deprecated
+    public getJobsChangedSince_result clone() {
+      return new getJobsChangedSince_result(this);
+    }
+
+    public ThriftJobChanges getSuccess() {
+      return this.success;
+    }
+
+    public getJobsChangedSince_result setSuccess(ThriftJobChanges success) {
+      this.success = success;
+      return this;
+    }
+
+    public void unsetSuccess() {
+      this.success = null;
+    }
+
+    /** Returns true if field success is set (has been asigned a value) and false otherwise */
+    public boolean isSetSuccess() {
+      return this.success != null;
+    }
+
+    public void setSuccessIsSet(boolean value) {
+      if (!value) {
+        this.success = null;
+      }
+    }
+
+    public void setFieldValue(_Fields field, Object value) {
+      switch (field) {
+      case SUCCESS:
+        if (value == null) {
+          unsetSuccess();
+        } else {
+          setSuccess((ThriftJobChanges)value);
+        }
+        break;
+
+      }
+    }
+
+    public void setFieldValue(int fieldID, Object value) {
+      setFieldValue(_Fields.findByThriftIdOrThrow(fieldID), value);
+    }
+
+    public Object getFieldValue(_Fields field) {
+      switch (field) {
+      case SUCCESS:
+        return getSuccess();
+
+      }
+      throw new IllegalStateException();
+    }
+
+    public Object getFieldValue(int fieldId) {
+      return getFieldValue(_Fields.findByThriftIdOrThrow(fieldId));
+    }
+
+    /** Returns true if field corresponding to fieldID is set (has been asigned a value) and false otherwise */
+    public boolean isSet(_Fields field) {
+      switch (field) {
+      case SUCCESS:
+        return isSetSuccess();
+      }
+      throw new IllegalStateException();
+    }
+
+    public boolean isSet(int fieldID) {
+      return isSet(_Fields.findByThriftIdOrThrow(fieldID));
+    }
+
+    @Override
+    public boolean equals(Object that) {
+      if (that == null)
+        return false;
+      if (that instanceof getJobsChangedSince_result)
+        return this.equals((getJobsChangedSince_result)that);
+      return false;
+    }
+
+    public boolean equals(getJobsChangedSince_result that) {
+      if (that == null)
+        return false;
+
+      boolean this_present_success = true && this.isSetSuccess();
+      boolean that_present_success = true && that.isSetSuccess();
+      if (this_present_success || that_present_success) {
+        if (!(this_present_success && that_present_success))
+          return false;
+        if (!this.success.equals(that.success))
+          return false;
+      }
+
+      return true;
+    }
+
+    @Override
+    public int hashCode() {
+      return 0;
+    }
+
+    public int compareTo(getJobsChangedSince_result other) {
+      if (!getClass().equals(other.getClass())) {
+        return getClass().getName().compareTo(other.getClass().getName());
+      }
+
+      int lastComparison = 0;
+      getJobsChangedSince_result typedOther = (getJobsChangedSince_result)other;
+
+      lastComparison = Boolean.valueOf(isSetSuccess()).compareTo(isSetSuccess());
+      if (lastComparison != 0) {
+        return lastComparison;
+      }
+      lastComparison = TBaseHelper.compareTo(success, typedOther.success);
+      if (lastComparison != 0) {
+        return lastComparison;
+      }
+      return 0;
+    }
+
+    public void read(TProtocol iprot) throws TException {
+      TField field;
+      iprot.readStructBegin();
+      while (true)
+      {
+        field = iprot.readFieldBegin();
+        if (field.type == TType.STOP) { 
+          break;
+        }
+        _Fields fieldId = _Fields.findByThriftId(field.id);
+        if (fieldId == null) {
+          TProtocolUtil.skip(iprot, field.type);
+        } else {
+          switch (fieldId) {
+            case SUCCESS:
+              if (field.type == TType.STRUCT) {
+                this.success = new ThriftJobChanges();
+                this.success.read(iprot);
+              } else { 
+                TProtocolUtil.skip(iprot, field.type);
+              }
+              break;
+          }
+          iprot.readFieldEnd();
+        }
+      }
+      iprot.readStructEnd();
+
+      // check for required fields of primitive type, which can't be checked in the validate method
+      validate();
+    }
+
+    public void write(TProtocol oprot) throws TException {
+      oprot.writeStructBegin(STRUCT_DESC);
+
+      if (this.isSetSuccess()) {
+        oprot.writeFieldBegin(SUCCESS_FIELD_DESC);
+        this.success.write(oprot);
+        oprot.writeFieldEnd();
+      }
+      oprot.writeFieldStop();
+      oprot.writeStructEnd();
+    }
+
+    @Override
+    public String toString() {
+      StringBuilder sb = new StringBuilder("getJobsChangedSince_result(");
+      boolean first = true;
+
+      sb.append("success:");
+      if (this.success == null) {
+        sb.append("null");
+      } else {
+        sb.append(this.success);
+      }
+      first = false;
+      sb.append(")");
+      return sb.toString();
+    }
+
+    public void validate() throws TException {
+      // check for required fields
+    }
+
+  }
+
+  public static class getUserJobCounts_args implements TBase<getUserJobCounts_args._Fields>, java.io.Serializable, Cloneable   {
+    private static final TStruct STRUCT_DESC = new TStruct("getUserJobCounts_args");
+
+    private static final TField CTX_FIELD_DESC = new TField("ctx", TType.STRUCT, (short)1);
+    private static final TField USER_FIELD_DESC = new TField("user", TType.STRING, (short)2);
+
+    public org.apache.hadoop.thriftfs.api.RequestContext ctx;
+    public String user;
+
+    /** The set of fields this struct contains, along with convenience methods for finding and manipulating them. */
+    public enum _Fields implements TFieldIdEnum {
+      CTX((short)1, "ctx"),
+      USER((short)2, "user");
+
+      private static final Map<Integer, _Fields> byId = new HashMap<Integer, _Fields>();
+      private static final Map<String, _Fields> byName = new HashMap<String, _Fields>();
+
+      static {
+        for (_Fields field : EnumSet.allOf(_Fields.class)) {
+          byId.put((int)field._thriftId, field);
+          byName.put(field.getFieldName(), field);
+        }
+      }
+
+      /**
+       * Find the _Fields constant that matches fieldId, or null if its not found.
+       */
+      public static _Fields findByThriftId(int fieldId) {
+        return byId.get(fieldId);
+      }
+
+      /**
+       * Find the _Fields constant that matches fieldId, throwing an exception
+       * if it is not found.
+       */
+      public static _Fields findByThriftIdOrThrow(int fieldId) {
+        _Fields fields = findByThriftId(fieldId);
+        if (fields == null) throw new IllegalArgumentException("Field " + fieldId + " doesn't exist!");
+        return fields;
+      }
+
+      /**
+       * Find the _Fields constant that matches name, or null if its not found.
+       */
+      public static _Fields findByName(String name) {
+        return byName.get(name);
+      }
+
+      private final short _thriftId;
+      private final String _fieldName;
+
+      _Fields(short thriftId, String fieldName) {
+        _thriftId = thriftId;
+        _fieldName = fieldName;
+      }
+
+      public short getThriftFieldId() {
+        return _thriftId;
+      }
+
+      public String getFieldName() {
+        return _fieldName;
+      }
+    }
+
+    // isset id assignments
+
+    public static final Map<_Fields, FieldMetaData> metaDataMap = Collections.unmodifiableMap(new EnumMap<_Fields, FieldMetaData>(_Fields.class) {{
+      put(_Fields.CTX, new FieldMetaData("ctx", TFieldRequirementType.DEFAULT, 
+          new StructMetaData(TType.STRUCT, org.apache.hadoop.thriftfs.api.RequestContext.class)));
+      put(_Fields.USER, new FieldMetaData("user", TFieldRequirementType.DEFAULT, 
+          new FieldValueMetaData(TType.STRING)));
+    }});
+
+    static {
+      FieldMetaData.addStructMetaDataMap(getUserJobCounts_args.class, metaDataMap);
+    }
+
+    public getUserJobCounts_args() {
+    }
+
+    public getUserJobCounts_args(
+      org.apache.hadoop.thriftfs.api.RequestContext ctx,
+      String user)
+    {
+      this();
+      this.ctx = ctx;
+      this.user = user;
+    }
+
+    /**
+     * Performs a deep copy on <i>other</i>.
+     */
+    public getUserJobCounts_args(getUserJobCounts_args other) {
+      if (other.isSetCtx()) {
+        this.ctx = new org.apache.hadoop.thriftfs.api.RequestContext(other.ctx);
+      }
+      if (other.isSetUser()) {
+        this.user = other.user;
+      }
+    }
+
+    public getUserJobCounts_args deepCopy() {
+      return new getUserJobCounts_args(this);
+    }
+
+    @Deprecated
+    public getUserJobCounts_args clone() {
+      return new getUserJobCounts_args(this);
+    }
+
+    public org.apache.hadoop.thriftfs.api.RequestContext getCtx() {
+      return this.ctx;
+    }
+
+    public getUserJobCounts_args setCtx(org.apache.hadoop.thriftfs.api.RequestContext ctx) {
+      this.ctx = ctx;
+      return this;
+    }
+
+    public void unsetCtx() {
+      this.ctx = null;
+    }
+
+    /** Returns true if field ctx is set (has been asigned a value) and false otherwise */
+    public boolean isSetCtx() {
+      return this.ctx != null;
+    }
+
+    public void setCtxIsSet(boolean value) {
+      if (!value) {
+        this.ctx = null;
+      }
+    }
+
+    public String getUser() {
+      return this.user;
+    }
+
+    public getUserJobCounts_args setUser(String user) {
+      this.user = user;
+      return this;
+    }
+
+    public void unsetUser() {
+      this.user = null;
+    }
+
+    /** Returns true if field user is set (has been asigned a value) and false otherwise */
+    public boolean isSetUser() {
+      return this.user != null;
+    }
+
+    public void setUserIsSet(boolean value) {
+      if (!value) {
+        this.user = null;
+      }
+    }
+
+    public void setFieldValue(_Fields field, Object value) {
+      switch (field) {
+      case CTX:
+        if (value == null) {
+          unsetCtx();
+        } else {
+          setCtx((org.apache.hadoop.thriftfs.api.RequestContext)value);
+        }
+        break;
+
+      case USER:
+        if (value == null) {
+          unsetUser();
+        } else {
+          setUser((String)value);
+        }
+        break;
+
+      }
+    }
+
+    public void setFieldValue(int fieldID, Object value) {
+      setFieldValue(_Fields.findByThriftIdOrThrow(fieldID), value);
+    }
+
+    public Object getFieldValue(_Fields field) {
+      switch (field) {
+      case CTX:
+        return getCtx();
+
+      case USER:
+        return getUser();
+
+      }
+      throw new IllegalStateException();
+    }
+
+    public Object getFieldValue(int fieldId) {
+      return getFieldValue(_Fields.findByThriftIdOrThrow(fieldId));
+    }
+
+    /** Returns true if field corresponding to fieldID is set (has been asigned a value) and false otherwise */
+    public boolean isSet(_Fields field) {
+      switch (field) {
+      case CTX:
+        return isSetCtx();
+      case USER:
+        return isSetUser();
+      }
+      throw new IllegalStateException();
+    }
+
+    public boolean isSet(int fieldID) {
+      return isSet(_Fields.findByThriftIdOrThrow(fieldID));
+    }
+
+    @Override
+    public boolean equals(Object that) {
+      if (that == null)
+        return false;
+      if (that instanceof getUserJobCounts_args)
+        return this.equals((getUserJobCounts_args)that);
+      return false;
+    }
+
+    public boolean equals(getUserJobCounts_args that) {
+      if (that == null)
+        return false;
+
+      boolean this_present_ctx = true && this.isSetCtx();
+      boolean that_present_ctx = true && that.isSetCtx();
+      if (this_present_ctx || that_present_ctx) {
+        if (!(this_present_ctx && that_present_ctx))
+          return false;
+        if (!this.ctx.equals(that.ctx))
+          return false;
+      }
+
+      boolean this_present_user = true && this.isSetUser();
+      boolean that_present_user = true && that.isSetUser();
+      if (this_present_user || that_present_user) {
+        if (!(this_present_user && that_present_user))
+          return false;
+        if (!this.user.equals(that.user))
+          return false;
+      }
+
+      return true;
+    }
+
+    @Override
+    public int hashCode() {
+      return 0;
+    }
+
+    public void read(TProtocol iprot) throws TException {
+      TField field;
+      iprot.readStructBegin();
+      while (true)
+      {
+        field = iprot.readFieldBegin();
+        if (field.type == TType.STOP) { 
+          break;
+        }
+        _Fields fieldId = _Fields.findByThriftId(field.id);
+        if (fieldId == null) {
+          TProtocolUtil.skip(iprot, field.type);
+        } else {
+          switch (fieldId) {
+            case CTX:
+              if (field.type == TType.STRUCT) {
+                this.ctx = new org.apache.hadoop.thriftfs.api.RequestContext();
+                this.ctx.read(iprot);
+              } else { 
+                TProtocolUtil.skip(iprot, field.type);
+              }
+              break;
+            case USER:
+              if (field.type == TType.STRING) {
+                this.user = iprot.readString();
+              } else { 
+                TProtocolUtil.skip(iprot, field.type);
+              }
+              break;
+          }
+          iprot.readFieldEnd();
+        }
+      }
+      iprot.readStructEnd();
+
+      // check for required fields of primitive type, which can't be checked in the validate method
+      validate();
+    }
+
+    public void write(TProtocol oprot) throws TException {
+      validate();
+
+      oprot.writeStructBegin(STRUCT_DESC);
+      if (this.ctx != null) {
+        oprot.writeFieldBegin(CTX_FIELD_DESC);
+        this.ctx.write(oprot);
+        oprot.writeFieldEnd();
+      }
+      if (this.user != null) {
+        oprot.writeFieldBegin(USER_FIELD_DESC);
+        oprot.writeString(this.user);
+        oprot.writeFieldEnd();
+      }
+      oprot.writeFieldStop();
+      oprot.writeStructEnd();
+    }
+
+    @Override
+    public String toString() {
+      StringBuilder sb = new StringBuilder("getUserJobCounts_args(");
+      boolean first = true;
+
+      sb.append("ctx:");
+      if (this.ctx == null) {
+        sb.append("null");
+      } else {
+        sb.append(this.ctx);
+      }
+      first = false;
+      if (!first) sb.append(", ");
+      sb.append("user:");
+      if (this.user == null) {
+        sb.append("null");
+      } else {
+        sb.append(this.user);
+      }
+      first = false;
+      sb.append(")");
+      return sb.toString();
+    }
+
+    public void validate() throws TException {
+      // check for required fields
+    }
+
+  }
+
+  public static class getUserJobCounts_result implements TBase<getUserJobCounts_result._Fields>, java.io.Serializable, Cloneable, Comparable<getUserJobCounts_result>   {
+    private static final TStruct STRUCT_DESC = new TStruct("getUserJobCounts_result");
+
+    private static final TField SUCCESS_FIELD_DESC = new TField("success", TType.STRUCT, (short)0);
+
+    public ThriftUserJobCounts success;
+
+    /** The set of fields this struct contains, along with convenience methods for finding and manipulating them. */
+    public enum _Fields implements TFieldIdEnum {
+      SUCCESS((short)0, "success");
+
+      private static final Map<Integer, _Fields> byId = new HashMap<Integer, _Fields>();
+      private static final Map<String, _Fields> byName = new HashMap<String, _Fields>();
+
+      static {
+        for (_Fields field : EnumSet.allOf(_Fields.class)) {
+          byId.put((int)field._thriftId, field);
+          byName.put(field.getFieldName(), field);
+        }
+      }
+
+      /**
+       * Find the _Fields constant that matches fieldId, or null if its not found.
+       */
+      public static _Fields findByThriftId(int fieldId) {
+        return byId.get(fieldId);
+      }
+
+      /**
+       * Find the _Fields constant that matches fieldId, throwing an exception
+       * if it is not found.
+       */
+      public static _Fields findByThriftIdOrThrow(int fieldId) {
+        _Fields fields = findByThriftId(fieldId);
+        if (fields == null) throw new IllegalArgumentException("Field " + fieldId + " doesn't exist!");
+        return fields;
+      }
+
+      /**
+       * Find the _Fields constant that matches name, or null if its not found.
+       */
+      public static _Fields findByName(String name) {
+        return byName.get(name);
+      }
+
+      private final short _thriftId;
+      private final String _fieldName;
+
+      _Fields(short thriftId, String fieldName) {
+        _thriftId = thriftId;
+        _fieldName = fieldName;
+      }
+
+      public short getThriftFieldId() {
+        return _thriftId;
+      }
+
+      public String getFieldName() {
+        return _fieldName;
+      }
+    }
+
+    // isset id assignments
+
+    public static final Map<_Fields, FieldMetaData> metaDataMap = Collections.unmodifiableMap(new EnumMap<_Fields, FieldMetaData>(_Fields.class) {{
+      put(_Fields.SUCCESS, new FieldMetaData("success", TFieldRequirementType.DEFAULT, 
+          new StructMetaData(TType.STRUCT, ThriftUserJobCounts.class)));
+    }});
+
+    static {
+      FieldMetaData.addStructMetaDataMap(getUserJobCounts_result.class, metaDataMap);
+    }
+
+    public getUserJobCounts_result() {
+    }
+
+    public getUserJobCounts_result(
+      ThriftUserJobCounts success)
+    {
+      this();
+      this.success = success;
+    }
+
+    /**
+     * Performs a deep copy on <i>other</i>.
+     */
+    public getUserJobCounts_result(getUserJobCounts_result other) {
+      if (other.isSetSuccess()) {
+        this.success = new ThriftUserJobCounts(other.success);
+      }
+    }
+
+    public getUserJobCounts_result deepCopy() {
+      return new getUserJobCounts_result(this);
+    }
+
+    @Deprecated
+    public getUserJobCounts_result clone() {
+      return new getUserJobCounts_result(this);
+    }
+
+    public ThriftUserJobCounts getSuccess() {
+      return this.success;
+    }
+
+    public getUserJobCounts_result setSuccess(ThriftUserJobCounts success) {
+      this.success = success;
+      return this;
+    }
+
+    public void unsetSuccess() {
+      this.success = null;
+    }
+
+    /** Returns true if field success is set (has been asigned a value) and false otherwise */
+    public boolean isSetSuccess() {
+      return this.success != null;
+    }
+
+    public void setSuccessIsSet(boolean value) {
+      if (!value) {
+        this.success = null;
+      }
+    }
+
+    public void setFieldValue(_Fields field, Object value) {
+      switch (field) {
+      case SUCCESS:
+        if (value == null) {
+          unsetSuccess();
+        } else {
+          setSuccess((ThriftUserJobCounts)value);
+        }
+        break;
+
+      }
+    }
+
+    public void setFieldValue(int fieldID, Object value) {
+      setFieldValue(_Fields.findByThriftIdOrThrow(fieldID), value);
+    }
+
+    public Object getFieldValue(_Fields field) {
+      switch (field) {
+      case SUCCESS:
+        return getSuccess();
+
+      }
+      throw new IllegalStateException();
+    }
+
+    public Object getFieldValue(int fieldId) {
+      return getFieldValue(_Fields.findByThriftIdOrThrow(fieldId));
+    }
+
+    /** Returns true if field corresponding to fieldID is set (has been asigned a value) and false otherwise */
+    public boolean isSet(_Fields field) {
+      switch (field) {
+      case SUCCESS:
+        return isSetSuccess();
+      }
+      throw new IllegalStateException();
+    }
+
+    public boolean isSet(int fieldID) {
+      return isSet(_Fields.findByThriftIdOrThrow(fieldID));
+    }
+
+    @Override
+    public boolean equals(Object that) {
+      if (that == null)
+        return false;
+      if (that instanceof getUserJobCounts_result)
+        return this.equals((getUserJobCounts_result)that);
+      return false;
+    }
+
+    public boolean equals(getUserJobCounts_result that) {
+      if (that == null)
+        return false;
+
+      boolean this_present_success = true && this.isSetSuccess();
+      boolean that_present_success = true && that.isSetSuccess();
+      if (this_present_success || that_present_success) {
+        if (!(this_present_success && that_present_success))
+          return false;
+        if (!this.success.equals(that.success))
+          return false;
+      }
+
+      return true;
+    }
+
+    @Override
+    public int hashCode() {
+      return 0;
+    }
+
+    public int compareTo(getUserJobCounts_result other) {
+      if (!getClass().equals(other.getClass())) {
+        return getClass().getName().compareTo(other.getClass().getName());
+      }
+
+      int lastComparison = 0;
+      getUserJobCounts_result typedOther = (getUserJobCounts_result)other;
+
+      lastComparison = Boolean.valueOf(isSetSuccess()).compareTo(isSetSuccess());
+      if (lastComparison != 0) {
+        return lastComparison;
+      }
+      lastComparison = TBaseHelper.compareTo(success, typedOther.success);
+      if (lastComparison != 0) {
+        return lastComparison;
+      }
+      return 0;
+    }
+
+    public void read(TProtocol iprot) throws TException {
+      TField field;
+      iprot.readStructBegin();
+      while (true)
+      {
+        field = iprot.readFieldBegin();
+        if (field.type == TType.STOP) { 
+          break;
+        }
+        _Fields fieldId = _Fields.findByThriftId(field.id);
+        if (fieldId == null) {
+          TProtocolUtil.skip(iprot, field.type);
+        } else {
+          switch (fieldId) {
+            case SUCCESS:
+              if (field.type == TType.STRUCT) {
+                this.success = new ThriftUserJobCounts();
+                this.success.read(iprot);
+              } else { 
+                TProtocolUtil.skip(iprot, field.type);
+              }
+              break;
+          }
+          iprot.readFieldEnd();
+        }
+      }
+      iprot.readStructEnd();
+
+      // check for required fields of primitive type, which can't be checked in the validate method
+      validate();
+    }
+
+    public void write(TProtocol oprot) throws TException {
+      oprot.writeStructBegin(STRUCT_DESC);
+
+      if (this.isSetSuccess()) {
+        oprot.writeFieldBegin(SUCCESS_FIELD_DESC);
+        this.success.write(oprot);
+        oprot.writeFieldEnd();
+      }
+      oprot.writeFieldStop();
+      oprot.writeStructEnd();
+    }
+
+    @Override
+    public String toString() {
+      StringBuilder sb = new StringBuilder("getUserJobCounts_result(");
+      boolean first = true;
+
+      sb.append("success:");
+      if (this.success == null) {
+        sb.append("null");
+      } else {
+        sb.append(this.success);
+      }
+      first = false;
+      sb.append(")");
+      return sb.toString();
+    }
+
+    public void validate() throws TException {
+      // check for required fields
+    }
+
+  }
+
+  public static class getTaskList_args implements TBase<getTaskList_args._Fields>, java.io.Serializable, Cloneable   {
+    private static final TStruct STRUCT_DESC = new TStruct("getTaskList_args");
+
+    private static final TField CTX_FIELD_DESC = new TField("ctx", TType.STRUCT, (short)1);
+    private static final TField JOB_ID_FIELD_DESC = new TField("jobID", TType.STRUCT, (short)2);
+    private static final TField TYPES_FIELD_DESC = new TField("types", TType.SET, (short)3);
+    private static final TField STATES_FIELD_DESC = new TField("states", TType.SET, (short)4);
+    private static final TField TEXT_FIELD_DESC = new TField("text", TType.STRING, (short)5);
+    private static final TField COUNT_FIELD_DESC = new TField("count", TType.I32, (short)6);
+    private static final TField OFFSET_FIELD_DESC = new TField("offset", TType.I32, (short)7);
+
+    public org.apache.hadoop.thriftfs.api.RequestContext ctx;
+    public ThriftJobID jobID;
+    public Set<ThriftTaskType> types;
+    public Set<ThriftTaskQueryState> states;
+    public String text;
+    public int count;
+    public int offset;
+
+    /** The set of fields this struct contains, along with convenience methods for finding and manipulating them. */
+    public enum _Fields implements TFieldIdEnum {
+      CTX((short)1, "ctx"),
+      JOB_ID((short)2, "jobID"),
+      TYPES((short)3, "types"),
+      STATES((short)4, "states"),
+      TEXT((short)5, "text"),
+      COUNT((short)6, "count"),
+      OFFSET((short)7, "offset");
+
+      private static final Map<Integer, _Fields> byId = new HashMap<Integer, _Fields>();
+      private static final Map<String, _Fields> byName = new HashMap<String, _Fields>();
+
+      static {
+        for (_Fields field : EnumSet.allOf(_Fields.class)) {
+          byId.put((int)field._thriftId, field);
+          byName.put(field.getFieldName(), field);
+        }
+      }
+
+      /**
+       * Find the _Fields constant that matches fieldId, or null if its not found.
+       */
+      public static _Fields findByThriftId(int fieldId) {
+        return byId.get(fieldId);
+      }
+
+      /**
+       * Find the _Fields constant that matches fieldId, throwing an exception
+       * if it is not found.
+       */
+      public static _Fields findByThriftIdOrThrow(int fieldId) {
+        _Fields fields = findByThriftId(fieldId);
+        if (fields == null) throw new IllegalArgumentException("Field " + fieldId + " doesn't exist!");
+        return fields;
+      }
+
+      /**
+       * Find the _Fields constant that matches name, or null if its not found.
+       */
+      public static _Fields findByName(String name) {
+        return byName.get(name);
+      }
+
+      private final short _thriftId;
+      private final String _fieldName;
+
+      _Fields(short thriftId, String fieldName) {
+        _thriftId = thriftId;
+        _fieldName = fieldName;
+      }
+
+      public short getThriftFieldId() {
+        return _thriftId;
+      }
+
+      public String getFieldName() {
+        return _fieldName;
+      }
+    }
+
+    // isset id assignments
+    private static final int __COUNT_ISSET_ID = 0;
+    private static final int __OFFSET_ISSET_ID = 1;
+    private BitSet __isset_bit_vector = new BitSet(2);
+
+    public static final Map<_Fields, FieldMetaData> metaDataMap = Collections.unmodifiableMap(new EnumMap<_Fields, FieldMetaData>(_Fields.class) {{
+      put(_Fields.CTX, new FieldMetaData("ctx", TFieldRequirementType.DEFAULT, 
+          new StructMetaData(TType.STRUCT, org.apache.hadoop.thriftfs.api.RequestContext.class)));
+      put(_Fields.JOB_ID, new FieldMetaData("jobID", TFieldRequirementType.DEFAULT, 
+          new StructMetaData(TType.STRUCT, ThriftJobID.class)));
+      put(_Fields.TYPES, new FieldMetaData("types", TFieldRequirementType.DEFAULT, 
+          new SetMetaData(TType.SET, 
+              new EnumMetaData(TType.ENUM, ThriftTaskType.class))));
+      put(_Fields.STATES, new FieldMetaData("states", TFieldRequirementType.DEFAULT, 
+          new SetMetaData(TType.SET, 
+              new EnumMetaData(TType.ENUM, ThriftTaskQueryState.class))));
+      put(_Fields.TEXT, new FieldMetaData("text", TFieldRequirementType.DEFAULT, 
+          new FieldValueMetaData(TType.STRING)));
+      put(_Fields.COUNT, new FieldMetaData("count", TFieldRequirementType.DEFAULT, 
+          new FieldValueMetaData(TType.I32)));
+      put(_Fields.OFFSET, new FieldMetaData("offset", TFieldRequirementType.DEFAULT, 
+          new FieldValueMetaData(TType.I32)));
+    }});
+
+    static {
+      FieldMetaData.addStructMetaDataMap(getTaskList_args.class, metaDataMap);
+    }
+
+    public getTaskList_args() {
+    }
+
+    public getTaskList_args(
+      org.apache.hadoop.thriftfs.api.RequestContext ctx,
+      ThriftJobID jobID,
+      Set<ThriftTaskType> types,
+      Set<ThriftTaskQueryState> states,
+      String text,
+      int count,
+      int offset)
+    {
+      this();
+      this.ctx = ctx;
+      this.jobID = jobID;
+      this.types = types;
+      this.states = states;
+      this.text = text;
+      this.count = count;
+      setCountIsSet(true);
+      this.offset = offset;
+      setOffsetIsSet(true);
+    }
+
+    /**
+     * Performs a deep copy on <i>other</i>.
+     */
+    public getTaskList_args(getTaskList_args other) {
+      __isset_bit_vector.clear();
+      __isset_bit_vector.or(other.__isset_bit_vector);
+      if (other.isSetCtx()) {
+        this.ctx = new org.apache.hadoop.thriftfs.api.RequestContext(other.ctx);
+      }
+      if (other.isSetJobID()) {
+        this.jobID = new ThriftJobID(other.jobID);
+      }
+      if (other.isSetTypes()) {
+        Set<ThriftTaskType> __this__types = new HashSet<ThriftTaskType>();
+        for (ThriftTaskType other_element : other.types) {
+          __this__types.add(other_element);
+        }
+        this.types = __this__types;
+      }
+      if (other.isSetStates()) {
+        Set<ThriftTaskQueryState> __this__states = new HashSet<ThriftTaskQueryState>();
+        for (ThriftTaskQueryState other_element : other.states) {
+          __this__states.add(other_element);
+        }
+        this.states = __this__states;
+      }
+      if (other.isSetText()) {
+        this.text = other.text;
+      }
+      this.count = other.count;
+      this.offset = other.offset;
+    }
+
+    public getTaskList_args deepCopy() {
+      return new getTaskList_args(this);
+    }
+
+    @Deprecated
+    public getTaskList_args clone() {
+      return new getTaskList_args(this);
+    }
+
+    public org.apache.hadoop.thriftfs.api.RequestContext getCtx() {
+      return this.ctx;
+    }
+
+    public getTaskList_args setCtx(org.apache.hadoop.thriftfs.api.RequestContext ctx) {
+      this.ctx = ctx;
+      return this;
+    }
+
+    public void unsetCtx() {
+      this.ctx = null;
+    }
+
+    /** Returns true if field ctx is set (has been asigned a value) and false otherwise */
+    public boolean isSetCtx() {
+      return this.ctx != null;
+    }
+
+    public void setCtxIsSet(boolean value) {
+      if (!value) {
+        this.ctx = null;
+      }
+    }
+
+    public ThriftJobID getJobID() {
+      return this.jobID;
+    }
+
+    public getTaskList_args setJobID(ThriftJobID jobID) {
+      this.jobID = jobID;
+      return this;
+    }
+
+    public void unsetJobID() {
+      this.jobID = null;
+    }
+
+    /** Returns true if field jobID is set (has been asigned a value) and false otherwise */
+    public boolean isSetJobID() {
+      return this.jobID != null;
+    }
+
+    public void setJobIDIsSet(boolean value) {
+      if (!value) {
+        this.jobID = null;
+      }
+    }
+
+    public int getTypesSize() {
+      return (this.types == null) ? 0 : this.types.size();
+    }
+
+    public java.util.Iterator<ThriftTaskType> getTypesIterator() {
+      return (this.types == null) ? null : this.types.iterator();
+    }
+
+    public void addToTypes(ThriftTaskType elem) {
+      if (this.types == null) {
+        this.types = new HashSet<ThriftTaskType>();
+      }
+      this.types.add(elem);
+    }
+
+    public Set<ThriftTaskType> getTypes() {
+      return this.types;
+    }
+
+    public getTaskList_args setTypes(Set<ThriftTaskType> types) {
+      this.types = types;
+      return this;
+    }
+
+    public void unsetTypes() {
+      this.types = null;
+    }
+
+    /** Returns true if field types is set (has been asigned a value) and false otherwise */
+    public boolean isSetTypes() {
+      return this.types != null;
+    }
+
+    public void setTypesIsSet(boolean value) {
+      if (!value) {
+        this.types = null;
+      }
+    }
+
+    public int getStatesSize() {
+      return (this.states == null) ? 0 : this.states.size();
+    }
+
+    public java.util.Iterator<ThriftTaskQueryState> getStatesIterator() {
+      return (this.states == null) ? null : this.states.iterator();
+    }
+
+    public void addToStates(ThriftTaskQueryState elem) {
+      if (this.states == null) {
+        this.states = new HashSet<ThriftTaskQueryState>();
+      }
+      this.states.add(elem);
+    }
+
+    public Set<ThriftTaskQueryState> getStates() {
+      return this.states;
+    }
+
+    public getTaskList_args setStates(Set<ThriftTaskQueryState> states) {
+      this.states = states;
+      return this;
+    }
+
+    public void unsetStates() {
+      this.states = null;
+    }
+
+    /** Returns true if field states is set (has been asigned a value) and false otherwise */
+    public boolean isSetStates() {
+      return this.states != null;
+    }
+
+    public void setStatesIsSet(boolean value) {
+      if (!value) {
+        this.states = null;
+      }
+    }
+
+    public String getText() {
+      return this.text;
+    }
+
+    public getTaskList_args setText(String text) {
+      this.text = text;
+      return this;
+    }
+
+    public void unsetText() {
+      this.text = null;
+    }
+
+    /** Returns true if field text is set (has been asigned a value) and false otherwise */
+    public boolean isSetText() {
+      return this.text != null;
+    }
+
+    public void setTextIsSet(boolean value) {
+      if (!value) {
+        this.text = null;
+      }
+    }
+
+    public int getCount() {
+      return this.count;
+    }
+
+    public getTaskList_args setCount(int count) {
+      this.count = count;
+      setCountIsSet(true);
+      return this;
+    }
+
+    public void unsetCount() {
+      __isset_bit_vector.clear(__COUNT_ISSET_ID);
+    }
+
+    /** Returns true if field count is set (has been asigned a value) and false otherwise */
+    public boolean isSetCount() {
+      return __isset_bit_vector.get(__COUNT_ISSET_ID);
+    }
+
+    public void setCountIsSet(boolean value) {
+      __isset_bit_vector.set(__COUNT_ISSET_ID, value);
+    }
+
+    public int getOffset() {
+      return this.offset;
+    }
+
+    public getTaskList_args setOffset(int offset) {
+      this.offset = offset;
+      setOffsetIsSet(true);
+      return this;
+    }
+
+    public void unsetOffset() {
+      __isset_bit_vector.clear(__OFFSET_ISSET_ID);
+    }
+
+    /** Returns true if field offset is set (has been asigned a value) and false otherwise */
+    public boolean isSetOffset() {
+      return __isset_bit_vector.get(__OFFSET_ISSET_ID);
+    }
+
+    public void setOffsetIsSet(boolean value) {
+      __isset_bit_vector.set(__OFFSET_ISSET_ID, value);
+    }
+
+    public void setFieldValue(_Fields field, Object value) {
+      switch (field) {
+      case CTX:
+        if (value == null) {
+          unsetCtx();
+        } else {
+          setCtx((org.apache.hadoop.thriftfs.api.RequestContext)value);
+        }
+        break;
+
+      case JOB_ID:
+        if (value == null) {
+          unsetJobID();
+        } else {
+          setJobID((ThriftJobID)value);
+        }
+        break;
+
+      case TYPES:
+        if (value == null) {
+          unsetTypes();
+        } else {
+          setTypes((Set<ThriftTaskType>)value);
+        }
+        break;
+
+      case STATES:
+        if (value == null) {
+          unsetStates();
+        } else {
+          setStates((Set<ThriftTaskQueryState>)value);
+        }
+        break;
+
+      case TEXT:
+        if (value == null) {
+          unsetText();
+        } else {
+          setText((String)value);
+        }
+        break;
+
+      case COUNT:
+        if (value == null) {
+          unsetCount();
+        } else {
+          setCount((Integer)value);
+        }
+        break;
+
+      case OFFSET:
+        if (value == null) {
+          unsetOffset();
+        } else {
+          setOffset((Integer)value);
+        }
+        break;
+
+      }
+    }
+
+    public void setFieldValue(int fieldID, Object value) {
+      setFieldValue(_Fields.findByThriftIdOrThrow(fieldID), value);
+    }
+
+    public Object getFieldValue(_Fields field) {
+      switch (field) {
+      case CTX:
+        return getCtx();
+
+      case JOB_ID:
+        return getJobID();
+
+      case TYPES:
+        return getTypes();
+
+      case STATES:
+        return getStates();
+
+      case TEXT:
+        return getText();
+
+      case COUNT:
+        return new Integer(getCount());
+
+      case OFFSET:
+        return new Integer(getOffset());
+
+      }
+      throw new IllegalStateException();
+    }
+
+    public Object getFieldValue(int fieldId) {
+      return getFieldValue(_Fields.findByThriftIdOrThrow(fieldId));
+    }
+
+    /** Returns true if field corresponding to fieldID is set (has been asigned a value) and false otherwise */
+    public boolean isSet(_Fields field) {
+      switch (field) {
+      case CTX:
+        return isSetCtx();
+      case JOB_ID:
+        return isSetJobID();
+      case TYPES:
+        return isSetTypes();
+      case STATES:
+        return isSetStates();
+      case TEXT:
+        return isSetText();
+      case COUNT:
+        return isSetCount();
+      case OFFSET:
+        return isSetOffset();
+      }
+      throw new IllegalStateException();
+    }
+
+    public boolean isSet(int fieldID) {
+      return isSet(_Fields.findByThriftIdOrThrow(fieldID));
+    }
+
+    @Override
+    public boolean equals(Object that) {
+      if (that == null)
+        return false;
+      if (that instanceof getTaskList_args)
+        return this.equals((getTaskList_args)that);
+      return false;
+    }
+
+    public boolean equals(getTaskList_args that) {
+      if (that == null)
+        return false;
+
+      boolean this_present_ctx = true && this.isSetCtx();
+      boolean that_present_ctx = true && that.isSetCtx();
+      if (this_present_ctx || that_present_ctx) {
+        if (!(this_present_ctx && that_present_ctx))
+          return false;
+        if (!this.ctx.equals(that.ctx))
+          return false;
+      }
+
+      boolean this_present_jobID = true && this.isSetJobID();
+      boolean that_present_jobID = true && that.isSetJobID();
+      if (this_present_jobID || that_present_jobID) {
+        if (!(this_present_jobID && that_present_jobID))
+          return false;
+        if (!this.jobID.equals(that.jobID))
+          return false;
+      }
+
+      boolean this_present_types = true && this.isSetTypes();
+      boolean that_present_types = true && that.isSetTypes();
+      if (this_present_types || that_present_types) {
+        if (!(this_present_types && that_present_types))
+          return false;
+        if (!this.types.equals(that.types))
+          return false;
+      }
+
+      boolean this_present_states = true && this.isSetStates();
+      boolean that_present_states = true && that.isSetStates();
+      if (this_present_states || that_present_states) {
+        if (!(this_present_states && that_present_states))
+          return false;
+        if (!this.states.equals(that.states))
+          return false;
+      }
+
+      boolean this_present_text = true && this.isSetText();
+      boolean that_present_text = true && that.isSetText();
+      if (this_present_text || that_present_text) {
+        if (!(this_present_text && that_present_text))
+          return false;
+        if (!this.text.equals(that.text))
+          return false;
+      }
+
+      boolean this_present_count = true;
+      boolean that_present_count = true;
+      if (this_present_count || that_present_count) {
+        if (!(this_present_count && that_present_count))
+          return false;
+        if (this.count != that.count)
+          return false;
+      }
+
+      boolean this_present_offset = true;
+      boolean that_present_offset = true;
+      if (this_present_offset || that_present_offset) {
+        if (!(this_present_offset && that_present_offset))
+          return false;
+        if (this.offset != that.offset)
+          return false;
+      }
+
+      return true;
+    }
+
+    @Override
+    public int hashCode() {
+      return 0;
+    }
+
+    public void read(TProtocol iprot) throws TException {
+      TField field;
+      iprot.readStructBegin();
+      while (true)
+      {
+        field = iprot.readFieldBegin();
+        if (field.type == TType.STOP) { 
+          break;
+        }
+        _Fields fieldId = _Fields.findByThriftId(field.id);
+        if (fieldId == null) {
+          TProtocolUtil.skip(iprot, field.type);
+        } else {
+          switch (fieldId) {
+            case CTX:
+              if (field.type == TType.STRUCT) {
+                this.ctx = new org.apache.hadoop.thriftfs.api.RequestContext();
+                this.ctx.read(iprot);
+              } else { 
+                TProtocolUtil.skip(iprot, field.type);
+              }
+              break;
+            case JOB_ID:
+              if (field.type == TType.STRUCT) {
+                this.jobID = new ThriftJobID();
+                this.jobID.read(iprot);
+              } else { 
+                TProtocolUtil.skip(iprot, field.type);
+              }
+              break;
+            case TYPES:
+              if (field.type == TType.SET) {
+                {
+                  TSet _set99 = iprot.readSetBegin();
+                  this.types = new HashSet<ThriftTaskType>(2*_set99.size);
+                  for (int _i100 = 0; _i100 < _set99.size; ++_i100)
+                  {
+                    ThriftTaskType _elem101;
+                    _elem101 = ThriftTaskType.findByValue(iprot.readI32());
+                    this.types.add(_elem101);
+                  }
+                  iprot.readSetEnd();
+                }
+              } else { 
+                TProtocolUtil.skip(iprot, field.type);
+              }
+              break;
+            case STATES:
+              if (field.type == TType.SET) {
+                {
+                  TSet _set102 = iprot.readSetBegin();
+                  this.states = new HashSet<ThriftTaskQueryState>(2*_set102.size);
+                  for (int _i103 = 0; _i103 < _set102.size; ++_i103)
+                  {
+                    ThriftTaskQueryState _elem104;
+                    _elem104 = ThriftTaskQueryState.findByValue(iprot.readI32());
+                    this.states.add(_elem104);
+                  }
+                  iprot.readSetEnd();
+                }
+              } else { 
+                TProtocolUtil.skip(iprot, field.type);
+              }
+              break;
+            case TEXT:
+              if (field.type == TType.STRING) {
+                this.text = iprot.readString();
+              } else { 
+                TProtocolUtil.skip(iprot, field.type);
+              }
+              break;
+            case COUNT:
+              if (field.type == TType.I32) {
+                this.count = iprot.readI32();
+                setCountIsSet(true);
+              } else { 
+                TProtocolUtil.skip(iprot, field.type);
+              }
+              break;
+            case OFFSET:
+              if (field.type == TType.I32) {
+                this.offset = iprot.readI32();
+                setOffsetIsSet(true);
+              } else { 
+                TProtocolUtil.skip(iprot, field.type);
+              }
+              break;
+          }
+          iprot.readFieldEnd();
+        }
+      }
+      iprot.readStructEnd();
+
+      // check for required fields of primitive type, which can't be checked in the validate method
+      validate();
+    }
+
+    public void write(TProtocol oprot) throws TException {
+      validate();
+
+      oprot.writeStructBegin(STRUCT_DESC);
+      if (this.ctx != null) {
+        oprot.writeFieldBegin(CTX_FIELD_DESC);
+        this.ctx.write(oprot);
+        oprot.writeFieldEnd();
+      }
+      if (this.jobID != null) {
+        oprot.writeFieldBegin(JOB_ID_FIELD_DESC);
+        this.jobID.write(oprot);
+        oprot.writeFieldEnd();
+      }
+      if (this.types != null) {
+        oprot.writeFieldBegin(TYPES_FIELD_DESC);
+        {
+          oprot.writeSetBegin(new TSet(TType.I32, this.types.size()));
+          for (ThriftTaskType _iter105 : this.types)
+          {
+            oprot.writeI32(_iter105.getValue());
+          }
+          oprot.writeSetEnd();
+        }
+        oprot.writeFieldEnd();
+      }
+      if (this.states != null) {
+        oprot.writeFieldBegin(STATES_FIELD_DESC);
+        {
+          oprot.writeSetBegin(new TSet(TType.I32, this.states.size()));
+          for (ThriftTaskQueryState _iter106 : this.states)
+          {
+            oprot.writeI32(_iter106.getValue());
+          }
+          oprot.writeSetEnd();
+        }
+        oprot.writeFieldEnd();
+      }
+      if (this.text != null) {
+        oprot.writeFieldBegin(TEXT_FIELD_DESC);
+        oprot.writeString(this.text);
+        oprot.writeFieldEnd();
+      }
+      oprot.writeFieldBegin(COUNT_FIELD_DESC);
+      oprot.writeI32(this.count);
+      oprot.writeFieldEnd();
+      oprot.writeFieldBegin(OFFSET_FIELD_DESC);
+      oprot.writeI32(this.offset);
+      oprot.writeFieldEnd();
+      oprot.writeFieldStop();
+      oprot.writeStructEnd();
+    }
+
+    @Override
+    public String toString() {
+      StringBuilder sb = new StringBuilder("getTaskList_args(");
+      boolean first = true;
+
+      sb.append("ctx:");
+      if (this.ctx == null) {
+        sb.append("null");
+      } else {
+        sb.append(this.ctx);
+      }
+      first = false;
+      if (!first) sb.append(", ");
+      sb.append("jobID:");
+      if (this.jobID == null) {
+        sb.append("null");
+      } else {
+        sb.append(this.jobID);
+      }
+      first = false;
+      if (!first) sb.append(", ");
+      sb.append("types:");
+      if (this.types == null) {
+        sb.append("null");
+      } else {
+        sb.append(this.types);
+      }
+      first = false;
+      if (!first) sb.append(", ");
+      sb.append("states:");
+      if (this.states == null) {
+        sb.append("null");
+      } else {
+        sb.append(this.states);
+      }
+      first = false;
+      if (!first) sb.append(", ");
+      sb.append("text:");
+      if (this.text == null) {
+        sb.append("null");
+      } else {
+        sb.append(this.text);
+      }
+      first = false;
+      if (!first) sb.append(", ");
+      sb.append("count:");
+      sb.append(this.count);
+      first = false;
+      if (!first) sb.append(", ");
+      sb.append("offset:");
+      sb.append(this.offset);
+      first = false;
+      sb.append(")");
+      return sb.toString();
+    }
+
+    public void validate() throws TException {
+      // check for required fields
+    }
+
+  }
+
+  public static class getTaskList_result implements TBase<getTaskList_result._Fields>, java.io.Serializable, Cloneable   {
+    private static final TStruct STRUCT_DESC = new TStruct("getTaskList_result");
+
+    private static final TField SUCCESS_FIELD_DESC = new TField("success", TType.STRUCT, (short)0);
+    private static final TField ERR_FIELD_DESC = new TField("err", TType.STRUCT, (short)1);
+
+    public ThriftTaskInProgressList success;
+    public JobNotFoundException err;
+
+    /** The set of fields this struct contains, along with convenience methods for finding and manipulating them. */
+    public enum _Fields implements TFieldIdEnum {
+      SUCCESS((short)0, "success"),
+      ERR((short)1, "err");
+
+      private static final Map<Integer, _Fields> byId = new HashMap<Integer, _Fields>();
+      private static final Map<String, _Fields> byName = new HashMap<String, _Fields>();
+
+      static {
+        for (_Fields field : EnumSet.allOf(_Fields.class)) {
+          byId.put((int)field._thriftId, field);
+          byName.put(field.getFieldName(), field);
+        }
+      }
+
+      /**
+       * Find the _Fields constant that matches fieldId, or null if its not found.
+       */
+      public static _Fields findByThriftId(int fieldId) {
+        return byId.get(fieldId);
+      }
+
+      /**
+       * Find the _Fields constant that matches fieldId, throwing an exception
+       * if it is not found.
+       */
+      public static _Fields findByThriftIdOrThrow(int fieldId) {
+        _Fields fields = findByThriftId(fieldId);
+        if (fields == null) throw new IllegalArgumentException("Field " + fieldId + " doesn't exist!");
+        return fields;
+      }
+
+      /**
+       * Find the _Fields constant that matches name, or null if its not found.
+       */
+      public static _Fields findByName(String name) {
+        return byName.get(name);
+      }
+
+      private final short _thriftId;
+      private final String _fieldName;
+
+      _Fields(short thriftId, String fieldName) {
+        _thriftId = thriftId;
+        _fieldName = fieldName;
+      }
+
+      public short getThriftFieldId() {
+        return _thriftId;
+      }
+
+      public String getFieldName() {
+        return _fieldName;
+      }
+    }
+
+    // isset id assignments
+
+    public static final Map<_Fields, FieldMetaData> metaDataMap = Collections.unmodifiableMap(new EnumMap<_Fields, FieldMetaData>(_Fields.class) {{
+      put(_Fields.SUCCESS, new FieldMetaData("success", TFieldRequirementType.DEFAULT, 
+          new StructMetaData(TType.STRUCT, ThriftTaskInProgressList.class)));
+      put(_Fields.ERR, new FieldMetaData("err", TFieldRequirementType.DEFAULT, 
+          new FieldValueMetaData(TType.STRUCT)));
+    }});
+
+    static {
+      FieldMetaData.addStructMetaDataMap(getTaskList_result.class, metaDataMap);
+    }
+
+    public getTaskList_result() {
+    }
+
+    public getTaskList_result(
+      ThriftTaskInProgressList success,
+      JobNotFoundException err)
+    {
+      this();
+      this.success = success;
+      this.err = err;
+    }
+
+    /**
+     * Performs a deep copy on <i>other</i>.
+     */
+    public getTaskList_result(getTaskList_result other) {
+      if (other.isSetSuccess()) {
+        this.success = new ThriftTaskInProgressList(other.success);
+      }
+      if (other.isSetErr()) {
+        this.err = new JobNotFoundException(other.err);
+      }
+    }
+
+    public getTaskList_result deepCopy() {
+      return new getTaskList_result(this);
+    }
+
+    @Deprecated
+    public getTaskList_result clone() {
+      return new getTaskList_result(this);
+    }
+
+    public ThriftTaskInProgressList getSuccess() {
+      return this.success;
+    }
+
+    public getTaskList_result setSuccess(ThriftTaskInProgressList success) {
+      this.success = success;
+      return this;
+    }
+
+    public void unsetSuccess() {
+      this.success = null;
+    }
+
+    /** Returns true if field success is set (has been asigned a value) and false otherwise */
+    public boolean isSetSuccess() {
+      return this.success != null;
+    }
+
+    public void setSuccessIsSet(boolean value) {
+      if (!value) {
+        this.success = null;
+      }
+    }
+
+    public JobNotFoundException getErr() {
+      return this.err;
+    }
+
+    public getTaskList_result setErr(JobNotFoundException err) {
+      this.err = err;
+      return this;
+    }
+
+    public void unsetErr() {
+      this.err = null;
+    }
+
+    /** Returns true if field err is set (has been asigned a value) and false otherwise */
+    public boolean isSetErr() {
+      return this.err != null;
+    }
+
+    public void setErrIsSet(boolean value) {
+      if (!value) {
+        this.err = null;
+      }
+    }
+
+    public void setFieldValue(_Fields field, Object value) {
+      switch (field) {
+      case SUCCESS:
+        if (value == null) {
+          unsetSuccess();
+        } else {
+          setSuccess((ThriftTaskInProgressList)value);
+        }
+        break;
+
+      case ERR:
+        if (value == null) {
+          unsetErr();
+        } else {
+          setErr((JobNotFoundException)value);
+        }
+        break;
+
+      }
+    }
+
+    public void setFieldValue(int fieldID, Object value) {
+      setFieldValue(_Fields.findByThriftIdOrThrow(fieldID), value);
+    }
+
+    public Object getFieldValue(_Fields field) {
+      switch (field) {
+      case SUCCESS:
+        return getSuccess();
+
+      case ERR:
+        return getErr();
+
+      }
+      throw new IllegalStateException();
+    }
+
+    public Object getFieldValue(int fieldId) {
+      return getFieldValue(_Fields.findByThriftIdOrThrow(fieldId));
+    }
+
+    /** Returns true if field corresponding to fieldID is set (has been asigned a value) and false otherwise */
+    public boolean isSet(_Fields field) {
+      switch (field) {
+      case SUCCESS:
+        return isSetSuccess();
+      case ERR:
+        return isSetErr();
+      }
+      throw new IllegalStateException();
+    }
+
+    public boolean isSet(int fieldID) {
+      return isSet(_Fields.findByThriftIdOrThrow(fieldID));
+    }
+
+    @Override
+    public boolean equals(Object that) {
+      if (that == null)
+        return false;
+      if (that instanceof getTaskList_result)
+        return this.equals((getTaskList_result)that);
+      return false;
+    }
+
+    public boolean equals(getTaskList_result that) {
+      if (that == null)
+        return false;
+
+      boolean this_present_success = true && this.isSetSuccess();
+      boolean that_present_success = true && that.isSetSuccess();
+      if (this_present_success || that_present_success) {
+        if (!(this_present_success && that_present_success))
+          return false;
+        if (!this.success.equals(that.success))
+          return false;
+      }
+
+      boolean this_present_err = true && this.isSetErr();
+      boolean that_present_err = true && that.isSetErr();
+      if (this_present_err || that_present_err) {
+        if (!(this_present_err && that_present_err))
+          return false;
+        if (!this.err.equals(that.err))
+          return false;
+      }
+
+      return true;
+    }
+
+    @Override
+    public int hashCode() {
+      return 0;
+    }
+
+    public void read(TProtocol iprot) throws TException {
+      TField field;
+      iprot.readStructBegin();
+      while (true)
+      {
+        field = iprot.readFieldBegin();
+        if (field.type == TType.STOP) { 
+          break;
+        }
+        _Fields fieldId = _Fields.findByThriftId(field.id);
+        if (fieldId == null) {
+          TProtocolUtil.skip(iprot, field.type);
+        } else {
+          switch (fieldId) {
+            case SUCCESS:
+              if (field.type == TType.STRUCT) {
+                this.success = new ThriftTaskInProgressList();
+                this.success.read(iprot);
+              } else { 
+                TProtocolUtil.skip(iprot, field.type);
+              }
+              break;
+            case ERR:
+              if (field.type == TType.STRUCT) {
+                this.err = new JobNotFoundException();
+                this.err.read(iprot);
+              } else { 
+                TProtocolUtil.skip(iprot, field.type);
+              }
+              break;
+          }
+          iprot.readFieldEnd();
+        }
+      }
+      iprot.readStructEnd();
+
+      // check for required fields of primitive type, which can't be checked in the validate method
+      validate();
+    }
+
+    public void write(TProtocol oprot) throws TException {
+      oprot.writeStructBegin(STRUCT_DESC);
+
+      if (this.isSetSuccess()) {
+        oprot.writeFieldBegin(SUCCESS_FIELD_DESC);
+        this.success.write(oprot);
+        oprot.writeFieldEnd();
+      } else if (this.isSetErr()) {
+        oprot.writeFieldBegin(ERR_FIELD_DESC);
+        this.err.write(oprot);
+        oprot.writeFieldEnd();
+      }
+      oprot.writeFieldStop();
+      oprot.writeStructEnd();
+    }
+
+    @Override
+    public String toString() {
+      StringBuilder sb = new StringBuilder("getTaskList_result(");
+      boolean first = true;
+
+      sb.append("success:");
+      if (this.success == null) {
+        sb.append("null");
+      } else {
+        sb.append(this.success);
+      }
+      first = false;
+      if (!first) sb.append(", ");
+      sb.append("err:");
+      if (this.err == null) {
+        sb.append("null");
+      } else {
+        sb.append(this.err);
+      }
+      first = false;
+      sb.append(")");
+      return sb.toString();
+    }
+
+    public void validate() throws TException {
+      // check for required fields
+    }
+
+  }
+
+  public static class getTopTasks_args implements TBase<getTopTasks_args._Fields>, java.io.Serializable, Cloneable   {
+    private static final TStruct STRUCT_DESC = new TStruct("getTopTasks_args");
+
+    private static final TField CTX_FIELD_DESC = new TField("ctx", TType.STRUCT, (short)10);
+    private static final TField JOB_ID_FIELD_DESC = new TField("jobID", TType.STRUCT, (short)1);
+    private static final TField STATES_FIELD_DESC = new TField("states", TType.SET, (short)2);
+    private static final TField COUNT_FIELD_DESC = new TField("count", TType.I32, (short)3);
+    private static final TField NEWEST_FIRST_FIELD_DESC = new TField("newestFirst", TType.BOOL, (short)4);
+
+    public org.apache.hadoop.thriftfs.api.RequestContext ctx;
+    public ThriftJobID jobID;
+    public Set<ThriftTaskQueryState> states;
+    public int count;
+    public boolean newestFirst;
+
+    /** The set of fields this struct contains, along with convenience methods for finding and manipulating them. */
+    public enum _Fields implements TFieldIdEnum {
+      CTX((short)10, "ctx"),
+      JOB_ID((short)1, "jobID"),
+      STATES((short)2, "states"),
+      COUNT((short)3, "count"),
+      NEWEST_FIRST((short)4, "newestFirst");
+
+      private static final Map<Integer, _Fields> byId = new HashMap<Integer, _Fields>();
+      private static final Map<String, _Fields> byName = new HashMap<String, _Fields>();
+
+      static {
+        for (_Fields field : EnumSet.allOf(_Fields.class)) {
+          byId.put((int)field._thriftId, field);
+          byName.put(field.getFieldName(), field);
+        }
+      }
+
+      /**
+       * Find the _Fields constant that matches fieldId, or null if its not found.
+       */
+      public static _Fields findByThriftId(int fieldId) {
+        return byId.get(fieldId);
+      }
+
+      /**
+       * Find the _Fields constant that matches fieldId, throwing an exception
+       * if it is not found.
+       */
+      public static _Fields findByThriftIdOrThrow(int fieldId) {
+        _Fields fields = findByThriftId(fieldId);
+        if (fields == null) throw new IllegalArgumentException("Field " + fieldId + " doesn't exist!");
+        return fields;
+      }
+
+      /**
+       * Find the _Fields constant that matches name, or null if its not found.
+       */
+      public static _Fields findByName(String name) {
+        return byName.get(name);
+      }
+
+      private final short _thriftId;
+      private final String _fieldName;
+
+      _Fields(short thriftId, String fieldName) {
+        _thriftId = thriftId;
+        _fieldName = fieldName;
+      }
+
+      public short getThriftFieldId() {
+        return _thriftId;
+      }
+
+      public String getFieldName() {
+        return _fieldName;
+      }
+    }
+
+    // isset id assignments
+    private static final int __COUNT_ISSET_ID = 0;
+    private static final int __NEWESTFIRST_ISSET_ID = 1;
+    private BitSet __isset_bit_vector = new BitSet(2);
+
+    public static final Map<_Fields, FieldMetaData> metaDataMap = Collections.unmodifiableMap(new EnumMap<_Fields, FieldMetaData>(_Fields.class) {{
+      put(_Fields.CTX, new FieldMetaData("ctx", TFieldRequirementType.DEFAULT, 
+          new StructMetaData(TType.STRUCT, org.apache.hadoop.thriftfs.api.RequestContext.class)));
+      put(_Fields.JOB_ID, new FieldMetaData("jobID", TFieldRequirementType.DEFAULT, 
+          new StructMetaData(TType.STRUCT, ThriftJobID.class)));
+      put(_Fields.STATES, new FieldMetaData("states", TFieldRequirementType.DEFAULT, 
+          new SetMetaData(TType.SET, 
+              new EnumMetaData(TType.ENUM, ThriftTaskQueryState.class))));
+      put(_Fields.COUNT, new FieldMetaData("count", TFieldRequirementType.DEFAULT, 
+          new FieldValueMetaData(TType.I32)));
+      put(_Fields.NEWEST_FIRST, new FieldMetaData("newestFirst", TFieldRequirementType.DEFAULT, 
+          new FieldValueMetaData(TType.BOOL)));
+    }});
+
+    static {
+      FieldMetaData.addStructMetaDataMap(getTopTasks_args.class, metaDataMap);
+    }
+
+    public getTopTasks_args() {
+    }
+
+    public getTopTasks_args(
+      org.apache.hadoop.thriftfs.api.RequestContext ctx,
+      ThriftJobID jobID,
+      Set<ThriftTaskQueryState> states,
+      int count,
+      boolean newestFirst)
+    {
+      this();
+      this.ctx = ctx;
+      this.jobID = jobID;
+      this.states = states;
+      this.count = count;
+      setCountIsSet(true);
+      this.newestFirst = newestFirst;
+      setNewestFirstIsSet(true);
+    }
+
+    /**
+     * Performs a deep copy on <i>other</i>.
+     */
+    public getTopTasks_args(getTopTasks_args other) {
+      __isset_bit_vector.clear();
+      __isset_bit_vector.or(other.__isset_bit_vector);
+      if (other.isSetCtx()) {
+        this.ctx = new org.apache.hadoop.thriftfs.api.RequestContext(other.ctx);
+      }
+      if (other.isSetJobID()) {
+        this.jobID = new ThriftJobID(other.jobID);
+      }
+      if (other.isSetStates()) {
+        Set<ThriftTaskQueryState> __this__states = new HashSet<ThriftTaskQueryState>();
+        for (ThriftTaskQueryState other_element : other.states) {
+          __this__states.add(other_element);
+        }
+        this.states = __this__states;
+      }
+      this.count = other.count;
+      this.newestFirst = other.newestFirst;
+    }
+
+    public getTopTasks_args deepCopy() {
+      return new getTopTasks_args(this);
+    }
+
+    @Deprecated
+    public getTopTasks_args clone() {
+      return new getTopTasks_args(this);
+    }
+
+    public org.apache.hadoop.thriftfs.api.RequestContext getCtx() {
+      return this.ctx;
+    }
+
+    public getTopTasks_args setCtx(org.apache.hadoop.thriftfs.api.RequestContext ctx) {
+      this.ctx = ctx;
+      return this;
+    }
+
+    public void unsetCtx() {
+      this.ctx = null;
+    }
+
+    /** Returns true if field ctx is set (has been asigned a value) and false otherwise */
+    public boolean isSetCtx() {
+      return this.ctx != null;
+    }
+
+    public void setCtxIsSet(boolean value) {
+      if (!value) {
+        this.ctx = null;
+      }
+    }
+
+    public ThriftJobID getJobID() {
+      return this.jobID;
+    }
+
+    public getTopTasks_args setJobID(ThriftJobID jobID) {
+      this.jobID = jobID;
+      return this;
+    }
+
+    public void unsetJobID() {
+      this.jobID = null;
+    }
+
+    /** Returns true if field jobID is set (has been asigned a value) and false otherwise */
+    public boolean isSetJobID() {
+      return this.jobID != null;
+    }
+
+    public void setJobIDIsSet(boolean value) {
+      if (!value) {
+        this.jobID = null;
+      }
+    }
+
+    public int getStatesSize() {
+      return (this.states == null) ? 0 : this.states.size();
+    }
+
+    public java.util.Iterator<ThriftTaskQueryState> getStatesIterator() {
+      return (this.states == null) ? null : this.states.iterator();
+    }
+
+    public void addToStates(ThriftTaskQueryState elem) {
+      if (this.states == null) {
+        this.states = new HashSet<ThriftTaskQueryState>();
+      }
+      this.states.add(elem);
+    }
+
+    public Set<ThriftTaskQueryState> getStates() {
+      return this.states;
+    }
+
+    public getTopTasks_args setStates(Set<ThriftTaskQueryState> states) {
+      this.states = states;
+      return this;
+    }
+
+    public void unsetStates() {
+      this.states = null;
+    }
+
+    /** Returns true if field states is set (has been asigned a value) and false otherwise */
+    public boolean isSetStates() {
+      return this.states != null;
+    }
+
+    public void setStatesIsSet(boolean value) {
+      if (!value) {
+        this.states = null;
+      }
+    }
+
+    public int getCount() {
+      return this.count;
+    }
+
+    public getTopTasks_args setCount(int count) {
+      this.count = count;
+      setCountIsSet(true);
+      return this;
+    }
+
+    public void unsetCount() {
+      __isset_bit_vector.clear(__COUNT_ISSET_ID);
+    }
+
+    /** Returns true if field count is set (has been asigned a value) and false otherwise */
+    public boolean isSetCount() {
+      return __isset_bit_vector.get(__COUNT_ISSET_ID);
+    }
+
+    public void setCountIsSet(boolean value) {
+      __isset_bit_vector.set(__COUNT_ISSET_ID, value);
+    }
+
+    public boolean isNewestFirst() {
+      return this.newestFirst;
+    }
+
+    public getTopTasks_args setNewestFirst(boolean newestFirst) {
+      this.newestFirst = newestFirst;
+      setNewestFirstIsSet(true);
+      return this;
+    }
+
+    public void unsetNewestFirst() {
+      __isset_bit_vector.clear(__NEWESTFIRST_ISSET_ID);
+    }
+
+    /** Returns true if field newestFirst is set (has been asigned a value) and false otherwise */
+    public boolean isSetNewestFirst() {
+      return __isset_bit_vector.get(__NEWESTFIRST_ISSET_ID);
+    }
+
+    public void setNewestFirstIsSet(boolean value) {
+      __isset_bit_vector.set(__NEWESTFIRST_ISSET_ID, value);
+    }
+
+    public void setFieldValue(_Fields field, Object value) {
+      switch (field) {
+      case CTX:
+        if (value == null) {
+          unsetCtx();
+        } else {
+          setCtx((org.apache.hadoop.thriftfs.api.RequestContext)value);
+        }
+        break;
+
+      case JOB_ID:
+        if (value == null) {
+          unsetJobID();
+        } else {
+          setJobID((ThriftJobID)value);
+        }
+        break;
+
+      case STATES:
+        if (value == null) {
+          unsetStates();
+        } else {
+          setStates((Set<ThriftTaskQueryState>)value);
+        }
+        break;
+
+      case COUNT:
+        if (value == null) {
+          unsetCount();
+        } else {
+          setCount((Integer)value);
+        }
+        break;
+
+      case NEWEST_FIRST:
+        if (value == null) {
+          unsetNewestFirst();
+        } else {
+          setNewestFirst((Boolean)value);
+        }
+        break;
+
+      }
+    }
+
+    public void setFieldValue(int fieldID, Object value) {
+      setFieldValue(_Fields.findByThriftIdOrThrow(fieldID), value);
+    }
+
+    public Object getFieldValue(_Fields field) {
+      switch (field) {
+      case CTX:
+        return getCtx();
+
+      case JOB_ID:
+        return getJobID();
+
+      case STATES:
+        return getStates();
+
+      case COUNT:
+        return new Integer(getCount());
+
+      case NEWEST_FIRST:
+        return new Boolean(isNewestFirst());
+
+      }
+      throw new IllegalStateException();
+    }
+
+    public Object getFieldValue(int fieldId) {
+      return getFieldValue(_Fields.findByThriftIdOrThrow(fieldId));
+    }
+
+    /** Returns true if field corresponding to fieldID is set (has been asigned a value) and false otherwise */
+    public boolean isSet(_Fields field) {
+      switch (field) {
+      case CTX:
+        return isSetCtx();
+      case JOB_ID:
+        return isSetJobID();
+      case STATES:
+        return isSetStates();
+      case COUNT:
+        return isSetCount();
+      case NEWEST_FIRST:
+        return isSetNewestFirst();
+      }
+      throw new IllegalStateException();
+    }
+
+    public boolean isSet(int fieldID) {
+      return isSet(_Fields.findByThriftIdOrThrow(fieldID));
+    }
+
+    @Override
+    public boolean equals(Object that) {
+      if (that == null)
+        return false;
+      if (that instanceof getTopTasks_args)
+        return this.equals((getTopTasks_args)that);
+      return false;
+    }
+
+    public boolean equals(getTopTasks_args that) {
+      if (that == null)
+        return false;
+
+      boolean this_present_ctx = true && this.isSetCtx();
+      boolean that_present_ctx = true && that.isSetCtx();
+      if (this_present_ctx || that_present_ctx) {
+        if (!(this_present_ctx && that_present_ctx))
+          return false;
+        if (!this.ctx.equals(that.ctx))
+          return false;
+      }
+
+      boolean this_present_jobID = true && this.isSetJobID();
+      boolean that_present_jobID = true && that.isSetJobID();
+      if (this_present_jobID || that_present_jobID) {
+        if (!(this_present_jobID && that_present_jobID))
+          return false;
+        if (!this.jobID.equals(that.jobID))
+          return false;
+      }
+
+      boolean this_present_states = true && this.isSetStates();
+      boolean that_present_states = true && that.isSetStates();
+      if (this_present_states || that_present_states) {
+        if (!(this_present_states && that_present_states))
+          return false;
+        if (!this.states.equals(that.states))
+          return false;
+      }
+
+      boolean this_present_count = true;
+      boolean that_present_count = true;
+      if (this_present_count || that_present_count) {
+        if (!(this_present_count && that_present_count))
+          return false;
+        if (this.count != that.count)
+          return false;
+      }
+
+      boolean this_present_newestFirst = true;
+      boolean that_present_newestFirst = true;
+      if (this_present_newestFirst || that_present_newestFirst) {
+        if (!(this_present_newestFirst && that_present_newestFirst))
+          return false;
+        if (this.newestFirst != that.newestFirst)
+          return false;
+      }
+
+      return true;
+    }
+
+    @Override
+    public int hashCode() {
+      return 0;
+    }
+
+    public void read(TProtocol iprot) throws TException {
+      TField field;
+      iprot.readStructBegin();
+      while (true)
+      {
+        field = iprot.readFieldBegin();
+        if (field.type == TType.STOP) { 
+          break;
+        }
+        _Fields fieldId = _Fields.findByThriftId(field.id);
+        if (fieldId == null) {
+          TProtocolUtil.skip(iprot, field.type);
+        } else {
+          switch (fieldId) {
+            case CTX:
+              if (field.type == TType.STRUCT) {
+                this.ctx = new org.apache.hadoop.thriftfs.api.RequestContext();
+                this.ctx.read(iprot);
+              } else { 
+                TProtocolUtil.skip(iprot, field.type);
+              }
+              break;
+            case JOB_ID:
+              if (field.type == TType.STRUCT) {
+                this.jobID = new ThriftJobID();
+                this.jobID.read(iprot);
+              } else { 
+                TProtocolUtil.skip(iprot, field.type);
+              }
+              break;
+            case STATES:
+              if (field.type == TType.SET) {
+                {
+                  TSet _set107 = iprot.readSetBegin();
+                  this.states = new HashSet<ThriftTaskQueryState>(2*_set107.size);
+                  for (int _i108 = 0; _i108 < _set107.size; ++_i108)
+                  {
+                    ThriftTaskQueryState _elem109;
+                    _elem109 = ThriftTaskQueryState.findByValue(iprot.readI32());
+                    this.states.add(_elem109);
+                  }
+                  iprot.readSetEnd();
+                }
+              } else { 
+                TProtocolUtil.skip(iprot, field.type);
+              }
+              break;
+            case COUNT:
+              if (field.type == TType.I32) {
+                this.count = iprot.readI32();
+                setCountIsSet(true);
+              } else { 
+                TProtocolUtil.skip(iprot, field.type);
+              }
+              break;
+            case NEWEST_FIRST:
+              if (field.type == TType.BOOL) {
+                this.newestFirst = iprot.readBool();
+                setNewestFirstIsSet(true);
+              } else { 
+                TProtocolUtil.skip(iprot, field.type);
+              }
+              break;
+          }
+          iprot.readFieldEnd();
+        }
+      }
+      iprot.readStructEnd();
+
+      // check for required fields of primitive type, which can't be checked in the validate method
+      validate();
+    }
+
+    public void write(TProtocol oprot) throws TException {
+      validate();
+
+      oprot.writeStructBegin(STRUCT_DESC);
+      if (this.jobID != null) {
+        oprot.writeFieldBegin(JOB_ID_FIELD_DESC);
+        this.jobID.write(oprot);
+        oprot.writeFieldEnd();
+      }
+      if (this.states != null) {
+        oprot.writeFieldBegin(STATES_FIELD_DESC);
+        {
+          oprot.writeSetBegin(new TSet(TType.I32, this.states.size()));
+          for (ThriftTaskQueryState _iter110 : this.states)
+          {
+            oprot.writeI32(_iter110.getValue());
+          }
+          oprot.writeSetEnd();
+        }
+        oprot.writeFieldEnd();
+      }
+      oprot.writeFieldBegin(COUNT_FIELD_DESC);
+      oprot.writeI32(this.count);
+      oprot.writeFieldEnd();
+      oprot.writeFieldBegin(NEWEST_FIRST_FIELD_DESC);
+      oprot.writeBool(this.newestFirst);
+      oprot.writeFieldEnd();
+      if (this.ctx != null) {
+        oprot.writeFieldBegin(CTX_FIELD_DESC);
+        this.ctx.write(oprot);
+        oprot.writeFieldEnd();
+      }
+      oprot.writeFieldStop();
+      oprot.writeStructEnd();
+    }
+
+    @Override
+    public String toString() {
+      StringBuilder sb = new StringBuilder("getTopTasks_args(");
+      boolean first = true;
+
+      sb.append("ctx:");
+      if (this.ctx == null) {
+        sb.append("null");
+      } else {
+        sb.append(this.ctx);
+      }
+      first = false;
+      if (!first) sb.append(", ");
+      sb.append("jobID:");
+      if (this.jobID == null) {
+        sb.append("null");
+      } else {
+        sb.append(this.jobID);
+      }
+      first = false;
+      if (!first) sb.append(", ");
+      sb.append("states:");
+      if (this.states == null) {
+        sb.append("null");
+      } else {
+        sb.append(this.states);
+      }
+      first = false;
+      if (!first) sb.append(", ");
+      sb.append("count:");
+      sb.append(this.count);
+      first = false;
+      if (!first) sb.append(", ");
+      sb.append("newestFirst:");
+      sb.append(this.newestFirst);
+      first = false;
+      sb.append(")");
+      return sb.toString();
+    }
+
+    public void validate() throws TException {
+      // check for required fields
+    }
+
+  }
+
+  public static class getTopTasks_result implements TBase<getTopTasks_result._Fields>, java.io.Serializable, Cloneable   {
+    private static final TStruct STRUCT_DESC = new TStruct("getTopTasks_result");
+
+    private static final TField SUCCESS_FIELD_DESC = new TField("success", TType.STRUCT, (short)0);
+    private static final TField ERR_FIELD_DESC = new TField("err", TType.STRUCT, (short)1);
+
+    public ThriftTaskInProgressList success;
+    public JobNotFoundException err;
+
+    /** The set of fields this struct contains, along with convenience methods for finding and manipulating them. */
+    public enum _Fields implements TFieldIdEnum {
+      SUCCESS((short)0, "success"),
+      ERR((short)1, "err");
+
+      private static final Map<Integer, _Fields> byId = new HashMap<Integer, _Fields>();
+      private static final Map<String, _Fields> byName = new HashMap<String, _Fields>();
+
+      static {
+        for (_Fields field : EnumSet.allOf(_Fields.class)) {
+          byId.put((int)field._thriftId, field);
+          byName.put(field.getFieldName(), field);
+        }
+      }
+
+      /**
+       * Find the _Fields constant that matches fieldId, or null if its not found.
+       */
+      public static _Fields findByThriftId(int fieldId) {
+        return byId.get(fieldId);
+      }
+
+      /**
+       * Find the _Fields constant that matches fieldId, throwing an exception
+       * if it is not found.
+       */
+      public static _Fields findByThriftIdOrThrow(int fieldId) {
+        _Fields fields = findByThriftId(fieldId);
+        if (fields == null) throw new IllegalArgumentException("Field " + fieldId + " doesn't exist!");
+        return fields;
+      }
+
+      /**
+       * Find the _Fields constant that matches name, or null if its not found.
+       */
+      public static _Fields findByName(String name) {
+        return byName.get(name);
+      }
+
+      private final short _thriftId;
+      private final String _fieldName;
+
+      _Fields(short thriftId, String fieldName) {
+        _thriftId = thriftId;
+        _fieldName = fieldName;
+      }
+
+      public short getThriftFieldId() {
+        return _thriftId;
+      }
+
+      public String getFieldName() {
+        return _fieldName;
+      }
+    }
+
+    // isset id assignments
+
+    public static final Map<_Fields, FieldMetaData> metaDataMap = Collections.unmodifiableMap(new EnumMap<_Fields, FieldMetaData>(_Fields.class) {{
+      put(_Fields.SUCCESS, new FieldMetaData("success", TFieldRequirementType.DEFAULT, 
+          new StructMetaData(TType.STRUCT, ThriftTaskInProgressList.class)));
+      put(_Fields.ERR, new FieldMetaData("err", TFieldRequirementType.DEFAULT, 
+          new FieldValueMetaData(TType.STRUCT)));
+    }});
+
+    static {
+      FieldMetaData.addStructMetaDataMap(getTopTasks_result.class, metaDataMap);
+    }
+
+    public getTopTasks_result() {
+    }
+
+    public getTopTasks_result(
+      ThriftTaskInProgressList success,
+      JobNotFoundException err)
+    {
+      this();
+      this.success = success;
+      this.err = err;
+    }
+
+    /**
+     * Performs a deep copy on <i>other</i>.
+     */
+    public getTopTasks_result(getTopTasks_result other) {
+      if (other.isSetSuccess()) {
+        this.success = new ThriftTaskInProgressList(other.success);
+      }
+      if (other.isSetErr()) {
+        this.err = new JobNotFoundException(other.err);
+      }
+    }
+
+    public getTopTasks_result deepCopy() {
+      return new getTopTasks_result(this);
+    }
+
+    @Deprecated
+    public getTopTasks_result clone() {
+      return new getTopTasks_result(this);
+    }
+
+    public ThriftTaskInProgressList getSuccess() {
+      return this.success;
+    }
+
+    public getTopTasks_result setSuccess(ThriftTaskInProgressList success) {
+      this.success = success;
+      return this;
+    }
+
+    public void unsetSuccess() {
+      this.success = null;
+    }
+
+    /** Returns true if field success is set (has been asigned a value) and false otherwise */
+    public boolean isSetSuccess() {
+      return this.success != null;
+    }
+
+    public void setSuccessIsSet(boolean value) {
+      if (!value) {
+        this.success = null;
+      }
+    }
+
+    public JobNotFoundException getErr() {
+      return this.err;
+    }
+
+    public getTopTasks_result setErr(JobNotFoundException err) {
+      this.err = err;
+      return this;
+    }
+
+    public void unsetErr() {
+      this.err = null;
+    }
+
+    /** Returns true if field err is set (has been asigned a value) and false otherwise */
+    public boolean isSetErr() {
+      return this.err != null;
+    }
+
+    public void setErrIsSet(boolean value) {
+      if (!value) {
+        this.err = null;
+      }
+    }
+
+    public void setFieldValue(_Fields field, Object value) {
+      switch (field) {
+      case SUCCESS:
+        if (value == null) {
+          unsetSuccess();
+        } else {
+          setSuccess((ThriftTaskInProgressList)value);
+        }
+        break;
+
+      case ERR:
+        if (value == null) {
+          unsetErr();
+        } else {
+          setErr((JobNotFoundException)value);
+        }
+        break;
+
+      }
+    }
+
+    public void setFieldValue(int fieldID, Object value) {
+      setFieldValue(_Fields.findByThriftIdOrThrow(fieldID), value);
+    }
+
+    public Object getFieldValue(_Fields field) {
+      switch (field) {
+      case SUCCESS:
+        return getSuccess();
+
+      case ERR:
+        return getErr();
+
+      }
+      throw new IllegalStateException();
+    }
+
+    public Object getFieldValue(int fieldId) {
+      return getFieldValue(_Fields.findByThriftIdOrThrow(fieldId));
+    }
+
+    /** Returns true if field corresponding to fieldID is set (has been asigned a value) and false otherwise */
+    public boolean isSet(_Fields field) {
+      switch (field) {
+      case SUCCESS:
+        return isSetSuccess();
+      case ERR:
+        return isSetErr();
+      }
+      throw new IllegalStateException();
+    }
+
+    public boolean isSet(int fieldID) {
+      return isSet(_Fields.findByThriftIdOrThrow(fieldID));
+    }
+
+    @Override
+    public boolean equals(Object that) {
+      if (that == null)
+        return false;
+      if (that instanceof getTopTasks_result)
+        return this.equals((getTopTasks_result)that);
+      return false;
+    }
+
+    public boolean equals(getTopTasks_result that) {
+      if (that == null)
+        return false;
+
+      boolean this_present_success = true && this.isSetSuccess();
+      boolean that_present_success = true && that.isSetSuccess();
+      if (this_present_success || that_present_success) {
+        if (!(this_present_success && that_present_success))
+          return false;
+        if (!this.success.equals(that.success))
+          return false;
+      }
+
+      boolean this_present_err = true && this.isSetErr();
+      boolean that_present_err = true && that.isSetErr();
+      if (this_present_err || that_present_err) {
+        if (!(this_present_err && that_present_err))
+          return false;
+        if (!this.err.equals(that.err))
+          return false;
+      }
+
+      return true;
+    }
+
+    @Override
+    public int hashCode() {
+      return 0;
+    }
+
+    public void read(TProtocol iprot) throws TException {
+      TField field;
+      iprot.readStructBegin();
+      while (true)
+      {
+        field = iprot.readFieldBegin();
+        if (field.type == TType.STOP) { 
+          break;
+        }
+        _Fields fieldId = _Fields.findByThriftId(field.id);
+        if (fieldId == null) {
+          TProtocolUtil.skip(iprot, field.type);
+        } else {
+          switch (fieldId) {
+            case SUCCESS:
+              if (field.type == TType.STRUCT) {
+                this.success = new ThriftTaskInProgressList();
+                this.success.read(iprot);
+              } else { 
+                TProtocolUtil.skip(iprot, field.type);
+              }
+              break;
+            case ERR:
+              if (field.type == TType.STRUCT) {
+                this.err = new JobNotFoundException();
+                this.err.read(iprot);
+              } else { 
+                TProtocolUtil.skip(iprot, field.type);
+              }
+              break;
+          }
+          iprot.readFieldEnd();
+        }
+      }
+      iprot.readStructEnd();
+
+      // check for required fields of primitive type, which can't be checked in the validate method
+      validate();
+    }
+
+    public void write(TProtocol oprot) throws TException {
+      oprot.writeStructBegin(STRUCT_DESC);
+
+      if (this.isSetSuccess()) {
+        oprot.writeFieldBegin(SUCCESS_FIELD_DESC);
+        this.success.write(oprot);
+        oprot.writeFieldEnd();
+      } else if (this.isSetErr()) {
+        oprot.writeFieldBegin(ERR_FIELD_DESC);
+        this.err.write(oprot);
+        oprot.writeFieldEnd();
+      }
+      oprot.writeFieldStop();
+      oprot.writeStructEnd();
+    }
+
+    @Override
+    public String toString() {
+      StringBuilder sb = new StringBuilder("getTopTasks_result(");
+      boolean first = true;
+
+      sb.append("success:");
+      if (this.success == null) {
+        sb.append("null");
+      } else {
+        sb.append(this.success);
+      }
+      first = false;
+      if (!first) sb.append(", ");
+      sb.append("err:");
+      if (this.err == null) {
+        sb.append("null");
+      } else {
+        sb.append(this.err);
+      }
+      first = false;
+      sb.append(")");
+      return sb.toString();
+    }
+
+    public void validate() throws TException {
+      // check for required fields
+    }
+
+  }
+
+  public static class getTaskPage_args implements TBase<getTaskPage_args._Fields>, java.io.Serializable, Cloneable   {
+    private static final TStruct STRUCT_DESC = new TStruct("getTaskPage_args");
+
+    private static final TField CTX_FIELD_DESC = new TField("ctx", TType.STRUCT, (short)10);
+    private static final TField JOB_ID_FIELD_DESC = new TField("jobID", TType.STRUCT, (short)1);
+    private static final TField TYPES_FIELD_DESC = new TField("types", TType.SET, (short)2);
+    private static final TField STATES_FIELD_DESC = new TField("states", TType.SET, (short)3);
+    private static final TField TEXT_FIELD_DESC = new TField("text", TType.STRING, (short)4);
+    private static final TField CURSOR_FIELD_DESC = new TField("cursor", TType.STRING, (short)5);
+    private static final TField COUNT_FIELD_DESC = new TField("count", TType.I32, (short)6);
+
+    public org.apache.hadoop.thriftfs.api.RequestContext ctx;
+    public ThriftJobID jobID;
+    public Set<ThriftTaskType> types;
+    public Set<ThriftTaskQueryState> states;
+    public String text;
+    public String cursor;
+    public int count;
+
+    /** The set of fields this struct contains, along with convenience methods for finding and manipulating them. */
+    public enum _Fields implements TFieldIdEnum {
+      CTX((short)10, "ctx"),
+      JOB_ID((short)1, "jobID"),
+      TYPES((short)2, "types"),
+      STATES((short)3, "states"),
+      TEXT((short)4, "text"),
+      CURSOR((short)5, "cursor"),
+      COUNT((short)6, "count");
+
+      private static final Map<Integer, _Fields> byId = new HashMap<Integer, _Fields>();
+      private static final Map<String, _Fields> byName = new HashMap<String, _Fields>();
+
+      static {
+        for (_Fields field : EnumSet.allOf(_Fields.class)) {
+          byId.put((int)field._thriftId, field);
+          byName.put(field.getFieldName(), field);
+        }
+      }
+
+      /**
+       * Find the _Fields constant that matches fieldId, or null if its not found.
+       */
+      public static _Fields findByThriftId(int fieldId) {
+        return byId.get(fieldId);
+      }
+
+      /**
+       * Find the _Fields constant that matches fieldId, throwing an exception
+       * if it is not found.
+       */
+      public static _Fields findByThriftIdOrThrow(int fieldId) {
+        _Fields fields = findByThriftId(fieldId);
+        if (fields == null) throw new IllegalArgumentException("Field " + fieldId + " doesn't exist!");
+        return fields;
+      }
+
+      /**
+       * Find the _Fields constant that matches name, or null if its not found.
+       */
+      public static _Fields findByName(String name) {
+        return byName.get(name);
+      }
+
+      private final short _thriftId;
+      private final String _fieldName;
+
+      _Fields(short thriftId, String fieldName) {
+        _thriftId = thriftId;
+        _fieldName = fieldName;
+      }
+
+      public short getThriftFieldId() {
+        return _thriftId;
+      }
+
+      public String getFieldName() {
+        return _fieldName;
+      }
+    }
+
+    // isset id assignments
+    private static final int __COUNT_ISSET_ID = 0;
+    private BitSet __isset_bit_vector = new BitSet(1);
+
+    public static final Map<_Fields, FieldMetaData> metaDataMap = Collections.unmodifiableMap(new EnumMap<_Fields, FieldMetaData>(_Fields.class) {{
+      put(_Fields.CTX, new FieldMetaData("ctx", TFieldRequirementType.DEFAULT, 
+          new StructMetaData(TType.STRUCT, org.apache.hadoop.thriftfs.api.RequestContext.class)));
+      put(_Fields.JOB_ID, new FieldMetaData("jobID", TFieldRequirementType.DEFAULT, 
+          new StructMetaData(TType.STRUCT, ThriftJobID.class)));
+      put(_Fields.TYPES, new FieldMetaData("types", TFieldRequirementType.DEFAULT, 
+          new SetMetaData(TType.SET, 
+              new EnumMetaData(TType.ENUM, ThriftTaskType.class))));
+      put(_Fields.STATES, new FieldMetaData("states", TFieldRequirementType.DEFAULT, 
+          new SetMetaData(TType.SET, 
+              new EnumMetaData(TType.ENUM, ThriftTaskQueryState.class))));
+      put(_Fields.TEXT, new FieldMetaData("text", TFieldRequirementType.DEFAULT, 
+          new FieldValueMetaData(TType.STRING)));
+      put(_Fields.CURSOR, new FieldMetaData("cursor", TFieldRequirementType.DEFAULT, 
+          new FieldValueMetaData(TType.STRING)));
+      put(_Fields.COUNT, new FieldMetaData("count", TFieldRequirementType.DEFAULT, 
+          new FieldValueMetaData(TType.I32)));
+    }});
+
+    static {
+      FieldMetaData.addStructMetaDataMap(getTaskPage_args.class, metaDataMap);
+    }
+
+    public getTaskPage_args() {
+    }
+
+    public getTaskPage_args(
+      org.apache.hadoop.thriftfs.api.RequestContext ctx,
+      ThriftJobID jobID,
+      Set<ThriftTaskType> types,
+      Set<ThriftTaskQueryState> states,
+      String text,
+      String cursor,
+      int count)
+    {
+      this();
+      this.ctx = ctx;
+      this.jobID = jobID;
+      this.types = types;
+      this.states = states;
+      this.text = text;
+      this.cursor = cursor;
+      this.count = count;
+      setCountIsSet(true);
+    }
+
+    /**
+     * Performs a deep copy on <i>other</i>.
+     */
+    public getTaskPage_args(getTaskPage_args other) {
+      __isset_bit_vector.clear();
+      __isset_bit_vector.or(other.__isset_bit_vector);
+      if (other.isSetCtx()) {
+        this.ctx = new org.apache.hadoop.thriftfs.api.RequestContext(other.ctx);
+      }
+      if (other.isSetJobID()) {
+        this.jobID = new ThriftJobID(other.jobID);
+      }
+      if (other.isSetTypes()) {
+        Set<ThriftTaskType> __this__types = new HashSet<ThriftTaskType>();
+        for (ThriftTaskType other_element : other.types) {
+          __this__types.add(other_element);
+        }
+        this.types = __this__types;
+      }
+      if (other.isSetStates()) {
+        Set<ThriftTaskQueryState> __this__states = new HashSet<ThriftTaskQueryState>();
+        for (ThriftTaskQueryState other_element : other.states) {
+          __this__states.add(other_element);
+        }
+        this.states = __this__states;
+      }
+      if (other.isSetText()) {
+        this.text = other.text;
+      }
+      if (other.isSetCursor()) {
+        this.cursor = other.cursor;
+      }
+      this.count = other.count;
+    }
+
+    public getTaskPage_args deepCopy() {
+      return new getTaskPage_args(this);
+    }
+
+    @Deprecated
+    public getTaskPage_args clone() {
+      return new getTaskPage_args(this);
+    }
+
+    public org.apache.hadoop.thriftfs.api.RequestContext getCtx() {
+      return this.ctx;
+    }
+
+    public getTaskPage_args setCtx(org.apache.hadoop.thriftfs.api.RequestContext ctx) {
+      this.ctx = ctx;
+      return this;
+    }
+
+    public void unsetCtx() {
+      this.ctx = null;
+    }
+
+    /** Returns true if field ctx is set (has been asigned a value) and false otherwise */
+    public boolean isSetCtx() {
+      return this.ctx != null;
+    }
+
+    public void setCtxIsSet(boolean value) {
+      if (!value) {
+        this.ctx = null;
+      }
+    }
+
+    public ThriftJobID getJobID() {
+      return this.jobID;
+    }
+
+    public getTaskPage_args setJobID(ThriftJobID jobID) {
+      this.jobID = jobID;
+      return this;
+    }
+
+    public void unsetJobID() {
+      this.jobID = null;
+    }
+
+    /** Returns true if field jobID is set (has been asigned a value) and false otherwise */
+    public boolean isSetJobID() {
+      return this.jobID != null;
+    }
+
+    public void setJobIDIsSet(boolean value) {
+      if (!value) {
+        this.jobID = null;
+      }
+    }
+
+    public int getTypesSize() {
+      return (this.types == null) ? 0 : this.types.size();
+    }
+
+    public java.util.Iterator<ThriftTaskType> getTypesIterator() {
+      return (this.types == null) ? null : this.types.iterator();
+    }
+
+    public void addToTypes(ThriftTaskType elem) {
+      if (this.types == null) {
+        this.types = new HashSet<ThriftTaskType>();
+      }
+      this.types.add(elem);
+    }
+
+    public Set<ThriftTaskType> getTypes() {
+      return this.types;
+    }
+
+    public getTaskPage_args setTypes(Set<ThriftTaskType> types) {
+      this.types = types;
+      return this;
+    }
+
+    public void unsetTypes() {
+      this.types = null;
+    }
+
+    /** Returns true if field types is set (has been asigned a value) and false otherwise */
+    public boolean isSetTypes() {
+      return this.types != null;
+    }
+
+    public void setTypesIsSet(boolean value) {
+      if (!value) {
+        this.types = null;
+      }
+    }
+
+    public int getStatesSize() {
+      return (this.states == null) ? 0 : this.states.size();
+    }
+
+    public java.util.Iterator<ThriftTaskQueryState> getStatesIterator() {
+      return (this.states == null) ? null : this.states.iterator();
+    }
+
+    public void addToStates(ThriftTaskQueryState elem) {
+      if (this.states == null) {
+        this.states = new HashSet<ThriftTaskQueryState>();
+      }
+      this.states.add(elem);
+    }
+
+    public Set<ThriftTaskQueryState> getStates() {
+      return this.states;
+    }
+
+    public getTaskPage_args setStates(Set<ThriftTaskQueryState> states) {
+      this.states = states;
+      return this;
+    }
+
+    public void unsetStates() {
+      this.states = null;
+    }
+
+    /** Returns true if field states is set (has been asigned a value) and false otherwise */
+    public boolean isSetStates() {
+      return this.states != null;
+    }
+
+    public void setStatesIsSet(boolean value) {
+      if (!value) {
+        this.states = null;
+      }
+    }
+
+    public String getText() {
+      return this.text;
+    }
+
+    public getTaskPage_args setText(String text) {
+      this.text = text;
+      return this;
+    }
+
+    public void unsetText() {
+      this.text = null;
+    }
+
+    /** Returns true if field text is set (has been asigned a value) and false otherwise */
+    public boolean isSetText() {
+      return this.text != null;
+    }
+
+    public void setTextIsSet(boolean value) {
+      if (!value) {
+        this.text = null;
+      }
+    }
+
+    public String getCursor() {
+      return this.cursor;
+    }
+
+    public getTaskPage_args setCursor(String cursor) {
+      this.cursor = cursor;
+      return this;
+    }
+
+    public void unsetCursor() {
+      this.cursor = null;
+    }
+
+    /** Returns true if field cursor is set (has been asigned a value) and false otherwise */
+    public boolean isSetCursor() {
+      return this.cursor != null;
+    }
+
+    public void setCursorIsSet(boolean value) {
+      if (!value) {
+        this.cursor = null;
+      }
+    }
+
+    public int getCount() {
+      return this.count;
+    }
+
+    public getTaskPage_args setCount(int count) {
+      this.count = count;
+      setCountIsSet(true);
+      return this;
+    }
+
+    public void unsetCount() {
+      __isset_bit_vector.clear(__COUNT_ISSET_ID);
+    }
+
+    /** Returns true if field count is set (has been asigned a value) and false otherwise */
+    public boolean isSetCount() {
+      return __isset_bit_vector.get(__COUNT_ISSET_ID);
+    }
+
+    public void setCountIsSet(boolean value) {
+      __isset_bit_vector.set(__COUNT_ISSET_ID, value);
+    }
+
+    public void setFieldValue(_Fields field, Object value) {
+      switch (field) {
+      case CTX:
+        if (value == null) {
+          unsetCtx();
+        } else {
+          setCtx((org.apache.hadoop.thriftfs.api.RequestContext)value);
+        }
+        break;
+
+      case JOB_ID:
+        if (value == null) {
+          unsetJobID();
+        } else {
+          setJobID((ThriftJobID)value);
+        }
+        break;
+
+      case TYPES:
+        if (value == null) {
+          unsetTypes();
+        } else {
+          setTypes((Set<ThriftTaskType>)value);
+        }
+        break;
+
+      case STATES:
+        if (value == null) {
+          unsetStates();
+        } else {
+          setStates((Set<ThriftTaskQueryState>)value);
+        }
+        break;
+
+      case TEXT:
+        if (value == null) {
+          unsetText();
+        } else {
+          setText((String)value);
+        }
+        break;
+
+      case CURSOR:
+        if (value == null) {
+          unsetCursor();
+        } else {
+          setCursor((String)value);
+        }
+        break;
+
+      case COUNT:
+        if (value == null) {
+          unsetCount();
+        } else {
+          setCount((Integer)value);
+        }
+        break;
+
+      }
+    }
+
+    public void setFieldValue(int fieldID, Object value) {
+      setFieldValue(_Fields.findByThriftIdOrThrow(fieldID), value);
+    }
+
+    public Object getFieldValue(_Fields field) {
+      switch (field) {
+      case CTX:
+        return getCtx();
+
+      case JOB_ID:
+        return getJobID();
+
+      case TYPES:
+        return getTypes();
+
+      case STATES:
+        return getStates();
+
+      case TEXT:
+        return getText();
+
+      case CURSOR:
+        return getCursor();
+
+      case COUNT:
+        return new Integer(getCount());
+
+      }
+      throw new IllegalStateException();
+    }
+
+    public Object getFieldValue(int fieldId) {
+      return getFieldValue(_Fields.findByThriftIdOrThrow(fieldId));
+    }
+
+    /** Returns true if field corresponding to fieldID is set (has been asigned a value) and false otherwise */
+    public boolean isSet(_Fields field) {
+      switch (field) {
+      case CTX:
+        return isSetCtx();
+      case JOB_ID:
+        return isSetJobID();
+      case TYPES:
+        return isSetTypes();
+      case STATES:
+        return isSetStates();
+      case TEXT:
+        return isSetText();
+      case CURSOR:
+        return isSetCursor();
+      case COUNT:
+        return isSetCount();
+      }
+      throw new IllegalStateException();
+    }
+
+    public boolean isSet(int fieldID) {
+      return isSet(_Fields.findByThriftIdOrThrow(fieldID));
+    }
+
+    @Override
+    public boolean equals(Object that) {
+      if (that == null)
+        return false;
+      if (that instanceof getTaskPage_args)
+        return this.equals((getTaskPage_args)that);
+      return false;
+    }
+
+    public boolean equals(getTaskPage_args that) {
+      if (that == null)
+        return false;
+
+      boolean this_present_ctx = true && this.isSetCtx();
+      boolean that_present_ctx = true && that.isSetCtx();
+      if (this_present_ctx || that_present_ctx) {
+        if (!(this_present_ctx && that_present_ctx))
+          return false;
+        if (!this.ctx.equals(that.ctx))
+          return false;
+      }
+
+      boolean this_present_jobID = true && this.isSetJobID();
+      boolean that_present_jobID = true && that.isSetJobID();
+      if (this_present_jobID || that_present_jobID) {
+        if (!(this_present_jobID && that_present_jobID))
+          return false;
+        if (!this.jobID.equals(that.jobID))
+          return false;
+      }
+
+      boolean this_present_types = true && this.isSetTypes();
+      boolean that_present_types = true && that.isSetTypes();
+      if (this_present_types || that_present_types) {
+        if (!(this_present_types && that_present_types))
+          return false;
+        if (!this.types.equals(that.types))
+          return false;
+      }
+
+      boolean this_present_states = true && this.isSetStates();
+      boolean that_present_states = true && that.isSetStates();
+      if (this_present_states || that_present_states) {
+        if (!(this_present_states && that_present_states))
+          return false;
+        if (!this.states.equals(that.states))
+          return false;
+      }
+
+      boolean this_present_text = true && this.isSetText();
+      boolean that_present_text = true && that.isSetText();
+      if (this_present_text || that_present_text) {
+        if (!(this_present_text && that_present_text))
+          return false;
+        if (!this.text.equals(that.text))
+          return false;
+      }
+
+      boolean this_present_cursor = true && this.isSetCursor();
+      boolean that_present_cursor = true && that.isSetCursor();
+      if (this_present_cursor || that_present_cursor) {
+        if (!(this_present_cursor && that_present_cursor))
+          return false;
+        if (!this.cursor.equals(that.cursor))
+          return false;
+      }
+
+      boolean this_present_count = true;
+      boolean that_present_count = true;
+      if (this_present_count || that_present_count) {
+        if (!(this_present_count && that_present_count))
+          return false;
+        if (this.count != that.count)
+          return false;
+      }
+
+      return true;
+    }
+
+    @Override
+    public int hashCode() {
+      return 0;
+    }
+
+    public void read(TProtocol iprot) throws TException {
+      TField field;
+      iprot.readStructBegin();
+      while (true)
+      {
+        field = iprot.readFieldBegin();
+        if (field.type == TType.STOP) { 
+          break;
+        }
+        _Fields fieldId = _Fields.findByThriftId(field.id);
+        if (fieldId == null) {
+          TProtocolUtil.skip(iprot, field.type);
+        } else {
+          switch (fieldId) {
+            case CTX:
+              if (field.type == TType.STRUCT) {
+                this.ctx = new org.apache.hadoop.thriftfs.api.RequestContext();
+                this.ctx.read(iprot);
+              } else { 
+                TProtocolUtil.skip(iprot, field.type);
+              }
+              break;
+            case JOB_ID:
+              if (field.type == TType.STRUCT) {
+                this.jobID = new ThriftJobID();
+                this.jobID.read(iprot);
+              } else { 
+                TProtocolUtil.skip(iprot, field.type);
+              }
+              break;
+            case TYPES:
+              if (field.type == TType.SET) {
+                {
+                  TSet _set111 = iprot.readSetBegin();
+                  this.types = new HashSet<ThriftTaskType>(2*_set111.size);
+                  for (int _i112 = 0; _i112 < _set111.size; ++_i112)
+                  {
+                    ThriftTaskType _elem113;
+                    _elem113 = ThriftTaskType.findByValue(iprot.readI32());
+                    this.types.add(_elem113);
+                  }
+                  iprot.readSetEnd();
+                }
+              } else { 
+                TProtocolUtil.skip(iprot, field.type);
+              }
+              break;
+            case STATES:
+              if (field.type == TType.SET) {
+                {
+                  TSet _set114 = iprot.readSetBegin();
+                  this.states = new HashSet<ThriftTaskQueryState>(2*_set114.size);
+                  for (int _i115 = 0; _i115 < _set114.size; ++_i115)
+                  {
+                    ThriftTaskQueryState _elem116;
+                    _elem116 = ThriftTaskQueryState.findByValue(iprot.readI32());
+                    this.states.add(_elem116);
+                  }
+                  iprot.readSetEnd();
+                }
+              } else { 
+                TProtocolUtil.skip(iprot, field.type);
+              }
+              break;
+            case TEXT:
+              if (field.type == TType.STRING) {
+                this.text = iprot.readString();
+              } else { 
+                TProtocolUtil.skip(iprot, field.type);
+              }
+              break;
+            case CURSOR:
+              if (field.type == TType.STRING) {
+                this.cursor = iprot.readString();
+              } else { 
+                TProtocolUtil.skip(iprot, field.type);
+              }
+              break;
+            case COUNT:
+              if (field.type == TType.I32) {
+                this.count = iprot.readI32();
+                setCountIsSet(true);
+              } else { 
+                TProtocolUtil.skip(iprot, field.type);
+              }
+              break;
+          }
+          iprot.readFieldEnd();
+        }
+      }
+      iprot.readStructEnd();
+
+      // check for required fields of primitive type, which can't be checked in the validate method
+      validate();
+    }
+
+    public void write(TProtocol oprot) throws TException {
+      validate();
+
+      oprot.writeStructBegin(STRUCT_DESC);
+      if (this.jobID != null) {
+        oprot.writeFieldBegin(JOB_ID_FIELD_DESC);
+        this.jobID.write(oprot);
+        oprot.writeFieldEnd();
+      }
+      if (this.types != null) {
+        oprot.writeFieldBegin(TYPES_FIELD_DESC);
+        {
+          oprot.writeSetBegin(new TSet(TType.I32, this.types.size()));
+          for (ThriftTaskType _iter117 : this.types)
+          {
+            oprot.writeI32(_iter117.getValue());
+          }
+          oprot.writeSetEnd();
+        }
+        oprot.writeFieldEnd();
+      }
+      if (this.states != null) {
+        oprot.writeFieldBegin(STATES_FIELD_DESC);
+        {
+          oprot.writeSetBegin(new TSet(TType.I32, this.states.size()));
+          for (ThriftTaskQueryState _iter118 : this.states)
+          {
+            oprot.writeI32(_iter118.getValue());
+          }
+          oprot.writeSetEnd();
+        }
+        oprot.writeFieldEnd();
+      }
+      if (this.text != null) {
+        oprot.writeFieldBegin(TEXT_FIELD_DESC);
+        oprot.writeString(this.text);
+        oprot.writeFieldEnd();
+      }
+      if (this.cursor != null) {
+        oprot.writeFieldBegin(CURSOR_FIELD_DESC);
+        oprot.writeString(this.cursor);
+        oprot.writeFieldEnd();
+      }
+      oprot.writeFieldBegin(COUNT_FIELD_DESC);
+      oprot.writeI32(this.count);
+      oprot.writeFieldEnd();
+      if (this.ctx != null) {
+        oprot.writeFieldBegin(CTX_FIELD_DESC);
+        this.ctx.write(oprot);
+        oprot.writeFieldEnd();
+      }
+      oprot.writeFieldStop();
+      oprot.writeStructEnd();
+    }
+
+    @Override
+    public String toString() {
+      StringBuilder sb = new StringBuilder("getTaskPage_args(");
+      boolean first = true;
+
+      sb.append("ctx:");
+      if (this.ctx == null) {
+        sb.append("null");
+      } else {
+        sb.append(this.ctx);
+      }
+      first = false;
+      if (!first) sb.append(", ");
+      sb.append("jobID:");
+      if (this.jobID == null) {
+        sb.append("null");
+      } else {
+        sb.append(this.jobID);
+      }
+      first = false;
+      if (!first) sb.append(", ");
+      sb.append("types:");
+      if (this.types == null) {
+        sb.append("null");
+      } else {
+        sb.append(this.types);
+      }
+      first = false;
+      if (!first) sb.append(", ");
+      sb.append("states:");
+      if (this.states == null) {
+        sb.append("null");
+      } else {
+        sb.append(this.states);
+      }
+      first = false;
+      if (!first) sb.append(", ");
+      sb.append("text:");
+      if (this.text == null) {
+        sb.append("null");
+      } else {
+        sb.append(this.text);
+      }
+      first = false;
+      if (!first) sb.append(", ");
+      sb.append("cursor:");
+      if (this.cursor == null) {
+        sb.append("null");
+      } else {
+        sb.append(this.cursor);
+      }
+      first = false;
+      if (!first) sb.append(", ");
+      sb.append("count:");
+      sb.append(this.count);
+      first = false;
+      sb.append(")");
+      return sb.toString();
+    }
+
+    public void validate() throws TException {
+      // check for required fields
+    }
+
+  }
+
+  public static class getTaskPage_result implements TBase<getTaskPage_result._Fields>, java.io.Serializable, Cloneable   {
+    private static final TStruct STRUCT_DESC = new TStruct("getTaskPage_result");
+
+    private static final TField SUCCESS_FIELD_DESC = new TField("success", TType.STRUCT, (short)0);
+    private static final TField ERR_FIELD_DESC = new TField("err", TType.STRUCT, (short)1);
+
+    public ThriftTaskPage success;
+    public JobNotFoundException err;
+
+    /** The set of fields this struct contains, along with convenience methods for finding and manipulating them. */
+    public enum _Fields implements TFieldIdEnum {
+      SUCCESS((short)0, "success"),
+      ERR((short)1, "err");
+
+      private static final Map<Integer, _Fields> byId = new HashMap<Integer, _Fields>();
+      private static final Map<String, _Fields> byName = new HashMap<String, _Fields>();
+
+      static {
+        for (_Fields field : EnumSet.allOf(_Fields.class)) {
+          byId.put((int)field._thriftId, field);
+          byName.put(field.getFieldName(), field);
+        }
+      }
+
+      /**
+       * Find the _Fields constant that matches fieldId, or null if its not found.
+       */
+      public static _Fields findByThriftId(int fieldId) {
+        return byId.get(fieldId);
+      }
+
+      /**
+       * Find the _Fields constant that matches fieldId, throwing an exception
+       * if it is not found.
+       */
+      public static _Fields findByThriftIdOrThrow(int fieldId) {
+        _Fields fields = findByThriftId(fieldId);
+        if (fields == null) throw new IllegalArgumentException("Field " + fieldId + " doesn't exist!");
+        return fields;
+      }
+
+      /**
+       * Find the _Fields constant that matches name, or null if its not found.
+       */
+      public static _Fields findByName(String name) {
+        return byName.get(name);
+      }
+
+      private final short _thriftId;
+      private final String _fieldName;
+
+      _Fields(short thriftId, String fieldName) {
+        _thriftId = thriftId;
+        _fieldName = fieldName;
+      }
+
+      public short getThriftFieldId() {
+        return _thriftId;
+      }
+
+      public String getFieldName() {
+        return _fieldName;
+      }
+    }
+
+    // isset id assignments
+
+    public static final Map<_Fields, FieldMetaData> metaDataMap = Collections.unmodifiableMap(new EnumMap<_Fields, FieldMetaData>(_Fields.class) {{
+      put(_Fields.SUCCESS, new FieldMetaData("success", TFieldRequirementType.DEFAULT, 
+          new StructMetaData(TType.STRUCT, ThriftTaskPage.class)));
+      put(_Fields.ERR, new FieldMetaData("err", TFieldRequirementType.DEFAULT, 
+          new FieldValueMetaData(TType.STRUCT)));
+    }});
+
+    static {
+      FieldMetaData.addStructMetaDataMap(getTaskPage_result.class, metaDataMap);
+    }
+
+    public getTaskPage_result() {
+    }
+
+    public getTaskPage_result(
+      ThriftTaskPage success,
+      JobNotFoundException err)
+    {
+      this();
+      this.success = success;
+      this.err = err;
+    }
+
+    /**
+     * Performs a deep copy on <i>other</i>.
+     */
+    public getTaskPage_result(getTaskPage_result other) {
+      if (other.isSetSuccess()) {
+        this.success = new ThriftTaskPage(other.success);
+      }
+      if (other.isSetErr()) {
+        this.err = new JobNotFoundException(other.err);
+      }
+    }
+
+    public getTaskPage_result deepCopy() {
+      return new getTaskPage_result(this);
+    }
+
+    @Deprecated
+    public getTaskPage_result clone() {
+      return new getTaskPage_result(this);
+    }
+
+    public ThriftTaskPage getSuccess() {
+      return this.success;
+    }
+
+    public getTaskPage_result setSuccess(ThriftTaskPage success) {
+      this.success = success;
+      return this;
+    }
+
+    public void unsetSuccess() {
+      this.success = null;
+    }
+
+    /** Returns true if field success is set (has been asigned a value) and false otherwise */
+    public boolean isSetSuccess() {
+      return this.success != null;
+    }
+
+    public void setSuccessIsSet(boolean value) {
+      if (!value) {
+        this.success = null;
+      }
+    }
+
+    public JobNotFoundException getErr() {
+      return this.err;
+    }
+
+    public getTaskPage_result setErr(JobNotFoundException err) {
+      this.err = err;
+      return this;
+    }
+
+    public void unsetErr() {
+      this.err = null;
+    }
+
+    /** Returns true if field err is set (has been asigned a value) and false otherwise */
+    public boolean isSetErr() {
+      return this.err != null;
+    }
+
+    public void setErrIsSet(boolean value) {
+      if (!value) {
+        this.err = null;
+      }
+    }
+
+    public void setFieldValue(_Fields field, Object value) {
+      switch (field) {
+      case SUCCESS:
+        if (value == null) {
+          unsetSuccess();
+        } else {
+          setSuccess((ThriftTaskPage)value);
+        }
+        break;
+
+      case ERR:
+        if (value == null) {
+          unsetErr();
+        } else {
+          setErr((JobNotFoundException)value);
+        }
+        break;
+
+      }
+    }
+
+    public void setFieldValue(int fieldID, Object value) {
+      setFieldValue(_Fields.findByThriftIdOrThrow(fieldID), value);
+    }
+
+    public Object getFieldValue(_Fields field) {
+      switch (field) {
+      case SUCCESS:
+        return getSuccess();
+
+      case ERR:
+        return getErr();
+
+      }
+      throw new IllegalStateException();
+    }
+
+    public Object getFieldValue(int fieldId) {
+      return getFieldValue(_Fields.findByThriftIdOrThrow(fieldId));
+    }
+
+    /** Returns true if field corresponding to fieldID is set (has been asigned a value) and false otherwise */
+    public boolean isSet(_Fields field) {
+      switch (field) {
+      case SUCCESS:
+        return isSetSuccess();
+      case ERR:
+        return isSetErr();
+      }
+      throw new IllegalStateException();
+    }
+
+    public boolean isSet(int fieldID) {
+      return isSet(_Fields.findByThriftIdOrThrow(fieldID));
+    }
+
+    @Override
+    public boolean equals(Object that) {
+      if (that == null)
+        return false;
+      if (that instanceof getTaskPage_result)
+        return this.equals((getTaskPage_result)that);
+      return false;
+    }
+
+    public boolean equals(getTaskPage_result that) {
+      if (that == null)
+        return false;
+
+      boolean this_present_success = true && this.isSetSuccess();
+      boolean that_present_success = true && that.isSetSuccess();
+      if (this_present_success || that_present_success) {
+        if (!(this_present_success && that_present_success))
+          return false;
+        if (!this.success.equals(that.success))
+          return false;
+      }
+
+      boolean this_present_err = true && this.isSetErr();
+      boolean that_present_err = true && that.isSetErr();
+      if (this_present_err || that_present_err) {
+        if (!(this_present_err && that_present_err))
+          return false;
+        if (!this.err.equals(that.err))
+          return false;
+      }
+
+      return true;
+    }
+
+    @Override
+    public int hashCode() {
+      return 0;
+    }
+
+    public void read(TProtocol iprot) throws TException {
+      TField field;
+      iprot.readStructBegin();
+      while (true)
+      {
+        field = iprot.readFieldBegin();
+        if (field.type == TType.STOP) { 
+          break;
+        }
+        _Fields fieldId = _Fields.findByThriftId(field.id);
+        if (fieldId == null) {
+          TProtocolUtil.skip(iprot, field.type);
+        } else {
+          switch (fieldId) {
+            case SUCCESS:
+              if (field.type == TType.STRUCT) {
+                this.success = new ThriftTaskPage();
+                this.success.read(iprot);
+              } else { 
+                TProtocolUtil.skip(iprot, field.type);
+              }
+              break;
+            case ERR:
+              if (field.type == TType.STRUCT) {
+                this.err = new JobNotFoundException();
+                this.err.read(iprot);
+              } else { 
+                TProtocolUtil.skip(iprot, field.type);
+              }
+              break;
+          }
+          iprot.readFieldEnd();
+        }
+      }
+      iprot.readStructEnd();
+
+      // check for required fields of primitive type, which can't be checked in the validate method
+      validate();
+    }
+
+    public void write(TProtocol oprot) throws TException {
+      oprot.writeStructBegin(STRUCT_DESC);
+
+      if (this.isSetSuccess()) {
+        oprot.writeFieldBegin(SUCCESS_FIELD_DESC);
+        this.success.write(oprot);
+        oprot.writeFieldEnd();
+      } else if (this.isSetErr()) {
+        oprot.writeFieldBegin(ERR_FIELD_DESC);
+        this.err.write(oprot);
+        oprot.writeFieldEnd();
+      }
+      oprot.writeFieldStop();
+      oprot.writeStructEnd();
+    }
+
+    @Override
+    public String toString() {
+      StringBuilder sb = new StringBuilder("getTaskPage_result(");
+      boolean first = true;
+
+      sb.append("success:");
+      if (this.success == null) {
+        sb.append("null");
+      } else {
+        sb.append(this.success);
+      }
+      first = false;
+      if (!first) sb.append(", ");
+      sb.append("err:");
+      if (this.err == null) {
+        sb.append("null");
+      } else {
+        sb.append(this.err);
+      }
+      first = false;
+      sb.append(")");
+      return sb.toString();
+    }
+
+    public void validate() throws TException {
+      // check for required fields
+    }
+
+  }
+
+  public static class getTaskTimeline_args implements TBase<getTaskTimeline_args._Fields>, java.io.Serializable, Cloneable   {
+    private static final TStruct STRUCT_DESC = new TStruct("getTaskTimeline_args");
+
+    private static final TField CTX_FIELD_DESC = new TField("ctx", TType.STRUCT, (short)10);
+    private static final TField JOB_ID_FIELD_DESC = new TField("jobID", TType.STRUCT, (short)1);
+
+    public org.apache.hadoop.thriftfs.api.RequestContext ctx;
+    public ThriftJobID jobID;
+
+    /** The set of fields this struct contains, along with convenience methods for finding and manipulating them. */
+    public enum _Fields implements TFieldIdEnum {
+      CTX((short)10, "ctx"),
+      JOB_ID((short)1, "jobID");
+
+      private static final Map<Integer, _Fields> byId = new HashMap<Integer, _Fields>();
+      private static final Map<String, _Fields> byName = new HashMap<String, _Fields>();
+
+      static {
+        for (_Fields field : EnumSet.allOf(_Fields.class)) {
+          byId.put((int)field._thriftId, field);
+          byName.put(field.getFieldName(), field);
+        }
+      }
+
+      /**
+       * Find the _Fields constant that matches fieldId, or null if its not found.
+       */
+      public static _Fields findByThriftId(int fieldId) {
+        return byId.get(fieldId);
+      }
+
+      /**
+       * Find the _Fields constant that matches fieldId, throwing an exception
+       * if it is not found.
+       */
+      public static _Fields findByThriftIdOrThrow(int fieldId) {
+        _Fields fields = findByThriftId(fieldId);
+        if (fields == null) throw new IllegalArgumentException("Field " + fieldId + " doesn't exist!");
+        return fields;
+      }
+
+      /**
+       * Find the _Fields constant that matches name, or null if its not found.
+       */
+      public static _Fields findByName(String name) {
+        return byName.get(name);
+      }
+
+      private final short _thriftId;
+      private final String _fieldName;
+
+      _Fields(short thriftId, String fieldName) {
+        _thriftId = thriftId;
+        _fieldName = fieldName;
+      }
+
+      public short getThriftFieldId() {
+        return _thriftId;
+      }
+
+      public String getFieldName() {
+        return _fieldName;
+      }
+    }
+
+    // isset id assignments
+
+    public static final Map<_Fields, FieldMetaData> metaDataMap = Collections.unmodifiableMap(new EnumMap<_Fields, FieldMetaData>(_Fields.class) {{
+      put(_Fields.CTX, new FieldMetaData("ctx", TFieldRequirementType.DEFAULT, 
+          new StructMetaData(TType.STRUCT, org.apache.hadoop.thriftfs.api.RequestContext.class)));
+      put(_Fields.JOB_ID, new FieldMetaData("jobID", TFieldRequirementType.DEFAULT, 
+          new StructMetaData(TType.STRUCT, ThriftJobID.class)));
+    }});
+
+    static {
+      FieldMetaData.addStructMetaDataMap(getTaskTimeline_args.class, metaDataMap);
+    }
+
+    public getTaskTimeline_args() {
+    }
+
+    public getTaskTimeline_args(
+      org.apache.hadoop.thriftfs.api.RequestContext ctx,
+      ThriftJobID jobID)
+    {
+      this();
+      this.ctx = ctx;
+      this.jobID = jobID;
+    }
+
+    /**
+     * Performs a deep copy on <i>other</i>.
+     */
+    public getTaskTimeline_args(getTaskTimeline_args other) {
+      if (other.isSetCtx()) {
+        this.ctx = new org.apache.hadoop.thriftfs.api.RequestContext(other.ctx);
+      }
+      if (other.isSetJobID()) {
+        this.jobID = new ThriftJobID(other.jobID);
+      }
+    }
+
+    public getTaskTimeline_args deepCopy() {
+      return new getTaskTimeline_args(this);
+    }
+
+    @Deprecated
+    public getTaskTimeline_args clone() {
+      return new getTaskTimeline_args(this);
+    }
+
+    public org.apache.hadoop.thriftfs.api.RequestContext getCtx() {
+      return this.ctx;
+    }
+
+    public getTaskTimeline_args setCtx(org.apache.hadoop.thriftfs.api.RequestContext ctx) {
+      this.ctx = ctx;
+      return this;
+    }
+
+    public void unsetCtx() {
+      this.ctx = null;
+    }
+
+    /** Returns true if field ctx is set (has been asigned a value) and false otherwise */
+    public boolean isSetCtx() {
+      return this.ctx != null;
+    }
+
+    public void setCtxIsSet(boolean value) {
+      if (!value) {
+        this.ctx = null;
+      }
+    }
+
+    public ThriftJobID getJobID() {
+      return this.jobID;
+    }
+
+    public getTaskTimeline_args setJobID(ThriftJobID jobID) {
+      this.jobID = jobID;
+      return this;
+    }
+
+    public void unsetJobID() {
+      this.jobID = null;
+    }
+
+    /** Returns true if field jobID is set (has been asigned a value) and false otherwise */
+    public boolean isSetJobID() {
+      return this.jobID != null;
+    }
+
+    public void setJobIDIsSet(boolean value) {
+      if (!value) {
+        this.jobID = null;
+      }
+    }
+
+    public void setFieldValue(_Fields field, Object value) {
+      switch (field) {
+      case CTX:
         if (value == null) {
-          unsetCount();
+          unsetCtx();
         } else {
-          setCount((Integer)value);
+          setCtx((org.apache.hadoop.thriftfs.api.RequestContext)value);
         }
         break;
 
-      case OFFSET:
+      case JOB_ID:
         if (value == null) {
-          unsetOffset();
+          unsetJobID();
         } else {
-          setOffset((Integer)value);
+          setJobID((ThriftJobID)value);
         }
         break;
 
@@ -7724,21 +13264,6 @@ public class Jobtracker {
       case JOB_ID:
         return getJobID();
 
-      case TYPES:
-        return getTypes();
-
-      case STATES:
-        return getStates();
-
-      case TEXT:
-        return getText();
-
-      case COUNT:
-        return new Integer(getCount());
-
-      case OFFSET:
-        return new Integer(getOffset());
-
       }
       throw new IllegalStateException();
     }
@@ -7754,16 +13279,6 @@ public class Jobtracker {
         return isSetCtx();
       case JOB_ID:
         return isSetJobID();
-      case TYPES:
-        return isSetTypes();
-      case STATES:
-        return isSetStates();
-      case TEXT:
-        return isSetText();
-      case COUNT:
-        return isSetCount();
-      case OFFSET:
-        return isSetOffset();
       }
       throw new IllegalStateException();
     }
@@ -7776,12 +13291,12 @@ public class Jobtracker {
     public boolean equals(Object that) {
       if (that == null)
         return false;
-      if (that instanceof getTaskList_args)
-        return this.equals((getTaskList_args)that);
+      if (that instanceof getTaskTimeline_args)
+        return this.equals((getTaskTimeline_args)that);
       return false;
     }
 
-    public boolean equals(getTaskList_args that) {
+    public boolean equals(getTaskTimeline_args that) {
       if (that == null)
         return false;
 
@@ -7803,51 +13318,6 @@ public class Jobtracker {
           return false;
       }
 
-      boolean this_present_types = true && this.isSetTypes();
-      boolean that_present_types = true && that.isSetTypes();
-      if (this_present_types || that_present_types) {
-        if (!(this_present_types && that_present_types))
-          return false;
-        if (!this.types.equals(that.types))
-          return false;
-      }
-
-      boolean this_present_states = true && this.isSetStates();
-      boolean that_present_states = true && that.isSetStates();
-      if (this_present_states || that_present_states) {
-        if (!(this_present_states && that_present_states))
-          return false;
-        if (!this.states.equals(that.states))
-          return false;
-      }
-
-      boolean this_present_text = true && this.isSetText();
-      boolean that_present_text = true && that.isSetText();
-      if (this_present_text || that_present_text) {
-        if (!(this_present_text && that_present_text))
-          return false;
-        if (!this.text.equals(that.text))
-          return false;
-      }
-
-      boolean this_present_count = true;
-      boolean that_present_count = true;
-      if (this_present_count || that_present_count) {
-        if (!(this_present_count && that_present_count))
-          return false;
-        if (this.count != that.count)
-          return false;
-      }
-
-      boolean this_present_offset = true;
-      boolean that_present_offset = true;
-      if (this_present_offset || that_present_offset) {
-        if (!(this_present_offset && that_present_offset))
-          return false;
-        if (this.offset != that.offset)
-          return false;
-      }
-
       return true;
     }
 
@@ -7886,63 +13356,6 @@ public class Jobtracker {
                 TProtocolUtil.skip(iprot, field.type);
               }
               break;
-            case TYPES:
-              if (field.type == TType.SET) {
-                {
-                  TSet _set59 = iprot.readSetBegin();
-                  this.types = new HashSet<ThriftTaskType>(2*_set59.size);
-                  for (int _i60 = 0; _i60 < _set59.size; ++_i60)
-                  {
-                    ThriftTaskType _elem61;
-                    _elem61 = ThriftTaskType.findByValue(iprot.readI32());
-                    this.types.add(_elem61);
-                  }
-                  iprot.readSetEnd();
-                }
-              } else { 
-                TProtocolUtil.skip(iprot, field.type);
-              }
-              break;
-            case STATES:
-              if (field.type == TType.SET) {
-                {
-                  TSet _set62 = iprot.readSetBegin();
-                  this.states = new HashSet<ThriftTaskQueryState>(2*_set62.size);
-                  for (int _i63 = 0; _i63 < _set62.size; ++_i63)
-                  {
-                    ThriftTaskQueryState _elem64;
-                    _elem64 = ThriftTaskQueryState.findByValue(iprot.readI32());
-                    this.states.add(_elem64);
-                  }
-                  iprot.readSetEnd();
-                }
-              } else { 
-                TProtocolUtil.skip(iprot, field.type);
-              }
-              break;
-            case TEXT:
-              if (field.type == TType.STRING) {
-                this.text = iprot.readString();
-              } else { 
-                TProtocolUtil.skip(iprot, field.type);
-              }
-              break;
-            case COUNT:
-              if (field.type == TType.I32) {
-                this.count = iprot.readI32();
-                setCountIsSet(true);
-              } else { 
-                TProtocolUtil.skip(iprot, field.type);
-              }
-              break;
-            case OFFSET:
-              if (field.type == TType.I32) {
-                this.offset = iprot.readI32();
-                setOffsetIsSet(true);
-              } else { 
-                TProtocolUtil.skip(iprot, field.type);
-              }
-              break;
           }
           iprot.readFieldEnd();
         }
@@ -7957,58 +13370,23 @@ public class Jobtracker {
       validate();
 
       oprot.writeStructBegin(STRUCT_DESC);
-      if (this.ctx != null) {
-        oprot.writeFieldBegin(CTX_FIELD_DESC);
-        this.ctx.write(oprot);
-        oprot.writeFieldEnd();
-      }
       if (this.jobID != null) {
         oprot.writeFieldBegin(JOB_ID_FIELD_DESC);
         this.jobID.write(oprot);
         oprot.writeFieldEnd();
       }
-      if (this.types != null) {
-        oprot.writeFieldBegin(TYPES_FIELD_DESC);
-        {
-          oprot.writeSetBegin(new TSet(TType.I32, this.types.size()));
-          for (ThriftTaskType _iter65 : this.types)
-          {
-            oprot.writeI32(_iter65.getValue());
-          }
-          oprot.writeSetEnd();
-        }
-        oprot.writeFieldEnd();
-      }
-      if (this.states != null) {
-        oprot.writeFieldBegin(STATES_FIELD_DESC);
-        {
-          oprot.writeSetBegin(new TSet(TType.I32, this.states.size()));
-          for (ThriftTaskQueryState _iter66 : this.states)
-          {
-            oprot.writeI32(_iter66.getValue());
-          }
-          oprot.writeSetEnd();
-        }
-        oprot.writeFieldEnd();
-      }
-      if (this.text != null) {
-        oprot.writeFieldBegin(TEXT_FIELD_DESC);
-        oprot.writeString(this.text);
+      if (this.ctx != null) {
+        oprot.writeFieldBegin(CTX_FIELD_DESC);
+        this.ctx.write(oprot);
         oprot.writeFieldEnd();
       }
-      oprot.writeFieldBegin(COUNT_FIELD_DESC);
-      oprot.writeI32(this.count);
-      oprot.writeFieldEnd();
-      oprot.writeFieldBegin(OFFSET_FIELD_DESC);
-      oprot.writeI32(this.offset);
-      oprot.writeFieldEnd();
       oprot.writeFieldStop();
       oprot.writeStructEnd();
     }
 
     @Override
     public String toString() {
-      StringBuilder sb = new StringBuilder("getTaskList_args(");
+      StringBuilder sb = new StringBuilder("getTaskTimeline_args(");
       boolean first = true;
 
       sb.append("ctx:");
@@ -8026,38 +13404,6 @@ public class Jobtracker {
         sb.append(this.jobID);
       }
       first = false;
-      if (!first) sb.append(", ");
-      sb.append("types:");
-      if (this.types == null) {
-        sb.append("null");
-      } else {
-        sb.append(this.types);
-      }
-      first = false;
-      if (!first) sb.append(", ");
-      sb.append("states:");
-      if (this.states == null) {
-        sb.append("null");
-      } else {
-        sb.append(this.states);
-      }
-      first = false;
-      if (!first) sb.append(", ");
-      sb.append("text:");
-      if (this.text == null) {
-        sb.append("null");
-      } else {
-        sb.append(this.text);
-      }
-      first = false;
-      if (!first) sb.append(", ");
-      sb.append("count:");
-      sb.append(this.count);
-      first = false;
-      if (!first) sb.append(", ");
-      sb.append("offset:");
-      sb.append(this.offset);
-      first = false;
       sb.append(")");
       return sb.toString();
     }
@@ -8068,13 +13414,13 @@ public class Jobtracker {
 
   }
 
-  public static class getTaskList_result implements TBase<getTaskList_result._Fields>, java.io.Serializable, Cloneable   {
-    private static final TStruct STRUCT_DESC = new TStruct("getTaskList_result");
+  public static class getTaskTimeline_result implements TBase<getTaskTimeline_result._Fields>, java.io.Serializable, Cloneable, Comparable<getTaskTimeline_result>   {
+    private static final TStruct STRUCT_DESC = new TStruct("getTaskTimeline_result");
 
     private static final TField SUCCESS_FIELD_DESC = new TField("success", TType.STRUCT, (short)0);
     private static final TField ERR_FIELD_DESC = new TField("err", TType.STRUCT, (short)1);
 
-    public ThriftTaskInProgressList success;
+    public ThriftTaskTimeline success;
     public JobNotFoundException err;
 
     /** The set of fields this struct contains, along with convenience methods for finding and manipulating them. */
@@ -8137,20 +13483,20 @@ public class Jobtracker {
 
     public static final Map<_Fields, FieldMetaData> metaDataMap = Collections.unmodifiableMap(new EnumMap<_Fields, FieldMetaData>(_Fields.class) {{
       put(_Fields.SUCCESS, new FieldMetaData("success", TFieldRequirementType.DEFAULT, 
-          new StructMetaData(TType.STRUCT, ThriftTaskInProgressList.class)));
+          new StructMetaData(TType.STRUCT, ThriftTaskTimeline.class)));
       put(_Fields.ERR, new FieldMetaData("err", TFieldRequirementType.DEFAULT, 
           new FieldValueMetaData(TType.STRUCT)));
     }});
 
     static {
-      FieldMetaData.addStructMetaDataMap(getTaskList_result.class, metaDataMap);
+      FieldMetaData.addStructMetaDataMap(getTaskTimeline_result.class, metaDataMap);
     }
 
-    public getTaskList_result() {
+    public getTaskTimeline_result() {
     }
 
-    public getTaskList_result(
-      ThriftTaskInProgressList success,
+    public getTaskTimeline_result(
+      ThriftTaskTimeline success,
       JobNotFoundException err)
     {
       this();
@@ -8161,29 +13507,29 @@ public class Jobtracker {
     /**
      * Performs a deep copy on <i>other</i>.
      */
-    public getTaskList_result(getTaskList_result other) {
+    public getTaskTimeline_result(getTaskTimeline_result other) {
       if (other.isSetSuccess()) {
-        this.success = new ThriftTaskInProgressList(other.success);
+        this.success = new ThriftTaskTimeline(other.success);
       }
       if (other.isSetErr()) {
         this.err = new JobNotFoundException(other.err);
       }
     }
 
-    public getTaskList_result deepCopy() {
-      return new getTaskList_result(this);
+    public getTaskTimeline_result deepCopy() {
+      return new getTaskTimeline_result(this);
     }
 
     @Deprecated
-    public getTaskList_result clone() {
-      return new getTaskList_result(this);
+    public getTaskTimeline_result clone() {
+      return new getTaskTimeline_result(this);
     }
 
-    public ThriftTaskInProgressList getSuccess() {
+    public ThriftTaskTimeline getSuccess() {
       return this.success;
     }
 
-    public getTaskList_result setSuccess(ThriftTaskInProgressList success) {
+    public getTaskTimeline_result setSuccess(ThriftTaskTimeline success) {
       this.success = success;
       return this;
     }
@@ -8207,7 +13553,7 @@ public class Jobtracker {
       return this.err;
     }
 
-    public getTaskList_result setErr(JobNotFoundException err) {
+    public getTaskTimeline_result setErr(JobNotFoundException err) {
       this.err = err;
       return this;
     }
@@ -8233,7 +13579,7 @@ public class Jobtracker {
         if (value == null) {
           unsetSuccess();
         } else {
-          setSuccess((ThriftTaskInProgressList)value);
+          setSuccess((ThriftTaskTimeline)value);
         }
         break;
 
@@ -8287,12 +13633,12 @@ public class Jobtracker {
     public boolean equals(Object that) {
       if (that == null)
         return false;
-      if (that instanceof getTaskList_result)
-        return this.equals((getTaskList_result)that);
+      if (that instanceof getTaskTimeline_result)
+        return this.equals((getTaskTimeline_result)that);
       return false;
     }
 
-    public boolean equals(getTaskList_result that) {
+    public boolean equals(getTaskTimeline_result that) {
       if (that == null)
         return false;
 
@@ -8322,6 +13668,33 @@ public class Jobtracker {
       return 0;
     }
 
+    public int compareTo(getTaskTimeline_result other) {
+      if (!getClass().equals(other.getClass())) {
+        return getClass().getName().compareTo(other.getClass().getName());
+      }
+
+      int lastComparison = 0;
+      getTaskTimeline_result typedOther = (getTaskTimeline_result)other;
+
+      lastComparison = Boolean.valueOf(isSetSuccess()).compareTo(isSetSuccess());
+      if (lastComparison != 0) {
+        return lastComparison;
+      }
+      lastComparison = TBaseHelper.compareTo(success, typedOther.success);
+      if (lastComparison != 0) {
+        return lastComparison;
+      }
+      lastComparison = Boolean.valueOf(isSetErr()).compareTo(isSetErr());
+      if (lastComparison != 0) {
+        return lastComparison;
+      }
+      lastComparison = TBaseHelper.compareTo(err, typedOther.err);
+      if (lastComparison != 0) {
+        return lastComparison;
+      }
+      return 0;
+    }
+
     public void read(TProtocol iprot) throws TException {
       TField field;
       iprot.readStructBegin();
@@ -8338,7 +13711,7 @@ public class Jobtracker {
           switch (fieldId) {
             case SUCCESS:
               if (field.type == TType.STRUCT) {
-                this.success = new ThriftTaskInProgressList();
+                this.success = new ThriftTaskTimeline();
                 this.success.read(iprot);
               } else { 
                 TProtocolUtil.skip(iprot, field.type);
@@ -8380,7 +13753,7 @@ public class Jobtracker {
 
     @Override
     public String toString() {
-      StringBuilder sb = new StringBuilder("getTaskList_result(");
+      StringBuilder sb = new StringBuilder("getTaskTimeline_result(");
       boolean first = true;
 
       sb.append("success:");
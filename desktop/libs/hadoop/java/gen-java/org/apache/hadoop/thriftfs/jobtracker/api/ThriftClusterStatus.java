@@ -1540,13 +1540,13 @@ public class ThriftClusterStatus implements TBase<ThriftClusterStatus._Fields>,
           case ACTIVE_TRACKER_NAMES:
             if (field.type == TType.LIST) {
               {
-                TList _list51 = iprot.readListBegin();
-                this.activeTrackerNames = new ArrayList<String>(_list51.size);
-                for (int _i52 = 0; _i52 < _list51.size; ++_i52)
+                TList _list91 = iprot.readListBegin();
+                this.activeTrackerNames = new ArrayList<String>(_list91.size);
+                for (int _i92 = 0; _i92 < _list91.size; ++_i92)
                 {
-                  String _elem53;
-                  _elem53 = iprot.readString();
-                  this.activeTrackerNames.add(_elem53);
+                  String _elem93;
+                  _elem93 = iprot.readString();
+                  this.activeTrackerNames.add(_elem93);
                 }
                 iprot.readListEnd();
               }
@@ -1557,13 +1557,13 @@ public class ThriftClusterStatus implements TBase<ThriftClusterStatus._Fields>,
           case BLACKLISTED_TRACKER_NAMES:
             if (field.type == TType.LIST) {
               {
-                TList _list54 = iprot.readListBegin();
-                this.blacklistedTrackerNames = new ArrayList<String>(_list54.size);
-                for (int _i55 = 0; _i55 < _list54.size; ++_i55)
+                TList _list94 = iprot.readListBegin();
+                this.blacklistedTrackerNames = new ArrayList<String>(_list94.size);
+                for (int _i95 = 0; _i95 < _list94.size; ++_i95)
                 {
-                  String _elem56;
-                  _elem56 = iprot.readString();
-                  this.blacklistedTrackerNames.add(_elem56);
+                  String _elem96;
+                  _elem96 = iprot.readString();
+                  this.blacklistedTrackerNames.add(_elem96);
                 }
                 iprot.readListEnd();
               }
@@ -1725,9 +1725,9 @@ public class ThriftClusterStatus implements TBase<ThriftClusterStatus._Fields>,
       oprot.writeFieldBegin(ACTIVE_TRACKER_NAMES_FIELD_DESC);
       {
         oprot.writeListBegin(new TList(TType.STRING, this.activeTrackerNames.size()));
-        for (String _iter57 : this.activeTrackerNames)
+        for (String _iter97 : this.activeTrackerNames)
         {
-          oprot.writeString(_iter57);
+          oprot.writeString(_iter97);
         }
         oprot.writeListEnd();
       }
@@ -1737,9 +1737,9 @@ public class ThriftClusterStatus implements TBase<ThriftClusterStatus._Fields>,
       oprot.writeFieldBegin(BLACKLISTED_TRACKER_NAMES_FIELD_DESC);
       {
         oprot.writeListBegin(new TList(TType.STRING, this.blacklistedTrackerNames.size()));
-        for (String _iter58 : this.blacklistedTrackerNames)
+        for (String _iter98 : this.blacklistedTrackerNames)
         {
-          oprot.writeString(_iter58);
+          oprot.writeString(_iter98);
         }
         oprot.writeListEnd();
       }
@@ -0,0 +1,687 @@
+/**
+ * Autogenerated by Thrift
+ *
+ * DO NOT EDIT UNLESS YOU ARE SURE THAT YOU KNOW WHAT YOU ARE DOING
+ */
+package org.apache.hadoop.thriftfs.jobtracker.api;
+
+import java.util.List;
+import java.util.ArrayList;
+import java.util.Map;
+import java.util.HashMap;
+import java.util.EnumMap;
+import java.util.Set;
+import java.util.HashSet;
+import java.util.EnumSet;
+import java.util.Collections;
+import java.util.BitSet;
+import java.util.Arrays;
+import org.slf4j.Logger;
+import org.slf4j.LoggerFactory;
+
+import org.apache.thrift.*;
+import org.apache.thrift.meta_data.*;
+import org.apache.thrift.protocol.*;
+
+/**
+ * The jobs that changed since a getJobsChangedSince() token. Tokens are
+ * only meaningful to the JobTracker that issued them.
+ */
+public class ThriftJobChanges implements TBase<ThriftJobChanges._Fields>, java.io.Serializable, Cloneable, Comparable<ThriftJobChanges> {
+  private static final TStruct STRUCT_DESC = new TStruct("ThriftJobChanges");
+
+  private static final TField CHANGED_FIELD_DESC = new TField("changed", TType.LIST, (short)1);
+  private static final TField REMOVED_FIELD_DESC = new TField("removed", TType.LIST, (short)2);
+  private static final TField TOKEN_FIELD_DESC = new TField("token", TType.I64, (short)3);
+  private static final TField FULL_FIELD_DESC = new TField("full", TType.BOOL, (short)4);
+
+  /**
+   * Summaries of the jobs that were added, or whose state or progress changed
+   */
+  public List<ThriftJobSummary> changed;
+  /**
+   * The jobs that the JobTracker no longer retains
+   */
+  public List<ThriftJobID> removed;
+  /**
+   * The token to pass to the next call
+   */
+  public long token;
+  /**
+   * True if the token given could not be used (it was 0, too old, or from
+   * another JobTracker). changed then has every job, and the caller should
+   * drop the jobs it knew about.
+   */
+  public boolean full;
+
+  /** The set of fields this struct contains, along with convenience methods for finding and manipulating them. */
+  public enum _Fields implements TFieldIdEnum {
+    /**
+     * Summaries of the jobs that were added, or whose state or progress changed
+     */
+    CHANGED((short)1, "changed"),
+    /**
+     * The jobs that the JobTracker no longer retains
+     */
+    REMOVED((short)2, "removed"),
+    /**
+     * The token to pass to the next call
+     */
+    TOKEN((short)3, "token"),
+    /**
+     * True if the token given could not be used (it was 0, too old, or from
+     * another JobTracker). changed then has every job, and the caller should
+     * drop the jobs it knew about.
+     */
+    FULL((short)4, "full");
+
+    private static final Map<Integer, _Fields> byId = new HashMap<Integer, _Fields>();
+    private static final Map<String, _Fields> byName = new HashMap<String, _Fields>();
+
+    static {
+      for (_Fields field : EnumSet.allOf(_Fields.class)) {
+        byId.put((int)field._thriftId, field);
+        byName.put(field.getFieldName(), field);
+      }
+    }
+
+    /**
+     * Find the _Fields constant that matches fieldId, or null if its not found.
+     */
+    public static _Fields findByThriftId(int fieldId) {
+      return byId.get(fieldId);
+    }
+
+    /**
+     * Find the _Fields constant that matches fieldId, throwing an exception
+     * if it is not found.
+     */
+    public static _Fields findByThriftIdOrThrow(int fieldId) {
+      _Fields fields = findByThriftId(fieldId);
+      if (fields == null) throw new IllegalArgumentException("Field " + fieldId + " doesn't exist!");
+      return fields;
+    }
+
+    /**
+     * Find the _Fields constant that matches name, or null if its not found.
+     */
+    public static _Fields findByName(String name) {
+      return byName.get(name);
+    }
+
+    private final short _thriftId;
+    private final String _fieldName;
+
+    _Fields(short thriftId, String fieldName) {
+      _thriftId = thriftId;
+      _fieldName = fieldName;
+    }
+
+    public short getThriftFieldId() {
+      return _thriftId;
+    }
+
+    public String getFieldName() {
+      return _fieldName;
+    }
+  }
+
+  // isset id assignments
+  private static final int __TOKEN_ISSET_ID = 0;
+  private static final int __FULL_ISSET_ID = 1;
+  private BitSet __isset_bit_vector = new BitSet(2);
+
+  public static final Map<_Fields, FieldMetaData> metaDataMap = Collections.unmodifiableMap(new EnumMap<_Fields, FieldMetaData>(_Fields.class) {{
+    put(_Fields.CHANGED, new FieldMetaData("changed", TFieldRequirementType.DEFAULT, 
+        new ListMetaData(TType.LIST, 
+            new StructMetaData(TType.STRUCT, ThriftJobSummary.class))));
+    put(_Fields.REMOVED, new FieldMetaData("removed", TFieldRequirementType.DEFAULT, 
+        new ListMetaData(TType.LIST, 
+            new StructMetaData(TType.STRUCT, ThriftJobID.class))));
+    put(_Fields.TOKEN, new FieldMetaData("token", TFieldRequirementType.DEFAULT, 
+        new FieldValueMetaData(TType.I64)));
+    put(_Fields.FULL, new FieldMetaData("full", TFieldRequirementType.DEFAULT, 
+        new FieldValueMetaData(TType.BOOL)));
+  }});
+
+  static {
+    FieldMetaData.addStructMetaDataMap(ThriftJobChanges.class, metaDataMap);
+  }
+
+  public ThriftJobChanges() {
+  }
+
+  public ThriftJobChanges(
+    List<ThriftJobSummary> changed,
+    List<ThriftJobID> removed,
+    long token,
+    boolean full)
+  {
+    this();
+    this.changed = changed;
+    this.removed = removed;
+    this.token = token;
+    setTokenIsSet(true);
+    this.full = full;
+    setFullIsSet(true);
+  }
+
+  /**
+   * Performs a deep copy on <i>other</i>.
+   */
+  public ThriftJobChanges(ThriftJobChanges other) {
+    __isset_bit_vector.clear();
+    __isset_bit_vector.or(other.__isset_bit_vector);
+    if (other.isSetChanged()) {
+      List<ThriftJobSummary> __this__changed = new ArrayList<ThriftJobSummary>();
+      for (ThriftJobSummary other_element : other.changed) {
+        __this__changed.add(new ThriftJobSummary(other_element));
+      }
+      this.changed = __this__changed;
+    }
+    if (other.isSetRemoved()) {
+      List<ThriftJobID> __this__removed = new ArrayList<ThriftJobID>();
+      for (ThriftJobID other_element : other.removed) {
+        __this__removed.add(new ThriftJobID(other_element));
+      }
+      this.removed = __this__removed;
+    }
+    this.token = other.token;
+    this.full = other.full;
+  }
+
+  public ThriftJobChanges deepCopy() {
+    return new ThriftJobChanges(this);
+  }
+
+  @Deprecated
+  public ThriftJobChanges clone() {
+    return new ThriftJobChanges(this);
+  }
+
+  public int getChangedSize() {
+    return (this.changed == null) ? 0 : this.changed.size();
+  }
+
+  public java.util.Iterator<ThriftJobSummary> getChangedIterator() {
+    return (this.changed == null) ? null : this.changed.iterator();
+  }
+
+  public void addToChanged(ThriftJobSummary elem) {
+    if (this.changed == null) {
+      this.changed = new ArrayList<ThriftJobSummary>();
+    }
+    this.changed.add(elem);
+  }
+
+  /**
+   * Summaries of the jobs that were added, or whose state or progress changed
+   */
+  public List<ThriftJobSummary> getChanged() {
+    return this.changed;
+  }
+
+  /**
+   * Summaries of the jobs that were added, or whose state or progress changed
+   */
+  public ThriftJobChanges setChanged(List<ThriftJobSummary> changed) {
+    this.changed = changed;
+    return this;
+  }
+
+  public void unsetChanged() {
+    this.changed = null;
+  }
+
+  /** Returns true if field changed is set (has been asigned a value) and false otherwise */
+  public boolean isSetChanged() {
+    return this.changed != null;
+  }
+
+  public void setChangedIsSet(boolean value) {
+    if (!value) {
+      this.changed = null;
+    }
+  }
+
+  public int getRemovedSize() {
+    return (this.removed == null) ? 0 : this.removed.size();
+  }
+
+  public java.util.Iterator<ThriftJobID> getRemovedIterator() {
+    return (this.removed == null) ? null : this.removed.iterator();
+  }
+
+  public void addToRemoved(ThriftJobID elem) {
+    if (this.removed == null) {
+      this.removed = new ArrayList<ThriftJobID>();
+    }
+    this.removed.add(elem);
+  }
+
+  /**
+   * The jobs that the JobTracker no longer retains
+   */
+  public List<ThriftJobID> getRemoved() {
+    return this.removed;
+  }
+
+  /**
+   * The jobs that the JobTracker no longer retains
+   */
+  public ThriftJobChanges setRemoved(List<ThriftJobID> removed) {
+    this.removed = removed;
+    return this;
+  }
+
+  public void unsetRemoved() {
+    this.removed = null;
+  }
+
+  /** Returns true if field removed is set (has been asigned a value) and false otherwise */
+  public boolean isSetRemoved() {
+    return this.removed != null;
+  }
+
+  public void setRemovedIsSet(boolean value) {
+    if (!value) {
+      this.removed = null;
+    }
+  }
+
+  /**
+   * The token to pass to the next call
+   */
+  public long getToken() {
+    return this.token;
+  }
+
+  /**
+   * The token to pass to the next call
+   */
+  public ThriftJobChanges setToken(long token) {
+    this.token = token;
+    setTokenIsSet(true);
+    return this;
+  }
+
+  public void unsetToken() {
+    __isset_bit_vector.clear(__TOKEN_ISSET_ID);
+  }
+
+  /** Returns true if field token is set (has been asigned a value) and false otherwise */
+  public boolean isSetToken() {
+    return __isset_bit_vector.get(__TOKEN_ISSET_ID);
+  }
+
+  public void setTokenIsSet(boolean value) {
+    __isset_bit_vector.set(__TOKEN_ISSET_ID, value);
+  }
+
+  /**
+   * True if the token given could not be used (it was 0, too old, or from
+   * another JobTracker). changed then has every job, and the caller should
+   * drop the jobs it knew about.
+   */
+  public boolean isFull() {
+    return this.full;
+  }
+
+  /**
+   * True if the token given could not be used (it was 0, too old, or from
+   * another JobTracker). changed then has every job, and the caller should
+   * drop the jobs it knew about.
+   */
+  public ThriftJobChanges setFull(boolean full) {
+    this.full = full;
+    setFullIsSet(true);
+    return this;
+  }
+
+  public void unsetFull() {
+    __isset_bit_vector.clear(__FULL_ISSET_ID);
+  }
+
+  /** Returns true if field full is set (has been asigned a value) and false otherwise */
+  public boolean isSetFull() {
+    return __isset_bit_vector.get(__FULL_ISSET_ID);
+  }
+
+  public void setFullIsSet(boolean value) {
+    __isset_bit_vector.set(__FULL_ISSET_ID, value);
+  }
+
+  public void setFieldValue(_Fields field, Object value) {
+    switch (field) {
+    case CHANGED:
+      if (value == null) {
+        unsetChanged();
+      } else {
+        setChanged((List<ThriftJobSummary>)value);
+      }
+      break;
+
+    case REMOVED:
+      if (value == null) {
+        unsetRemoved();
+      } else {
+        setRemoved((List<ThriftJobID>)value);
+      }
+      break;
+
+    case TOKEN:
+      if (value == null) {
+        unsetToken();
+      } else {
+        setToken((Long)value);
+      }
+      break;
+
+    case FULL:
+      if (value == null) {
+        unsetFull();
+      } else {
+        setFull((Boolean)value);
+      }
+      break;
+
+    }
+  }
+
+  public void setFieldValue(int fieldID, Object value) {
+    setFieldValue(_Fields.findByThriftIdOrThrow(fieldID), value);
+  }
+
+  public Object getFieldValue(_Fields field) {
+    switch (field) {
+    case CHANGED:
+      return getChanged();
+
+    case REMOVED:
+      return getRemoved();
+
+    case TOKEN:
+      return new Long(getToken());
+
+    case FULL:
+      return new Boolean(isFull());
+
+    }
+    throw new IllegalStateException();
+  }
+
+  public Object getFieldValue(int fieldId) {
+    return getFieldValue(_Fields.findByThriftIdOrThrow(fieldId));
+  }
+
+  /** Returns true if field corresponding to fieldID is set (has been asigned a value) and false otherwise */
+  public boolean isSet(_Fields field) {
+    switch (field) {
+    case CHANGED:
+      return isSetChanged();
+    case REMOVED:
+      return isSetRemoved();
+    case TOKEN:
+      return isSetToken();
+    case FULL:
+      return isSetFull();
+    }
+    throw new IllegalStateException();
+  }
+
+  public boolean isSet(int fieldID) {
+    return isSet(_Fields.findByThriftIdOrThrow(fieldID));
+  }
+
+  @Override
+  public boolean equals(Object that) {
+    if (that == null)
+      return false;
+    if (that instanceof ThriftJobChanges)
+      return this.equals((ThriftJobChanges)that);
+    return false;
+  }
+
+  public boolean equals(ThriftJobChanges that) {
+    if (that == null)
+      return false;
+
+    boolean this_present_changed = true && this.isSetChanged();
+    boolean that_present_changed = true && that.isSetChanged();
+    if (this_present_changed || that_present_changed) {
+      if (!(this_present_changed && that_present_changed))
+        return false;
+      if (!this.changed.equals(that.changed))
+        return false;
+    }
+
+    boolean this_present_removed = true && this.isSetRemoved();
+    boolean that_present_removed = true && that.isSetRemoved();
+    if (this_present_removed || that_present_removed) {
+      if (!(this_present_removed && that_present_removed))
+        return false;
+      if (!this.removed.equals(that.removed))
+        return false;
+    }
+
+    boolean this_present_token = true;
+    boolean that_present_token = true;
+    if (this_present_token || that_present_token) {
+      if (!(this_present_token && that_present_token))
+        return false;
+      if (this.token != that.token)
+        return false;
+    }
+
+    boolean this_present_full = true;
+    boolean that_present_full = true;
+    if (this_present_full || that_present_full) {
+      if (!(this_present_full && that_present_full))
+        return false;
+      if (this.full != that.full)
+        return false;
+    }
+
+    return true;
+  }
+
+  @Override
+  public int hashCode() {
+    return 0;
+  }
+
+  public int compareTo(ThriftJobChanges other) {
+    if (!getClass().equals(other.getClass())) {
+      return getClass().getName().compareTo(other.getClass().getName());
+    }
+
+    int lastComparison = 0;
+    ThriftJobChanges typedOther = (ThriftJobChanges)other;
+
+    lastComparison = Boolean.valueOf(isSetChanged()).compareTo(isSetChanged());
+    if (lastComparison != 0) {
+      return lastComparison;
+    }
+    lastComparison = TBaseHelper.compareTo(changed, typedOther.changed);
+    if (lastComparison != 0) {
+      return lastComparison;
+    }
+    lastComparison = Boolean.valueOf(isSetRemoved()).compareTo(isSetRemoved());
+    if (lastComparison != 0) {
+      return lastComparison;
+    }
+    lastComparison = TBaseHelper.compareTo(removed, typedOther.removed);
+    if (lastComparison != 0) {
+      return lastComparison;
+    }
+    lastComparison = Boolean.valueOf(isSetToken()).compareTo(isSetToken());
+    if (lastComparison != 0) {
+      return lastComparison;
+    }
+    lastComparison = TBaseHelper.compareTo(token, typedOther.token);
+    if (lastComparison != 0) {
+      return lastComparison;
+    }
+    lastComparison = Boolean.valueOf(isSetFull()).compareTo(isSetFull());
+    if (lastComparison != 0) {
+      return lastComparison;
+    }
+    lastComparison = TBaseHelper.compareTo(full, typedOther.full);
+    if (lastComparison != 0) {
+      return lastComparison;
+    }
+    return 0;
+  }
+
+  public void read(TProtocol iprot) throws TException {
+    TField field;
+    iprot.readStructBegin();
+    while (true)
+    {
+      field = iprot.readFieldBegin();
+      if (field.type == TType.STOP) { 
+        break;
+      }
+      _Fields fieldId = _Fields.findByThriftId(field.id);
+      if (fieldId == null) {
+        TProtocolUtil.skip(iprot, field.type);
+      } else {
+        switch (fieldId) {
+          case CHANGED:
+            if (field.type == TType.LIST) {
+              {
+                TList _list83 = iprot.readListBegin();
+                this.changed = new ArrayList<ThriftJobSummary>(_list83.size);
+                for (int _i84 = 0; _i84 < _list83.size; ++_i84)
+                {
+                  ThriftJobSummary _elem85;
+                  _elem85 = new ThriftJobSummary();
+                  _elem85.read(iprot);
+                  this.changed.add(_elem85);
+                }
+                iprot.readListEnd();
+              }
+            } else { 
+              TProtocolUtil.skip(iprot, field.type);
+            }
+            break;
+          case REMOVED:
+            if (field.type == TType.LIST) {
+              {
+                TList _list86 = iprot.readListBegin();
+                this.removed = new ArrayList<ThriftJobID>(_list86.size);
+                for (int _i87 = 0; _i87 < _list86.size; ++_i87)
+                {
+                  ThriftJobID _elem88;
+                  _elem88 = new ThriftJobID();
+                  _elem88.read(iprot);
+                  this.removed.add(_elem88);
+                }
+                iprot.readListEnd();
+              }
+            } else { 
+              TProtocolUtil.skip(iprot, field.type);
+            }
+            break;
+          case TOKEN:
+            if (field.type == TType.I64) {
+              this.token = iprot.readI64();
+              setTokenIsSet(true);
+            } else { 
+              TProtocolUtil.skip(iprot, field.type);
+            }
+            break;
+          case FULL:
+            if (field.type == TType.BOOL) {
+              this.full = iprot.readBool();
+              setFullIsSet(true);
+            } else { 
+              TProtocolUtil.skip(iprot, field.type);
+            }
+            break;
+        }
+        iprot.readFieldEnd();
+      }
+    }
+    iprot.readStructEnd();
+
+    // check for required fields of primitive type, which can't be checked in the validate method
+    validate();
+  }
+
+  public void write(TProtocol oprot) throws TException {
+    validate();
+
+    oprot.writeStructBegin(STRUCT_DESC);
+    if (this.changed != null) {
+      oprot.writeFieldBegin(CHANGED_FIELD_DESC);
+      {
+        oprot.writeListBegin(new TList(TType.STRUCT, this.changed.size()));
+        for (ThriftJobSummary _iter89 : this.changed)
+        {
+          _iter89.write(oprot);
+        }
+        oprot.writeListEnd();
+      }
+      oprot.writeFieldEnd();
+    }
+    if (this.removed != null) {
+      oprot.writeFieldBegin(REMOVED_FIELD_DESC);
+      {
+        oprot.writeListBegin(new TList(TType.STRUCT, this.removed.size()));
+        for (ThriftJobID _iter90 : this.removed)
+        {
+          _iter90.write(oprot);
+        }
+        oprot.writeListEnd();
+      }
+      oprot.writeFieldEnd();
+    }
+    oprot.writeFieldBegin(TOKEN_FIELD_DESC);
+    oprot.writeI64(this.token);
+    oprot.writeFieldEnd();
+    oprot.writeFieldBegin(FULL_FIELD_DESC);
+    oprot.writeBool(this.full);
+    oprot.writeFieldEnd();
+    oprot.writeFieldStop();
+    oprot.writeStructEnd();
+  }
+
+  @Override
+  public String toString() {
+    StringBuilder sb = new StringBuilder("ThriftJobChanges(");
+    boolean first = true;
+
+    sb.append("changed:");
+    if (this.changed == null) {
+      sb.append("null");
+    } else {
+      sb.append(this.changed);
+    }
+    first = false;
+    if (!first) sb.append(", ");
+    sb.append("removed:");
+    if (this.removed == null) {
+      sb.append("null");
+    } else {
+      sb.append(this.removed);
+    }
+    first = false;
+    if (!first) sb.append(", ");
+    sb.append("token:");
+    sb.append(this.token);
+    first = false;
+    if (!first) sb.append(", ");
+    sb.append("full:");
+    sb.append(this.full);
+    first = false;
+    sb.append(")");
+    return sb.toString();
+  }
+
+  public void validate() throws TException {
+    // check for required fields
+  }
+
+}
+
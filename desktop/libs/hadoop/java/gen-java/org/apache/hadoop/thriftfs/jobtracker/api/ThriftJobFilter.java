@@ -0,0 +1,582 @@
+/**
+ * Autogenerated by Thrift
+ *
+ * DO NOT EDIT UNLESS YOU ARE SURE THAT YOU KNOW WHAT YOU ARE DOING
+ */
+package org.apache.hadoop.thriftfs.jobtracker.api;
+
+import java.util.List;
+import java.util.ArrayList;
+import java.util.Map;
+import java.util.HashMap;
+import java.util.EnumMap;
+import java.util.Set;
+import java.util.HashSet;
+import java.util.EnumSet;
+import java.util.Collections;
+import java.util.BitSet;
+import java.util.Arrays;
+import org.slf4j.Logger;
+import org.slf4j.LoggerFactory;
+
+import org.apache.thrift.*;
+import org.apache.thrift.meta_data.*;
+import org.apache.thrift.protocol.*;
+
+/**
+ * Selection criteria for getJobSummaries(). Unset or empty fields match every job.
+ * Strings match as case-insensitive substrings.
+ */
+public class ThriftJobFilter implements TBase<ThriftJobFilter._Fields>, java.io.Serializable, Cloneable {
+  private static final TStruct STRUCT_DESC = new TStruct("ThriftJobFilter");
+
+  private static final TField STATES_FIELD_DESC = new TField("states", TType.SET, (short)1);
+  private static final TField USER_FIELD_DESC = new TField("user", TType.STRING, (short)2);
+  private static final TField QUEUE_FIELD_DESC = new TField("queue", TType.STRING, (short)3);
+  private static final TField TEXT_FIELD_DESC = new TField("text", TType.STRING, (short)4);
+
+  /**
+   * Match jobs in any of these states
+   */
+  public Set<ThriftJobState> states;
+  public String user;
+  public String queue;
+  /**
+   * Matched against the job's user, name, id, queue and priority
+   */
+  public String text;
+
+  /** The set of fields this struct contains, along with convenience methods for finding and manipulating them. */
+  public enum _Fields implements TFieldIdEnum {
+    /**
+     * Match jobs in any of these states
+     */
+    STATES((short)1, "states"),
+    USER((short)2, "user"),
+    QUEUE((short)3, "queue"),
+    /**
+     * Matched against the job's user, name, id, queue and priority
+     */
+    TEXT((short)4, "text");
+
+    private static final Map<Integer, _Fields> byId = new HashMap<Integer, _Fields>();
+    private static final Map<String, _Fields> byName = new HashMap<String, _Fields>();
+
+    static {
+      for (_Fields field : EnumSet.allOf(_Fields.class)) {
+        byId.put((int)field._thriftId, field);
+        byName.put(field.getFieldName(), field);
+      }
+    }
+
+    /**
+     * Find the _Fields constant that matches fieldId, or null if its not found.
+     */
+    public static _Fields findByThriftId(int fieldId) {
+      return byId.get(fieldId);
+    }
+
+    /**
+     * Find the _Fields constant that matches fieldId, throwing an exception
+     * if it is not found.
+     */
+    public static _Fields findByThriftIdOrThrow(int fieldId) {
+      _Fields fields = findByThriftId(fieldId);
+      if (fields == null) throw new IllegalArgumentException("Field " + fieldId + " doesn't exist!");
+      return fields;
+    }
+
+    /**
+     * Find the _Fields constant that matches name, or null if its not found.
+     */
+    public static _Fields findByName(String name) {
+      return byName.get(name);
+    }
+
+    private final short _thriftId;
+    private final String _fieldName;
+
+    _Fields(short thriftId, String fieldName) {
+      _thriftId = thriftId;
+      _fieldName = fieldName;
+    }
+
+    public short getThriftFieldId() {
+      return _thriftId;
+    }
+
+    public String getFieldName() {
+      return _fieldName;
+    }
+  }
+
+  // isset id assignments
+
+  public static final Map<_Fields, FieldMetaData> metaDataMap = Collections.unmodifiableMap(new EnumMap<_Fields, FieldMetaData>(_Fields.class) {{
+    put(_Fields.STATES, new FieldMetaData("states", TFieldRequirementType.DEFAULT, 
+        new SetMetaData(TType.SET, 
+            new EnumMetaData(TType.ENUM, ThriftJobState.class))));
+    put(_Fields.USER, new FieldMetaData("user", TFieldRequirementType.DEFAULT, 
+        new FieldValueMetaData(TType.STRING)));
+    put(_Fields.QUEUE, new FieldMetaData("queue", TFieldRequirementType.DEFAULT, 
+        new FieldValueMetaData(TType.STRING)));
+    put(_Fields.TEXT, new FieldMetaData("text", TFieldRequirementType.DEFAULT, 
+        new FieldValueMetaData(TType.STRING)));
+  }});
+
+  static {
+    FieldMetaData.addStructMetaDataMap(ThriftJobFilter.class, metaDataMap);
+  }
+
+  public ThriftJobFilter() {
+  }
+
+  public ThriftJobFilter(
+    Set<ThriftJobState> states,
+    String user,
+    String queue,
+    String text)
+  {
+    this();
+    this.states = states;
+    this.user = user;
+    this.queue = queue;
+    this.text = text;
+  }
+
+  /**
+   * Performs a deep copy on <i>other</i>.
+   */
+  public ThriftJobFilter(ThriftJobFilter other) {
+    if (other.isSetStates()) {
+      Set<ThriftJobState> __this__states = new HashSet<ThriftJobState>();
+      for (ThriftJobState other_element : other.states) {
+        __this__states.add(other_element);
+      }
+      this.states = __this__states;
+    }
+    if (other.isSetUser()) {
+      this.user = other.user;
+    }
+    if (other.isSetQueue()) {
+      this.queue = other.queue;
+    }
+    if (other.isSetText()) {
+      this.text = other.text;
+    }
+  }
+
+  public ThriftJobFilter deepCopy() {
+    return new ThriftJobFilter(this);
+  }
+
+  @Deprecated
+  public ThriftJobFilter clone() {
+    return new ThriftJobFilter(this);
+  }
+
+  public int getStatesSize() {
+    return (this.states == null) ? 0 : this.states.size();
+  }
+
+  public java.util.Iterator<ThriftJobState> getStatesIterator() {
+    return (this.states == null) ? null : this.states.iterator();
+  }
+
+  public void addToStates(ThriftJobState elem) {
+    if (this.states == null) {
+      this.states = new HashSet<ThriftJobState>();
+    }
+    this.states.add(elem);
+  }
+
+  /**
+   * Match jobs in any of these states
+   */
+  public Set<ThriftJobState> getStates() {
+    return this.states;
+  }
+
+  /**
+   * Match jobs in any of these states
+   */
+  public ThriftJobFilter setStates(Set<ThriftJobState> states) {
+    this.states = states;
+    return this;
+  }
+
+  public void unsetStates() {
+    this.states = null;
+  }
+
+  /** Returns true if field states is set (has been asigned a value) and false otherwise */
+  public boolean isSetStates() {
+    return this.states != null;
+  }
+
+  public void setStatesIsSet(boolean value) {
+    if (!value) {
+      this.states = null;
+    }
+  }
+
+  public String getUser() {
+    return this.user;
+  }
+
+  public ThriftJobFilter setUser(String user) {
+    this.user = user;
+    return this;
+  }
+
+  public void unsetUser() {
+    this.user = null;
+  }
+
+  /** Returns true if field user is set (has been asigned a value) and false otherwise */
+  public boolean isSetUser() {
+    return this.user != null;
+  }
+
+  public void setUserIsSet(boolean value) {
+    if (!value) {
+      this.user = null;
+    }
+  }
+
+  public String getQueue() {
+    return this.queue;
+  }
+
+  public ThriftJobFilter setQueue(String queue) {
+    this.queue = queue;
+    return this;
+  }
+
+  public void unsetQueue() {
+    this.queue = null;
+  }
+
+  /** Returns true if field queue is set (has been asigned a value) and false otherwise */
+  public boolean isSetQueue() {
+    return this.queue != null;
+  }
+
+  public void setQueueIsSet(boolean value) {
+    if (!value) {
+      this.queue = null;
+    }
+  }
+
+  /**
+   * Matched against the job's user, name, id, queue and priority
+   */
+  public String getText() {
+    return this.text;
+  }
+
+  /**
+   * Matched against the job's user, name, id, queue and priority
+   */
+  public ThriftJobFilter setText(String text) {
+    this.text = text;
+    return this;
+  }
+
+  public void unsetText() {
+    this.text = null;
+  }
+
+  /** Returns true if field text is set (has been asigned a value) and false otherwise */
+  public boolean isSetText() {
+    return this.text != null;
+  }
+
+  public void setTextIsSet(boolean value) {
+    if (!value) {
+      this.text = null;
+    }
+  }
+
+  public void setFieldValue(_Fields field, Object value) {
+    switch (field) {
+    case STATES:
+      if (value == null) {
+        unsetStates();
+      } else {
+        setStates((Set<ThriftJobState>)value);
+      }
+      break;
+
+    case USER:
+      if (value == null) {
+        unsetUser();
+      } else {
+        setUser((String)value);
+      }
+      break;
+
+    case QUEUE:
+      if (value == null) {
+        unsetQueue();
+      } else {
+        setQueue((String)value);
+      }
+      break;
+
+    case TEXT:
+      if (value == null) {
+        unsetText();
+      } else {
+        setText((String)value);
+      }
+      break;
+
+    }
+  }
+
+  public void setFieldValue(int fieldID, Object value) {
+    setFieldValue(_Fields.findByThriftIdOrThrow(fieldID), value);
+  }
+
+  public Object getFieldValue(_Fields field) {
+    switch (field) {
+    case STATES:
+      return getStates();
+
+    case USER:
+      return getUser();
+
+    case QUEUE:
+      return getQueue();
+
+    case TEXT:
+      return getText();
+
+    }
+    throw new IllegalStateException();
+  }
+
+  public Object getFieldValue(int fieldId) {
+    return getFieldValue(_Fields.findByThriftIdOrThrow(fieldId));
+  }
+
+  /** Returns true if field corresponding to fieldID is set (has been asigned a value) and false otherwise */
+  public boolean isSet(_Fields field) {
+    switch (field) {
+    case STATES:
+      return isSetStates();
+    case USER:
+      return isSetUser();
+    case QUEUE:
+      return isSetQueue();
+    case TEXT:
+      return isSetText();
+    }
+    throw new IllegalStateException();
+  }
+
+  public boolean isSet(int fieldID) {
+    return isSet(_Fields.findByThriftIdOrThrow(fieldID));
+  }
+
+  @Override
+  public boolean equals(Object that) {
+    if (that == null)
+      return false;
+    if (that instanceof ThriftJobFilter)
+      return this.equals((ThriftJobFilter)that);
+    return false;
+  }
+
+  public boolean equals(ThriftJobFilter that) {
+    if (that == null)
+      return false;
+
+    boolean this_present_states = true && this.isSetStates();
+    boolean that_present_states = true && that.isSetStates();
+    if (this_present_states || that_present_states) {
+      if (!(this_present_states && that_present_states))
+        return false;
+      if (!this.states.equals(that.states))
+        return false;
+    }
+
+    boolean this_present_user = true && this.isSetUser();
+    boolean that_present_user = true && that.isSetUser();
+    if (this_present_user || that_present_user) {
+      if (!(this_present_user && that_present_user))
+        return false;
+      if (!this.user.equals(that.user))
+        return false;
+    }
+
+    boolean this_present_queue = true && this.isSetQueue();
+    boolean that_present_queue = true && that.isSetQueue();
+    if (this_present_queue || that_present_queue) {
+      if (!(this_present_queue && that_present_queue))
+        return false;
+      if (!this.queue.equals(that.queue))
+        return false;
+    }
+
+    boolean this_present_text = true && this.isSetText();
+    boolean that_present_text = true && that.isSetText();
+    if (this_present_text || that_present_text) {
+      if (!(this_present_text && that_present_text))
+        return false;
+      if (!this.text.equals(that.text))
+        return false;
+    }
+
+    return true;
+  }
+
+  @Override
+  public int hashCode() {
+    return 0;
+  }
+
+  public void read(TProtocol iprot) throws TException {
+    TField field;
+    iprot.readStructBegin();
+    while (true)
+    {
+      field = iprot.readFieldBegin();
+      if (field.type == TType.STOP) { 
+        break;
+      }
+      _Fields fieldId = _Fields.findByThriftId(field.id);
+      if (fieldId == null) {
+        TProtocolUtil.skip(iprot, field.type);
+      } else {
+        switch (fieldId) {
+          case STATES:
+            if (field.type == TType.SET) {
+              {
+                TSet _set75 = iprot.readSetBegin();
+                this.states = new HashSet<ThriftJobState>(2*_set75.size);
+                for (int _i76 = 0; _i76 < _set75.size; ++_i76)
+                {
+                  ThriftJobState _elem77;
+                  _elem77 = ThriftJobState.findByValue(iprot.readI32());
+                  this.states.add(_elem77);
+                }
+                iprot.readSetEnd();
+              }
+            } else { 
+              TProtocolUtil.skip(iprot, field.type);
+            }
+            break;
+          case USER:
+            if (field.type == TType.STRING) {
+              this.user = iprot.readString();
+            } else { 
+              TProtocolUtil.skip(iprot, field.type);
+            }
+            break;
+          case QUEUE:
+            if (field.type == TType.STRING) {
+              this.queue = iprot.readString();
+            } else { 
+              TProtocolUtil.skip(iprot, field.type);
+            }
+            break;
+          case TEXT:
+            if (field.type == TType.STRING) {
+              this.text = iprot.readString();
+            } else { 
+              TProtocolUtil.skip(iprot, field.type);
+            }
+            break;
+        }
+        iprot.readFieldEnd();
+      }
+    }
+    iprot.readStructEnd();
+
+    // check for required fields of primitive type, which can't be checked in the validate method
+    validate();
+  }
+
+  public void write(TProtocol oprot) throws TException {
+    validate();
+
+    oprot.writeStructBegin(STRUCT_DESC);
+    if (this.states != null) {
+      oprot.writeFieldBegin(STATES_FIELD_DESC);
+      {
+        oprot.writeSetBegin(new TSet(TType.I32, this.states.size()));
+        for (ThriftJobState _iter78 : this.states)
+        {
+          oprot.writeI32(_iter78.getValue());
+        }
+        oprot.writeSetEnd();
+      }
+      oprot.writeFieldEnd();
+    }
+    if (this.user != null) {
+      oprot.writeFieldBegin(USER_FIELD_DESC);
+      oprot.writeString(this.user);
+      oprot.writeFieldEnd();
+    }
+    if (this.queue != null) {
+      oprot.writeFieldBegin(QUEUE_FIELD_DESC);
+      oprot.writeString(this.queue);
+      oprot.writeFieldEnd();
+    }
+    if (this.text != null) {
+      oprot.writeFieldBegin(TEXT_FIELD_DESC);
+      oprot.writeString(this.text);
+      oprot.writeFieldEnd();
+    }
+    oprot.writeFieldStop();
+    oprot.writeStructEnd();
+  }
+
+  @Override
+  public String toString() {
+    StringBuilder sb = new StringBuilder("ThriftJobFilter(");
+    boolean first = true;
+
+    sb.append("states:");
+    if (this.states == null) {
+      sb.append("null");
+    } else {
+      sb.append(this.states);
+    }
+    first = false;
+    if (!first) sb.append(", ");
+    sb.append("user:");
+    if (this.user == null) {
+      sb.append("null");
+    } else {
+      sb.append(this.user);
+    }
+    first = false;
+    if (!first) sb.append(", ");
+    sb.append("queue:");
+    if (this.queue == null) {
+      sb.append("null");
+    } else {
+      sb.append(this.queue);
+    }
+    first = false;
+    if (!first) sb.append(", ");
+    sb.append("text:");
+    if (this.text == null) {
+      sb.append("null");
+    } else {
+      sb.append(this.text);
+    }
+    first = false;
+    sb.append(")");
+    return sb.toString();
+  }
+
+  public void validate() throws TException {
+    // check for required fields
+  }
+
+}
+
@@ -261,14 +261,14 @@ public class ThriftJobList implements TBase<ThriftJobList._Fields>, java.io.Seri
           case JOBS:
             if (field.type == TType.LIST) {
               {
-                TList _list47 = iprot.readListBegin();
-                this.jobs = new ArrayList<ThriftJobInProgress>(_list47.size);
-                for (int _i48 = 0; _i48 < _list47.size; ++_i48)
+                TList _list71 = iprot.readListBegin();
+                this.jobs = new ArrayList<ThriftJobInProgress>(_list71.size);
+                for (int _i72 = 0; _i72 < _list71.size; ++_i72)
                 {
-                  ThriftJobInProgress _elem49;
-                  _elem49 = new ThriftJobInProgress();
-                  _elem49.read(iprot);
-                  this.jobs.add(_elem49);
+                  ThriftJobInProgress _elem73;
+                  _elem73 = new ThriftJobInProgress();
+                  _elem73.read(iprot);
+                  this.jobs.add(_elem73);
                 }
                 iprot.readListEnd();
               }
@@ -294,9 +294,9 @@ public class ThriftJobList implements TBase<ThriftJobList._Fields>, java.io.Seri
       oprot.writeFieldBegin(JOBS_FIELD_DESC);
       {
         oprot.writeListBegin(new TList(TType.STRUCT, this.jobs.size()));
-        for (ThriftJobInProgress _iter50 : this.jobs)
+        for (ThriftJobInProgress _iter74 : this.jobs)
         {
-          _iter50.write(oprot);
+          _iter74.write(oprot);
         }
         oprot.writeListEnd();
       }
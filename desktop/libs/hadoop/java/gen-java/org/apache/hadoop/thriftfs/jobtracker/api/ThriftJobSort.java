@@ -0,0 +1,416 @@
+/**
+ * Autogenerated by Thrift
+ *
+ * DO NOT EDIT UNLESS YOU ARE SURE THAT YOU KNOW WHAT YOU ARE DOING
+ */
+package org.apache.hadoop.thriftfs.jobtracker.api;
+
+import java.util.List;
+import java.util.ArrayList;
+import java.util.Map;
+import java.util.HashMap;
+import java.util.EnumMap;
+import java.util.Set;
+import java.util.HashSet;
+import java.util.EnumSet;
+import java.util.Collections;
+import java.util.BitSet;
+import java.util.Arrays;
+import org.slf4j.Logger;
+import org.slf4j.LoggerFactory;
+
+import org.apache.thrift.*;
+import org.apache.thrift.meta_data.*;
+import org.apache.thrift.protocol.*;
+
+/**
+ * Order of the jobs returned by getJobSummaries()
+ */
+public class ThriftJobSort implements TBase<ThriftJobSort._Fields>, java.io.Serializable, Cloneable, Comparable<ThriftJobSort> {
+  private static final TStruct STRUCT_DESC = new TStruct("ThriftJobSort");
+
+  private static final TField KEY_FIELD_DESC = new TField("key", TType.I32, (short)1);
+  private static final TField DESCENDING_FIELD_DESC = new TField("descending", TType.BOOL, (short)2);
+
+  /**
+   * 
+   * @see ThriftJobSortKey
+   */
+  public ThriftJobSortKey key;
+  public boolean descending;
+
+  /** The set of fields this struct contains, along with convenience methods for finding and manipulating them. */
+  public enum _Fields implements TFieldIdEnum {
+    /**
+     * 
+     * @see ThriftJobSortKey
+     */
+    KEY((short)1, "key"),
+    DESCENDING((short)2, "descending");
+
+    private static final Map<Integer, _Fields> byId = new HashMap<Integer, _Fields>();
+    private static final Map<String, _Fields> byName = new HashMap<String, _Fields>();
+
+    static {
+      for (_Fields field : EnumSet.allOf(_Fields.class)) {
+        byId.put((int)field._thriftId, field);
+        byName.put(field.getFieldName(), field);
+      }
+    }
+
+    /**
+     * Find the _Fields constant that matches fieldId, or null if its not found.
+     */
+    public static _Fields findByThriftId(int fieldId) {
+      return byId.get(fieldId);
+    }
+
+    /**
+     * Find the _Fields constant that matches fieldId, throwing an exception
+     * if it is not found.
+     */
+    public static _Fields findByThriftIdOrThrow(int fieldId) {
+      _Fields fields = findByThriftId(fieldId);
+      if (fields == null) throw new IllegalArgumentException("Field " + fieldId + " doesn't exist!");
+      return fields;
+    }
+
+    /**
+     * Find the _Fields constant that matches name, or null if its not found.
+     */
+    public static _Fields findByName(String name) {
+      return byName.get(name);
+    }
+
+    private final short _thriftId;
+    private final String _fieldName;
+
+    _Fields(short thriftId, String fieldName) {
+      _thriftId = thriftId;
+      _fieldName = fieldName;
+    }
+
+    public short getThriftFieldId() {
+      return _thriftId;
+    }
+
+    public String getFieldName() {
+      return _fieldName;
+    }
+  }
+
+  // isset id assignments
+  private static final int __DESCENDING_ISSET_ID = 0;
+  private BitSet __isset_bit_vector = new BitSet(1);
+
+  public static final Map<_Fields, FieldMetaData> metaDataMap = Collections.unmodifiableMap(new EnumMap<_Fields, FieldMetaData>(_Fields.class) {{
+    put(_Fields.KEY, new FieldMetaData("key", TFieldRequirementType.DEFAULT, 
+        new EnumMetaData(TType.ENUM, ThriftJobSortKey.class)));
+    put(_Fields.DESCENDING, new FieldMetaData("descending", TFieldRequirementType.DEFAULT, 
+        new FieldValueMetaData(TType.BOOL)));
+  }});
+
+  static {
+    FieldMetaData.addStructMetaDataMap(ThriftJobSort.class, metaDataMap);
+  }
+
+  public ThriftJobSort() {
+  }
+
+  public ThriftJobSort(
+    ThriftJobSortKey key,
+    boolean descending)
+  {
+    this();
+    this.key = key;
+    this.descending = descending;
+    setDescendingIsSet(true);
+  }
+
+  /**
+   * Performs a deep copy on <i>other</i>.
+   */
+  public ThriftJobSort(ThriftJobSort other) {
+    __isset_bit_vector.clear();
+    __isset_bit_vector.or(other.__isset_bit_vector);
+    if (other.isSetKey()) {
+      this.key = other.key;
+    }
+    this.descending = other.descending;
+  }
+
+  public ThriftJobSort deepCopy() {
+    return new ThriftJobSort(this);
+  }
+
+  @Deprecated
+  public ThriftJobSort clone() {
+    return new ThriftJobSort(this);
+  }
+
+  /**
+   * 
+   * @see ThriftJobSortKey
+   */
+  public ThriftJobSortKey getKey() {
+    return this.key;
+  }
+
+  /**
+   * 
+   * @see ThriftJobSortKey
+   */
+  public ThriftJobSort setKey(ThriftJobSortKey key) {
+    this.key = key;
+    return this;
+  }
+
+  public void unsetKey() {
+    this.key = null;
+  }
+
+  /** Returns true if field key is set (has been asigned a value) and false otherwise */
+  public boolean isSetKey() {
+    return this.key != null;
+  }
+
+  public void setKeyIsSet(boolean value) {
+    if (!value) {
+      this.key = null;
+    }
+  }
+
+  public boolean isDescending() {
+    return this.descending;
+  }
+
+  public ThriftJobSort setDescending(boolean descending) {
+    this.descending = descending;
+    setDescendingIsSet(true);
+    return this;
+  }
+
+  public void unsetDescending() {
+    __isset_bit_vector.clear(__DESCENDING_ISSET_ID);
+  }
+
+  /** Returns true if field descending is set (has been asigned a value) and false otherwise */
+  public boolean isSetDescending() {
+    return __isset_bit_vector.get(__DESCENDING_ISSET_ID);
+  }
+
+  public void setDescendingIsSet(boolean value) {
+    __isset_bit_vector.set(__DESCENDING_ISSET_ID, value);
+  }
+
+  public void setFieldValue(_Fields field, Object value) {
+    switch (field) {
+    case KEY:
+      if (value == null) {
+        unsetKey();
+      } else {
+        setKey((ThriftJobSortKey)value);
+      }
+      break;
+
+    case DESCENDING:
+      if (value == null) {
+        unsetDescending();
+      } else {
+        setDescending((Boolean)value);
+      }
+      break;
+
+    }
+  }
+
+  public void setFieldValue(int fieldID, Object value) {
+    setFieldValue(_Fields.findByThriftIdOrThrow(fieldID), value);
+  }
+
+  public Object getFieldValue(_Fields field) {
+    switch (field) {
+    case KEY:
+      return getKey();
+
+    case DESCENDING:
+      return new Boolean(isDescending());
+
+    }
+    throw new IllegalStateException();
+  }
+
+  public Object getFieldValue(int fieldId) {
+    return getFieldValue(_Fields.findByThriftIdOrThrow(fieldId));
+  }
+
+  /** Returns true if field corresponding to fieldID is set (has been asigned a value) and false otherwise */
+  public boolean isSet(_Fields field) {
+    switch (field) {
+    case KEY:
+      return isSetKey();
+    case DESCENDING:
+      return isSetDescending();
+    }
+    throw new IllegalStateException();
+  }
+
+  public boolean isSet(int fieldID) {
+    return isSet(_Fields.findByThriftIdOrThrow(fieldID));
+  }
+
+  @Override
+  public boolean equals(Object that) {
+    if (that == null)
+      return false;
+    if (that instanceof ThriftJobSort)
+      return this.equals((ThriftJobSort)that);
+    return false;
+  }
+
+  public boolean equals(ThriftJobSort that) {
+    if (that == null)
+      return false;
+
+    boolean this_present_key = true && this.isSetKey();
+    boolean that_present_key = true && that.isSetKey();
+    if (this_present_key || that_present_key) {
+      if (!(this_present_key && that_present_key))
+        return false;
+      if (!this.key.equals(that.key))
+        return false;
+    }
+
+    boolean this_present_descending = true;
+    boolean that_present_descending = true;
+    if (this_present_descending || that_present_descending) {
+      if (!(this_present_descending && that_present_descending))
+        return false;
+      if (this.descending != that.descending)
+        return false;
+    }
+
+    return true;
+  }
+
+  @Override
+  public int hashCode() {
+    return 0;
+  }
+
+  public int compareTo(ThriftJobSort other) {
+    if (!getClass().equals(other.getClass())) {
+      return getClass().getName().compareTo(other.getClass().getName());
+    }
+
+    int lastComparison = 0;
+    ThriftJobSort typedOther = (ThriftJobSort)other;
+
+    lastComparison = Boolean.valueOf(isSetKey()).compareTo(isSetKey());
+    if (lastComparison != 0) {
+      return lastComparison;
+    }
+    lastComparison = TBaseHelper.compareTo(key, typedOther.key);
+    if (lastComparison != 0) {
+      return lastComparison;
+    }
+    lastComparison = Boolean.valueOf(isSetDescending()).compareTo(isSetDescending());
+    if (lastComparison != 0) {
+      return lastComparison;
+    }
+    lastComparison = TBaseHelper.compareTo(descending, typedOther.descending);
+    if (lastComparison != 0) {
+      return lastComparison;
+    }
+    return 0;
+  }
+
+  public void read(TProtocol iprot) throws TException {
+    TField field;
+    iprot.readStructBegin();
+    while (true)
+    {
+      field = iprot.readFieldBegin();
+      if (field.type == TType.STOP) { 
+        break;
+      }
+      _Fields fieldId = _Fields.findByThriftId(field.id);
+      if (fieldId == null) {
+        TProtocolUtil.skip(iprot, field.type);
+      } else {
+        switch (fieldId) {
+          case KEY:
+            if (field.type == TType.I32) {
+              this.key = ThriftJobSortKey.findByValue(iprot.readI32());
+            } else { 
+              TProtocolUtil.skip(iprot, field.type);
+            }
+            break;
+          case DESCENDING:
+            if (field.type == TType.BOOL) {
+              this.descending = iprot.readBool();
+              setDescendingIsSet(true);
+            } else { 
+              TProtocolUtil.skip(iprot, field.type);
+            }
+            break;
+        }
+        iprot.readFieldEnd();
+      }
+    }
+    iprot.readStructEnd();
+
+    // check for required fields of primitive type, which can't be checked in the validate method
+    validate();
+  }
+
+  public void write(TProtocol oprot) throws TException {
+    validate();
+
+    oprot.writeStructBegin(STRUCT_DESC);
+    if (this.key != null) {
+      oprot.writeFieldBegin(KEY_FIELD_DESC);
+      oprot.writeI32(this.key.getValue());
+      oprot.writeFieldEnd();
+    }
+    oprot.writeFieldBegin(DESCENDING_FIELD_DESC);
+    oprot.writeBool(this.descending);
+    oprot.writeFieldEnd();
+    oprot.writeFieldStop();
+    oprot.writeStructEnd();
+  }
+
+  @Override
+  public String toString() {
+    StringBuilder sb = new StringBuilder("ThriftJobSort(");
+    boolean first = true;
+
+    sb.append("key:");
+    if (this.key == null) {
+      sb.append("null");
+    } else {
+      String key_name = key.name();
+      if (key_name != null) {
+        sb.append(key_name);
+        sb.append(" (");
+      }
+      sb.append(this.key);
+      if (key_name != null) {
+        sb.append(")");
+      }
+    }
+    first = false;
+    if (!first) sb.append(", ");
+    sb.append("descending:");
+    sb.append(this.descending);
+    first = false;
+    sb.append(")");
+    return sb.toString();
+  }
+
+  public void validate() throws TException {
+    // check for required fields
+  }
+
+}
+
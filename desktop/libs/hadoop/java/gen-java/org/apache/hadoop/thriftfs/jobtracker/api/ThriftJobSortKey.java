@@ -0,0 +1,51 @@
+/**
+ * Autogenerated by Thrift
+ *
+ * DO NOT EDIT UNLESS YOU ARE SURE THAT YOU KNOW WHAT YOU ARE DOING
+ */
+package org.apache.hadoop.thriftfs.jobtracker.api;
+
+
+import java.util.Map;
+import java.util.HashMap;
+import org.apache.thrift.TEnum;
+/**
+ * Job fields that getJobSummaries() can order by
+ */
+public enum ThriftJobSortKey implements TEnum{
+    JOB_ID(0),
+    NAME(1),
+    USER(2),
+    QUEUE(3),
+    STATE(4),
+    PRIORITY(5),
+    START_TIME(6),
+    FINISH_TIME(7);
+
+  private static final Map<Integer, ThriftJobSortKey> BY_VALUE = new HashMap<Integer,ThriftJobSortKey>() {{
+    for(ThriftJobSortKey val : ThriftJobSortKey.values()) {
+      put(val.getValue(), val);
+    }
+  }};
+
+  private final int value;
+
+  private ThriftJobSortKey(int value) {
+    this.value = value;
+  }
+
+  /**
+   * Get the integer value of this enum value, as defined in the Thrift IDL.
+   */
+  public int getValue() {
+    return value;
+  }
+
+  /**
+   * Find a the enum type by its integer value, as defined in the Thrift IDL.
+   * @return null if the value is not found.
+   */
+  public static ThriftJobSortKey findByValue(int value) { 
+    return BY_VALUE.get(value);
+  }
+}
@@ -0,0 +1,1408 @@
+/**
+ * Autogenerated by Thrift
+ *
+ * DO NOT EDIT UNLESS YOU ARE SURE THAT YOU KNOW WHAT YOU ARE DOING
+ */
+package org.apache.hadoop.thriftfs.jobtracker.api;
+
+import java.util.List;
+import java.util.ArrayList;
+import java.util.Map;
+import java.util.HashMap;
+import java.util.EnumMap;
+import java.util.Set;
+import java.util.HashSet;
+import java.util.EnumSet;
+import java.util.Collections;
+import java.util.BitSet;
+import java.util.Arrays;
+import org.slf4j.Logger;
+import org.slf4j.LoggerFactory;
+
+import org.apache.thrift.*;
+import org.apache.thrift.meta_data.*;
+import org.apache.thrift.protocol.*;
+
+/**
+ * The fields of a job shown in job lists; much smaller than a
+ * ThriftJobInProgress. Use getJob() for the rest.
+ */
+public class ThriftJobSummary implements TBase<ThriftJobSummary._Fields>, java.io.Serializable, Cloneable, Comparable<ThriftJobSummary> {
+  private static final TStruct STRUCT_DESC = new TStruct("ThriftJobSummary");
+
+  private static final TField JOB_ID_FIELD_DESC = new TField("jobID", TType.STRUCT, (short)1);
+  private static final TField NAME_FIELD_DESC = new TField("name", TType.STRING, (short)2);
+  private static final TField USER_FIELD_DESC = new TField("user", TType.STRING, (short)3);
+  private static final TField QUEUE_NAME_FIELD_DESC = new TField("queueName", TType.STRING, (short)4);
+  private static final TField RUN_STATE_FIELD_DESC = new TField("runState", TType.I32, (short)5);
+  private static final TField PRIORITY_FIELD_DESC = new TField("priority", TType.I32, (short)6);
+  private static final TField MAP_PROGRESS_FIELD_DESC = new TField("mapProgress", TType.DOUBLE, (short)7);
+  private static final TField REDUCE_PROGRESS_FIELD_DESC = new TField("reduceProgress", TType.DOUBLE, (short)8);
+  private static final TField DESIRED_MAPS_FIELD_DESC = new TField("desiredMaps", TType.I32, (short)9);
+  private static final TField DESIRED_REDUCES_FIELD_DESC = new TField("desiredReduces", TType.I32, (short)10);
+  private static final TField FINISHED_MAPS_FIELD_DESC = new TField("finishedMaps", TType.I32, (short)11);
+  private static final TField FINISHED_REDUCES_FIELD_DESC = new TField("finishedReduces", TType.I32, (short)12);
+  private static final TField START_TIME_FIELD_DESC = new TField("startTime", TType.I64, (short)13);
+  private static final TField FINISH_TIME_FIELD_DESC = new TField("finishTime", TType.I64, (short)14);
+
+  public ThriftJobID jobID;
+  public String name;
+  public String user;
+  public String queueName;
+  /**
+   * 
+   * @see ThriftJobState
+   */
+  public ThriftJobState runState;
+  /**
+   * 
+   * @see ThriftJobPriority
+   */
+  public ThriftJobPriority priority;
+  public double mapProgress;
+  public double reduceProgress;
+  public int desiredMaps;
+  public int desiredReduces;
+  public int finishedMaps;
+  public int finishedReduces;
+  public long startTime;
+  public long finishTime;
+
+  /** The set of fields this struct contains, along with convenience methods for finding and manipulating them. */
+  public enum _Fields implements TFieldIdEnum {
+    JOB_ID((short)1, "jobID"),
+    NAME((short)2, "name"),
+    USER((short)3, "user"),
+    QUEUE_NAME((short)4, "queueName"),
+    /**
+     * 
+     * @see ThriftJobState
+     */
+    RUN_STATE((short)5, "runState"),
+    /**
+     * 
+     * @see ThriftJobPriority
+     */
+    PRIORITY((short)6, "priority"),
+    MAP_PROGRESS((short)7, "mapProgress"),
+    REDUCE_PROGRESS((short)8, "reduceProgress"),
+    DESIRED_MAPS((short)9, "desiredMaps"),
+    DESIRED_REDUCES((short)10, "desiredReduces"),
+    FINISHED_MAPS((short)11, "finishedMaps"),
+    FINISHED_REDUCES((short)12, "finishedReduces"),
+    START_TIME((short)13, "startTime"),
+    FINISH_TIME((short)14, "finishTime");
+
+    private static final Map<Integer, _Fields> byId = new HashMap<Integer, _Fields>();
+    private static final Map<String, _Fields> byName = new HashMap<String, _Fields>();
+
+    static {
+      for (_Fields field : EnumSet.allOf(_Fields.class)) {
+        byId.put((int)field._thriftId, field);
+        byName.put(field.getFieldName(), field);
+      }
+    }
+
+    /**
+     * Find the _Fields constant that matches fieldId, or null if its not found.
+     */
+    public static _Fields findByThriftId(int fieldId) {
+      return byId.get(fieldId);
+    }
+
+    /**
+     * Find the _Fields constant that matches fieldId, throwing an exception
+     * if it is not found.
+     */
+    public static _Fields findByThriftIdOrThrow(int fieldId) {
+      _Fields fields = findByThriftId(fieldId);
+      if (fields == null) throw new IllegalArgumentException("Field " + fieldId + " doesn't exist!");
+      return fields;
+    }
+
+    /**
+     * Find the _Fields constant that matches name, or null if its not found.
+     */
+    public static _Fields findByName(String name) {
+      return byName.get(name);
+    }
+
+    private final short _thriftId;
+    private final String _fieldName;
+
+    _Fields(short thriftId, String fieldName) {
+      _thriftId = thriftId;
+      _fieldName = fieldName;
+    }
+
+    public short getThriftFieldId() {
+      return _thriftId;
+    }
+
+    public String getFieldName() {
+      return _fieldName;
+    }
+  }
+
+  // isset id assignments
+  private static final int __MAPPROGRESS_ISSET_ID = 0;
+  private static final int __REDUCEPROGRESS_ISSET_ID = 1;
+  private static final int __DESIREDMAPS_ISSET_ID = 2;
+  private static final int __DESIREDREDUCES_ISSET_ID = 3;
+  private static final int __FINISHEDMAPS_ISSET_ID = 4;
+  private static final int __FINISHEDREDUCES_ISSET_ID = 5;
+  private static final int __STARTTIME_ISSET_ID = 6;
+  private static final int __FINISHTIME_ISSET_ID = 7;
+  private BitSet __isset_bit_vector = new BitSet(8);
+
+  public static final Map<_Fields, FieldMetaData> metaDataMap = Collections.unmodifiableMap(new EnumMap<_Fields, FieldMetaData>(_Fields.class) {{
+    put(_Fields.JOB_ID, new FieldMetaData("jobID", TFieldRequirementType.DEFAULT, 
+        new StructMetaData(TType.STRUCT, ThriftJobID.class)));
+    put(_Fields.NAME, new FieldMetaData("name", TFieldRequirementType.DEFAULT, 
+        new FieldValueMetaData(TType.STRING)));
+    put(_Fields.USER, new FieldMetaData("user", TFieldRequirementType.DEFAULT, 
+        new FieldValueMetaData(TType.STRING)));
+    put(_Fields.QUEUE_NAME, new FieldMetaData("queueName", TFieldRequirementType.DEFAULT, 
+        new FieldValueMetaData(TType.STRING)));
+    put(_Fields.RUN_STATE, new FieldMetaData("runState", TFieldRequirementType.DEFAULT, 
+        new EnumMetaData(TType.ENUM, ThriftJobState.class)));
+    put(_Fields.PRIORITY, new FieldMetaData("priority", TFieldRequirementType.DEFAULT, 
+        new EnumMetaData(TType.ENUM, ThriftJobPriority.class)));
+    put(_Fields.MAP_PROGRESS, new FieldMetaData("mapProgress", TFieldRequirementType.DEFAULT, 
+        new FieldValueMetaData(TType.DOUBLE)));
+    put(_Fields.REDUCE_PROGRESS, new FieldMetaData("reduceProgress", TFieldRequirementType.DEFAULT, 
+        new FieldValueMetaData(TType.DOUBLE)));
+    put(_Fields.DESIRED_MAPS, new FieldMetaData("desiredMaps", TFieldRequirementType.DEFAULT, 
+        new FieldValueMetaData(TType.I32)));
+    put(_Fields.DESIRED_REDUCES, new FieldMetaData("desiredReduces", TFieldRequirementType.DEFAULT, 
+        new FieldValueMetaData(TType.I32)));
+    put(_Fields.FINISHED_MAPS, new FieldMetaData("finishedMaps", TFieldRequirementType.DEFAULT, 
+        new FieldValueMetaData(TType.I32)));
+    put(_Fields.FINISHED_REDUCES, new FieldMetaData("finishedReduces", TFieldRequirementType.DEFAULT, 
+        new FieldValueMetaData(TType.I32)));
+    put(_Fields.START_TIME, new FieldMetaData("startTime", TFieldRequirementType.DEFAULT, 
+        new FieldValueMetaData(TType.I64)));
+    put(_Fields.FINISH_TIME, new FieldMetaData("finishTime", TFieldRequirementType.DEFAULT, 
+        new FieldValueMetaData(TType.I64)));
+  }});
+
+  static {
+    FieldMetaData.addStructMetaDataMap(ThriftJobSummary.class, metaDataMap);
+  }
+
+  public ThriftJobSummary() {
+  }
+
+  public ThriftJobSummary(
+    ThriftJobID jobID,
+    String name,
+    String user,
+    String queueName,
+    ThriftJobState runState,
+    ThriftJobPriority priority,
+    double mapProgress,
+    double reduceProgress,
+    int desiredMaps,
+    int desiredReduces,
+    int finishedMaps,
+    int finishedReduces,
+    long startTime,
+    long finishTime)
+  {
+    this();
+    this.jobID = jobID;
+    this.name = name;
+    this.user = user;
+    this.queueName = queueName;
+    this.runState = runState;
+    this.priority = priority;
+    this.mapProgress = mapProgress;
+    setMapProgressIsSet(true);
+    this.reduceProgress = reduceProgress;
+    setReduceProgressIsSet(true);
+    this.desiredMaps = desiredMaps;
+    setDesiredMapsIsSet(true);
+    this.desiredReduces = desiredReduces;
+    setDesiredReducesIsSet(true);
+    this.finishedMaps = finishedMaps;
+    setFinishedMapsIsSet(true);
+    this.finishedReduces = finishedReduces;
+    setFinishedReducesIsSet(true);
+    this.startTime = startTime;
+    setStartTimeIsSet(true);
+    this.finishTime = finishTime;
+    setFinishTimeIsSet(true);
+  }
+
+  /**
+   * Performs a deep copy on <i>other</i>.
+   */
+  public ThriftJobSummary(ThriftJobSummary other) {
+    __isset_bit_vector.clear();
+    __isset_bit_vector.or(other.__isset_bit_vector);
+    if (other.isSetJobID()) {
+      this.jobID = new ThriftJobID(other.jobID);
+    }
+    if (other.isSetName()) {
+      this.name = other.name;
+    }
+    if (other.isSetUser()) {
+      this.user = other.user;
+    }
+    if (other.isSetQueueName()) {
+      this.queueName = other.queueName;
+    }
+    if (other.isSetRunState()) {
+      this.runState = other.runState;
+    }
+    if (other.isSetPriority()) {
+      this.priority = other.priority;
+    }
+    this.mapProgress = other.mapProgress;
+    this.reduceProgress = other.reduceProgress;
+    this.desiredMaps = other.desiredMaps;
+    this.desiredReduces = other.desiredReduces;
+    this.finishedMaps = other.finishedMaps;
+    this.finishedReduces = other.finishedReduces;
+    this.startTime = other.startTime;
+    this.finishTime = other.finishTime;
+  }
+
+  public ThriftJobSummary deepCopy() {
+    return new ThriftJobSummary(this);
+  }
+
+  @Deprecated
+  public ThriftJobSummary clone() {
+    return new ThriftJobSummary(this);
+  }
+
+  public ThriftJobID getJobID() {
+    return this.jobID;
+  }
+
+  public ThriftJobSummary setJobID(ThriftJobID jobID) {
+    this.jobID = jobID;
+    return this;
+  }
+
+  public void unsetJobID() {
+    this.jobID = null;
+  }
+
+  /** Returns true if field jobID is set (has been asigned a value) and false otherwise */
+  public boolean isSetJobID() {
+    return this.jobID != null;
+  }
+
+  public void setJobIDIsSet(boolean value) {
+    if (!value) {
+      this.jobID = null;
+    }
+  }
+
+  public String getName() {
+    return this.name;
+  }
+
+  public ThriftJobSummary setName(String name) {
+    this.name = name;
+    return this;
+  }
+
+  public void unsetName() {
+    this.name = null;
+  }
+
+  /** Returns true if field name is set (has been asigned a value) and false otherwise */
+  public boolean isSetName() {
+    return this.name != null;
+  }
+
+  public void setNameIsSet(boolean value) {
+    if (!value) {
+      this.name = null;
+    }
+  }
+
+  public String getUser() {
+    return this.user;
+  }
+
+  public ThriftJobSummary setUser(String user) {
+    this.user = user;
+    return this;
+  }
+
+  public void unsetUser() {
+    this.user = null;
+  }
+
+  /** Returns true if field user is set (has been asigned a value) and false otherwise */
+  public boolean isSetUser() {
+    return this.user != null;
+  }
+
+  public void setUserIsSet(boolean value) {
+    if (!value) {
+      this.user = null;
+    }
+  }
+
+  public String getQueueName() {
+    return this.queueName;
+  }
+
+  public ThriftJobSummary setQueueName(String queueName) {
+    this.queueName = queueName;
+    return this;
+  }
+
+  public void unsetQueueName() {
+    this.queueName = null;
+  }
+
+  /** Returns true if field queueName is set (has been asigned a value) and false otherwise */
+  public boolean isSetQueueName() {
+    return this.queueName != null;
+  }
+
+  public void setQueueNameIsSet(boolean value) {
+    if (!value) {
+      this.queueName = null;
+    }
+  }
+
+  /**
+   * 
+   * @see ThriftJobState
+   */
+  public ThriftJobState getRunState() {
+    return this.runState;
+  }
+
+  /**
+   * 
+   * @see ThriftJobState
+   */
+  public ThriftJobSummary setRunState(ThriftJobState runState) {
+    this.runState = runState;
+    return this;
+  }
+
+  public void unsetRunState() {
+    this.runState = null;
+  }
+
+  /** Returns true if field runState is set (has been asigned a value) and false otherwise */
+  public boolean isSetRunState() {
+    return this.runState != null;
+  }
+
+  public void setRunStateIsSet(boolean value) {
+    if (!value) {
+      this.runState = null;
+    }
+  }
+
+  /**
+   * 
+   * @see ThriftJobPriority
+   */
+  public ThriftJobPriority getPriority() {
+    return this.priority;
+  }
+
+  /**
+   * 
+   * @see ThriftJobPriority
+   */
+  public ThriftJobSummary setPriority(ThriftJobPriority priority) {
+    this.priority = priority;
+    return this;
+  }
+
+  public void unsetPriority() {
+    this.priority = null;
+  }
+
+  /** Returns true if field priority is set (has been asigned a value) and false otherwise */
+  public boolean isSetPriority() {
+    return this.priority != null;
+  }
+
+  public void setPriorityIsSet(boolean value) {
+    if (!value) {
+      this.priority = null;
+    }
+  }
+
+  public double getMapProgress() {
+    return this.mapProgress;
+  }
+
+  public ThriftJobSummary setMapProgress(double mapProgress) {
+    this.mapProgress = mapProgress;
+    setMapProgressIsSet(true);
+    return this;
+  }
+
+  public void unsetMapProgress() {
+    __isset_bit_vector.clear(__MAPPROGRESS_ISSET_ID);
+  }
+
+  /** Returns true if field mapProgress is set (has been asigned a value) and false otherwise */
+  public boolean isSetMapProgress() {
+    return __isset_bit_vector.get(__MAPPROGRESS_ISSET_ID);
+  }
+
+  public void setMapProgressIsSet(boolean value) {
+    __isset_bit_vector.set(__MAPPROGRESS_ISSET_ID, value);
+  }
+
+  public double getReduceProgress() {
+    return this.reduceProgress;
+  }
+
+  public ThriftJobSummary setReduceProgress(double reduceProgress) {
+    this.reduceProgress = reduceProgress;
+    setReduceProgressIsSet(true);
+    return this;
+  }
+
+  public void unsetReduceProgress() {
+    __isset_bit_vector.clear(__REDUCEPROGRESS_ISSET_ID);
+  }
+
+  /** Returns true if field reduceProgress is set (has been asigned a value) and false otherwise */
+  public boolean isSetReduceProgress() {
+    return __isset_bit_vector.get(__REDUCEPROGRESS_ISSET_ID);
+  }
+
+  public void setReduceProgressIsSet(boolean value) {
+    __isset_bit_vector.set(__REDUCEPROGRESS_ISSET_ID, value);
+  }
+
+  public int getDesiredMaps() {
+    return this.desiredMaps;
+  }
+
+  public ThriftJobSummary setDesiredMaps(int desiredMaps) {
+    this.desiredMaps = desiredMaps;
+    setDesiredMapsIsSet(true);
+    return this;
+  }
+
+  public void unsetDesiredMaps() {
+    __isset_bit_vector.clear(__DESIREDMAPS_ISSET_ID);
+  }
+
+  /** Returns true if field desiredMaps is set (has been asigned a value) and false otherwise */
+  public boolean isSetDesiredMaps() {
+    return __isset_bit_vector.get(__DESIREDMAPS_ISSET_ID);
+  }
+
+  public void setDesiredMapsIsSet(boolean value) {
+    __isset_bit_vector.set(__DESIREDMAPS_ISSET_ID, value);
+  }
+
+  public int getDesiredReduces() {
+    return this.desiredReduces;
+  }
+
+  public ThriftJobSummary setDesiredReduces(int desiredReduces) {
+    this.desiredReduces = desiredReduces;
+    setDesiredReducesIsSet(true);
+    return this;
+  }
+
+  public void unsetDesiredReduces() {
+    __isset_bit_vector.clear(__DESIREDREDUCES_ISSET_ID);
+  }
+
+  /** Returns true if field desiredReduces is set (has been asigned a value) and false otherwise */
+  public boolean isSetDesiredReduces() {
+    return __isset_bit_vector.get(__DESIREDREDUCES_ISSET_ID);
+  }
+
+  public void setDesiredReducesIsSet(boolean value) {
+    __isset_bit_vector.set(__DESIREDREDUCES_ISSET_ID, value);
+  }
+
+  public int getFinishedMaps() {
+    return this.finishedMaps;
+  }
+
+  public ThriftJobSummary setFinishedMaps(int finishedMaps) {
+    this.finishedMaps = finishedMaps;
+    setFinishedMapsIsSet(true);
+    return this;
+  }
+
+  public void unsetFinishedMaps() {
+    __isset_bit_vector.clear(__FINISHEDMAPS_ISSET_ID);
+  }
+
+  /** Returns true if field finishedMaps is set (has been asigned a value) and false otherwise */
+  public boolean isSetFinishedMaps() {
+    return __isset_bit_vector.get(__FINISHEDMAPS_ISSET_ID);
+  }
+
+  public void setFinishedMapsIsSet(boolean value) {
+    __isset_bit_vector.set(__FINISHEDMAPS_ISSET_ID, value);
+  }
+
+  public int getFinishedReduces() {
+    return this.finishedReduces;
+  }
+
+  public ThriftJobSummary setFinishedReduces(int finishedReduces) {
+    this.finishedReduces = finishedReduces;
+    setFinishedReducesIsSet(true);
+    return this;
+  }
+
+  public void unsetFinishedReduces() {
+    __isset_bit_vector.clear(__FINISHEDREDUCES_ISSET_ID);
+  }
+
+  /** Returns true if field finishedReduces is set (has been asigned a value) and false otherwise */
+  public boolean isSetFinishedReduces() {
+    return __isset_bit_vector.get(__FINISHEDREDUCES_ISSET_ID);
+  }
+
+  public void setFinishedReducesIsSet(boolean value) {
+    __isset_bit_vector.set(__FINISHEDREDUCES_ISSET_ID, value);
+  }
+
+  public long getStartTime() {
+    return this.startTime;
+  }
+
+  public ThriftJobSummary setStartTime(long startTime) {
+    this.startTime = startTime;
+    setStartTimeIsSet(true);
+    return this;
+  }
+
+  public void unsetStartTime() {
+    __isset_bit_vector.clear(__STARTTIME_ISSET_ID);
+  }
+
+  /** Returns true if field startTime is set (has been asigned a value) and false otherwise */
+  public boolean isSetStartTime() {
+    return __isset_bit_vector.get(__STARTTIME_ISSET_ID);
+  }
+
+  public void setStartTimeIsSet(boolean value) {
+    __isset_bit_vector.set(__STARTTIME_ISSET_ID, value);
+  }
+
+  public long getFinishTime() {
+    return this.finishTime;
+  }
+
+  public ThriftJobSummary setFinishTime(long finishTime) {
+    this.finishTime = finishTime;
+    setFinishTimeIsSet(true);
+    return this;
+  }
+
+  public void unsetFinishTime() {
+    __isset_bit_vector.clear(__FINISHTIME_ISSET_ID);
+  }
+
+  /** Returns true if field finishTime is set (has been asigned a value) and false otherwise */
+  public boolean isSetFinishTime() {
+    return __isset_bit_vector.get(__FINISHTIME_ISSET_ID);
+  }
+
+  public void setFinishTimeIsSet(boolean value) {
+    __isset_bit_vector.set(__FINISHTIME_ISSET_ID, value);
+  }
+
+  public void setFieldValue(_Fields field, Object value) {
+    switch (field) {
+    case JOB_ID:
+      if (value == null) {
+        unsetJobID();
+      } else {
+        setJobID((ThriftJobID)value);
+      }
+      break;
+
+    case NAME:
+      if (value == null) {
+        unsetName();
+      } else {
+        setName((String)value);
+      }
+      break;
+
+    case USER:
+      if (value == null) {
+        unsetUser();
+      } else {
+        setUser((String)value);
+      }
+      break;
+
+    case QUEUE_NAME:
+      if (value == null) {
+        unsetQueueName();
+      } else {
+        setQueueName((String)value);
+      }
+      break;
+
+    case RUN_STATE:
+      if (value == null) {
+        unsetRunState();
+      } else {
+        setRunState((ThriftJobState)value);
+      }
+      break;
+
+    case PRIORITY:
+      if (value == null) {
+        unsetPriority();
+      } else {
+        setPriority((ThriftJobPriority)value);
+      }
+      break;
+
+    case MAP_PROGRESS:
+      if (value == null) {
+        unsetMapProgress();
+      } else {
+        setMapProgress((Double)value);
+      }
+      break;
+
+    case REDUCE_PROGRESS:
+      if (value == null) {
+        unsetReduceProgress();
+      } else {
+        setReduceProgress((Double)value);
+      }
+      break;
+
+    case DESIRED_MAPS:
+      if (value == null) {
+        unsetDesiredMaps();
+      } else {
+        setDesiredMaps((Integer)value);
+      }
+      break;
+
+    case DESIRED_REDUCES:
+      if (value == null) {
+        unsetDesiredReduces();
+      } else {
+        setDesiredReduces((Integer)value);
+      }
+      break;
+
+    case FINISHED_MAPS:
+      if (value == null) {
+        unsetFinishedMaps();
+      } else {
+        setFinishedMaps((Integer)value);
+      }
+      break;
+
+    case FINISHED_REDUCES:
+      if (value == null) {
+        unsetFinishedReduces();
+      } else {
+        setFinishedReduces((Integer)value);
+      }
+      break;
+
+    case START_TIME:
+      if (value == null) {
+        unsetStartTime();
+      } else {
+        setStartTime((Long)value);
+      }
+      break;
+
+    case FINISH_TIME:
+      if (value == null) {
+        unsetFinishTime();
+      } else {
+        setFinishTime((Long)value);
+      }
+      break;
+
+    }
+  }
+
+  public void setFieldValue(int fieldID, Object value) {
+    setFieldValue(_Fields.findByThriftIdOrThrow(fieldID), value);
+  }
+
+  public Object getFieldValue(_Fields field) {
+    switch (field) {
+    case JOB_ID:
+      return getJobID();
+
+    case NAME:
+      return getName();
+
+    case USER:
+      return getUser();
+
+    case QUEUE_NAME:
+      return getQueueName();
+
+    case RUN_STATE:
+      return getRunState();
+
+    case PRIORITY:
+      return getPriority();
+
+    case MAP_PROGRESS:
+      return new Double(getMapProgress());
+
+    case REDUCE_PROGRESS:
+      return new Double(getReduceProgress());
+
+    case DESIRED_MAPS:
+      return new Integer(getDesiredMaps());
+
+    case DESIRED_REDUCES:
+      return new Integer(getDesiredReduces());
+
+    case FINISHED_MAPS:
+      return new Integer(getFinishedMaps());
+
+    case FINISHED_REDUCES:
+      return new Integer(getFinishedReduces());
+
+    case START_TIME:
+      return new Long(getStartTime());
+
+    case FINISH_TIME:
+      return new Long(getFinishTime());
+
+    }
+    throw new IllegalStateException();
+  }
+
+  public Object getFieldValue(int fieldId) {
+    return getFieldValue(_Fields.findByThriftIdOrThrow(fieldId));
+  }
+
+  /** Returns true if field corresponding to fieldID is set (has been asigned a value) and false otherwise */
+  public boolean isSet(_Fields field) {
+    switch (field) {
+    case JOB_ID:
+      return isSetJobID();
+    case NAME:
+      return isSetName();
+    case USER:
+      return isSetUser();
+    case QUEUE_NAME:
+      return isSetQueueName();
+    case RUN_STATE:
+      return isSetRunState();
+    case PRIORITY:
+      return isSetPriority();
+    case MAP_PROGRESS:
+      return isSetMapProgress();
+    case REDUCE_PROGRESS:
+      return isSetReduceProgress();
+    case DESIRED_MAPS:
+      return isSetDesiredMaps();
+    case DESIRED_REDUCES:
+      return isSetDesiredReduces();
+    case FINISHED_MAPS:
+      return isSetFinishedMaps();
+    case FINISHED_REDUCES:
+      return isSetFinishedReduces();
+    case START_TIME:
+      return isSetStartTime();
+    case FINISH_TIME:
+      return isSetFinishTime();
+    }
+    throw new IllegalStateException();
+  }
+
+  public boolean isSet(int fieldID) {
+    return isSet(_Fields.findByThriftIdOrThrow(fieldID));
+  }
+
+  @Override
+  public boolean equals(Object that) {
+    if (that == null)
+      return false;
+    if (that instanceof ThriftJobSummary)
+      return this.equals((ThriftJobSummary)that);
+    return false;
+  }
+
+  public boolean equals(ThriftJobSummary that) {
+    if (that == null)
+      return false;
+
+    boolean this_present_jobID = true && this.isSetJobID();
+    boolean that_present_jobID = true && that.isSetJobID();
+    if (this_present_jobID || that_present_jobID) {
+      if (!(this_present_jobID && that_present_jobID))
+        return false;
+      if (!this.jobID.equals(that.jobID))
+        return false;
+    }
+
+    boolean this_present_name = true && this.isSetName();
+    boolean that_present_name = true && that.isSetName();
+    if (this_present_name || that_present_name) {
+      if (!(this_present_name && that_present_name))
+        return false;
+      if (!this.name.equals(that.name))
+        return false;
+    }
+
+    boolean this_present_user = true && this.isSetUser();
+    boolean that_present_user = true && that.isSetUser();
+    if (this_present_user || that_present_user) {
+      if (!(this_present_user && that_present_user))
+        return false;
+      if (!this.user.equals(that.user))
+        return false;
+    }
+
+    boolean this_present_queueName = true && this.isSetQueueName();
+    boolean that_present_queueName = true && that.isSetQueueName();
+    if (this_present_queueName || that_present_queueName) {
+      if (!(this_present_queueName && that_present_queueName))
+        return false;
+      if (!this.queueName.equals(that.queueName))
+        return false;
+    }
+
+    boolean this_present_runState = true && this.isSetRunState();
+    boolean that_present_runState = true && that.isSetRunState();
+    if (this_present_runState || that_present_runState) {
+      if (!(this_present_runState && that_present_runState))
+        return false;
+      if (!this.runState.equals(that.runState))
+        return false;
+    }
+
+    boolean this_present_priority = true && this.isSetPriority();
+    boolean that_present_priority = true && that.isSetPriority();
+    if (this_present_priority || that_present_priority) {
+      if (!(this_present_priority && that_present_priority))
+        return false;
+      if (!this.priority.equals(that.priority))
+        return false;
+    }
+
+    boolean this_present_mapProgress = true;
+    boolean that_present_mapProgress = true;
+    if (this_present_mapProgress || that_present_mapProgress) {
+      if (!(this_present_mapProgress && that_present_mapProgress))
+        return false;
+      if (this.mapProgress != that.mapProgress)
+        return false;
+    }
+
+    boolean this_present_reduceProgress = true;
+    boolean that_present_reduceProgress = true;
+    if (this_present_reduceProgress || that_present_reduceProgress) {
+      if (!(this_present_reduceProgress && that_present_reduceProgress))
+        return false;
+      if (this.reduceProgress != that.reduceProgress)
+        return false;
+    }
+
+    boolean this_present_desiredMaps = true;
+    boolean that_present_desiredMaps = true;
+    if (this_present_desiredMaps || that_present_desiredMaps) {
+      if (!(this_present_desiredMaps && that_present_desiredMaps))
+        return false;
+      if (this.desiredMaps != that.desiredMaps)
+        return false;
+    }
+
+    boolean this_present_desiredReduces = true;
+    boolean that_present_desiredReduces = true;
+    if (this_present_desiredReduces || that_present_desiredReduces) {
+      if (!(this_present_desiredReduces && that_present_desiredReduces))
+        return false;
+      if (this.desiredReduces != that.desiredReduces)
+        return false;
+    }
+
+    boolean this_present_finishedMaps = true;
+    boolean that_present_finishedMaps = true;
+    if (this_present_finishedMaps || that_present_finishedMaps) {
+      if (!(this_present_finishedMaps && that_present_finishedMaps))
+        return false;
+      if (this.finishedMaps != that.finishedMaps)
+        return false;
+    }
+
+    boolean this_present_finishedReduces = true;
+    boolean that_present_finishedReduces = true;
+    if (this_present_finishedReduces || that_present_finishedReduces) {
+      if (!(this_present_finishedReduces && that_present_finishedReduces))
+        return false;
+      if (this.finishedReduces != that.finishedReduces)
+        return false;
+    }
+
+    boolean this_present_startTime = true;
+    boolean that_present_startTime = true;
+    if (this_present_startTime || that_present_startTime) {
+      if (!(this_present_startTime && that_present_startTime))
+        return false;
+      if (this.startTime != that.startTime)
+        return false;
+    }
+
+    boolean this_present_finishTime = true;
+    boolean that_present_finishTime = true;
+    if (this_present_finishTime || that_present_finishTime) {
+      if (!(this_present_finishTime && that_present_finishTime))
+        return false;
+      if (this.finishTime != that.finishTime)
+        return false;
+    }
+
+    return true;
+  }
+
+  @Override
+  public int hashCode() {
+    return 0;
+  }
+
+  public int compareTo(ThriftJobSummary other) {
+    if (!getClass().equals(other.getClass())) {
+      return getClass().getName().compareTo(other.getClass().getName());
+    }
+
+    int lastComparison = 0;
+    ThriftJobSummary typedOther = (ThriftJobSummary)other;
+
+    lastComparison = Boolean.valueOf(isSetJobID()).compareTo(isSetJobID());
+    if (lastComparison != 0) {
+      return lastComparison;
+    }
+    lastComparison = TBaseHelper.compareTo(jobID, typedOther.jobID);
+    if (lastComparison != 0) {
+      return lastComparison;
+    }
+    lastComparison = Boolean.valueOf(isSetName()).compareTo(isSetName());
+    if (lastComparison != 0) {
+      return lastComparison;
+    }
+    lastComparison = TBaseHelper.compareTo(name, typedOther.name);
+    if (lastComparison != 0) {
+      return lastComparison;
+    }
+    lastComparison = Boolean.valueOf(isSetUser()).compareTo(isSetUser());
+    if (lastComparison != 0) {
+      return lastComparison;
+    }
+    lastComparison = TBaseHelper.compareTo(user, typedOther.user);
+    if (lastComparison != 0) {
+      return lastComparison;
+    }
+    lastComparison = Boolean.valueOf(isSetQueueName()).compareTo(isSetQueueName());
+    if (lastComparison != 0) {
+      return lastComparison;
+    }
+    lastComparison = TBaseHelper.compareTo(queueName, typedOther.queueName);
+    if (lastComparison != 0) {
+      return lastComparison;
+    }
+    lastComparison = Boolean.valueOf(isSetRunState()).compareTo(isSetRunState());
+    if (lastComparison != 0) {
+      return lastComparison;
+    }
+    lastComparison = TBaseHelper.compareTo(runState, typedOther.runState);
+    if (lastComparison != 0) {
+      return lastComparison;
+    }
+    lastComparison = Boolean.valueOf(isSetPriority()).compareTo(isSetPriority());
+    if (lastComparison != 0) {
+      return lastComparison;
+    }
+    lastComparison = TBaseHelper.compareTo(priority, typedOther.priority);
+    if (lastComparison != 0) {
+      return lastComparison;
+    }
+    lastComparison = Boolean.valueOf(isSetMapProgress()).compareTo(isSetMapProgress());
+    if (lastComparison != 0) {
+      return lastComparison;
+    }
+    lastComparison = TBaseHelper.compareTo(mapProgress, typedOther.mapProgress);
+    if (lastComparison != 0) {
+      return lastComparison;
+    }
+    lastComparison = Boolean.valueOf(isSetReduceProgress()).compareTo(isSetReduceProgress());
+    if (lastComparison != 0) {
+      return lastComparison;
+    }
+    lastComparison = TBaseHelper.compareTo(reduceProgress, typedOther.reduceProgress);
+    if (lastComparison != 0) {
+      return lastComparison;
+    }
+    lastComparison = Boolean.valueOf(isSetDesiredMaps()).compareTo(isSetDesiredMaps());
+    if (lastComparison != 0) {
+      return lastComparison;
+    }
+    lastComparison = TBaseHelper.compareTo(desiredMaps, typedOther.desiredMaps);
+    if (lastComparison != 0) {
+      return lastComparison;
+    }
+    lastComparison = Boolean.valueOf(isSetDesiredReduces()).compareTo(isSetDesiredReduces());
+    if (lastComparison != 0) {
+      return lastComparison;
+    }
+    lastComparison = TBaseHelper.compareTo(desiredReduces, typedOther.desiredReduces);
+    if (lastComparison != 0) {
+      return lastComparison;
+    }
+    lastComparison = Boolean.valueOf(isSetFinishedMaps()).compareTo(isSetFinishedMaps());
+    if (lastComparison != 0) {
+      return lastComparison;
+    }
+    lastComparison = TBaseHelper.compareTo(finishedMaps, typedOther.finishedMaps);
+    if (lastComparison != 0) {
+      return lastComparison;
+    }
+    lastComparison = Boolean.valueOf(isSetFinishedReduces()).compareTo(isSetFinishedReduces());
+    if (lastComparison != 0) {
+      return lastComparison;
+    }
+    lastComparison = TBaseHelper.compareTo(finishedReduces, typedOther.finishedReduces);
+    if (lastComparison != 0) {
+      return lastComparison;
+    }
+    lastComparison = Boolean.valueOf(isSetStartTime()).compareTo(isSetStartTime());
+    if (lastComparison != 0) {
+      return lastComparison;
+    }
+    lastComparison = TBaseHelper.compareTo(startTime, typedOther.startTime);
+    if (lastComparison != 0) {
+      return lastComparison;
+    }
+    lastComparison = Boolean.valueOf(isSetFinishTime()).compareTo(isSetFinishTime());
+    if (lastComparison != 0) {
+      return lastComparison;
+    }
+    lastComparison = TBaseHelper.compareTo(finishTime, typedOther.finishTime);
+    if (lastComparison != 0) {
+      return lastComparison;
+    }
+    return 0;
+  }
+
+  public void read(TProtocol iprot) throws TException {
+    TField field;
+    iprot.readStructBegin();
+    while (true)
+    {
+      field = iprot.readFieldBegin();
+      if (field.type == TType.STOP) { 
+        break;
+      }
+      _Fields fieldId = _Fields.findByThriftId(field.id);
+      if (fieldId == null) {
+        TProtocolUtil.skip(iprot, field.type);
+      } else {
+        switch (fieldId) {
+          case JOB_ID:
+            if (field.type == TType.STRUCT) {
+              this.jobID = new ThriftJobID();
+              this.jobID.read(iprot);
+            } else { 
+              TProtocolUtil.skip(iprot, field.type);
+            }
+            break;
+          case NAME:
+            if (field.type == TType.STRING) {
+              this.name = iprot.readString();
+            } else { 
+              TProtocolUtil.skip(iprot, field.type);
+            }
+            break;
+          case USER:
+            if (field.type == TType.STRING) {
+              this.user = iprot.readString();
+            } else { 
+              TProtocolUtil.skip(iprot, field.type);
+            }
+            break;
+          case QUEUE_NAME:
+            if (field.type == TType.STRING) {
+              this.queueName = iprot.readString();
+            } else { 
+              TProtocolUtil.skip(iprot, field.type);
+            }
+            break;
+          case RUN_STATE:
+            if (field.type == TType.I32) {
+              this.runState = ThriftJobState.findByValue(iprot.readI32());
+            } else { 
+              TProtocolUtil.skip(iprot, field.type);
+            }
+            break;
+          case PRIORITY:
+            if (field.type == TType.I32) {
+              this.priority = ThriftJobPriority.findByValue(iprot.readI32());
+            } else { 
+              TProtocolUtil.skip(iprot, field.type);
+            }
+            break;
+          case MAP_PROGRESS:
+            if (field.type == TType.DOUBLE) {
+              this.mapProgress = iprot.readDouble();
+              setMapProgressIsSet(true);
+            } else { 
+              TProtocolUtil.skip(iprot, field.type);
+            }
+            break;
+          case REDUCE_PROGRESS:
+            if (field.type == TType.DOUBLE) {
+              this.reduceProgress = iprot.readDouble();
+              setReduceProgressIsSet(true);
+            } else { 
+              TProtocolUtil.skip(iprot, field.type);
+            }
+            break;
+          case DESIRED_MAPS:
+            if (field.type == TType.I32) {
+              this.desiredMaps = iprot.readI32();
+              setDesiredMapsIsSet(true);
+            } else { 
+              TProtocolUtil.skip(iprot, field.type);
+            }
+            break;
+          case DESIRED_REDUCES:
+            if (field.type == TType.I32) {
+              this.desiredReduces = iprot.readI32();
+              setDesiredReducesIsSet(true);
+            } else { 
+              TProtocolUtil.skip(iprot, field.type);
+            }
+            break;
+          case FINISHED_MAPS:
+            if (field.type == TType.I32) {
+              this.finishedMaps = iprot.readI32();
+              setFinishedMapsIsSet(true);
+            } else { 
+              TProtocolUtil.skip(iprot, field.type);
+            }
+            break;
+          case FINISHED_REDUCES:
+            if (field.type == TType.I32) {
+              this.finishedReduces = iprot.readI32();
+              setFinishedReducesIsSet(true);
+            } else { 
+              TProtocolUtil.skip(iprot, field.type);
+            }
+            break;
+          case START_TIME:
+            if (field.type == TType.I64) {
+              this.startTime = iprot.readI64();
+              setStartTimeIsSet(true);
+            } else { 
+              TProtocolUtil.skip(iprot, field.type);
+            }
+            break;
+          case FINISH_TIME:
+            if (field.type == TType.I64) {
+              this.finishTime = iprot.readI64();
+              setFinishTimeIsSet(true);
+            } else { 
+              TProtocolUtil.skip(iprot, field.type);
+            }
+            break;
+        }
+        iprot.readFieldEnd();
+      }
+    }
+    iprot.readStructEnd();
+
+    // check for required fields of primitive type, which can't be checked in the validate method
+    validate();
+  }
+
+  public void write(TProtocol oprot) throws TException {
+    validate();
+
+    oprot.writeStructBegin(STRUCT_DESC);
+    if (this.jobID != null) {
+      oprot.writeFieldBegin(JOB_ID_FIELD_DESC);
+      this.jobID.write(oprot);
+      oprot.writeFieldEnd();
+    }
+    if (this.name != null) {
+      oprot.writeFieldBegin(NAME_FIELD_DESC);
+      oprot.writeString(this.name);
+      oprot.writeFieldEnd();
+    }
+    if (this.user != null) {
+      oprot.writeFieldBegin(USER_FIELD_DESC);
+      oprot.writeString(this.user);
+      oprot.writeFieldEnd();
+    }
+    if (this.queueName != null) {
+      oprot.writeFieldBegin(QUEUE_NAME_FIELD_DESC);
+      oprot.writeString(this.queueName);
+      oprot.writeFieldEnd();
+    }
+    if (this.runState != null) {
+      oprot.writeFieldBegin(RUN_STATE_FIELD_DESC);
+      oprot.writeI32(this.runState.getValue());
+      oprot.writeFieldEnd();
+    }
+    if (this.priority != null) {
+      oprot.writeFieldBegin(PRIORITY_FIELD_DESC);
+      oprot.writeI32(this.priority.getValue());
+      oprot.writeFieldEnd();
+    }
+    oprot.writeFieldBegin(MAP_PROGRESS_FIELD_DESC);
+    oprot.writeDouble(this.mapProgress);
+    oprot.writeFieldEnd();
+    oprot.writeFieldBegin(REDUCE_PROGRESS_FIELD_DESC);
+    oprot.writeDouble(this.reduceProgress);
+    oprot.writeFieldEnd();
+    oprot.writeFieldBegin(DESIRED_MAPS_FIELD_DESC);
+    oprot.writeI32(this.desiredMaps);
+    oprot.writeFieldEnd();
+    oprot.writeFieldBegin(DESIRED_REDUCES_FIELD_DESC);
+    oprot.writeI32(this.desiredReduces);
+    oprot.writeFieldEnd();
+    oprot.writeFieldBegin(FINISHED_MAPS_FIELD_DESC);
+    oprot.writeI32(this.finishedMaps);
+    oprot.writeFieldEnd();
+    oprot.writeFieldBegin(FINISHED_REDUCES_FIELD_DESC);
+    oprot.writeI32(this.finishedReduces);
+    oprot.writeFieldEnd();
+    oprot.writeFieldBegin(START_TIME_FIELD_DESC);
+    oprot.writeI64(this.startTime);
+    oprot.writeFieldEnd();
+    oprot.writeFieldBegin(FINISH_TIME_FIELD_DESC);
+    oprot.writeI64(this.finishTime);
+    oprot.writeFieldEnd();
+    oprot.writeFieldStop();
+    oprot.writeStructEnd();
+  }
+
+  @Override
+  public String toString() {
+    StringBuilder sb = new StringBuilder("ThriftJobSummary(");
+    boolean first = true;
+
+    sb.append("jobID:");
+    if (this.jobID == null) {
+      sb.append("null");
+    } else {
+      sb.append(this.jobID);
+    }
+    first = false;
+    if (!first) sb.append(", ");
+    sb.append("name:");
+    if (this.name == null) {
+      sb.append("null");
+    } else {
+      sb.append(this.name);
+    }
+    first = false;
+    if (!first) sb.append(", ");
+    sb.append("user:");
+    if (this.user == null) {
+      sb.append("null");
+    } else {
+      sb.append(this.user);
+    }
+    first = false;
+    if (!first) sb.append(", ");
+    sb.append("queueName:");
+    if (this.queueName == null) {
+      sb.append("null");
+    } else {
+      sb.append(this.queueName);
+    }
+    first = false;
+    if (!first) sb.append(", ");
+    sb.append("runState:");
+    if (this.runState == null) {
+      sb.append("null");
+    } else {
+      String runState_name = runState.name();
+      if (runState_name != null) {
+        sb.append(runState_name);
+        sb.append(" (");
+      }
+      sb.append(this.runState);
+      if (runState_name != null) {
+        sb.append(")");
+      }
+    }
+    first = false;
+    if (!first) sb.append(", ");
+    sb.append("priority:");
+    if (this.priority == null) {
+      sb.append("null");
+    } else {
+      String priority_name = priority.name();
+      if (priority_name != null) {
+        sb.append(priority_name);
+        sb.append(" (");
+      }
+      sb.append(this.priority);
+      if (priority_name != null) {
+        sb.append(")");
+      }
+    }
+    first = false;
+    if (!first) sb.append(", ");
+    sb.append("mapProgress:");
+    sb.append(this.mapProgress);
+    first = false;
+    if (!first) sb.append(", ");
+    sb.append("reduceProgress:");
+    sb.append(this.reduceProgress);
+    first = false;
+    if (!first) sb.append(", ");
+    sb.append("desiredMaps:");
+    sb.append(this.desiredMaps);
+    first = false;
+    if (!first) sb.append(", ");
+    sb.append("desiredReduces:");
+    sb.append(this.desiredReduces);
+    first = false;
+    if (!first) sb.append(", ");
+    sb.append("finishedMaps:");
+    sb.append(this.finishedMaps);
+    first = false;
+    if (!first) sb.append(", ");
+    sb.append("finishedReduces:");
+    sb.append(this.finishedReduces);
+    first = false;
+    if (!first) sb.append(", ");
+    sb.append("startTime:");
+    sb.append(this.startTime);
+    first = false;
+    if (!first) sb.append(", ");
+    sb.append("finishTime:");
+    sb.append(this.finishTime);
+    first = false;
+    sb.append(")");
+    return sb.toString();
+  }
+
+  public void validate() throws TException {
+    // check for required fields
+  }
+
+}
+
@@ -0,0 +1,442 @@
+/**
+ * Autogenerated by Thrift
+ *
+ * DO NOT EDIT UNLESS YOU ARE SURE THAT YOU KNOW WHAT YOU ARE DOING
+ */
+package org.apache.hadoop.thriftfs.jobtracker.api;
+
+import java.util.List;
+import java.util.ArrayList;
+import java.util.Map;
+import java.util.HashMap;
+import java.util.EnumMap;
+import java.util.Set;
+import java.util.HashSet;
+import java.util.EnumSet;
+import java.util.Collections;
+import java.util.BitSet;
+import java.util.Arrays;
+import org.slf4j.Logger;
+import org.slf4j.LoggerFactory;
+
+import org.apache.thrift.*;
+import org.apache.thrift.meta_data.*;
+import org.apache.thrift.protocol.*;
+
+/**
+ * A page of job summaries (see getJobSummaries)
+ */
+public class ThriftJobSummaryList implements TBase<ThriftJobSummaryList._Fields>, java.io.Serializable, Cloneable, Comparable<ThriftJobSummaryList> {
+  private static final TStruct STRUCT_DESC = new TStruct("ThriftJobSummaryList");
+
+  private static final TField JOBS_FIELD_DESC = new TField("jobs", TType.LIST, (short)1);
+  private static final TField NUM_TOTAL_JOBS_FIELD_DESC = new TField("numTotalJobs", TType.I32, (short)2);
+
+  public List<ThriftJobSummary> jobs;
+  /**
+   * The total number of jobs matching
+   */
+  public int numTotalJobs;
+
+  /** The set of fields this struct contains, along with convenience methods for finding and manipulating them. */
+  public enum _Fields implements TFieldIdEnum {
+    JOBS((short)1, "jobs"),
+    /**
+     * The total number of jobs matching
+     */
+    NUM_TOTAL_JOBS((short)2, "numTotalJobs");
+
+    private static final Map<Integer, _Fields> byId = new HashMap<Integer, _Fields>();
+    private static final Map<String, _Fields> byName = new HashMap<String, _Fields>();
+
+    static {
+      for (_Fields field : EnumSet.allOf(_Fields.class)) {
+        byId.put((int)field._thriftId, field);
+        byName.put(field.getFieldName(), field);
+      }
+    }
+
+    /**
+     * Find the _Fields constant that matches fieldId, or null if its not found.
+     */
+    public static _Fields findByThriftId(int fieldId) {
+      return byId.get(fieldId);
+    }
+
+    /**
+     * Find the _Fields constant that matches fieldId, throwing an exception
+     * if it is not found.
+     */
+    public static _Fields findByThriftIdOrThrow(int fieldId) {
+      _Fields fields = findByThriftId(fieldId);
+      if (fields == null) throw new IllegalArgumentException("Field " + fieldId + " doesn't exist!");
+      return fields;
+    }
+
+    /**
+     * Find the _Fields constant that matches name, or null if its not found.
+     */
+    public static _Fields findByName(String name) {
+      return byName.get(name);
+    }
+
+    private final short _thriftId;
+    private final String _fieldName;
+
+    _Fields(short thriftId, String fieldName) {
+      _thriftId = thriftId;
+      _fieldName = fieldName;
+    }
+
+    public short getThriftFieldId() {
+      return _thriftId;
+    }
+
+    public String getFieldName() {
+      return _fieldName;
+    }
+  }
+
+  // isset id assignments
+  private static final int __NUMTOTALJOBS_ISSET_ID = 0;
+  private BitSet __isset_bit_vector = new BitSet(1);
+
+  public static final Map<_Fields, FieldMetaData> metaDataMap = Collections.unmodifiableMap(new EnumMap<_Fields, FieldMetaData>(_Fields.class) {{
+    put(_Fields.JOBS, new FieldMetaData("jobs", TFieldRequirementType.DEFAULT, 
+        new ListMetaData(TType.LIST, 
+            new StructMetaData(TType.STRUCT, ThriftJobSummary.class))));
+    put(_Fields.NUM_TOTAL_JOBS, new FieldMetaData("numTotalJobs", TFieldRequirementType.DEFAULT, 
+        new FieldValueMetaData(TType.I32)));
+  }});
+
+  static {
+    FieldMetaData.addStructMetaDataMap(ThriftJobSummaryList.class, metaDataMap);
+  }
+
+  public ThriftJobSummaryList() {
+  }
+
+  public ThriftJobSummaryList(
+    List<ThriftJobSummary> jobs,
+    int numTotalJobs)
+  {
+    this();
+    this.jobs = jobs;
+    this.numTotalJobs = numTotalJobs;
+    setNumTotalJobsIsSet(true);
+  }
+
+  /**
+   * Performs a deep copy on <i>other</i>.
+   */
+  public ThriftJobSummaryList(ThriftJobSummaryList other) {
+    __isset_bit_vector.clear();
+    __isset_bit_vector.or(other.__isset_bit_vector);
+    if (other.isSetJobs()) {
+      List<ThriftJobSummary> __this__jobs = new ArrayList<ThriftJobSummary>();
+      for (ThriftJobSummary other_element : other.jobs) {
+        __this__jobs.add(new ThriftJobSummary(other_element));
+      }
+      this.jobs = __this__jobs;
+    }
+    this.numTotalJobs = other.numTotalJobs;
+  }
+
+  public ThriftJobSummaryList deepCopy() {
+    return new ThriftJobSummaryList(this);
+  }
+
+  @Deprecated
+  public ThriftJobSummaryList clone() {
+    return new ThriftJobSummaryList(this);
+  }
+
+  public int getJobsSize() {
+    return (this.jobs == null) ? 0 : this.jobs.size();
+  }
+
+  public java.util.Iterator<ThriftJobSummary> getJobsIterator() {
+    return (this.jobs == null) ? null : this.jobs.iterator();
+  }
+
+  public void addToJobs(ThriftJobSummary elem) {
+    if (this.jobs == null) {
+      this.jobs = new ArrayList<ThriftJobSummary>();
+    }
+    this.jobs.add(elem);
+  }
+
+  public List<ThriftJobSummary> getJobs() {
+    return this.jobs;
+  }
+
+  public ThriftJobSummaryList setJobs(List<ThriftJobSummary> jobs) {
+    this.jobs = jobs;
+    return this;
+  }
+
+  public void unsetJobs() {
+    this.jobs = null;
+  }
+
+  /** Returns true if field jobs is set (has been asigned a value) and false otherwise */
+  public boolean isSetJobs() {
+    return this.jobs != null;
+  }
+
+  public void setJobsIsSet(boolean value) {
+    if (!value) {
+      this.jobs = null;
+    }
+  }
+
+  /**
+   * The total number of jobs matching
+   */
+  public int getNumTotalJobs() {
+    return this.numTotalJobs;
+  }
+
+  /**
+   * The total number of jobs matching
+   */
+  public ThriftJobSummaryList setNumTotalJobs(int numTotalJobs) {
+    this.numTotalJobs = numTotalJobs;
+    setNumTotalJobsIsSet(true);
+    return this;
+  }
+
+  public void unsetNumTotalJobs() {
+    __isset_bit_vector.clear(__NUMTOTALJOBS_ISSET_ID);
+  }
+
+  /** Returns true if field numTotalJobs is set (has been asigned a value) and false otherwise */
+  public boolean isSetNumTotalJobs() {
+    return __isset_bit_vector.get(__NUMTOTALJOBS_ISSET_ID);
+  }
+
+  public void setNumTotalJobsIsSet(boolean value) {
+    __isset_bit_vector.set(__NUMTOTALJOBS_ISSET_ID, value);
+  }
+
+  public void setFieldValue(_Fields field, Object value) {
+    switch (field) {
+    case JOBS:
+      if (value == null) {
+        unsetJobs();
+      } else {
+        setJobs((List<ThriftJobSummary>)value);
+      }
+      break;
+
+    case NUM_TOTAL_JOBS:
+      if (value == null) {
+        unsetNumTotalJobs();
+      } else {
+        setNumTotalJobs((Integer)value);
+      }
+      break;
+
+    }
+  }
+
+  public void setFieldValue(int fieldID, Object value) {
+    setFieldValue(_Fields.findByThriftIdOrThrow(fieldID), value);
+  }
+
+  public Object getFieldValue(_Fields field) {
+    switch (field) {
+    case JOBS:
+      return getJobs();
+
+    case NUM_TOTAL_JOBS:
+      return new Integer(getNumTotalJobs());
+
+    }
+    throw new IllegalStateException();
+  }
+
+  public Object getFieldValue(int fieldId) {
+    return getFieldValue(_Fields.findByThriftIdOrThrow(fieldId));
+  }
+
+  /** Returns true if field corresponding to fieldID is set (has been asigned a value) and false otherwise */
+  public boolean isSet(_Fields field) {
+    switch (field) {
+    case JOBS:
+      return isSetJobs();
+    case NUM_TOTAL_JOBS:
+      return isSetNumTotalJobs();
+    }
+    throw new IllegalStateException();
+  }
+
+  public boolean isSet(int fieldID) {
+    return isSet(_Fields.findByThriftIdOrThrow(fieldID));
+  }
+
+  @Override
+  public boolean equals(Object that) {
+    if (that == null)
+      return false;
+    if (that instanceof ThriftJobSummaryList)
+      return this.equals((ThriftJobSummaryList)that);
+    return false;
+  }
+
+  public boolean equals(ThriftJobSummaryList that) {
+    if (that == null)
+      return false;
+
+    boolean this_present_jobs = true && this.isSetJobs();
+    boolean that_present_jobs = true && that.isSetJobs();
+    if (this_present_jobs || that_present_jobs) {
+      if (!(this_present_jobs && that_present_jobs))
+        return false;
+      if (!this.jobs.equals(that.jobs))
+        return false;
+    }
+
+    boolean this_present_numTotalJobs = true;
+    boolean that_present_numTotalJobs = true;
+    if (this_present_numTotalJobs || that_present_numTotalJobs) {
+      if (!(this_present_numTotalJobs && that_present_numTotalJobs))
+        return false;
+      if (this.numTotalJobs != that.numTotalJobs)
+        return false;
+    }
+
+    return true;
+  }
+
+  @Override
+  public int hashCode() {
+    return 0;
+  }
+
+  public int compareTo(ThriftJobSummaryList other) {
+    if (!getClass().equals(other.getClass())) {
+      return getClass().getName().compareTo(other.getClass().getName());
+    }
+
+    int lastComparison = 0;
+    ThriftJobSummaryList typedOther = (ThriftJobSummaryList)other;
+
+    lastComparison = Boolean.valueOf(isSetJobs()).compareTo(isSetJobs());
+    if (lastComparison != 0) {
+      return lastComparison;
+    }
+    lastComparison = TBaseHelper.compareTo(jobs, typedOther.jobs);
+    if (lastComparison != 0) {
+      return lastComparison;
+    }
+    lastComparison = Boolean.valueOf(isSetNumTotalJobs()).compareTo(isSetNumTotalJobs());
+    if (lastComparison != 0) {
+      return lastComparison;
+    }
+    lastComparison = TBaseHelper.compareTo(numTotalJobs, typedOther.numTotalJobs);
+    if (lastComparison != 0) {
+      return lastComparison;
+    }
+    return 0;
+  }
+
+  public void read(TProtocol iprot) throws TException {
+    TField field;
+    iprot.readStructBegin();
+    while (true)
+    {
+      field = iprot.readFieldBegin();
+      if (field.type == TType.STOP) { 
+        break;
+      }
+      _Fields fieldId = _Fields.findByThriftId(field.id);
+      if (fieldId == null) {
+        TProtocolUtil.skip(iprot, field.type);
+      } else {
+        switch (fieldId) {
+          case JOBS:
+            if (field.type == TType.LIST) {
+              {
+                TList _list79 = iprot.readListBegin();
+                this.jobs = new ArrayList<ThriftJobSummary>(_list79.size);
+                for (int _i80 = 0; _i80 < _list79.size; ++_i80)
+                {
+                  ThriftJobSummary _elem81;
+                  _elem81 = new ThriftJobSummary();
+                  _elem81.read(iprot);
+                  this.jobs.add(_elem81);
+                }
+                iprot.readListEnd();
+              }
+            } else { 
+              TProtocolUtil.skip(iprot, field.type);
+            }
+            break;
+          case NUM_TOTAL_JOBS:
+            if (field.type == TType.I32) {
+              this.numTotalJobs = iprot.readI32();
+              setNumTotalJobsIsSet(true);
+            } else { 
+              TProtocolUtil.skip(iprot, field.type);
+            }
+            break;
+        }
+        iprot.readFieldEnd();
+      }
+    }
+    iprot.readStructEnd();
+
+    // check for required fields of primitive type, which can't be checked in the validate method
+    validate();
+  }
+
+  public void write(TProtocol oprot) throws TException {
+    validate();
+
+    oprot.writeStructBegin(STRUCT_DESC);
+    if (this.jobs != null) {
+      oprot.writeFieldBegin(JOBS_FIELD_DESC);
+      {
+        oprot.writeListBegin(new TList(TType.STRUCT, this.jobs.size()));
+        for (ThriftJobSummary _iter82 : this.jobs)
+        {
+          _iter82.write(oprot);
+        }
+        oprot.writeListEnd();
+      }
+      oprot.writeFieldEnd();
+    }
+    oprot.writeFieldBegin(NUM_TOTAL_JOBS_FIELD_DESC);
+    oprot.writeI32(this.numTotalJobs);
+    oprot.writeFieldEnd();
+    oprot.writeFieldStop();
+    oprot.writeStructEnd();
+  }
+
+  @Override
+  public String toString() {
+    StringBuilder sb = new StringBuilder("ThriftJobSummaryList(");
+    boolean first = true;
+
+    sb.append("jobs:");
+    if (this.jobs == null) {
+      sb.append("null");
+    } else {
+      sb.append(this.jobs);
+    }
+    first = false;
+    if (!first) sb.append(", ");
+    sb.append("numTotalJobs:");
+    sb.append(this.numTotalJobs);
+    first = false;
+    sb.append(")");
+    return sb.toString();
+  }
+
+  public void validate() throws TException {
+    // check for required fields
+  }
+
+}
+
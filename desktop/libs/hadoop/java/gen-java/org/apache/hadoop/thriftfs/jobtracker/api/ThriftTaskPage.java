@@ -0,0 +1,504 @@
+/**
+ * Autogenerated by Thrift
+ *
+ * DO NOT EDIT UNLESS YOU ARE SURE THAT YOU KNOW WHAT YOU ARE DOING
+ */
+package org.apache.hadoop.thriftfs.jobtracker.api;
+
+import java.util.List;
+import java.util.ArrayList;
+import java.util.Map;
+import java.util.HashMap;
+import java.util.EnumMap;
+import java.util.Set;
+import java.util.HashSet;
+import java.util.EnumSet;
+import java.util.Collections;
+import java.util.BitSet;
+import java.util.Arrays;
+import org.slf4j.Logger;
+import org.slf4j.LoggerFactory;
+
+import org.apache.thrift.*;
+import org.apache.thrift.meta_data.*;
+import org.apache.thrift.protocol.*;
+
+/**
+ * A page of the tasks of a job that match a filter (see getTaskPage). The
+ * tasks are listed in the same order as by getTaskList.
+ */
+public class ThriftTaskPage implements TBase<ThriftTaskPage._Fields>, java.io.Serializable, Cloneable {
+  private static final TStruct STRUCT_DESC = new TStruct("ThriftTaskPage");
+
+  private static final TField TASKS_FIELD_DESC = new TField("tasks", TType.LIST, (short)1);
+  private static final TField NUM_TOTAL_TASKS_FIELD_DESC = new TField("numTotalTasks", TType.I32, (short)2);
+  private static final TField NEXT_CURSOR_FIELD_DESC = new TField("nextCursor", TType.STRING, (short)3);
+
+  public List<ThriftTaskInProgress> tasks;
+  /**
+   * The number of tasks that matched the filter when the listing started
+   */
+  public int numTotalTasks;
+  /**
+   * The cursor of the next page, or empty after the last page
+   */
+  public String nextCursor;
+
+  /** The set of fields this struct contains, along with convenience methods for finding and manipulating them. */
+  public enum _Fields implements TFieldIdEnum {
+    TASKS((short)1, "tasks"),
+    /**
+     * The number of tasks that matched the filter when the listing started
+     */
+    NUM_TOTAL_TASKS((short)2, "numTotalTasks"),
+    /**
+     * The cursor of the next page, or empty after the last page
+     */
+    NEXT_CURSOR((short)3, "nextCursor");
+
+    private static final Map<Integer, _Fields> byId = new HashMap<Integer, _Fields>();
+    private static final Map<String, _Fields> byName = new HashMap<String, _Fields>();
+
+    static {
+      for (_Fields field : EnumSet.allOf(_Fields.class)) {
+        byId.put((int)field._thriftId, field);
+        byName.put(field.getFieldName(), field);
+      }
+    }
+
+    /**
+     * Find the _Fields constant that matches fieldId, or null if its not found.
+     */
+    public static _Fields findByThriftId(int fieldId) {
+      return byId.get(fieldId);
+    }
+
+    /**
+     * Find the _Fields constant that matches fieldId, throwing an exception
+     * if it is not found.
+     */
+    public static _Fields findByThriftIdOrThrow(int fieldId) {
+      _Fields fields = findByThriftId(fieldId);
+      if (fields == null) throw new IllegalArgumentException("Field " + fieldId + " doesn't exist!");
+      return fields;
+    }
+
+    /**
+     * Find the _Fields constant that matches name, or null if its not found.
+     */
+    public static _Fields findByName(String name) {
+      return byName.get(name);
+    }
+
+    private final short _thriftId;
+    private final String _fieldName;
+
+    _Fields(short thriftId, String fieldName) {
+      _thriftId = thriftId;
+      _fieldName = fieldName;
+    }
+
+    public short getThriftFieldId() {
+      return _thriftId;
+    }
+
+    public String getFieldName() {
+      return _fieldName;
+    }
+  }
+
+  // isset id assignments
+  private static final int __NUMTOTALTASKS_ISSET_ID = 0;
+  private BitSet __isset_bit_vector = new BitSet(1);
+
+  public static final Map<_Fields, FieldMetaData> metaDataMap = Collections.unmodifiableMap(new EnumMap<_Fields, FieldMetaData>(_Fields.class) {{
+    put(_Fields.TASKS, new FieldMetaData("tasks", TFieldRequirementType.DEFAULT, 
+        new ListMetaData(TType.LIST, 
+            new StructMetaData(TType.STRUCT, ThriftTaskInProgress.class))));
+    put(_Fields.NUM_TOTAL_TASKS, new FieldMetaData("numTotalTasks", TFieldRequirementType.DEFAULT, 
+        new FieldValueMetaData(TType.I32)));
+    put(_Fields.NEXT_CURSOR, new FieldMetaData("nextCursor", TFieldRequirementType.DEFAULT, 
+        new FieldValueMetaData(TType.STRING)));
+  }});
+
+  static {
+    FieldMetaData.addStructMetaDataMap(ThriftTaskPage.class, metaDataMap);
+  }
+
+  public ThriftTaskPage() {
+  }
+
+  public ThriftTaskPage(
+    List<ThriftTaskInProgress> tasks,
+    int numTotalTasks,
+    String nextCursor)
+  {
+    this();
+    this.tasks = tasks;
+    this.numTotalTasks = numTotalTasks;
+    setNumTotalTasksIsSet(true);
+    this.nextCursor = nextCursor;
+  }
+
+  /**
+   * Performs a deep copy on <i>other</i>.
+   */
+  public ThriftTaskPage(ThriftTaskPage other) {
+    __isset_bit_vector.clear();
+    __isset_bit_vector.or(other.__isset_bit_vector);
+    if (other.isSetTasks()) {
+      List<ThriftTaskInProgress> __this__tasks = new ArrayList<ThriftTaskInProgress>();
+      for (ThriftTaskInProgress other_element : other.tasks) {
+        __this__tasks.add(new ThriftTaskInProgress(other_element));
+      }
+      this.tasks = __this__tasks;
+    }
+    this.numTotalTasks = other.numTotalTasks;
+    if (other.isSetNextCursor()) {
+      this.nextCursor = other.nextCursor;
+    }
+  }
+
+  public ThriftTaskPage deepCopy() {
+    return new ThriftTaskPage(this);
+  }
+
+  @Deprecated
+  public ThriftTaskPage clone() {
+    return new ThriftTaskPage(this);
+  }
+
+  public int getTasksSize() {
+    return (this.tasks == null) ? 0 : this.tasks.size();
+  }
+
+  public java.util.Iterator<ThriftTaskInProgress> getTasksIterator() {
+    return (this.tasks == null) ? null : this.tasks.iterator();
+  }
+
+  public void addToTasks(ThriftTaskInProgress elem) {
+    if (this.tasks == null) {
+      this.tasks = new ArrayList<ThriftTaskInProgress>();
+    }
+    this.tasks.add(elem);
+  }
+
+  public List<ThriftTaskInProgress> getTasks() {
+    return this.tasks;
+  }
+
+  public ThriftTaskPage setTasks(List<ThriftTaskInProgress> tasks) {
+    this.tasks = tasks;
+    return this;
+  }
+
+  public void unsetTasks() {
+    this.tasks = null;
+  }
+
+  /** Returns true if field tasks is set (has been asigned a value) and false otherwise */
+  public boolean isSetTasks() {
+    return this.tasks != null;
+  }
+
+  public void setTasksIsSet(boolean value) {
+    if (!value) {
+      this.tasks = null;
+    }
+  }
+
+  /**
+   * The number of tasks that matched the filter when the listing started
+   */
+  public int getNumTotalTasks() {
+    return this.numTotalTasks;
+  }
+
+  /**
+   * The number of tasks that matched the filter when the listing started
+   */
+  public ThriftTaskPage setNumTotalTasks(int numTotalTasks) {
+    this.numTotalTasks = numTotalTasks;
+    setNumTotalTasksIsSet(true);
+    return this;
+  }
+
+  public void unsetNumTotalTasks() {
+    __isset_bit_vector.clear(__NUMTOTALTASKS_ISSET_ID);
+  }
+
+  /** Returns true if field numTotalTasks is set (has been asigned a value) and false otherwise */
+  public boolean isSetNumTotalTasks() {
+    return __isset_bit_vector.get(__NUMTOTALTASKS_ISSET_ID);
+  }
+
+  public void setNumTotalTasksIsSet(boolean value) {
+    __isset_bit_vector.set(__NUMTOTALTASKS_ISSET_ID, value);
+  }
+
+  /**
+   * The cursor of the next page, or empty after the last page
+   */
+  public String getNextCursor() {
+    return this.nextCursor;
+  }
+
+  /**
+   * The cursor of the next page, or empty after the last page
+   */
+  public ThriftTaskPage setNextCursor(String nextCursor) {
+    this.nextCursor = nextCursor;
+    return this;
+  }
+
+  public void unsetNextCursor() {
+    this.nextCursor = null;
+  }
+
+  /** Returns true if field nextCursor is set (has been asigned a value) and false otherwise */
+  public boolean isSetNextCursor() {
+    return this.nextCursor != null;
+  }
+
+  public void setNextCursorIsSet(boolean value) {
+    if (!value) {
+      this.nextCursor = null;
+    }
+  }
+
+  public void setFieldValue(_Fields field, Object value) {
+    switch (field) {
+    case TASKS:
+      if (value == null) {
+        unsetTasks();
+      } else {
+        setTasks((List<ThriftTaskInProgress>)value);
+      }
+      break;
+
+    case NUM_TOTAL_TASKS:
+      if (value == null) {
+        unsetNumTotalTasks();
+      } else {
+        setNumTotalTasks((Integer)value);
+      }
+      break;
+
+    case NEXT_CURSOR:
+      if (value == null) {
+        unsetNextCursor();
+      } else {
+        setNextCursor((String)value);
+      }
+      break;
+
+    }
+  }
+
+  public void setFieldValue(int fieldID, Object value) {
+    setFieldValue(_Fields.findByThriftIdOrThrow(fieldID), value);
+  }
+
+  public Object getFieldValue(_Fields field) {
+    switch (field) {
+    case TASKS:
+      return getTasks();
+
+    case NUM_TOTAL_TASKS:
+      return new Integer(getNumTotalTasks());
+
+    case NEXT_CURSOR:
+      return getNextCursor();
+
+    }
+    throw new IllegalStateException();
+  }
+
+  public Object getFieldValue(int fieldId) {
+    return getFieldValue(_Fields.findByThriftIdOrThrow(fieldId));
+  }
+
+  /** Returns true if field corresponding to fieldID is set (has been asigned a value) and false otherwise */
+  public boolean isSet(_Fields field) {
+    switch (field) {
+    case TASKS:
+      return isSetTasks();
+    case NUM_TOTAL_TASKS:
+      return isSetNumTotalTasks();
+    case NEXT_CURSOR:
+      return isSetNextCursor();
+    }
+    throw new IllegalStateException();
+  }
+
+  public boolean isSet(int fieldID) {
+    return isSet(_Fields.findByThriftIdOrThrow(fieldID));
+  }
+
+  @Override
+  public boolean equals(Object that) {
+    if (that == null)
+      return false;
+    if (that instanceof ThriftTaskPage)
+      return this.equals((ThriftTaskPage)that);
+    return false;
+  }
+
+  public boolean equals(ThriftTaskPage that) {
+    if (that == null)
+      return false;
+
+    boolean this_present_tasks = true && this.isSetTasks();
+    boolean that_present_tasks = true && that.isSetTasks();
+    if (this_present_tasks || that_present_tasks) {
+      if (!(this_present_tasks && that_present_tasks))
+        return false;
+      if (!this.tasks.equals(that.tasks))
+        return false;
+    }
+
+    boolean this_present_numTotalTasks = true;
+    boolean that_present_numTotalTasks = true;
+    if (this_present_numTotalTasks || that_present_numTotalTasks) {
+      if (!(this_present_numTotalTasks && that_present_numTotalTasks))
+        return false;
+      if (this.numTotalTasks != that.numTotalTasks)
+        return false;
+    }
+
+    boolean this_present_nextCursor = true && this.isSetNextCursor();
+    boolean that_present_nextCursor = true && that.isSetNextCursor();
+    if (this_present_nextCursor || that_present_nextCursor) {
+      if (!(this_present_nextCursor && that_present_nextCursor))
+        return false;
+      if (!this.nextCursor.equals(that.nextCursor))
+        return false;
+    }
+
+    return true;
+  }
+
+  @Override
+  public int hashCode() {
+    return 0;
+  }
+
+  public void read(TProtocol iprot) throws TException {
+    TField field;
+    iprot.readStructBegin();
+    while (true)
+    {
+      field = iprot.readFieldBegin();
+      if (field.type == TType.STOP) { 
+        break;
+      }
+      _Fields fieldId = _Fields.findByThriftId(field.id);
+      if (fieldId == null) {
+        TProtocolUtil.skip(iprot, field.type);
+      } else {
+        switch (fieldId) {
+          case TASKS:
+            if (field.type == TType.LIST) {
+              {
+                TList _list47 = iprot.readListBegin();
+                this.tasks = new ArrayList<ThriftTaskInProgress>(_list47.size);
+                for (int _i48 = 0; _i48 < _list47.size; ++_i48)
+                {
+                  ThriftTaskInProgress _elem49;
+                  _elem49 = new ThriftTaskInProgress();
+                  _elem49.read(iprot);
+                  this.tasks.add(_elem49);
+                }
+                iprot.readListEnd();
+              }
+            } else { 
+              TProtocolUtil.skip(iprot, field.type);
+            }
+            break;
+          case NUM_TOTAL_TASKS:
+            if (field.type == TType.I32) {
+              this.numTotalTasks = iprot.readI32();
+              setNumTotalTasksIsSet(true);
+            } else { 
+              TProtocolUtil.skip(iprot, field.type);
+            }
+            break;
+          case NEXT_CURSOR:
+            if (field.type == TType.STRING) {
+              this.nextCursor = iprot.readString();
+            } else { 
+              TProtocolUtil.skip(iprot, field.type);
+            }
+            break;
+        }
+        iprot.readFieldEnd();
+      }
+    }
+    iprot.readStructEnd();
+
+    // check for required fields of primitive type, which can't be checked in the validate method
+    validate();
+  }
+
+  public void write(TProtocol oprot) throws TException {
+    validate();
+
+    oprot.writeStructBegin(STRUCT_DESC);
+    if (this.tasks != null) {
+      oprot.writeFieldBegin(TASKS_FIELD_DESC);
+      {
+        oprot.writeListBegin(new TList(TType.STRUCT, this.tasks.size()));
+        for (ThriftTaskInProgress _iter50 : this.tasks)
+        {
+          _iter50.write(oprot);
+        }
+        oprot.writeListEnd();
+      }
+      oprot.writeFieldEnd();
+    }
+    oprot.writeFieldBegin(NUM_TOTAL_TASKS_FIELD_DESC);
+    oprot.writeI32(this.numTotalTasks);
+    oprot.writeFieldEnd();
+    if (this.nextCursor != null) {
+      oprot.writeFieldBegin(NEXT_CURSOR_FIELD_DESC);
+      oprot.writeString(this.nextCursor);
+      oprot.writeFieldEnd();
+    }
+    oprot.writeFieldStop();
+    oprot.writeStructEnd();
+  }
+
+  @Override
+  public String toString() {
+    StringBuilder sb = new StringBuilder("ThriftTaskPage(");
+    boolean first = true;
+
+    sb.append("tasks:");
+    if (this.tasks == null) {
+      sb.append("null");
+    } else {
+      sb.append(this.tasks);
+    }
+    first = false;
+    if (!first) sb.append(", ");
+    sb.append("numTotalTasks:");
+    sb.append(this.numTotalTasks);
+    first = false;
+    if (!first) sb.append(", ");
+    sb.append("nextCursor:");
+    if (this.nextCursor == null) {
+      sb.append("null");
+    } else {
+      sb.append(this.nextCursor);
+    }
+    first = false;
+    sb.append(")");
+    return sb.toString();
+  }
+
+  public void validate() throws TException {
+    // check for required fields
+  }
+
+}
+
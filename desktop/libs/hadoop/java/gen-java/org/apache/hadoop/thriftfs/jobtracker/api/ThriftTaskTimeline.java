@@ -0,0 +1,963 @@
+/**
+ * Autogenerated by Thrift
+ *
+ * DO NOT EDIT UNLESS YOU ARE SURE THAT YOU KNOW WHAT YOU ARE DOING
+ */
+package org.apache.hadoop.thriftfs.jobtracker.api;
+
+import java.util.List;
+import java.util.ArrayList;
+import java.util.Map;
+import java.util.HashMap;
+import java.util.EnumMap;
+import java.util.Set;
+import java.util.HashSet;
+import java.util.EnumSet;
+import java.util.Collections;
+import java.util.BitSet;
+import java.util.Arrays;
+import org.slf4j.Logger;
+import org.slf4j.LoggerFactory;
+
+import org.apache.thrift.*;
+import org.apache.thrift.meta_data.*;
+import org.apache.thrift.protocol.*;
+
+/**
+ * The start and finish times of every task of a job, as parallel lists
+ * (one element per task) rather than as ThriftTaskInProgress, so that jobs
+ * with many tasks stay cheap to send (see getTaskTimeline).
+ */
+public class ThriftTaskTimeline implements TBase<ThriftTaskTimeline._Fields>, java.io.Serializable, Cloneable, Comparable<ThriftTaskTimeline> {
+  private static final TStruct STRUCT_DESC = new TStruct("ThriftTaskTimeline");
+
+  private static final TField TASK_NUMBERS_FIELD_DESC = new TField("taskNumbers", TType.LIST, (short)1);
+  private static final TField TASK_TYPES_FIELD_DESC = new TField("taskTypes", TType.LIST, (short)2);
+  private static final TField STATES_FIELD_DESC = new TField("states", TType.LIST, (short)3);
+  private static final TField START_TIMES_FIELD_DESC = new TField("startTimes", TType.LIST, (short)4);
+  private static final TField FINISH_TIMES_FIELD_DESC = new TField("finishTimes", TType.LIST, (short)5);
+  private static final TField CURRENT_TIME_FIELD_DESC = new TField("currentTime", TType.I64, (short)6);
+
+  /**
+   * The number of each task within its type, as in its ThriftTaskID
+   */
+  public List<Integer> taskNumbers;
+  public List<ThriftTaskType> taskTypes;
+  public List<ThriftTaskQueryState> states;
+  /**
+   * When each task started running, or 0
+   */
+  public List<Long> startTimes;
+  /**
+   * When each task finished, or 0
+   */
+  public List<Long> finishTimes;
+  /**
+   * The time on the JobTracker, for the tasks that are still running
+   */
+  public long currentTime;
+
+  /** The set of fields this struct contains, along with convenience methods for finding and manipulating them. */
+  public enum _Fields implements TFieldIdEnum {
+    /**
+     * The number of each task within its type, as in its ThriftTaskID
+     */
+    TASK_NUMBERS((short)1, "taskNumbers"),
+    TASK_TYPES((short)2, "taskTypes"),
+    STATES((short)3, "states"),
+    /**
+     * When each task started running, or 0
+     */
+    START_TIMES((short)4, "startTimes"),
+    /**
+     * When each task finished, or 0
+     */
+    FINISH_TIMES((short)5, "finishTimes"),
+    /**
+     * The time on the JobTracker, for the tasks that are still running
+     */
+    CURRENT_TIME((short)6, "currentTime");
+
+    private static final Map<Integer, _Fields> byId = new HashMap<Integer, _Fields>();
+    private static final Map<String, _Fields> byName = new HashMap<String, _Fields>();
+
+    static {
+      for (_Fields field : EnumSet.allOf(_Fields.class)) {
+        byId.put((int)field._thriftId, field);
+        byName.put(field.getFieldName(), field);
+      }
+    }
+
+    /**
+     * Find the _Fields constant that matches fieldId, or null if its not found.
+     */
+    public static _Fields findByThriftId(int fieldId) {
+      return byId.get(fieldId);
+    }
+
+    /**
+     * Find the _Fields constant that matches fieldId, throwing an exception
+     * if it is not found.
+     */
+    public static _Fields findByThriftIdOrThrow(int fieldId) {
+      _Fields fields = findByThriftId(fieldId);
+      if (fields == null) throw new IllegalArgumentException("Field " + fieldId + " doesn't exist!");
+      return fields;
+    }
+
+    /**
+     * Find the _Fields constant that matches name, or null if its not found.
+     */
+    public static _Fields findByName(String name) {
+      return byName.get(name);
+    }
+
+    private final short _thriftId;
+    private final String _fieldName;
+
+    _Fields(short thriftId, String fieldName) {
+      _thriftId = thriftId;
+      _fieldName = fieldName;
+    }
+
+    public short getThriftFieldId() {
+      return _thriftId;
+    }
+
+    public String getFieldName() {
+      return _fieldName;
+    }
+  }
+
+  // isset id assignments
+  private static final int __CURRENTTIME_ISSET_ID = 0;
+  private BitSet __isset_bit_vector = new BitSet(1);
+
+  public static final Map<_Fields, FieldMetaData> metaDataMap = Collections.unmodifiableMap(new EnumMap<_Fields, FieldMetaData>(_Fields.class) {{
+    put(_Fields.TASK_NUMBERS, new FieldMetaData("taskNumbers", TFieldRequirementType.DEFAULT, 
+        new ListMetaData(TType.LIST, 
+            new FieldValueMetaData(TType.I32))));
+    put(_Fields.TASK_TYPES, new FieldMetaData("taskTypes", TFieldRequirementType.DEFAULT, 
+        new ListMetaData(TType.LIST, 
+            new EnumMetaData(TType.ENUM, ThriftTaskType.class))));
+    put(_Fields.STATES, new FieldMetaData("states", TFieldRequirementType.DEFAULT, 
+        new ListMetaData(TType.LIST, 
+            new EnumMetaData(TType.ENUM, ThriftTaskQueryState.class))));
+    put(_Fields.START_TIMES, new FieldMetaData("startTimes", TFieldRequirementType.DEFAULT, 
+        new ListMetaData(TType.LIST, 
+            new FieldValueMetaData(TType.I64))));
+    put(_Fields.FINISH_TIMES, new FieldMetaData("finishTimes", TFieldRequirementType.DEFAULT, 
+        new ListMetaData(TType.LIST, 
+            new FieldValueMetaData(TType.I64))));
+    put(_Fields.CURRENT_TIME, new FieldMetaData("currentTime", TFieldRequirementType.DEFAULT, 
+        new FieldValueMetaData(TType.I64)));
+  }});
+
+  static {
+    FieldMetaData.addStructMetaDataMap(ThriftTaskTimeline.class, metaDataMap);
+  }
+
+  public ThriftTaskTimeline() {
+  }
+
+  public ThriftTaskTimeline(
+    List<Integer> taskNumbers,
+    List<ThriftTaskType> taskTypes,
+    List<ThriftTaskQueryState> states,
+    List<Long> startTimes,
+    List<Long> finishTimes,
+    long currentTime)
+  {
+    this();
+    this.taskNumbers = taskNumbers;
+    this.taskTypes = taskTypes;
+    this.states = states;
+    this.startTimes = startTimes;
+    this.finishTimes = finishTimes;
+    this.currentTime = currentTime;
+    setCurrentTimeIsSet(true);
+  }
+
+  /**
+   * Performs a deep copy on <i>other</i>.
+   */
+  public ThriftTaskTimeline(ThriftTaskTimeline other) {
+    __isset_bit_vector.clear();
+    __isset_bit_vector.or(other.__isset_bit_vector);
+    if (other.isSetTaskNumbers()) {
+      List<Integer> __this__taskNumbers = new ArrayList<Integer>();
+      for (Integer other_element : other.taskNumbers) {
+        __this__taskNumbers.add(other_element);
+      }
+      this.taskNumbers = __this__taskNumbers;
+    }
+    if (other.isSetTaskTypes()) {
+      List<ThriftTaskType> __this__taskTypes = new ArrayList<ThriftTaskType>();
+      for (ThriftTaskType other_element : other.taskTypes) {
+        __this__taskTypes.add(other_element);
+      }
+      this.taskTypes = __this__taskTypes;
+    }
+    if (other.isSetStates()) {
+      List<ThriftTaskQueryState> __this__states = new ArrayList<ThriftTaskQueryState>();
+      for (ThriftTaskQueryState other_element : other.states) {
+        __this__states.add(other_element);
+      }
+      this.states = __this__states;
+    }
+    if (other.isSetStartTimes()) {
+      List<Long> __this__startTimes = new ArrayList<Long>();
+      for (Long other_element : other.startTimes) {
+        __this__startTimes.add(other_element);
+      }
+      this.startTimes = __this__startTimes;
+    }
+    if (other.isSetFinishTimes()) {
+      List<Long> __this__finishTimes = new ArrayList<Long>();
+      for (Long other_element : other.finishTimes) {
+        __this__finishTimes.add(other_element);
+      }
+      this.finishTimes = __this__finishTimes;
+    }
+    this.currentTime = other.currentTime;
+  }
+
+  public ThriftTaskTimeline deepCopy() {
+    return new ThriftTaskTimeline(this);
+  }
+
+  @Deprecated
+  public ThriftTaskTimeline clone() {
+    return new ThriftTaskTimeline(this);
+  }
+
+  public int getTaskNumbersSize() {
+    return (this.taskNumbers == null) ? 0 : this.taskNumbers.size();
+  }
+
+  public java.util.Iterator<Integer> getTaskNumbersIterator() {
+    return (this.taskNumbers == null) ? null : this.taskNumbers.iterator();
+  }
+
+  public void addToTaskNumbers(int elem) {
+    if (this.taskNumbers == null) {
+      this.taskNumbers = new ArrayList<Integer>();
+    }
+    this.taskNumbers.add(elem);
+  }
+
+  /**
+   * The number of each task within its type, as in its ThriftTaskID
+   */
+  public List<Integer> getTaskNumbers() {
+    return this.taskNumbers;
+  }
+
+  /**
+   * The number of each task within its type, as in its ThriftTaskID
+   */
+  public ThriftTaskTimeline setTaskNumbers(List<Integer> taskNumbers) {
+    this.taskNumbers = taskNumbers;
+    return this;
+  }
+
+  public void unsetTaskNumbers() {
+    this.taskNumbers = null;
+  }
+
+  /** Returns true if field taskNumbers is set (has been asigned a value) and false otherwise */
+  public boolean isSetTaskNumbers() {
+    return this.taskNumbers != null;
+  }
+
+  public void setTaskNumbersIsSet(boolean value) {
+    if (!value) {
+      this.taskNumbers = null;
+    }
+  }
+
+  public int getTaskTypesSize() {
+    return (this.taskTypes == null) ? 0 : this.taskTypes.size();
+  }
+
+  public java.util.Iterator<ThriftTaskType> getTaskTypesIterator() {
+    return (this.taskTypes == null) ? null : this.taskTypes.iterator();
+  }
+
+  public void addToTaskTypes(ThriftTaskType elem) {
+    if (this.taskTypes == null) {
+      this.taskTypes = new ArrayList<ThriftTaskType>();
+    }
+    this.taskTypes.add(elem);
+  }
+
+  public List<ThriftTaskType> getTaskTypes() {
+    return this.taskTypes;
+  }
+
+  public ThriftTaskTimeline setTaskTypes(List<ThriftTaskType> taskTypes) {
+    this.taskTypes = taskTypes;
+    return this;
+  }
+
+  public void unsetTaskTypes() {
+    this.taskTypes = null;
+  }
+
+  /** Returns true if field taskTypes is set (has been asigned a value) and false otherwise */
+  public boolean isSetTaskTypes() {
+    return this.taskTypes != null;
+  }
+
+  public void setTaskTypesIsSet(boolean value) {
+    if (!value) {
+      this.taskTypes = null;
+    }
+  }
+
+  public int getStatesSize() {
+    return (this.states == null) ? 0 : this.states.size();
+  }
+
+  public java.util.Iterator<ThriftTaskQueryState> getStatesIterator() {
+    return (this.states == null) ? null : this.states.iterator();
+  }
+
+  public void addToStates(ThriftTaskQueryState elem) {
+    if (this.states == null) {
+      this.states = new ArrayList<ThriftTaskQueryState>();
+    }
+    this.states.add(elem);
+  }
+
+  public List<ThriftTaskQueryState> getStates() {
+    return this.states;
+  }
+
+  public ThriftTaskTimeline setStates(List<ThriftTaskQueryState> states) {
+    this.states = states;
+    return this;
+  }
+
+  public void unsetStates() {
+    this.states = null;
+  }
+
+  /** Returns true if field states is set (has been asigned a value) and false otherwise */
+  public boolean isSetStates() {
+    return this.states != null;
+  }
+
+  public void setStatesIsSet(boolean value) {
+    if (!value) {
+      this.states = null;
+    }
+  }
+
+  public int getStartTimesSize() {
+    return (this.startTimes == null) ? 0 : this.startTimes.size();
+  }
+
+  public java.util.Iterator<Long> getStartTimesIterator() {
+    return (this.startTimes == null) ? null : this.startTimes.iterator();
+  }
+
+  public void addToStartTimes(long elem) {
+    if (this.startTimes == null) {
+      this.startTimes = new ArrayList<Long>();
+    }
+    this.startTimes.add(elem);
+  }
+
+  /**
+   * When each task started running, or 0
+   */
+  public List<Long> getStartTimes() {
+    return this.startTimes;
+  }
+
+  /**
+   * When each task started running, or 0
+   */
+  public ThriftTaskTimeline setStartTimes(List<Long> startTimes) {
+    this.startTimes = startTimes;
+    return this;
+  }
+
+  public void unsetStartTimes() {
+    this.startTimes = null;
+  }
+
+  /** Returns true if field startTimes is set (has been asigned a value) and false otherwise */
+  public boolean isSetStartTimes() {
+    return this.startTimes != null;
+  }
+
+  public void setStartTimesIsSet(boolean value) {
+    if (!value) {
+      this.startTimes = null;
+    }
+  }
+
+  public int getFinishTimesSize() {
+    return (this.finishTimes == null) ? 0 : this.finishTimes.size();
+  }
+
+  public java.util.Iterator<Long> getFinishTimesIterator() {
+    return (this.finishTimes == null) ? null : this.finishTimes.iterator();
+  }
+
+  public void addToFinishTimes(long elem) {
+    if (this.finishTimes == null) {
+      this.finishTimes = new ArrayList<Long>();
+    }
+    this.finishTimes.add(elem);
+  }
+
+  /**
+   * When each task finished, or 0
+   */
+  public List<Long> getFinishTimes() {
+    return this.finishTimes;
+  }
+
+  /**
+   * When each task finished, or 0
+   */
+  public ThriftTaskTimeline setFinishTimes(List<Long> finishTimes) {
+    this.finishTimes = finishTimes;
+    return this;
+  }
+
+  public void unsetFinishTimes() {
+    this.finishTimes = null;
+  }
+
+  /** Returns true if field finishTimes is set (has been asigned a value) and false otherwise */
+  public boolean isSetFinishTimes() {
+    return this.finishTimes != null;
+  }
+
+  public void setFinishTimesIsSet(boolean value) {
+    if (!value) {
+      this.finishTimes = null;
+    }
+  }
+
+  /**
+   * The time on the JobTracker, for the tasks that are still running
+   */
+  public long getCurrentTime() {
+    return this.currentTime;
+  }
+
+  /**
+   * The time on the JobTracker, for the tasks that are still running
+   */
+  public ThriftTaskTimeline setCurrentTime(long currentTime) {
+    this.currentTime = currentTime;
+    setCurrentTimeIsSet(true);
+    return this;
+  }
+
+  public void unsetCurrentTime() {
+    __isset_bit_vector.clear(__CURRENTTIME_ISSET_ID);
+  }
+
+  /** Returns true if field currentTime is set (has been asigned a value) and false otherwise */
+  public boolean isSetCurrentTime() {
+    return __isset_bit_vector.get(__CURRENTTIME_ISSET_ID);
+  }
+
+  public void setCurrentTimeIsSet(boolean value) {
+    __isset_bit_vector.set(__CURRENTTIME_ISSET_ID, value);
+  }
+
+  public void setFieldValue(_Fields field, Object value) {
+    switch (field) {
+    case TASK_NUMBERS:
+      if (value == null) {
+        unsetTaskNumbers();
+      } else {
+        setTaskNumbers((List<Integer>)value);
+      }
+      break;
+
+    case TASK_TYPES:
+      if (value == null) {
+        unsetTaskTypes();
+      } else {
+        setTaskTypes((List<ThriftTaskType>)value);
+      }
+      break;
+
+    case STATES:
+      if (value == null) {
+        unsetStates();
+      } else {
+        setStates((List<ThriftTaskQueryState>)value);
+      }
+      break;
+
+    case START_TIMES:
+      if (value == null) {
+        unsetStartTimes();
+      } else {
+        setStartTimes((List<Long>)value);
+      }
+      break;
+
+    case FINISH_TIMES:
+      if (value == null) {
+        unsetFinishTimes();
+      } else {
+        setFinishTimes((List<Long>)value);
+      }
+      break;
+
+    case CURRENT_TIME:
+      if (value == null) {
+        unsetCurrentTime();
+      } else {
+        setCurrentTime((Long)value);
+      }
+      break;
+
+    }
+  }
+
+  public void setFieldValue(int fieldID, Object value) {
+    setFieldValue(_Fields.findByThriftIdOrThrow(fieldID), value);
+  }
+
+  public Object getFieldValue(_Fields field) {
+    switch (field) {
+    case TASK_NUMBERS:
+      return getTaskNumbers();
+
+    case TASK_TYPES:
+      return getTaskTypes();
+
+    case STATES:
+      return getStates();
+
+    case START_TIMES:
+      return getStartTimes();
+
+    case FINISH_TIMES:
+      return getFinishTimes();
+
+    case CURRENT_TIME:
+      return new Long(getCurrentTime());
+
+    }
+    throw new IllegalStateException();
+  }
+
+  public Object getFieldValue(int fieldId) {
+    return getFieldValue(_Fields.findByThriftIdOrThrow(fieldId));
+  }
+
+  /** Returns true if field corresponding to fieldID is set (has been asigned a value) and false otherwise */
+  public boolean isSet(_Fields field) {
+    switch (field) {
+    case TASK_NUMBERS:
+      return isSetTaskNumbers();
+    case TASK_TYPES:
+      return isSetTaskTypes();
+    case STATES:
+      return isSetStates();
+    case START_TIMES:
+      return isSetStartTimes();
+    case FINISH_TIMES:
+      return isSetFinishTimes();
+    case CURRENT_TIME:
+      return isSetCurrentTime();
+    }
+    throw new IllegalStateException();
+  }
+
+  public boolean isSet(int fieldID) {
+    return isSet(_Fields.findByThriftIdOrThrow(fieldID));
+  }
+
+  @Override
+  public boolean equals(Object that) {
+    if (that == null)
+      return false;
+    if (that instanceof ThriftTaskTimeline)
+      return this.equals((ThriftTaskTimeline)that);
+    return false;
+  }
+
+  public boolean equals(ThriftTaskTimeline that) {
+    if (that == null)
+      return false;
+
+    boolean this_present_taskNumbers = true && this.isSetTaskNumbers();
+    boolean that_present_taskNumbers = true && that.isSetTaskNumbers();
+    if (this_present_taskNumbers || that_present_taskNumbers) {
+      if (!(this_present_taskNumbers && that_present_taskNumbers))
+        return false;
+      if (!this.taskNumbers.equals(that.taskNumbers))
+        return false;
+    }
+
+    boolean this_present_taskTypes = true && this.isSetTaskTypes();
+    boolean that_present_taskTypes = true && that.isSetTaskTypes();
+    if (this_present_taskTypes || that_present_taskTypes) {
+      if (!(this_present_taskTypes && that_present_taskTypes))
+        return false;
+      if (!this.taskTypes.equals(that.taskTypes))
+        return false;
+    }
+
+    boolean this_present_states = true && this.isSetStates();
+    boolean that_present_states = true && that.isSetStates();
+    if (this_present_states || that_present_states) {
+      if (!(this_present_states && that_present_states))
+        return false;
+      if (!this.states.equals(that.states))
+        return false;
+    }
+
+    boolean this_present_startTimes = true && this.isSetStartTimes();
+    boolean that_present_startTimes = true && that.isSetStartTimes();
+    if (this_present_startTimes || that_present_startTimes) {
+      if (!(this_present_startTimes && that_present_startTimes))
+        return false;
+      if (!this.startTimes.equals(that.startTimes))
+        return false;
+    }
+
+    boolean this_present_finishTimes = true && this.isSetFinishTimes();
+    boolean that_present_finishTimes = true && that.isSetFinishTimes();
+    if (this_present_finishTimes || that_present_finishTimes) {
+      if (!(this_present_finishTimes && that_present_finishTimes))
+        return false;
+      if (!this.finishTimes.equals(that.finishTimes))
+        return false;
+    }
+
+    boolean this_present_currentTime = true;
+    boolean that_present_currentTime = true;
+    if (this_present_currentTime || that_present_currentTime) {
+      if (!(this_present_currentTime && that_present_currentTime))
+        return false;
+      if (this.currentTime != that.currentTime)
+        return false;
+    }
+
+    return true;
+  }
+
+  @Override
+  public int hashCode() {
+    return 0;
+  }
+
+  public int compareTo(ThriftTaskTimeline other) {
+    if (!getClass().equals(other.getClass())) {
+      return getClass().getName().compareTo(other.getClass().getName());
+    }
+
+    int lastComparison = 0;
+    ThriftTaskTimeline typedOther = (ThriftTaskTimeline)other;
+
+    lastComparison = Boolean.valueOf(isSetTaskNumbers()).compareTo(isSetTaskNumbers());
+    if (lastComparison != 0) {
+      return lastComparison;
+    }
+    lastComparison = TBaseHelper.compareTo(taskNumbers, typedOther.taskNumbers);
+    if (lastComparison != 0) {
+      return lastComparison;
+    }
+    lastComparison = Boolean.valueOf(isSetTaskTypes()).compareTo(isSetTaskTypes());
+    if (lastComparison != 0) {
+      return lastComparison;
+    }
+    lastComparison = TBaseHelper.compareTo(taskTypes, typedOther.taskTypes);
+    if (lastComparison != 0) {
+      return lastComparison;
+    }
+    lastComparison = Boolean.valueOf(isSetStates()).compareTo(isSetStates());
+    if (lastComparison != 0) {
+      return lastComparison;
+    }
+    lastComparison = TBaseHelper.compareTo(states, typedOther.states);
+    if (lastComparison != 0) {
+      return lastComparison;
+    }
+    lastComparison = Boolean.valueOf(isSetStartTimes()).compareTo(isSetStartTimes());
+    if (lastComparison != 0) {
+      return lastComparison;
+    }
+    lastComparison = TBaseHelper.compareTo(startTimes, typedOther.startTimes);
+    if (lastComparison != 0) {
+      return lastComparison;
+    }
+    lastComparison = Boolean.valueOf(isSetFinishTimes()).compareTo(isSetFinishTimes());
+    if (lastComparison != 0) {
+      return lastComparison;
+    }
+    lastComparison = TBaseHelper.compareTo(finishTimes, typedOther.finishTimes);
+    if (lastComparison != 0) {
+      return lastComparison;
+    }
+    lastComparison = Boolean.valueOf(isSetCurrentTime()).compareTo(isSetCurrentTime());
+    if (lastComparison != 0) {
+      return lastComparison;
+    }
+    lastComparison = TBaseHelper.compareTo(currentTime, typedOther.currentTime);
+    if (lastComparison != 0) {
+      return lastComparison;
+    }
+    return 0;
+  }
+
+  public void read(TProtocol iprot) throws TException {
+    TField field;
+    iprot.readStructBegin();
+    while (true)
+    {
+      field = iprot.readFieldBegin();
+      if (field.type == TType.STOP) { 
+        break;
+      }
+      _Fields fieldId = _Fields.findByThriftId(field.id);
+      if (fieldId == null) {
+        TProtocolUtil.skip(iprot, field.type);
+      } else {
+        switch (fieldId) {
+          case TASK_NUMBERS:
+            if (field.type == TType.LIST) {
+              {
+                TList _list51 = iprot.readListBegin();
+                this.taskNumbers = new ArrayList<Integer>(_list51.size);
+                for (int _i52 = 0; _i52 < _list51.size; ++_i52)
+                {
+                  int _elem53;
+                  _elem53 = iprot.readI32();
+                  this.taskNumbers.add(_elem53);
+                }
+                iprot.readListEnd();
+              }
+            } else { 
+              TProtocolUtil.skip(iprot, field.type);
+            }
+            break;
+          case TASK_TYPES:
+            if (field.type == TType.LIST) {
+              {
+                TList _list54 = iprot.readListBegin();
+                this.taskTypes = new ArrayList<ThriftTaskType>(_list54.size);
+                for (int _i55 = 0; _i55 < _list54.size; ++_i55)
+                {
+                  ThriftTaskType _elem56;
+                  _elem56 = ThriftTaskType.findByValue(iprot.readI32());
+                  this.taskTypes.add(_elem56);
+                }
+                iprot.readListEnd();
+              }
+            } else { 
+              TProtocolUtil.skip(iprot, field.type);
+            }
+            break;
+          case STATES:
+            if (field.type == TType.LIST) {
+              {
+                TList _list57 = iprot.readListBegin();
+                this.states = new ArrayList<ThriftTaskQueryState>(_list57.size);
+                for (int _i58 = 0; _i58 < _list57.size; ++_i58)
+                {
+                  ThriftTaskQueryState _elem59;
+                  _elem59 = ThriftTaskQueryState.findByValue(iprot.readI32());
+                  this.states.add(_elem59);
+                }
+                iprot.readListEnd();
+              }
+            } else { 
+              TProtocolUtil.skip(iprot, field.type);
+            }
+            break;
+          case START_TIMES:
+            if (field.type == TType.LIST) {
+              {
+                TList _list60 = iprot.readListBegin();
+                this.startTimes = new ArrayList<Long>(_list60.size);
+                for (int _i61 = 0; _i61 < _list60.size; ++_i61)
+                {
+                  long _elem62;
+                  _elem62 = iprot.readI64();
+                  this.startTimes.add(_elem62);
+                }
+                iprot.readListEnd();
+              }
+            } else { 
+              TProtocolUtil.skip(iprot, field.type);
+            }
+            break;
+          case FINISH_TIMES:
+            if (field.type == TType.LIST) {
+              {
+                TList _list63 = iprot.readListBegin();
+                this.finishTimes = new ArrayList<Long>(_list63.size);
+                for (int _i64 = 0; _i64 < _list63.size; ++_i64)
+                {
+                  long _elem65;
+                  _elem65 = iprot.readI64();
+                  this.finishTimes.add(_elem65);
+                }
+                iprot.readListEnd();
+              }
+            } else { 
+              TProtocolUtil.skip(iprot, field.type);
+            }
+            break;
+          case CURRENT_TIME:
+            if (field.type == TType.I64) {
+              this.currentTime = iprot.readI64();
+              setCurrentTimeIsSet(true);
+            } else { 
+              TProtocolUtil.skip(iprot, field.type);
+            }
+            break;
+        }
+        iprot.readFieldEnd();
+      }
+    }
+    iprot.readStructEnd();
+
+    // check for required fields of primitive type, which can't be checked in the validate method
+    validate();
+  }
+
+  public void write(TProtocol oprot) throws TException {
+    validate();
+
+    oprot.writeStructBegin(STRUCT_DESC);
+    if (this.taskNumbers != null) {
+      oprot.writeFieldBegin(TASK_NUMBERS_FIELD_DESC);
+      {
+        oprot.writeListBegin(new TList(TType.I32, this.taskNumbers.size()));
+        for (int _iter66 : this.taskNumbers)
+        {
+          oprot.writeI32(_iter66);
+        }
+        oprot.writeListEnd();
+      }
+      oprot.writeFieldEnd();
+    }
+    if (this.taskTypes != null) {
+      oprot.writeFieldBegin(TASK_TYPES_FIELD_DESC);
+      {
+        oprot.writeListBegin(new TList(TType.I32, this.taskTypes.size()));
+        for (ThriftTaskType _iter67 : this.taskTypes)
+        {
+          oprot.writeI32(_iter67.getValue());
+        }
+        oprot.writeListEnd();
+      }
+      oprot.writeFieldEnd();
+    }
+    if (this.states != null) {
+      oprot.writeFieldBegin(STATES_FIELD_DESC);
+      {
+        oprot.writeListBegin(new TList(TType.I32, this.states.size()));
+        for (ThriftTaskQueryState _iter68 : this.states)
+        {
+          oprot.writeI32(_iter68.getValue());
+        }
+        oprot.writeListEnd();
+      }
+      oprot.writeFieldEnd();
+    }
+    if (this.startTimes != null) {
+      oprot.writeFieldBegin(START_TIMES_FIELD_DESC);
+      {
+        oprot.writeListBegin(new TList(TType.I64, this.startTimes.size()));
+        for (long _iter69 : this.startTimes)
+        {
+          oprot.writeI64(_iter69);
+        }
+        oprot.writeListEnd();
+      }
+      oprot.writeFieldEnd();
+    }
+    if (this.finishTimes != null) {
+      oprot.writeFieldBegin(FINISH_TIMES_FIELD_DESC);
+      {
+        oprot.writeListBegin(new TList(TType.I64, this.finishTimes.size()));
+        for (long _iter70 : this.finishTimes)
+        {
+          oprot.writeI64(_iter70);
+        }
+        oprot.writeListEnd();
+      }
+      oprot.writeFieldEnd();
+    }
+    oprot.writeFieldBegin(CURRENT_TIME_FIELD_DESC);
+    oprot.writeI64(this.currentTime);
+    oprot.writeFieldEnd();
+    oprot.writeFieldStop();
+    oprot.writeStructEnd();
+  }
+
+  @Override
+  public String toString() {
+    StringBuilder sb = new StringBuilder("ThriftTaskTimeline(");
+    boolean first = true;
+
+    sb.append("taskNumbers:");
+    if (this.taskNumbers == null) {
+      sb.append("null");
+    } else {
+      sb.append(this.taskNumbers);
+    }
+    first = false;
+    if (!first) sb.append(", ");
+    sb.append("taskTypes:");
+    if (this.taskTypes == null) {
+      sb.append("null");
+    } else {
+      sb.append(this.taskTypes);
+    }
+    first = false;
+    if (!first) sb.append(", ");
+    sb.append("states:");
+    if (this.states == null) {
+      sb.append("null");
+    } else {
+      sb.append(this.states);
+    }
+    first = false;
+    if (!first) sb.append(", ");
+    sb.append("startTimes:");
+    if (this.startTimes == null) {
+      sb.append("null");
+    } else {
+      sb.append(this.startTimes);
+    }
+    first = false;
+    if (!first) sb.append(", ");
+    sb.append("finishTimes:");
+    if (this.finishTimes == null) {
+      sb.append("null");
+    } else {
+      sb.append(this.finishTimes);
+    }
+    first = false;
+    if (!first) sb.append(", ");
+    sb.append("currentTime:");
+    sb.append(this.currentTime);
+    first = false;
+    sb.append(")");
+    return sb.toString();
+  }
+
+  public void validate() throws TException {
+    // check for required fields
+  }
+
+}
+
@@ -501,7 +501,7 @@ service Namenode extends common.HadoopServiceBase {
 
 /** Encapsulates a block data transfer with its CRC */
 struct BlockData {
-  /** CRC32 of the data being transfered */
+  /** CRC32 of the data being transfered (0 if the client skipped it) */
   1:  i32 crc,
   /** Length of the data being transfered */
   2:  i32 length,
@@ -528,5 +528,36 @@ service Datanode {
                       2:  i64 offset,
                    
                       /** Number of bytes to read. */
-                      3:  i32 length) throws (1:common.IOException err)
+                      3:  i32 length,
+
+                      /**
+                       * Don't compute the CRC32 of the data, for clients
+                       * that don't check it.
+                       */
+                      4:  bool skipCrc) throws (1:common.IOException err),
+
+  /**
+   * Read bytes from a file, across block boundaries if need be.
+   *
+   * The datanode reads the blocks itself, from its own replicas where
+   * it has them, so the client needs no block locations.  Fewer bytes
+   * than asked for are returned only at the end of the file.
+   *
+   * Only 2^31 - 1 bytes may be read on a single call to this method.
+   */
+  BlockData readRange(10: common.RequestContext ctx,
+                      /** Path of the file to be read from. */
+                      1:  string path,
+
+                      /** Offset within the file where read must start from. */
+                      2:  i64 offset,
+
+                      /** Number of bytes to read. */
+                      3:  i32 length,
+
+                      /**
+                       * Don't compute the CRC32 of the data, for clients
+                       * that don't check it.
+                       */
+                      4:  bool skipCrc) throws (1:common.IOException err)
 }
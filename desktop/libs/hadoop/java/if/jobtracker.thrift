@@ -287,6 +287,36 @@ struct ThriftTaskInProgressList {
   2: i32 numTotalTasks
 }
 
+/**
+ * A page of the tasks of a job that match a filter (see getTaskPage). The
+ * tasks are listed in the same order as by getTaskList.
+ */
+struct ThriftTaskPage {
+  1: list<ThriftTaskInProgress> tasks
+  /** The number of tasks that matched the filter when the listing started */
+  2: i32 numTotalTasks
+  /** The cursor of the next page, or empty after the last page */
+  3: string nextCursor
+}
+
+/**
+ * The start and finish times of every task of a job, as parallel lists
+ * (one element per task) rather than as ThriftTaskInProgress, so that jobs
+ * with many tasks stay cheap to send (see getTaskTimeline).
+ */
+struct ThriftTaskTimeline {
+  /** The number of each task within its type, as in its ThriftTaskID */
+  1: list<i32> taskNumbers
+  2: list<ThriftTaskType> taskTypes
+  3: list<ThriftTaskQueryState> states
+  /** When each task started running, or 0 */
+  4: list<i64> startTimes
+  /** When each task finished, or 0 */
+  5: list<i64> finishTimes
+  /** The time on the JobTracker, for the tasks that are still running */
+  6: i64 currentTime
+}
+
 /** Status of *all* jobs, not just currently running ones */
 struct ThriftJobInProgress {
   1: ThriftJobProfile profile
@@ -310,6 +340,84 @@ struct ThriftJobList {
   1: list<ThriftJobInProgress> jobs
 }
 
+/**
+ * Selection criteria for getJobSummaries(). Unset or empty fields match every job.
+ * Strings match as case-insensitive substrings.
+ */
+struct ThriftJobFilter {
+  /** Match jobs in any of these states */
+  1: set<ThriftJobState> states
+  2: string user
+  3: string queue
+  /** Matched against the job's user, name, id, queue and priority */
+  4: string text
+}
+
+/** Job fields that getJobSummaries() can order by */
+enum ThriftJobSortKey {
+  JOB_ID,
+  NAME,
+  USER,
+  QUEUE,
+  STATE,
+  PRIORITY,
+  START_TIME,
+  FINISH_TIME
+}
+
+/** Order of the jobs returned by getJobSummaries() */
+struct ThriftJobSort {
+  1: ThriftJobSortKey key
+  2: bool descending
+}
+
+/**
+ * The fields of a job shown in job lists; much smaller than a
+ * ThriftJobInProgress. Use getJob() for the rest.
+ */
+struct ThriftJobSummary {
+  1: ThriftJobID jobID
+  2: string name
+  3: string user
+  4: string queueName
+  5: ThriftJobState runState
+  6: ThriftJobPriority priority
+  7: double mapProgress
+  8: double reduceProgress
+  9: i32 desiredMaps
+  10: i32 desiredReduces
+  11: i32 finishedMaps
+  12: i32 finishedReduces
+  13: i64 startTime
+  14: i64 finishTime
+}
+
+/** A page of job summaries (see getJobSummaries) */
+struct ThriftJobSummaryList {
+  1: list<ThriftJobSummary> jobs
+  /** The total number of jobs matching */
+  2: i32 numTotalJobs
+}
+
+/**
+ * The jobs that changed since a getJobsChangedSince() token. Tokens are
+ * only meaningful to the JobTracker that issued them.
+ */
+struct ThriftJobChanges {
+  /** Summaries of the jobs that were added, or whose state or progress changed */
+  1: list<ThriftJobSummary> changed
+  /** The jobs that the JobTracker no longer retains */
+  2: list<ThriftJobID> removed
+  /** The token to pass to the next call */
+  3: i64 token
+  /**
+   * True if the token given could not be used (it was 0, too old, or from
+   * another JobTracker). changed then has every job, and the caller should
+   * drop the jobs it knew about.
+   */
+  4: bool full
+}
+
 /** Container structure for job counts for a given user */
 struct ThriftUserJobCounts {
   1: i32 nPrep,
@@ -387,6 +495,10 @@ service Jobtracker extends common.HadoopServiceBase {
         ThriftJobInProgress getJob(10: common.RequestContext ctx, 1: ThriftJobID jobID)
                                   throws(1: JobNotFoundException err),
 
+        /** Get a job by ID, without its task list (see getTopTasks) */
+        ThriftJobInProgress getJobNoTasks(10: common.RequestContext ctx, 1: ThriftJobID jobID)
+                                  throws(1: JobNotFoundException err),
+
 	/** Get a list of currently running jobs */
 	ThriftJobList getRunningJobs(10: common.RequestContext ctx),
 
@@ -402,6 +514,25 @@ service Jobtracker extends common.HadoopServiceBase {
 	/** Get a list of all failed, completed and running jobs (could be expensive!) */
 	ThriftJobList getAllJobs(10: common.RequestContext ctx),
 
+        /**
+         * Get the summaries of one page of the jobs matching a filter, in
+         * the given order. numTotalJobs of the result is the number of
+         * matching jobs. A negative limit means no limit.
+         */
+        ThriftJobSummaryList getJobSummaries(10: common.RequestContext ctx,
+                                             1: ThriftJobFilter filter,
+                                             2: ThriftJobSort sort,
+                                             3: i32 offset,
+                                             4: i32 limit),
+
+        /**
+         * Get the jobs whose state or progress changed since token, which
+         * is 0 or the token returned by an earlier call. When nothing has
+         * changed, the result is empty.
+         */
+        ThriftJobChanges getJobsChangedSince(10: common.RequestContext ctx,
+                                             1: i64 token),
+
         /** Get the count of jobs by status for a given user */
         ThriftUserJobCounts getUserJobCounts(1: common.RequestContext ctx, 2: string user),
 
@@ -415,6 +546,38 @@ service Jobtracker extends common.HadoopServiceBase {
                                       6: i32 count,
                                       7: i32 offset) throws(1: JobNotFoundException err),
 
+        /**
+         * Get the count tasks in any of states that started executing last
+         * (or first, unless newestFirst), in that order. numTotalTasks is the
+         * number of tasks in those states.
+         */
+        ThriftTaskInProgressList getTopTasks(10: common.RequestContext ctx,
+                                             1: ThriftJobID jobID,
+                                             2: set<ThriftTaskQueryState> states,
+                                             3: i32 count,
+                                             4: bool newestFirst)
+                                  throws(1: JobNotFoundException err),
+
+        /**
+         * Get count tasks from cursor (empty for the first page) on, of
+         * the tasks that match a filter, as per getTaskList. The matching
+         * tasks are kept for a while, so that getting the next pages
+         * doesn't filter every task of the job again.
+         */
+        ThriftTaskPage getTaskPage(10: common.RequestContext ctx,
+                                   1: ThriftJobID jobID,
+                                   2: set<ThriftTaskType> types,
+                                   3: set<ThriftTaskQueryState> states,
+                                   4: string text,
+                                   5: string cursor,
+                                   6: i32 count)
+                                  throws(1: JobNotFoundException err),
+
+        /** Get the start and finish times of every task of a job */
+        ThriftTaskTimeline getTaskTimeline(10: common.RequestContext ctx,
+                                           1: ThriftJobID jobID)
+                                  throws(1: JobNotFoundException err),
+
         /** Get details of a task */
         ThriftTaskInProgress getTask(1: common.RequestContext ctx,
                                      2: ThriftTaskID taskID)
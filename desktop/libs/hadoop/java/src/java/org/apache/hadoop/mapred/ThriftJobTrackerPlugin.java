@@ -29,9 +29,14 @@ import java.util.Collection;
 import java.util.Collections;
 import java.util.Comparator;
 import java.util.HashMap;
+import java.util.HashSet;
+import java.util.Iterator;
+import java.util.LinkedHashMap;
 import java.util.List;
 import java.util.Map;
+import java.util.PriorityQueue;
 import java.util.Set;
+import java.util.TreeSet;
 
 import org.apache.commons.logging.Log;
 import org.apache.commons.logging.LogFactory;
@@ -54,7 +59,9 @@ import org.apache.hadoop.thriftfs.jobtracker.api.ThriftClusterStatus;
 import org.apache.hadoop.thriftfs.jobtracker.api.ThriftCounter;
 import org.apache.hadoop.thriftfs.jobtracker.api.ThriftCounterGroup;
 import org.apache.hadoop.thriftfs.jobtracker.api.ThriftGroupList;
+import org.apache.hadoop.thriftfs.jobtracker.api.ThriftJobChanges;
 import org.apache.hadoop.thriftfs.jobtracker.api.ThriftJobCounterRollups;
+import org.apache.hadoop.thriftfs.jobtracker.api.ThriftJobFilter;
 import org.apache.hadoop.thriftfs.jobtracker.api.ThriftJobID;
 import org.apache.hadoop.thriftfs.jobtracker.api.ThriftJobInProgress;
 import org.apache.hadoop.thriftfs.jobtracker.api.ThriftJobList;
@@ -62,16 +69,21 @@ import org.apache.hadoop.thriftfs.jobtracker.api.ThriftJobPriority;
 import org.apache.hadoop.thriftfs.jobtracker.api.ThriftJobProfile;
 import org.apache.hadoop.thriftfs.jobtracker.api.ThriftJobQueueInfo;
 import org.apache.hadoop.thriftfs.jobtracker.api.ThriftJobQueueList;
+import org.apache.hadoop.thriftfs.jobtracker.api.ThriftJobSort;
 import org.apache.hadoop.thriftfs.jobtracker.api.ThriftJobStatus;
+import org.apache.hadoop.thriftfs.jobtracker.api.ThriftJobSummary;
+import org.apache.hadoop.thriftfs.jobtracker.api.ThriftJobSummaryList;
 import org.apache.hadoop.thriftfs.jobtracker.api.ThriftJobState;
 import org.apache.hadoop.thriftfs.jobtracker.api.ThriftTaskAttemptID;
 import org.apache.hadoop.thriftfs.jobtracker.api.ThriftTaskID;
 import org.apache.hadoop.thriftfs.jobtracker.api.ThriftTaskInProgress;
 import org.apache.hadoop.thriftfs.jobtracker.api.ThriftTaskInProgressList;
+import org.apache.hadoop.thriftfs.jobtracker.api.ThriftTaskPage;
 import org.apache.hadoop.thriftfs.jobtracker.api.ThriftTaskPhase;
 import org.apache.hadoop.thriftfs.jobtracker.api.ThriftTaskQueryState;
 import org.apache.hadoop.thriftfs.jobtracker.api.ThriftTaskState;
 import org.apache.hadoop.thriftfs.jobtracker.api.ThriftTaskStatus;
+import org.apache.hadoop.thriftfs.jobtracker.api.ThriftTaskTimeline;
 import org.apache.hadoop.thriftfs.jobtracker.api.ThriftTaskTrackerStatus;
 import org.apache.hadoop.thriftfs.jobtracker.api.ThriftTaskTrackerStatusList;
 import org.apache.hadoop.thriftfs.jobtracker.api.ThriftTaskType;
@@ -266,6 +278,34 @@ public class ThriftJobTrackerPlugin extends JobTrackerPlugin implements Configur
             return new TaskInProgress[] { goodTip };
         }
 
+        /**
+         * Converts a JobInProgress object to the summary shown in job lists.
+         */
+        public static ThriftJobSummary toThriftSummary(JobInProgress job) {
+            ThriftJobSummary ret = new ThriftJobSummary();
+
+            // Take the lock so we can do an atomic copy
+            synchronized(job) {
+                JobProfile profile = job.getProfile();
+                JobStatus status = job.getStatus();
+                ret.setJobID(toThrift(job.getJobID()));
+                ret.setName(profile.getJobName());
+                ret.setUser(profile.getUser());
+                ret.setQueueName(profile.getQueueName());
+                ret.setRunState(jobRunStateToThrift(status.getRunState()));
+                ret.setPriority(toThrift(job.getPriority()));
+                ret.setMapProgress(status.mapProgress());
+                ret.setReduceProgress(status.reduceProgress());
+                ret.setDesiredMaps(job.desiredMaps());
+                ret.setDesiredReduces(job.desiredReduces());
+                ret.setFinishedMaps(job.finishedMaps());
+                ret.setFinishedReduces(job.finishedReduces());
+                ret.setStartTime(job.getStartTime());
+                ret.setFinishTime(job.getFinishTime());
+            }
+            return ret;
+        }
+
         public static ThriftJobInProgress toThrift(JobInProgress job, JobTracker tracker) {
             return toThrift(job, true, tracker);
         }
@@ -626,6 +666,170 @@ public class ThriftJobTrackerPlugin extends JobTrackerPlugin implements Configur
             return tip.isFailed() && tip.getExecStartTime() != 0;
         }
 
+        /**
+         * Returns the tasks of the job of any of types that are in any of
+         * states, and whose state, most recent state or id contains text
+         * (ignoring case). Backs getTaskList() and getTaskPage().
+         */
+        public static List<TaskInProgress> matchingTasks(JobInProgress job,
+                                                         Set<ThriftTaskType> types,
+                                                         Set<ThriftTaskQueryState> states,
+                                                         String text) {
+            // Gather all the tasks of the matching type
+            List<TaskInProgress> allTips = new ArrayList<TaskInProgress>();
+            synchronized(job) {
+                if (types.contains(ThriftTaskType.MAP))
+                    allTips.addAll(Arrays.asList(job.getMapTasks()));
+                if (types.contains(ThriftTaskType.REDUCE))
+                    allTips.addAll(Arrays.asList(job.getReduceTasks()));
+                if (types.contains(ThriftTaskType.JOB_CLEANUP))
+                    allTips.addAll(Arrays.asList(
+                          JTThriftUtils.sanitizeCleanupSetupTask(job.getCleanupTasks())));
+                if (types.contains(ThriftTaskType.JOB_SETUP))
+                    allTips.addAll(Arrays.asList(
+                          JTThriftUtils.sanitizeCleanupSetupTask(job.getSetupTasks())));
+            }
+
+            List<TaskInProgress> matches = null;
+            if (text == null)
+                text = "";
+            else
+                text = text.trim();
+
+            boolean doFilterStates = (states.size() !=
+                                      ThriftTaskQueryState.class.getEnumConstants().length);
+            boolean doFilterText = !text.isEmpty();
+
+            if (doFilterStates || doFilterText) {
+                text = text.toUpperCase();
+                matches = new ArrayList<TaskInProgress>();
+
+                // Note that it's important to finish all matching, regardless
+                // of the requested count, because we need to report the total
+                // number of matches.
+                for (TaskInProgress tip : allTips) {
+                    ThriftTaskQueryState qstate = null;
+
+                    if (doFilterStates) {
+                        // Do filter by states
+                        qstate = JTThriftUtils.inferTaskState(tip);
+                        if (!states.contains(qstate))
+                            continue;
+                    }
+
+                    if (doFilterText) {
+                        // Match against (1) state, (2) most recent state, (3) ID
+                        if (qstate == null)
+                            qstate = JTThriftUtils.inferTaskState(tip);
+                        String qstateStr = qstate.toString();
+                        if (!qstateStr.contains(text) &&
+                                !tip.getTIPId().toString().toUpperCase().contains(text) &&
+                                !tip.generateSingleReport().getState().toUpperCase().contains(text))
+                            continue;
+                    }
+
+                    matches.add(tip);
+                }
+            } else {
+              // If not filtering, every task matches
+              matches = allTips;
+            }
+            return matches;
+        }
+
+        private static boolean containsIgnoreCase(String s, String sub) {
+            return s != null && s.toLowerCase().contains(sub);
+        }
+
+        /**
+         * Whether the job matches the filter (see ThriftJobFilter).
+         * A null filter matches every job.
+         */
+        public static boolean matches(JobInProgress job, ThriftJobFilter filter) {
+            if (filter == null)
+                return true;
+            JobProfile profile = job.getProfile();
+            if (filter.states != null && !filter.states.isEmpty()) {
+                ThriftJobState state = jobRunStateToThrift(job.getStatus().getRunState());
+                if (!filter.states.contains(state))
+                    return false;
+            }
+            if (filter.user != null && !filter.user.isEmpty() &&
+                    !containsIgnoreCase(profile.getUser(), filter.user.toLowerCase()))
+                return false;
+            if (filter.queue != null && !filter.queue.isEmpty() &&
+                    !containsIgnoreCase(profile.getQueueName(), filter.queue.toLowerCase()))
+                return false;
+            if (filter.text != null && !filter.text.isEmpty()) {
+                // The fields shown in the job list
+                String text = filter.text.toLowerCase();
+                if (!containsIgnoreCase(profile.getUser(), text) &&
+                        !containsIgnoreCase(profile.getJobName(), text) &&
+                        !containsIgnoreCase(job.getJobID().toString(), text) &&
+                        !containsIgnoreCase(profile.getQueueName(), text) &&
+                        !containsIgnoreCase(job.getPriority().toString(), text))
+                    return false;
+            }
+            return true;
+        }
+
+        private static int compareStrings(String a, String b) {
+            if (a == null)
+                return (b == null) ? 0 : -1;
+            if (b == null)
+                return 1;
+            return a.compareToIgnoreCase(b);
+        }
+
+        private static int compareLongs(long a, long b) {
+            return (a < b) ? -1 : ((a == b) ? 0 : 1);
+        }
+
+        /**
+         * Returns a comparator ordering jobs as per sort. Ties, and a null
+         * sort, are ordered by job id.
+         */
+        public static Comparator<JobInProgress> getJobComparator(final ThriftJobSort sort) {
+            return new Comparator<JobInProgress>() {
+                public int compare(JobInProgress a, JobInProgress b) {
+                    int ret = 0;
+                    if (sort != null && sort.key != null) {
+                        switch (sort.key) {
+                            case NAME:
+                                ret = compareStrings(a.getProfile().getJobName(),
+                                                     b.getProfile().getJobName());
+                                break;
+                            case USER:
+                                ret = compareStrings(a.getProfile().getUser(),
+                                                     b.getProfile().getUser());
+                                break;
+                            case QUEUE:
+                                ret = compareStrings(a.getProfile().getQueueName(),
+                                                     b.getProfile().getQueueName());
+                                break;
+                            case STATE:
+                                ret = compareLongs(a.getStatus().getRunState(),
+                                                   b.getStatus().getRunState());
+                                break;
+                            case PRIORITY:
+                                ret = a.getPriority().compareTo(b.getPriority());
+                                break;
+                            case START_TIME:
+                                ret = compareLongs(a.getStartTime(), b.getStartTime());
+                                break;
+                            case FINISH_TIME:
+                                ret = compareLongs(a.getFinishTime(), b.getFinishTime());
+                                break;
+                            default:
+                                break;
+                        }
+                    }
+                    if (ret == 0)
+                        ret = a.getJobID().compareTo(b.getJobID());
+                    return (sort != null && sort.descending) ? -ret : ret;
+                }};
+        }
+
     }
 
     public static final Log LOG = LogFactory.getLog(JobTrackerPlugin.class.getName());
@@ -643,6 +847,10 @@ public class ThriftJobTrackerPlugin extends JobTrackerPlugin implements Configur
 
     private Configuration conf;
 
+    private final JobChangeLog jobChangeLog = new JobChangeLog();
+
+    private final TaskListings taskListings = new TaskListings();
+
     private ThriftPluginServer thriftServer;
 
     @Override
@@ -679,6 +887,180 @@ public class ThriftJobTrackerPlugin extends JobTrackerPlugin implements Configur
           }
     }
 
+    /**
+     * Backs getJobsChangedSince(). Remembers the last summary of every job,
+     * and the version at which it changed, so that callers are only sent
+     * the jobs that changed since the version (token) they have seen.
+     *
+     * Versions start at the time the plugin was created, so that tokens
+     * from an earlier JobTracker are older than any version of this one.
+     */
+    static class JobChangeLog {
+        /** How often, at most, the JobTracker's jobs are rescanned */
+        static final long MIN_SCAN_INTERVAL_MS = 1000;
+        /** How many removals are remembered; older tokens get every job */
+        static final int MAX_REMOVED = 10000;
+
+        private long version = System.currentTimeMillis();
+        private long lastScan = 0;
+        /** Tokens older than this may have missed removals */
+        private long removedSince = version;
+        private final Map<JobID, ThriftJobSummary> summaries =
+            new HashMap<JobID, ThriftJobSummary>();
+        private final Map<JobID, Long> versions = new HashMap<JobID, Long>();
+        /** Removed jobs, oldest removal first */
+        private final LinkedHashMap<JobID, Long> removed =
+            new LinkedHashMap<JobID, Long>();
+
+        synchronized ThriftJobChanges changedSince(JobTracker jobTracker, long token) {
+            scan(jobTracker);
+            boolean full = token < removedSince || token > version;
+            List<ThriftJobSummary> changed = new ArrayList<ThriftJobSummary>();
+            for (Map.Entry<JobID, ThriftJobSummary> e : summaries.entrySet()) {
+                if (full || versions.get(e.getKey()) > token)
+                    changed.add(e.getValue());
+            }
+            List<ThriftJobID> gone = new ArrayList<ThriftJobID>();
+            if (!full) {
+                for (Map.Entry<JobID, Long> e : removed.entrySet()) {
+                    if (e.getValue() > token)
+                        gone.add(JTThriftUtils.toThrift(e.getKey()));
+                }
+            }
+            return new ThriftJobChanges(changed, gone, version, full);
+        }
+
+        /** Compares every job to its last summary, and bumps the version if any changed */
+        private void scan(JobTracker jobTracker) {
+            long now = System.currentTimeMillis();
+            if (now - lastScan < MIN_SCAN_INTERVAL_MS)
+                return;
+            lastScan = now;
+
+            long next = version + 1;
+            boolean bumped = false;
+            Set<JobID> seen = new HashSet<JobID>();
+            // Unlike the running/completed/failed lists, this includes PREP jobs
+            for (JobStatus status : jobTracker.getAllJobs()) {
+                JobInProgress job = jobTracker.getJob(status.getJobID());
+                if (job == null)
+                    continue;
+                JobID id = job.getJobID();
+                seen.add(id);
+                ThriftJobSummary summary = JTThriftUtils.toThriftSummary(job);
+                if (!summary.equals(summaries.get(id))) {
+                    summaries.put(id, summary);
+                    versions.put(id, next);
+                    removed.remove(id);
+                    bumped = true;
+                }
+            }
+            for (Iterator<JobID> it = summaries.keySet().iterator(); it.hasNext(); ) {
+                JobID id = it.next();
+                if (!seen.contains(id)) {
+                    it.remove();
+                    versions.remove(id);
+                    removed.put(id, next);
+                    bumped = true;
+                }
+            }
+            while (removed.size() > MAX_REMOVED) {
+                Iterator<Map.Entry<JobID, Long>> it = removed.entrySet().iterator();
+                removedSince = it.next().getValue();
+                it.remove();
+            }
+            if (bumped)
+                version = next;
+        }
+    }
+
+    /**
+     * Backs getTaskPage(). Keeps the tasks of a job that matched a filter,
+     * in order, for a while after they were last paged through, so that the
+     * next pages (e.g., as a user scrolls) don't filter every task of the
+     * job again.
+     *
+     * Cursors are "listing id:position". When the listing of a cursor has
+     * expired, the filter is applied again, and paging resumes from the
+     * same position of the new listing.
+     */
+    static class TaskListings {
+        /** Listings unused for this long are dropped */
+        static final long EXPIRY_MS = 60 * 1000;
+        /** How many listings are kept, at most */
+        static final int MAX_LISTINGS = 100;
+
+        static class Listing {
+            final long id;
+            final JobID jobID;
+            final String filter;
+            final TaskInProgress[] tips;
+            long lastUsed;
+
+            Listing(long id, JobID jobID, String filter, TaskInProgress[] tips) {
+                this.id = id;
+                this.jobID = jobID;
+                this.filter = filter;
+                this.tips = tips;
+            }
+
+            String cursor(int position) {
+                return id + ":" + position;
+            }
+        }
+
+        /** Ids start at the time the plugin was created, as in JobChangeLog */
+        private long nextId = System.currentTimeMillis();
+        /** Listings by id, least recently used first */
+        private final LinkedHashMap<Long, Listing> listings =
+            new LinkedHashMap<Long, Listing>(16, 0.75f, true);
+
+        /** Returns a key identifying the filter of a getTaskPage() call */
+        static String filterKey(Set<ThriftTaskType> types,
+                                Set<ThriftTaskQueryState> states,
+                                String text) {
+            return new TreeSet<ThriftTaskType>(types) + "/" +
+                new TreeSet<ThriftTaskQueryState>(states) + "/" +
+                (text == null ? "" : text.trim().toUpperCase());
+        }
+
+        /**
+         * Returns the listing with the given id, if it is of the same job
+         * and filter, or null.
+         */
+        synchronized Listing get(long id, JobID jobID, String filter) {
+            long now = System.currentTimeMillis();
+            expire(now);
+            Listing listing = listings.get(id);
+            if (listing == null || !listing.jobID.equals(jobID) ||
+                    !listing.filter.equals(filter))
+                return null;
+            listing.lastUsed = now;
+            return listing;
+        }
+
+        synchronized Listing add(JobID jobID, String filter, List<TaskInProgress> tips) {
+            long now = System.currentTimeMillis();
+            expire(now);
+            Listing listing = new Listing(nextId++, jobID, filter,
+                                          tips.toArray(new TaskInProgress[tips.size()]));
+            listing.lastUsed = now;
+            listings.put(listing.id, listing);
+            Iterator<Listing> it = listings.values().iterator();
+            while (listings.size() > MAX_LISTINGS) {
+                it.next();
+                it.remove();
+            }
+            return listing;
+        }
+
+        private void expire(long now) {
+            Iterator<Listing> it = listings.values().iterator();
+            while (it.hasNext() && now - it.next().lastUsed > EXPIRY_MS)
+                it.remove();
+        }
+    }
+
     /** Java server-side implementation of the 'Jobtracker' Thrift interface. */
     class ThriftHandler extends ThriftHandlerBase implements Jobtracker.Iface {
 
@@ -733,6 +1115,17 @@ public class ThriftJobTrackerPlugin extends JobTrackerPlugin implements Configur
             return JTThriftUtils.toThrift(job, jobTracker);
         }
 
+        /** Returns the job with the given ID, without its tasks */
+        public ThriftJobInProgress getJobNoTasks(RequestContext ctx, ThriftJobID jobID) throws JobNotFoundException {
+            assumeUserContext(ctx);
+            JobID jid = JTThriftUtils.fromThrift(jobID);
+            JobInProgress job = jobTracker.getJob(jid);
+            if (job == null) {
+              throw new JobNotFoundException();
+            }
+            return JTThriftUtils.toThrift(job, false, jobTracker);
+        }
+
         /** Returns all running jobs (does not include task info) */
         public ThriftJobList getRunningJobs(RequestContext ctx) {
             assumeUserContext(ctx);
@@ -814,6 +1207,54 @@ public class ThriftJobTrackerPlugin extends JobTrackerPlugin implements Configur
             return new ThriftJobList(ret);
         }
 
+        /**
+         * Returns the jobs matching filter, in the given order.
+         * Filtering and sorting happen before converting anything,
+         * so that only the requested page is sent over.
+         */
+        private List<JobInProgress> selectJobs(ThriftJobFilter filter, ThriftJobSort sort) {
+            List<JobInProgress> jobList = new ArrayList<JobInProgress>();
+            jobList.addAll(jobTracker.getRunningJobs());
+            synchronized(jobTracker){
+                jobList.addAll(jobTracker.failedJobs());
+                jobList.addAll(jobTracker.completedJobs());
+            }
+
+            List<JobInProgress> matches = new ArrayList<JobInProgress>();
+            for (JobInProgress job : jobList) {
+                if (JTThriftUtils.matches(job, filter))
+                    matches.add(job);
+            }
+            Collections.sort(matches, JTThriftUtils.getJobComparator(sort));
+            return matches;
+        }
+
+        /** Returns the [offset, offset + limit) slice of jobs; all of the rest if limit is negative */
+        private List<JobInProgress> page(List<JobInProgress> jobs, int offset, int limit) {
+            int fromIdx = Math.min(Math.max(offset, 0), jobs.size());
+            int toIdx = (limit < 0) ? jobs.size() :
+                Math.min(fromIdx + limit, jobs.size());
+            return jobs.subList(fromIdx, toIdx);
+        }
+
+        /** Returns the summaries of one page of the jobs matching filter */
+        public ThriftJobSummaryList getJobSummaries(RequestContext ctx, ThriftJobFilter filter,
+                                                    ThriftJobSort sort, int offset, int limit) {
+            assumeUserContext(ctx);
+            List<JobInProgress> matches = selectJobs(filter, sort);
+            List<ThriftJobSummary> ret = new ArrayList<ThriftJobSummary>();
+            for (JobInProgress job : page(matches, offset, limit)) {
+                ret.add(JTThriftUtils.toThriftSummary(job));
+            }
+            return new ThriftJobSummaryList(ret, matches.size());
+        }
+
+        /** Returns the summaries of the jobs that changed since token */
+        public ThriftJobChanges getJobsChangedSince(RequestContext ctx, long token) {
+            assumeUserContext(ctx);
+            return jobChangeLog.changedSince(jobTracker, token);
+        }
+
         /**
          * Return the count of jobs, broken down by status, for a given user.
          */
@@ -866,78 +1307,164 @@ public class ThriftJobTrackerPlugin extends JobTrackerPlugin implements Configur
             if (job == null)
                 throw new JobNotFoundException();
 
-            // Gather all the tasks of the matching type
-            List<TaskInProgress> allTips = new ArrayList<TaskInProgress>();
-            synchronized(job) {
-                if (types.contains(ThriftTaskType.MAP))
-                    allTips.addAll(Arrays.asList(job.getMapTasks()));
-                if (types.contains(ThriftTaskType.REDUCE))
-                    allTips.addAll(Arrays.asList(job.getReduceTasks()));
-                if (types.contains(ThriftTaskType.JOB_CLEANUP))
-                    allTips.addAll(Arrays.asList(
-                          JTThriftUtils.sanitizeCleanupSetupTask(job.getCleanupTasks())));
-                if (types.contains(ThriftTaskType.JOB_SETUP))
-                    allTips.addAll(Arrays.asList(
-                          JTThriftUtils.sanitizeCleanupSetupTask(job.getSetupTasks())));
-            }
+            List<TaskInProgress> matches =
+                JTThriftUtils.matchingTasks(job, types, states, text);
 
             // Are the arguments out of bound?
-            if (count < 0 || offset < 0 || offset >= allTips.size()) {
+            if (count < 0 || offset < 0 || offset > matches.size()) {
                 LOG.error("Bad arguments to getTaskList(): count " + count +
                           "; offset " + offset +
-                          "; while total tasks count is " + allTips.size());
+                          "; while matching tasks count is " + matches.size());
                 return JTThriftUtils.toThrift(new TaskInProgress[0], jobTracker, 0, 0);
             }
 
-            List<TaskInProgress> matches = null;
-            if (text == null)
-                text = "";
-            else
-                text = text.trim();
+            return JTThriftUtils.toThrift(matches.toArray(new TaskInProgress[matches.size()]),
+                                          jobTracker, offset, offset + count);
+        }
 
-            boolean doFilterStates = (states.size() !=
-                                      ThriftTaskQueryState.class.getEnumConstants().length);
-            boolean doFilterText = !text.isEmpty();
 
-            if (doFilterStates || doFilterText) {
-                text = text.toUpperCase();
-                matches = new ArrayList<TaskInProgress>();
+        /**
+         * Returns the count tasks in any of states that started executing
+         * last (or first, unless newestFirst). Only the selected tasks are
+         * converted, and they are picked with a bounded heap, so this is
+         * cheap even for jobs with very many tasks.
+         */
+        public ThriftTaskInProgressList getTopTasks(RequestContext ctx,
+                                                    ThriftJobID thriftJobID,
+                                                    Set<ThriftTaskQueryState> states,
+                                                    int count,
+                                                    final boolean newestFirst)
+                throws JobNotFoundException {
+            assumeUserContext(ctx);
+            JobID jid = JTThriftUtils.fromThrift(thriftJobID);
+            JobInProgress job = jobTracker.getJob(jid);
+            if (job == null)
+                throw new JobNotFoundException();
 
-                // Note that it's important to finish all matching, regardless
-                // of the requested count, because we need to report the total
-                // number of matches.
-                for (TaskInProgress tip : allTips) {
-                    ThriftTaskQueryState qstate = null;
+            List<TaskInProgress> allTips = new ArrayList<TaskInProgress>();
+            synchronized(job) {
+                allTips.addAll(Arrays.asList(job.getMapTasks()));
+                allTips.addAll(Arrays.asList(job.getReduceTasks()));
+                allTips.addAll(Arrays.asList(
+                      JTThriftUtils.sanitizeCleanupSetupTask(job.getCleanupTasks())));
+                allTips.addAll(Arrays.asList(
+                      JTThriftUtils.sanitizeCleanupSetupTask(job.getSetupTasks())));
+            }
 
-                    if (doFilterStates) {
-                        // Do filter by states
-                        qstate = JTThriftUtils.inferTaskState(tip);
-                        if (!states.contains(qstate))
-                            continue;
-                    }
+            // Orders tasks from the most wanted to the least wanted
+            final Comparator<TaskInProgress> wanted = new Comparator<TaskInProgress>() {
+                public int compare(TaskInProgress foo, TaskInProgress bar) {
+                    long diff = foo.getExecStartTime() - bar.getExecStartTime();
+                    if (diff == 0)
+                        return foo.getTIPId().compareTo(bar.getTIPId());
+                    return ((diff > 0) == newestFirst) ? -1 : 1;
+                }};
+
+            // The head of the heap is the least wanted of the tasks kept so far
+            if (count < 0)
+                count = 0;
+            PriorityQueue<TaskInProgress> heap = new PriorityQueue<TaskInProgress>(
+                count + 1, Collections.reverseOrder(wanted));
+            int nMatches = 0;
+            for (TaskInProgress tip : allTips) {
+                if (!states.contains(JTThriftUtils.inferTaskState(tip)))
+                    continue;
+                ++nMatches;
+                heap.add(tip);
+                if (heap.size() > count)
+                    heap.poll();
+            }
 
-                    if (doFilterText) {
-                        // Match against (1) state, (2) most recent state, (3) ID
-                        if (qstate == null)
-                            qstate = JTThriftUtils.inferTaskState(tip);
-                        String qstateStr = qstate.toString();
-                        if (!qstateStr.contains(text) &&
-                                !tip.getTIPId().toString().toUpperCase().contains(text) &&
-                                !tip.generateSingleReport().getState().toUpperCase().contains(text))
-                            continue;
-                    }
+            TaskInProgress[] top = heap.toArray(new TaskInProgress[heap.size()]);
+            Arrays.sort(top, wanted);
+            ThriftTaskInProgressList ret = JTThriftUtils.toThrift(top, jobTracker, 0, top.length);
+            ret.setNumTotalTasks(nMatches);
+            return ret;
+        }
 
-                    matches.add(tip);
+        /**
+         * Returns count tasks from cursor on, of the tasks that match the
+         * filter (see getTaskList()). The matching tasks are listed when
+         * cursor is empty, unknown, or of another filter.
+         */
+        public ThriftTaskPage getTaskPage(RequestContext ctx,
+                                          ThriftJobID thriftJobID,
+                                          Set<ThriftTaskType> types,
+                                          Set<ThriftTaskQueryState> states,
+                                          String text,
+                                          String cursor,
+                                          int count) throws JobNotFoundException {
+            assumeUserContext(ctx);
+            JobID jid = JTThriftUtils.fromThrift(thriftJobID);
+            JobInProgress job = jobTracker.getJob(jid);
+            if (job == null)
+                throw new JobNotFoundException();
+
+            String filter = TaskListings.filterKey(types, states, text);
+            long listingId = -1;
+            int position = 0;
+            if (cursor != null && cursor.length() > 0) {
+                try {
+                    int colon = cursor.indexOf(':');
+                    listingId = Long.parseLong(cursor.substring(0, colon));
+                    position = Integer.parseInt(cursor.substring(colon + 1));
+                } catch (RuntimeException e) {
+                    LOG.warn("Bad cursor to getTaskPage(): " + cursor);
                 }
-            } else {
-              // If not filtering, we just do offset/limit into the full list
-              matches = allTips;
             }
 
-            return JTThriftUtils.toThrift(matches.toArray(new TaskInProgress[matches.size()]),
-                                          jobTracker, offset, offset + count);
+            TaskListings.Listing listing = taskListings.get(listingId, jid, filter);
+            if (listing == null) {
+                listing = taskListings.add(
+                    jid, filter, JTThriftUtils.matchingTasks(job, types, states, text));
+            }
+
+            int total = listing.tips.length;
+            position = Math.max(0, Math.min(position, total));
+            int end = Math.min(position + Math.max(count, 0), total);
+            ThriftTaskInProgressList page =
+                JTThriftUtils.toThrift(listing.tips, jobTracker, position, end);
+            return new ThriftTaskPage(page.tasks, total,
+                                      end < total ? listing.cursor(end) : "");
         }
 
+        /**
+         * Returns the type, state, start and finish times of every task of
+         * the job, without their counters and attempts.
+         */
+        public ThriftTaskTimeline getTaskTimeline(RequestContext ctx,
+                                                  ThriftJobID thriftJobID)
+                throws JobNotFoundException {
+            assumeUserContext(ctx);
+            JobID jid = JTThriftUtils.fromThrift(thriftJobID);
+            JobInProgress job = jobTracker.getJob(jid);
+            if (job == null)
+                throw new JobNotFoundException();
+
+            List<TaskInProgress> tips = new ArrayList<TaskInProgress>();
+            synchronized(job) {
+                tips.addAll(Arrays.asList(
+                      JTThriftUtils.sanitizeCleanupSetupTask(job.getSetupTasks())));
+                tips.addAll(Arrays.asList(job.getMapTasks()));
+                tips.addAll(Arrays.asList(job.getReduceTasks()));
+                tips.addAll(Arrays.asList(
+                      JTThriftUtils.sanitizeCleanupSetupTask(job.getCleanupTasks())));
+            }
+
+            int n = tips.size();
+            ThriftTaskTimeline ret = new ThriftTaskTimeline(
+                new ArrayList<Integer>(n), new ArrayList<ThriftTaskType>(n),
+                new ArrayList<ThriftTaskQueryState>(n), new ArrayList<Long>(n),
+                new ArrayList<Long>(n), System.currentTimeMillis());
+            for (TaskInProgress tip : tips) {
+                ret.taskNumbers.add(tip.getTIPId().getId());
+                ret.taskTypes.add(JTThriftUtils.getTaskInProgressType(tip));
+                ret.states.add(JTThriftUtils.inferTaskState(tip));
+                ret.startTimes.add(tip.getExecStartTime());
+                ret.finishTimes.add(tip.getExecFinishTime());
+            }
+            return ret;
+        }
 
         /** Returns the task identified by the id */
         public ThriftTaskInProgress getTask(RequestContext ctx, ThriftTaskID ttaskId)
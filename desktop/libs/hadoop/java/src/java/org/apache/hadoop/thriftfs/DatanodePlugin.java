@@ -20,15 +20,21 @@ package org.apache.hadoop.thriftfs;
 import java.io.EOFException;
 import java.net.InetSocketAddress;
 import java.net.Socket;
+import java.util.ArrayList;
+import java.util.Iterator;
+import java.util.LinkedHashMap;
+import java.util.List;
 import java.util.zip.CRC32;
 
 import org.apache.commons.logging.Log;
 import org.apache.commons.logging.LogFactory;
 import org.apache.hadoop.conf.Configurable;
 import org.apache.hadoop.conf.Configuration;
+import org.apache.hadoop.fs.FSInputStream;
 import org.apache.hadoop.hdfs.DFSClient;
 import org.apache.hadoop.hdfs.server.datanode.DataNode;
 import org.apache.hadoop.net.NetUtils;
+import org.apache.hadoop.security.UnixUserGroupInformation;
 import org.apache.hadoop.security.UserGroupInformation;
 import org.apache.hadoop.thriftfs.api.Block;
 import org.apache.hadoop.thriftfs.api.BlockData;
@@ -40,6 +46,11 @@ import org.apache.hadoop.util.ServicePlugin;
 import org.apache.thrift.TException;
 import org.apache.thrift.TProcessor;
 import org.apache.thrift.TProcessorFactory;
+import org.apache.thrift.protocol.TBinaryProtocol;
+import org.apache.thrift.protocol.TField;
+import org.apache.thrift.protocol.TProtocol;
+import org.apache.thrift.protocol.TStruct;
+import org.apache.thrift.protocol.TType;
 import org.apache.thrift.transport.TTransport;
 
 public class DatanodePlugin
@@ -56,6 +67,43 @@ public class DatanodePlugin
    */
   public static final String DEFAULT_THRIFT_ADDRESS = "0.0.0.0:0";
 
+  /**
+   * Name of the configuration property of the largest read buffer kept
+   * around, per server thread, between calls to readBlock.
+   */
+  public static final String READ_BUFFER_SIZE_PROPERTY =
+      "dfs.thrift.datanode.read.buffer.size";
+  public static final int DEFAULT_READ_BUFFER_SIZE = 4 * 1024 * 1024;
+
+  /**
+   * Read buffers, reused across calls handled by the same server thread.
+   * The Python client opens a connection per read, so these can't
+   * belong to the (per connection) handler.
+   */
+  private final ThreadLocal<byte[]> readBuffers = new ThreadLocal<byte[]>();
+
+  /** The most DFSClients kept for readRange, beyond those in use. */
+  static final int MAX_DFS_CLIENTS = 16;
+
+  /**
+   * The DFSClients readRange reads through, one per user, in least recently
+   * used order.  Like the read buffers, they outlive the (per connection)
+   * handlers.  A DFSClient may be used by several threads at once.  Guarded
+   * by itself.
+   */
+  private final LinkedHashMap<String, CachedDFSClient> dfsClients =
+      new LinkedHashMap<String, CachedDFSClient>(16, 0.75f, true);
+
+  /** A cached DFSClient, and the number of reads going through it. */
+  private static class CachedDFSClient {
+    final DFSClient client;
+    int users = 0;
+
+    CachedDFSClient(DFSClient client) {
+      this.client = client;
+    }
+  }
+
   private DataNode datanode;
   private Thread registerThread;
   private volatile boolean register;
@@ -73,28 +121,48 @@ public class DatanodePlugin
   class ThriftHandler extends ThriftHandlerBase implements Datanode.Iface {
 
     private int bufferSize;
+    private int maxReadBufferSize;
     private CRC32 summer;
 
     public ThriftHandler(ThriftServerContext context) {
       super(context);
       this.bufferSize = conf.getInt("io.file.buffer.size", 4096);
+      this.maxReadBufferSize = conf.getInt(READ_BUFFER_SIZE_PROPERTY,
+                                           DEFAULT_READ_BUFFER_SIZE);
       this.summer = new CRC32();
     }
 
-    public BlockData readBlock(RequestContext ctx, Block block, long offset, int length)
+    /**
+     * Returns a buffer of at least length bytes.  Buffers up to
+     * maxReadBufferSize are kept for the next call on this thread.
+     */
+    private byte[] getReadBuffer(int length) {
+      byte[] buf = readBuffers.get();
+      if (buf != null && buf.length >= length) {
+        return buf;
+      }
+      buf = new byte[length];
+      if (length <= maxReadBufferSize) {
+        readBuffers.set(buf);
+      }
+      return buf;
+    }
+
+    public BlockData readBlock(RequestContext ctx, Block block, long offset, int length,
+                               boolean skipCrc)
         throws IOException, TException {
       assumeUserContext(ctx);
       LOG.debug("readBlock(" + block.blockId + "," + offset + "," + length
           + "): Entering");
 
-      BlockData ret = new BlockData();
+      BlockData ret;
       DFSClient.BlockReader reader = null;
       try {
         reader = DFSClient.BlockReader.newBlockReader(
           getSocket(), block.path,
           block.blockId, block.genStamp,
           offset, length, bufferSize, true, serverContext.getClientName());
-        byte[] buf = new byte[length];
+        byte[] buf = getReadBuffer(length);
         int n = reader.read(buf, 0, length);
         if (n == -1) {
           throw new EOFException("EOF reading " + length + " bytes at offset "
@@ -103,25 +171,19 @@ public class DatanodePlugin
         LOG.debug("readBlock(" + block.blockId + ", " + offset + ", " + length
             + "): Read " + n + " bytes");
 
-        if (n == length) {
-            // If we read exactly the same number of bytes that was asked for,
-            // we can simply return the buffer directly
-            ret.data = buf;
-        } else {
-            assert n < length;
-            // If we read fewer bytes than they asked for, we need to write
-            // back a smaller byte array. With the appropriate thrift hook
-            // we could avoid this copy, too.
-            ret.data = new byte[n];
-            System.arraycopy(buf, 0, ret.data, 0, n);
+        // The buffer may be longer than what was read (a short read, or a
+        // reused buffer): only the first n bytes are sent back.  Since the
+        // response is written out by this thread before it handles another
+        // call, the buffer is free for reuse by then.
+        ret = new SlicedBlockData(buf, n);
+
+        if (!skipCrc) {
+          summer.update(buf, 0, n);
+          ret.crc = (int) summer.getValue();
+          summer.reset();
+          LOG.debug("readBlock(" + block.blockId + ", " + offset + ", " + length
+              + "): CRC32: " + ret.crc);
         }
-        ret.length = n;
-
-        summer.update(ret.data);
-        ret.crc = (int) summer.getValue();
-        summer.reset();
-        LOG.debug("readBlock(" + block.blockId + ", " + offset + ", " + length
-            + "): CRC32: " + ret.crc);
       } catch (Throwable t) {
         LOG.info("readBlock(" + block.blockId + ", " + offset + ", " + length
             + "): Failed", t);
@@ -139,12 +201,164 @@ public class DatanodePlugin
       return ret;
     }
 
+    public BlockData readRange(RequestContext ctx, String path, long offset, int length,
+                               boolean skipCrc)
+        throws IOException, TException {
+      assumeUserContext(ctx);
+      LOG.debug("readRange(" + path + "," + offset + "," + length
+          + "): Entering");
+
+      BlockData ret;
+      CachedDFSClient client = null;
+      FSInputStream in = null;
+      try {
+        // A client of our own, as the requesting user, so that the
+        // NameNode checks their permissions.  It hands out block
+        // locations sorted by distance to us, so local replicas are
+        // read first.
+        client = acquireDFSClient(
+            (UnixUserGroupInformation) UserGroupInformation.getCurrentUGI());
+        in = client.client.open(path);
+
+        byte[] buf = getReadBuffer(length);
+        int n = 0;
+        while (n < length) {
+          // Positional reads go across block boundaries.
+          int read = in.read(offset + n, buf, n, length - n);
+          if (read == -1) {
+            break;
+          }
+          n += read;
+        }
+        LOG.debug("readRange(" + path + ", " + offset + ", " + length
+            + "): Read " + n + " bytes");
+
+        ret = new SlicedBlockData(buf, n);
+        if (!skipCrc) {
+          summer.update(buf, 0, n);
+          ret.crc = (int) summer.getValue();
+          summer.reset();
+        }
+      } catch (Throwable t) {
+        LOG.info("readRange(" + path + ", " + offset + ", " + length
+            + "): Failed", t);
+        throw ThriftUtils.toThrift(t);
+      } finally {
+        if (in != null) {
+          try {
+            in.close();
+          } catch (Throwable t) {
+            LOG.warn("readRange(" + path + "): Cannot close input stream", t);
+          }
+        }
+        if (client != null) {
+          releaseDFSClient(client);
+        }
+      }
+      return ret;
+    }
+
     private Socket getSocket() throws java.io.IOException {
       InetSocketAddress addr = datanode.getSelfAddr();
       return new Socket(addr.getAddress(), addr.getPort());
     }
   }
 
+  /**
+   * BlockData whose data is the first length bytes of a (possibly longer)
+   * buffer.  Serializes the same as a BlockData holding a copy of those
+   * bytes.
+   */
+  static class SlicedBlockData extends BlockData {
+    private static final TStruct STRUCT_DESC = new TStruct("BlockData");
+    private static final TField CRC_FIELD_DESC = new TField("crc", TType.I32, (short)1);
+    private static final TField LENGTH_FIELD_DESC = new TField("length", TType.I32, (short)2);
+    private static final TField DATA_FIELD_DESC = new TField("data", TType.STRING, (short)3);
+
+    SlicedBlockData(byte[] buf, int length) {
+      this.data = buf;
+      this.length = length;
+      setLengthIsSet(true);
+    }
+
+    @Override
+    public void write(TProtocol oprot) throws TException {
+      if (!(oprot instanceof TBinaryProtocol)) {
+        // Only the binary protocol's encoding of binary fields is known
+        // here; fall back to a copy of the slice.
+        BlockData copy = new BlockData(crc, length, new byte[length]);
+        System.arraycopy(data, 0, copy.data, 0, length);
+        copy.write(oprot);
+        return;
+      }
+      oprot.writeStructBegin(STRUCT_DESC);
+      oprot.writeFieldBegin(CRC_FIELD_DESC);
+      oprot.writeI32(this.crc);
+      oprot.writeFieldEnd();
+      oprot.writeFieldBegin(LENGTH_FIELD_DESC);
+      oprot.writeI32(this.length);
+      oprot.writeFieldEnd();
+      oprot.writeFieldBegin(DATA_FIELD_DESC);
+      // What TBinaryProtocol.writeBinary() does, for a slice.
+      oprot.writeI32(this.length);
+      oprot.getTransport().write(this.data, 0, this.length);
+      oprot.writeFieldEnd();
+      oprot.writeFieldStop();
+      oprot.writeStructEnd();
+    }
+  }
+
+  /**
+   * Returns the DFSClient of the given user, creating it if necessary.
+   * Callers hand it back with releaseDFSClient() once done with it.
+   */
+  private CachedDFSClient acquireDFSClient(UnixUserGroupInformation ugi)
+      throws java.io.IOException {
+    String key = ugi.toString();
+    synchronized (dfsClients) {
+      CachedDFSClient client = dfsClients.get(key);
+      if (client == null) {
+        Configuration userConf = new Configuration(conf);
+        UnixUserGroupInformation.saveToConf(userConf,
+            UnixUserGroupInformation.UGI_PROPERTY_NAME, ugi);
+        client = new CachedDFSClient(new DFSClient(userConf));
+        dfsClients.put(key, client);
+      }
+      client.users++;
+      return client;
+    }
+  }
+
+  /**
+   * Hands back a DFSClient returned by acquireDFSClient().  Then closes the
+   * least recently used clients that aren't in use, beyond MAX_DFS_CLIENTS.
+   */
+  private void releaseDFSClient(CachedDFSClient client) {
+    List<DFSClient> evicted = new ArrayList<DFSClient>();
+    synchronized (dfsClients) {
+      client.users--;
+      Iterator<CachedDFSClient> it = dfsClients.values().iterator();
+      while (dfsClients.size() > MAX_DFS_CLIENTS && it.hasNext()) {
+        CachedDFSClient lru = it.next();
+        if (lru.users == 0) {
+          it.remove();
+          evicted.add(lru.client);
+        }
+      }
+    }
+    closeDFSClients(evicted);
+  }
+
+  private static void closeDFSClients(List<DFSClient> clients) {
+    for (DFSClient client : clients) {
+      try {
+        client.close();
+      } catch (Throwable t) {
+        LOG.warn("Cannot close DFS client", t);
+      }
+    }
+  }
+
   public void setConf(Configuration conf) {
     this.conf = conf;
   }
@@ -224,6 +438,15 @@ public class DatanodePlugin
     } catch (Throwable t) {}
 
     thriftServer.stop();
+
+    List<DFSClient> clients = new ArrayList<DFSClient>();
+    synchronized (dfsClients) {
+      for (CachedDFSClient client : dfsClients.values()) {
+        clients.add(client.client);
+      }
+      dfsClients.clear();
+    }
+    closeDFSClients(clients);
   }
 
   @Override
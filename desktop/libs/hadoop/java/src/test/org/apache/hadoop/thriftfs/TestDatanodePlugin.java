@@ -19,6 +19,7 @@
 package org.apache.hadoop.thriftfs;
 
 import java.util.List;
+import java.util.zip.CRC32;
 
 import org.apache.commons.logging.Log;
 import org.apache.commons.logging.LogFactory;
@@ -95,10 +96,20 @@ public class TestDatanodePlugin  {
     DatanodeInfo node = b.nodes.get(0);
     datanode = Helper.createDatanodeClient(node);
 
-    BlockData blockData = datanode.readBlock(ctx, b, 0, 32);
+    BlockData blockData = datanode.readBlock(ctx, b, 0, 32, false);
     LOG.debug("Read block: " + blockData);
     assertEquals("0000 - Thirty-two bytes in a row",
         new String(blockData.data));
+    CRC32 summer = new CRC32();
+    summer.update(blockData.data);
+    assertEquals((int) summer.getValue(), blockData.crc);
+
+    // Same data, without the CRC.
+    blockData = datanode.readBlock(ctx, b, 0, 32, true);
+    assertEquals(32, blockData.length);
+    assertEquals("0000 - Thirty-two bytes in a row",
+        new String(blockData.data));
+    assertEquals(0, blockData.crc);
 
     createFile(BLOCK_SIZE + 32);
     blocks = namenode.getBlocks(ctx, testFile, 0, BLOCK_SIZE + 32);
@@ -109,24 +120,52 @@ public class TestDatanodePlugin  {
     node = b.nodes.get(0);
     datanode = Helper.createDatanodeClient(node);
 
-    blockData = datanode.readBlock(ctx, b, 0, BLOCK_SIZE);
+    blockData = datanode.readBlock(ctx, b, 0, BLOCK_SIZE, false);
     assertEquals(BLOCK_SIZE, blockData.length);
     String data = new String(blockData.data);
     assertTrue(data.startsWith("0000 - Thirty-two bytes in a row"));
     assertTrue(data.endsWith("0255 - Thirty-two bytes in a row"));
 
-    blockData = datanode.readBlock(ctx, b, 32, 32);
+    // Smaller than the previous read, so the server reuses its buffer;
+    // only what was read must come back.
+    blockData = datanode.readBlock(ctx, b, 32, 32, false);
     assertEquals(32, blockData.length);
     assertEquals("0001 - Thirty-two bytes in a row",
         new String(blockData.data));
 
     b = blocks.get(1);
-    blockData = datanode.readBlock(ctx, b, 0, 32);
+    blockData = datanode.readBlock(ctx, b, 0, 32, false);
     assertEquals(32, blockData.length);
     assertEquals("0256 - Thirty-two bytes in a row",
         new String(blockData.data));
   }
 
+  @Test
+  public void testReadRange() throws Exception {
+    createFile(BLOCK_SIZE + 64);
+    List<Block> blocks = namenode.getBlocks(ctx, testFile, 0, 32);
+    datanode = Helper.createDatanodeClient(blocks.get(0).nodes.get(0));
+
+    // Across the block boundary, in a single call.
+    BlockData blockData = datanode.readRange(ctx, testFile, BLOCK_SIZE - 32, 64, false);
+    assertEquals(64, blockData.length);
+    assertEquals("0255 - Thirty-two bytes in a row0256 - Thirty-two bytes in a row",
+        new String(blockData.data));
+    CRC32 summer = new CRC32();
+    summer.update(blockData.data);
+    assertEquals((int) summer.getValue(), blockData.crc);
+
+    // Short at the end of the file.
+    blockData = datanode.readRange(ctx, testFile, BLOCK_SIZE + 32, 64, true);
+    assertEquals(32, blockData.length);
+    assertEquals("0257 - Thirty-two bytes in a row",
+        new String(blockData.data));
+
+    // Nothing past it.
+    blockData = datanode.readRange(ctx, testFile, BLOCK_SIZE + 64, 32, true);
+    assertEquals(0, blockData.length);
+  }
+
   private void createFile(int length) throws Exception {
     LOG.debug("Creating " + testFilePath);
     FSDataOutputStream out = fs.create(testFilePath, true, BUFFER_SIZE,
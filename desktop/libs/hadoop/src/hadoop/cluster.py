@@ -44,7 +44,8 @@ def _make_filesystem(identifier):
 def _make_mrcluster(identifier):
   cluster_conf = conf.MR_CLUSTERS[identifier]
   return LiveJobTracker(cluster_conf.JT_HOST.get(),
-                        cluster_conf.JT_THRIFT_PORT.get())
+                        cluster_conf.JT_THRIFT_PORT.get(),
+                        snapshot_interval=cluster_conf.SNAPSHOT_INTERVAL.get())
 
 FS_CACHE = None
 def get_hdfs(identifier="default"):
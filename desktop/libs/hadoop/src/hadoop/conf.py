@@ -121,4 +121,9 @@ MR_CLUSTERS = UnspecifiedConfigSection(
     members=dict(
       JT_HOST=Config("jobtracker_host", help="IP for JobTracker"),
       JT_THRIFT_PORT=Config("thrift_port", help="Thrift port for JobTracker", default=9290,
-                            type=int))))
+                            type=int),
+      SNAPSHOT_INTERVAL=Config("snapshot_interval",
+                               help=("Seconds between refreshes of the snapshot of the " +
+                                     "JobTracker's jobs and task trackers shared by all users"),
+                               default=5,
+                               type=int))))
@@ -37,6 +37,7 @@ class ConfParse(dict):
     parser.CharacterDataHandler = self._char_handler
     self._curname = None
     self._element = None
+    self._chars = []
     try:
       if callable(conf.read):
         parser.ParseFile(conf)
@@ -52,12 +53,17 @@ class ConfParse(dict):
 
   def _element_start(self, name, attrs):
     self._element = name
+    self._chars = []
 
   def _element_end(self, name):
+    # The text of an element may come in several pieces (e.g., around
+    # entities, or at buffer boundaries)
+    if self._element == "name":
+      self._curname = "".join(self._chars)
+    elif self._element == "value":
+      self[self._curname] = "".join(self._chars)
     self._element = None
 
   def _char_handler(self, bytes):
-    if self._element == "name":
-      self._curname = bytes
-    if self._element == "value":
-      self[self._curname] = bytes
+    if self._element in ("name", "value"):
+      self._chars.append(bytes)
@@ -194,6 +194,20 @@ class LocalSubFileSystem(object):
 
     return ret
 
+  def read(self, path, offset, length):
+    """
+    Reads up to length bytes of path, starting at offset, like
+    HadoopFileSystem.read().
+    """
+    if length <= 0:
+      return ""
+    f = self.open(path)
+    try:
+      f.seek(offset)
+      return f.read(length)
+    finally:
+      f.close()
+
   def setuser(self, user, groups=None):
     pass
 
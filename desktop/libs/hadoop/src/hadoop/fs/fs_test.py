@@ -54,6 +54,19 @@ class LocalSubFileSystemTest(unittest.TestCase):
 
     self.fs.remove("/x")
 
+  def test_read(self):
+    self.assertRaises(IOError, self.fs.read, "/notfound", 0, 1)
+    f = self.fs.open("/x", "w")
+    f.write("Hello world\n")
+    f.close()
+
+    self.assertEquals("Hello", self.fs.read("/x", 0, 5))
+    self.assertEquals("world\n", self.fs.read("/x", 6, 100))
+    self.assertEquals("", self.fs.read("/x", 100, 5))
+    self.assertEquals("", self.fs.read("/x", 0, 0))
+
+    self.fs.remove("/x")
+
   def test_rename(self):
     # No exceptions means this worked fine.
     self.fs.open("/x", "w").close()
@@ -159,6 +159,67 @@ class HadoopFileSystem(object):
       return FileUpload(self, path, mode, *args, **kwargs)
     return File(self, path, mode, *args, **kwargs)
 
+  @_coerce_exceptions
+  def read(self, path, offset, length):
+    """
+    Reads up to length bytes of path, starting at offset.  Returns fewer
+    bytes only at the end of the file.
+
+    This is a fast path for one-off reads: open() + seek() + read() costs
+    a stat, a getBlocks and a readBlock per block in the range, whereas
+    here a single datanode reads the whole range (see Datanode.readRange).
+    That costs a getBlocks call to find the datanode, and the datanode's
+    own call to the NameNode to open the file.
+    """
+    path = normpath(path)
+    if length <= 0:
+      return ""
+    block = self._get_first_block(path, offset)
+    if block is None:
+      # At or past the end of the file.
+      return ""
+
+    errs = []
+    for node in block.nodes:
+      dn_conn = self._connect_dn(node)
+      try:
+        try:
+          data = dn_conn.readRange(self.request_context, path, offset, length, True)
+          return data.data
+        except IOException, e:
+          if e.clazz == HADOOP_ACCESSCONTROLEXCEPTION:
+            raise
+          errs.append(e)
+        except Exception, e:
+          errs.append(e)
+      finally:
+        dn_conn.close()
+
+    # E.g., datanodes that predate readRange.
+    LOG.warn("Falling back to block reads of %s: %s" % (path, repr(errs)))
+    f = File(self, path)
+    try:
+      f.seek(offset)
+      return f.read(length)
+    finally:
+      f.close()
+
+  def _get_first_block(self, path, offset):
+    """
+    The block holding offset, or None past the end of the file. A missing
+    file is common for read() (e.g. a stale link), so it raises IOError
+    rather than an IOException that _coerce_exceptions would log.
+    """
+    try:
+      blocks = self._get_blocks(path, offset, 1)
+    except IOException, ioe:
+      if ioe.clazz == 'java.io.FileNotFoundException':
+        raise IOError(errno.ENOENT, "No such file or directory: '%s'" % path)
+      raise
+    if not blocks:
+      return None
+    return blocks[0]
+
   @_coerce_exceptions
   def remove(self, path):
     stat = self._hadoop_stat(path)
@@ -319,7 +380,8 @@ class HadoopFileSystem(object):
       dn_conn = self._connect_dn(node)
       try:
         try:
-          data = dn_conn.readBlock(self.request_context, block, offset, len)
+          # We don't check the CRC, so don't have the datanode compute it.
+          data = dn_conn.readBlock(self.request_context, block, offset, len, True)
           return data.data
         except Exception, e:
           errs.append(e)
@@ -407,6 +469,14 @@ class HadoopFileSystem(object):
     may be None.
     """
     summary = self.nn_client.getContentSummary(self.request_context, normpath(path))
+    return self.unpack_content_summary(summary)
+
+  @staticmethod
+  def unpack_content_summary(summary):
+    """
+    Unpack a Thrift "ContentSummary" object into the dictionary
+    returned by get_usage_and_quota.
+    """
     ret = dict()
     ret["file_count"] = summary.fileCount
     ret["space_used"] = summary.spaceConsumed
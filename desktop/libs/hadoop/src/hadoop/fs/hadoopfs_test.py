@@ -104,6 +104,29 @@ def test_seek_across_blocks():
   finally:
     cluster.shutdown()
 
+@attr('requires_hadoop')
+def test_read_range():
+  """Reads ranges, across blocks, in one go"""
+  cluster = mini_cluster.shared_cluster()
+  try:
+    fs = cluster.fs
+    fs.setuser(cluster.superuser)
+    f = fs.open("/fortest-read-range.txt", "w", block_size=1024)
+    try:
+      data = "abcdefghijklmnopqrstuvwxyz" * 300
+      f.write(data)
+      f.close()
+
+      for offset, length in ((0, 10), (1000, 100), (0, len(data)),
+                             (len(data) - 10, 100), (len(data), 10), (10, 0)):
+        assert_equals(data[offset:offset+length],
+                      fs.read("/fortest-read-range.txt", offset, length))
+      assert_raises(IOError, fs.read, "/test/doesnotexist.txt", 0, 10)
+    finally:
+      fs.remove("/fortest-read-range.txt")
+  finally:
+    cluster.shutdown()
+
 
 @attr('requires_hadoop')
 def test_exceptions():
@@ -123,6 +146,7 @@ def test_exceptions():
     # Arguably, this should have thrown already, at open, but
     # we throw the exception lazily, when getting block locations.
     assert_raises(PermissionDeniedException, f.read)
+    assert_raises(PermissionDeniedException, fs.read, "/for_exception_test.txt", 0, 3)
 
     assert_raises(IOError, fs.open, "/test/doesnotexist.txt")
   finally:
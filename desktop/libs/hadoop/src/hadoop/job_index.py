@@ -0,0 +1,210 @@
+#!/usr/bin/env python
+# Licensed to Cloudera, Inc. under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  Cloudera, Inc. licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+In-memory indexes over snapshots of jobs.
+
+A JobIndex is built once per snapshot of the JobTracker's jobs, and then
+answers the queries of the jobs page without looking at every job: text
+filters go through an inverted index of the tokens of the job fields,
+and state filters through per-state buckets kept sorted by start time.
+"""
+import re
+
+# Splits field values into tokens.  A query token is looked up by
+# substring in the vocabulary, so "ob_20" still finds "job_2010..."
+_TOKEN_RE = re.compile(r'[a-z0-9]+')
+
+def tokenize(s):
+  """Returns the set of lowercased alphanumeric tokens of s."""
+  if not s:
+    return set()
+  return set(_TOKEN_RE.findall(s.lower()))
+
+
+class StateBuckets(object):
+  """
+  Items grouped by state, each group sorted by a time key (oldest first).
+  """
+  def __init__(self, items, state_func, time_func):
+    self._buckets = {}
+    for item in items:
+      self._buckets.setdefault(state_func(item), []).append(item)
+    for bucket in self._buckets.itervalues():
+      bucket.sort(key=time_func)
+    self._time_func = time_func
+
+  def states(self):
+    return self._buckets.keys()
+
+  def get(self, state):
+    """Returns the items in state, oldest first.  Do not modify the list."""
+    return self._buckets.get(state, [])
+
+  def count(self, states):
+    return sum(len(self.get(state)) for state in states)
+
+  def top(self, states, n, newest_first=True, offset=0):
+    """
+    Returns the n newest (or oldest) items in any of states, skipping the
+    first offset of them.  Only the first offset + n items of each bucket
+    are looked at.
+    """
+    end = offset + n
+    heads = []
+    for state in states:
+      bucket = self.get(state)
+      if newest_first:
+        heads.extend(bucket[-end:])
+      else:
+        heads.extend(bucket[:end])
+    heads.sort(key=self._time_func, reverse=newest_first)
+    return heads[offset:end]
+
+
+# The fields of a ThriftJobSummary that are indexed, by name.  "text"
+# queries look at all of them, as the jobs page always did.
+_JOB_FIELDS = {
+  'user': lambda s: s.user,
+  'queue': lambda s: s.queueName,
+  'name': lambda s: s.name,
+  'id': lambda s: s.jobID.asString,
+  'priority': lambda s: s.priorityAsString,
+}
+_TEXT_FIELDS = ('user', 'name', 'id', 'queue', 'priority')
+
+def _job_id_key(summary):
+  return (summary.jobID.jobTrackerID, summary.jobID.jobID)
+
+def _lower(s):
+  return s and s.lower()
+
+# Sort keys of job summaries, by hadoop.job_tracker.VALID_JOB_SORT_KEYS.
+# As in the JobTracker, ties are ordered by job id.
+JOB_SORT_KEYS = {
+  None: _job_id_key,
+  "job_id": _job_id_key,
+  "name": lambda s: (_lower(s.name), _job_id_key(s)),
+  "user": lambda s: (_lower(s.user), _job_id_key(s)),
+  "queue": lambda s: (_lower(s.queueName), _job_id_key(s)),
+  "state": lambda s: (s.runState, _job_id_key(s)),
+  "priority": lambda s: (s.priority, _job_id_key(s)),
+  "start_time": lambda s: (s.startTime, _job_id_key(s)),
+  "finish_time": lambda s: (s.finishTime, _job_id_key(s)),
+}
+
+
+class JobIndex(object):
+  """
+  An index over a list of ThriftJobSummary (with their enums fixed up).
+
+  Filters keep the semantics of the JobTracker's getJobSummaries():
+  case-insensitive substring matches.  The inverted index narrows the
+  candidates, which are then checked against the whole filter value.
+  """
+  def __init__(self, summaries):
+    self._jobs = list(summaries)
+    # field -> token -> set of positions in self._jobs
+    self._postings = dict((field, {}) for field in _JOB_FIELDS)
+    for pos, summary in enumerate(self._jobs):
+      for field, get in _JOB_FIELDS.iteritems():
+        postings = self._postings[field]
+        for token in tokenize(get(summary)):
+          postings.setdefault(token, set()).add(pos)
+    self._by_state = StateBuckets(self._jobs,
+                                  lambda s: s.runStateAsString.lower(),
+                                  JOB_SORT_KEYS["start_time"])
+
+  def __len__(self):
+    return len(self._jobs)
+
+  def _match(self, fields, value):
+    """
+    Returns the set of positions of the jobs in which any of fields
+    contains value, ignoring case.
+    """
+    value = value.lower()
+    query_tokens = tokenize(value)
+    result = set()
+    for field in fields:
+      get = _JOB_FIELDS[field]
+      if query_tokens:
+        # Every alphanumeric run of value is within a token of a matching
+        # field, so intersecting the postings of the tokens that contain
+        # each query token gives a superset of the matches.
+        candidates = None
+        for query_token in query_tokens:
+          positions = set()
+          for token, postings in self._postings[field].iteritems():
+            if query_token in token:
+              positions |= postings
+          if candidates is None:
+            candidates = positions
+          else:
+            candidates &= positions
+          if not candidates:
+            break
+      else:
+        candidates = xrange(len(self._jobs))
+      result.update(pos for pos in candidates
+                    if value in (get(self._jobs[pos]) or '').lower())
+    return result
+
+  def query(self, job_states=None, user=None, queue=None, text=None,
+            sort_key=None, descending=False, count=-1, offset=0):
+    """
+    Returns (page, total): count (all if negative) of the matching jobs
+    from offset on, in order, and the number of matching jobs.
+    Arguments are as per LiveJobTracker.get_job_summaries().
+    """
+    if job_states:
+      states = list(job_states)
+    else:
+      states = None
+
+    # Intersect the matches of the substring filters
+    positions = None
+    for fields, value in ((('user',), user), (('queue',), queue), (_TEXT_FIELDS, text)):
+      if value:
+        matches = self._match(fields, value)
+        if positions is None:
+          positions = matches
+        else:
+          positions &= matches
+
+    if positions is None and sort_key == "start_time":
+      # The state buckets are in this order already, so only the
+      # requested page needs looking at.
+      if states is None:
+        states = self._by_state.states()
+      total = self._by_state.count(states)
+      if count < 0:
+        count = total
+      return self._by_state.top(states, count, newest_first=descending, offset=offset), total
+
+    if positions is None:
+      matching = list(self._jobs)
+    else:
+      matching = [ self._jobs[pos] for pos in positions ]
+    if states is not None:
+      matching = [ s for s in matching if s.runStateAsString.lower() in states ]
+    matching.sort(key=JOB_SORT_KEYS[sort_key], reverse=descending)
+
+    if count < 0:
+      page = matching[offset:]
+    else:
+      page = matching[offset:offset + count]
+    return page, len(matching)
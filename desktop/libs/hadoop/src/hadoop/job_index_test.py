@@ -0,0 +1,115 @@
+#!/usr/bin/env python
+# Licensed to Cloudera, Inc. under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  Cloudera, Inc. licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from nose.tools import assert_equal
+
+from desktop.lib.thrift_util import fixup_enums
+from hadoop.api.jobtracker.ttypes import ThriftJobSummary, ThriftJobID, \
+    ThriftJobState, ThriftJobPriority
+from hadoop.job_index import JobIndex, StateBuckets, JOB_SORT_KEYS, tokenize
+
+USERS = ["alice", "bob", "carol_admin"]
+QUEUES = ["default", "etl-nightly"]
+NAMES = ["word count", "Sleep job", "INSERT OVERWRITE TABLE foo", "pi"]
+STATES = [ThriftJobState.RUNNING, ThriftJobState.SUCCEEDED,
+          ThriftJobState.FAILED, ThriftJobState.KILLED, ThriftJobState.PREP]
+
+def make_summaries(n):
+  summaries = []
+  for i in range(n):
+    jobid = "job_201003121527_%04d" % i
+    summary = ThriftJobSummary(
+      jobID=ThriftJobID("201003121527", i, jobid),
+      name="%s %d" % (NAMES[i % len(NAMES)], i % 7),
+      user=USERS[i % len(USERS)],
+      queueName=QUEUES[i % len(QUEUES)],
+      runState=STATES[i % len(STATES)],
+      priority=i % 5,
+      startTime=1000 + (i * 37) % 101,   # Plenty of ties
+      finishTime=0)
+    fixup_enums(summary, {"runState":ThriftJobState, "priority":ThriftJobPriority})
+    summaries.append(summary)
+  return summaries
+
+def scan(summaries, job_states=None, user=None, queue=None, text=None,
+         sort_key=None, descending=False, count=-1, offset=0):
+  """The straightforward implementation of JobIndex.query"""
+  def contains(s, sub):
+    return s is not None and sub.lower() in s.lower()
+  def matches(s):
+    if job_states and s.runStateAsString.lower() not in job_states:
+      return False
+    if user and not contains(s.user, user):
+      return False
+    if queue and not contains(s.queueName, queue):
+      return False
+    if text and not [ f for f in (s.user, s.name, s.jobID.asString, s.queueName,
+                                  s.priorityAsString) if contains(f, text) ]:
+      return False
+    return True
+  matching = [ s for s in summaries if matches(s) ]
+  matching.sort(key=JOB_SORT_KEYS[sort_key], reverse=descending)
+  if count < 0:
+    return matching[offset:], len(matching)
+  return matching[offset:offset + count], len(matching)
+
+def test_tokenize():
+  assert_equal(set(["job", "201003121527", "0001"]), tokenize("job_201003121527_0001"))
+  assert_equal(set(["insert", "overwrite"]), tokenize("INSERT overwrite"))
+  assert_equal(set(), tokenize(None))
+
+def test_query_matches_scan():
+  summaries = make_summaries(200)
+  index = JobIndex(summaries)
+  assert_equal(200, len(index))
+
+  def ids(result):
+    return [ s.jobID.asString for s in result[0] ], result[1]
+
+  queries = [
+    dict(),
+    dict(sort_key="start_time", descending=True, count=10),
+    dict(sort_key="start_time", descending=True, count=10, offset=35),
+    dict(job_states=set(["failed"]), sort_key="start_time", count=5),
+    dict(job_states=set(["failed", "running"]), sort_key="start_time", descending=True,
+         count=7, offset=3),
+    dict(job_states=set(["succeeded"]), sort_key="start_time", descending=True),
+    dict(user="ali"),
+    dict(user="ADMIN", sort_key="name"),
+    dict(queue="etl", sort_key="queue", descending=True),
+    dict(text="count 3"),
+    dict(text="ob_2010", sort_key="start_time", count=10, offset=20),
+    dict(text="_00", sort_key="user"),
+    dict(text="very_high"),
+    dict(text="-"),
+    dict(text="nothing matches this"),
+    dict(user="bob", queue="default", text="sleep", job_states=set(["running", "prep"]),
+         sort_key="finish_time"),
+    dict(job_states=set(["killed"]), sort_key="state"),
+    dict(sort_key="priority", descending=True, count=20, offset=190),
+  ]
+  for query in queries:
+    assert_equal(ids(scan(summaries, **query)), ids(index.query(**query)))
+
+def test_state_buckets():
+  buckets = StateBuckets(range(20), lambda x: x % 2 and "odd" or "even", lambda x: x)
+  assert_equal([0, 2, 4], buckets.get("even")[:3])
+  assert_equal([19, 18, 17], buckets.top(["odd", "even"], 3))
+  assert_equal([16, 15, 14], buckets.top(["odd", "even"], 3, offset=3))
+  assert_equal([1, 3], buckets.top(["odd"], 2, newest_first=False))
+  assert_equal([], buckets.top(["neither"], 2))
+  assert_equal(10, buckets.count(["odd", "neither"]))
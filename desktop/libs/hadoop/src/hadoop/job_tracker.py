@@ -17,6 +17,10 @@
 #
 # Django-side implementation of the JobTracker plugin interface
 
+import logging
+import threading
+import time
+
 from desktop.lib import thrift_util
 from desktop.lib.thrift_util import fixup_enums
 
@@ -24,18 +28,310 @@ from hadoop.api.jobtracker import Jobtracker
 from hadoop.api.jobtracker.ttypes import ThriftJobID, ThriftTaskAttemptID, \
     ThriftTaskType, ThriftTaskPhase, ThriftTaskID, \
     ThriftTaskState, ThriftJobState, ThriftJobPriority, TaskNotFoundException, \
-    JobTrackerState, JobNotFoundException, ThriftTaskQueryState
+    JobTrackerState, JobNotFoundException, ThriftTaskQueryState, \
+    ThriftJobFilter, ThriftJobSort, ThriftJobSortKey, ThriftJobSummaryList
 from hadoop.api.common.ttypes import RequestContext
+from hadoop.job_index import JobIndex
+from hadoop.tracker_registry import TrackerRegistry
 
 VALID_TASK_STATES = set(["succeeded", "failed", "running", "pending", "killed"])
 VALID_TASK_TYPES = set(["map", "reduce", "job_cleanup", "job_setup"])
+VALID_JOB_STATES = set(["running", "succeeded", "failed", "prep", "killed"])
+VALID_JOB_SORT_KEYS = set(["job_id", "name", "user", "queue", "state", "priority",
+                           "start_time", "finish_time"])
 
 # timeout (seconds) for thrift calls to jobtracker
 JT_THRIFT_TIMEOUT=15
 
+# seconds between refreshes of the JobTrackerSnapshot
+DEFAULT_SNAPSHOT_INTERVAL=5
+
+LOG = logging.getLogger(__name__)
+
 DEFAULT_USER = "webui"
 DEFAULT_GROUPS = ["webui"]
 
+
+class JobSummaryCache(object):
+  """
+  A copy of the summaries of the JobTracker's jobs, kept up to date by
+  applying the deltas returned by getJobsChangedSince().
+
+  Each job is stamped with the token at which it was last seen changing,
+  so that clients holding a token of their own (e.g., a browser window)
+  can also be sent just the jobs that changed since.
+  """
+  # How many removals are remembered; older tokens get every job
+  MAX_REMOVED = 10000
+
+  def __init__(self):
+    self.token = 0
+    self._lock = threading.Lock()
+    self._jobs = {}             # job id -> (token, ThriftJobSummary)
+    self._removed = {}          # job id -> token
+    self._removed_since = 0     # Tokens older than this may have missed removals
+
+  def update(self, changes):
+    """Applies a ThriftJobChanges."""
+    self._lock.acquire()
+    try:
+      if changes.token < self.token:
+        # A concurrent refresh got here first with newer changes
+        return
+      if changes.full:
+        self._jobs = {}
+        self._removed = {}
+        self._removed_since = changes.token
+      for summary in changes.changed:
+        jobid = summary.jobID.asString
+        self._jobs[jobid] = (changes.token, summary)
+        self._removed.pop(jobid, None)
+      for thrift_jobid in changes.removed:
+        self._jobs.pop(thrift_jobid.asString, None)
+        self._removed[thrift_jobid.asString] = changes.token
+      if len(self._removed) > self.MAX_REMOVED:
+        oldest = sorted(self._removed.iteritems(), key=lambda x: x[1])
+        for jobid, token in oldest[:len(self._removed) - self.MAX_REMOVED]:
+          del self._removed[jobid]
+          self._removed_since = max(self._removed_since, token)
+      self.token = changes.token
+    finally:
+      self._lock.release()
+
+  def jobs(self):
+    """Returns the ThriftJobSummary of every job."""
+    self._lock.acquire()
+    try:
+      return [ summary for token, summary in self._jobs.itervalues() ]
+    finally:
+      self._lock.release()
+
+  def get(self, jobid):
+    """Returns the ThriftJobSummary of jobid (a job id string), or None."""
+    self._lock.acquire()
+    try:
+      entry = self._jobs.get(jobid)
+      return entry and entry[1]
+    finally:
+      self._lock.release()
+
+  def changed_since(self, token):
+    """
+    Returns (token, full, changed, removed): the current token, whether
+    the given token was unusable (in which case changed has every job),
+    the ThriftJobSummary of the jobs that changed since token, and the ids
+    of the jobs removed since.
+    """
+    self._lock.acquire()
+    try:
+      full = not token or token < self._removed_since or token > self.token
+      changed = [ summary for job_token, summary in self._jobs.itervalues()
+                  if full or job_token > token ]
+      removed = []
+      if not full:
+        removed = [ jobid for jobid, job_token in self._removed.iteritems()
+                    if job_token > token ]
+      return self.token, full, changed, removed
+    finally:
+      self._lock.release()
+
+
+class JobTrackerSnapshot(object):
+  """
+  A picture of the JobTracker's jobs and task trackers, shared by every
+  request in this process instead of being fetched by each of them.
+
+  A single background thread refreshes it every interval seconds; jobs
+  are refreshed incrementally (see JobSummaryCache), and task trackers are
+  kept by name (see TrackerRegistry).  The JobTracker is asked as the web
+  UI user, so anything per-user (e.g., a user's own jobs) is filtered
+  in-process.
+
+  If the snapshot is older than max_age seconds (the thread is behind, or
+  the JobTracker was unreachable), readers refresh it themselves.
+
+  Job kills are confirmed through the snapshot as well: request_kill()
+  notes the kill, and kill_status() reports it confirmed once a refresh
+  sees the job stopped.
+  """
+  # Seconds a requested kill may take to be confirmed before it is
+  # reported as timed out
+  KILL_TIMEOUT = 60
+  # Requested kills are forgotten after this many seconds
+  KILL_RETENTION = 600
+
+  def __init__(self, jt, interval=DEFAULT_SNAPSHOT_INTERVAL, max_age=None):
+    self.jt = jt
+    self.interval = interval
+    self.max_age = max_age or 3 * interval
+    self.request_context = RequestContext(
+      confOptions={'hadoop.job.ugi': ",".join([DEFAULT_USER] + DEFAULT_GROUPS)})
+    self.job_cache = JobSummaryCache()
+    self.refresh_time = None
+    self.tracker_registry = TrackerRegistry()
+    self._refresh_lock = threading.Lock()
+    self._start_lock = threading.Lock()
+    self._thread = None
+    self._stopped = None
+    self._job_index = None        # (token, JobIndex)
+    self._kills = {}              # job id -> time its kill was requested
+    self._listeners = []
+
+  def start(self):
+    """Starts the refresher thread, unless it is running already."""
+    self._start_lock.acquire()
+    try:
+      if self._thread is None:
+        # Each thread has its own event, so that a stopped thread can't
+        # linger on after a restart.
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._run, args=(self._stopped,),
+                                        name="JobTrackerSnapshot")
+        self._thread.setDaemon(True)
+        self._thread.start()
+    finally:
+      self._start_lock.release()
+
+  def stop(self):
+    self._start_lock.acquire()
+    try:
+      if self._thread is not None:
+        self._stopped.set()
+        self._thread = None
+    finally:
+      self._start_lock.release()
+
+  def _run(self, stopped):
+    while not stopped.isSet():
+      try:
+        self.refresh()
+      except Exception:
+        LOG.exception("Failed to refresh the JobTracker snapshot")
+      stopped.wait(self.interval)
+
+  def refresh(self):
+    """Fetches the jobs that changed since the last refresh, and every task tracker."""
+    self._refresh_lock.acquire()
+    try:
+      changes = self.jt.client.getJobsChangedSince(self.request_context, self.job_cache.token)
+      for summary in changes.changed:
+        fixup_enums(summary, {"runState":ThriftJobState, "priority":ThriftJobPriority})
+      self.job_cache.update(changes)
+      trackers = self.jt.client.getAllTrackers(self.request_context).trackers
+      for tracker in trackers:
+        self.jt._fixup_tasktracker(tracker)
+      self.tracker_registry.update(trackers)
+      self.refresh_time = time.time()
+      for jobid, requested in self._kills.items():
+        if self.refresh_time - requested > self.KILL_RETENTION:
+          self._kills.pop(jobid, None)
+    finally:
+      self._refresh_lock.release()
+
+    for listener in list(self._listeners):
+      try:
+        listener(self, changes)
+      except Exception:
+        LOG.exception("JobTracker snapshot listener %r failed" % (listener,))
+
+  def add_listener(self, listener):
+    """
+    Has listener(snapshot, changes) called after every refresh, with the
+    ThriftJobChanges it applied (enums fixed up).  Listeners run in the
+    refreshing thread, so they should be quick.  Adding a listener twice
+    has no effect.
+    """
+    if listener not in self._listeners:
+      self._listeners.append(listener)
+
+  def _ensure_fresh(self):
+    if self._thread is None:
+      self.start()
+    if self.refresh_time is None or time.time() - self.refresh_time > self.max_age:
+      self.refresh()
+
+  @property
+  def jobs(self):
+    """The JobSummaryCache of the jobs"""
+    self._ensure_fresh()
+    return self.job_cache
+
+  @property
+  def trackers(self):
+    """The ThriftTaskTrackerStatus of every task tracker, by name"""
+    self._ensure_fresh()
+    return self.tracker_registry.trackers()
+
+  def tracker(self, name):
+    """Returns the ThriftTaskTrackerStatus of the tracker named name, or None."""
+    self._ensure_fresh()
+    return self.tracker_registry.get(name)
+
+  def trackers_changed_since(self, token):
+    """
+    Returns the (token, full, changed, removed) of the task trackers that
+    changed since token; see TrackerRegistry.changed_since().
+    """
+    self._ensure_fresh()
+    return self.tracker_registry.changed_since(token)
+
+  def jobs_by_user(self, user):
+    """Returns the ThriftJobSummary of the jobs of user."""
+    return [ summary for summary in self.jobs.jobs() if summary.user == user ]
+
+  def get_job_summaries(self, job_states=None, user=None, queue=None, text=None,
+                        sort_key=None, descending=False, count=-1, offset=0):
+    """
+    Like LiveJobTracker.get_job_summaries(), but answered from the snapshot.
+    """
+    assert job_states is None or VALID_JOB_STATES.issuperset(job_states)
+    assert sort_key is None or sort_key in VALID_JOB_SORT_KEYS
+    page, total = self.job_index().query(job_states, user, queue, text,
+                                         sort_key, descending, count, offset)
+    return ThriftJobSummaryList(jobs=page, numTotalJobs=total)
+
+  def request_kill(self, jobid):
+    """
+    Notes that jobid (a job id string) was asked to be killed, so that
+    kill_status() can follow it.  Doesn't kill the job.
+    """
+    self._kills[jobid] = time.time()
+    if self._thread is None:
+      self.start()
+
+  def kill_status(self, jobid):
+    """
+    Returns the status of the kill of jobid noted by request_kill():
+    "confirmed" once the snapshot has the job stopped, "pending" until
+    then, "timed_out" if that has taken over KILL_TIMEOUT seconds, or None
+    if no kill was requested.  Never reaches the JobTracker.
+    """
+    requested = self._kills.get(jobid)
+    if requested is None:
+      return None
+    summary = self.jobs.get(jobid)
+    if summary is not None and summary.runStateAsString not in ("RUNNING", "PREP"):
+      return "confirmed"
+    if time.time() - requested > self.KILL_TIMEOUT:
+      return "timed_out"
+    return "pending"
+
+  def job_index(self):
+    """
+    Returns the JobIndex of the jobs, which is rebuilt only when the jobs
+    have changed.
+    """
+    jobs = self.jobs
+    index = self._job_index
+    if index is None or index[0] != jobs.token:
+      # Read the token first: a concurrent refresh can only make the index
+      # newer than the token it is filed under.
+      token = jobs.token
+      index = (token, JobIndex(jobs.jobs()))
+      self._job_index = index
+    return index[1]
+
+
 class LiveJobTracker(object):
   """
   Connects to a JobTracker over our Thrift interface.
@@ -44,7 +340,7 @@ class LiveJobTracker(object):
   In particular, if Thrift returns None for anything, this will throw.
   """
 
-  def __init__(self, host, thrift_port):
+  def __init__(self, host, thrift_port, snapshot_interval=DEFAULT_SNAPSHOT_INTERVAL):
     self.client = thrift_util.get_client(
       Jobtracker.Client, host, thrift_port, service_name="Hadoop MR JobTracker",
       timeout_seconds=JT_THRIFT_TIMEOUT)
@@ -52,6 +348,7 @@ class LiveJobTracker(object):
     self.thrift_port = thrift_port
     self.request_context = RequestContext()
     self.setuser(DEFAULT_USER, DEFAULT_GROUPS)
+    self._snapshot = JobTrackerSnapshot(self, snapshot_interval)
 
   def thriftjobid_from_string(self, jobid):
     """The jobid looks like this: job_201001301455_0001"""
@@ -197,12 +494,16 @@ class LiveJobTracker(object):
     self._fixup_tasktracker(tracker)
     return tracker
 
-  def get_job(self, jobid):
+  def get_job(self, jobid, include_tasks=True):
     """
-    Returns a ThriftJobInProgress (including task info)
+    Returns a ThriftJobInProgress (including a few of its tasks, unless
+    include_tasks is False; see get_top_tasks for picking them)
     """
     try:
-      job = self.client.getJob(self.request_context, jobid)
+      if include_tasks:
+        job = self.client.getJob(self.request_context, jobid)
+      else:
+        job = self.client.getJobNoTasks(self.request_context, jobid)
     except JobNotFoundException, e:
       e.response_data = dict(code="JT_JOB_NOT_FOUND", message="Could not find job %s on JobTracker." % jobid.asString, data=jobid)
       raise
@@ -254,6 +555,59 @@ class LiveJobTracker(object):
       self._fixup_job(job)
     return joblist
 
+  def get_job_summaries(self, job_states=None, user=None, queue=None, text=None,
+                        sort_key=None, descending=False, count=-1, offset=0):
+    """
+    Returns a ThriftJobSummaryList, which only has the fields shown in job
+    lists, of count jobs (all of them if count is negative), from offset
+    on, of the jobs matching the given criteria.  Its numTotalJobs is the
+    number of matching jobs.  The JobTracker does the filtering and
+    sorting, so only the requested jobs are sent over.
+
+    job_states is a set of VALID_JOB_STATES; None means everything.
+    user, queue and text are matched as case-insensitive substrings.
+    sort_key is one of VALID_JOB_SORT_KEYS; None sorts by job id.
+    """
+    job_filter, sort = self._job_query(job_states, user, queue, text, sort_key, descending)
+    summaries = self.client.getJobSummaries(self.request_context, job_filter, sort, offset, count)
+    for summary in summaries.jobs:
+      fixup_enums(summary, {"runState":ThriftJobState, "priority":ThriftJobPriority})
+    return summaries
+
+  def get_jobs_changed_since(self, token):
+    """
+    Returns a ThriftJobChanges: the summaries of the jobs whose state or
+    progress changed since token (0, or the token of an earlier result).
+    """
+    changes = self.client.getJobsChangedSince(self.request_context, token)
+    for summary in changes.changed:
+      fixup_enums(summary, {"runState":ThriftJobState, "priority":ThriftJobPriority})
+    return changes
+
+  def snapshot(self):
+    """
+    Returns the JobTrackerSnapshot of this JobTracker, which is shared by
+    every user, and starts refreshing it in the background on first use.
+    """
+    return self._snapshot
+
+  def stop_snapshot(self):
+    """Stops refreshing the snapshot in the background."""
+    self._snapshot.stop()
+
+  def _job_query(self, job_states, user, queue, text, sort_key, descending):
+    """Returns the (ThriftJobFilter, ThriftJobSort) of a get_job_summaries() query."""
+    assert job_states is None or VALID_JOB_STATES.issuperset(job_states)
+    assert sort_key is None or sort_key in VALID_JOB_SORT_KEYS
+    job_filter = ThriftJobFilter(user=user, queue=queue, text=text)
+    if job_states:
+      job_filter.states = set(ThriftJobState._NAMES_TO_VALUES[x.upper()] for x in job_states)
+    sort = None
+    if sort_key is not None:
+      sort = ThriftJobSort(key=ThriftJobSortKey._NAMES_TO_VALUES[sort_key.upper()],
+                           descending=descending)
+    return job_filter, sort
+
   def get_job_count_by_user(self, user):
     """
     Returns a ThriftUserJobCounts.
@@ -287,6 +641,42 @@ class LiveJobTracker(object):
       self._fixup_task_in_progress(tip)
     return tip_list
 
+  def get_task_page(self, jobid, task_types, task_states, task_text, cursor, count):
+    """
+    Returns a ThriftTaskPage of count of the tasks matching the filter (as
+    per get_task_list), from cursor (None or "" for the first page) on.
+    Its nextCursor is the cursor of the next page, or "" after the last.
+    """
+    ttask_types = [ ThriftTaskType._NAMES_TO_VALUES[x.upper()] for x in task_types ]
+    ttask_states = [ ThriftTaskQueryState._NAMES_TO_VALUES[x.upper()] for x in task_states ]
+    page = self.client.getTaskPage(
+          self.request_context, jobid, ttask_types, ttask_states, task_text, cursor or "", count)
+
+    for tip in page.tasks:
+      self._fixup_task_in_progress(tip)
+    return page
+
+  def get_task_timeline(self, jobid):
+    """
+    Returns a ThriftTaskTimeline of every task of the job: parallel lists of
+    their numbers, types, states, start and finish times.
+    """
+    return self.client.getTaskTimeline(self.request_context, jobid)
+
+  def get_top_tasks(self, jobid, task_states, count, newest_first=True):
+    """
+    Returns a ThriftTaskInProgressList of the count tasks in any of
+    task_states that started executing last (or first, unless newest_first).
+    Its numTotalTasks is the number of tasks in those states.
+    """
+    ttask_states = [ ThriftTaskQueryState._NAMES_TO_VALUES[x.upper()] for x in task_states ]
+    tip_list = self.client.getTopTasks(
+          self.request_context, jobid, ttask_states, count, newest_first)
+
+    for tip in tip_list.tasks:
+      self._fixup_task_in_progress(tip)
+    return tip_list
+
   def get_task(self, jobid, taskid):
     """Return a ThriftTaskInProgress"""
     try:
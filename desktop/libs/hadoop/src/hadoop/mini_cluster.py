@@ -244,6 +244,9 @@ rpc.class=org.apache.hadoop.metrics.spi.NoEmitMetricsContext
     """
     Kills the cluster ungracefully.
     """
+    if self._jt is not None:
+      self._jt.stop_snapshot()
+
     if self.clusterproc and self.clusterproc.poll() is None:
       os.kill(self.clusterproc.pid, signal.SIGKILL)
       self.clusterproc.wait()
@@ -23,6 +23,7 @@ from nose.tools import assert_true, assert_equal
 from nose.plugins.attrib import attr
 
 from hadoop import confparse
+from hadoop import job_tracker
 from hadoop import mini_cluster
 
 @attr('requires_hadoop')
@@ -46,6 +47,57 @@ def test_live_jobtracker():
     assert_true(jt.completed_jobs())
     assert_true(jt.failed_jobs())
     assert_true(jt.all_jobs())
+    assert_true(jt.get_job_summaries(job_states=set(["succeeded"]), text="job",
+                                     sort_key="start_time", descending=True, count=5))
+    summaries = jt.get_job_summaries(count=1)
+    assert_equal(1, len(summaries.jobs))
+    assert_true(summaries.numTotalJobs >= 1)
+    assert_true(summaries.jobs[0].runStateAsString)
+
+    # A job without its tasks, and a few of its tasks on their own
+    jobid = summaries.jobs[0].jobID
+    assert_equal(None, jt.get_job(jobid, include_tasks=False).tasks)
+    top = jt.get_top_tasks(jobid, set(["succeeded", "failed", "killed"]), 2)
+    assert_true(len(top.tasks) <= 2)
+    assert_true(top.numTotalTasks >= len(top.tasks))
+    start_times = [ t.execStartTime for t in top.tasks ]
+    assert_equal(sorted(start_times, reverse=True), start_times)
+
+    # Paging through the tasks with cursors
+    all_types = job_tracker.VALID_TASK_TYPES
+    all_states = job_tracker.VALID_TASK_STATES
+    page = jt.get_task_page(jobid, all_types, all_states, "", None, 1)
+    assert_true(len(page.tasks) <= 1)
+    if page.numTotalTasks > 1:
+      assert_true(page.nextCursor)
+      rest = jt.get_task_page(jobid, all_types, all_states, "", page.nextCursor, page.numTotalTasks)
+      assert_equal(page.numTotalTasks - 1, len(rest.tasks))
+      assert_equal("", rest.nextCursor)
+
+    # The times of every task, in one call
+    timeline = jt.get_task_timeline(jobid)
+    assert_equal(len(timeline.taskNumbers), len(timeline.finishTimes))
+    assert_true(len(timeline.taskNumbers) >= page.numTotalTasks)
+
+    # The first refresh of the job cache gets every job; the next ones
+    # only get the jobs that changed.
+    changes = jt.get_jobs_changed_since(0)
+    assert_true(changes.full)
+    assert_true(len(changes.changed) >= summaries.numTotalJobs)
+    later = jt.get_jobs_changed_since(changes.token)
+    assert_true(not later.full)
+
+    # The shared snapshot has the same jobs, filtered in-process
+    snapshot = jt.snapshot()
+    snapshot.refresh()
+    cache = snapshot.jobs
+    assert_equal(len(changes.changed), len(cache.jobs()))
+    token, full, changed, removed = cache.changed_since(cache.token)
+    assert_equal([], changed)
+    assert_equal(len(changes.changed), snapshot.get_job_summaries().numTotalJobs)
+    assert_equal(1, len(snapshot.get_job_summaries(sort_key="start_time", count=1).jobs))
+    assert_true(snapshot.trackers)
+    jt.stop_snapshot()
     # not tested: get_job_counters
     assert_true(jt.get_current_time())
     # not tested: get_job_xml
@@ -74,6 +126,10 @@ def test_confparse():
         <name>boolean_false</name>
         <value>false</value>
       </property>
+      <property>
+        <name>with_entities</name>
+        <value>a &lt; b &amp;&amp; c</value>
+      </property>
     </configuration>
   """
 
@@ -87,6 +143,7 @@ def test_confparse():
     assert_equal(cp.getbool('boolean_true'), True)
     assert_equal(cp.getbool('boolean_false'), False)
     assert_equal(cp.getbool('not_in_xml', True), True)
+    assert_equal(cp['with_entities'], 'a < b && c')
 
     try:
       cp['bogus']
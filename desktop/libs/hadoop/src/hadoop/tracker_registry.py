@@ -0,0 +1,121 @@
+#!/usr/bin/env python
+# Licensed to Cloudera, Inc. under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  Cloudera, Inc. licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+The task trackers of a JobTracker snapshot, by name.
+
+The JobTracker only hands out the status of every tracker at once, so a
+TrackerRegistry is updated with the whole list on each refresh, and works
+out which trackers changed.  Lookups by name don't scan the trackers.
+"""
+import threading
+
+# Changes with every heartbeat, so it doesn't count as a change
+_VOLATILE_FIELDS = ('lastSeen',)
+
+def same_status(a, b):
+  """Whether two ThriftTaskTrackerStatus differ only in volatile fields."""
+  a_fields = dict(a.__dict__)
+  b_fields = dict(b.__dict__)
+  for field in _VOLATILE_FIELDS:
+    a_fields.pop(field, None)
+    b_fields.pop(field, None)
+  return a_fields == b_fields
+
+
+class TrackerRegistry(object):
+  """
+  The latest ThriftTaskTrackerStatus of every task tracker, by name.
+
+  Each update() has a token, and each tracker is stamped with the token
+  of the update that last saw it change, so that changes can be followed
+  as with job_tracker.JobSummaryCache.
+  """
+  # How many removals are remembered; older tokens get every tracker
+  MAX_REMOVED = 1000
+
+  def __init__(self):
+    self.token = 0
+    self._lock = threading.Lock()
+    self._trackers = {}         # name -> (token, ThriftTaskTrackerStatus)
+    self._removed = {}          # name -> token
+    self._removed_since = 0     # Tokens older than this may have missed removals
+
+  def update(self, trackers):
+    """
+    Replaces the trackers with trackers, a list of ThriftTaskTrackerStatus,
+    stamping those that changed (or are new) and those that are gone with
+    a new token.
+    """
+    self._lock.acquire()
+    try:
+      token = self.token + 1
+      current = {}
+      for status in trackers:
+        name = status.trackerName
+        entry = self._trackers.get(name)
+        if entry is None or not same_status(entry[1], status):
+          current[name] = (token, status)
+        else:
+          # Keep the newer status, for its lastSeen
+          current[name] = (entry[0], status)
+        self._removed.pop(name, None)
+      removed = [ name for name in self._trackers if name not in current ]
+      for name in removed:
+        self._removed[name] = token
+      if len(self._removed) > self.MAX_REMOVED:
+        oldest = sorted(self._removed.iteritems(), key=lambda x: x[1])
+        for name, removed_token in oldest[:len(self._removed) - self.MAX_REMOVED]:
+          del self._removed[name]
+          self._removed_since = max(self._removed_since, removed_token)
+      # Replaced rather than changed, so that lookups needn't lock
+      self._trackers = current
+      self.token = token
+    finally:
+      self._lock.release()
+
+  def __len__(self):
+    return len(self._trackers)
+
+  def get(self, name):
+    """Returns the ThriftTaskTrackerStatus of the tracker named name, or None."""
+    entry = self._trackers.get(name)
+    return entry and entry[1]
+
+  def trackers(self):
+    """Returns the ThriftTaskTrackerStatus of every tracker, by name."""
+    trackers = self._trackers
+    return [ trackers[name][1] for name in sorted(trackers) ]
+
+  def changed_since(self, token):
+    """
+    Returns (token, full, changed, removed): the current token, whether
+    the given token was unusable (in which case changed has every
+    tracker), the ThriftTaskTrackerStatus of the trackers that changed
+    since token, and the names of the trackers removed since.
+    """
+    self._lock.acquire()
+    try:
+      full = not token or token < self._removed_since or token > self.token
+      changed = [ status for tracker_token, status in self._trackers.itervalues()
+                  if full or tracker_token > token ]
+      removed = []
+      if not full:
+        removed = [ name for name, removed_token in self._removed.iteritems()
+                    if removed_token > token ]
+      return self.token, full, changed, removed
+    finally:
+      self._lock.release()
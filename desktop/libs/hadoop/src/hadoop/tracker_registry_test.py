@@ -0,0 +1,58 @@
+#!/usr/bin/env python
+# Licensed to Cloudera, Inc. under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  Cloudera, Inc. licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from nose.tools import assert_equal, assert_true
+
+from hadoop.api.jobtracker.ttypes import ThriftTaskTrackerStatus
+from hadoop.tracker_registry import TrackerRegistry
+
+def make_tracker(name, last_seen=1000, map_count=0):
+  host = name.split(':')[0][len("tracker_"):]
+  return ThriftTaskTrackerStatus(trackerName=name, host=host,
+                                 httpPort=50060, lastSeen=last_seen,
+                                 mapCount=map_count, reduceCount=0)
+
+def test_tracker_registry():
+  registry = TrackerRegistry()
+  names = [ "tracker_host%d:localhost/127.0.0.1:%d" % (i, 4000 + i) for i in range(3) ]
+  registry.update([ make_tracker(name) for name in names ])
+  token, full, changed, removed = registry.changed_since(0)
+  assert_equal(names, sorted([ t.trackerName for t in changed ]))
+  assert_equal([], removed)
+  assert_equal(3, len(registry))
+  assert_equal(names, [ t.trackerName for t in registry.trackers() ])
+  assert_equal("host1", registry.get(names[1]).host)
+  assert_equal(None, registry.get("tracker_nosuchhost"))
+  first = registry.token
+
+  # A heartbeat alone isn't a change, but the newer status is kept
+  registry.update([ make_tracker(names[0], last_seen=2000, map_count=2),
+                    make_tracker(names[1], last_seen=2000) ])
+  assert_equal(2000, registry.get(names[1]).lastSeen)
+  assert_equal(None, registry.get(names[2]))
+
+  token, full, changed, removed = registry.changed_since(first)
+  assert_true(not full)
+  assert_equal([names[0]], [ t.trackerName for t in changed ])
+  assert_equal([names[2]], removed)
+
+  token, full, changed, removed = registry.changed_since(token)
+  assert_equal(([], []), (changed, removed))
+
+  # Unknown tokens get every tracker
+  token, full, changed, removed = registry.changed_since(0)
+  assert_true(full)
+  assert_equal(2, len(changed))